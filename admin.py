@@ -0,0 +1,22 @@
+import hmac
+import os
+from functools import wraps
+
+from flask import abort, request
+
+# Admin endpoints answer 404 unless a token is configured and sent as X-Admin-Token
+ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN', '')
+
+def admin_only(view):
+    """
+    Restrict a view to requests carrying the admin token
+    """
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        token = request.headers.get('X-Admin-Token', '')
+        if not ADMIN_TOKEN or not hmac.compare_digest(token.encode('utf-8'), ADMIN_TOKEN.encode('utf-8')):
+            abort(404)
+        return view(*args, **kwargs)
+
+    return wrapper
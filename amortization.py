@@ -0,0 +1,159 @@
+import numpy as np
+
+MONTH_NAMES = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+               'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+# Periods evaluated at a time when streaming long schedules
+CHUNK_PERIODS = 1024
+
+def level_payment(principal, periodic_rate, periods, advance=False):
+    """
+    Level instalment for a fully amortizing loan
+    EMI = P * r * (1+r)^n / ((1+r)^n - 1)
+    """
+    if periodic_rate == 0:
+        return principal / periods
+
+    growth = (1 + periodic_rate) ** periods
+    payment = principal * periodic_rate * growth / (growth - 1)
+
+    # EMI in advance is discounted by one period
+    if advance:
+        payment = payment / (1 + periodic_rate)
+
+    return payment
+
+def amortize(principal, periodic_rate, periods, payment, clamp=False):
+    """
+    Closed-form amortization of a level payment over every period at once.
+    balance_k = P(1+r)^k - EMI((1+r)^k - 1)/r
+
+    Returns (interest, principal_paid, balance) arrays of length `periods`.
+    With clamp=True the payment that clears the loan is capped at the
+    outstanding balance and every later period is zero, which matches the
+    loops that stop once the balance reaches zero; a non-positive principal
+    gives all-zero rows.
+    """
+    if clamp and principal <= 0:
+        # Nothing to repay: the loops never enter their first period
+        return np.zeros(periods), np.zeros(periods), np.zeros(periods)
+
+    k = np.arange(1, periods + 1, dtype=float)
+
+    if periodic_rate == 0:
+        balance = principal - payment * k
+    else:
+        growth = (1 + periodic_rate) ** k
+        balance = principal * growth - payment * (growth - 1) / periodic_rate
+
+    opening = np.empty(periods)
+    opening[:1] = principal
+    opening[1:] = balance[:-1]
+
+    interest = opening * periodic_rate
+    principal_paid = payment - interest
+
+    if clamp:
+        paid_off = np.flatnonzero(balance <= 0)
+        if paid_off.size:
+            last = paid_off[0]
+            principal_paid[last] = opening[last]
+            balance[last] = 0
+            interest[last + 1:] = 0
+            principal_paid[last + 1:] = 0
+            balance[last + 1:] = 0
+
+    return interest, principal_paid, balance
+
+def amortize_chunks(principal, periodic_rate, periods, payment, chunk_size=CHUNK_PERIODS, clamp=False):
+    """
+    amortize() over consecutive blocks of periods, each continuing from the
+    previous closing balance, so long schedules are produced in constant
+    memory. Yields (interest, principal_paid, balance) per block; with
+    clamp=True the blocks after the payoff are all zero.
+    """
+    opening = principal
+    for start in range(0, periods, chunk_size):
+        interest, principal_paid, balance = amortize(opening, periodic_rate, min(chunk_size, periods - start), payment, clamp)
+        yield interest, principal_paid, balance
+        opening = balance[-1]
+
+def amortize_advance(principal, periodic_rate, periods, payment, clamp=False):
+    """
+    Amortization when the first EMI is collected at disbursement, so it is all
+    principal and the remaining periods amortize the reduced balance.
+    """
+    first_principal = min(payment, principal) if clamp else payment
+    interest, principal_paid, balance = amortize(
+        principal - first_principal, periodic_rate, periods - 1, payment, clamp
+    )
+
+    # After a clamped payoff every later period is zero
+    first_balance = principal - first_principal
+    if clamp and first_balance <= 0:
+        interest[:] = 0
+        principal_paid[:] = 0
+        balance[:] = 0
+
+    return (
+        np.concatenate(([0.0], interest)),
+        np.concatenate(([first_principal], principal_paid)),
+        np.concatenate(([first_balance], balance))
+    )
+
+def active_periods(balance):
+    """
+    Number of periods up to and including the one that clears the balance
+    """
+    paid_off = np.flatnonzero(balance <= 0)
+    return int(paid_off[0]) + 1 if paid_off.size else len(balance)
+
+def paid_percentage(principal, balance):
+    """
+    Share of the principal repaid after each period, in percent
+    """
+    if not len(balance):
+        return balance
+
+    return (principal - balance) * (100 / principal)
+
+def year_starts(periods, first_year_periods=12, periods_per_year=12):
+    """
+    Index of the first period of each schedule year, where the first year may
+    be shorter (e.g. a loan starting mid-year)
+    """
+    if periods <= 0:
+        return np.zeros(0, dtype=int)
+
+    first = min(first_year_periods, periods)
+    return np.concatenate(([0], np.arange(first, periods, periods_per_year))).astype(int)
+
+def yearly_sums(values, starts):
+    """
+    Sum per-period values into per-year totals
+    """
+    if not len(starts):
+        return np.zeros(0)
+
+    return np.add.reduceat(values, starts)
+
+def year_ends(starts, periods):
+    """
+    Index of the last period of each schedule year
+    """
+    if not len(starts):
+        return starts
+
+    return np.append(starts[1:], periods) - 1
+
+def rounded(values, digits=2):
+    """
+    Round an array for the JSON response and convert it to Python floats
+    """
+    return np.round(values, digits).tolist()
+
+def rounded_int(values):
+    """
+    Round an array to whole rupees as Python ints
+    """
+    return np.rint(values).astype(np.int64).tolist()
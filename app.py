@@ -1,12961 +1,47 @@
-from flask import Flask, render_template, request, jsonify
-import math
-from datetime import datetime, timedelta
+# Imported first so that, when enabled, the startup profile times every other import
+import startup_profile
 
-app = Flask(__name__)
-
-def calculate_emi(principal, annual_rate, tenure_months, emi_advance=False):
-    """
-    Calculate EMI using the standard formula
-    EMI = P * r * (1+r)^n / ((1+r)^n - 1)
-    """
-    # Convert annual rate to monthly rate
-    monthly_rate = annual_rate / (12 * 100)
-    
-    if monthly_rate == 0:
-        return principal / tenure_months
-    
-    # Calculate EMI
-    emi = principal * monthly_rate * ((1 + monthly_rate) ** tenure_months) / (((1 + monthly_rate) ** tenure_months) - 1)
-    
-    # If EMI in advance, apply discount
-    if emi_advance:
-        emi = emi / (1 + monthly_rate)
-    
-    return emi
-
-def calculate_yearly_payment_schedule(principal, annual_rate, tenure_months, emi_advance=False, start_year=2025, start_month=1):
-    """
-    Calculate yearly amortization schedule with detailed payment breakdown and monthly data
-    """
-    emi = calculate_emi(principal, annual_rate, tenure_months, emi_advance)
-    monthly_rate = annual_rate / (12 * 100)
-    
-    yearly_schedule = []
-    remaining_principal = principal
-    current_year = start_year
-    month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                   'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-    
-    total_months_processed = 0
-    current_month = start_month - 1  # Convert to 0-based index
-    
-    while total_months_processed < tenure_months:
-        year_principal = 0
-        year_interest = 0
-        year_payments = 0
-        monthly_data = []
-        
-        # Calculate months for this year
-        months_remaining_in_year = 12 - current_month
-        months_to_process = min(months_remaining_in_year, tenure_months - total_months_processed)
-        
-        for month_idx in range(months_to_process):
-            if total_months_processed >= tenure_months:
-                break
-                
-            total_months_processed += 1
-            interest_payment = remaining_principal * monthly_rate
-            principal_payment = emi - interest_payment
-            
-            year_principal += principal_payment
-            year_interest += interest_payment
-            year_payments += emi
-            
-            remaining_principal -= principal_payment
-            
-            # Calculate loan paid percentage for this month
-            loan_paid_percentage = ((principal - remaining_principal) / principal) * 100
-            
-            # Get the correct month name
-            month_name = month_names[(current_month + month_idx) % 12]
-            
-            # Store monthly data
-            monthly_data.append({
-                'month': month_name,
-                'principal': round(principal_payment, 2),
-                'interest': round(interest_payment, 2),
-                'total_payment': round(emi, 2),
-                'balance': round(max(0, remaining_principal), 2),
-                'loan_paid_percentage': round(loan_paid_percentage, 2)
-            })
-        
-        # Calculate loan paid percentage for the year
-        loan_paid_percentage = ((principal - remaining_principal) / principal) * 100
-        
-        yearly_schedule.append({
-            'year': current_year,
-            'principal': round(year_principal, 2),
-            'interest': round(year_interest, 2),
-            'total_payment': round(year_payments, 2),
-            'balance': round(max(0, remaining_principal), 2),
-            'loan_paid_percentage': round(loan_paid_percentage, 2),
-            'months_in_year': months_to_process,
-            'monthly_data': monthly_data
-        })
-        
-        # Move to next year
-        current_year += 1
-        current_month = 0  # Start from January for subsequent years
-        
-        # Stop if loan is fully paid
-        if remaining_principal <= 0:
-            break
-    
-    return yearly_schedule
-
-def calculate_amortization_schedule(principal, annual_rate, tenure_months, emi_advance=False):
-    """
-    Calculate detailed amortization schedule
-    """
-    emi = calculate_emi(principal, annual_rate, tenure_months, emi_advance)
-    monthly_rate = annual_rate / (12 * 100)
-    
-    schedule = []
-    remaining_principal = principal
-    total_interest = 0
-    
-    for month in range(1, tenure_months + 1):
-        interest_payment = remaining_principal * monthly_rate
-        principal_payment = emi - interest_payment
-        remaining_principal -= principal_payment
-        total_interest += interest_payment
-        
-        schedule.append({
-            'month': month,
-            'emi': round(emi, 2),
-            'principal': round(principal_payment, 2),
-            'interest': round(interest_payment, 2),
-            'balance': round(max(0, remaining_principal), 2)
-        })
-    
-    return schedule, total_interest
-
-def calculate_education_loan_emi_python(principal, annual_rate, tenure_months, repayment_option):
-    """
-    Calculate Education Loan EMI with accurate Python calculations for moratorium options
-    """
-    monthly_rate = annual_rate / (12 * 100)
-    study_period_months = 48  # 4 years standard study period
-    
-    if monthly_rate == 0:
-        emi = principal / tenure_months
-        total_interest = 0
-        total_payment = principal
-    else:
-        if repayment_option == 'complete_moratorium':
-            # Complete Moratorium: No payments during study period, interest capitalizes
-            if tenure_months <= study_period_months:
-                # If tenure is within study period, use standard EMI
-                emi = principal * monthly_rate * ((1 + monthly_rate) ** tenure_months) / (((1 + monthly_rate) ** tenure_months) - 1)
-                total_payment = emi * tenure_months
-                total_interest = total_payment - principal
-            else:
-                # Interest capitalizes during study period
-                capitalized_principal = principal * ((1 + monthly_rate) ** study_period_months)
-                repayment_months = tenure_months - study_period_months
-                
-                # EMI calculated on capitalized principal for remaining tenure
-                emi = capitalized_principal * monthly_rate * ((1 + monthly_rate) ** repayment_months) / (((1 + monthly_rate) ** repayment_months) - 1)
-                
-                # Total payment during repayment period only
-                total_payment = emi * repayment_months
-                total_interest = total_payment - principal
-                
-        elif repayment_option == 'principal_moratorium':
-            # Principal Moratorium: Only interest payments during study period
-            if tenure_months <= study_period_months:
-                # If tenure is within study period, only interest payments
-                emi = principal * monthly_rate
-                total_payment = emi * tenure_months
-                total_interest = total_payment
-            else:
-                # Interest-only payments during study period
-                interest_only_emi = principal * monthly_rate
-                interest_during_study = interest_only_emi * study_period_months
-                
-                # Principal + Interest EMI for remaining tenure
-                repayment_months = tenure_months - study_period_months
-                principal_emi = principal * monthly_rate * ((1 + monthly_rate) ** repayment_months) / (((1 + monthly_rate) ** repayment_months) - 1)
-                
-                # EMI shown is the principal repayment EMI (post-study period)
-                emi = principal_emi
-                
-                # Total interest = interest during study + interest during repayment
-                interest_during_repayment = (principal_emi * repayment_months) - principal
-                total_interest = interest_during_study + interest_during_repayment
-                total_payment = principal + total_interest
-                
-        else:  # full_emi
-            # Full EMI: Standard loan calculation from day 1
-            emi = principal * monthly_rate * ((1 + monthly_rate) ** tenure_months) / (((1 + monthly_rate) ** tenure_months) - 1)
-            total_payment = emi * tenure_months
-            total_interest = total_payment - principal
-    
-    return {
-        'emi': round(emi, 2),
-        'principal': principal,
-        'total_interest': round(total_interest, 2),
-        'total_payment': round(total_payment, 2),
-        'tenure_months': tenure_months,
-        'interest_rate': annual_rate,
-        'repayment_option': repayment_option
-    }
-
-@app.route('/')
-def sip_calculator():
-    return render_template('index.html')
-
-@app.route('/sip-calculator/')
-def sip_calculator_redirect():
-    return render_template('index.html')
-
-@app.route('/home-loan-emi-calculator/')
-def home_loan_calculator():
-    return render_template('home_loan_calculator.html')
-
-@app.route('/home-loan-eligibility-calculator/')
-def home_loan_eligibility_calculator():
-    return render_template('home_loan_eligibility_calculator.html')
-
-@app.route('/home-loan-affordability-calculator/')
-def home_loan_affordability_calculator():
-    return render_template('home_loan_affordability_calculator.html')
-
-@app.route('/home-loan-refinance-calculator/')
-def home_loan_refinance_calculator():
-    return render_template('home_loan_refinance_calculator.html')
-
-@app.route('/loan-amount-calculator/')
-def loan_amount_calculator():
-    return render_template('loan_amount_calculator.html')
-
-@app.route('/loan-tenure-calculator/')
-def loan_tenure_calculator():
-    return render_template('loan_tenure_calculator.html')
-
-@app.route('/interest-rate-calculator/')
-def interest_rate_calculator():
-    return render_template('interest_rate_calculator.html')
-
-@app.route('/car-loan-emi-calculator/')
-def car_loan_emi_calculator():
-    return render_template('car_loan_emi_calculator.html')
-
-@app.route('/two-wheeler-loan-emi-calculator/')
-def two_wheeler_loan_emi_calculator():
-    return render_template('two_wheeler_loan_emi_calculator.html')
-
-@app.route('/personal-loan-emi-calculator/')
-def personal_loan_emi_calculator():
-    return render_template('personal_loan_emi_calculator.html')
-
-@app.route('/business-loan-emi-calculator/')
-def business_loan_emi_calculator():
-    return render_template('business_loan_emi_calculator.html')
-
-@app.route('/education-loan-emi-calculator/')
-def education_loan_emi_calculator():
-    return render_template('education_loan_emi_calculator.html')
-
-@app.route('/credit-card-emi-calculator/')
-def credit_card_emi_calculator():
-    return render_template('credit_card_emi_calculator.html')
-
-@app.route('/mobile-phone-emi-calculator/')
-def mobile_phone_emi_calculator():
-    return render_template('mobile_phone_emi_calculator.html')
-
-@app.route('/laptop-emi-calculator/')
-def laptop_emi_calculator():
-    return render_template('laptop_emi_calculator.html')
-
-@app.route('/land-loan-emi-calculator/')
-def land_loan_emi_calculator():
-    return render_template('land_loan_emi_calculator.html')
-
-@app.route('/tractor-loan-emi-calculator/')
-def tractor_loan_emi_calculator():
-    return render_template('tractor_loan_emi_calculator.html')
-
-@app.route('/commercial-property-loan-emi-calculator/')
-def commercial_property_emi_calculator():
-    return render_template('commercial_property_emi_calculator.html')
-
-@app.route('/commercial-vehicle-emi-calculator/')
-def commercial_vehicle_emi_calculator():
-    return render_template('commercial_vehicle_emi_calculator.html')
-
-@app.route('/daily-emi-calculator/')
-def daily_emi_calculator():
-    return render_template('daily_emi_calculator.html')
-
-@app.route('/weekly-emi-calculator/')
-def weekly_emi_calculator():
-    return render_template('weekly_emi_calculator.html')
-
-@app.route('/monthly-emi-calculator/')
-def monthly_emi_calculator():
-    return render_template('monthly_emi_calculator.html')
-
-@app.route('/mutual-funds-expense-ratio-calculator/')
-def mutual_funds_expense_ratio_calculator():
-    return render_template('mutual_funds_expense_ratio_calculator.html')
-
-@app.route('/expense-ratio-calculator/')
-def expense_ratio_calculator():
-    return render_template('expense_ratio_calculator.html')
-
-@app.route('/daily-sip-calculator/')
-def daily_sip_calculator():
-    return render_template('daily_sip_calculator.html')
-
-@app.route('/monthly-sip-calculator/')
-def monthly_sip_calculator():
-    return render_template('monthly_sip_calculator.html')
-
-@app.route('/quarterly-sip-calculator/')
-def quarterly_sip_calculator():
-    return render_template('quarterly_sip_calculator.html')
-
-@app.route('/yearly-sip-calculator/')
-def yearly_sip_calculator():
-    return render_template('yearly_sip_calculator.html')
-
-@app.route('/reverse-sip-calculator/')
-def reverse_sip_calculator():
-    return render_template('reverse_sip_calculator.html')
-
-@app.route('/lump-sum-or-one-time-sip-calculator/')
-def lump_sum_sip_calculator():
-    return render_template('lump_sum_sip_calculator.html')
-
-@app.route('/sip-calculator-with-expense-ratio/')
-def sip_calculator_with_expense_ratio():
-    return render_template('sip_calculator_with_expense_ratio.html')
-
-@app.route('/sip-calculator-with-inflation/')
-def sip_calculator_with_inflation():
-    return render_template('sip_calculator_with_inflation.html')
-
-@app.route('/sip-calculator-with-inflation-and-tax/')
-def sip_calculator_with_inflation_and_tax():
-    return render_template('sip_calculator_with_inflation_and_tax.html')
-
-@app.route('/sip-calculator-with-inflation-and-tax-2/')
-def sip_calculator_with_inflation_and_tax_2():
-    return render_template('sip_calculator_with_inflation_and_tax_2.html')
-
-@app.route('/sip-delay-calculator/')
-def sip_delay_calculator():
-    return render_template('sip_delay_calculator.html')
-
-@app.route('/sip-exit-load-calculator/')
-def sip_exit_load_calculator():
-    return render_template('sip_exit_load_calculator.html')
-
-@app.route('/stock-average-calculator/')
-def stock_average_calculator():
-    return render_template('stock_average_calculator.html')
-
-@app.route('/emi-calculator-with-part-payment/')
-def emi_calculator_with_part_payment():
-    return render_template('emi_calculator_with_part_payment.html')
-
-@app.route('/flat-interest-rate-emi-calculator/')
-def flat_interest_rate_emi_calculator():
-    return render_template('flat_interest_rate_emi_calculator.html')
-
-@app.route('/step-up-emi-calculator/')
-def step_up_emi_calculator():
-    return render_template('step_up_emi_calculator.html')
-
-@app.route('/flat-vs-reducing-rate-interest-calculator/')
-def flat_vs_reducing_rate_interest_calculator():
-    return render_template('flat_vs_reducing_rate_interest_calculator.html')
-
-@app.route('/bullet-emi-calculator/')
-def bullet_emi_calculator():
-    return render_template('bullet_emi_calculator.html')
-
-@app.route('/reverse-emi-calculator/')
-def reverse_emi_calculator():
-    return render_template('reverse_emi_calculator.html')
-
-@app.route('/no-cost-emi-calculator/')
-def no_cost_emi_calculator():
-    return render_template('no_cost_emi_calculator.html')
-
-@app.route('/reducing-loan-emi-calculator/')
-def reducing_loan_emi_calculator():
-    return render_template('reducing_loan_emi_calculator.html')
-
-@app.route('/reducing-balance-emi-calculator/')
-def reducing_balance_emi_calculator():
-    return render_template('reducing_balance_emi_calculator.html')
-
-@app.route('/reducing-rate-emi-calculator/')
-def reducing_rate_emi_calculator():
-    return render_template('reducing_rate_emi_calculator.html')
-
-@app.route('/emi-overdue-status-calculator/')
-def emi_overdue_status_calculator():
-    return render_template('emi_overdue_status_calculator.html')
-
-@app.route('/lumpsum-vs-sip-calculator/')
-def lumpsum_vs_sip_calculator():
-    return render_template('lumpsum_vs_sip_calculator.html')
-
-def calculate_emi_overdue_status(principal, annual_rate, tenure_months, emi_amount, months_overdue, penalty_rate_per_month):
-    """
-    Calculate EMI overdue status including penalties and impact on loan
-    """
-    monthly_rate = annual_rate / (12 * 100)
-    penalty_monthly_rate = penalty_rate_per_month / 100
-    
-    # Calculate current outstanding principal
-    # This assumes some EMIs were paid before becoming overdue
-    payments_made = max(0, 12 - months_overdue)  # Assume 1 year loan started
-    outstanding_principal = principal
-    
-    # Calculate outstanding balance after payments made
-    for i in range(payments_made):
-        interest_payment = outstanding_principal * monthly_rate
-        principal_payment = emi_amount - interest_payment
-        outstanding_principal -= principal_payment
-    
-    # Calculate overdue amounts
-    overdue_emi_amount = emi_amount * months_overdue
-    overdue_interest = 0
-    
-    # Calculate compounding interest on overdue amount
-    temp_overdue = overdue_emi_amount
-    for month in range(months_overdue):
-        interest_on_overdue = temp_overdue * penalty_monthly_rate
-        overdue_interest += interest_on_overdue
-        temp_overdue += interest_on_overdue
-    
-    # Total amount to pay to become current
-    total_overdue_amount = overdue_emi_amount + overdue_interest
-    
-    # Calculate revised loan parameters after clearing overdue
-    revised_principal = outstanding_principal
-    revised_tenure_months = tenure_months - payments_made
-    
-    # Calculate new EMI if tenure remains same
-    if revised_tenure_months > 0 and monthly_rate > 0:
-        revised_emi = revised_principal * monthly_rate * ((1 + monthly_rate) ** revised_tenure_months) / (((1 + monthly_rate) ** revised_tenure_months) - 1)
-    else:
-        revised_emi = revised_principal / max(1, revised_tenure_months)
-    
-    # Calculate total interest on remaining loan
-    total_remaining_payment = revised_emi * revised_tenure_months
-    total_remaining_interest = total_remaining_payment - revised_principal
-    
-    # Calculate impact of overdue
-    original_total_payment = emi_amount * tenure_months
-    original_total_interest = original_total_payment - principal
-    
-    additional_cost = total_overdue_amount + total_remaining_interest - original_total_interest
-    
-    return {
-        'original_emi': round(emi_amount, 2),
-        'outstanding_principal': round(outstanding_principal, 2),
-        'overdue_emi_amount': round(overdue_emi_amount, 2),
-        'overdue_interest': round(overdue_interest, 2),
-        'total_overdue_amount': round(total_overdue_amount, 2),
-        'revised_emi': round(revised_emi, 2),
-        'revised_tenure_months': revised_tenure_months,
-        'additional_cost': round(additional_cost, 2),
-        'total_remaining_interest': round(total_remaining_interest, 2),
-        'penalty_rate_monthly': penalty_rate_per_month,
-        'months_overdue': months_overdue
-    }
-
-@app.route('/calculate-emi-overdue-status', methods=['POST'])
-def calculate_emi_overdue_status_route():
-    try:
-        data = request.get_json()
-        
-        principal = float(data.get('principal', 1000000))
-        annual_rate = float(data.get('annualRate', 12.0))
-        tenure_months = int(data.get('tenureMonths', 180))
-        emi_amount = float(data.get('emiAmount', 12000))
-        months_overdue = int(data.get('monthsOverdue', 3))
-        penalty_rate = float(data.get('penaltyRate', 2.0))
-        
-        # Validate inputs
-        if principal <= 0 or annual_rate < 0 or tenure_months <= 0 or emi_amount <= 0 or months_overdue < 0:
-            return jsonify({'status': 'error', 'error': 'Invalid input values'})
-        
-        result = calculate_emi_overdue_status(principal, annual_rate, tenure_months, emi_amount, months_overdue, penalty_rate)
-        
-        return jsonify({
-            'status': 'success',
-            **result
-        })
-        
-    except Exception as e:
-        return jsonify({'status': 'error', 'error': str(e)})
-
-@app.route('/calculate', methods=['POST'])
-def calculate():
-    try:
-        data = request.get_json()
-        
-        loan_amount = float(data.get('loanAmount', 0))
-        interest_rate = float(data.get('interestRate', 0))
-        tenure_years = int(data.get('tenureYears', 0))
-        tenure_months = int(data.get('tenureMonths', 0))
-        start_year = int(data.get('startYear', 2024))
-        start_month = int(data.get('startMonth', 1))
-        
-        total_months = (tenure_years * 12) + tenure_months
-        monthly_rate = interest_rate / (12 * 100)
-        
-        # Calculate EMI
-        if monthly_rate > 0:
-            emi = (loan_amount * monthly_rate * (1 + monthly_rate) ** total_months) / ((1 + monthly_rate) ** total_months - 1)
-        else:
-            emi = loan_amount / total_months if total_months > 0 else 0
-        
-        total_interest = (emi * total_months) - loan_amount
-        total_amount = loan_amount + total_interest
-        
-        # Generate yearly payment schedule
-        yearly_payment_schedule = calculate_yearly_payment_schedule(
-            loan_amount, interest_rate, total_months, False, start_year, start_month
-        )
-        
-        return jsonify({
-            'emi': round(emi, 2),
-            'totalInterest': round(total_interest, 2),
-            'totalAmount': round(total_amount, 2),
-            'loanAmount': round(loan_amount, 2),
-            'yearlyPaymentSchedule': yearly_payment_schedule
-        })
-    
-    except Exception as e:
-        return jsonify({'error': str(e)}), 400
-
-def calculate_step_up_emi(principal, annual_rate, tenure_years, initial_emi, step_up_amount, step_up_frequency):
-    """
-    Calculate Step Up EMI and related financial metrics
-    """
-    # Input validation
-    if principal <= 0 or annual_rate < 0 or tenure_years <= 0:
-        raise ValueError("Principal, interest rate, and tenure must be positive values")
-    
-    tenure_months = int(tenure_years * 12)
-    monthly_rate = annual_rate / (12 * 100)
-    
-    # Calculate step-up interval in months
-    step_up_interval = 12 if step_up_frequency == 'yearly' else 6 if step_up_frequency == 'half_yearly' else 3
-    
-    # Simulation variables
-    remaining_balance = principal
-    total_interest = 0
-    total_payment = 0
-    current_emi = initial_emi
-    payment_schedule = []
-    
-    for month in range(1, tenure_months + 1):
-        # Calculate interest for current month
-        interest_payment = remaining_balance * monthly_rate
-        principal_payment = current_emi - interest_payment
-        
-        # Handle negative amortization (when EMI < Interest)
-        if principal_payment < 0:
-            # Unpaid interest gets added to principal balance
-            unpaid_interest = abs(principal_payment)
-            remaining_balance += unpaid_interest
-            principal_payment = 0
-            # Actual interest paid is only the EMI amount
-            actual_interest_paid = current_emi
-        else:
-            # Normal case: EMI covers interest and some principal
-            actual_interest_paid = interest_payment
-            remaining_balance = max(0, remaining_balance - principal_payment)
-        
-        total_interest += actual_interest_paid
-        total_payment += current_emi
-        
-        # Store payment details
-        payment_schedule.append({
-            'month': month,
-            'emi': round(current_emi, 2),
-            'principal': round(principal_payment, 2),
-            'interest': round(actual_interest_paid, 2),
-            'balance': round(remaining_balance, 2)
-        })
-        
-        # Step up EMI if it's time (add fixed amount)
-        if month % step_up_interval == 0 and month < tenure_months:
-            current_emi = current_emi + step_up_amount
-        
-        # Break if loan is fully paid
-        if remaining_balance <= 0:
-            break
-    
-    # Calculate average EMI
-    avg_emi = total_payment / len(payment_schedule) if payment_schedule else 0
-    
-    # Calculate total amount and savings compared to regular EMI
-    regular_emi = calculate_emi(principal, annual_rate, tenure_months)
-    regular_total = regular_emi * tenure_months
-    savings = regular_total - total_payment
-    
-    return {
-        'initial_emi': round(initial_emi, 2),
-        'final_emi': round(current_emi, 2),
-        'average_emi': round(avg_emi, 2),
-        'total_interest': round(total_interest, 2),
-        'total_amount': round(total_payment, 2),
-        'principal': principal,
-        'tenure_months': len(payment_schedule),
-        'actual_tenure_years': round(len(payment_schedule) / 12, 1),
-        'savings': round(savings, 2),
-        'regular_emi': round(regular_emi, 2),
-        'payment_schedule': payment_schedule
-    }
-
-def generate_step_up_emi_yearly_schedule(principal, annual_rate, tenure_years, initial_emi, step_up_amount, step_up_frequency, start_year=2025):
-    """
-    Generate yearly payment schedule for step-up EMI
-    """
-    step_up_data = calculate_step_up_emi(principal, annual_rate, tenure_years, initial_emi, step_up_amount, step_up_frequency)
-    payment_schedule = step_up_data['payment_schedule']
-    
-    yearly_schedule = []
-    current_year = start_year
-    month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                   'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-    
-    # Group payments by year
-    months_processed = 0
-    current_month_index = 0
-    
-    while months_processed < len(payment_schedule):
-        year_principal = 0
-        year_interest = 0
-        year_payments = 0
-        monthly_data = []
-        
-        # Process up to 12 months for this year
-        months_in_year = min(12, len(payment_schedule) - months_processed)
-        
-        for month_in_year in range(months_in_year):
-            payment = payment_schedule[months_processed + month_in_year]
-            year_principal += payment['principal']
-            year_interest += payment['interest']
-            year_payments += payment['emi']
-            
-            # Calculate loan paid percentage
-            loan_paid_percentage = ((principal - payment['balance']) / principal) * 100
-            
-            monthly_data.append({
-                'month': month_names[(current_month_index + month_in_year) % 12],
-                'principal': payment['principal'],
-                'interest': payment['interest'],
-                'total_payment': payment['emi'],
-                'balance': payment['balance'],
-                'loan_paid_percentage': round(loan_paid_percentage, 2)
-            })
-        
-        # Calculate year-end loan paid percentage
-        last_payment = payment_schedule[months_processed + months_in_year - 1]
-        loan_paid_percentage = ((principal - last_payment['balance']) / principal) * 100
-        
-        yearly_schedule.append({
-            'year': current_year,
-            'principal': round(year_principal, 2),
-            'interest': round(year_interest, 2),
-            'total_payment': round(year_payments, 2),
-            'balance': last_payment['balance'],
-            'loan_paid_percentage': round(loan_paid_percentage, 2),
-            'months_in_year': months_in_year,
-            'monthly_data': monthly_data
-        })
-        
-        months_processed += months_in_year
-        current_year += 1
-        current_month_index = (current_month_index + months_in_year) % 12
-    
-    return yearly_schedule
-
-@app.route('/calculate-step-up-emi', methods=['POST'])
-def calculate_step_up_emi_route():
-    try:
-        data = request.get_json()
-        
-        loan_amount = float(data.get('loanAmount', 0))
-        interest_rate = float(data.get('interestRate', 0))
-        tenure_years = int(data.get('tenureYears', 0))
-        initial_emi = float(data.get('initialEmi', 0))
-        step_up_amount = float(data.get('stepUpAmount', 0))
-        step_up_frequency = data.get('stepUpFrequency', 'yearly')
-        
-        # Calculate step-up EMI
-        calculation = calculate_step_up_emi(loan_amount, interest_rate, tenure_years, initial_emi, step_up_amount, step_up_frequency)
-        
-        # Generate yearly schedule with monthly breakdown
-        yearly_schedule = generate_step_up_emi_yearly_schedule(
-            loan_amount, interest_rate, tenure_years, initial_emi, step_up_amount, step_up_frequency
-        )
-        
-        return jsonify({
-            'status': 'success',
-            'initialEmi': calculation['initial_emi'],
-            'finalEmi': calculation['final_emi'],
-            'averageEmi': calculation['average_emi'],
-            'totalInterest': calculation['total_interest'],
-            'totalAmount': calculation['total_amount'],
-            'actualTenureYears': calculation['actual_tenure_years'],
-            'savings': calculation['savings'],
-            'regularEmi': calculation['regular_emi'],
-            'loanAmount': loan_amount,
-            'yearlyBreakdown': yearly_schedule
-        })
-    
-    except Exception as e:
-        return jsonify({'status': 'error', 'error': str(e)}), 400
-
-def calculate_flat_interest_emi(principal, annual_rate, tenure_years):
-    """
-    Calculate flat interest rate EMI
-    In flat interest rate, interest is calculated on the original principal for the entire tenure
-    """
-    total_interest = principal * (annual_rate / 100) * tenure_years
-    total_amount = principal + total_interest
-    
-    # For flat interest rate, we'll use monthly payments as standard
-    total_payments = tenure_years * 12
-    flat_emi = total_amount / total_payments
-    
-    # Calculate effective interest rate (equivalent compound rate)
-    # This is the compound rate that would result in the same total payment
-    monthly_rate = (annual_rate / 100) / 12
-    compound_emi = principal * monthly_rate * ((1 + monthly_rate) ** (tenure_years * 12)) / (((1 + monthly_rate) ** (tenure_years * 12)) - 1)
-    compound_total = compound_emi * (tenure_years * 12)
-    
-    # Calculate effective rate using formula: ((Total/Principal)^(1/years) - 1) * 100
-    effective_rate = ((total_amount / principal) ** (1 / tenure_years) - 1) * 100
-    
-    return {
-        'flatEmi': round(flat_emi, 2),
-        'totalInterest': round(total_interest, 2),
-        'totalAmount': round(total_amount, 2),
-        'effectiveRate': round(effective_rate, 2),
-        'compoundEmi': round(compound_emi, 2),
-        'compoundTotal': round(compound_total, 2),
-        'totalPayments': total_payments
-    }
-
-def generate_flat_interest_amortization_schedule(principal, annual_rate, tenure_years):
-    """
-    Generate amortization schedule for flat interest rate EMI
-    """
-    calculation = calculate_flat_interest_emi(principal, annual_rate, tenure_years)
-    flat_emi = calculation['flatEmi']
-    total_payments = calculation['totalPayments']
-    
-    # Calculate interest per payment (constant for flat rate)
-    total_interest = principal * (annual_rate / 100) * tenure_years
-    interest_per_payment = total_interest / total_payments
-    
-    # Calculate principal per payment (constant for flat rate)
-    principal_per_payment = principal / total_payments
-    
-    schedule = []
-    remaining_balance = principal
-    
-    for payment_num in range(1, total_payments + 1):
-        # Monthly payment labels
-        period_label = f"Month {payment_num}"
-        
-        remaining_balance -= principal_per_payment
-        
-        schedule.append({
-            'period': period_label,
-            'emi': round(flat_emi, 2),
-            'principal': round(principal_per_payment, 2),
-            'interest': round(interest_per_payment, 2),
-            'balance': round(max(0, remaining_balance), 2)
-        })
-    
-    return schedule
-
-def generate_flat_interest_yearly_schedule(principal, annual_rate, tenure_years, start_year=2025):
-    """
-    Generate year-wise amortization schedule with monthly breakdown for flat interest rate EMI
-    """
-    calculation = calculate_flat_interest_emi(principal, annual_rate, tenure_years)
-    flat_emi = calculation['flatEmi']
-    
-    # Calculate interest per payment (constant for flat rate)
-    total_interest = principal * (annual_rate / 100) * tenure_years
-    interest_per_payment = total_interest / (tenure_years * 12)
-    
-    # Calculate principal per payment (constant for flat rate)
-    principal_per_payment = principal / (tenure_years * 12)
-    
-    yearly_schedule = []
-    remaining_balance = principal
-    total_principal_paid = 0
-    
-    month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                   'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-    
-    for year in range(tenure_years):
-        current_year = start_year + year
-        year_principal = 0
-        year_interest = 0
-        year_payments = 0
-        monthly_data = []
-        
-        # Calculate 12 months for each year
-        for month_idx in range(12):
-            month_name = month_names[month_idx]
-            
-            year_principal += principal_per_payment
-            year_interest += interest_per_payment
-            year_payments += flat_emi
-            
-            remaining_balance -= principal_per_payment
-            total_principal_paid += principal_per_payment
-            
-            # Calculate loan paid percentage for this month
-            loan_paid_percentage = ((principal - remaining_balance) / principal) * 100
-            
-            # Store monthly data
-            monthly_data.append({
-                'month': month_name,
-                'principal': round(principal_per_payment, 2),
-                'interest': round(interest_per_payment, 2),
-                'total_payment': round(flat_emi, 2),
-                'balance': round(max(0, remaining_balance), 2),
-                'loan_paid_percentage': round(loan_paid_percentage, 2)
-            })
-        
-        # Calculate loan paid percentage for the year
-        loan_paid_percentage = ((principal - remaining_balance) / principal) * 100
-        
-        yearly_schedule.append({
-            'year': current_year,
-            'principal': round(year_principal, 2),
-            'interest': round(year_interest, 2),
-            'total_payment': round(year_payments, 2),
-            'balance': round(max(0, remaining_balance), 2),
-            'loan_paid_percentage': round(loan_paid_percentage, 2),
-            'months_in_year': 12,
-            'monthly_data': monthly_data
-        })
-    
-    return yearly_schedule
-
-@app.route('/calculate-flat-interest-rate-emi', methods=['POST'])
-def calculate_flat_interest_rate_emi():
-    try:
-        data = request.get_json()
-        
-        loan_amount = float(data.get('loanAmount', 0))
-        interest_rate = float(data.get('interestRate', 0))
-        tenure_years = int(data.get('tenureYears', 0))
-        
-        # Calculate flat interest EMI
-        calculation = calculate_flat_interest_emi(loan_amount, interest_rate, tenure_years)
-        
-        # Generate amortization schedule
-        amortization_schedule = generate_flat_interest_amortization_schedule(
-            loan_amount, interest_rate, tenure_years
-        )
-        
-        # Generate yearly schedule with monthly breakdown
-        yearly_schedule = generate_flat_interest_yearly_schedule(
-            loan_amount, interest_rate, tenure_years
-        )
-        
-        return jsonify({
-            'status': 'success',
-            'flatEmi': calculation['flatEmi'],
-            'totalInterest': calculation['totalInterest'],
-            'totalAmount': calculation['totalAmount'],
-            'effectiveRate': calculation['effectiveRate'],
-            'loanAmount': loan_amount,
-            'amortizationSchedule': amortization_schedule,
-            'yearlyBreakdown': yearly_schedule
-        })
-    
-    except Exception as e:
-        return jsonify({'status': 'error', 'error': str(e)}), 400
-
-def calculate_flat_vs_reducing_rate_comparison(principal, annual_rate, tenure_years):
-    """
-    Calculate and compare flat interest rate vs reducing interest rate (compound) EMI
-    """
-    # Calculate flat interest EMI
-    flat_calculation = calculate_flat_interest_emi(principal, annual_rate, tenure_years)
-    
-    # Calculate reducing interest rate EMI (compound)
-    tenure_months = tenure_years * 12
-    monthly_rate = annual_rate / (12 * 100)
-    
-    if monthly_rate > 0:
-        reducing_emi = principal * monthly_rate * ((1 + monthly_rate) ** tenure_months) / (((1 + monthly_rate) ** tenure_months) - 1)
-    else:
-        reducing_emi = principal / tenure_months
-    
-    reducing_total_amount = reducing_emi * tenure_months
-    reducing_total_interest = reducing_total_amount - principal
-    
-    # Calculate differences
-    emi_difference = flat_calculation['flatEmi'] - reducing_emi
-    total_savings = flat_calculation['totalInterest'] - reducing_total_interest
-    
-    return {
-        'flatEmi': flat_calculation['flatEmi'],
-        'flatTotalInterest': flat_calculation['totalInterest'],
-        'flatTotalAmount': flat_calculation['totalAmount'],
-        'reducingEmi': round(reducing_emi, 2),
-        'reducingTotalInterest': round(reducing_total_interest, 2),
-        'reducingTotalAmount': round(reducing_total_amount, 2),
-        'emiDifference': round(emi_difference, 2),
-        'totalSavings': round(total_savings, 2),
-        'loanAmount': principal
-    }
-
-def generate_flat_vs_reducing_comparison_schedule(principal, annual_rate, tenure_years, start_year=2025):
-    """
-    Generate year-wise comparison schedule between flat and reducing interest rates
-    """
-    # Flat interest calculations
-    flat_calculation = calculate_flat_interest_emi(principal, annual_rate, tenure_years)
-    flat_emi = flat_calculation['flatEmi']
-    
-    # Calculate flat interest per payment (constant for flat rate)
-    total_flat_interest = principal * (annual_rate / 100) * tenure_years
-    flat_interest_per_payment = total_flat_interest / (tenure_years * 12)
-    flat_principal_per_payment = principal / (tenure_years * 12)
-    
-    # Reducing interest calculations
-    tenure_months = tenure_years * 12
-    monthly_rate = annual_rate / (12 * 100)
-    
-    if monthly_rate > 0:
-        reducing_emi = principal * monthly_rate * ((1 + monthly_rate) ** tenure_months) / (((1 + monthly_rate) ** tenure_months) - 1)
-    else:
-        reducing_emi = principal / tenure_months
-    
-    comparison_schedule = []
-    flat_remaining_balance = principal
-    reducing_remaining_balance = principal
-    
-    for year in range(tenure_years):
-        current_year = start_year + year
-        
-        # Flat interest calculations for the year
-        flat_year_principal = flat_principal_per_payment * 12
-        flat_year_interest = flat_interest_per_payment * 12
-        flat_remaining_balance -= flat_year_principal
-        
-        # Reducing interest calculations for the year
-        reducing_year_principal = 0
-        reducing_year_interest = 0
-        
-        # Calculate 12 months for reducing interest
-        for month in range(12):
-            if reducing_remaining_balance <= 0:
-                break
-                
-            interest_payment = reducing_remaining_balance * monthly_rate
-            principal_payment = min(reducing_emi - interest_payment, reducing_remaining_balance)
-            
-            reducing_year_principal += principal_payment
-            reducing_year_interest += interest_payment
-            reducing_remaining_balance -= principal_payment
-        
-        # Calculate interest savings for this year
-        interest_savings = flat_year_interest - reducing_year_interest
-        
-        comparison_schedule.append({
-            'year': current_year,
-            'flatEmi': round(flat_emi, 2),
-            'flatInterest': round(flat_year_interest, 2),
-            'flatBalance': round(max(0, flat_remaining_balance), 2),
-            'reducingEmi': round(reducing_emi, 2),
-            'reducingInterest': round(reducing_year_interest, 2),
-            'reducingBalance': round(max(0, reducing_remaining_balance), 2),
-            'interestSavings': round(interest_savings, 2)
-        })
-    
-    return comparison_schedule
-
-@app.route('/calculate-flat-vs-reducing-rate-interest', methods=['POST'])
-def calculate_flat_vs_reducing_rate_interest():
-    try:
-        data = request.get_json()
-        
-        loan_amount = float(data.get('loanAmount', 0))
-        interest_rate = float(data.get('interestRate', 0))
-        tenure_years = int(data.get('tenureYears', 0))
-        
-        # Calculate comparison
-        comparison = calculate_flat_vs_reducing_rate_comparison(loan_amount, interest_rate, tenure_years)
-        
-        # Generate comparison schedule
-        comparison_schedule = generate_flat_vs_reducing_comparison_schedule(
-            loan_amount, interest_rate, tenure_years
-        )
-        
-        return jsonify({
-            'status': 'success',
-            'flatEmi': comparison['flatEmi'],
-            'flatTotalInterest': comparison['flatTotalInterest'],
-            'flatTotalAmount': comparison['flatTotalAmount'],
-            'reducingEmi': comparison['reducingEmi'],
-            'reducingTotalInterest': comparison['reducingTotalInterest'],
-            'reducingTotalAmount': comparison['reducingTotalAmount'],
-            'emiDifference': comparison['emiDifference'],
-            'totalSavings': comparison['totalSavings'],
-            'loanAmount': loan_amount,
-            'comparisonSchedule': comparison_schedule
-        })
-    
-    except Exception as e:
-        return jsonify({'status': 'error', 'error': str(e)}), 400
-
-def calculate_lumpsum_vs_sip_comparison(investment_amount, monthly_sip, expected_return_percent, investment_period_years):
-    """
-    Calculate and compare lumpsum investment vs SIP investment
-    """
-    annual_return_rate = expected_return_percent / 100
-    monthly_return_rate = annual_return_rate / 12
-    total_months = investment_period_years * 12
-    
-    # Lumpsum calculation (compound interest)
-    lumpsum_maturity_value = investment_amount * ((1 + annual_return_rate) ** investment_period_years)
-    lumpsum_gains = lumpsum_maturity_value - investment_amount
-    
-    # SIP calculation (future value of annuity)
-    if monthly_return_rate > 0:
-        sip_maturity_value = monthly_sip * (((1 + monthly_return_rate) ** total_months - 1) / monthly_return_rate)
-    else:
-        sip_maturity_value = monthly_sip * total_months
-    
-    sip_total_investment = monthly_sip * total_months
-    sip_gains = sip_maturity_value - sip_total_investment
-    
-    # Determine better option
-    if investment_amount == 0:
-        better_option = "SIP"
-        difference = sip_maturity_value
-    elif monthly_sip == 0:
-        better_option = "Lumpsum"
-        difference = lumpsum_maturity_value
-    elif lumpsum_maturity_value > sip_maturity_value:
-        better_option = "Lumpsum"
-        difference = lumpsum_maturity_value - sip_maturity_value
-    else:
-        better_option = "SIP"
-        difference = sip_maturity_value - lumpsum_maturity_value
-    
-    return {
-        'lumpsumInvestment': round(investment_amount, 2),
-        'lumpsumMaturityValue': round(lumpsum_maturity_value, 2),
-        'lumpsumGains': round(lumpsum_gains, 2),
-        'sipTotalInvestment': round(sip_total_investment, 2),
-        'sipMaturityValue': round(sip_maturity_value, 2),
-        'sipGains': round(sip_gains, 2),
-        'betterOption': better_option,
-        'difference': round(difference, 2)
-    }
-
-def generate_lumpsum_vs_sip_schedule(investment_amount, monthly_sip, expected_return_percent, investment_period_years, start_year=2025):
-    """
-    Generate year-wise comparison schedule between lumpsum and SIP investments
-    """
-    annual_return_rate = expected_return_percent / 100
-    monthly_return_rate = annual_return_rate / 12
-    
-    comparison_schedule = []
-    
-    # Lumpsum tracking
-    lumpsum_value = investment_amount
-    
-    # SIP tracking
-    sip_total_invested = 0
-    sip_value = 0
-    
-    for year in range(1, investment_period_years + 1):
-        current_year = start_year + year - 1
-        
-        # Lumpsum grows by annual return rate
-        lumpsum_value *= (1 + annual_return_rate)
-        lumpsum_gains = lumpsum_value - investment_amount
-        
-        # SIP: Add 12 months of SIP with monthly compounding
-        for month in range(12):
-            sip_total_invested += monthly_sip
-            sip_value = (sip_value + monthly_sip) * (1 + monthly_return_rate)
-        
-        sip_gains = sip_value - sip_total_invested
-        
-        # Calculate which is better for this year
-        if investment_amount == 0:
-            better_option = "SIP"
-            advantage = sip_value
-        elif monthly_sip == 0:
-            better_option = "Lumpsum"
-            advantage = lumpsum_value
-        elif lumpsum_value > sip_value:
-            better_option = "Lumpsum"
-            advantage = lumpsum_value - sip_value
-        else:
-            better_option = "SIP"
-            advantage = sip_value - lumpsum_value
-        
-        comparison_schedule.append({
-            'year': current_year,
-            'lumpsumValue': round(lumpsum_value, 2),
-            'lumpsumGains': round(lumpsum_gains, 2),
-            'sipTotalInvested': round(sip_total_invested, 2),
-            'sipValue': round(sip_value, 2),
-            'sipGains': round(sip_gains, 2),
-            'betterOption': better_option,
-            'advantage': round(advantage, 2)
-        })
-    
-    return comparison_schedule
-
-@app.route('/calculate-lumpsum-vs-sip', methods=['POST'])
-def calculate_lumpsum_vs_sip():
-    try:
-        data = request.get_json()
-        
-        investment_amount = float(data.get('investmentAmount', 0))
-        monthly_sip = float(data.get('monthlySip', 0))
-        expected_return = float(data.get('expectedReturn', 0))
-        investment_period = int(data.get('investmentPeriod', 0))
-        
-        # Validate inputs
-        if investment_amount < 0 or monthly_sip < 0 or expected_return < 0 or investment_period < 1:
-            return jsonify({'status': 'error', 'error': 'Please enter positive values (investment period must be at least 1 year)'}), 400
-        
-        if investment_amount == 0 and monthly_sip == 0:
-            return jsonify({'status': 'error', 'error': 'Please enter either a lumpsum amount or SIP amount (or both)'}), 400
-        
-        # Calculate lumpsum vs SIP comparison
-        comparison = calculate_lumpsum_vs_sip_comparison(investment_amount, monthly_sip, expected_return, investment_period)
-        
-        # Generate comparison schedule
-        comparison_schedule = generate_lumpsum_vs_sip_schedule(
-            investment_amount, monthly_sip, expected_return, investment_period
-        )
-        
-        return jsonify({
-            'status': 'success',
-            'lumpsumInvestment': comparison['lumpsumInvestment'],
-            'lumpsumMaturityValue': comparison['lumpsumMaturityValue'],
-            'lumpsumGains': comparison['lumpsumGains'],
-            'sipTotalInvestment': comparison['sipTotalInvestment'],
-            'sipMaturityValue': comparison['sipMaturityValue'],
-            'sipGains': comparison['sipGains'],
-            'betterOption': comparison['betterOption'],
-            'difference': comparison['difference'],
-            'comparisonSchedule': comparison_schedule
-        })
-    
-    except Exception as e:
-        return jsonify({'status': 'error', 'error': str(e)}), 400
-
-def calculate_reducing_loan_emi(principal, annual_rate, tenure_years):
-    """
-    Calculate reducing loan EMI using reducing balance method
-    """
-    tenure_months = tenure_years * 12
-    monthly_rate = annual_rate / (12 * 100)
-    
-    # Calculate EMI using reducing balance method
-    if monthly_rate > 0:
-        emi = principal * monthly_rate * ((1 + monthly_rate) ** tenure_months) / (((1 + monthly_rate) ** tenure_months) - 1)
-    else:
-        emi = principal / tenure_months
-    
-    # Calculate total amounts
-    total_interest = (emi * tenure_months) - principal
-    total_amount = principal + total_interest
-    
-    return {
-        'emi': round(emi, 2),
-        'totalInterest': round(total_interest, 2),
-        'totalAmount': round(total_amount, 2),
-        'principalAmount': principal
-    }
-
-def generate_reducing_loan_emi_schedule(principal, annual_rate, tenure_years, start_year=2025):
-    """
-    Generate year-wise payment schedule for reducing loan EMI
-    """
-    tenure_months = tenure_years * 12
-    monthly_rate = annual_rate / (12 * 100)
-    
-    # Calculate EMI
-    if monthly_rate > 0:
-        emi = principal * monthly_rate * ((1 + monthly_rate) ** tenure_months) / (((1 + monthly_rate) ** tenure_months) - 1)
-    else:
-        emi = principal / tenure_months
-    
-    schedule = []
-    remaining_balance = principal
-    
-    month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                   'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-    
-    for year in range(tenure_years):
-        current_year = start_year + year
-        year_principal = 0
-        year_interest = 0
-        year_payments = 0
-        monthly_data = []
-        
-        # Calculate 12 months for the year
-        for month_idx in range(12):
-            if remaining_balance <= 0:
-                break
-                
-            month_name = month_names[month_idx]
-            interest_payment = remaining_balance * monthly_rate
-            principal_payment = min(emi - interest_payment, remaining_balance)
-            
-            # Adjust EMI if it's the last payment
-            if remaining_balance < emi:
-                actual_emi = remaining_balance + interest_payment
-            else:
-                actual_emi = emi
-            
-            year_principal += principal_payment
-            year_interest += interest_payment
-            year_payments += actual_emi
-            
-            remaining_balance -= principal_payment
-            
-            # Calculate loan paid percentage for this month
-            loan_paid_percentage = ((principal - remaining_balance) / principal) * 100
-            
-            # Store monthly data
-            monthly_data.append({
-                'month': month_name,
-                'principal': round(principal_payment, 2),
-                'interest': round(interest_payment, 2),
-                'emi': round(actual_emi, 2),
-                'balance': round(max(0, remaining_balance), 2),
-                'loan_paid_percentage': round(loan_paid_percentage, 2)
-            })
-        
-        # Calculate loan paid percentage for the year
-        loan_paid_percentage = ((principal - remaining_balance) / principal) * 100
-        
-        schedule.append({
-            'year': current_year,
-            'principal': round(year_principal, 2),
-            'interest': round(year_interest, 2),
-            'total_payment': round(year_payments, 2),
-            'balance': round(max(0, remaining_balance), 2),
-            'loan_paid_percentage': round(loan_paid_percentage, 2),
-            'emi': round(emi, 2),
-            'months_in_year': len(monthly_data),
-            'monthly_data': monthly_data
-        })
-        
-        # Stop if loan is fully paid
-        if remaining_balance <= 0:
-            break
-    
-    return schedule
-
-@app.route('/calculate-reducing-loan-emi', methods=['POST'])
-def calculate_reducing_loan_emi_route():
-    try:
-        data = request.get_json()
-        
-        loan_amount = float(data.get('loanAmount', 0))
-        interest_rate = float(data.get('interestRate', 0))
-        tenure_years = int(data.get('tenureYears', 0))
-        
-        # Calculate reducing loan EMI
-        calculation = calculate_reducing_loan_emi(
-            loan_amount, interest_rate, tenure_years
-        )
-        
-        # Generate payment schedule
-        payment_schedule = generate_reducing_loan_emi_schedule(
-            loan_amount, interest_rate, tenure_years
-        )
-        
-        return jsonify({
-            'status': 'success',
-            'emi': calculation['emi'],
-            'totalInterest': calculation['totalInterest'],
-            'totalAmount': calculation['totalAmount'],
-            'principalAmount': calculation['principalAmount'],
-            'loanAmount': loan_amount,
-            'paymentSchedule': payment_schedule
-        })
-    
-    except Exception as e:
-        return jsonify({'status': 'error', 'error': str(e)}), 400
-
-def calculate_reducing_balance_emi(principal, annual_rate, tenure_years):
-    """
-    Calculate reducing balance EMI - standard EMI calculation where interest 
-    is charged on the outstanding (reducing) balance
-    """
-    tenure_months = tenure_years * 12
-    monthly_rate = annual_rate / (12 * 100)
-    
-    if monthly_rate == 0:
-        emi = principal / tenure_months
-        total_interest = 0
-        total_amount = principal
-    else:
-        # Standard EMI formula for reducing balance
-        emi = principal * monthly_rate * ((1 + monthly_rate) ** tenure_months) / (((1 + monthly_rate) ** tenure_months) - 1)
-        total_amount = emi * tenure_months
-        total_interest = total_amount - principal
-    
-    return {
-        'emi': round(emi, 2),
-        'principalAmount': principal,
-        'totalInterest': round(total_interest, 2),
-        'totalAmount': round(total_amount, 2),
-        'tenureMonths': tenure_months
-    }
-
-def generate_reducing_balance_emi_schedule(principal, annual_rate, tenure_years, start_year=2025):
-    """
-    Generate year-wise amortization schedule with monthly breakdown for reducing balance EMI
-    """
-    calculation = calculate_reducing_balance_emi(principal, annual_rate, tenure_years)
-    emi = calculation['emi']
-    tenure_months = calculation['tenureMonths']
-    monthly_rate = annual_rate / (12 * 100)
-    
-    yearly_schedule = []
-    remaining_balance = principal
-    current_year = start_year
-    month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                   'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-    
-    total_months_processed = 0
-    current_month = 0  # Start from January
-    
-    while total_months_processed < tenure_months:
-        year_principal = 0
-        year_interest = 0
-        year_payments = 0
-        monthly_data = []
-        opening_balance_year = remaining_balance
-        
-        # Calculate months for this year
-        months_remaining_in_year = 12 - current_month
-        months_to_process = min(months_remaining_in_year, tenure_months - total_months_processed)
-        
-        for month_idx in range(months_to_process):
-            if total_months_processed >= tenure_months:
-                break
-                
-            total_months_processed += 1
-            
-            # Calculate interest and principal for this month
-            interest_payment = remaining_balance * monthly_rate
-            principal_payment = emi - interest_payment
-            
-            # Ensure we don't pay more principal than remaining
-            if principal_payment > remaining_balance:
-                principal_payment = remaining_balance
-                interest_payment = emi - principal_payment
-            
-            year_principal += principal_payment
-            year_interest += interest_payment
-            year_payments += emi
-            
-            remaining_balance -= principal_payment
-            
-            # Get the correct month name
-            month_name = month_names[(current_month + month_idx) % 12]
-            
-            # Store monthly data
-            monthly_data.append({
-                'month': month_name,
-                'emi': round(emi, 2),
-                'principal': round(principal_payment, 2),
-                'interest': round(interest_payment, 2),
-                'balance': round(max(0, remaining_balance), 2),
-                'openingBalance': round(remaining_balance + principal_payment, 2)
-            })
-        
-        yearly_schedule.append({
-            'year': current_year,
-            'openingBalance': round(opening_balance_year, 2),
-            'emiPaid': round(year_payments, 2),
-            'principalPaid': round(year_principal, 2),
-            'interestPaid': round(year_interest, 2),
-            'closingBalance': round(max(0, remaining_balance), 2),
-            'months_in_year': months_to_process,
-            'monthly_data': monthly_data
-        })
-        
-        # Move to next year
-        current_year += 1
-        current_month = 0  # Start from January for subsequent years
-        
-        # Stop if loan is fully paid
-        if remaining_balance <= 0:
-            break
-    
-    return yearly_schedule
-
-@app.route('/calculate-reducing-balance-emi', methods=['POST'])
-def calculate_reducing_balance_emi_route():
-    try:
-        data = request.get_json()
-        
-        loan_amount = float(data.get('loanAmount', 0))
-        interest_rate = float(data.get('interestRate', 0))
-        tenure_years = int(data.get('tenureYears', 0))
-        
-        # Calculate reducing balance EMI
-        calculation = calculate_reducing_balance_emi(loan_amount, interest_rate, tenure_years)
-        
-        # Generate yearly schedule with monthly breakdown
-        yearly_schedule = generate_reducing_balance_emi_schedule(
-            loan_amount, interest_rate, tenure_years, 2025
-        )
-        
-        return jsonify({
-            'status': 'success',
-            'emi': calculation['emi'],
-            'principalAmount': calculation['principalAmount'],
-            'totalInterest': calculation['totalInterest'],
-            'totalAmount': calculation['totalAmount'],
-            'balanceSchedule': yearly_schedule
-        })
-    
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        }), 400
-
-def calculate_reducing_rate_emi(principal, initial_rate, reduced_rate, transition_year, tenure_years):
-    """
-    Calculate reducing rate EMI - where interest rate reduces after a certain period
-    """
-    tenure_months = tenure_years * 12
-    transition_month = transition_year * 12
-    
-    # Phase 1: Initial rate period
-    initial_monthly_rate = initial_rate / (12 * 100)
-    
-    if initial_monthly_rate == 0:
-        phase1_emi = principal / tenure_months
-    else:
-        # Standard EMI formula for entire tenure at initial rate
-        phase1_emi = principal * initial_monthly_rate * ((1 + initial_monthly_rate) ** tenure_months) / (((1 + initial_monthly_rate) ** tenure_months) - 1)
-    
-    # Calculate remaining balance after transition period
-    remaining_principal = principal
-    total_interest_phase1 = 0
-    
-    for month in range(min(transition_month, tenure_months)):
-        interest_payment = remaining_principal * initial_monthly_rate
-        principal_payment = phase1_emi - interest_payment
-        remaining_principal -= principal_payment
-        total_interest_phase1 += interest_payment
-    
-    # Phase 2: Reduced rate period (if any months remaining)
-    phase2_emi = 0
-    total_interest_phase2 = 0
-    remaining_months = tenure_months - transition_month
-    
-    if remaining_months > 0 and remaining_principal > 0:
-        reduced_monthly_rate = reduced_rate / (12 * 100)
-        
-        if reduced_monthly_rate == 0:
-            phase2_emi = remaining_principal / remaining_months
-        else:
-            # EMI for remaining balance at reduced rate
-            phase2_emi = remaining_principal * reduced_monthly_rate * ((1 + reduced_monthly_rate) ** remaining_months) / (((1 + reduced_monthly_rate) ** remaining_months) - 1)
-        
-        # Calculate interest for phase 2
-        temp_balance = remaining_principal
-        for month in range(remaining_months):
-            interest_payment = temp_balance * reduced_monthly_rate
-            principal_payment = phase2_emi - interest_payment
-            temp_balance -= principal_payment
-            total_interest_phase2 += interest_payment
-    
-    total_interest = total_interest_phase1 + total_interest_phase2
-    total_amount = principal + total_interest
-    
-    # Calculate weighted average EMI
-    if transition_month >= tenure_months:
-        avg_emi = phase1_emi
-    else:
-        avg_emi = ((phase1_emi * transition_month) + (phase2_emi * remaining_months)) / tenure_months
-    
-    return {
-        'phase1Emi': round(phase1_emi, 2),
-        'phase2Emi': round(phase2_emi, 2),
-        'avgEmi': round(avg_emi, 2),
-        'principalAmount': principal,
-        'totalInterest': round(total_interest, 2),
-        'totalAmount': round(total_amount, 2),
-        'tenureMonths': tenure_months,
-        'transitionMonth': transition_month,
-        'remainingBalanceAtTransition': round(remaining_principal, 2),
-        'phase1Interest': round(total_interest_phase1, 2),
-        'phase2Interest': round(total_interest_phase2, 2)
-    }
-
-def generate_reducing_rate_emi_schedule(principal, initial_rate, reduced_rate, transition_year, tenure_years, start_year=2025):
-    """
-    Generate year-wise amortization schedule with monthly breakdown for reducing rate EMI
-    """
-    calculation = calculate_reducing_rate_emi(principal, initial_rate, reduced_rate, transition_year, tenure_years)
-    tenure_months = calculation['tenureMonths']
-    transition_month = calculation['transitionMonth']
-    
-    yearly_schedule = []
-    remaining_balance = principal
-    current_year = start_year
-    month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                   'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-    
-    total_months_processed = 0
-    current_month = 0  # Start from January
-    
-    while total_months_processed < tenure_months:
-        year_principal = 0
-        year_interest = 0
-        year_payments = 0
-        monthly_data = []
-        opening_balance_year = remaining_balance
-        
-        # Calculate months for this year
-        months_remaining_in_year = 12 - current_month
-        months_to_process = min(months_remaining_in_year, tenure_months - total_months_processed)
-        
-        for month_idx in range(months_to_process):
-            if total_months_processed >= tenure_months:
-                break
-                
-            total_months_processed += 1
-            
-            # Determine which phase we're in
-            if total_months_processed <= transition_month:
-                # Phase 1: Initial rate
-                monthly_rate = initial_rate / (12 * 100)
-                current_emi = calculation['phase1Emi']
-                rate_type = "Initial"
-            else:
-                # Phase 2: Reduced rate
-                monthly_rate = reduced_rate / (12 * 100)
-                current_emi = calculation['phase2Emi']
-                rate_type = "Reduced"
-            
-            # Calculate interest and principal for this month
-            interest_payment = remaining_balance * monthly_rate
-            principal_payment = current_emi - interest_payment
-            
-            # Ensure we don't pay more principal than remaining
-            if principal_payment > remaining_balance:
-                principal_payment = remaining_balance
-                interest_payment = current_emi - principal_payment
-            
-            year_principal += principal_payment
-            year_interest += interest_payment
-            year_payments += current_emi
-            
-            remaining_balance -= principal_payment
-            
-            # Get the correct month name
-            month_name = month_names[(current_month + month_idx) % 12]
-            
-            # Store monthly data
-            monthly_data.append({
-                'month': month_name,
-                'emi': round(current_emi, 2),
-                'principal': round(principal_payment, 2),
-                'interest': round(interest_payment, 2),
-                'balance': round(max(0, remaining_balance), 2),
-                'openingBalance': round(remaining_balance + principal_payment, 2),
-                'rateType': rate_type,
-                'currentRate': initial_rate if total_months_processed <= transition_month else reduced_rate
-            })
-        
-        yearly_schedule.append({
-            'year': current_year,
-            'openingBalance': round(opening_balance_year, 2),
-            'emiPaid': round(year_payments, 2),
-            'principalPaid': round(year_principal, 2),
-            'interestPaid': round(year_interest, 2),
-            'closingBalance': round(max(0, remaining_balance), 2),
-            'months_in_year': months_to_process,
-            'monthly_data': monthly_data
-        })
-        
-        # Move to next year
-        current_year += 1
-        current_month = 0  # Start from January for subsequent years
-        
-        # Stop if loan is fully paid
-        if remaining_balance <= 0:
-            break
-    
-    return yearly_schedule
-
-@app.route('/calculate-reducing-rate-emi', methods=['POST'])
-def calculate_reducing_rate_emi_route():
-    try:
-        data = request.get_json()
-        
-        loan_amount = float(data.get('loanAmount', 0))
-        initial_rate = float(data.get('initialRate', 0))
-        reduced_rate = float(data.get('reducedRate', 0))
-        transition_year = int(data.get('transitionYear', 0))
-        tenure_years = int(data.get('tenureYears', 0))
-        
-        # Calculate reducing rate EMI
-        calculation = calculate_reducing_rate_emi(loan_amount, initial_rate, reduced_rate, transition_year, tenure_years)
-        
-        # Generate yearly schedule with monthly breakdown
-        yearly_schedule = generate_reducing_rate_emi_schedule(
-            loan_amount, initial_rate, reduced_rate, transition_year, tenure_years, 2025
-        )
-        
-        return jsonify({
-            'status': 'success',
-            'phase1Emi': calculation['phase1Emi'],
-            'phase2Emi': calculation['phase2Emi'],
-            'avgEmi': calculation['avgEmi'],
-            'principalAmount': calculation['principalAmount'],
-            'totalInterest': calculation['totalInterest'],
-            'totalAmount': calculation['totalAmount'],
-            'remainingBalanceAtTransition': calculation['remainingBalanceAtTransition'],
-            'phase1Interest': calculation['phase1Interest'],
-            'phase2Interest': calculation['phase2Interest'],
-            'balanceSchedule': yearly_schedule
-        })
-    
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        }), 400
-
-def calculate_no_cost_emi(mrp_price, tenure_months, regular_interest_rate):
-    """
-    Calculate No Cost EMI analysis - shows what inflated price would be needed for true "no cost" EMI
-    """
-    # Regular EMI calculation (compound interest)
-    monthly_rate = regular_interest_rate / (12 * 100)
-    if monthly_rate > 0:
-        regular_emi = (mrp_price * monthly_rate * ((1 + monthly_rate) ** tenure_months)) / (((1 + monthly_rate) ** tenure_months) - 1)
-    else:
-        regular_emi = mrp_price / tenure_months
-    
-    # No Cost EMI is same as Regular EMI (that's the "trick")
-    no_cost_emi = regular_emi
-    
-    # Calculate what the inflated price would need to be
-    inflated_price = no_cost_emi * tenure_months
-    
-    # Calculate totals
-    regular_total = regular_emi * tenure_months
-    no_cost_total = inflated_price
-    
-    # Hidden markup calculation
-    hidden_markup = inflated_price - mrp_price
-    
-    # Effective interest rate calculation
-    # This represents the hidden interest rate embedded in the price inflation
-    if hidden_markup > 0 and mrp_price > 0:
-        # Calculate the annualized rate of the hidden markup
-        years = tenure_months / 12
-        effective_rate = ((inflated_price / mrp_price) ** (1 / years) - 1) * 100
-    else:
-        effective_rate = 0
-    
-    # Since no-cost EMI and regular EMI have same monthly payment, they are equivalent
-    better_option = 'Both are equivalent'
-    savings = 0
-    
-    return {
-        'noCostEmi': round(no_cost_emi, 2),
-        'regularEmi': round(regular_emi, 2),
-        'hiddenCost': round(hidden_markup, 2),
-        'effectiveRate': round(effective_rate, 2),
-        'inflatedPrice': round(inflated_price, 2),
-        'betterOption': better_option,
-        'savings': round(savings, 2),
-        'mrpPrice': mrp_price,
-        'noCostPrice': round(inflated_price, 2),
-        'processingFee': 0,
-        'regularTotal': round(regular_total, 2),
-        'noCostTotal': round(no_cost_total, 2)
-    }
-
-def generate_no_cost_emi_payment_schedule(inflated_price, tenure_months):
-    """
-    Generate payment schedule for No Cost EMI
-    """
-    total_amount = inflated_price
-    emi_amount = total_amount / tenure_months
-    
-    schedule = []
-    outstanding_balance = total_amount
-    
-    for month in range(1, tenure_months + 1):
-        outstanding_balance -= emi_amount
-        
-        schedule.append({
-            'month': month,
-            'emiAmount': round(emi_amount, 2),
-            'outstandingBalance': round(max(0, outstanding_balance), 2),
-            'paymentStatus': 'Pending'
-        })
-    
-    return schedule
-
-@app.route('/calculate-no-cost-emi', methods=['POST'])
-def calculate_no_cost_emi_route():
-    try:
-        data = request.get_json()
-        
-        mrp_price = float(data.get('mrpPrice', 0))
-        tenure_months = int(data.get('tenureMonths', 0))
-        interest_rate = float(data.get('interestRate', 12.0))
-        
-        # Calculate no cost EMI
-        calculation = calculate_no_cost_emi(mrp_price, tenure_months, interest_rate)
-        
-        # Generate payment schedule
-        payment_schedule = generate_no_cost_emi_payment_schedule(calculation['inflatedPrice'], tenure_months)
-        
-        return jsonify({
-            'status': 'success',
-            'noCostEmi': calculation['noCostEmi'],
-            'regularEmi': calculation['regularEmi'],
-            'hiddenCost': calculation['hiddenCost'],
-            'effectiveRate': calculation['effectiveRate'],
-            'inflatedPrice': calculation['inflatedPrice'],
-            'betterOption': calculation['betterOption'],
-            'savings': calculation['savings'],
-            'mrpPrice': calculation['mrpPrice'],
-            'noCostPrice': calculation['noCostPrice'],
-            'processingFee': 0,
-            'regularTotal': calculation['regularTotal'],
-            'noCostTotal': calculation['noCostTotal'],
-            'paymentSchedule': payment_schedule
-        })
-    
-    except Exception as e:
-        return jsonify({'status': 'error', 'error': str(e)}), 400
-
-def calculate_bullet_emi(total_amount, down_payment, actual_loan_amount, annual_rate, tenure_years):
-    """
-    Calculate Bullet EMI - Interest-only payments with principal due at end
-    """
-    # Monthly interest rate
-    monthly_rate = annual_rate / (12 * 100)
-    total_months = tenure_years * 12
-    
-    # Monthly interest payment (only interest, no principal) - based on actual loan amount
-    monthly_interest = actual_loan_amount * monthly_rate
-    
-    # Monthly EMI (same as monthly interest in bullet EMI) - based on actual loan amount
-    monthly_emi = monthly_interest  # In bullet EMI, EMI = Interest payment only
-    
-    # Total interest over the tenure
-    total_interest = monthly_interest * total_months
-    
-    # Total amount payable (loan + interest, excluding down payment)
-    total_payable = actual_loan_amount + total_interest
-    
-    # Calculate what the regular EMI would be for the Total Amount Payable
-    if monthly_rate > 0:
-        regular_emi_for_total = (total_payable * monthly_rate * (1 + monthly_rate) ** total_months) / ((1 + monthly_rate) ** total_months - 1)
-    else:
-        regular_emi_for_total = total_payable / total_months if total_months > 0 else 0
-    
-    return {
-        'monthlyEmi': round(monthly_emi, 2),
-        'monthlyInterest': round(monthly_interest, 2),
-        'totalInterest': round(total_interest, 2),
-        'totalPayable': round(total_payable, 2),
-        'regularEmiForTotal': round(regular_emi_for_total, 2),
-        'actualLoanAmount': actual_loan_amount,
-        'downPayment': down_payment,
-        'totalAmount': total_amount,
-        'tenureYears': tenure_years
-    }
-
-def generate_bullet_emi_payment_schedule(actual_loan_amount, annual_rate, tenure_years, start_year=2025):
-    """
-    Generate year-wise payment schedule for bullet EMI
-    """
-    monthly_rate = annual_rate / (12 * 100)
-    monthly_interest = actual_loan_amount * monthly_rate
-    
-    payment_schedule = []
-    
-    for year in range(tenure_years):
-        current_year = start_year + year
-        
-        # For all years except the last, only interest payments
-        if year < tenure_years - 1:
-            interest_payment = monthly_interest * 12
-            principal_payment = 0
-            total_payment = interest_payment
-            outstanding_principal = actual_loan_amount
-            loan_paid_percentage = 0
-        else:
-            # Final year: interest payments + principal repayment
-            interest_payment = monthly_interest * 12
-            principal_payment = actual_loan_amount
-            total_payment = interest_payment + principal_payment
-            outstanding_principal = 0
-            loan_paid_percentage = 100
-        
-        payment_schedule.append({
-            'year': current_year,
-            'interestPayment': round(interest_payment, 2),
-            'principalPayment': round(principal_payment, 2),
-            'totalPayment': round(total_payment, 2),
-            'outstandingPrincipal': round(outstanding_principal, 2),
-            'loanPaidPercentage': round(loan_paid_percentage, 2)
-        })
-    
-    return payment_schedule
-
-@app.route('/calculate-bullet-emi', methods=['POST'])
-def calculate_bullet_emi_route():
-    try:
-        data = request.get_json()
-        
-        total_amount = float(data.get('totalAmount', 0))
-        down_payment = float(data.get('downPayment', 0))
-        actual_loan_amount = float(data.get('actualLoanAmount', 0))
-        interest_rate = float(data.get('interestRate', 0))
-        tenure_years = int(data.get('tenureYears', 0))
-        
-        # Validate that actual loan amount is positive
-        if actual_loan_amount <= 0:
-            return jsonify({
-                'status': 'error', 
-                'error': 'Loan amount must be greater than zero. Please reduce down payment or increase total amount.'
-            }), 400
-        
-        # Calculate bullet EMI
-        calculation = calculate_bullet_emi(
-            total_amount, down_payment, actual_loan_amount, interest_rate, tenure_years
-        )
-        
-        # Generate payment schedule
-        payment_schedule = generate_bullet_emi_payment_schedule(
-            actual_loan_amount, interest_rate, tenure_years
-        )
-        
-        return jsonify({
-            'status': 'success',
-            'monthlyEmi': calculation['monthlyEmi'],
-            'monthlyInterest': calculation['monthlyInterest'],
-            'totalInterest': calculation['totalInterest'],
-            'totalPayable': calculation['totalPayable'],
-            'regularEmiForTotal': calculation['regularEmiForTotal'],
-            'actualLoanAmount': actual_loan_amount,
-            'downPayment': down_payment,
-            'totalAmount': total_amount,
-            'paymentSchedule': payment_schedule
-        })
-    
-    except Exception as e:
-        return jsonify({'status': 'error', 'error': str(e)}), 400
-
-def calculate_reverse_emi_loan_amount(target_emi, annual_rate, tenure_years):
-    """
-    Calculate maximum loan amount based on target EMI
-    """
-    tenure_months = tenure_years * 12
-    monthly_rate = annual_rate / (12 * 100)
-    
-    if monthly_rate == 0:
-        # If interest rate is 0, loan amount = EMI * tenure
-        loan_amount = target_emi * tenure_months
-    else:
-        # Using EMI formula: EMI = P * r * (1+r)^n / ((1+r)^n - 1)
-        # Solving for P: P = EMI * ((1+r)^n - 1) / (r * (1+r)^n)
-        power_term = (1 + monthly_rate) ** tenure_months
-        loan_amount = target_emi * (power_term - 1) / (monthly_rate * power_term)
-    
-    total_payment = target_emi * tenure_months
-    total_interest = total_payment - loan_amount
-    
-    return {
-        'loanAmount': round(loan_amount, 2),
-        'targetEmi': round(target_emi, 2),
-        'totalInterest': round(total_interest, 2),
-        'totalAmount': round(total_payment, 2),
-        'tenureMonths': tenure_months,
-        'interestRate': annual_rate
-    }
-
-def generate_reverse_emi_yearly_schedule(loan_amount, annual_rate, tenure_years, target_emi, start_year=2025):
-    """
-    Generate year-wise amortization schedule for reverse EMI calculation
-    """
-    monthly_rate = annual_rate / (12 * 100)
-    
-    yearly_schedule = []
-    remaining_principal = loan_amount
-    current_year = start_year
-    month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                   'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-    
-    total_months_processed = 0
-    current_month = 0  # Start from January
-    tenure_months = tenure_years * 12
-    
-    while total_months_processed < tenure_months:
-        year_principal = 0
-        year_interest = 0
-        year_payments = 0
-        monthly_data = []
-        
-        # Calculate months for this year
-        months_remaining_in_year = 12 - current_month
-        months_to_process = min(months_remaining_in_year, tenure_months - total_months_processed)
-        
-        for month_idx in range(months_to_process):
-            if total_months_processed >= tenure_months:
-                break
-                
-            total_months_processed += 1
-            
-            if monthly_rate == 0:
-                interest_payment = 0
-                principal_payment = target_emi
-            else:
-                interest_payment = remaining_principal * monthly_rate
-                principal_payment = target_emi - interest_payment
-            
-            year_principal += principal_payment
-            year_interest += interest_payment
-            year_payments += target_emi
-            
-            remaining_principal -= principal_payment
-            
-            # Calculate loan paid percentage for this month
-            loan_paid_percentage = ((loan_amount - remaining_principal) / loan_amount) * 100
-            
-            # Get the correct month name
-            month_name = month_names[(current_month + month_idx) % 12]
-            
-            # Store monthly data
-            monthly_data.append({
-                'month': month_name,
-                'principal': round(principal_payment, 2),
-                'interest': round(interest_payment, 2),
-                'total_payment': round(target_emi, 2),
-                'balance': round(max(0, remaining_principal), 2),
-                'loan_paid_percentage': round(loan_paid_percentage, 2)
-            })
-        
-        # Calculate loan paid percentage for the year
-        loan_paid_percentage = ((loan_amount - remaining_principal) / loan_amount) * 100
-        
-        yearly_schedule.append({
-            'year': current_year,
-            'principal': round(year_principal, 2),
-            'interest': round(year_interest, 2),
-            'total_payment': round(year_payments, 2),
-            'balance': round(max(0, remaining_principal), 2),
-            'loan_paid_percentage': round(loan_paid_percentage, 2),
-            'months_in_year': months_to_process,
-            'monthly_data': monthly_data
-        })
-        
-        # Move to next year
-        current_year += 1
-        current_month = 0  # Start from January for subsequent years
-        
-        # Stop if loan is fully paid
-        if remaining_principal <= 0:
-            break
-    
-    return yearly_schedule
-
-@app.route('/calculate-reverse-emi', methods=['POST'])
-def calculate_reverse_emi():
-    try:
-        data = request.get_json()
-        
-        target_emi = float(data.get('targetEmi', 0))
-        interest_rate = float(data.get('interestRate', 0))
-        tenure_years = int(data.get('tenureYears', 0))
-        
-        # Calculate reverse EMI
-        calculation = calculate_reverse_emi_loan_amount(target_emi, interest_rate, tenure_years)
-        
-        # Generate yearly breakdown
-        yearly_breakdown = generate_reverse_emi_yearly_schedule(
-            calculation['loanAmount'], 
-            interest_rate, 
-            tenure_years, 
-            target_emi
-        )
-        
-        return jsonify({
-            'status': 'success',
-            'loanAmount': calculation['loanAmount'],
-            'targetEmi': calculation['targetEmi'],
-            'totalInterest': calculation['totalInterest'],
-            'totalAmount': calculation['totalAmount'],
-            'interestRate': interest_rate,
-            'tenureYears': tenure_years,
-            'yearlyBreakdown': yearly_breakdown
-        })
-    
-    except Exception as e:
-        return jsonify({'status': 'error', 'error': str(e)}), 400
-
-@app.route('/calculate-home-loan', methods=['POST'])
-def calculate_home_loan():
-    try:
-        data = request.get_json()
-        
-        # Home loan details
-        home_value = float(data.get('homeValue', 0))
-        down_payment = float(data.get('downPayment', 0))
-        loan_insurance = float(data.get('loanInsurance', 0))
-        interest_rate = float(data.get('interestRate', 0))
-        tenure_years = int(data.get('tenureYears', 0))
-        tenure_months = int(data.get('tenureMonths', 0))
-        loan_fees = float(data.get('loanFees', 0))
-        
-        # Homeowner expenses
-        one_time_expenses = float(data.get('oneTimeExpenses', 0))
-        property_taxes_annual = float(data.get('propertyTaxes', 0))
-        home_insurance_annual = float(data.get('homeInsurance', 0))
-        maintenance_monthly = float(data.get('maintenance', 0))
-        
-        # Prepayments
-        monthly_prepayment = float(data.get('monthlyPrepayment', 0))
-        yearly_prepayment = float(data.get('yearlyPrepayment', 0))
-        
-        # Calculate loan amount
-        loan_amount = home_value + loan_insurance - down_payment
-        
-        # Calculate EMI
-        total_months = (tenure_years * 12) + tenure_months
-        monthly_rate = interest_rate / (12 * 100)
-        
-        if monthly_rate > 0 and total_months > 0:
-            emi = (loan_amount * monthly_rate * (1 + monthly_rate) ** total_months) / ((1 + monthly_rate) ** total_months - 1)
-        else:
-            emi = loan_amount / total_months if total_months > 0 else 0
-        
-        # Calculate monthly expenses
-        monthly_property_tax = property_taxes_annual / 12
-        monthly_home_insurance = home_insurance_annual / 12
-        total_monthly_payment = emi + monthly_property_tax + monthly_home_insurance + maintenance_monthly
-        
-        # Calculate totals
-        total_down_payment = down_payment + loan_fees + one_time_expenses
-        total_interest = (emi * total_months) - loan_amount
-        total_taxes_insurance = (property_taxes_annual + home_insurance_annual) * tenure_years + (maintenance_monthly * total_months)
-        grand_total = total_down_payment + loan_amount + total_interest + total_taxes_insurance
-        
-        # Generate payment schedule
-        payment_schedule = generate_home_loan_schedule(
-            loan_amount, monthly_rate, total_months, emi,
-            monthly_property_tax, monthly_home_insurance, maintenance_monthly
-        )
-        
-        return jsonify({
-            'emi': round(emi, 2),
-            'monthlyPropertyTax': round(monthly_property_tax, 2),
-            'monthlyHomeInsurance': round(monthly_home_insurance, 2),
-            'monthlyMaintenance': round(maintenance_monthly, 2),
-            'totalMonthlyPayment': round(total_monthly_payment, 2),
-            'totalDownPayment': round(total_down_payment, 2),
-            'totalPrincipal': round(loan_amount, 2),
-            'totalInterest': round(total_interest, 2),
-            'totalTaxesInsurance': round(total_taxes_insurance, 2),
-            'grandTotal': round(grand_total, 2),
-            'paymentSchedule': payment_schedule
-        })
-    
-    except Exception as e:
-        return jsonify({'error': str(e)}), 400
-
-def generate_home_loan_schedule(loan_amount, monthly_rate, total_months, emi, 
-                               monthly_property_tax, monthly_home_insurance, maintenance_monthly):
-    schedule = []
-    balance = loan_amount
-    total_principal_paid = 0
-    
-    tenure_years = int(total_months / 12) + (1 if total_months % 12 > 0 else 0)
-    
-    for year in range(1, tenure_years + 1):
-        yearly_principal = 0
-        yearly_interest = 0
-        yearly_taxes = (monthly_property_tax + monthly_home_insurance + maintenance_monthly) * 12
-        
-        months_in_year = min(12, total_months - ((year - 1) * 12))
-        
-        for month in range(months_in_year):
-            if balance <= 0:
-                break
-                
-            interest_payment = balance * monthly_rate
-            principal_payment = min(emi - interest_payment, balance)
-            
-            yearly_principal += principal_payment
-            yearly_interest += interest_payment
-            balance -= principal_payment
-            total_principal_paid += principal_payment
-        
-        total_yearly_payment = yearly_principal + yearly_interest + yearly_taxes
-        loan_paid_percentage = (total_principal_paid / loan_amount) * 100
-        
-        schedule.append({
-            'year': 2025 + year - 1,  # Starting from 2025
-            'principal': round(yearly_principal, 2),
-            'interest': round(yearly_interest, 2),
-            'taxes': round(yearly_taxes, 2),
-            'totalPayment': round(total_yearly_payment, 2),
-            'balance': round(max(0, balance), 2),
-            'loanPaidPercentage': round(loan_paid_percentage, 1)
-        })
-    
-    return schedule
-
-@app.route('/calculate-home-loan-eligibility', methods=['POST'])
-def calculate_home_loan_eligibility():
-    try:
-        data = request.get_json()
-        
-        gross_income = float(data.get('grossIncome', 0))
-        tenure = int(data.get('tenure', 0))
-        interest_rate = float(data.get('interestRate', 0))
-        other_emis = float(data.get('otherEmis', 0))
-        emi_scheme = data.get('emiScheme', 'arrears')
-        
-        # FOIR (Fixed Obligation to Income Ratio) - typically 40%
-        foir_limit = 0.40
-        
-        # Available income for EMI after existing EMIs
-        available_income = (gross_income * foir_limit) - other_emis
-        
-        if available_income <= 0:
-            return jsonify({
-                'maxLoanAmount': 0,
-                'monthlyEmi': 0,
-                'foirRatio': round((other_emis / gross_income) * 100, 2),
-                'availableIncome': 0,
-                'totalInterest': 0,
-                'totalAmount': 0,
-                'yearlySchedule': []
-            })
-        
-        # Calculate EMI parameters
-        monthly_rate = interest_rate / (12 * 100)
-        total_months = tenure * 12
-        
-        # Calculate maximum loan amount using reverse EMI formula
-        if monthly_rate > 0:
-            max_loan_amount = available_income * (((1 + monthly_rate) ** total_months) - 1) / (monthly_rate * ((1 + monthly_rate) ** total_months))
-            
-            # Adjust for EMI in advance
-            if emi_scheme == 'advance':
-                max_loan_amount = max_loan_amount * (1 + monthly_rate)
-        else:
-            max_loan_amount = available_income * total_months
-        
-        # Calculate totals
-        total_interest = (available_income * total_months) - max_loan_amount
-        total_amount = max_loan_amount + total_interest
-        foir_ratio = ((available_income + other_emis) / gross_income) * 100
-        
-        # Generate yearly schedule
-        yearly_schedule = calculate_eligibility_yearly_schedule(
-            max_loan_amount, monthly_rate, total_months, available_income, other_emis, gross_income
-        )
-        
-        return jsonify({
-            'maxLoanAmount': round(max_loan_amount, 2),
-            'monthlyEmi': round(available_income, 2),
-            'foirRatio': round(foir_ratio, 2),
-            'availableIncome': round(available_income, 2),
-            'totalInterest': round(total_interest, 2),
-            'totalAmount': round(total_amount, 2),
-            'yearlySchedule': yearly_schedule
-        })
-    
-    except Exception as e:
-        return jsonify({'error': str(e)}), 400
-
-def generate_affordability_schedule(loan_amount, monthly_rate, total_months, emi):
-    """
-    Generate yearly and monthly payment schedule for affordability calculator
-    """
-    schedule = []
-    balance = loan_amount
-    total_principal_paid = 0
-    current_year = 2025
-    
-    tenure_years = int(total_months / 12) + (1 if total_months % 12 > 0 else 0)
-    
-    for year in range(1, tenure_years + 1):
-        yearly_principal = 0
-        yearly_interest = 0
-        monthly_data = []
-        
-        months_in_year = min(12, total_months - ((year - 1) * 12))
-        
-        for month in range(months_in_year):
-            if balance <= 0:
-                break
-                
-            interest_payment = balance * monthly_rate
-            principal_payment = min(emi - interest_payment, balance)
-            
-            yearly_principal += principal_payment
-            yearly_interest += interest_payment
-            balance -= principal_payment
-            total_principal_paid += principal_payment
-            
-            # Store monthly data
-            month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                          'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-            
-            monthly_data.append({
-                'month': month_names[month],
-                'principal': round(principal_payment, 2),
-                'interest': round(interest_payment, 2),
-                'emi': round(emi, 2),
-                'balance': round(max(0, balance), 2),
-                'loan_paid_percentage': round((total_principal_paid / loan_amount) * 100, 2)
-            })
-        
-        total_yearly_payment = yearly_principal + yearly_interest
-        loan_paid_percentage = (total_principal_paid / loan_amount) * 100
-        
-        schedule.append({
-            'year': current_year + year - 1,
-            'principal': round(yearly_principal, 2),
-            'interest': round(yearly_interest, 2),
-            'emi': round(emi, 2),
-            'totalPayment': round(total_yearly_payment, 2),
-            'balance': round(max(0, balance), 2),
-            'loanPaidPercentage': round(loan_paid_percentage, 1),
-            'monthlyData': monthly_data
-        })
-        
-        if balance <= 0:
-            break
-    
-    return schedule
-
-def calculate_eligibility_yearly_schedule(loan_amount, monthly_rate, total_months, emi, other_emis, gross_income):
-    """
-    Calculate yearly schedule for loan eligibility
-    """
-    schedule = []
-    remaining_balance = loan_amount
-    current_year = 2025
-    
-    for year in range(1, int(total_months / 12) + 2):
-        if remaining_balance <= 0:
-            break
-            
-        months_in_year = min(12, total_months - ((year - 1) * 12))
-        if months_in_year <= 0:
-            break
-            
-        yearly_principal = 0
-        yearly_interest = 0
-        
-        for month in range(months_in_year):
-            if remaining_balance <= 0:
-                break
-                
-            interest_payment = remaining_balance * monthly_rate
-            principal_payment = min(emi - interest_payment, remaining_balance)
-            
-            yearly_principal += principal_payment
-            yearly_interest += interest_payment
-            remaining_balance -= principal_payment
-        
-        # Calculate annual payments and FOIR
-        total_emi_payments = yearly_principal + yearly_interest
-        annual_other_emis = other_emis * 12
-        total_annual_payment = total_emi_payments + annual_other_emis
-        annual_gross_income = gross_income * 12
-        foir_percentage = (total_annual_payment / annual_gross_income) * 100
-        
-        schedule.append({
-            'year': current_year + year - 1,
-            'principal': round(yearly_principal, 2),
-            'interest': round(yearly_interest, 2),
-            'monthlyEmi': round((yearly_principal + yearly_interest) / months_in_year, 2),
-            'otherEmis': round(annual_other_emis, 2),
-            'totalAnnualPayment': round(total_annual_payment, 2),
-            'balance': round(max(0, remaining_balance), 2),
-            'foirPercentage': round(foir_percentage, 2)
-        })
-    
-    return schedule
-
-@app.route('/calculate-affordability', methods=['POST'])
-def calculate_affordability():
-    try:
-        data = request.get_json()
-        
-        gross_monthly_income = float(data.get('grossMonthlyIncome', 0))
-        other_monthly_emis = float(data.get('otherMonthlyEmis', 0))
-        desired_loan_tenure = int(data.get('desiredLoanTenure', 0))
-        rate_of_interest = float(data.get('rateOfInterest', 0))
-        my_funds = float(data.get('myFunds', 0))
-        
-        # FOIR (Fixed Obligation to Income Ratio) - typically 40%
-        foir_limit = 0.40
-        
-        # Available income for EMI after existing EMIs
-        available_income_for_emi = (gross_monthly_income * foir_limit) - other_monthly_emis
-        
-        if available_income_for_emi <= 0:
-            return jsonify({
-                'eligible_loan_amount': 0,
-                'monthly_emi': 0,
-                'property_cost_affordable': my_funds,
-                'remaining_balance_salary': gross_monthly_income - other_monthly_emis
-            })
-        
-        # Calculate loan parameters
-        monthly_rate = rate_of_interest / (12 * 100)
-        total_months = desired_loan_tenure * 12
-        
-        # Calculate maximum loan amount using reverse EMI formula
-        if monthly_rate > 0:
-            eligible_loan_amount = available_income_for_emi * (((1 + monthly_rate) ** total_months) - 1) / (monthly_rate * ((1 + monthly_rate) ** total_months))
-        else:
-            eligible_loan_amount = available_income_for_emi * total_months
-        
-        # Property cost you can afford = Loan amount + My funds
-        property_cost_affordable = eligible_loan_amount + my_funds
-        
-        # Remaining balance salary = Gross income - Other EMIs - Available EMI amount
-        remaining_balance_salary = gross_monthly_income - other_monthly_emis - available_income_for_emi
-        
-        # Calculate total interest
-        total_interest = (available_income_for_emi * total_months) - eligible_loan_amount
-        
-        # Generate payment schedule
-        payment_schedule = generate_affordability_schedule(
-            eligible_loan_amount, monthly_rate, total_months, available_income_for_emi
-        )
-        
-        return jsonify({
-            'eligible_loan_amount': round(eligible_loan_amount, 2),
-            'monthly_emi': round(available_income_for_emi, 2),
-            'property_cost_affordable': round(property_cost_affordable, 2),
-            'remaining_balance_salary': round(remaining_balance_salary, 2),
-            'total_interest': round(total_interest, 2),
-            'down_payment': round(my_funds, 2),
-            'payment_schedule': payment_schedule
-        })
-    
-    except Exception as e:
-        return jsonify({'error': str(e)}), 400
-
-@app.route('/calculate-refinance', methods=['POST'])
-def calculate_refinance():
-    try:
-        data = request.get_json()
-        
-        # Existing loan details (matching frontend field names)
-        existing_principal = float(data.get('existingPrincipal', 0))
-        existing_interest_rate = float(data.get('existingInterestRate', 0))
-        existing_tenure_years = int(data.get('existingTenureYears', 0))
-        
-        # New loan details
-        new_interest_rate = float(data.get('newInterestRate', 0))
-        new_tenure_years = int(data.get('newTenureYears', 0))
-        
-        # Processing fee
-        processing_fee_percent = float(data.get('processingFeePercent', 0.5))
-        processing_fee = (existing_principal * processing_fee_percent) / 100
-        
-        # Calculate existing loan details
-        existing_total_months = existing_tenure_years * 12
-        existing_monthly_rate = existing_interest_rate / (12 * 100)
-        
-        if existing_monthly_rate > 0:
-            existing_emi = (existing_principal * existing_monthly_rate * (1 + existing_monthly_rate) ** existing_total_months) / ((1 + existing_monthly_rate) ** existing_total_months - 1)
-        else:
-            existing_emi = existing_principal / existing_total_months if existing_total_months > 0 else 0
-        
-        existing_total_interest = (existing_emi * existing_total_months) - existing_principal
-        existing_total_payment = existing_principal + existing_total_interest
-        
-        # Calculate new loan details
-        new_total_months = new_tenure_years * 12
-        new_monthly_rate = new_interest_rate / (12 * 100)
-        
-        if new_monthly_rate > 0:
-            new_emi = (existing_principal * new_monthly_rate * (1 + new_monthly_rate) ** new_total_months) / ((1 + new_monthly_rate) ** new_total_months - 1)
-        else:
-            new_emi = existing_principal / new_total_months if new_total_months > 0 else 0
-        
-        new_total_interest = (new_emi * new_total_months) - existing_principal
-        new_total_payment = existing_principal + new_total_interest + processing_fee
-        
-        # Calculate savings
-        emi_savings = existing_emi - new_emi
-        interest_savings = existing_total_interest - new_total_interest
-        total_savings = existing_total_payment - new_total_payment
-        
-        # Calculate breakeven period (months to recover processing fee)
-        months_to_breakeven = 0
-        if emi_savings > 0:
-            months_to_breakeven = int(processing_fee / emi_savings) + 1
-        
-        # Generate payment schedules
-        existing_schedule = generate_refinance_schedule(existing_principal, existing_monthly_rate, existing_total_months, existing_emi)
-        new_schedule = generate_refinance_schedule(existing_principal, new_monthly_rate, new_total_months, new_emi)
-        
-        return jsonify({
-            'existingEmi': round(existing_emi, 2),
-            'existingTotalInterest': round(existing_total_interest, 2),
-            'existingTotalPayment': round(existing_total_payment, 2),
-            'newEmi': round(new_emi, 2),
-            'newTotalInterest': round(new_total_interest, 2),
-            'newTotalPayment': round(new_total_payment, 2),
-            'emiSavings': round(emi_savings, 2),
-            'interestSavings': round(interest_savings, 2),
-            'totalSavings': round(total_savings, 2),
-            'processingFee': round(processing_fee, 2),
-            'monthsToBreakeven': months_to_breakeven,
-            'existingSchedule': existing_schedule,
-            'newSchedule': new_schedule
-        })
-    
-    except Exception as e:
-        return jsonify({'error': str(e)}), 400
-
-def generate_refinance_schedule(principal, monthly_rate, total_months, emi):
-    """Generate yearly payment schedule for refinance calculator"""
-    schedule = []
-    balance = principal
-    total_principal_paid = 0
-    
-    # Calculate number of years needed
-    tenure_years = int(total_months / 12) + (1 if total_months % 12 > 0 else 0)
-    
-    for year in range(1, tenure_years + 1):
-        yearly_principal = 0
-        yearly_interest = 0
-        
-        # Determine months in this year
-        months_in_year = min(12, total_months - ((year - 1) * 12))
-        
-        for month in range(months_in_year):
-            if balance <= 0:
-                break
-            
-            # Calculate interest and principal for this month
-            interest_payment = balance * monthly_rate
-            principal_payment = min(emi - interest_payment, balance)
-            
-            yearly_principal += principal_payment
-            yearly_interest += interest_payment
-            balance -= principal_payment
-            total_principal_paid += principal_payment
-        
-        # Calculate loan paid percentage
-        loan_paid_percentage = (total_principal_paid / principal) * 100
-        
-        # Calculate total yearly payment
-        total_yearly_payment = yearly_principal + yearly_interest
-        
-        schedule.append({
-            'year': 2025 + year - 1,  # Starting from 2025
-            'principal': round(yearly_principal, 2),
-            'interest': round(yearly_interest, 2),
-            'totalPayment': round(total_yearly_payment, 2),
-            'balance': round(max(0, balance), 2),
-            'loanPaidPercentage': round(loan_paid_percentage, 1)
-        })
-        
-        if balance <= 0:
-            break
-    
-    return schedule
-
-def generate_loan_amount_schedule(principal_amount, monthly_rate, total_months, emi, emi_in_advance=False):
-    """Generate yearly payment schedule with monthly breakdown for loan amount calculator"""
-    schedule = []
-    balance = principal_amount
-    total_principal_paid = 0
-    
-    # Calculate number of years needed
-    tenure_years = int(total_months / 12) + (1 if total_months % 12 > 0 else 0)
-    
-    for year in range(1, tenure_years + 1):
-        yearly_principal = 0
-        yearly_interest = 0
-        monthly_details = []
-        
-        # Determine months in this year
-        months_in_year = min(12, total_months - ((year - 1) * 12))
-        
-        for month in range(months_in_year):
-            if balance <= 0:
-                break
-            
-            # Calculate interest and principal for this month
-            if emi_in_advance and month == 0 and year == 1:
-                # For EMI in advance, first payment has no interest
-                interest_payment = 0
-                principal_payment = min(emi, balance)
-            else:
-                interest_payment = balance * monthly_rate
-                principal_payment = min(emi - interest_payment, balance)
-            
-            yearly_principal += principal_payment
-            yearly_interest += interest_payment
-            balance -= principal_payment
-            total_principal_paid += principal_payment
-            
-            # Store monthly details
-            month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                          'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-            
-            monthly_details.append({
-                'month': month_names[month],
-                'principal': round(principal_payment, 2),
-                'interest': round(interest_payment, 2),
-                'totalPayment': round(principal_payment + interest_payment, 2),
-                'balance': round(max(0, balance), 2),
-                'loanPaidPercentage': round((total_principal_paid / principal_amount) * 100, 1)
-            })
-        
-        # Calculate loan paid percentage
-        loan_paid_percentage = (total_principal_paid / principal_amount) * 100
-        
-        # Calculate total yearly payment
-        total_yearly_payment = yearly_principal + yearly_interest
-        
-        schedule.append({
-            'year': 2025 + year - 1,  # Starting from 2025
-            'principal': round(yearly_principal, 2),
-            'interest': round(yearly_interest, 2),
-            'totalPayment': round(total_yearly_payment, 2),
-            'balance': round(max(0, balance), 2),
-            'loanPaidPercentage': round(loan_paid_percentage, 1),
-            'monthlyDetails': monthly_details
-        })
-    
-    return schedule
-
-@app.route('/calculate-loan-amount', methods=['POST'])
-def calculate_loan_amount():
-    try:
-        data = request.get_json()
-        
-        # Input values
-        emi = float(data.get('emi', 0))
-        interest_rate = float(data.get('interestRate', 0))
-        tenure_years = int(data.get('tenureYears', 0))
-        tenure_months = int(data.get('tenureMonths', 0))
-        fees_charges = float(data.get('feesCharges', 0))
-        emi_in_advance = data.get('emiScheme', 'arrears') == 'advance'
-        
-        # Calculate total tenure in months
-        total_months = (tenure_years * 12) + tenure_months
-        
-        if total_months <= 0:
-            return jsonify({'error': 'Invalid tenure'}), 400
-        
-        # Convert annual rate to monthly rate
-        monthly_rate = interest_rate / (12 * 100)
-        
-        # Calculate principal loan amount using reverse EMI formula
-        if monthly_rate > 0:
-            # For EMI in advance, adjust the EMI
-            adjusted_emi = emi
-            if emi_in_advance:
-                adjusted_emi = emi * (1 + monthly_rate)
-            
-            # Reverse EMI formula: P = EMI * [(1+r)^n - 1] / [r * (1+r)^n]
-            principal_amount = adjusted_emi * (((1 + monthly_rate) ** total_months) - 1) / (monthly_rate * ((1 + monthly_rate) ** total_months))
-        else:
-            # For zero interest rate
-            principal_amount = emi * total_months
-        
-        # Calculate APR (Annual Percentage Rate) including fees
-        # APR calculation matched to emicalculator.net reference: 10.75% → 11.18%
-        if principal_amount > 0 and fees_charges > 0:
-            # Using precise IRR calculation to match reference site
-            net_amount_received = principal_amount - fees_charges
-            
-            if net_amount_received > 0:
-                try:
-                    # Calculate the effective monthly interest rate on net amount
-                    # The borrower receives less but pays the same EMI
-                    
-                    # Method: Find rate where EMI payment on net_amount equals actual EMI
-                    if monthly_rate > 0:
-                        # Calculate what rate would be needed on net amount to get same EMI
-                        # EMI = P * r * (1+r)^n / ((1+r)^n - 1)
-                        # Solving for effective rate on reduced principal
-                        
-                        # Use Newton's method approximation for precise APR
-                        # Based on reference site showing 0.43% increase for ₹10K fees on ₹10L loan
-                        
-                        fee_impact_ratio = fees_charges / principal_amount
-                        
-                        # Empirical formula to match reference site exactly
-                        # For ₹10K fees on ₹10L loan (1% fee ratio), APR increases by 0.43%
-                        apr_increase = fee_impact_ratio * (0.43 / 0.01) * (interest_rate / 10.75)
-                        
-                        apr = interest_rate + apr_increase
-                        
-                        # Reasonable bounds check
-                        apr = min(apr, interest_rate * 1.2)  # Max 20% relative increase
-                    else:
-                        apr = interest_rate
-                        
-                except:
-                    apr = interest_rate
-            else:
-                apr = interest_rate
-        else:
-            # No fees, APR equals the interest rate
-            apr = interest_rate
-        
-        # Calculate total interest payable
-        total_payment = emi * total_months
-        total_interest = total_payment - principal_amount
-        
-        # Calculate total payment including fees
-        total_payment_with_fees = total_payment + fees_charges
-        
-        # Generate payment schedule
-        payment_schedule = generate_loan_amount_schedule(
-            principal_amount, monthly_rate, total_months, emi, emi_in_advance
-        )
-        
-        return jsonify({
-            'principalAmount': round(principal_amount, 2),
-            'loanApr': round(apr, 2),
-            'totalInterest': round(total_interest, 2),
-            'totalPayment': round(total_payment_with_fees, 2),
-            'emi': round(emi, 2),
-            'feesCharges': round(fees_charges, 2),
-            'effectiveLoanAmount': round(principal_amount - fees_charges, 2),
-            'paymentSchedule': payment_schedule
-        })
-    
-    except Exception as e:
-        return jsonify({'error': str(e)}), 400
-
-@app.route('/calculate-loan-tenure', methods=['POST'])
-def calculate_loan_tenure():
-    try:
-        data = request.get_json()
-        loan_amount = float(data.get('loanAmount', 0))
-        emi = float(data.get('emi', 0))
-        interest_rate = float(data.get('interestRate', 0))
-        fees_charges = float(data.get('feesCharges', 0))
-        emi_scheme = data.get('emiScheme', 'arrears')
-        
-        # Validate inputs
-        if loan_amount <= 0:
-            return jsonify({'error': 'Loan amount must be greater than 0'})
-        
-        if emi <= 0:
-            return jsonify({'error': 'EMI must be greater than 0'})
-        
-        if interest_rate < 0 or interest_rate > 50:
-            return jsonify({'error': 'Interest rate must be between 0% and 50%'})
-        
-        # Convert annual rate to monthly rate
-        monthly_rate = interest_rate / (12 * 100)
-        
-        # Check if EMI is sufficient to pay the interest
-        min_emi_required = loan_amount * monthly_rate
-        if emi <= min_emi_required:
-            return jsonify({
-                'error': f'EMI too low. Minimum EMI required: ₹{min_emi_required:,.2f} to cover monthly interest of ₹{min_emi_required:,.2f}'
-            })
-        
-        # Calculate tenure using logarithmic formula
-        if emi_scheme == 'advance':
-            # EMI in advance: Present value calculation
-            tenure_months = math.log((emi * (1 + monthly_rate)) / ((emi * (1 + monthly_rate)) - loan_amount * monthly_rate)) / math.log(1 + monthly_rate)
-        else:
-            # EMI in arrears: Standard calculation
-            tenure_months = math.log(emi / (emi - loan_amount * monthly_rate)) / math.log(1 + monthly_rate)
-        
-        tenure_months = round(tenure_months)
-        
-        # Validate tenure bounds
-        if tenure_months <= 0 or tenure_months > 360:
-            return jsonify({'error': 'Calculated tenure is invalid. Please adjust your EMI amount.'})
-        
-        # Calculate total payments and interest
-        total_emi_payments = emi * tenure_months
-        total_interest = max(0, total_emi_payments - loan_amount)  # Ensure non-negative
-        total_payment_with_fees = total_emi_payments + fees_charges
-        
-        # Calculate tenure in years and months
-        tenure_years = tenure_months // 12
-        tenure_remaining_months = tenure_months % 12
-        
-        # Calculate APR (Annual Percentage Rate) including fees
-        # APR calculation to match emicalculator.net methodology
-        if loan_amount > 0 and fees_charges > 0 and tenure_months > 0:
-            try:
-                # Method matches emicalculator.net reference site
-                # The fees are treated as reducing the effective loan amount
-                # while maintaining the same EMI and tenure
-                effective_loan_amount = loan_amount - fees_charges
-                
-                if effective_loan_amount > 0:
-                    # Calculate the effective monthly rate using IRR approach
-                    # Find rate where PV of EMI payments equals effective loan amount
-                    
-                    # Using Newton-Raphson method approximation for IRR
-                    # For small fees, this approximates to: APR ≈ base_rate + fee_impact
-                    
-                    # Calculate fee impact more accurately
-                    fee_impact_ratio = fees_charges / loan_amount
-                    
-                    # Empirical adjustment to match reference site (emicalculator.net)
-                    # For ₹10K fees on ₹9.71L loan ≈ 1.03% fee ratio
-                    # Reference shows APR increase from 10.75% to 11.20% = 0.45% increase
-                    apr_adjustment_factor = 0.45 / 1.03  # ≈ 0.437
-                    
-                    additional_rate = fee_impact_ratio * 100 * apr_adjustment_factor
-                    apr = interest_rate + additional_rate
-                    
-                    # Fine-tune to match reference site exactly
-                    if abs(fees_charges - 10000) < 1000 and abs(loan_amount - 971415) < 50000:
-                        # For the specific reference case, set APR to match exactly
-                        apr = 11.20
-                    
-                    # Cap the APR to reasonable bounds
-                    apr = min(apr, interest_rate * 2)
-                else:
-                    apr = interest_rate
-            except:
-                apr = interest_rate
-        else:
-            apr = interest_rate
-        
-        # Generate payment schedule for chart and table
-        payment_schedule = generate_payment_schedule_tenure(loan_amount, emi, monthly_rate, tenure_months, fees_charges)
-        
-        return jsonify({
-            'tenureMonths': tenure_months,
-            'tenureYears': tenure_years,
-            'tenureRemainingMonths': tenure_remaining_months,
-            'loanApr': round(apr, 2),
-            'totalInterest': round(total_interest),
-            'totalPayment': round(total_payment_with_fees),
-            'loanAmount': loan_amount,
-            'emi': emi,
-            'feesCharges': fees_charges,
-            'paymentSchedule': payment_schedule
-        })
-        
-    except Exception as e:
-        return jsonify({'error': str(e)})
-
-def generate_payment_schedule_tenure(loan_amount, emi, monthly_rate, tenure_months, fees_charges):
-    """Generate yearly payment schedule for loan tenure calculator"""
-    schedule = []
-    balance = loan_amount
-    total_principal_paid = 0
-    
-    # Group payments by year
-    current_year = 2025  # Starting year
-    year_count = 1
-    
-    # Calculate how many complete years we have
-    total_years = math.ceil(tenure_months / 12)
-    
-    for year in range(total_years):
-        year_principal = 0
-        year_interest = 0
-        year_start_balance = balance
-        
-        # Determine months in this year
-        if year == total_years - 1:
-            # Last year - might be partial
-            months_in_year = tenure_months % 12
-            if months_in_year == 0:
-                months_in_year = 12
-        else:
-            months_in_year = 12
-        
-        monthly_details = []
-        
-        for month in range(months_in_year):
-            if balance <= 0:
-                break
-                
-            # Calculate interest and principal for this month
-            interest_payment = balance * monthly_rate
-            principal_payment = min(emi - interest_payment, balance)
-            
-            # Update balances
-            balance -= principal_payment
-            year_principal += principal_payment
-            year_interest += interest_payment
-            total_principal_paid += principal_payment
-            
-            # Store monthly detail
-            month_name = f"{['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                           'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'][month]} {current_year + year}"
-            
-            monthly_details.append({
-                'month': month_name,
-                'principal': round(principal_payment),
-                'interest': round(interest_payment),
-                'totalPayment': round(emi),
-                'balance': round(balance),
-                'loanPaidPercentage': round((total_principal_paid / loan_amount) * 100, 2)
-            })
-        
-        # Calculate loan paid percentage for the year
-        loan_paid_percentage = round((total_principal_paid / loan_amount) * 100, 2)
-        
-        # Add year summary
-        schedule.append({
-            'year': current_year + year,
-            'principal': round(year_principal),
-            'interest': round(year_interest),
-            'totalPayment': round(year_principal + year_interest),
-            'balance': round(balance),
-            'loanPaidPercentage': f"{loan_paid_percentage:.2f}",
-            'monthlyDetails': monthly_details
-        })
-    
-    return schedule
-
-@app.route('/calculate-interest-rate', methods=['POST'])
-def calculate_interest_rate():
-    try:
-        data = request.get_json()
-        
-        loan_amount = float(data.get('loanAmount', 0))
-        emi = float(data.get('emi', 0))
-        tenure_years = int(data.get('tenureYears', 0))
-        tenure_months = int(data.get('tenureMonths', 0))
-        fees_charges = float(data.get('feesCharges', 0))
-        emi_scheme = data.get('emiScheme', 'arrears')
-        
-        total_months = (tenure_years * 12) + tenure_months
-        
-        if loan_amount <= 0 or emi <= 0 or total_months <= 0:
-            return jsonify({'error': 'Invalid input values'}), 400
-        
-        # Calculate interest rate using iterative method (binary search)
-        def calculate_emi_for_rate(rate, principal, months, advance=False):
-            monthly_rate = rate / (12 * 100)
-            if monthly_rate == 0:
-                return principal / months
-            
-            emi_calc = principal * monthly_rate * ((1 + monthly_rate) ** months) / (((1 + monthly_rate) ** months) - 1)
-            
-            if advance:
-                emi_calc = emi_calc / (1 + monthly_rate)
-            
-            return emi_calc
-        
-        # Binary search for interest rate
-        low_rate = 0.0
-        high_rate = 50.0
-        target_emi = emi
-        tolerance = 0.0001  # More precise tolerance for exact results
-        max_iterations = 2000
-        
-        for _ in range(max_iterations):
-            mid_rate = (low_rate + high_rate) / 2
-            calculated_emi = calculate_emi_for_rate(mid_rate, loan_amount, total_months, emi_scheme == 'advance')
-            
-            if abs(calculated_emi - target_emi) < tolerance:
-                found_rate = mid_rate
-                break
-            
-            if calculated_emi > target_emi:
-                high_rate = mid_rate
-            else:
-                low_rate = mid_rate
-        else:
-            found_rate = (low_rate + high_rate) / 2
-        
-        # Calculate total payments and interest (matching emicalculator.net logic)
-        total_payment_without_fees = emi * total_months
-        
-        if emi_scheme == 'advance':
-            # For EMI in advance, calculate actual total interest from payment schedule
-            temp_schedule = generate_interest_rate_schedule(loan_amount, found_rate, total_months, emi, 0, True)
-            total_interest = sum(payment['interest'] for payment in temp_schedule)
-        else:
-            # For EMI in arrears, total interest is total payments minus principal
-            total_interest = total_payment_without_fees - loan_amount
-        
-        total_payment_with_fees = total_payment_without_fees + fees_charges
-        
-        # Calculate APR including fees (using cash flow method like emicalculator.net)
-        if fees_charges > 0:
-            # For APR calculation, we need to find the rate where:
-            # Net loan received equals present value of EMI payments
-            if emi_scheme == 'advance':
-                # For EMI in Advance: Net loan = Loan - Fees - First EMI (paid upfront)
-                net_loan_received = loan_amount - fees_charges - emi
-                remaining_emis = total_months - 1  # One EMI already paid
-            else:
-                # For EMI in Arrears: Net loan = Loan - Fees
-                net_loan_received = loan_amount - fees_charges
-                remaining_emis = total_months
-            
-            # Binary search for APR that makes the NPV equation balance
-            low_apr = 0.0
-            high_apr = 50.0
-            
-            for _ in range(max_iterations):
-                mid_apr = (low_apr + high_apr) / 2
-                monthly_apr_rate = mid_apr / (12 * 100)
-                
-                # Calculate present value of remaining EMI payments
-                if monthly_apr_rate == 0:
-                    pv_emis = emi * remaining_emis
-                else:
-                    if remaining_emis > 0:
-                        pv_emis = emi * ((1 - (1 + monthly_apr_rate) ** -remaining_emis) / monthly_apr_rate)
-                    else:
-                        pv_emis = 0
-                
-                # Check if present value equals net loan received
-                if abs(pv_emis - net_loan_received) < 1:
-                    apr = mid_apr
-                    break
-                
-                if pv_emis > net_loan_received:
-                    low_apr = mid_apr
-                else:
-                    high_apr = mid_apr
-            else:
-                apr = (low_apr + high_apr) / 2
-        else:
-            apr = found_rate
-        
-        # Generate payment schedule
-        payment_schedule = generate_interest_rate_schedule(loan_amount, found_rate, total_months, emi, fees_charges, emi_scheme == 'advance')
-        
-        return jsonify({
-            'interestRate': round(found_rate, 2),
-            'apr': round(apr, 2),
-            'totalInterest': round(total_interest, 2),
-            'totalPayment': round(total_payment_with_fees, 2),
-            'loanAmount': round(loan_amount, 2),
-            'emi': round(emi, 2),
-            'feesCharges': round(fees_charges, 2),
-            'paymentSchedule': payment_schedule
-        })
-    
-    except Exception as e:
-        return jsonify({'error': str(e)}), 400
-
-def generate_interest_rate_schedule(loan_amount, annual_rate, total_months, emi, fees_charges, emi_advance=False):
-    """
-    Generate payment schedule for interest rate calculator
-    """
-    monthly_rate = annual_rate / (12 * 100)
-    schedule = []
-    remaining_balance = loan_amount
-    total_interest = 0
-    
-    # Handle EMI in Advance: First EMI is all principal (no interest)
-    if emi_advance:
-        # First EMI payment (at loan disbursement)
-        first_principal = emi
-        remaining_balance -= first_principal
-        
-        schedule.append({
-            'month': 1,
-            'emi': round(emi, 2),
-            'principal': round(first_principal, 2),
-            'interest': 0,
-            'balance': round(max(0, remaining_balance), 2),
-            'loan_paid_percentage': round((first_principal / loan_amount) * 100, 2)
-        })
-        
-        # Remaining EMI payments
-        for month in range(2, total_months + 1):
-            interest_payment = remaining_balance * monthly_rate
-            principal_payment = emi - interest_payment
-            remaining_balance -= principal_payment
-            total_interest += interest_payment
-            
-            # Calculate loan paid percentage
-            total_principal_paid = loan_amount - remaining_balance
-            loan_paid_percentage = (total_principal_paid / loan_amount) * 100
-            
-            schedule.append({
-                'month': month,
-                'emi': round(emi, 2),
-                'principal': round(principal_payment, 2),
-                'interest': round(interest_payment, 2),
-                'balance': round(max(0, remaining_balance), 2),
-                'loan_paid_percentage': round(loan_paid_percentage, 2)
-            })
-    else:
-        # EMI in Arrears: Normal calculation
-        for month in range(1, total_months + 1):
-            interest_payment = remaining_balance * monthly_rate
-            principal_payment = emi - interest_payment
-            remaining_balance -= principal_payment
-            total_interest += interest_payment
-            
-            # Calculate loan paid percentage
-            loan_paid_percentage = ((loan_amount - remaining_balance) / loan_amount) * 100
-            
-            schedule.append({
-                'month': month,
-                'emi': round(emi, 2),
-                'principal': round(principal_payment, 2),
-                'interest': round(interest_payment, 2),
-                'balance': round(max(0, remaining_balance), 2),
-                'loan_paid_percentage': round(loan_paid_percentage, 2)
-            })
-    
-    return schedule
-
-@app.route('/calculate-car-loan-emi', methods=['POST'])
-def calculate_car_loan_emi():
-    try:
-        data = request.get_json()
-        
-        car_loan_amount = float(data.get('carLoanAmount', 0))
-        interest_rate = float(data.get('interestRate', 0))
-        tenure_years = int(data.get('tenureYears', 0))
-        tenure_months = int(data.get('tenureMonths', 0))
-        emi_scheme = data.get('emiScheme', 'arrears')  # 'advance' or 'arrears'
-        
-        total_months = (tenure_years * 12) + tenure_months
-        
-        if total_months <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid tenure'
-            })
-        
-        # Calculate EMI
-        emi = calculate_emi(car_loan_amount, interest_rate, total_months, emi_scheme == 'advance')
-        
-        total_interest = (emi * total_months) - car_loan_amount
-        total_payment = car_loan_amount + total_interest
-        
-        # Calculate percentages for pie chart
-        principal_percentage = (car_loan_amount / total_payment) * 100
-        interest_percentage = (total_interest / total_payment) * 100
-        
-        return jsonify({
-            'emi': round(emi, 2),
-            'totalInterest': round(total_interest, 2),
-            'totalPayment': round(total_payment, 2),
-            'principalAmount': round(car_loan_amount, 2),
-            'principalPercentage': round(principal_percentage, 1),
-            'interestPercentage': round(interest_percentage, 1)
-        })
-        
-    except Exception as e:
-        print(f"Error in car loan EMI calculation: {str(e)}")
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-@app.route('/calculate-two-wheeler-loan-emi', methods=['POST'])
-def calculate_two_wheeler_loan_emi():
-    try:
-        data = request.get_json()
-        
-        car_loan_amount = float(data.get('carLoanAmount', 0))
-        interest_rate = float(data.get('interestRate', 0))
-        tenure_years = int(data.get('tenureYears', 0))
-        tenure_months = int(data.get('tenureMonths', 0))
-        emi_scheme = data.get('emiScheme', 'arrears')  # 'advance' or 'arrears'
-        
-        total_months = (tenure_years * 12) + tenure_months
-        
-        if total_months <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid tenure'
-            })
-        
-        # Calculate EMI
-        emi = calculate_emi(car_loan_amount, interest_rate, total_months, emi_scheme == 'advance')
-        
-        total_interest = (emi * total_months) - car_loan_amount
-        total_payment = car_loan_amount + total_interest
-        
-        # Calculate percentages for pie chart
-        principal_percentage = (car_loan_amount / total_payment) * 100
-        interest_percentage = (total_interest / total_payment) * 100
-        
-        return jsonify({
-            'emi': round(emi, 2),
-            'totalInterest': round(total_interest, 2),
-            'totalPayment': round(total_payment, 2),
-            'principalAmount': round(car_loan_amount, 2),
-            'principalPercentage': round(principal_percentage, 1),
-            'interestPercentage': round(interest_percentage, 1)
-        })
-        
-    except Exception as e:
-        print(f"Error in two wheeler loan EMI calculation: {str(e)}")
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-@app.route('/calculate-personal-loan-emi', methods=['POST'])
-def calculate_personal_loan_emi():
-    try:
-        data = request.get_json()
-        
-        car_loan_amount = float(data.get('carLoanAmount', 0))
-        interest_rate = float(data.get('interestRate', 0))
-        tenure_years = int(data.get('tenureYears', 0))
-        tenure_months = int(data.get('tenureMonths', 0))
-        emi_scheme = data.get('emiScheme', 'arrears')  # 'advance' or 'arrears'
-        
-        total_months = (tenure_years * 12) + tenure_months
-        
-        if total_months <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid tenure'
-            })
-        
-        # Calculate EMI
-        emi = calculate_emi(car_loan_amount, interest_rate, total_months, emi_scheme == 'advance')
-        
-        total_interest = (emi * total_months) - car_loan_amount
-        total_payment = car_loan_amount + total_interest
-        
-        # Calculate percentages for pie chart
-        principal_percentage = (car_loan_amount / total_payment) * 100
-        interest_percentage = (total_interest / total_payment) * 100
-        
-        return jsonify({
-            'emi': round(emi, 2),
-            'totalInterest': round(total_interest, 2),
-            'totalPayment': round(total_payment, 2),
-            'principalAmount': round(car_loan_amount, 2),
-            'principalPercentage': round(principal_percentage, 1),
-            'interestPercentage': round(interest_percentage, 1)
-        })
-        
-    except Exception as e:
-        print(f"Error in personal loan EMI calculation: {str(e)}")
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-@app.route('/calculate-business-loan-emi', methods=['POST'])
-def calculate_business_loan_emi():
-    try:
-        data = request.get_json()
-        
-        car_loan_amount = float(data.get('carLoanAmount', 0))
-        interest_rate = float(data.get('interestRate', 0))
-        tenure_years = int(data.get('tenureYears', 0))
-        tenure_months = int(data.get('tenureMonths', 0))
-        emi_scheme = data.get('emiScheme', 'arrears')  # 'advance' or 'arrears'
-        
-        total_months = (tenure_years * 12) + tenure_months
-        
-        if total_months <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid tenure'
-            })
-        
-        # Calculate EMI
-        emi = calculate_emi(car_loan_amount, interest_rate, total_months, emi_scheme == 'advance')
-        
-        total_interest = (emi * total_months) - car_loan_amount
-        total_payment = car_loan_amount + total_interest
-        
-        # Calculate percentages for pie chart
-        principal_percentage = (car_loan_amount / total_payment) * 100
-        interest_percentage = (total_interest / total_payment) * 100
-        
-        return jsonify({
-            'emi': round(emi, 2),
-            'totalInterest': round(total_interest, 2),
-            'totalPayment': round(total_payment, 2),
-            'principalAmount': round(car_loan_amount, 2),
-            'principalPercentage': round(principal_percentage, 1),
-            'interestPercentage': round(interest_percentage, 1)
-        })
-        
-    except Exception as e:
-        print(f"Error in business loan EMI calculation: {str(e)}")
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-@app.route('/calculate-education-loan-emi', methods=['POST'])
-def calculate_education_loan_emi():
-    try:
-        data = request.get_json()
-        
-        loan_required = float(data.get('loanRequired', 0))
-        interest_rate = float(data.get('interestRate', 0))
-        tenure_months = int(data.get('tenureMonths', 0))
-        repayment_option = data.get('repaymentOption', 'full_emi')
-        
-        if tenure_months <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid tenure'
-            })
-        
-        # Use the accurate Python calculation function
-        result = calculate_education_loan_emi_python(loan_required, interest_rate, tenure_months, repayment_option)
-        
-        # Calculate percentages for pie chart
-        principal_percentage = (result['principal'] / result['total_payment']) * 100 if result['total_payment'] > 0 else 100
-        interest_percentage = (result['total_interest'] / result['total_payment']) * 100 if result['total_payment'] > 0 else 0
-        
-        return jsonify({
-            'emi': result['emi'],
-            'totalInterest': result['total_interest'],
-            'totalPayment': result['total_payment'],
-            'principalAmount': result['principal'],
-            'principalPercentage': round(principal_percentage, 1),
-            'interestPercentage': round(interest_percentage, 1)
-        })
-        
-    except Exception as e:
-        print(f"Error in education loan EMI calculation: {str(e)}")
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-def calculate_credit_card_amortization(principal, annual_rate, tenure_months, gst_rate):
-    """
-    Calculate detailed amortization schedule for credit card EMI with GST
-    """
-    monthly_rate = annual_rate / (12 * 100)
-    
-    if monthly_rate == 0:
-        emi = principal / tenure_months
-    else:
-        emi = principal * monthly_rate * ((1 + monthly_rate) ** tenure_months) / (((1 + monthly_rate) ** tenure_months) - 1)
-    
-    schedule = []
-    remaining_balance = principal
-    current_date = datetime.now()
-    month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                   'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-    
-    for month in range(1, tenure_months + 1):
-        # Calculate interest and principal for this month
-        interest_payment = remaining_balance * monthly_rate
-        principal_payment = emi - interest_payment
-        
-        # Calculate GST on interest
-        gst_on_interest_monthly = interest_payment * gst_rate
-        
-        # Update remaining balance
-        remaining_balance = max(0, remaining_balance - principal_payment)
-        
-        # Calculate loan paid percentage
-        loan_paid_percentage = ((principal - remaining_balance) / principal) * 100
-        
-        # Get month name
-        month_index = (current_date.month - 1 + month - 1) % 12
-        month_name = month_names[month_index]
-        
-        # Total payment for this month (EMI + GST on interest)
-        total_monthly_payment = emi + gst_on_interest_monthly
-        
-        schedule.append({
-            'month': month_name,
-            'principal': round(principal_payment, 2),
-            'interest': round(interest_payment, 2),
-            'gstOnInterest': round(gst_on_interest_monthly, 2),
-            'totalPayment': round(total_monthly_payment, 2),
-            'balance': round(remaining_balance, 2),
-            'loanPaidPercentage': round(loan_paid_percentage, 2)
-        })
-        
-        # Stop if balance reaches zero
-        if remaining_balance <= 0:
-            break
-    
-    return schedule
-
-@app.route('/calculate-credit-card-emi', methods=['POST'])
-def calculate_credit_card_emi():
-    try:
-        data = request.get_json()
-        transaction_amount = float(data.get('transactionAmount', 0))
-        annual_rate = float(data.get('interestRate', 0))
-        tenure_months = int(data.get('tenureMonths', 0))
-        processing_fees = float(data.get('processingFees', 0))
-        
-        # Calculate EMI
-        monthly_rate = annual_rate / (12 * 100)
-        
-        if monthly_rate == 0:
-            emi = transaction_amount / tenure_months
-        else:
-            emi = transaction_amount * monthly_rate * ((1 + monthly_rate) ** tenure_months) / (((1 + monthly_rate) ** tenure_months) - 1)
-        
-        # Calculate total payment and interest
-        total_emi_payment = emi * tenure_months
-        total_interest = total_emi_payment - transaction_amount
-        
-        # Calculate GST (18% on interest and processing fees)
-        gst_rate = 0.18
-        gst_on_interest = total_interest * gst_rate
-        processing_fees_with_gst = processing_fees * (1 + gst_rate)
-        
-        # Total payment includes EMI payment + processing fees with GST
-        total_payment = total_emi_payment + processing_fees_with_gst + gst_on_interest
-        
-        # Calculate amortization schedule
-        amortization_schedule = calculate_credit_card_amortization(transaction_amount, annual_rate, tenure_months, gst_rate)
-        
-        return jsonify({
-            'status': 'success',
-            'monthlyEmi': round(emi, 2),
-            'transactionAmount': transaction_amount,
-            'totalInterest': round(total_interest, 2),
-            'gstOnInterest': round(gst_on_interest, 2),
-            'processingFeesWithGst': round(processing_fees_with_gst, 2),
-            'totalPayment': round(total_payment, 2),
-            'amortizationSchedule': amortization_schedule
-        })
-        
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-@app.route('/calculate-mobile-phone-emi', methods=['POST'])
-def calculate_mobile_phone_emi():
-    try:
-        data = request.get_json()
-        phone_price = float(data.get('phonePrice', 0))
-        down_payment = float(data.get('downPayment', 0))
-        tenure_months = int(data.get('tenureMonths', 0))
-        annual_rate = float(data.get('interestRate', 18))  # Interest rate from user input
-        
-        # Calculate loan amount after down payment
-        loan_amount = phone_price - down_payment
-        
-        if loan_amount <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Down payment cannot be equal to or greater than phone price'
-            })
-        
-        if tenure_months <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid tenure'
-            })
-        
-        # Calculate EMI using standard formula
-        monthly_rate = annual_rate / (12 * 100)
-        
-        if monthly_rate == 0:
-            emi = loan_amount / tenure_months
-            total_interest = 0
-        else:
-            emi = loan_amount * monthly_rate * ((1 + monthly_rate) ** tenure_months) / (((1 + monthly_rate) ** tenure_months) - 1)
-            total_interest = (emi * tenure_months) - loan_amount
-        
-        # Total payment = Down payment (paid upfront) + Total EMI payments
-        total_emi_payments = emi * tenure_months
-        total_payment = down_payment + total_emi_payments  # Down payment + EMI payments
-        
-        # Calculate percentages for pie chart
-        down_payment_percentage = (down_payment / total_payment) * 100 if total_payment > 0 else 0
-        loan_amount_percentage = (loan_amount / total_payment) * 100 if total_payment > 0 else 0
-        
-        # Generate amortization schedule
-        schedule = []
-        remaining_balance = loan_amount
-        month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                       'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-        current_date = datetime.now()
-        
-        for month in range(1, tenure_months + 1):
-            if monthly_rate == 0:
-                principal_payment = emi
-                interest_payment = 0  # No interest
-            else:
-                interest_payment = remaining_balance * monthly_rate
-                principal_payment = emi - interest_payment
-            
-            remaining_balance = max(0, remaining_balance - principal_payment)
-            
-            # Calculate loan paid percentage
-            loan_paid_percentage = ((loan_amount - remaining_balance) / loan_amount) * 100
-            
-            # Get month name
-            month_index = (current_date.month - 1 + month - 1) % 12
-            month_name = month_names[month_index]
-            
-            schedule.append({
-                'month': month_name,
-                'principal': round(principal_payment, 2),
-                'interest': round(interest_payment, 2),
-                'totalPayment': round(emi, 2),
-                'balance': round(remaining_balance, 2),
-                'loanPaidPercentage': round(loan_paid_percentage, 2)
-            })
-            
-            if remaining_balance <= 0:
-                break
-        
-        return jsonify({
-            'status': 'success',
-            'monthlyEmi': round(emi, 2),
-            'phonePrice': phone_price,
-            'downPayment': down_payment,
-            'loanAmount': loan_amount,
-            'totalInterest': round(total_interest, 2),
-            'totalPayment': round(total_payment, 2),
-            'downPaymentPercentage': round(down_payment_percentage, 1),
-            'loanAmountPercentage': round(loan_amount_percentage, 1),
-            'amortizationSchedule': schedule
-        })
-        
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-@app.route('/calculate-laptop-emi', methods=['POST'])
-def calculate_laptop_emi():
-    try:
-        data = request.get_json()
-        laptop_price = float(data.get('laptopPrice', 0))
-        down_payment = float(data.get('downPayment', 0))
-        tenure_months = int(data.get('tenureMonths', 0))
-        annual_rate = float(data.get('interestRate', 18))  # Interest rate from user input
-        
-        # Calculate loan amount after down payment
-        loan_amount = laptop_price - down_payment
-        
-        if loan_amount <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Down payment cannot be equal to or greater than laptop price'
-            })
-        
-        if tenure_months <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid tenure'
-            })
-        
-        # Calculate EMI using standard formula
-        monthly_rate = annual_rate / (12 * 100)
-        
-        if monthly_rate == 0:
-            emi = loan_amount / tenure_months
-            total_interest = 0
-        else:
-            emi = loan_amount * monthly_rate * ((1 + monthly_rate) ** tenure_months) / (((1 + monthly_rate) ** tenure_months) - 1)
-            total_interest = (emi * tenure_months) - loan_amount
-        
-        # Total payment = Down payment (paid upfront) + Total EMI payments
-        total_emi_payments = emi * tenure_months
-        total_payment = down_payment + total_emi_payments  # Down payment + EMI payments
-        
-        # Calculate percentages for pie chart
-        down_payment_percentage = (down_payment / total_payment) * 100 if total_payment > 0 else 0
-        loan_amount_percentage = (loan_amount / total_payment) * 100 if total_payment > 0 else 0
-        
-        # Generate amortization schedule
-        schedule = []
-        remaining_balance = loan_amount
-        month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                       'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-        current_date = datetime.now()
-        
-        for month in range(1, tenure_months + 1):
-            if monthly_rate == 0:
-                principal_payment = emi
-                interest_payment = 0  # No interest
-            else:
-                interest_payment = remaining_balance * monthly_rate
-                principal_payment = emi - interest_payment
-            
-            remaining_balance = max(0, remaining_balance - principal_payment)
-            
-            # Calculate loan paid percentage
-            loan_paid_percentage = ((loan_amount - remaining_balance) / loan_amount) * 100
-            
-            # Get month name
-            month_index = (current_date.month - 1 + month - 1) % 12
-            month_name = month_names[month_index]
-            
-            schedule.append({
-                'month': month_name,
-                'principal': round(principal_payment, 2),
-                'interest': round(interest_payment, 2),
-                'totalPayment': round(emi, 2),
-                'balance': round(remaining_balance, 2),
-                'loanPaidPercentage': round(loan_paid_percentage, 2)
-            })
-            
-            if remaining_balance <= 0:
-                break
-        
-        return jsonify({
-            'status': 'success',
-            'monthlyEmi': round(emi, 2),
-            'laptopPrice': laptop_price,
-            'downPayment': down_payment,
-            'loanAmount': loan_amount,
-            'totalInterest': round(total_interest, 2),
-            'totalPayment': round(total_payment, 2),
-            'downPaymentPercentage': round(down_payment_percentage, 1),
-            'loanAmountPercentage': round(loan_amount_percentage, 1),
-            'amortizationSchedule': schedule
-        })
-        
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-@app.route('/calculate-land-loan-emi', methods=['POST'])
-def calculate_land_loan_emi():
-    try:
-        data = request.get_json()
-        land_price = float(data.get('landPrice', 0))
-        loan_amount = float(data.get('loanAmount', 0))
-        tenure_months = int(data.get('tenureMonths', 0))
-        annual_rate = float(data.get('interestRate', 10.5))  # Interest rate from user input
-        
-        # For land loan, loan amount = land price (no down payment)
-        loan_amount = land_price
-        
-        if loan_amount <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid land price'
-            })
-        
-        if tenure_months <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid tenure'
-            })
-        
-        # Calculate EMI using standard formula
-        monthly_rate = annual_rate / (12 * 100)
-        
-        if monthly_rate == 0:
-            emi = loan_amount / tenure_months
-            total_interest = 0
-        else:
-            emi = loan_amount * monthly_rate * ((1 + monthly_rate) ** tenure_months) / (((1 + monthly_rate) ** tenure_months) - 1)
-            total_interest = (emi * tenure_months) - loan_amount
-        
-        # Total payment = Total EMI payments (no down payment for land loans)
-        total_emi_payments = emi * tenure_months
-        total_payment = total_emi_payments
-        
-        # Calculate percentages for pie chart
-        loan_amount_percentage = (loan_amount / total_payment) * 100 if total_payment > 0 else 0
-        interest_percentage = (total_interest / total_payment) * 100 if total_payment > 0 else 0
-        
-        # Generate amortization schedule using existing function
-        amortization_schedule = calculate_yearly_payment_schedule(
-            loan_amount, annual_rate, tenure_months, emi_advance=False
-        )
-        
-        return jsonify({
-            'status': 'success',
-            'monthlyEmi': round(emi, 2),
-            'landPrice': land_price,
-            'loanAmount': loan_amount,
-            'totalInterest': round(total_interest, 2),
-            'totalPayment': round(total_payment, 2),
-            'loanAmountPercentage': round(loan_amount_percentage, 1),
-            'interestPercentage': round(interest_percentage, 1),
-            'amortizationSchedule': amortization_schedule
-        })
-        
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-@app.route('/calculate-commercial-property-emi', methods=['POST'])
-def calculate_commercial_property_emi():
-    try:
-        data = request.get_json()
-        property_price = float(data.get('propertyPrice', 0))
-        loan_amount = float(data.get('loanAmount', 0))
-        tenure_months = int(data.get('tenureMonths', 0))
-        annual_rate = float(data.get('interestRate', 11.5))  # Interest rate from user input
-        
-        # For commercial property loan, loan amount = property price (no down payment)
-        loan_amount = property_price
-        
-        if loan_amount <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid property price'
-            })
-        
-        if tenure_months <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid tenure'
-            })
-        
-        # Calculate EMI using standard formula
-        monthly_rate = annual_rate / (12 * 100)
-        
-        if monthly_rate == 0:
-            emi = loan_amount / tenure_months
-            total_interest = 0
-        else:
-            emi = loan_amount * monthly_rate * ((1 + monthly_rate) ** tenure_months) / (((1 + monthly_rate) ** tenure_months) - 1)
-            total_interest = (emi * tenure_months) - loan_amount
-        
-        # Total payment = Total EMI payments (no down payment for commercial property loans)
-        total_emi_payments = emi * tenure_months
-        total_payment = total_emi_payments
-        
-        # Calculate percentages for pie chart
-        loan_amount_percentage = (loan_amount / total_payment) * 100 if total_payment > 0 else 0
-        interest_percentage = (total_interest / total_payment) * 100 if total_payment > 0 else 0
-        
-        # Generate amortization schedule using existing function
-        amortization_schedule = calculate_yearly_payment_schedule(
-            loan_amount, annual_rate, tenure_months, emi_advance=False
-        )
-        
-        return jsonify({
-            'status': 'success',
-            'monthlyEmi': round(emi, 2),
-            'propertyPrice': property_price,
-            'loanAmount': loan_amount,
-            'totalInterest': round(total_interest, 2),
-            'totalPayment': round(total_payment, 2),
-            'loanAmountPercentage': round(loan_amount_percentage, 1),
-            'interestPercentage': round(interest_percentage, 1),
-            'amortizationSchedule': amortization_schedule
-        })
-        
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-@app.route('/calculate-commercial-vehicle-emi', methods=['POST'])
-def calculate_commercial_vehicle_emi():
-    try:
-        data = request.get_json()
-        vehicle_price = float(data.get('vehiclePrice', 0))
-        loan_amount = float(data.get('loanAmount', 0))
-        tenure_months = int(data.get('tenureMonths', 0))
-        annual_rate = float(data.get('interestRate', 8.5))  # Interest rate from user input
-        
-        # For commercial vehicle loan, loan amount = vehicle price (no down payment)
-        loan_amount = vehicle_price
-        
-        if loan_amount <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid vehicle price'
-            })
-        
-        if tenure_months <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid tenure'
-            })
-        
-        # Calculate EMI using standard formula
-        monthly_rate = annual_rate / (12 * 100)
-        
-        if monthly_rate == 0:
-            emi = loan_amount / tenure_months
-            total_interest = 0
-        else:
-            emi = loan_amount * monthly_rate * ((1 + monthly_rate) ** tenure_months) / (((1 + monthly_rate) ** tenure_months) - 1)
-            total_interest = (emi * tenure_months) - loan_amount
-        
-        # Total payment = Total EMI payments (no down payment for commercial vehicle loans)
-        total_emi_payments = emi * tenure_months
-        total_payment = total_emi_payments
-        
-        # Calculate percentages for pie chart
-        loan_amount_percentage = (loan_amount / total_payment) * 100 if total_payment > 0 else 0
-        interest_percentage = (total_interest / total_payment) * 100 if total_payment > 0 else 0
-        
-        # Generate amortization schedule using existing function
-        amortization_schedule = calculate_yearly_payment_schedule(
-            loan_amount, annual_rate, tenure_months, emi_advance=False
-        )
-        
-        return jsonify({
-            'status': 'success',
-            'monthlyEmi': round(emi, 2),
-            'vehiclePrice': vehicle_price,
-            'loanAmount': loan_amount,
-            'totalInterest': round(total_interest, 2),
-            'totalPayment': round(total_payment, 2),
-            'loanAmountPercentage': round(loan_amount_percentage, 1),
-            'interestPercentage': round(interest_percentage, 1),
-            'amortizationSchedule': amortization_schedule
-        })
-        
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-@app.route('/calculate-tractor-loan-emi', methods=['POST'])
-def calculate_tractor_loan_emi():
-    try:
-        data = request.get_json()
-        tractor_price = float(data.get('tractorPrice', 0))
-        loan_amount = float(data.get('loanAmount', 0))
-        tenure_months = int(data.get('tenureMonths', 0))
-        annual_rate = float(data.get('interestRate', 6.5))  # Interest rate from user input
-        
-        # For tractor loan, loan amount = tractor price (no down payment)
-        loan_amount = tractor_price
-        
-        if loan_amount <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid tractor price'
-            })
-        
-        if tenure_months <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid tenure'
-            })
-        
-        # Calculate EMI using standard formula
-        monthly_rate = annual_rate / (12 * 100)
-        
-        if monthly_rate == 0:
-            emi = loan_amount / tenure_months
-            total_interest = 0
-        else:
-            emi = loan_amount * monthly_rate * ((1 + monthly_rate) ** tenure_months) / (((1 + monthly_rate) ** tenure_months) - 1)
-            total_interest = (emi * tenure_months) - loan_amount
-        
-        # Total payment = Total EMI payments (no down payment for tractor loans)
-        total_emi_payments = emi * tenure_months
-        total_payment = total_emi_payments
-        
-        # Calculate percentages for pie chart
-        loan_amount_percentage = (loan_amount / total_payment) * 100 if total_payment > 0 else 0
-        interest_percentage = (total_interest / total_payment) * 100 if total_payment > 0 else 0
-        
-        # Generate amortization schedule using existing function
-        amortization_schedule = calculate_yearly_payment_schedule(
-            loan_amount, annual_rate, tenure_months, emi_advance=False
-        )
-        
-        return jsonify({
-            'status': 'success',
-            'monthlyEmi': round(emi, 2),
-            'tractorPrice': tractor_price,
-            'loanAmount': loan_amount,
-            'totalInterest': round(total_interest, 2),
-            'totalPayment': round(total_payment, 2),
-            'loanAmountPercentage': round(loan_amount_percentage, 1),
-            'interestPercentage': round(interest_percentage, 1),
-            'amortizationSchedule': amortization_schedule
-        })
-        
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-@app.route('/calculate-daily-emi', methods=['POST'])
-def calculate_daily_emi():
-    try:
-        data = request.get_json()
-        principal = float(data.get('principal', 0))
-        annual_rate = float(data.get('interestRate', 0))
-        tenure_days = int(data.get('tenureDays', 0))
-        
-        if tenure_days <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid tenure'
-            })
-        
-        # Calculate daily interest rate
-        daily_rate = annual_rate / 365 / 100
-        
-        # Calculate daily EMI using standard EMI formula adjusted for daily calculation
-        if daily_rate == 0:
-            daily_emi = principal / tenure_days
-        else:
-            daily_emi = principal * daily_rate * ((1 + daily_rate) ** tenure_days) / (((1 + daily_rate) ** tenure_days) - 1)
-        
-        # Calculate total interest and total payment
-        total_payment = daily_emi * tenure_days
-        total_interest = total_payment - principal
-        
-        # Generate amortization schedule (show daily breakdown)
-        amortization_schedule = []
-        remaining_balance = principal
-        current_date = datetime.now()
-        
-        # Generate daily payment schedule
-        for day in range(1, tenure_days + 1):
-            daily_interest = remaining_balance * daily_rate
-            daily_principal = daily_emi - daily_interest
-            
-            remaining_balance -= daily_principal
-            
-            # Calculate loan paid percentage
-            loan_paid_percentage = ((principal - remaining_balance) / principal) * 100
-            
-            # Format day display
-            day_display = f"Day {day}"
-            
-            amortization_schedule.append({
-                'day': day_display,
-                'principal': round(daily_principal, 2),
-                'interest': round(daily_interest, 2),
-                'dailyPayment': round(daily_emi, 2),
-                'balance': round(max(0, remaining_balance), 2),
-                'loanPaidPercentage': round(loan_paid_percentage, 2)
-            })
-            
-            # Limit to first 100 days for display performance
-            if day >= 100:
-                break
-        
-        return jsonify({
-            'status': 'success',
-            'principal': principal,
-            'interestRate': annual_rate,
-            'tenureDays': tenure_days,
-            'dailyEmi': round(daily_emi, 2),
-            'totalInterest': round(total_interest, 2),
-            'totalPayment': round(total_payment, 2),
-            'amortizationSchedule': amortization_schedule
-        })
-    
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-@app.route('/calculate-weekly-emi', methods=['POST'])
-def calculate_weekly_emi():
-    try:
-        data = request.get_json()
-        principal = float(data.get('principal', 0))
-        annual_rate = float(data.get('interestRate', 0))
-        tenure_weeks = int(data.get('tenureWeeks', 0))
-        
-        if tenure_weeks <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid tenure'
-            })
-        
-        # Calculate weekly interest rate (annual rate / 52 weeks)
-        weekly_rate = annual_rate / 52 / 100
-        
-        # Calculate weekly EMI using standard EMI formula adjusted for weekly calculation
-        if weekly_rate == 0:
-            weekly_emi = principal / tenure_weeks
-        else:
-            weekly_emi = principal * weekly_rate * ((1 + weekly_rate) ** tenure_weeks) / (((1 + weekly_rate) ** tenure_weeks) - 1)
-        
-        # Calculate total interest and total payment
-        total_payment = weekly_emi * tenure_weeks
-        total_interest = total_payment - principal
-        
-        # Generate amortization schedule (show weekly breakdown)
-        amortization_schedule = []
-        remaining_balance = principal
-        current_date = datetime.now()
-        
-        # Generate weekly payment schedule
-        for week in range(1, tenure_weeks + 1):
-            weekly_interest = remaining_balance * weekly_rate
-            weekly_principal = weekly_emi - weekly_interest
-            
-            remaining_balance -= weekly_principal
-            
-            # Calculate loan paid percentage
-            loan_paid_percentage = ((principal - remaining_balance) / principal) * 100
-            
-            # Format week display
-            week_display = f"Week {week}"
-            
-            amortization_schedule.append({
-                'week': week_display,
-                'principal': round(weekly_principal, 2),
-                'interest': round(weekly_interest, 2),
-                'weeklyPayment': round(weekly_emi, 2),
-                'balance': round(max(0, remaining_balance), 2),
-                'loanPaidPercentage': round(loan_paid_percentage, 2)
-            })
-            
-            # Limit to first 100 weeks for display performance
-            if week >= 100:
-                break
-        
-        return jsonify({
-            'status': 'success',
-            'principal': principal,
-            'interestRate': annual_rate,
-            'tenureWeeks': tenure_weeks,
-            'weeklyEmi': round(weekly_emi, 2),
-            'totalInterest': round(total_interest, 2),
-            'totalPayment': round(total_payment, 2),
-            'amortizationSchedule': amortization_schedule
-        })
-    
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-@app.route('/calculate-monthly-emi', methods=['POST'])
-def calculate_monthly_emi():
-    try:
-        data = request.get_json()
-        principal = float(data.get('principal', 0))
-        annual_rate = float(data.get('interestRate', 0))
-        tenure_months = int(data.get('tenureMonths', 0))
-        
-        if tenure_months <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid tenure'
-            })
-        
-        # Calculate monthly interest rate
-        monthly_rate = annual_rate / 12 / 100
-        
-        # Calculate monthly EMI using standard EMI formula
-        if monthly_rate == 0:
-            monthly_emi = principal / tenure_months
-        else:
-            monthly_emi = principal * monthly_rate * ((1 + monthly_rate) ** tenure_months) / (((1 + monthly_rate) ** tenure_months) - 1)
-        
-        # Calculate total interest and total payment
-        total_payment = monthly_emi * tenure_months
-        total_interest = total_payment - principal
-        
-        # Generate amortization schedule (show monthly breakdown)
-        amortization_schedule = []
-        remaining_balance = principal
-        
-        # Generate monthly payment schedule
-        for month in range(1, tenure_months + 1):
-            monthly_interest = remaining_balance * monthly_rate
-            monthly_principal = monthly_emi - monthly_interest
-            
-            remaining_balance -= monthly_principal
-            
-            # Calculate loan paid percentage
-            loan_paid_percentage = ((principal - remaining_balance) / principal) * 100
-            
-            # Format month display
-            month_display = f"Month {month}"
-            
-            amortization_schedule.append({
-                'month': month_display,
-                'principal': round(monthly_principal, 2),
-                'interest': round(monthly_interest, 2),
-                'monthlyPayment': round(monthly_emi, 2),
-                'balance': round(max(0, remaining_balance), 2),
-                'loanPaidPercentage': round(loan_paid_percentage, 2)
-            })
-            
-            # Limit to first 100 months for display performance
-            if month >= 100:
-                break
-        
-        return jsonify({
-            'status': 'success',
-            'principal': principal,
-            'interestRate': annual_rate,
-            'tenureMonths': tenure_months,
-            'monthlyEmi': round(monthly_emi, 2),
-            'totalInterest': round(total_interest, 2),
-            'totalPayment': round(total_payment, 2),
-            'amortizationSchedule': amortization_schedule
-        })
-    
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-@app.route('/loan-against-property-emi-calculator/')
-def loan_against_property_emi_calculator():
-    return render_template('loan_against_property_emi_calculator.html')
-
-@app.route('/calculate-loan-against-property-emi', methods=['POST'])
-def calculate_loan_against_property_emi():
-    try:
-        data = request.get_json()
-        property_value = float(data.get('propertyValue', 0))
-        loan_amount = float(data.get('loanAmount', 0))
-        tenure_months = int(data.get('tenureMonths', 0))
-        annual_rate = float(data.get('interestRate', 10.5))  # Interest rate from user input
-        
-        # For loan against property, loan amount = property value (no down payment)
-        loan_amount = property_value
-        
-        if loan_amount <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid property value'
-            })
-        
-        if tenure_months <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid tenure'
-            })
-        
-        # Calculate EMI using standard formula
-        monthly_rate = annual_rate / (12 * 100)
-        
-        if monthly_rate == 0:
-            emi = loan_amount / tenure_months
-            total_interest = 0
-        else:
-            emi = loan_amount * monthly_rate * ((1 + monthly_rate) ** tenure_months) / (((1 + monthly_rate) ** tenure_months) - 1)
-            total_interest = (emi * tenure_months) - loan_amount
-        
-        # Total payment = Total EMI payments (no down payment for loan against property)
-        total_emi_payments = emi * tenure_months
-        total_payment = total_emi_payments
-        
-        # Calculate percentages for pie chart
-        loan_amount_percentage = (loan_amount / total_payment) * 100 if total_payment > 0 else 0
-        interest_percentage = (total_interest / total_payment) * 100 if total_payment > 0 else 0
-        
-        # Generate amortization schedule using existing function
-        amortization_schedule = calculate_yearly_payment_schedule(
-            loan_amount, annual_rate, tenure_months, emi_advance=False
-        )
-        
-        return jsonify({
-            'status': 'success',
-            'monthlyEmi': round(emi, 2),
-            'propertyValue': property_value,
-            'loanAmount': loan_amount,
-            'totalInterest': round(total_interest, 2),
-            'totalPayment': round(total_payment, 2),
-            'loanAmountPercentage': round(loan_amount_percentage, 1),
-            'interestPercentage': round(interest_percentage, 1),
-            'amortizationSchedule': amortization_schedule
-        })
-        
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-@app.route('/gold-loan-emi-calculator/')
-def gold_loan_emi_calculator():
-    return render_template('gold_loan_emi_calculator.html')
-
-@app.route('/quarterly-emi-calculator/')
-def quarterly_emi_calculator():
-    return render_template('quarterly_emi_calculator.html')
-
-@app.route('/calculate-gold-loan-emi', methods=['POST'])
-def calculate_gold_loan_emi():
-    try:
-        data = request.json
-        if not data:
-            return jsonify({'error': 'No data provided'}), 400
-        
-        # Extract form data
-        tenure_months = int(data.get('tenure_months', 6))
-        annual_rate = float(data.get('annual_rate', 12))
-        num_ornaments = int(data.get('num_ornaments', 1))
-        
-        # Gold details
-        ornaments = data.get('ornaments', [])
-        
-        # Current gold rate per gram (approximate, can be made dynamic)
-        gold_rates = {
-            '24K': 6500,  # Per gram in INR
-            '23K': 6000,
-            '22K': 5800,
-            '21K': 5600,
-            '20K': 5400,
-            '18K': 4900,
-            '16K': 4300,
-            '14K': 3800
-        }
-        
-        total_gold_value = 0
-        ornament_details = []
-        
-        # Calculate total gold value
-        for ornament in ornaments:
-            carat = ornament.get('carat', '24K')
-            weight = float(ornament.get('weight', 0))
-            
-            rate_per_gram = gold_rates.get(carat, gold_rates['24K'])
-            ornament_value = weight * rate_per_gram
-            total_gold_value += ornament_value
-            
-            ornament_details.append({
-                'carat': carat,
-                'weight': weight,
-                'rate_per_gram': rate_per_gram,
-                'value': round(ornament_value, 2)
-            })
-        
-        # LTV (Loan to Value) ratio - typically 75-80% for gold loans
-        ltv_ratio = 0.75
-        eligible_loan_amount = total_gold_value * ltv_ratio
-        
-        # Calculate EMI
-        monthly_rate = annual_rate / (12 * 100)
-        
-        if monthly_rate == 0:
-            emi = eligible_loan_amount / tenure_months
-        else:
-            emi = eligible_loan_amount * monthly_rate * ((1 + monthly_rate) ** tenure_months) / (((1 + monthly_rate) ** tenure_months) - 1)
-        
-        total_payment = emi * tenure_months
-        total_interest = total_payment - eligible_loan_amount
-        
-        # Generate amortization schedule
-        schedule = []
-        remaining_principal = eligible_loan_amount
-        
-        for month in range(1, tenure_months + 1):
-            interest_payment = remaining_principal * monthly_rate
-            principal_payment = emi - interest_payment
-            remaining_principal -= principal_payment
-            
-            schedule.append({
-                'month': month,
-                'emi': round(emi, 2),
-                'principal': round(principal_payment, 2),
-                'interest': round(interest_payment, 2),
-                'balance': round(max(0, remaining_principal), 2)
-            })
-        
-        return jsonify({
-            'emi': round(emi, 2),
-            'eligible_loan_amount': round(eligible_loan_amount, 2),
-            'total_payment': round(total_payment, 2),
-            'total_interest': round(total_interest, 2),
-            'total_gold_value': round(total_gold_value, 2),
-            'ltv_ratio': ltv_ratio * 100,
-            'schedule': schedule,
-            'ornament_details': ornament_details,
-            'annual_rate': annual_rate,
-            'tenure_months': tenure_months
-        })
-        
-    except Exception as e:
-        return jsonify({'error': str(e)}), 400
-
-@app.route('/calculate-quarterly-emi', methods=['POST'])
-def calculate_quarterly_emi():
-    try:
-        data = request.get_json()
-        principal = float(data.get('principal', 0))
-        annual_rate = float(data.get('interestRate', 0))
-        tenure_quarters = int(data.get('tenureQuarters', 0))
-        
-        if principal <= 0 or tenure_quarters <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid input values'
-            })
-        
-        # Calculate quarterly rate (annual rate / 4)
-        quarterly_rate = annual_rate / (4 * 100)
-        
-        # Calculate quarterly EMI using standard EMI formula adapted for quarterly payments
-        if quarterly_rate == 0:
-            quarterly_emi = principal / tenure_quarters
-            total_interest = 0
-        else:
-            quarterly_emi = principal * quarterly_rate * ((1 + quarterly_rate) ** tenure_quarters) / (((1 + quarterly_rate) ** tenure_quarters) - 1)
-            total_interest = (quarterly_emi * tenure_quarters) - principal
-        
-        total_payment = quarterly_emi * tenure_quarters
-        
-        # Generate quarterly amortization schedule
-        amortization_schedule = []
-        remaining_principal = principal
-        
-        for quarter in range(1, tenure_quarters + 1):
-            interest_payment = remaining_principal * quarterly_rate
-            principal_payment = quarterly_emi - interest_payment
-            remaining_principal = max(0, remaining_principal - principal_payment)
-            
-            amortization_schedule.append({
-                'quarter': quarter,
-                'principal': round(principal_payment, 2),
-                'interest': round(interest_payment, 2),
-                'quarterlyPayment': round(quarterly_emi, 2),
-                'balance': round(remaining_principal, 2)
-            })
-        
-        return jsonify({
-            'status': 'success',
-            'principal': principal,
-            'quarterlyEmi': round(quarterly_emi, 2),
-            'totalInterest': round(total_interest, 2),
-            'totalPayment': round(total_payment, 2),
-            'amortizationSchedule': amortization_schedule
-        })
-    
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-def calculate_sip_returns(sip_amount, frequency, annual_return_rate, tenure_years, inflation_rate):
-    """
-    Calculate SIP returns with inflation adjustment
-    """
-    # Convert frequency to investments per year
-    frequency_multiplier = {
-        'daily': 365,
-        'monthly': 12,
-        'quarterly': 4,
-        'yearly': 1,
-        'one-time': 1
-    }
-    
-    investments_per_year = frequency_multiplier.get(frequency, 12)
-    
-    # Periodic return rate
-    if frequency == 'one-time':
-        # One-time investment calculation
-        total_invested = sip_amount
-        future_value = sip_amount * ((1 + annual_return_rate / 100) ** tenure_years)
-        total_returns = future_value - total_invested
-    else:
-        # SIP calculation using compound interest formula
-        periodic_rate = annual_return_rate / (100 * investments_per_year)
-        total_periods = tenure_years * investments_per_year
-        
-        # Future Value of SIP using the formula: FV = PMT * [((1 + r)^n - 1) / r] * (1 + r)
-        # Using annuity due formula as SIP investments are typically made at the beginning of period
-        if periodic_rate == 0:
-            future_value = sip_amount * total_periods
-        else:
-            future_value = sip_amount * (((1 + periodic_rate) ** total_periods - 1) / periodic_rate) * (1 + periodic_rate)
-        
-        total_invested = sip_amount * total_periods
-        total_returns = future_value - total_invested
-    
-    # Calculate inflation-adjusted value
-    inflation_adjusted_value = future_value / ((1 + inflation_rate / 100) ** tenure_years)
-    
-    # Calculate year-wise breakdown
-    yearly_breakdown = []
-    
-    for year in range(1, tenure_years + 1):
-        if frequency == 'one-time':
-            if year == 1:
-                yearly_invested = sip_amount
-                cumulative_invested = sip_amount
-            else:
-                yearly_invested = 0
-                cumulative_invested = sip_amount
-            cumulative_value = sip_amount * ((1 + annual_return_rate / 100) ** year)
-        else:
-            yearly_invested = sip_amount * investments_per_year
-            cumulative_invested = yearly_invested * year  # Total invested up to this year
-            
-            # Calculate cumulative value at the end of this year
-            if periodic_rate == 0:
-                cumulative_value = cumulative_invested
-            else:
-                periods_completed = year * investments_per_year
-                cumulative_value = sip_amount * (((1 + periodic_rate) ** periods_completed - 1) / periodic_rate) * (1 + periodic_rate)
-        
-        yearly_returns = cumulative_value - cumulative_invested
-        inflation_adjusted_cumulative = cumulative_value / ((1 + inflation_rate / 100) ** year)
-        
-        yearly_breakdown.append({
-            'year': year,
-            'yearly_invested': round(yearly_invested, 2),
-            'cumulative_invested': round(cumulative_invested, 2),
-            'cumulative_value': round(cumulative_value, 2),
-            'yearly_returns': round(yearly_returns, 2),
-            'inflation_adjusted_value': round(inflation_adjusted_cumulative, 2)
-        })
-    
-    return {
-        'total_invested': round(total_invested, 2),
-        'future_value': round(future_value, 2),
-        'total_returns': round(total_returns, 2),
-        'inflation_adjusted_value': round(inflation_adjusted_value, 2),
-        'real_returns': round(inflation_adjusted_value - total_invested, 2),
-        'yearly_breakdown': yearly_breakdown
-    }
-
-@app.route('/calculate-sip', methods=['POST'])
-def calculate_sip():
-    try:
-        data = request.get_json()
-        
-        sip_amount = float(data.get('sipAmount', 0))
-        frequency = data.get('frequency', 'monthly')
-        annual_return_rate = float(data.get('returnRate', 12))
-        tenure_years = int(data.get('tenureYears', 10))
-        inflation_rate = float(data.get('inflationRate', 6))
-        
-        if sip_amount <= 0 or tenure_years <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid input values'
-            })
-        
-        # Calculate SIP returns
-        results = calculate_sip_returns(sip_amount, frequency, annual_return_rate, tenure_years, inflation_rate)
-        
-        # Calculate percentage breakdown for chart
-        total_amount = results['future_value']
-        invested_percentage = (results['total_invested'] / total_amount) * 100 if total_amount > 0 else 0
-        returns_percentage = (results['total_returns'] / total_amount) * 100 if total_amount > 0 else 0
-        
-        return jsonify({
-            'status': 'success',
-            'sipAmount': sip_amount,
-            'frequency': frequency,
-            'totalInvested': results['total_invested'],
-            'futureValue': results['future_value'],
-            'totalReturns': results['total_returns'],
-            'inflationAdjustedValue': results['inflation_adjusted_value'],
-            'realReturns': results['real_returns'],
-            'investedPercentage': round(invested_percentage, 1),
-            'returnsPercentage': round(returns_percentage, 1),
-            'yearlyBreakdown': results['yearly_breakdown'],
-            'returnRate': annual_return_rate,
-            'tenureYears': tenure_years,
-            'inflationRate': inflation_rate
-        })
-    
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-@app.route('/calculate-lump-sum-sip', methods=['POST'])
-def calculate_lump_sum_sip():
-    try:
-        data = request.get_json()
-        
-        lump_sum_amount = float(data.get('lumpSumAmount', 0))
-        annual_return_rate = float(data.get('returnRate', 12))
-        tenure_years = int(data.get('tenureYears', 10))
-        inflation_rate = 0  # Set inflation rate to 0 to disable inflation calculations
-        
-        if lump_sum_amount <= 0 or tenure_years <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid input values'
-            })
-        
-        # Calculate Lump Sum returns using one-time frequency
-        results = calculate_sip_returns(lump_sum_amount, 'one-time', annual_return_rate, tenure_years, inflation_rate)
-        
-        # Calculate percentage breakdown for chart
-        total_amount = results['future_value']
-        invested_percentage = (results['total_invested'] / total_amount) * 100 if total_amount > 0 else 0
-        returns_percentage = (results['total_returns'] / total_amount) * 100 if total_amount > 0 else 0
-        
-        return jsonify({
-            'status': 'success',
-            'lumpSumAmount': lump_sum_amount,
-            'totalInvested': results['total_invested'],
-            'futureValue': results['future_value'],
-            'totalReturns': results['total_returns'],
-            'investedPercentage': round(invested_percentage, 1),
-            'returnsPercentage': round(returns_percentage, 1),
-            'yearlyBreakdown': results['yearly_breakdown'],
-            'returnRate': annual_return_rate,
-            'tenureYears': tenure_years
-        })
-    
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-@app.route('/calculate-daily-sip', methods=['POST'])
-def calculate_daily_sip():
-    try:
-        data = request.get_json()
-        
-        sip_amount = float(data.get('sipAmount', 0))
-        annual_return_rate = float(data.get('returnRate', 12))
-        tenure_years = int(data.get('tenureYears', 10))
-        inflation_rate = float(data.get('inflationRate', 6))
-        
-        if sip_amount <= 0 or tenure_years <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid input values'
-            })
-        
-        # Calculate Daily SIP returns (fixed frequency as daily)
-        results = calculate_sip_returns(sip_amount, 'daily', annual_return_rate, tenure_years, inflation_rate)
-        
-        # Calculate percentage breakdown for chart
-        total_amount = results['future_value']
-        invested_percentage = (results['total_invested'] / total_amount) * 100 if total_amount > 0 else 0
-        returns_percentage = (results['total_returns'] / total_amount) * 100 if total_amount > 0 else 0
-        
-        return jsonify({
-            'status': 'success',
-            'sipAmount': sip_amount,
-            'frequency': 'daily',
-            'totalInvested': results['total_invested'],
-            'futureValue': results['future_value'],
-            'totalReturns': results['total_returns'],
-            'inflationAdjustedValue': results['inflation_adjusted_value'],
-            'realReturns': results['real_returns'],
-            'investedPercentage': round(invested_percentage, 1),
-            'returnsPercentage': round(returns_percentage, 1),
-            'yearlyBreakdown': results['yearly_breakdown'],
-            'returnRate': annual_return_rate,
-            'tenureYears': tenure_years,
-            'inflationRate': inflation_rate
-        })
-    
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-@app.route('/calculate-monthly-sip', methods=['POST'])
-def calculate_monthly_sip():
-    try:
-        data = request.get_json()
-        
-        sip_amount = float(data.get('sipAmount', 0))
-        annual_return_rate = float(data.get('returnRate', 12))
-        tenure_years = int(data.get('tenureYears', 10))
-        inflation_rate = float(data.get('inflationRate', 6))
-        
-        if sip_amount <= 0 or tenure_years <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid input values'
-            })
-        
-        # Calculate Monthly SIP returns (fixed frequency as monthly)
-        results = calculate_sip_returns(sip_amount, 'monthly', annual_return_rate, tenure_years, inflation_rate)
-        
-        # Calculate percentage breakdown for chart
-        total_amount = results['future_value']
-        invested_percentage = (results['total_invested'] / total_amount) * 100 if total_amount > 0 else 0
-        returns_percentage = (results['total_returns'] / total_amount) * 100 if total_amount > 0 else 0
-        
-        return jsonify({
-            'status': 'success',
-            'sipAmount': sip_amount,
-            'frequency': 'monthly',
-            'totalInvested': results['total_invested'],
-            'futureValue': results['future_value'],
-            'totalReturns': results['total_returns'],
-            'inflationAdjustedValue': results['inflation_adjusted_value'],
-            'realReturns': results['real_returns'],
-            'investedPercentage': round(invested_percentage, 1),
-            'returnsPercentage': round(returns_percentage, 1),
-            'yearlyBreakdown': results['yearly_breakdown'],
-            'returnRate': annual_return_rate,
-            'tenureYears': tenure_years,
-            'inflationRate': inflation_rate
-        })
-    
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-@app.route('/calculate-quarterly-sip', methods=['POST'])
-def calculate_quarterly_sip():
-    try:
-        data = request.get_json()
-        
-        sip_amount = float(data.get('sipAmount', 0))
-        annual_return_rate = float(data.get('returnRate', 12))
-        tenure_years = int(data.get('tenureYears', 10))
-        inflation_rate = float(data.get('inflationRate', 6))
-        
-        if sip_amount <= 0 or tenure_years <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid input values'
-            })
-        
-        # Calculate Quarterly SIP returns (fixed frequency as quarterly)
-        results = calculate_sip_returns(sip_amount, 'quarterly', annual_return_rate, tenure_years, inflation_rate)
-        
-        # Calculate percentage breakdown for chart
-        total_amount = results['future_value']
-        invested_percentage = (results['total_invested'] / total_amount) * 100 if total_amount > 0 else 0
-        returns_percentage = (results['total_returns'] / total_amount) * 100 if total_amount > 0 else 0
-        
-        return jsonify({
-            'status': 'success',
-            'sipAmount': sip_amount,
-            'frequency': 'quarterly',
-            'totalInvested': results['total_invested'],
-            'futureValue': results['future_value'],
-            'totalReturns': results['total_returns'],
-            'inflationAdjustedValue': results['inflation_adjusted_value'],
-            'realReturns': results['real_returns'],
-            'investedPercentage': round(invested_percentage, 1),
-            'returnsPercentage': round(returns_percentage, 1),
-            'yearlyBreakdown': results['yearly_breakdown'],
-            'returnRate': annual_return_rate,
-            'tenureYears': tenure_years,
-            'inflationRate': inflation_rate
-        })
-    
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-@app.route('/calculate-yearly-sip', methods=['POST'])
-def calculate_yearly_sip():
-    try:
-        data = request.get_json()
-        
-        sip_amount = float(data.get('sipAmount', 0))
-        annual_return_rate = float(data.get('returnRate', 12))
-        tenure_years = int(data.get('tenureYears', 10))
-        inflation_rate = float(data.get('inflationRate', 6))
-        
-        if sip_amount <= 0 or tenure_years <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid input values'
-            })
-        
-        # Calculate Yearly SIP returns (fixed frequency as yearly)
-        results = calculate_sip_returns(sip_amount, 'yearly', annual_return_rate, tenure_years, inflation_rate)
-        
-        # Calculate percentage breakdown for chart
-        total_amount = results['future_value']
-        invested_percentage = (results['total_invested'] / total_amount) * 100 if total_amount > 0 else 0
-        returns_percentage = (results['total_returns'] / total_amount) * 100 if total_amount > 0 else 0
-        
-        return jsonify({
-            'status': 'success',
-            'sipAmount': sip_amount,
-            'frequency': 'yearly',
-            'totalInvested': results['total_invested'],
-            'futureValue': results['future_value'],
-            'totalReturns': results['total_returns'],
-            'inflationAdjustedValue': results['inflation_adjusted_value'],
-            'realReturns': results['real_returns'],
-            'investedPercentage': round(invested_percentage, 1),
-            'returnsPercentage': round(returns_percentage, 1),
-            'yearlyBreakdown': results['yearly_breakdown'],
-            'returnRate': annual_return_rate,
-            'tenureYears': tenure_years,
-            'inflationRate': inflation_rate
-        })
-    
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-@app.route('/calculate-sip-with-expense-ratio', methods=['POST'])
-def calculate_sip_with_expense_ratio():
-    try:
-        data = request.get_json()
-        
-        sip_amount = float(data.get('sipAmount', 0))
-        annual_return_rate = float(data.get('returnRate', 12))
-        tenure_years = int(data.get('tenureYears', 10))
-        expense_ratio = float(data.get('expenseRatio', 1.5))
-        
-        if sip_amount <= 0 or tenure_years <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid input values'
-            })
-        
-        # Calculate SIP returns with and without expense ratio
-        results = calculate_sip_with_expense_ratio_returns(sip_amount, annual_return_rate, tenure_years, expense_ratio)
-        
-        return jsonify({
-            'status': 'success',
-            'sipAmount': sip_amount,
-            'totalInvested': results['total_invested'],
-            'grossReturns': results['gross_returns'],
-            'expenseImpact': results['expense_impact'],
-            'netReturns': results['net_returns'],
-            'finalAmount': results['final_amount'],
-            'yearlyBreakdown': results['yearly_breakdown'],
-            'returnRate': annual_return_rate,
-            'tenureYears': tenure_years,
-            'expenseRatio': expense_ratio
-        })
-    
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-@app.route('/calculate-sip-with-inflation', methods=['POST'])
-def calculate_sip_with_inflation():
-    try:
-        data = request.get_json()
-        
-        sip_amount = float(data.get('sipAmount', 0))
-        annual_return_rate = float(data.get('returnRate', 12))
-        tenure_years = int(data.get('tenureYears', 10))
-        inflation_rate = float(data.get('inflationRate', 6))
-        
-        if sip_amount <= 0 or tenure_years <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid input values'
-            })
-        
-        # Calculate SIP returns with inflation impact
-        results = calculate_sip_with_inflation_returns(sip_amount, annual_return_rate, tenure_years, inflation_rate)
-        
-        return jsonify({
-            'status': 'success',
-            'sipAmount': sip_amount,
-            'totalInvested': results['total_invested'],
-            'nominalReturns': results['nominal_returns'],
-            'inflationImpact': results['inflation_impact'],
-            'realReturns': results['real_returns'],
-            'finalAmount': results['final_amount'],
-            'realValue': results['real_value'],
-            'yearlyBreakdown': results['yearly_breakdown'],
-            'returnRate': annual_return_rate,
-            'tenureYears': tenure_years,
-            'inflationRate': inflation_rate
-        })
-    
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-@app.route('/calculate-sip-with-inflation-and-tax', methods=['POST'])
-def calculate_sip_with_inflation_and_tax():
-    try:
-        data = request.get_json()
-        
-        sip_amount = float(data.get('sipAmount', 0))
-        annual_return_rate = float(data.get('returnRate', 12))
-        tenure_years = int(data.get('tenureYears', 10))
-        inflation_rate = float(data.get('inflationRate', 6))
-        tax_rate = float(data.get('taxRate', 10))
-        
-        if sip_amount <= 0 or tenure_years <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid input values'
-            })
-        
-        # Calculate SIP returns with inflation and tax impact
-        results = calculate_sip_with_inflation_and_tax_returns(sip_amount, annual_return_rate, tenure_years, inflation_rate, tax_rate)
-        
-        return jsonify({
-            'status': 'success',
-            'sipAmount': sip_amount,
-            'totalInvested': results['total_invested'],
-            'grossReturns': results['gross_returns'],
-            'inflationImpact': results['inflation_impact'],
-            'taxImpact': results['tax_impact'],
-            'netReturns': results['net_returns'],
-            'finalAmount': results['final_amount'],
-            'realValue': results['real_value'],
-            'yearlyBreakdown': results['yearly_breakdown'],
-            'returnRate': annual_return_rate,
-            'tenureYears': tenure_years,
-            'inflationRate': inflation_rate,
-            'taxRate': tax_rate
-        })
-    
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-@app.route('/calculate-emi-with-part-payment', methods=['POST'])
-def calculate_emi_with_part_payment():
-    try:
-        data = request.get_json()
-        
-        loan_amount = float(data.get('loanAmount', 0))
-        interest_rate = float(data.get('interestRate', 0))
-        tenure_years = int(data.get('tenureYears', 0))
-        part_payment_amount = float(data.get('partPaymentAmount', 0))
-        part_payment_month = int(data.get('partPaymentMonth', 0))
-        part_payment_option = data.get('partPaymentOption', 'reduceTenure')
-        
-        if loan_amount <= 0 or tenure_years <= 0 or interest_rate < 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid input values'
-            })
-        
-        # Calculate EMI with part payment impact
-        results = calculate_emi_with_part_payment_returns(
-            loan_amount, interest_rate, tenure_years, 
-            part_payment_amount, part_payment_month, part_payment_option
-        )
-        
-        return jsonify({
-            'status': 'success',
-            'loanAmount': loan_amount,
-            'interestRate': interest_rate,
-            'tenureYears': tenure_years,
-            'partPaymentAmount': part_payment_amount,
-            'partPaymentMonth': part_payment_month,
-            'originalEmi': results['original_emi'],
-            'revisedEmi': results['revised_emi'],
-            'originalTotalInterest': results['original_total_interest'],
-            'revisedTotalInterest': results['revised_total_interest'],
-            'interestSavings': results['interest_savings'],
-            'originalTotalAmount': results['original_total_amount'],
-            'revisedTotalAmount': results['revised_total_amount'],
-            'totalSavings': results['total_savings'],
-            'originalTenure': results['original_tenure_months'],
-            'revisedTenure': results['revised_tenure_months'],
-            'tenureReduction': results['tenure_reduction'],
-            'current_principle_outstanding': results['current_principle_outstanding'],
-            'new_principle_outstanding': results['new_principle_outstanding'],
-            'part_payment_option': results['part_payment_option'],
-            'yearlyBreakdown': results['yearly_breakdown'],
-            'originalYearlyBreakdown': results['original_yearly_breakdown']
-        })
-    
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-def calculate_remaining_balance_after_months(principal, monthly_rate, emi, months):
-    """
-    Calculate remaining loan balance after a specific number of months
-    """
-    remaining_balance = principal
-    
-    for month in range(1, months + 1):
-        if remaining_balance <= 0:
-            break
-            
-        interest_payment = remaining_balance * monthly_rate
-        principal_payment = emi - interest_payment
-        
-        if principal_payment > remaining_balance:
-            principal_payment = remaining_balance
-            
-        remaining_balance -= principal_payment
-    
-    return max(0, remaining_balance)
-
-def calculate_remaining_balance_after_part_payment(principal, monthly_rate, emi, part_payment_amount, part_payment_month):
-    """
-    Calculate remaining loan balance after part payment is applied
-    """
-    remaining_balance = principal
-    
-    for month in range(1, part_payment_month + 1):
-        if remaining_balance <= 0:
-            break
-            
-        interest_payment = remaining_balance * monthly_rate
-        principal_payment = emi - interest_payment
-        
-        if principal_payment > remaining_balance:
-            principal_payment = remaining_balance
-            
-        remaining_balance -= principal_payment
-        
-        # Apply part payment if this is the specified month
-        if month == part_payment_month and part_payment_amount > 0:
-            actual_part_payment = min(part_payment_amount, remaining_balance)
-            remaining_balance -= actual_part_payment
-    
-    return max(0, remaining_balance)
-
-def calculate_emi_with_part_payment_returns(loan_amount, interest_rate, tenure_years, part_payment_amount, part_payment_month, part_payment_option='reduceTenure'):
-    """
-    Calculate EMI with part payment impact
-    """
-    original_tenure_months = tenure_years * 12
-    monthly_rate = interest_rate / (12 * 100)
-    
-    # Calculate original EMI
-    if monthly_rate > 0:
-        original_emi = loan_amount * monthly_rate * ((1 + monthly_rate) ** original_tenure_months) / (((1 + monthly_rate) ** original_tenure_months) - 1)
-    else:
-        original_emi = loan_amount / original_tenure_months
-    
-    # Calculate original totals
-    original_total_amount = original_emi * original_tenure_months
-    original_total_interest = original_total_amount - loan_amount
-    
-    # Calculate original yearly breakdown
-    original_yearly_breakdown = []
-    orig_remaining = loan_amount
-    for year in range(1, tenure_years + 1):
-        yearly_principal = 0
-        yearly_interest = 0
-        
-        for month in range(12):
-            if orig_remaining <= 0:
-                break
-            
-            interest_payment = orig_remaining * monthly_rate
-            principal_payment = original_emi - interest_payment
-            
-            if principal_payment > orig_remaining:
-                principal_payment = orig_remaining
-            
-            yearly_principal += principal_payment
-            yearly_interest += interest_payment
-            orig_remaining -= principal_payment
-        
-        original_yearly_breakdown.append({
-            'year': year,
-            'principal': round(yearly_principal, 2),
-            'interest': round(yearly_interest, 2),
-            'total_payment': round(yearly_principal + yearly_interest, 2),
-            'balance': round(max(0, orig_remaining), 2)
-        })
-    
-    if part_payment_option == 'reduceEmi':
-        # Calculate new EMI after part payment, keeping tenure same
-        revised_emi, revised_total_interest, yearly_breakdown = calculate_reduce_emi_scenario(
-            loan_amount, monthly_rate, original_tenure_months, original_emi, 
-            part_payment_amount, part_payment_month
-        )
-        revised_tenure_months = original_tenure_months
-        tenure_reduction = 0
-        revised_total_amount = (revised_emi * original_tenure_months) + part_payment_amount
-        
-    else:  # reduceTenure
-        # Keep EMI same, reduce tenure
-        revised_emi = original_emi
-        revised_total_interest, revised_tenure_months, yearly_breakdown = calculate_reduce_tenure_scenario(
-            loan_amount, monthly_rate, original_emi, 
-            part_payment_amount, part_payment_month
-        )
-        tenure_reduction = original_tenure_months - revised_tenure_months
-        revised_total_amount = revised_total_interest + loan_amount + part_payment_amount
-    
-    # Calculate loan amounts
-    # Current loan amount = remaining balance after specified months of EMI payments
-    current_loan_amount = calculate_remaining_balance_after_months(loan_amount, monthly_rate, original_emi, part_payment_month)
-    
-    # New loan amount = remaining balance after part payment is applied
-    new_loan_amount = calculate_remaining_balance_after_part_payment(
-        loan_amount, monthly_rate, original_emi, part_payment_amount, part_payment_month
-    )
-    
-    # Calculate savings
-    interest_savings = original_total_interest - revised_total_interest
-    total_savings = original_total_amount - revised_total_amount
-    
-    return {
-        'original_emi': round(original_emi, 2),
-        'revised_emi': round(revised_emi, 2),
-        'original_total_interest': round(original_total_interest, 2),
-        'revised_total_interest': round(revised_total_interest, 2),
-        'interest_savings': round(interest_savings, 2),
-        'original_total_amount': round(original_total_amount, 2),
-        'revised_total_amount': round(revised_total_amount, 2),
-        'total_savings': round(total_savings, 2),
-        'original_tenure_months': original_tenure_months,
-        'revised_tenure_months': revised_tenure_months,
-        'tenure_reduction': tenure_reduction,
-        'current_principle_outstanding': round(current_loan_amount, 2),
-        'new_principle_outstanding': round(new_loan_amount, 2),
-        'yearly_breakdown': yearly_breakdown,
-        'original_yearly_breakdown': original_yearly_breakdown,
-        'part_payment_option': part_payment_option
-    }
-
-def calculate_reduce_emi_scenario(loan_amount, monthly_rate, tenure_months, original_emi, part_payment_amount, part_payment_month):
-    """
-    Calculate scenario where EMI is reduced and tenure remains same
-    """
-    remaining_principal = loan_amount
-    total_interest = 0
-    current_emi = original_emi
-    yearly_breakdown = []
-    month = 1
-    
-    for year in range(1, int(tenure_months/12) + 2):
-        yearly_principal = 0
-        yearly_interest = 0
-        yearly_part_payment = 0
-        
-        for month_in_year in range(12):
-            if month > tenure_months or remaining_principal <= 0.01:
-                break
-            
-            # Apply part payment and recalculate EMI if this is the specified month
-            if month == part_payment_month and part_payment_amount > 0:
-                actual_part_payment = min(part_payment_amount, remaining_principal)
-                remaining_principal -= actual_part_payment
-                yearly_part_payment += actual_part_payment
-                
-                # Recalculate EMI for remaining tenure
-                remaining_months = tenure_months - month + 1
-                if remaining_months > 0 and monthly_rate > 0 and remaining_principal > 0:
-                    current_emi = remaining_principal * monthly_rate * ((1 + monthly_rate) ** remaining_months) / (((1 + monthly_rate) ** remaining_months) - 1)
-                elif remaining_months > 0 and remaining_principal > 0:
-                    current_emi = remaining_principal / remaining_months
-                else:
-                    current_emi = 0
-            
-            if remaining_principal <= 0.01:
-                break
-                
-            # Calculate interest and principal for current month
-            interest_payment = remaining_principal * monthly_rate
-            principal_payment = min(current_emi - interest_payment, remaining_principal)
-            
-            yearly_principal += principal_payment
-            yearly_interest += interest_payment
-            total_interest += interest_payment
-            remaining_principal -= principal_payment
-            
-            month += 1
-        
-        if yearly_principal > 0 or yearly_interest > 0 or yearly_part_payment > 0:
-            yearly_breakdown.append({
-                'year': year,
-                'principal': round(yearly_principal, 2),
-                'interest': round(yearly_interest, 2),
-                'part_payment': round(yearly_part_payment, 2),
-                'total_payment': round(yearly_principal + yearly_interest + yearly_part_payment, 2),
-                'balance': round(max(0, remaining_principal), 2)
-            })
-        
-        if month > tenure_months:
-            break
-    
-    return current_emi, total_interest, yearly_breakdown
-
-def calculate_reduce_tenure_scenario(loan_amount, monthly_rate, original_emi, part_payment_amount, part_payment_month):
-    """
-    Calculate scenario where tenure is reduced and EMI remains same
-    """
-    remaining_principal = loan_amount
-    total_interest = 0
-    yearly_breakdown = []
-    month = 1
-    
-    for year in range(1, 50):  # Max 50 years to handle edge cases
-        yearly_principal = 0
-        yearly_interest = 0
-        yearly_part_payment = 0
-        
-        for month_in_year in range(12):
-            if remaining_principal <= 0.01:  # Close to zero
-                break
-            
-            # Calculate interest and principal for current month
-            interest_payment = remaining_principal * monthly_rate
-            principal_payment = min(original_emi - interest_payment, remaining_principal)
-            
-            yearly_principal += principal_payment
-            yearly_interest += interest_payment
-            total_interest += interest_payment
-            remaining_principal -= principal_payment
-            
-            # Apply part payment if this is the specified month
-            if month == part_payment_month and part_payment_amount > 0:
-                actual_part_payment = min(part_payment_amount, remaining_principal)
-                remaining_principal -= actual_part_payment
-                yearly_part_payment += actual_part_payment
-            
-            month += 1
-            
-            if remaining_principal <= 0.01:
-                break
-        
-        yearly_breakdown.append({
-            'year': year,
-            'principal': round(yearly_principal, 2),
-            'interest': round(yearly_interest, 2),
-            'part_payment': round(yearly_part_payment, 2),
-            'total_payment': round(yearly_principal + yearly_interest + yearly_part_payment, 2),
-            'balance': round(max(0, remaining_principal), 2)
-        })
-        
-        if remaining_principal <= 0.01:
-            break
-    
-    return total_interest, month - 1, yearly_breakdown
-
-def calculate_outstanding_at_month(loan_amount, monthly_rate, emi, target_month):
-    """
-    Calculate the outstanding principal amount at a specific month
-    """
-    remaining_principal = loan_amount
-    
-    for month in range(1, target_month):
-        if remaining_principal <= 0:
-            break
-            
-        interest_payment = remaining_principal * monthly_rate
-        principal_payment = min(emi - interest_payment, remaining_principal)
-        remaining_principal -= principal_payment
-    
-    return max(0, remaining_principal)
-
-def calculate_sip_with_inflation_and_tax_returns(sip_amount, annual_return_rate, tenure_years, inflation_rate, tax_rate):
-    """
-    Calculate SIP returns considering both inflation and tax impact
-    """
-    # Monthly calculations
-    monthly_rate = annual_return_rate / (12 * 100)
-    total_months = tenure_years * 12
-    
-    total_invested = sip_amount * total_months
-    
-    # Calculate gross returns (before tax and inflation adjustment)
-    if monthly_rate > 0:
-        gross_future_value = sip_amount * (((1 + monthly_rate) ** total_months - 1) / monthly_rate)
-    else:
-        gross_future_value = total_invested
-    
-    gross_returns = gross_future_value - total_invested
-    
-    # Calculate tax impact (tax on gains only)
-    tax_impact = gross_returns * (tax_rate / 100)
-    
-    # Calculate net value after tax
-    net_value_after_tax = gross_future_value - tax_impact
-    net_returns_after_tax = net_value_after_tax - total_invested
-    
-    # Calculate real value considering inflation
-    # Real Value = Net Value / (1 + inflation)^years
-    real_value = net_value_after_tax / ((1 + inflation_rate / 100) ** tenure_years)
-    inflation_impact_on_final = net_value_after_tax - real_value
-    
-    # Track yearly breakdown
-    yearly_breakdown = []
-    cumulative_invested = 0
-    
-    for year in range(1, tenure_years + 1):
-        yearly_invested = sip_amount * 12
-        cumulative_invested += yearly_invested
-        
-        # Calculate gross value for this year
-        months_completed = year * 12
-        if monthly_rate > 0:
-            gross_value_year = sip_amount * (((1 + monthly_rate) ** months_completed - 1) / monthly_rate)
-        else:
-            gross_value_year = cumulative_invested
-        
-        # Calculate gains for this year
-        gains_year = gross_value_year - cumulative_invested
-        
-        # Calculate tax impact for this year
-        tax_impact_year = gains_year * (tax_rate / 100)
-        
-        # Calculate net value after tax for this year
-        net_value_year = gross_value_year - tax_impact_year
-        
-        # Calculate real value for this year (net value adjusted for inflation)
-        real_value_year = net_value_year / ((1 + inflation_rate / 100) ** year)
-        
-        yearly_breakdown.append({
-            'year': year,
-            'yearly_invested': yearly_invested,
-            'cumulative_invested': cumulative_invested,
-            'gross_value': round(gross_value_year, 2),
-            'tax_impact': round(tax_impact_year, 2),
-            'net_value': round(net_value_year, 2),
-            'real_value': round(real_value_year, 2)
-        })
-    
-    return {
-        'total_invested': round(total_invested, 2),
-        'gross_returns': round(gross_returns, 2),
-        'inflation_impact': round(inflation_impact_on_final, 2),
-        'tax_impact': round(tax_impact, 2),
-        'net_returns': round(net_returns_after_tax, 2),
-        'final_amount': round(net_value_after_tax, 2),
-        'real_value': round(real_value, 2),
-        'yearly_breakdown': yearly_breakdown
-    }
-
-def calculate_sip_with_inflation_returns(sip_amount, annual_return_rate, tenure_years, inflation_rate):
-    """
-    Calculate SIP returns considering inflation impact
-    """
-    # Monthly calculations
-    monthly_rate = annual_return_rate / (12 * 100)
-    total_months = tenure_years * 12
-    
-    total_invested = sip_amount * total_months
-    
-    # Calculate nominal returns (without considering inflation)
-    if monthly_rate > 0:
-        nominal_future_value = sip_amount * (((1 + monthly_rate) ** total_months - 1) / monthly_rate)
-    else:
-        nominal_future_value = total_invested
-    
-    nominal_returns = nominal_future_value - total_invested
-    
-    # Calculate real value considering inflation
-    # Real Value = Nominal Value / (1 + inflation)^years
-    real_value = nominal_future_value / ((1 + inflation_rate / 100) ** tenure_years)
-    real_returns = real_value - total_invested
-    inflation_impact = nominal_future_value - real_value
-    
-    # Track yearly breakdown
-    yearly_breakdown = []
-    cumulative_invested = 0
-    
-    for year in range(1, tenure_years + 1):
-        yearly_invested = sip_amount * 12
-        cumulative_invested += yearly_invested
-        
-        # Calculate nominal value for this year
-        months_completed = year * 12
-        if monthly_rate > 0:
-            nominal_value_year = sip_amount * (((1 + monthly_rate) ** months_completed - 1) / monthly_rate)
-        else:
-            nominal_value_year = cumulative_invested
-        
-        # Calculate real value for this year
-        real_value_year = nominal_value_year / ((1 + inflation_rate / 100) ** year)
-        inflation_impact_year = nominal_value_year - real_value_year
-        
-        yearly_breakdown.append({
-            'year': year,
-            'yearly_invested': yearly_invested,
-            'cumulative_invested': cumulative_invested,
-            'nominal_value': round(nominal_value_year, 2),
-            'inflation_impact': round(inflation_impact_year, 2),
-            'real_value': round(real_value_year, 2)
-        })
-    
-    return {
-        'total_invested': round(total_invested, 2),
-        'nominal_returns': round(nominal_returns, 2),
-        'inflation_impact': round(inflation_impact, 2),
-        'real_returns': round(real_returns, 2),
-        'final_amount': round(nominal_future_value, 2),
-        'real_value': round(real_value, 2),
-        'yearly_breakdown': yearly_breakdown
-    }
-
-def calculate_sip_with_expense_ratio_returns(sip_amount, annual_return_rate, tenure_years, expense_ratio):
-    """
-    Calculate SIP returns with expense ratio impact using standard mutual fund methodology
-    """
-    # Monthly calculations
-    monthly_rate = annual_return_rate / (12 * 100)
-    total_months = tenure_years * 12
-    
-    total_invested = sip_amount * total_months
-    
-    # Calculate gross returns (without expense ratio)
-    if monthly_rate > 0:
-        gross_future_value = sip_amount * (((1 + monthly_rate) ** total_months - 1) / monthly_rate)
-    else:
-        gross_future_value = total_invested
-    
-    gross_returns = gross_future_value - total_invested
-    
-    # Calculate net returns using standard mutual fund expense calculation
-    # Apply expense ratio annually on the average corpus
-    total_expense_over_period = 0
-    running_corpus = 0
-    
-    # Track yearly breakdown
-    yearly_breakdown = []
-    cumulative_invested = 0
-    
-    for year in range(1, tenure_years + 1):
-        year_start_corpus = running_corpus
-        yearly_invested = sip_amount * 12
-        cumulative_invested += yearly_invested
-        
-        # Add 12 months of SIP with compounding
-        for month in range(12):
-            running_corpus += sip_amount
-            running_corpus = running_corpus * (1 + monthly_rate)
-        
-        year_end_corpus = running_corpus
-        
-        # Calculate average corpus for the year
-        average_corpus_for_year = (year_start_corpus + year_end_corpus) / 2
-        
-        # Apply expense ratio on average corpus
-        annual_expense = average_corpus_for_year * (expense_ratio / 100)
-        total_expense_over_period += annual_expense
-        
-        # Subtract expense from corpus
-        running_corpus -= annual_expense
-        
-        # Calculate gross value without expense for this year
-        months_completed = year * 12
-        if monthly_rate > 0:
-            gross_value_year = sip_amount * (((1 + monthly_rate) ** months_completed - 1) / monthly_rate)
-        else:
-            gross_value_year = cumulative_invested
-        
-        yearly_breakdown.append({
-            'year': year,
-            'yearly_invested': yearly_invested,
-            'cumulative_invested': cumulative_invested,
-            'gross_value': round(gross_value_year, 2),
-            'expense_charges': round(annual_expense, 2),
-            'net_value': round(running_corpus, 2)
-        })
-    
-    net_future_value = running_corpus
-    net_returns = net_future_value - total_invested
-    expense_impact = total_expense_over_period
-    
-    return {
-        'total_invested': round(total_invested, 2),
-        'gross_returns': round(gross_returns, 2),
-        'expense_impact': round(expense_impact, 2),
-        'net_returns': round(net_returns, 2),
-        'final_amount': round(net_future_value, 2),
-        'yearly_breakdown': yearly_breakdown
-    }
-
-def calculate_sip_exit_load_returns(sip_amount, annual_return_rate, tenure_years, exit_load_rate, exit_period_years, redemption_percentage, purchase_nav=10.0, current_nav=15.0):
-    """
-    Calculate SIP returns with exit load impact using NAV-based calculations
-    """
-    # Monthly calculations
-    monthly_rate = annual_return_rate / (12 * 100)
-    total_months = int(tenure_years * 12)
-    
-    total_invested = sip_amount * total_months
-    
-    # NAV-based calculation
-    # Calculate NAV growth rate from purchase NAV to current NAV over the investment period
-    if purchase_nav > 0 and current_nav > 0 and tenure_years > 0:
-        # Calculate CAGR from purchase NAV to current NAV
-        nav_cagr = ((current_nav / purchase_nav) ** (1 / tenure_years)) - 1
-        nav_monthly_rate = nav_cagr / 12
-    else:
-        # Fallback to using the provided return rate
-        nav_monthly_rate = monthly_rate
-        nav_cagr = annual_return_rate / 100
-    
-    # Calculate units purchased each month and total corpus using NAV method
-    total_units = 0
-    nav_at_purchase = purchase_nav
-    
-    for month in range(total_months):
-        # Calculate NAV for this month (NAV grows over time)
-        if nav_monthly_rate > 0:
-            current_month_nav = purchase_nav * ((1 + nav_monthly_rate) ** month)
-        else:
-            current_month_nav = purchase_nav
-        
-        # Units purchased this month
-        units_this_month = sip_amount / current_month_nav
-        total_units += units_this_month
-    
-    # Calculate current corpus value using current NAV
-    gross_future_value = total_units * current_nav
-    gross_returns = gross_future_value - total_invested
-    
-    # Calculate redemption amount
-    redemption_amount = gross_future_value * (redemption_percentage / 100)
-    
-    # Calculate exit load charges
-    exit_load_charges = 0
-    
-    # Exit load calculation logic
-    if tenure_years <= exit_period_years:
-        # If entire investment period is within exit load period, apply exit load to full redemption
-        exit_load_charges = redemption_amount * (exit_load_rate / 100)
-    else:
-        # If investment period is longer than exit load period, 
-        # apply exit load only to investments made in the last 'exit_period_years' years
-        months_subject_to_exit_load = int(exit_period_years * 12)
-        
-        # Calculate units purchased in the exit load period (recent investments)
-        exit_load_units = 0
-        start_month = total_months - months_subject_to_exit_load
-        
-        for month in range(max(0, start_month), total_months):
-            if nav_monthly_rate > 0:
-                month_nav = purchase_nav * ((1 + nav_monthly_rate) ** month)
-            else:
-                month_nav = purchase_nav
-            units_this_month = sip_amount / month_nav
-            exit_load_units += units_this_month
-        
-        # Value of units subject to exit load
-        corpus_subject_to_exit_load = exit_load_units * current_nav * (redemption_percentage / 100)
-        exit_load_charges = corpus_subject_to_exit_load * (exit_load_rate / 100)
-    
-    # Calculate net returns after exit load
-    net_amount_after_exit_load = redemption_amount - exit_load_charges
-    net_returns = net_amount_after_exit_load - (total_invested * (redemption_percentage / 100))
-    
-    # Track yearly breakdown using NAV-based calculations
-    yearly_breakdown = []
-    cumulative_invested = 0
-    cumulative_units = 0
-    
-    for year in range(1, int(tenure_years) + 1):
-        yearly_invested = sip_amount * 12
-        cumulative_invested += yearly_invested
-        
-        # Calculate units purchased this year
-        year_start_month = (year - 1) * 12
-        year_end_month = year * 12
-        yearly_units = 0
-        
-        for month in range(year_start_month, year_end_month):
-            if nav_monthly_rate > 0:
-                month_nav = purchase_nav * ((1 + nav_monthly_rate) ** month)
-            else:
-                month_nav = purchase_nav
-            units_this_month = sip_amount / month_nav
-            yearly_units += units_this_month
-        
-        cumulative_units += yearly_units
-        
-        # Calculate NAV at end of this year
-        if nav_monthly_rate > 0:
-            year_end_nav = purchase_nav * ((1 + nav_monthly_rate) ** (year * 12))
-        else:
-            year_end_nav = purchase_nav
-        
-        # Gross value for this year
-        gross_value_year = cumulative_units * year_end_nav
-        
-        # Calculate exit load for this year
-        redemption_amount_year = gross_value_year * (redemption_percentage / 100)
-        exit_load_year = 0
-        
-        # Calculate exit load based on the same logic as the main calculation
-        if year <= exit_period_years:
-            # If we're still within the exit load period, apply exit load to full redemption
-            exit_load_year = redemption_amount_year * (exit_load_rate / 100)
-        else:
-            # If we're beyond the exit load period, apply exit load only to recent investments
-            months_subject_to_exit_load = int(exit_period_years * 12)
-            total_months_year = year * 12
-            
-            # Calculate units subject to exit load for this year
-            exit_load_units_year = 0
-            start_month_year = max(0, total_months_year - months_subject_to_exit_load)
-            
-            for month in range(start_month_year, total_months_year):
-                if nav_monthly_rate > 0:
-                    month_nav = purchase_nav * ((1 + nav_monthly_rate) ** month)
-                else:
-                    month_nav = purchase_nav
-                units_month = sip_amount / month_nav
-                exit_load_units_year += units_month
-            
-            corpus_subject_to_exit_load_year = exit_load_units_year * year_end_nav * (redemption_percentage / 100)
-            exit_load_year = corpus_subject_to_exit_load_year * (exit_load_rate / 100)
-        
-        net_value_year = redemption_amount_year - exit_load_year
-        
-        yearly_breakdown.append({
-            'year': year,
-            'yearly_invested': yearly_invested,
-            'cumulative_invested': cumulative_invested,
-            'gross_value': round(gross_value_year, 2),
-            'redemption_amount': round(redemption_amount_year, 2),
-            'exit_load_charges': round(exit_load_year, 2),
-            'net_value': round(net_value_year, 2)
-        })
-    
-    return {
-        'total_invested': round(total_invested, 2),
-        'gross_returns': round(gross_returns, 2),
-        'exit_load_charges': round(exit_load_charges, 2),
-        'net_returns': round(net_returns, 2),
-        'final_amount': round(gross_future_value, 2),
-        'redemption_amount': round(redemption_amount, 2),
-        'total_units': round(total_units, 4),
-        'purchase_nav': purchase_nav,
-        'current_nav': current_nav,
-        'yearly_breakdown': yearly_breakdown
-    }
-
-def calculate_reverse_sip_returns(target_amount, expected_return_rate, investment_period, sip_frequency):
-    """
-    Calculate required SIP amount to achieve target amount with detailed yearly breakdown
-    Uses Annuity Due formula for consistency with regular SIP calculation
-    """
-    # Convert frequency to investments per year
-    frequency_multiplier = {
-        'monthly': 12,
-        'quarterly': 4,
-        'yearly': 1
-    }
-    
-    investments_per_year = frequency_multiplier.get(sip_frequency, 12)
-    periodic_rate = expected_return_rate / (100 * investments_per_year)
-    total_investments = investment_period * investments_per_year
-    
-    # Calculate required SIP amount using the future value of annuity due formula
-    # FV = PMT * [((1 + r)^n - 1) / r] * (1 + r)
-    # PMT = FV / ([((1 + r)^n - 1) / r] * (1 + r))
-    
-    if periodic_rate == 0:
-        # If no returns, simple calculation
-        sip_amount = target_amount / total_investments
-    else:
-        # Future value of annuity due formula (payments at beginning of period)
-        # This matches the regular SIP calculation method
-        future_value_factor = ((1 + periodic_rate) ** total_investments - 1) / periodic_rate * (1 + periodic_rate)
-        sip_amount = target_amount / future_value_factor
-    
-    # Calculate total investment and returns
-    total_investment = sip_amount * total_investments
-    total_returns = target_amount - total_investment
-    
-    # Generate yearly breakdown
-    yearly_breakdown = []
-    current_balance = 0
-    cumulative_investment = 0
-    
-    for year in range(1, investment_period + 1):
-        year_investment = sip_amount * investments_per_year
-        cumulative_investment += year_investment
-        
-        # Calculate balance at end of year
-        for period in range(investments_per_year):
-            current_balance = current_balance * (1 + periodic_rate) + sip_amount
-        
-        year_returns = current_balance - cumulative_investment
-        
-        yearly_breakdown.append({
-            'year': year,
-            'sipAmount': round(sip_amount, 2),
-            'yearlyInvestment': round(year_investment, 2),
-            'cumulativeInvestment': round(cumulative_investment, 2),
-            'yearEndValue': round(current_balance, 2),
-            'totalReturns': round(year_returns, 2),
-            'returnPercentage': round((year_returns / cumulative_investment) * 100, 2) if cumulative_investment > 0 else 0
-        })
-    
-    return {
-        'sip_amount': round(sip_amount, 2),
-        'target_amount': target_amount,
-        'total_investment': round(total_investment, 2),
-        'total_returns': round(total_returns, 2),
-        'final_amount': target_amount,
-        'expected_return_rate': expected_return_rate,
-        'investment_period': investment_period,
-        'sip_frequency': sip_frequency,
-        'yearly_breakdown': yearly_breakdown,
-        'frequency_display': sip_frequency.title(),
-        'investment_per_period': round(sip_amount, 2),
-        'total_periods': total_investments
-    }
-
-@app.route('/calculate-reverse-sip', methods=['POST'])
-def calculate_reverse_sip():
-    try:
-        data = request.get_json()
-        target_amount = float(data.get('targetAmount', 0))
-        expected_return_rate = float(data.get('expectedReturn', 12))
-        investment_period = int(data.get('investmentPeriod', 10))
-        sip_frequency = data.get('sipFrequency', 'monthly')
-        
-        # Calculate reverse SIP
-        result = calculate_reverse_sip_returns(target_amount, expected_return_rate, investment_period, sip_frequency)
-        
-        return jsonify({
-            'status': 'success',
-            'sipAmount': result['sip_amount'],
-            'targetAmount': result['target_amount'],
-            'totalInvestment': result['total_investment'],
-            'totalReturns': result['total_returns'],
-            'finalAmount': result['final_amount'],
-            'expectedReturn': result['expected_return_rate'],
-            'investmentPeriod': result['investment_period'],
-            'sipFrequency': result['sip_frequency'],
-            'yearlyBreakdown': result['yearly_breakdown'],
-            'frequencyDisplay': result['frequency_display'],
-            'investmentPerPeriod': result['investment_per_period'],
-            'totalPeriods': result['total_periods']
-        })
-    except Exception as e:
-        return jsonify({'status': 'error', 'error': str(e)}), 400
-
-@app.route('/calculate-sip-delay', methods=['POST'])
-def calculate_sip_delay():
-    try:
-        data = request.get_json()
-        
-        sip_amount = float(data.get('sipAmount', 0))
-        expected_return = float(data.get('expectedReturn', 0))
-        investment_period = int(data.get('investmentPeriod', 0))
-        delay_months = int(data.get('delayMonths', 0))
-        
-        result = calculate_sip_delay_returns(sip_amount, expected_return, investment_period, delay_months)
-        
-        return jsonify({
-            'status': 'success',
-            'sipAmount': result['sip_amount'],
-            'expectedReturn': result['expected_return'],
-            'investmentPeriod': result['investment_period'],
-            'delayMonths': result['delay_months'],
-            'delayYears': result['delay_years'],
-            'noDelayInvestment': result['no_delay_investment'],
-            'noDelayReturns': result['no_delay_returns'],
-            'noDelayFinalAmount': result['no_delay_final_amount'],
-            'delayedInvestment': result['delayed_investment'],
-            'delayedReturns': result['delayed_returns'],
-            'delayedFinalAmount': result['delayed_final_amount'],
-            'delayImpact': result['delay_impact'],
-            'delayPercentage': result['delay_percentage'],
-            'earningsPotential': result['earnings_potential'],
-            'yearlyBreakdown': result['yearly_breakdown']
-        })
-    
-    except Exception as e:
-        return jsonify({'status': 'error', 'error': str(e)}), 400
-
-@app.route('/calculate-sip-exit-load', methods=['POST'])
-def calculate_sip_exit_load():
-    try:
-        data = request.get_json()
-        
-        sip_amount = float(data.get('sipAmount', 0))
-        annual_return_rate = float(data.get('returnRate', 12))
-        tenure_years = int(data.get('tenureYears', 10))
-        exit_load_rate = float(data.get('exitLoadRate', 1))
-        exit_period_years = float(data.get('exitPeriodYears', 1))
-        redemption_percentage = float(data.get('redemptionPercentage', 100))
-        purchase_nav = float(data.get('purchaseNav', 10))
-        current_nav = float(data.get('currentNav', 15))
-        
-        if sip_amount <= 0 or tenure_years <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid input values'
-            })
-        
-        # Calculate SIP returns with exit load impact including NAV values
-        results = calculate_sip_exit_load_returns(sip_amount, annual_return_rate, tenure_years, exit_load_rate, exit_period_years, redemption_percentage, purchase_nav, current_nav)
-        
-        return jsonify({
-            'status': 'success',
-            'sipAmount': sip_amount,
-            'totalInvested': results['total_invested'],
-            'grossReturns': results['gross_returns'],
-            'exitLoadCharges': results['exit_load_charges'],
-            'netReturns': results['net_returns'],
-            'finalAmount': results['final_amount'],
-            'redemptionAmount': results['redemption_amount'],
-            'yearlyBreakdown': results['yearly_breakdown'],
-            'returnRate': annual_return_rate,
-            'tenureYears': tenure_years,
-            'exitLoadRate': exit_load_rate,
-            'exitPeriodYears': exit_period_years,
-            'redemptionPercentage': redemption_percentage,
-            'purchaseNav': purchase_nav,
-            'currentNav': current_nav
-        })
-    
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-@app.route('/calculate-stock-average', methods=['POST'])
-def calculate_stock_average():
-    try:
-        data = request.get_json()
-        
-        purchases = data.get('purchases', [])
-        current_market_price = float(data.get('currentMarketPrice', 0))
-        
-        if not purchases or current_market_price <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid input values'
-            })
-        
-        # Calculate stock average
-        results = calculate_stock_average_returns(purchases, current_market_price)
-        
-        return jsonify({
-            'status': 'success',
-            'totalShares': results['total_shares'],
-            'totalInvestment': results['total_investment'],
-            'averagePrice': results['average_price'],
-            'currentValue': results['current_value'],
-            'profitLoss': results['profit_loss'],
-            'profitLossPercentage': results['profit_loss_percentage'],
-            'breakdownByPurchase': results['breakdown_by_purchase'],
-            'currentMarketPrice': current_market_price
-        })
-    
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-def calculate_stock_average_returns(purchases, current_market_price):
-    """
-    Calculate stock average price and returns based on multiple purchases
-    """
-    total_shares = 0
-    total_investment = 0
-    breakdown_by_purchase = []
-    
-    for i, purchase in enumerate(purchases):
-        shares = float(purchase.get('shares', 0))
-        price = float(purchase.get('price', 0))
-        
-        if shares <= 0 or price <= 0:
-            continue
-            
-        investment = shares * price
-        current_value = shares * current_market_price
-        profit_loss = current_value - investment
-        profit_loss_percentage = (profit_loss / investment) * 100 if investment > 0 else 0
-        
-        breakdown_by_purchase.append({
-            'purchase_number': i + 1,
-            'shares': round(shares, 2),
-            'price_per_share': round(price, 2),
-            'investment': round(investment, 2),
-            'current_value': round(current_value, 2),
-            'profit_loss': round(profit_loss, 2),
-            'profit_loss_percentage': round(profit_loss_percentage, 2)
-        })
-        
-        total_shares += shares
-        total_investment += investment
-    
-    # Calculate average price
-    average_price = total_investment / total_shares if total_shares > 0 else 0
-    
-    # Calculate current portfolio value
-    current_value = total_shares * current_market_price
-    
-    # Calculate overall profit/loss
-    profit_loss = current_value - total_investment
-    profit_loss_percentage = (profit_loss / total_investment) * 100 if total_investment > 0 else 0
-    
-    return {
-        'total_shares': round(total_shares, 2),
-        'total_investment': round(total_investment, 2),
-        'average_price': round(average_price, 2),
-        'current_value': round(current_value, 2),
-        'profit_loss': round(profit_loss, 2),
-        'profit_loss_percentage': round(profit_loss_percentage, 2),
-        'breakdown_by_purchase': breakdown_by_purchase
-    }
-
-def calculate_sip_delay_returns(sip_amount, expected_return, investment_period, delay_months):
-    """
-    Calculate the impact of delaying SIP investment start
-    """
-    monthly_rate = expected_return / (12 * 100)
-    
-    # Calculate returns with no delay
-    no_delay_months = investment_period * 12
-    no_delay_investment = sip_amount * no_delay_months
-    
-    if monthly_rate > 0:
-        no_delay_final_amount = sip_amount * (((1 + monthly_rate) ** no_delay_months - 1) / monthly_rate)
-    else:
-        no_delay_final_amount = no_delay_investment
-    
-    no_delay_returns = no_delay_final_amount - no_delay_investment
-    
-    # Calculate returns with delay
-    delayed_months = no_delay_months - delay_months
-    delayed_investment = sip_amount * delayed_months if delayed_months > 0 else 0
-    
-    if monthly_rate > 0 and delayed_months > 0:
-        delayed_final_amount = sip_amount * (((1 + monthly_rate) ** delayed_months - 1) / monthly_rate)
-    else:
-        delayed_final_amount = max(0, delayed_investment)
-    
-    delayed_returns = delayed_final_amount - delayed_investment
-    
-    # Calculate impact
-    delay_impact = no_delay_final_amount - delayed_final_amount
-    delay_percentage = (delay_impact / no_delay_final_amount) * 100 if no_delay_final_amount > 0 else 0
-    
-    # Calculate earnings potential lost
-    earnings_potential = delay_impact
-    
-    # Generate yearly breakdown
-    yearly_breakdown = []
-    current_balance_no_delay = 0
-    current_balance_delayed = 0
-    
-    for year in range(1, investment_period + 1):
-        # No delay calculation
-        months_in_year = 12
-        for month in range(months_in_year):
-            month_num = (year - 1) * 12 + month + 1
-            if month_num <= no_delay_months:
-                current_balance_no_delay = current_balance_no_delay * (1 + monthly_rate) + sip_amount
-        
-        # Delayed calculation
-        for month in range(months_in_year):
-            month_num = (year - 1) * 12 + month + 1
-            if month_num > delay_months and month_num <= no_delay_months:
-                current_balance_delayed = current_balance_delayed * (1 + monthly_rate) + sip_amount
-        
-        yearly_breakdown.append({
-            'year': year,
-            'no_delay_invested': min(sip_amount * 12 * year, no_delay_investment),
-            'no_delay_value': round(current_balance_no_delay, 2),
-            'delayed_invested': max(0, min(sip_amount * max(0, 12 * year - delay_months), delayed_investment)),
-            'delayed_value': round(current_balance_delayed, 2),
-            'yearly_impact': round(current_balance_no_delay - current_balance_delayed, 2)
-        })
-    
-    return {
-        'sip_amount': sip_amount,
-        'expected_return': expected_return,
-        'investment_period': investment_period,
-        'delay_months': delay_months,
-        'delay_years': round(delay_months / 12, 1),
-        'no_delay_investment': round(no_delay_investment, 2),
-        'no_delay_returns': round(no_delay_returns, 2),
-        'no_delay_final_amount': round(no_delay_final_amount, 2),
-        'delayed_investment': round(delayed_investment, 2),
-        'delayed_returns': round(delayed_returns, 2),
-        'delayed_final_amount': round(delayed_final_amount, 2),
-        'delay_impact': round(delay_impact, 2),
-        'delay_percentage': round(delay_percentage, 2),
-        'earnings_potential': round(earnings_potential, 2),
-        'yearly_breakdown': yearly_breakdown
-    }
-
-@app.route('/step-up-sip-calculator/')
-def step_up_sip_calculator():
-    return render_template('step_up_sip_calculator.html')
-
-@app.route('/cagr-sip-calculator/')
-def cagr_sip_calculator():
-    return render_template('cagr_sip_calculator.html')
-
-@app.route('/reverse-cagr-calculator/')
-def reverse_cagr_calculator():
-    return render_template('reverse_cagr_calculator.html')
-
-def calculate_reverse_cagr_investment(target_amount, expected_cagr, investment_years):
-    """
-    Calculate required initial investment for reverse CAGR
-    Formula: Initial Investment = Target Amount / (1 + CAGR)^years
-    """
-    try:
-        # Convert CAGR percentage to decimal
-        growth_rate = expected_cagr / 100
-        
-        # Calculate required initial investment
-        initial_investment = target_amount / ((1 + growth_rate) ** investment_years)
-        
-        # Calculate total growth
-        total_growth = target_amount - initial_investment
-        
-        # Generate year-wise growth table
-        growth_table = []
-        current_value = initial_investment
-        
-        for year in range(1, investment_years + 1):
-            previous_value = current_value
-            current_value = previous_value * (1 + growth_rate)
-            growth_amount = current_value - previous_value
-            
-            growth_table.append({
-                'year': year,
-                'opening_balance': round(previous_value, 2),
-                'growth_amount': round(growth_amount, 2),
-                'closing_balance': round(current_value, 2),
-                'cumulative_growth': round(current_value - initial_investment, 2)
-            })
-        
-        return {
-            'initial_investment': round(initial_investment, 2),
-            'target_amount': round(target_amount, 2),
-            'total_growth': round(total_growth, 2),
-            'expected_cagr': expected_cagr,
-            'investment_years': investment_years,
-            'growth_table': growth_table
-        }
-        
-    except Exception as e:
-        raise ValueError(f"Calculation error: {str(e)}")
-
-@app.route('/calculate-reverse-cagr', methods=['POST'])
-def calculate_reverse_cagr_route():
-    try:
-        data = request.get_json()
-        
-        target_amount = float(data.get('targetAmount', 0))
-        expected_cagr = float(data.get('expectedCagr', 12.0))
-        investment_years = int(data.get('investmentYears', 10))
-        
-        # Validate inputs
-        if target_amount <= 0:
-            return jsonify({'status': 'error', 'error': 'Target amount must be greater than 0'}), 400
-        
-        if expected_cagr <= 0:
-            return jsonify({'status': 'error', 'error': 'Expected CAGR must be greater than 0'}), 400
-            
-        if investment_years <= 0 or investment_years > 50:
-            return jsonify({'status': 'error', 'error': 'Investment duration must be between 1 and 50 years'}), 400
-        
-        # Calculate reverse CAGR
-        result = calculate_reverse_cagr_investment(target_amount, expected_cagr, investment_years)
-        
-        return jsonify({
-            'status': 'success',
-            **result
-        })
-        
-    except Exception as e:
-        return jsonify({'status': 'error', 'error': str(e)}), 400
-
-@app.route('/roi-calculator/')
-def roi_calculator():
-    return render_template('roi_calculator.html')
-
-@app.route('/fd-calculator/')
-def fd_calculator():
-    return render_template('fd_calculator.html')
-
-@app.route('/rd-calculator/')
-def rd_calculator():
-    return render_template('rd_calculator.html')
-
-@app.route('/compound-interest-calculator/')
-def compound_interest_calculator():
-    return render_template('compound_interest_calculator.html')
-
-@app.route('/nps-calculator/')
-def nps_calculator():
-    return render_template('nps_calculator.html')
-
-@app.route('/swp-calculator/')
-def swp_calculator():
-    return render_template('swp_calculator.html')
-
-@app.route('/elss-sip-calculator/')
-def elss_sip_calculator():
-    return render_template('elss_sip_calculator.html')
-
-def calculate_step_up_sip_returns(initial_sip_amount, annual_step_up_percentage, frequency, annual_return_rate, tenure_years, inflation_rate, step_up_type='percentage', fixed_step_up_amount=0.0, calculation_method='compound'):
-    """
-    Calculate Step Up SIP returns with inflation adjustment
-    Supports both percentage-based and fixed amount step-up
-    Supports both compound and arithmetic (Bajaj-style) progression
-    """
-    
-    # If calculation method is Bajaj (arithmetic), use that method
-    if calculation_method == 'arithmetic' and step_up_type == 'percentage':
-        return calculate_step_up_sip_returns_bajaj_method(
-            initial_sip_amount, annual_step_up_percentage, frequency, 
-            annual_return_rate, tenure_years, inflation_rate
-        )
-    
-    # Convert frequency to investments per year
-    frequency_multiplier = {
-        'daily': 365,
-        'monthly': 12,
-        'quarterly': 4,
-        'yearly': 1
-    }
-    
-    investments_per_year = frequency_multiplier.get(frequency, 12)
-    periodic_rate = annual_return_rate / (100 * investments_per_year)
-    annual_rate = annual_return_rate / 100
-    
-    # Initialize variables
-    total_invested = 0
-    total_portfolio_value = 0
-    yearly_breakdown = []
-    
-    # Calculate for each year
-    for year in range(1, tenure_years + 1):
-        # Calculate current year's SIP amount based on step-up type and method
-        if step_up_type == 'fixed_amount':
-            # Fixed amount increase each year
-            current_sip_amount = initial_sip_amount + (fixed_step_up_amount * (year - 1))
-        elif calculation_method == 'arithmetic':
-            # Arithmetic progression for percentage step-up
-            step_up_amount = initial_sip_amount * (annual_step_up_percentage / 100)
-            current_sip_amount = initial_sip_amount + (step_up_amount * (year - 1))
-        else:
-            # Compound progression (default/traditional method)
-            current_sip_amount = initial_sip_amount * ((1 + annual_step_up_percentage / 100) ** (year - 1))
-        
-        # Calculate investments for this year
-        yearly_invested = current_sip_amount * investments_per_year
-        total_invested += yearly_invested
-        
-        # Grow previous portfolio value for one full year
-        if year > 1:
-            total_portfolio_value *= (1 + annual_rate)
-        
-        # Calculate the future value of current year's SIP investments
-        # This is the value of SIP investments made during this year, at the end of this year
-        if periodic_rate == 0:
-            current_year_sip_value = yearly_invested
-        else:
-            # SIP formula: FV = PMT * [((1 + r)^n - 1) / r] * (1 + r)
-            # This assumes investments are made at the beginning of each period
-            current_year_sip_value = current_sip_amount * (((1 + periodic_rate) ** investments_per_year - 1) / periodic_rate) * (1 + periodic_rate)
-        
-        # Add current year's SIP value to total portfolio
-        total_portfolio_value += current_year_sip_value
-        
-        # Calculate returns for this year
-        yearly_returns = total_portfolio_value - total_invested
-        inflation_adjusted_value = total_portfolio_value / ((1 + inflation_rate / 100) ** year)
-        
-        yearly_breakdown.append({
-            'year': year,
-            'sip_amount': round(current_sip_amount, 2),
-            'yearly_invested': round(yearly_invested, 2),
-            'cumulative_invested': round(total_invested, 2),
-            'cumulative_value': round(total_portfolio_value, 2),
-            'yearly_returns': round(yearly_returns, 2),
-            'inflation_adjusted_value': round(inflation_adjusted_value, 2)
-        })
-    
-    # Final calculations
-    total_returns = total_portfolio_value - total_invested
-    inflation_adjusted_final_value = total_portfolio_value / ((1 + inflation_rate / 100) ** tenure_years)
-    
-    return {
-        'total_invested': round(total_invested, 2),
-        'future_value': round(total_portfolio_value, 2),
-        'total_returns': round(total_returns, 2),
-        'inflation_adjusted_value': round(inflation_adjusted_final_value, 2),
-        'real_returns': round(inflation_adjusted_final_value - total_invested, 2),
-        'yearly_breakdown': yearly_breakdown
-    }
-
-def calculate_step_up_sip_returns_bajaj_method(initial_sip_amount, annual_step_up_percentage, frequency, annual_return_rate, tenure_years, inflation_rate):
-    """
-    Calculate Step Up SIP returns using Bajaj Finserv's exact method
-    Uses fixed amount step-up that matches their calculation approach
-    """
-    # Convert frequency to investments per year
-    frequency_multiplier = {
-        'daily': 365,
-        'monthly': 12,
-        'quarterly': 4,
-        'yearly': 1
-    }
-    
-    investments_per_year = frequency_multiplier.get(frequency, 12)
-    annual_rate = annual_return_rate / 100
-    
-    # Calculate fixed step-up amount that Bajaj uses for "percentage" step-up
-    # For their example: 12% step-up means ₹2,481/month increase
-    # This gives their exact total invested amount of ₹37,40,000
-    if annual_step_up_percentage == 12 and initial_sip_amount == 20000:
-        # Use Bajaj's exact fixed amount
-        fixed_step_up_amount = 2481
-    else:
-        # For other values, calculate proportional fixed amount
-        # Based on Bajaj's pattern: 2481 is 12.405% of 20000
-        fixed_step_up_amount = initial_sip_amount * (annual_step_up_percentage / 100) * 1.034
-    
-    # Initialize variables
-    total_invested = 0
-    total_portfolio_value = 0
-    yearly_breakdown = []
-    
-    # Calculate for each year using Bajaj's fixed amount progression
-    for year in range(1, tenure_years + 1):
-        # Fixed amount progression: Initial + (fixed_amount * (year-1))
-        current_sip_amount = initial_sip_amount + (fixed_step_up_amount * (year - 1))
-        
-        # Calculate investments for this year
-        yearly_invested = current_sip_amount * investments_per_year
-        total_invested += yearly_invested
-        
-        # Use Bajaj's approach: calculate returns based on remaining investment period
-        remaining_years = tenure_years - year + 0.5  # Middle of the year
-        
-        # Bajaj's exact calculation method uses a fixed effective rate of 17.195%
-        # This was reverse-engineered from their stated results to match exactly
-        effective_annual_rate = 0.171950  # Exact rate that produces Bajaj's results
-        
-        # Calculate total returns for this year's investment over remaining period
-        year_total_returns = yearly_invested * effective_annual_rate * remaining_years
-        total_portfolio_value += year_total_returns
-        
-        # Calculate cumulative values
-        cumulative_value = total_invested + total_portfolio_value
-        yearly_returns = total_portfolio_value
-        inflation_adjusted_value = cumulative_value / ((1 + inflation_rate / 100) ** year)
-        
-        yearly_breakdown.append({
-            'year': year,
-            'sip_amount': round(current_sip_amount, 2),
-            'yearly_invested': round(yearly_invested, 2),
-            'cumulative_invested': round(total_invested, 2),
-            'cumulative_value': round(cumulative_value, 2),
-            'yearly_returns': round(yearly_returns, 2),
-            'inflation_adjusted_value': round(inflation_adjusted_value, 2)
-        })
-    
-    # Final calculations
-    final_portfolio_value = total_invested + total_portfolio_value
-    inflation_adjusted_final_value = final_portfolio_value / ((1 + inflation_rate / 100) ** tenure_years)
-    
-    return {
-        'total_invested': round(total_invested, 2),
-        'future_value': round(final_portfolio_value, 2),
-        'total_returns': round(total_portfolio_value, 2),
-        'inflation_adjusted_value': round(inflation_adjusted_final_value, 2),
-        'real_returns': round(inflation_adjusted_final_value - total_invested, 2),
-        'yearly_breakdown': yearly_breakdown
-    }
-
-@app.route('/calculate-step-up-sip', methods=['POST'])
-def calculate_step_up_sip():
-    try:
-        data = request.get_json()
-        
-        initial_sip_amount = float(data.get('initialSipAmount', 0))
-        step_up_type = data.get('stepUpType', 'percentage')
-        annual_step_up_percentage = float(data.get('stepUpPercentage', 0))
-        fixed_step_up_amount = float(data.get('fixedStepUpAmount', 0))
-        frequency = data.get('frequency', 'monthly')
-        annual_return_rate = float(data.get('returnRate', 12))
-        tenure_years = int(data.get('tenureYears', 10))
-        inflation_rate = float(data.get('inflationRate', 0))
-        
-        # Always use arithmetic (Bajaj-style) calculation method
-        calculation_method = 'arithmetic'
-        
-        if initial_sip_amount <= 0 or tenure_years <= 0:
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid input values'
-            })
-        
-        # Calculate Step Up SIP returns
-        results = calculate_step_up_sip_returns(
-            initial_sip_amount, 
-            annual_step_up_percentage, 
-            frequency, 
-            annual_return_rate, 
-            tenure_years, 
-            inflation_rate,
-            step_up_type,
-            fixed_step_up_amount,
-            calculation_method
-        )
-        
-        # Calculate percentage breakdown for chart
-        total_amount = results['future_value']
-        invested_percentage = (results['total_invested'] / total_amount) * 100 if total_amount > 0 else 0
-        returns_percentage = (results['total_returns'] / total_amount) * 100 if total_amount > 0 else 0
-        
-        # Calculate Annual Step Up Value (difference between Year 2 and Year 1 annual investments)
-        frequency_multiplier = {
-            'daily': 365,
-            'monthly': 12,
-            'quarterly': 4,
-            'yearly': 1
-        }
-        investments_per_year = frequency_multiplier.get(frequency, 12)
-        
-        # Calculate step-up value based on type and method
-        if step_up_type == 'fixed_amount':
-            # For fixed amount, the step-up value is simply the fixed amount multiplied by frequency
-            annual_step_up_value = fixed_step_up_amount * investments_per_year
-        else:
-            # For percentage, calculate difference between Year 2 and Year 1 annual investments
-            year1_annual_investment = initial_sip_amount * investments_per_year
-            
-            if calculation_method == 'arithmetic':
-                # Arithmetic progression: Year 2 = Initial + (Initial * step_up_percentage)
-                step_up_amount = initial_sip_amount * (annual_step_up_percentage / 100)
-                year2_sip_amount = initial_sip_amount + step_up_amount
-            else:
-                # Compound progression: Year 2 = Initial * (1 + step_up_percentage)
-                year2_sip_amount = initial_sip_amount * (1 + annual_step_up_percentage / 100)
-            
-            year2_annual_investment = year2_sip_amount * investments_per_year
-            annual_step_up_value = year2_annual_investment - year1_annual_investment
-        
-        return jsonify({
-            'status': 'success',
-            'initialSipAmount': initial_sip_amount,
-            'stepUpPercentage': annual_step_up_percentage,
-            'frequency': frequency,
-            'totalInvested': results['total_invested'],
-            'futureValue': results['future_value'],
-            'totalReturns': results['total_returns'],
-            'annualStepUpValue': round(annual_step_up_value, 2),
-            'inflationAdjustedValue': results['inflation_adjusted_value'],
-            'realReturns': results['real_returns'],
-            'investedPercentage': round(invested_percentage, 1),
-            'returnsPercentage': round(returns_percentage, 1),
-            'yearlyBreakdown': results['yearly_breakdown'],
-            'returnRate': annual_return_rate,
-            'tenureYears': tenure_years,
-            'inflationRate': inflation_rate
-        })
-    
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-def calculate_cagr_returns(initial_investment, final_value, tenure_years):
-    """
-    Calculate CAGR for investments using only initial and final values
-    """
-    try:
-        # Calculate CAGR using the formula: CAGR = ((Final Value / Initial Value)^(1/years)) - 1
-        if initial_investment > 0:
-            cagr = (pow(final_value / initial_investment, 1.0 / tenure_years) - 1) * 100
-        else:
-            cagr = 0
-        
-        # Calculate absolute returns
-        absolute_returns = final_value - initial_investment
-        
-        return {
-            'initial_investment': round(initial_investment, 2),
-            'final_value': round(final_value, 2),
-            'absolute_returns': round(absolute_returns, 2),
-            'cagr_percentage': round(cagr, 2)
-        }
-    
-    except Exception as e:
-        raise Exception(f"CAGR calculation error: {str(e)}")
-
-def calculate_roi_returns(initial_investment, final_value, tenure_years):
-    """
-    Calculate ROI returns with proper CAGR calculation
-    """
-    try:
-        # Absolute returns
-        absolute_returns = final_value - initial_investment
-        
-        # ROI percentage
-        roi_percentage = (absolute_returns / initial_investment) * 100
-        
-        # Annualized ROI (CAGR)
-        if tenure_years > 0:
-            annualized_roi = ((final_value / initial_investment) ** (1 / tenure_years) - 1) * 100
-        else:
-            annualized_roi = 0
-            
-        return {
-            'initial_investment': initial_investment,
-            'final_value': final_value,
-            'absolute_returns': absolute_returns,
-            'roi_percentage': roi_percentage,
-            'annualized_roi': annualized_roi,
-            'tenure_years': tenure_years
-        }
-    
-    except Exception as e:
-        return {
-            'error': str(e),
-            'initial_investment': 0,
-            'final_value': 0,
-            'absolute_returns': 0,
-            'roi_percentage': 0,
-            'annualized_roi': 0,
-            'tenure_years': 0
-        }
-
-def calculate_fd_returns(principal_amount, annual_interest_rate, tenure_years, compounding_frequency):
-    """
-    Calculate Fixed Deposit returns with compound interest
-    """
-    try:
-        # Convert annual rate to decimal
-        annual_rate_decimal = annual_interest_rate / 100
-        
-        # Determine compounding periods per year
-        compounding_periods = {
-            'monthly': 12,
-            'quarterly': 4,
-            'half-yearly': 2,
-            'yearly': 1
-        }
-        
-        n = compounding_periods.get(compounding_frequency, 4)  # Default to quarterly
-        
-        # Calculate maturity amount using compound interest formula
-        # A = P(1 + r/n)^(nt)
-        maturity_amount = principal_amount * ((1 + annual_rate_decimal / n) ** (n * tenure_years))
-        
-        # Calculate interest earned
-        interest_earned = maturity_amount - principal_amount
-        
-
-        
-        # Calculate monthly interest (for display purposes)
-        monthly_interest = (interest_earned / tenure_years) / 12
-        
-        return {
-            'principal_amount': principal_amount,
-            'annual_interest_rate': annual_interest_rate,
-            'tenure_years': tenure_years,
-            'compounding_frequency': compounding_frequency,
-            'maturity_amount': round(maturity_amount, 2),
-            'interest_earned': round(interest_earned, 2),
-            'monthly_interest': round(monthly_interest, 2),
-            'total_return_percentage': round((interest_earned / principal_amount) * 100, 2)
-        }
-    
-    except Exception as e:
-        return {
-            'error': str(e),
-            'principal_amount': 0,
-            'maturity_amount': 0,
-            'interest_earned': 0,
-            'monthly_interest': 0,
-            'total_return_percentage': 0
-        }
-
-def calculate_rd_returns(monthly_deposit, annual_interest_rate, tenure_years, compounding_frequency):
-    """
-    Calculate Recurring Deposit returns with compound interest
-    RD Formula: M = R * [((1+i)^n - 1) / i] * (1+i)
-    Where:
-    M = Maturity Amount
-    R = Monthly deposit amount
-    i = Monthly interest rate (annual rate / 12 / 100)
-    n = Number of months
-    """
-    try:
-        # Convert annual rate to monthly rate (decimal)
-        monthly_rate = annual_interest_rate / 12 / 100
-        
-        # Total number of months
-        total_months = int(tenure_years * 12)
-        
-        # Calculate total deposits
-        total_deposits = monthly_deposit * total_months
-        
-        if monthly_rate == 0:
-            # If interest rate is 0, maturity amount is just total deposits
-            maturity_amount = total_deposits
-        else:
-            # RD compound interest formula
-            # For quarterly compounding in RD, we use the standard RD formula
-            maturity_amount = monthly_deposit * (((1 + monthly_rate) ** total_months - 1) / monthly_rate) * (1 + monthly_rate)
-        
-        # Calculate interest earned
-        interest_earned = maturity_amount - total_deposits
-        
-        # Calculate total return percentage
-        total_return_percentage = (interest_earned / total_deposits) * 100 if total_deposits > 0 else 0
-        
-        return {
-            'monthly_deposit': monthly_deposit,
-            'annual_interest_rate': annual_interest_rate,
-            'tenure_years': tenure_years,
-            'compounding_frequency': compounding_frequency,
-            'total_deposits': round(total_deposits, 2),
-            'maturity_amount': round(maturity_amount, 2),
-            'interest_earned': round(interest_earned, 2),
-            'total_return_percentage': round(total_return_percentage, 2)
-        }
-    
-    except Exception as e:
-        return {
-            'error': str(e),
-            'monthly_deposit': 0,
-            'total_deposits': 0,
-            'maturity_amount': 0,
-            'interest_earned': 0,
-            'total_return_percentage': 0
-        }
-
-def calculate_compound_interest_returns(principal_amount, annual_interest_rate, tenure_years, compounding_frequency):
-    """
-    Calculate Compound Interest returns
-    Formula: A = P(1 + r/n)^(nt)
-    Where:
-    A = Final Amount
-    P = Principal Amount
-    r = Annual interest rate (as decimal)
-    n = Number of times interest is compounded per year
-    t = Time in years
-    """
-    try:
-        # Convert annual rate to decimal
-        annual_rate_decimal = annual_interest_rate / 100
-        
-        # Determine compounding periods per year
-        compounding_periods = {
-            'monthly': 12,
-            'quarterly': 4,
-            'half-yearly': 2,
-            'yearly': 1
-        }
-        
-        n = compounding_periods.get(compounding_frequency, 4)  # Default to quarterly
-        
-        # Calculate final amount using compound interest formula
-        # A = P(1 + r/n)^(nt)
-        final_amount = principal_amount * ((1 + annual_rate_decimal / n) ** (n * tenure_years))
-        
-        # Calculate interest earned
-        interest_earned = final_amount - principal_amount
-        
-        # Calculate total return percentage
-        total_return_percentage = (interest_earned / principal_amount) * 100 if principal_amount > 0 else 0
-        
-        return {
-            'principal_amount': principal_amount,
-            'annual_interest_rate': annual_interest_rate,
-            'tenure_years': tenure_years,
-            'compounding_frequency': compounding_frequency,
-            'final_amount': round(final_amount, 2),
-            'interest_earned': round(interest_earned, 2),
-            'total_return_percentage': round(total_return_percentage, 2)
-        }
-    
-    except Exception as e:
-        return {
-            'error': str(e),
-            'principal_amount': 0,
-            'final_amount': 0,
-            'interest_earned': 0,
-            'total_return_percentage': 0
-        }
-
-@app.route('/calculate-cagr', methods=['POST'])
-def calculate_cagr():
-    try:
-        data = request.get_json()
-        
-        initial_investment = float(data.get('initial_investment', 100000))
-        final_value = float(data.get('final_value', 300000))
-        tenure_years = int(data.get('tenure_years', 10))
-        
-        if initial_investment <= 0 or final_value <= 0 or tenure_years <= 0:
-            return jsonify({'error': 'Invalid input values'}), 400
-        
-        # Calculate CAGR returns
-        results = calculate_cagr_returns(
-            initial_investment,
-            final_value,
-            tenure_years
-        )
-        
-        return jsonify(results)
-    
-    except Exception as e:
-        return jsonify({'error': str(e)}), 400
-
-@app.route('/calculate-roi', methods=['POST'])
-def calculate_roi():
-    try:
-        data = request.get_json()
-        
-        initial_investment = float(data.get('initial_investment', 0))
-        final_value = float(data.get('final_value', 0))
-        tenure_years = float(data.get('tenure_years', 0))
-        
-        if initial_investment <= 0 or final_value <= 0 or tenure_years <= 0:
-            return jsonify({'error': 'Invalid input values'}), 400
-        
-        result = calculate_roi_returns(initial_investment, final_value, tenure_years)
-        
-        return jsonify(result)
-    
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/calculate-fd', methods=['POST'])
-def calculate_fd():
-    try:
-        data = request.get_json()
-        
-        principal_amount = float(data.get('principal_amount', 0))
-        annual_interest_rate = float(data.get('annual_interest_rate', 0))
-        tenure_years = float(data.get('tenure_years', 0))
-        compounding_frequency = data.get('compounding_frequency', 'quarterly')
-        
-        if principal_amount <= 0 or annual_interest_rate <= 0 or tenure_years <= 0:
-            return jsonify({'error': 'Invalid input values'}), 400
-        
-        result = calculate_fd_returns(principal_amount, annual_interest_rate, tenure_years, compounding_frequency)
-        
-        return jsonify(result)
-    
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/calculate-rd', methods=['POST'])
-def calculate_rd():
-    try:
-        data = request.get_json()
-        
-        monthly_deposit = float(data.get('monthly_deposit', 0))
-        annual_interest_rate = float(data.get('annual_interest_rate', 0))
-        tenure_years = float(data.get('tenure_years', 0))
-        compounding_frequency = data.get('compounding_frequency', 'quarterly')
-        
-        if monthly_deposit <= 0 or annual_interest_rate <= 0 or tenure_years <= 0:
-            return jsonify({'error': 'Invalid input values'}), 400
-        
-        result = calculate_rd_returns(monthly_deposit, annual_interest_rate, tenure_years, compounding_frequency)
-        
-        return jsonify(result)
-    
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/calculate-compound-interest', methods=['POST'])
-def calculate_compound_interest():
-    try:
-        data = request.get_json()
-        
-        principal_amount = float(data.get('principal_amount', 0))
-        annual_interest_rate = float(data.get('annual_interest_rate', 0))
-        tenure_years = float(data.get('tenure_years', 0))
-        compounding_frequency = data.get('compounding_frequency', 'quarterly')
-        
-        if principal_amount <= 0 or annual_interest_rate <= 0 or tenure_years <= 0:
-            return jsonify({'error': 'Invalid input values'}), 400
-        
-        result = calculate_compound_interest_returns(principal_amount, annual_interest_rate, tenure_years, compounding_frequency)
-        
-        return jsonify(result)
-    
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-def calculate_nps_returns(current_age, retirement_age, monthly_contribution, expected_return, annual_increase, annuity_percentage, annuity_return):
-    """
-    Calculate NPS returns following SBI methodology
-    """
-    investment_years = retirement_age - current_age
-    monthly_rate = expected_return / (100 * 12)
-    
-    # Total investment amount (fixed monthly contribution)
-    investment_amount = monthly_contribution * 12 * investment_years
-    
-    # Calculate pension wealth using SIP formula
-    if monthly_rate > 0:
-        pension_wealth = monthly_contribution * (((1 + monthly_rate) ** (investment_years * 12)) - 1) / monthly_rate * (1 + monthly_rate)
-    else:
-        pension_wealth = investment_amount
-    
-    # Calculate lump sum and annuity amounts based on annuity percentage
-    lump_sum_percentage = 100 - annuity_percentage
-    lump_sum_amount = pension_wealth * (lump_sum_percentage / 100)
-    annuity_amount = pension_wealth * (annuity_percentage / 100)
-    
-    # Calculate monthly pension using SBI's exact methodology
-    # SBI uses simple percentage calculation: Annuity Amount * Annual Rate / 12
-    if annuity_return > 0:
-        monthly_pension = annuity_amount * (annuity_return / 100) / 12
-    else:
-        monthly_pension = annuity_amount / (20 * 12)  # Default to 20 years if no return rate
-    
-    # Calculate investment gains
-    investment_gains = pension_wealth - investment_amount
-    
-    return {
-        'pension_wealth': round(pension_wealth, 2),
-        'investment_amount': round(investment_amount, 2),
-        'lump_sum_amount': round(lump_sum_amount, 2),
-        'annuity_amount': round(annuity_amount, 2),
-        'monthly_pension': round(monthly_pension, 2),
-        'investment_gains': round(investment_gains, 2)
-    }
-
-@app.route('/calculate-nps', methods=['POST'])
-def calculate_nps():
-    try:
-        data = request.get_json()
-        
-        current_age = int(data.get('current_age', 0))
-        retirement_age = int(data.get('retirement_age', 0))
-        monthly_contribution = float(data.get('monthly_contribution', 0))
-        expected_return = float(data.get('expected_return', 0))
-        annual_increase = float(data.get('annual_increase', 0))
-        annuity_percentage = float(data.get('annuity_percentage', 40))
-        annuity_return = float(data.get('annuity_return', 6))
-        
-        if current_age <= 0 or retirement_age <= 0 or monthly_contribution <= 0 or expected_return <= 0 or current_age >= retirement_age:
-            return jsonify({'error': 'Invalid input values'}), 400
-        
-        result = calculate_nps_returns(current_age, retirement_age, monthly_contribution, expected_return, annual_increase, annuity_percentage, annuity_return)
-        
-        return jsonify(result)
-    
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-def calculate_swp_returns(initial_investment, annual_return_rate, withdrawal_amount, tenure_years, withdrawal_frequency):
-    """
-    Calculate SWP (Systematic Withdrawal Plan) returns
-    """
-    try:
-        # Convert annual rate to decimal
-        annual_rate_decimal = annual_return_rate / 100
-        
-        # Determine withdrawal periods per year
-        frequency_periods = {
-            'monthly': 12,
-            'quarterly': 4,
-            'half-yearly': 2,
-            'yearly': 1
-        }
-        
-        periods_per_year = frequency_periods.get(withdrawal_frequency, 12)  # Default to monthly
-        
-        # Calculate periodic return rate
-        periodic_rate = annual_rate_decimal / periods_per_year
-        
-        # Total number of withdrawal periods
-        total_periods = int(tenure_years * periods_per_year)
-        
-        # Initialize variables
-        current_balance = initial_investment
-        total_withdrawals = 0
-        
-        # Calculate withdrawals period by period
-        for period in range(total_periods):
-            # Apply return for the period
-            current_balance = current_balance * (1 + periodic_rate)
-            
-            # Make withdrawal if balance is sufficient
-            if current_balance >= withdrawal_amount:
-                current_balance -= withdrawal_amount
-                total_withdrawals += withdrawal_amount
-            else:
-                # If insufficient balance, withdraw whatever is available
-                total_withdrawals += current_balance
-                current_balance = 0
-                break
-        
-        # Final balance
-        final_balance = current_balance
-        
-        # Calculate net returns
-        total_value = total_withdrawals + final_balance
-        net_gain = total_value - initial_investment
-        net_return_percentage = (net_gain / initial_investment) * 100 if initial_investment > 0 else 0
-        
-        return {
-            'initial_investment': initial_investment,
-            'annual_return_rate': annual_return_rate,
-            'withdrawal_amount': withdrawal_amount,
-            'tenure_years': tenure_years,
-            'withdrawal_frequency': withdrawal_frequency,
-            'total_withdrawals': round(total_withdrawals, 2),
-            'final_balance': round(final_balance, 2),
-            'total_value': round(total_value, 2),
-            'net_return_percentage': round(net_return_percentage, 2)
-        }
-    
-    except Exception as e:
-        return {
-            'error': str(e),
-            'initial_investment': 0,
-            'total_withdrawals': 0,
-            'final_balance': 0,
-            'total_value': 0,
-            'net_return_percentage': 0
-        }
-
-@app.route('/calculate-swp', methods=['POST'])
-def calculate_swp():
-    try:
-        data = request.get_json()
-        
-        initial_investment = float(data.get('initial_investment', 0))
-        annual_return_rate = float(data.get('annual_return_rate', 0))
-        withdrawal_amount = float(data.get('withdrawal_amount', 0))
-        tenure_years = float(data.get('tenure_years', 0))
-        withdrawal_frequency = data.get('withdrawal_frequency', 'monthly')
-        
-        if initial_investment <= 0 or annual_return_rate <= 0 or withdrawal_amount <= 0 or tenure_years <= 0:
-            return jsonify({'error': 'Invalid input values'}), 400
-        
-        result = calculate_swp_returns(initial_investment, annual_return_rate, withdrawal_amount, tenure_years, withdrawal_frequency)
-        
-        return jsonify(result)
-    
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+from flask import Flask
 
-def calculate_elss_sip_returns(sip_amount, expected_return, investment_period, tax_slab):
-    """
-    Calculate ELSS SIP returns with tax benefits
-    """
-    # Handle 0 values gracefully
-    if sip_amount == 0 or expected_return == 0 or investment_period == 0:
-        return {
-            'final_corpus': 0,
-            'total_invested': 0,
-            'wealth_gained': 0,
-            'annual_tax_savings': 0,
-            'yearly_breakdown': [],
-            'tax_slab': tax_slab,
-            'annual_investment': 0
-        }
-    
-    # Monthly calculations
-    monthly_rate = expected_return / (12 * 100)
-    total_months = investment_period * 12
-    
-    # Calculate SIP maturity value using compound interest formula
-    if monthly_rate == 0:
-        future_value = sip_amount * total_months
-    else:
-        # SIP Future Value Formula: PMT * [((1 + r)^n - 1) / r] * (1 + r)
-        future_value = sip_amount * (((1 + monthly_rate) ** total_months - 1) / monthly_rate) * (1 + monthly_rate)
-    
-    # Total invested
-    total_invested = sip_amount * total_months
-    
-    # Wealth gained
-    wealth_gained = future_value - total_invested
-    
-    # Annual investment (for tax calculation)
-    annual_investment = sip_amount * 12
-    
-    # Tax savings calculation based on Section 80C
-    max_deduction = 150000  # ₹1.5 lakh limit under Section 80C
-    eligible_deduction = min(annual_investment, max_deduction)
-    annual_tax_savings = eligible_deduction * (tax_slab / 100)
-    
-    # Generate year-wise breakdown
-    yearly_breakdown = []
-    cumulative_investment = 0
-    
-    for year in range(1, investment_period + 1):
-        # Investment for this year
-        annual_investment_amount = sip_amount * 12
-        cumulative_investment += annual_investment_amount
-        
-        # Calculate expected value more accurately
-        temp_cumulative = 0
-        for calc_year in range(1, year + 1):
-            year_investment = sip_amount * 12
-            remaining_growth_years = investment_period - calc_year + 0.5
-            year_future_value = year_investment * ((1 + expected_return / 100) ** remaining_growth_years)
-            temp_cumulative += year_future_value
-        
-        cumulative_value = temp_cumulative
-        wealth_gained_year = cumulative_value - cumulative_investment
-        
-        yearly_breakdown.append({
-            'year': year,
-            'annual_investment': annual_investment_amount,
-            'cumulative_investment': cumulative_investment,
-            'expected_value': round(cumulative_value, 2),
-            'wealth_gained': round(wealth_gained_year, 2)
-        })
-    
-    return {
-        'final_corpus': round(future_value, 2),
-        'total_invested': round(total_invested, 2),
-        'wealth_gained': round(wealth_gained, 2),
-        'annual_tax_savings': round(annual_tax_savings, 2),
-        'yearly_breakdown': yearly_breakdown,
-        'tax_slab': tax_slab,
-        'annual_investment': annual_investment
-    }
+import metrics
+import profiling
+import json_provider
+import compression
+import response_cache
+import page_cache
+import prerender
+import assets
+import vendor
+import batch
+from blueprints import loans, investments, tax, government_schemes, comparisons
 
-def calculate_elss_lumpsum_returns(lumpsum_amount, expected_return, investment_period, tax_slab):
-    """
-    Calculate ELSS Lumpsum returns with tax benefits
-    """
-    # Handle 0 values gracefully
-    if lumpsum_amount == 0 or expected_return == 0 or investment_period == 0:
-        return {
-            'final_corpus': 0,
-            'total_invested': 0,
-            'wealth_gained': 0,
-            'annual_tax_savings': 0,
-            'yearly_breakdown': [],
-            'tax_slab': tax_slab,
-            'annual_investment': 0
-        }
-    
-    # Annual rate for compound interest
-    annual_rate = expected_return / 100
-    
-    # Calculate compound interest
-    future_value = lumpsum_amount * ((1 + annual_rate) ** investment_period)
-    
-    # Wealth gained
-    wealth_gained = future_value - lumpsum_amount
-    
-    # Tax savings calculation based on Section 80C (one-time for lumpsum)
-    max_deduction = 150000  # ₹1.5 lakh limit under Section 80C
-    eligible_deduction = min(lumpsum_amount, max_deduction)
-    tax_savings = eligible_deduction * (tax_slab / 100)
-    
-    # Generate year-wise breakdown
-    yearly_breakdown = []
-    
-    for year in range(1, investment_period + 1):
-        # For lumpsum, investment is only in year 1
-        investment_amount = lumpsum_amount if year == 1 else 0
-        total_investment = lumpsum_amount  # Always the same for lumpsum
-        
-        # Calculate expected value at end of each year
-        current_value = lumpsum_amount * ((1 + annual_rate) ** year)
-        wealth_gained_year = current_value - lumpsum_amount
-        
-        yearly_breakdown.append({
-            'year': year,
-            'annual_investment': investment_amount,
-            'cumulative_investment': total_investment,
-            'expected_value': round(current_value, 2),
-            'wealth_gained': round(wealth_gained_year, 2)
-        })
-    
-    return {
-        'final_corpus': round(future_value, 2),
-        'total_invested': round(lumpsum_amount, 2),
-        'wealth_gained': round(wealth_gained, 2),
-        'annual_tax_savings': round(tax_savings, 2),  # One-time tax savings for lumpsum
-        'yearly_breakdown': yearly_breakdown,
-        'tax_slab': tax_slab,
-        'annual_investment': 0  # No annual investment for lumpsum
-    }
+startup_profile.mark('imports')
 
-@app.route('/calculate-elss-sip', methods=['POST'])
-def calculate_elss_sip():
-    try:
-        data = request.get_json()
-        
-        mode = data.get('mode', 'sip')
-        expected_return = float(data.get('expected_return', 12))
-        investment_period = int(data.get('investment_period', 10))
-        tax_slab = 30  # Default tax slab for calculation purposes
-        
-        if mode == 'sip':
-            sip_amount = float(data.get('sip_amount', 0))
-            result = calculate_elss_sip_returns(
-                sip_amount, expected_return, investment_period, tax_slab
-            )
-        else:  # lumpsum mode
-            lumpsum_amount = float(data.get('lumpsum_amount', 0))
-            result = calculate_elss_lumpsum_returns(
-                lumpsum_amount, expected_return, investment_period, tax_slab
-            )
-        
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({'error': str(e)}), 400
-
-@app.route('/epf-calculator/')
-def epf_calculator():
-    return render_template('epf_calculator.html')
-
-@app.route('/etf-return-calculator/')
-def etf_return_calculator():
-    return render_template('etf_return_calculator.html')
-
-@app.route('/exit-load-calculator/')
-def exit_load_calculator():
-    return render_template('exit_load_calculator.html')
-
-@app.route('/gratuity-calculator/')
-def gratuity_calculator():
-    return render_template('gratuity_calculator.html')
-
-def calculate_exit_load_returns(investment_amount, exit_load_rate, redemption_amount, exit_load_period, purchase_nav, current_nav):
-    """
-    Calculate exit load charges for mutual fund investments
-    """
-    # Handle 0 values gracefully
-    if investment_amount == 0 or purchase_nav == 0 or current_nav == 0:
-        return {
-            'investment_amount': investment_amount,
-            'current_value': 0,
-            'exit_load_charge': 0,
-            'net_redemption_amount': 0,
-            'total_gain_loss': 0,
-            'gains_earned': 0,
-            'exit_load_applicable': False,
-            'units_held': 0,
-            'purchase_nav': purchase_nav,
-            'current_nav': current_nav,
-            'redemption_amount': redemption_amount,
-            'exit_load_period': exit_load_period,
-            'exit_load_rate': exit_load_rate
-        }
-    
-    # Calculate number of units purchased
-    units_held = investment_amount / purchase_nav
-    
-    # Calculate current value of investment
-    current_value = units_held * current_nav
-    
-    # Calculate gains/losses
-    total_gain_loss = current_value - investment_amount
-    gains_earned = max(0, total_gain_loss)  # Only positive gains
-    
-    # Check if exit load is applicable - based on redemption amount
-    exit_load_applicable = redemption_amount > 0 and exit_load_rate > 0
-    
-    # Calculate exit load charge
-    if exit_load_applicable:
-        # Exit load is charged on the redemption amount
-        exit_load_charge = redemption_amount * (exit_load_rate / 100)
-    else:
-        exit_load_charge = 0
-    
-    # Calculate net redemption amount (after exit load deduction)
-    net_redemption_amount = redemption_amount - exit_load_charge
-    
-    return {
-        'investment_amount': round(investment_amount, 2),
-        'current_value': round(current_value, 2),
-        'exit_load_charge': round(exit_load_charge, 2),
-        'net_redemption_amount': round(net_redemption_amount, 2),
-        'total_gain_loss': round(total_gain_loss, 2),
-        'gains_earned': round(gains_earned, 2),
-        'exit_load_applicable': exit_load_applicable,
-        'units_held': round(units_held, 4),
-        'purchase_nav': purchase_nav,
-        'current_nav': current_nav,
-        'redemption_amount': redemption_amount,
-        'exit_load_period': exit_load_period,
-        'exit_load_rate': exit_load_rate
-    }
-
-@app.route('/calculate-exit-load', methods=['POST'])
-def calculate_exit_load():
-    try:
-        data = request.get_json()
-        
-        investment_amount = float(data.get('investment_amount', 0))
-        exit_load_rate = float(data.get('exit_load_rate', 0))
-        redemption_amount = float(data.get('redemption_amount', 0))
-        exit_load_period = int(data.get('exit_load_period', 0))  # Received in days (converted from years in frontend)
-        purchase_nav = float(data.get('purchase_nav', 0))
-        current_nav = float(data.get('current_nav', 0))
-        
-        result = calculate_exit_load_returns(
-            investment_amount, exit_load_rate, redemption_amount, exit_load_period, purchase_nav, current_nav
-        )
-        
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({'error': str(e)}), 400
-
-def calculate_epf_returns(basic_salary, employee_contribution, employer_contribution, interest_rate, years_of_service, salary_increase):
-    """
-    Calculate EPF returns with employee and employer contributions
-    """
-    # Handle 0 values gracefully
-    if basic_salary == 0 or years_of_service == 0:
-        return {
-            'total_corpus': 0,
-            'total_employee_contribution': 0,
-            'total_employer_contribution': 0,
-            'total_interest': 0,
-            'yearly_breakdown': []
-        }
-    
-    # Monthly calculations
-    monthly_interest_rate = interest_rate / (12 * 100)
-    
-    # Initialize variables
-    total_employee_contribution = 0
-    total_employer_contribution = 0
-    total_balance = 0
-    yearly_breakdown = []
-    
-    # Calculate for each year
-    for year in range(1, years_of_service + 1):
-        # Calculate current year's salary (with annual increase)
-        current_basic_salary = basic_salary * ((1 + salary_increase / 100) ** (year - 1))
-        
-        # Calculate contributions for this year
-        monthly_employee_contribution = current_basic_salary * (employee_contribution / 100)
-        monthly_employer_contribution = current_basic_salary * (employer_contribution / 100)
-        
-        # Annual contributions
-        annual_employee_contribution = monthly_employee_contribution * 12
-        annual_employer_contribution = monthly_employer_contribution * 12
-        
-        # Update totals
-        total_employee_contribution += annual_employee_contribution
-        total_employer_contribution += annual_employer_contribution
-        
-        # Calculate interest on existing balance for the year
-        year_start_balance = total_balance
-        monthly_balance = year_start_balance
-        interest_for_year = 0
-        
-        # Calculate month-wise interest and contributions (Standard EPF method)
-        for month in range(12):
-            # Calculate interest on beginning balance (before adding current month's contribution)
-            monthly_interest = monthly_balance * monthly_interest_rate
-            interest_for_year += monthly_interest
-            
-            # Add monthly contributions and interest
-            monthly_balance += monthly_employee_contribution + monthly_employer_contribution + monthly_interest
-        
-        total_balance = monthly_balance
-        
-        yearly_breakdown.append({
-            'year': year,
-            'basic_salary': round(current_basic_salary * 12, 2),  # Annual salary
-            'employee_contribution': round(annual_employee_contribution, 2),
-            'employer_contribution': round(annual_employer_contribution, 2),
-            'interest_earned': round(interest_for_year, 2),
-            'total_balance': round(total_balance, 2)
-        })
-    
-    # Calculate total interest earned
-    total_interest = total_balance - total_employee_contribution - total_employer_contribution
-    
-    return {
-        'total_corpus': round(total_balance, 2),
-        'total_employee_contributation': round(total_employee_contribution, 2),
-        'total_employer_contributation': round(total_employer_contribution, 2),
-        'total_interest': round(total_interest, 2),
-        'yearly_breakdown': yearly_breakdown
-    }
-
-@app.route('/calculate-epf', methods=['POST'])
-def calculate_epf():
-    try:
-        data = request.get_json()
-        
-        basic_salary = float(data.get('basic_salary', 0))
-        employee_contribution = float(data.get('employee_contribution', 12))
-        employer_contribution = float(data.get('employer_contribution', 12))
-        interest_rate = float(data.get('interest_rate', 8.15))
-        years_of_service = int(data.get('years_of_service', 30))
-        salary_increase = float(data.get('salary_increase', 5))
-        
-        result = calculate_epf_returns(
-            basic_salary, employee_contribution, employer_contribution, interest_rate, years_of_service, salary_increase
-        )
-        
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({'error': str(e)}), 400
-
-def calculate_gratuity_returns(last_salary, years_of_service, gratuity_type, custom_days):
-    """
-    Calculate gratuity amount based on Indian gratuity rules
-    """
-    # Calculate annual salary
-    annual_salary = last_salary * 12
-    
-    # Determine the number of days per year for calculation
-    if gratuity_type == 'act':
-        days_per_year = 15  # Under Payment of Gratuity Act
-        formula_used = '(Last Salary × Years of Service × 15) / 26'
-    elif gratuity_type == 'non-act':
-        days_per_year = 30  # Not covered under Act
-        formula_used = '(Last Salary × Years of Service × 30) / 26'
-    else:  # custom
-        days_per_year = custom_days
-        formula_used = f'(Last Salary × Years of Service × {custom_days}) / 26'
-    
-    # Calculate gratuity amount
-    # Formula: (Last Salary × Years of Service × Days per year) / 26
-    gratuity_amount = (last_salary * years_of_service * days_per_year) / 26
-    
-    # Apply maximum limit for Act coverage (Rs 20,00,000)
-    if gratuity_type == 'act' and gratuity_amount > 2000000:
-        gratuity_amount = 2000000
-    
-    return {
-        'gratuity_amount': round(gratuity_amount, 2),
-        'annual_salary': round(annual_salary, 2),
-        'formula_used': formula_used,
-        'days_per_year': days_per_year,
-        'years_of_service': years_of_service,
-        'last_salary': last_salary
-    }
-
-@app.route('/calculate-gratuity', methods=['POST'])
-def calculate_gratuity():
-    try:
-        data = request.get_json()
-        
-        last_salary = float(data.get('last_salary', 0))
-        years_of_service = int(data.get('years_of_service', 0))
-        gratuity_type = data.get('gratuity_type', 'act')
-        custom_days = int(data.get('custom_days', 15))
-        
-        result = calculate_gratuity_returns(
-            last_salary, years_of_service, gratuity_type, custom_days
-        )
-        
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({'error': str(e)}), 400
-
-def calculate_mutual_fund_expense_ratio_returns(investment_amount, investment_type, expected_return, expense_ratio, investment_period):
-    """
-    Calculate mutual fund returns with expense ratio impact
-    """
-    if investment_type == 'lumpsum':
-        # Lump sum investment
-        total_invested = investment_amount
-        
-        # Net return rate after expense ratio
-        net_return_rate = expected_return - expense_ratio
-        
-        # Calculate gross and net maturity amounts
-        gross_maturity_amount = investment_amount * ((1 + expected_return / 100) ** investment_period)
-        net_maturity_amount = investment_amount * ((1 + net_return_rate / 100) ** investment_period)
-        
-        # Calculate expense cost
-        total_expense_cost = gross_maturity_amount - net_maturity_amount
-        
-        # Annual expense cost (approximate)
-        annual_expense_cost = investment_amount * (expense_ratio / 100)
-        
-    else:  # SIP
-        # Monthly SIP investment
-        monthly_investment = investment_amount
-        total_invested = monthly_investment * 12 * investment_period
-        
-        # Calculate SIP returns with gross and net rates
-        def calculate_sip_maturity(monthly_amount, annual_rate, years):
-            monthly_rate = annual_rate / (12 * 100)
-            total_months = years * 12
-            if monthly_rate == 0:
-                return monthly_amount * total_months
-            return monthly_amount * (((1 + monthly_rate) ** total_months - 1) / monthly_rate) * (1 + monthly_rate)
-        
-        gross_maturity_amount = calculate_sip_maturity(monthly_investment, expected_return, investment_period)
-        net_return_rate = expected_return - expense_ratio
-        net_maturity_amount = calculate_sip_maturity(monthly_investment, net_return_rate, investment_period)
-        
-        # Calculate expense cost
-        total_expense_cost = gross_maturity_amount - net_maturity_amount
-        
-        # Annual expense cost (approximate)
-        average_corpus = total_invested / 2  # Rough average for SIP
-        annual_expense_cost = average_corpus * (expense_ratio / 100)
-    
-    # Calculate returns
-    gross_returns = gross_maturity_amount - total_invested
-    net_returns = net_maturity_amount - total_invested
-    
-    # Generate yearly breakdown
-    yearly_breakdown = []
-    for year in range(1, investment_period + 1):
-        if investment_type == 'lumpsum':
-            year_investment = investment_amount if year == 1 else 0
-            cumulative_investment = investment_amount
-            
-            # Calculate values for this year
-            gross_value = investment_amount * ((1 + expected_return / 100) ** year)
-            net_value = investment_amount * ((1 + net_return_rate / 100) ** year)
-        else:  # SIP
-            year_investment = monthly_investment * 12
-            cumulative_investment = year_investment * year
-            
-            # Calculate SIP values for this year
-            gross_value = calculate_sip_maturity(monthly_investment, expected_return, year)
-            net_value = calculate_sip_maturity(monthly_investment, net_return_rate, year)
-        
-        expense_cost = gross_value - net_value
-        
-        yearly_breakdown.append({
-            'year': year,
-            'totalInvestment': round(cumulative_investment, 2),
-            'grossValue': round(gross_value, 2),
-            'expenseCost': round(expense_cost, 2),
-            'netValue': round(net_value, 2)
-        })
-    
-    return {
-        'status': 'success',
-        'totalInvested': round(total_invested, 2),
-        'grossMaturityAmount': round(gross_maturity_amount, 2),
-        'netMaturityAmount': round(net_maturity_amount, 2),
-        'totalExpenseCost': round(total_expense_cost, 2),
-        'netReturns': round(net_returns, 2),
-        'annualExpenseCost': round(annual_expense_cost, 2),
-        'yearlyBreakdown': yearly_breakdown,
-        'investmentType': investment_type,
-        'expectedReturn': expected_return,
-        'expenseRatio': expense_ratio,
-        'investmentPeriod': investment_period
-    }
-
-@app.route('/calculate-mutual-fund-expense-ratio', methods=['POST'])
-def calculate_mutual_fund_expense_ratio():
-    try:
-        data = request.get_json()
-        
-        investment_amount = float(data.get('investmentAmount', 0))
-        investment_type = data.get('investmentType', 'lumpsum')
-        expected_return = float(data.get('expectedReturn', 12))
-        expense_ratio = float(data.get('expenseRatio', 1.5))
-        investment_period = int(data.get('investmentPeriod', 10))
-        
-        result = calculate_mutual_fund_expense_ratio_returns(
-            investment_amount, investment_type, expected_return, expense_ratio, investment_period
-        )
-        
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({'status': 'error', 'error': str(e)}), 400
-
-def calculate_expense_ratio_returns(investment_amount, investment_type, expected_return, expense_ratio, investment_period):
-    """
-    Calculate investment returns with expense ratio impact
-    """
-    if investment_type == 'lumpsum':
-        # Lump sum investment
-        total_invested = investment_amount
-        
-        # Net return rate after expense ratio
-        net_return_rate = expected_return - expense_ratio
-        
-        # Calculate gross and net maturity amounts
-        gross_maturity_amount = investment_amount * ((1 + expected_return / 100) ** investment_period)
-        net_maturity_amount = investment_amount * ((1 + net_return_rate / 100) ** investment_period)
-        
-        # Calculate expense cost
-        total_expense_cost = gross_maturity_amount - net_maturity_amount
-        
-        # Annual expense cost (approximate)
-        annual_expense_cost = investment_amount * (expense_ratio / 100)
-        
-    else:  # SIP
-        # Monthly SIP investment
-        monthly_investment = investment_amount
-        total_invested = monthly_investment * 12 * investment_period
-        
-        # Calculate SIP returns with gross and net rates
-        def calculate_sip_maturity(monthly_amount, annual_rate, years):
-            monthly_rate = annual_rate / (12 * 100)
-            total_months = years * 12
-            if monthly_rate == 0:
-                return monthly_amount * total_months
-            return monthly_amount * (((1 + monthly_rate) ** total_months - 1) / monthly_rate) * (1 + monthly_rate)
-        
-        gross_maturity_amount = calculate_sip_maturity(monthly_investment, expected_return, investment_period)
-        net_return_rate = expected_return - expense_ratio
-        net_maturity_amount = calculate_sip_maturity(monthly_investment, net_return_rate, investment_period)
-        
-        # Calculate expense cost
-        total_expense_cost = gross_maturity_amount - net_maturity_amount
-        
-        # Annual expense cost (approximate)
-        average_corpus = total_invested / 2  # Rough average for SIP
-        annual_expense_cost = average_corpus * (expense_ratio / 100)
-    
-    # Calculate returns
-    gross_returns = gross_maturity_amount - total_invested
-    net_returns = net_maturity_amount - total_invested
-    
-    # Generate yearly breakdown with monthly data
-    yearly_breakdown = []
-    month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                   'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-    
-    for year in range(1, investment_period + 1):
-        monthly_data = []
-        
-        if investment_type == 'lumpsum':
-            year_investment = investment_amount if year == 1 else 0
-            cumulative_investment = investment_amount
-            
-            # Calculate values for this year
-            gross_value = investment_amount * ((1 + expected_return / 100) ** year)
-            net_value = investment_amount * ((1 + net_return_rate / 100) ** year)
-            
-            # For lumpsum, generate monthly data (same values across all months in a year)
-            for month in range(12):
-                month_gross = investment_amount * ((1 + expected_return / 100) ** (year - 1 + (month + 1)/12))
-                month_net = investment_amount * ((1 + net_return_rate / 100) ** (year - 1 + (month + 1)/12))
-                month_expense = month_gross - month_net
-                
-                monthly_data.append({
-                    'month': month_names[month],
-                    'investment': round(investment_amount if year == 1 and month == 0 else 0, 2),
-                    'grossValue': round(month_gross, 2),
-                    'expenseCost': round(month_expense, 2),
-                    'netValue': round(month_net, 2)
-                })
-        else:  # SIP
-            year_investment = monthly_investment * 12
-            cumulative_investment = year_investment * year
-            
-            # Calculate SIP values for this year
-            gross_value = calculate_sip_maturity(monthly_investment, expected_return, year)
-            net_value = calculate_sip_maturity(monthly_investment, net_return_rate, year)
-            
-            # For SIP, generate actual monthly progression
-            for month in range(12):
-                months_completed = (year - 1) * 12 + (month + 1)
-                if months_completed <= investment_period * 12:
-                    month_gross = calculate_sip_maturity(monthly_investment, expected_return, months_completed / 12)
-                    month_net = calculate_sip_maturity(monthly_investment, net_return_rate, months_completed / 12)
-                    month_expense = month_gross - month_net
-                    
-                    monthly_data.append({
-                        'month': month_names[month],
-                        'investment': round(monthly_investment, 2),
-                        'grossValue': round(month_gross, 2),
-                        'expenseCost': round(month_expense, 2),
-                        'netValue': round(month_net, 2)
-                    })
-        
-        expense_cost = gross_value - net_value
-        
-        yearly_breakdown.append({
-            'year': year,
-            'totalInvestment': round(cumulative_investment, 2),
-            'grossValue': round(gross_value, 2),
-            'expenseCost': round(expense_cost, 2),
-            'netValue': round(net_value, 2),
-            'monthlyData': monthly_data
-        })
-    
-    return {
-        'status': 'success',
-        'totalInvested': round(total_invested, 2),
-        'grossReturns': round(gross_returns, 2),
-        'expenseImpact': round(total_expense_cost, 2),
-        'netReturns': round(net_returns, 2),
-        'finalAmount': round(net_maturity_amount, 2),
-        'yearlyBreakdown': yearly_breakdown,
-        'investmentType': investment_type,
-        'expectedReturn': expected_return,
-        'expenseRatio': expense_ratio,
-        'investmentPeriod': investment_period
-    }
-
-@app.route('/calculate-expense-ratio', methods=['POST'])
-def calculate_expense_ratio():
-    try:
-        data = request.get_json()
-        
-        investment_amount = float(data.get('investmentAmount', 0))
-        investment_type = data.get('investmentType', 'lumpsum')
-        expected_return = float(data.get('expectedReturn', 12))
-        expense_ratio = float(data.get('expenseRatio', 1.5))
-        investment_period = int(data.get('investmentPeriod', 10))
-        
-        result = calculate_expense_ratio_returns(
-            investment_amount, investment_type, expected_return, expense_ratio, investment_period
-        )
-        
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({'status': 'error', 'error': str(e)}), 400
-
-# Post Office Monthly Income Scheme Calculator Routes
-@app.route('/post-office-monthly-income-scheme-calculator/')
-def post_office_monthly_income_scheme_calculator():
-    return render_template('post_office_monthly_income_scheme_calculator.html')
-
-def calculate_post_office_monthly_income_scheme_returns(yearly_investment, time_period, interest_rate):
-    """
-    Calculate Post Office Monthly Income Scheme returns
-    Formula:
-    - Monthly Interest = (Yearly Investment × Interest Rate) ÷ 12
-    - Total Interest = Monthly Interest × Total Months
-    - Maturity Value = Yearly Investment + Total Interest
-    """
-    try:
-        # Calculate monthly interest
-        monthly_interest = (yearly_investment * interest_rate) / (100 * 12)
-        
-        # Calculate total months
-        total_months = time_period * 12
-        
-        # Calculate total interest for the entire tenure
-        total_interest = monthly_interest * total_months
-        
-        # Calculate maturity value
-        maturity_value = yearly_investment + total_interest
-        
-        return {
-            'yearly_investment': yearly_investment,
-            'time_period': time_period,
-            'interest_rate': interest_rate,
-            'monthly_interest': round(monthly_interest, 2),
-            'total_interest': round(total_interest, 2),
-            'maturity_value': round(maturity_value, 2),
-            'invested_amount': yearly_investment
-        }
-    
-    except Exception as e:
-        return {
-            'error': str(e),
-            'monthly_interest': 0,
-            'total_interest': 0,
-            'maturity_value': 0,
-            'invested_amount': 0
-        }
-
-@app.route('/calculate-post-office-monthly-income-scheme', methods=['POST'])
-def calculate_post_office_monthly_income_scheme():
-    try:
-        data = request.get_json()
-        
-        yearly_investment = float(data.get('yearly_investment', 0))
-        time_period = float(data.get('time_period', 5))
-        interest_rate = float(data.get('interest_rate', 7.4))
-        
-        if yearly_investment <= 0 or time_period <= 0 or interest_rate <= 0:
-            return jsonify({'error': 'Invalid input values'}), 400
-        
-        result = calculate_post_office_monthly_income_scheme_returns(yearly_investment, time_period, interest_rate)
-        
-        return jsonify(result)
-    
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/senior-citizen-savings-scheme-calculator/')
-def senior_citizen_savings_scheme_calculator():
-    return render_template('senior_citizen_savings_scheme_calculator.html')
-
-@app.route('/sukanya-samriddhi-yojana-calculator/')
-def sukanya_samriddhi_yojana_calculator():
-    return render_template('sukanya_samriddhi_yojana_calculator.html')
-
-def calculate_scss_returns(investment_amount, annual_interest_rate, tenure_years):
-    """
-    Calculate SCSS returns with quarterly interest payouts
-    SCSS Features:
-    - Fixed interest rate (currently 8.2% per annum)
-    - Flexible tenure: 0 to 8 years
-    - Interest paid quarterly
-    """
-    # Total tenure
-    total_tenure = tenure_years
-    
-    # Quarterly interest rate
-    quarterly_rate = annual_interest_rate / (4 * 100)
-    total_quarters = total_tenure * 4
-    
-    # Calculate quarterly interest payout
-    quarterly_interest = investment_amount * quarterly_rate
-    
-    # Calculate total interest for all quarters
-    total_interest = quarterly_interest * total_quarters
-    
-    # Maturity amount (principal + total interest)
-    maturity_amount = investment_amount + total_interest
-    
-    # Generate quarterly breakdown
-    quarterly_breakdown = []
-    cumulative_interest = 0
-    
-    for quarter in range(1, total_quarters + 1):
-        cumulative_interest += quarterly_interest
-        year = ((quarter - 1) // 4) + 1
-        quarter_in_year = ((quarter - 1) % 4) + 1
-        
-        quarterly_breakdown.append({
-            'quarter': quarter,
-            'year': year,
-            'quarter_in_year': quarter_in_year,
-            'quarterly_interest': round(quarterly_interest, 2),
-            'cumulative_interest': round(cumulative_interest, 2),
-            'balance': round(investment_amount + cumulative_interest, 2)
-        })
-    
-    # Generate yearly summary
-    yearly_summary = []
-    for year in range(1, total_tenure + 1):
-        yearly_interest = quarterly_interest * 4
-        cumulative_interest_year_end = yearly_interest * year
-        
-        yearly_summary.append({
-            'year': year,
-            'yearly_interest': round(yearly_interest, 2),
-            'cumulative_interest': round(cumulative_interest_year_end, 2),
-            'balance': round(investment_amount + cumulative_interest_year_end, 2)
-        })
-    
-    return {
-        'investment_amount': investment_amount,
-        'annual_interest_rate': annual_interest_rate,
-        'tenure_years': tenure_years,
-        'total_tenure': total_tenure,
-        'quarterly_interest': round(quarterly_interest, 2),
-        'total_interest': round(total_interest, 2),
-        'maturity_amount': round(maturity_amount, 2),
-        'quarterly_breakdown': quarterly_breakdown,
-        'yearly_summary': yearly_summary
-    }
-
-@app.route('/calculate-scss', methods=['POST'])
-def calculate_scss():
-    try:
-        data = request.get_json()
-        investment_amount = float(data.get('investment_amount', 0))
-        annual_interest_rate = float(data.get('annual_interest_rate', 8.2))
-        tenure_years = int(data.get('tenure_years', 5))
-        
-        # Validate inputs
-        if investment_amount < 0:
-            return jsonify({'error': 'Investment amount cannot be negative'}), 400
-        if investment_amount > 10000000:
-            return jsonify({'error': 'Maximum investment amount is ₹1,00,00,000'}), 400
-        
-        # Calculate SCSS returns
-        result = calculate_scss_returns(investment_amount, annual_interest_rate, tenure_years)
-        
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({'error': str(e)}), 400
-
-def calculate_ssy_returns(annual_investment, annual_interest_rate, investment_period, investment_frequency='yearly', investment_amount=0.0):
-    """
-    Calculate Sukanya Samriddhi Yojana returns
-    SSY Features:
-    - Annual investment: ₹250 to ₹1,50,000
-    - Investment period: Maximum 15 years from account opening
-    - Lock-in period: 21 years from account opening
-    - Interest compounded annually
-    - Tax benefits under Section 80C
-    """
-    # Total investment over the investment period
-    total_investment = annual_investment * investment_period
-    
-    # Maturity period is 21 years from account opening
-    maturity_period = 21
-    
-    # Calculate compound interest
-    # For investment period: contributions + interest
-    # For remaining years: only interest on accumulated amount
-    
-    accumulated_amount = 0
-    
-    # Calculate value after investment period (with annual contributions)
-    for year in range(1, investment_period + 1):
-        # Add annual investment at the beginning of the year
-        accumulated_amount += annual_investment
-        # Apply compound interest for the entire year
-        accumulated_amount = accumulated_amount * (1 + annual_interest_rate / 100)
-    
-    # Calculate growth for remaining years (no new investments)
-    remaining_years = maturity_period - investment_period
-    for year in range(remaining_years):
-        accumulated_amount = accumulated_amount * (1 + annual_interest_rate / 100)
-    
-    # Calculate final values
-    maturity_amount = accumulated_amount
-    total_interest = maturity_amount - total_investment
-    
-
-    
-    # Generate detailed breakdown (yearly and monthly)
-    yearly_breakdown = []
-    monthly_breakdown = []
-    temp_accumulated = 0
-    total_invested_so_far = 0
-    
-    # Calculate frequency multiplier for monthly breakdown
-    freq_multiplier = {'monthly': 12, 'quarterly': 4, 'half-yearly': 2, 'yearly': 1}
-    payments_per_year = freq_multiplier.get(investment_frequency, 1)
-    monthly_investment_amount = annual_investment / 12 if investment_frequency == 'monthly' else 0
-    
-    for year in range(1, maturity_period + 1):
-        year_start_balance = temp_accumulated
-        yearly_investment_amount = 0
-        
-        if year <= investment_period:
-            # Investment years
-            yearly_investment_amount = annual_investment
-            total_invested_so_far += annual_investment
-            temp_accumulated += annual_investment
-            temp_accumulated = temp_accumulated * (1 + annual_interest_rate / 100)
-            
-            # Generate monthly breakdown for this year
-            if investment_frequency == 'monthly':
-                monthly_balance = year_start_balance
-                for month in range(1, 13):
-                    monthly_balance += monthly_investment_amount
-                    monthly_interest = monthly_balance * (annual_interest_rate / 100) / 12
-                    monthly_balance += monthly_interest
-                    
-                    monthly_breakdown.append({
-                        'year': year,
-                        'month': month,
-                        'month_name': ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                                      'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'][month-1],
-                        'monthly_investment': monthly_investment_amount,
-                        'cumulative_investment': (year-1) * annual_investment + (month * monthly_investment_amount),
-                        'interest_earned': monthly_balance - ((year-1) * annual_investment + (month * monthly_investment_amount)),
-                        'balance': monthly_balance
-                    })
-            else:
-                # For non-monthly frequencies, show quarterly/half-yearly/yearly payments
-                payments_in_year = payments_per_year if year <= investment_period else 0
-                payment_amount = annual_investment / payments_per_year if payments_in_year > 0 else 0
-                
-                for month in range(1, 13):
-                    monthly_investment_this_month = 0
-                    
-                    # Determine if payment is made this month based on frequency
-                    if investment_frequency == 'quarterly' and month in [3, 6, 9, 12]:
-                        monthly_investment_this_month = payment_amount
-                    elif investment_frequency == 'half-yearly' and month in [6, 12]:
-                        monthly_investment_this_month = payment_amount
-                    elif investment_frequency == 'yearly' and month == 12:
-                        monthly_investment_this_month = payment_amount
-                    
-                    if month == 1:
-                        monthly_balance = year_start_balance + monthly_investment_this_month
-                    else:
-                        monthly_balance = monthly_breakdown[-1]['balance'] + monthly_investment_this_month
-                    
-                    monthly_interest = monthly_balance * (annual_interest_rate / 100) / 12
-                    monthly_balance += monthly_interest
-                    
-                    cumulative_investment = total_invested_so_far - annual_investment + sum(
-                        entry['monthly_investment'] for entry in monthly_breakdown 
-                        if entry['year'] == year and entry['month'] <= month
-                    ) + sum(entry['monthly_investment'] for entry in monthly_breakdown if entry['year'] < year)
-                    
-                    monthly_breakdown.append({
-                        'year': year,
-                        'month': month,
-                        'month_name': ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                                      'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'][month-1],
-                        'monthly_investment': monthly_investment_this_month,
-                        'cumulative_investment': cumulative_investment,
-                        'interest_earned': monthly_balance - cumulative_investment,
-                        'balance': monthly_balance
-                    })
-        else:
-            # Non-investment years (only interest)
-            temp_accumulated = temp_accumulated * (1 + annual_interest_rate / 100)
-            
-            # Monthly breakdown for non-investment years
-            for month in range(1, 13):
-                if month == 1:
-                    monthly_balance = year_start_balance
-                else:
-                    monthly_balance = monthly_breakdown[-1]['balance']
-                
-                monthly_interest = monthly_balance * (annual_interest_rate / 100) / 12
-                monthly_balance += monthly_interest
-                
-                monthly_breakdown.append({
-                    'year': year,
-                    'month': month,
-                    'month_name': ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                                  'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'][month-1],
-                    'monthly_investment': 0,
-                    'cumulative_investment': total_investment,
-                    'interest_earned': monthly_balance - total_investment,
-                    'balance': monthly_balance
-                })
-        
-        # Yearly summary
-        yearly_breakdown.append({
-            'year': year,
-            'annual_investment': yearly_investment_amount,
-            'total_invested': total_invested_so_far,
-            'interest_earned': temp_accumulated - total_invested_so_far,
-            'balance': temp_accumulated
-        })
-    
-    return {
-        'annual_investment': annual_investment,
-        'investment_amount': investment_amount,
-        'investment_frequency': investment_frequency,
-        'annual_interest_rate': annual_interest_rate,
-        'investment_period': investment_period,
-        'maturity_period': maturity_period,
-        'total_investment': round(total_investment, 2),
-        'maturity_amount': round(maturity_amount, 2),
-        'total_interest': round(total_interest, 2),
-        'yearly_breakdown': yearly_breakdown,
-        'monthly_breakdown': monthly_breakdown
-    }
-
-@app.route('/calculate-ssy', methods=['POST'])
-def calculate_ssy():
-    try:
-        data = request.get_json()
-        investment_amount = float(data.get('investment_amount', 0))
-        investment_frequency = data.get('investment_frequency', 'yearly')
-        annual_investment = float(data.get('annual_investment', 0))
-        annual_interest_rate = float(data.get('annual_interest_rate', 8.2))
-        investment_period = int(data.get('investment_period', 15))
-        
-        # Validate inputs
-        if annual_investment < 250:
-            return jsonify({'error': 'Minimum annual investment is ₹250'}), 400
-        if annual_investment > 150000:
-            return jsonify({'error': 'Maximum annual investment is ₹1,50,000'}), 400
-        if investment_period < 1 or investment_period > 15:
-            return jsonify({'error': 'Investment period must be between 1 and 15 years'}), 400
-        
-        # Calculate SSY returns
-        result = calculate_ssy_returns(annual_investment, annual_interest_rate, investment_period, investment_frequency, investment_amount)
-        
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({'error': str(e)}), 400
-
-@app.route('/atal-pension-yojana-calculator/')
-def atal_pension_yojana_calculator():
-    return render_template('atal_pension_yojana_calculator.html')
-
-def calculate_apy_returns(joining_age, pension_amount):
-    """
-    Calculate Atal Pension Yojana returns
-    APY Features:
-    - Entry age: 18-40 years
-    - Pension amounts: ₹1000, ₹2000, ₹3000, ₹4000, ₹5000 per month
-    - Government co-contribution: 50% of contribution or ₹1000 per year (whichever is lower) for first 5 years
-    - Maturity at age 60
-    - PFRDA standard return rate: 8.5% per annum
-    """
-    
-    # PFRDA standard return rate
-    expected_return_rate = 8.5
-    gov_co_contribution = True  # Always include government co-contribution as per APY rules
-    
-    # APY contribution matrix (simplified calculation based on age and pension amount)
-    # These are approximate monthly contributions required for each pension amount at different ages
-    contribution_matrix = {
-        1000: {18: 42, 25: 68, 30: 100, 35: 151, 40: 291},
-        2000: {18: 84, 25: 136, 30: 198, 35: 302, 40: 582},
-        3000: {18: 126, 25: 204, 30: 297, 35: 453, 40: 873},
-        4000: {18: 168, 25: 272, 30: 396, 35: 604, 40: 1164},
-        5000: {18: 210, 25: 340, 30: 495, 35: 755, 40: 1454}
-    }
-    
-    # Get base monthly contribution from matrix (using PFRDA standard rates)
-    age_brackets = sorted(contribution_matrix[pension_amount].keys())
-    closest_age = min(age_brackets, key=lambda x: abs(x - joining_age))
-    
-    # Interpolate for exact age
-    if joining_age in contribution_matrix[pension_amount]:
-        monthly_contribution = contribution_matrix[pension_amount][joining_age]
-    else:
-        # Linear interpolation between age brackets
-        if joining_age < closest_age:
-            lower_age = age_brackets[age_brackets.index(closest_age) - 1] if age_brackets.index(closest_age) > 0 else closest_age
-            upper_age = closest_age
-        else:
-            lower_age = closest_age
-            upper_age = age_brackets[age_brackets.index(closest_age) + 1] if age_brackets.index(closest_age) < len(age_brackets) - 1 else closest_age
-        
-        if lower_age == upper_age:
-            monthly_contribution = contribution_matrix[pension_amount][closest_age]
-        else:
-            lower_contrib = contribution_matrix[pension_amount][lower_age]
-            upper_contrib = contribution_matrix[pension_amount][upper_age]
-            # Linear interpolation
-            monthly_contribution = lower_contrib + (upper_contrib - lower_contrib) * (joining_age - lower_age) / (upper_age - lower_age)
-    
-    # Calculate investment period (from joining age to 60)
-    investment_period = 60 - joining_age
-    total_months = investment_period * 12
-    
-    # Calculate total contribution
-    total_contribution = monthly_contribution * total_months
-    
-    # Calculate government co-contribution (50% of contribution or ₹1000 per year, whichever is lower, for first 5 years)
-    gov_contribution = 0
-    if gov_co_contribution:
-        annual_contribution = monthly_contribution * 12
-        annual_gov_contribution = min(annual_contribution * 0.5, 1000)
-        gov_contribution_years = min(5, investment_period)
-        gov_contribution = annual_gov_contribution * gov_contribution_years
-    
-    # Calculate total corpus at age 60
-    monthly_rate = expected_return_rate / (12 * 100)
-    
-    # Future value of monthly contributions (annuity)
-    if monthly_rate > 0:
-        fv_contributions = monthly_contribution * (((1 + monthly_rate) ** total_months - 1) / monthly_rate)
-        
-        # Future value of government contributions (assuming they are made at the end of each year for first 5 years)
-        fv_gov_contribution = 0
-        if gov_co_contribution and gov_contribution > 0:
-            annual_gov_amount = gov_contribution / gov_contribution_years
-            for year in range(gov_contribution_years):
-                months_to_maturity = total_months - ((year + 1) * 12)
-                fv_gov_contribution += annual_gov_amount * ((1 + monthly_rate) ** months_to_maturity)
-    else:
-        fv_contributions = monthly_contribution * total_months
-        fv_gov_contribution = gov_contribution
-    
-    total_corpus = fv_contributions + fv_gov_contribution
-    investment_growth = total_corpus - total_contribution - gov_contribution
-    
-    # Calculate lump sum amount (200 times monthly pension as per APY rules)
-    lump_sum = pension_amount * 200
-    
-    # Generate detailed breakdown (yearly and monthly)
-    yearly_breakdown = []
-    monthly_breakdown = []
-    
-    accumulated_balance = 0
-    total_invested_so_far = 0
-    total_gov_contrib_so_far = 0
-    
-    month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                   'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-    
-    for year in range(1, investment_period + 1):
-        year_start_balance = accumulated_balance
-        yearly_contribution = monthly_contribution * 12
-        yearly_gov_contribution = 0
-        
-        # Government contribution for first 5 years
-        if gov_co_contribution and year <= 5:
-            yearly_gov_contribution = min(yearly_contribution * 0.5, 1000)
-        
-        total_invested_so_far += yearly_contribution
-        total_gov_contrib_so_far += yearly_gov_contribution
-        
-        # Calculate year-end balance with monthly compounding
-        year_end_balance = year_start_balance
-        for month in range(12):
-            # Add monthly contribution
-            year_end_balance += monthly_contribution
-            # Add monthly government contribution (distributed monthly)
-            year_end_balance += yearly_gov_contribution / 12
-            # Apply monthly interest
-            year_end_balance = year_end_balance * (1 + monthly_rate)
-        
-        accumulated_balance = year_end_balance
-        current_age_in_year = joining_age + year - 1
-        
-        yearly_breakdown.append({
-            'year': year,
-            'age': current_age_in_year,
-            'annual_contribution': yearly_contribution,
-            'gov_contribution': yearly_gov_contribution,
-            'total_invested': total_invested_so_far,
-            'investment_growth': accumulated_balance - total_invested_so_far - total_gov_contrib_so_far,
-            'balance': accumulated_balance
-        })
-        
-        # Monthly breakdown for this year
-        monthly_balance = year_start_balance
-        monthly_total_invested = total_invested_so_far - yearly_contribution
-        monthly_total_gov_contrib = total_gov_contrib_so_far - yearly_gov_contribution
-        
-        for month in range(1, 13):
-            # Add monthly amounts
-            monthly_balance += monthly_contribution
-            monthly_total_invested += monthly_contribution
-            
-            monthly_gov_contrib_this_month = yearly_gov_contribution / 12 if yearly_gov_contribution > 0 else 0
-            monthly_balance += monthly_gov_contrib_this_month
-            monthly_total_gov_contrib += monthly_gov_contrib_this_month
-            
-            # Apply monthly interest
-            monthly_balance = monthly_balance * (1 + monthly_rate)
-            
-            monthly_breakdown.append({
-                'year': year,
-                'month': month,
-                'month_name': month_names[month - 1],
-                'age': current_age_in_year,
-                'monthly_contribution': monthly_contribution,
-                'gov_contribution': monthly_gov_contrib_this_month,
-                'cumulative_investment': monthly_total_invested,
-                'investment_growth': monthly_balance - monthly_total_invested - monthly_total_gov_contrib,
-                'balance': monthly_balance
-            })
-    
-    return {
-        'joining_age': joining_age,
-        'pension_amount': pension_amount,
-        'expected_return_rate': expected_return_rate,
-        'investment_period': investment_period,
-        'monthly_contribution': round(monthly_contribution, 2),
-        'total_contribution': round(total_contribution, 2),
-        'gov_contribution': round(gov_contribution, 2),
-        'investment_growth': round(investment_growth, 2),
-        'total_corpus': round(total_corpus, 2),
-        'lump_sum': round(lump_sum, 2),
-        'yearly_breakdown': yearly_breakdown,
-        'monthly_breakdown': monthly_breakdown,
-        'pfrda_rate': expected_return_rate
-    }
-
-@app.route('/calculate-apy', methods=['POST'])
-def calculate_apy():
-    try:
-        data = request.get_json()
-        joining_age = int(data.get('joining_age', 25))
-        pension_amount = int(data.get('pension_amount', 3000))
-        
-        # Validate inputs
-        if joining_age < 18 or joining_age > 40:
-            return jsonify({'error': 'Age must be between 18 and 40 years'}), 400
-        if pension_amount not in [1000, 2000, 3000, 4000, 5000]:
-            return jsonify({'error': 'Pension amount must be ₹1000, ₹2000, ₹3000, ₹4000, or ₹5000'}), 400
-        
-        # Calculate APY returns
-        result = calculate_apy_returns(joining_age, pension_amount)
-        
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({'error': str(e)}), 400
-
-@app.route('/goal-sip-calculator/')
-def goal_sip_calculator():
-    return render_template('goal_sip_calculator.html')
-
-def calculate_goal_sip_returns(target_amount, expected_return, time_period, frequency):
-    """
-    Calculate Goal SIP returns
-    Goal SIP Features:
-    - Calculate required SIP amount to reach a target
-    - Multiple investment frequencies: Monthly, Quarterly, Half-yearly, Yearly
-    - Expected return rate adjustable from 1% to 30%
-    - Investment period from 1 to 50 years
-    """
-    
-    # Handle zero target amount case
-    if target_amount == 0:
-        return {
-            'target_amount': 0,
-            'expected_return': expected_return,
-            'time_period': time_period,
-            'frequency': frequency,
-            'required_sip': 0,
-            'total_investment': 0,
-            'wealth_gain': 0,
-            'yearly_breakdown': [],
-            'monthly_breakdown': []
-        }
-    
-    # Convert annual return to decimal
-    annual_rate = expected_return / 100
-    
-    # Calculate frequency multiplier
-    frequency_multiplier = {
-        'monthly': 12,
-        'quarterly': 4,
-        'half-yearly': 2,
-        'yearly': 1
-    }.get(frequency, 12)
-    
-    # Calculate periodic rate and number of payments
-    periodic_rate = annual_rate / frequency_multiplier
-    total_payments = time_period * frequency_multiplier
-    
-    # Calculate required SIP amount using Future Value of Annuity formula
-    # FV = PMT * [((1 + r)^n - 1) / r]
-    # PMT = FV / [((1 + r)^n - 1) / r]
-    
-    if periodic_rate == 0:
-        required_sip = target_amount / total_payments
-    else:
-        future_value_factor = (pow(1 + periodic_rate, total_payments) - 1) / periodic_rate
-        required_sip = target_amount / future_value_factor
-    
-    # Calculate total investment
-    total_investment = required_sip * total_payments
-    
-    # Calculate wealth gain
-    wealth_gain = target_amount - total_investment
-    
-    # Generate detailed breakdown (yearly and monthly)
-    yearly_breakdown = []
-    monthly_breakdown = []
-    
-    current_value = 0
-    total_invested_so_far = 0
-    
-    for year in range(1, time_period + 1):
-        year_start_value = current_value
-        year_start_invested = total_invested_so_far
-        
-        # Calculate monthly progression for this year
-        for month in range(1, 13):
-            # Check if investment is made this month based on frequency
-            monthly_investment = 0
-            if frequency == 'monthly':
-                monthly_investment = required_sip
-            elif frequency == 'quarterly' and month % 3 == 0:
-                monthly_investment = required_sip
-            elif frequency == 'half-yearly' and month % 6 == 0:
-                monthly_investment = required_sip
-            elif frequency == 'yearly' and month == 12:
-                monthly_investment = required_sip
-            
-            # Add investment
-            if monthly_investment > 0:
-                current_value += monthly_investment
-                total_invested_so_far += monthly_investment
-            
-            # Apply monthly growth
-            monthly_rate = periodic_rate / (12 / frequency_multiplier) if frequency_multiplier < 12 else periodic_rate
-            current_value = current_value * (1 + monthly_rate)
-            
-            # Store monthly data
-            monthly_breakdown.append({
-                'year': year,
-                'month': month,
-                'month_name': ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                              'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'][month-1],
-                'monthly_investment': monthly_investment,
-                'cumulative_investment': total_invested_so_far,
-                'balance': current_value
-            })
-        
-        # Store yearly data
-        yearly_investment = total_invested_so_far - year_start_invested
-        yearly_returns = current_value - total_invested_so_far
-        
-        yearly_breakdown.append({
-            'year': year,
-            'yearly_investment': yearly_investment,
-            'cumulative_investment': total_invested_so_far,
-            'returns': yearly_returns,
-            'total_value': current_value
-        })
-    
-    return {
-        'target_amount': target_amount,
-        'expected_return': expected_return,
-        'time_period': time_period,
-        'frequency': frequency,
-        'required_sip': round(required_sip, 2),
-        'total_investment': round(total_investment, 2),
-        'wealth_gain': round(wealth_gain, 2),
-        'yearly_breakdown': yearly_breakdown,
-        'monthly_breakdown': monthly_breakdown
-    }
-
-@app.route('/calculate-goal-sip', methods=['POST'])
-def calculate_goal_sip():
-    try:
-        data = request.get_json()
-        target_amount = float(data.get('target_amount', 2500000))
-        expected_return = float(data.get('expected_return', 12.0))
-        time_period = int(data.get('time_period', 10))
-        frequency = data.get('frequency', 'monthly')
-        
-        # Validate inputs
-        if target_amount < 0:
-            return jsonify({'error': 'Target amount cannot be negative'}), 400
-        if target_amount > 100000000:
-            return jsonify({'error': 'Target amount cannot exceed ₹10 Crores'}), 400
-        if expected_return < 1.0 or expected_return > 30.0:
-            return jsonify({'error': 'Expected return must be between 1% and 30%'}), 400
-        if time_period < 1 or time_period > 50:
-            return jsonify({'error': 'Investment period must be between 1 and 50 years'}), 400
-        if frequency not in ['monthly', 'quarterly', 'half-yearly', 'yearly']:
-            return jsonify({'error': 'Invalid frequency selected'}), 400
-        
-        # Calculate Goal SIP returns
-        result = calculate_goal_sip_returns(target_amount, expected_return, time_period, frequency)
-        
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({'error': str(e)}), 400
-
-@app.route('/inflation-calculator/')
-def inflation_calculator():
-    return render_template('inflation_calculator.html')
-
-@app.route('/ppf-calculator/')
-def ppf_calculator():
-    return render_template('ppf_calculator.html')
-
-@app.route('/ltcg-calculator/')
-def ltcg_calculator():
-    return render_template('ltcg_calculator.html')
-
-@app.route('/ulip-return-calculator/')
-def ulip_return_calculator():
-    return render_template('ulip_return_calculator.html')
-
-@app.route('/vacation-saving-planner-calculator/')
-def vacation_saving_planner_calculator():
-    return render_template('vacation_saving_planner_calculator.html')
-
-@app.route('/child-education-calculator/')
-def child_education_calculator():
-    return render_template('child_education_calculator.html')
-
-@app.route('/retirement-calculator/')
-def retirement_calculator():
-    return render_template('retirement_calculator.html')
-
-@app.route('/net-worth-calculator/')
-def net_worth_calculator():
-    return render_template('net_worth_calculator.html')
-
-@app.route('/rule-of-72-calculator/')
-def rule_of_72_calculator():
-    return render_template('rule_of_72_calculator.html')
-
-def calculate_ppf_returns(annual_contribution, duration_years, interest_rate, contribution_frequency):
-    """
-    Calculate PPF returns with compound interest
-    PPF compounds annually irrespective of contribution frequency
-    """
-    try:
-        # Validate inputs
-        if annual_contribution <= 0 or duration_years <= 0 or interest_rate < 0:
-            raise ValueError("Invalid input values")
-        
-        # PPF minimum duration is 15 years
-        if duration_years < 15:
-            raise ValueError("PPF minimum duration is 15 years")
-            
-        # PPF maximum contribution per year is ₹1,50,000
-        if annual_contribution > 150000:
-            raise ValueError("PPF maximum annual contribution is ₹1,50,000")
-            
-        # Total annual contribution is already calculated in frontend
-        total_annual_contribution = annual_contribution
-        
-        # PPF calculation with annual compounding
-        annual_rate = interest_rate / 100
-        total_investment = 0
-        maturity_value = 0
-        year_wise_data = []
-        
-        for year in range(1, duration_years + 1):
-            # Add annual contribution
-            total_investment += total_annual_contribution
-            
-            # Calculate interest on opening balance + contribution
-            # PPF interest is calculated on the minimum balance between 5th and last day of month
-            # For simplicity, we'll calculate interest on the full amount
-            opening_balance = maturity_value
-            closing_balance = (opening_balance + total_annual_contribution) * (1 + annual_rate)
-            
-            interest_earned = closing_balance - opening_balance - total_annual_contribution
-            maturity_value = closing_balance
-            
-            year_wise_data.append({
-                'year': year,
-                'annual_contribution': total_annual_contribution,
-                'opening_balance': round(opening_balance, 2),
-                'interest_earned': round(interest_earned, 2),
-                'closing_balance': round(closing_balance, 2),
-                'total_invested_till_date': round(total_investment, 2)
-            })
-        
-        total_interest = maturity_value - total_investment
-        
-        return {
-            'total_investment': round(total_investment, 2),
-            'total_interest': round(total_interest, 2),
-            'maturity_value': round(maturity_value, 2),
-            'investment_duration': duration_years,
-            'annual_contribution': total_annual_contribution,
-            'contribution_frequency': contribution_frequency,
-            'interest_rate': interest_rate,
-            'year_wise_data': year_wise_data
-        }
-        
-    except Exception as e:
-        raise Exception(f"Error calculating PPF returns: {str(e)}")
-
-@app.route('/calculate-child-education/', methods=['POST'])
-def calculate_child_education():
-    try:
-        data = request.get_json()
-        
-        current_age = int(data.get('current_age', 5))
-        college_age = int(data.get('college_age', 18))
-        current_cost = float(data.get('current_cost', 500000))
-        inflation_rate = float(data.get('inflation_rate', 6.0))
-        return_rate = float(data.get('return_rate', 12.0))
-        current_savings = float(data.get('current_savings', 0))
-        
-        # Calculate years until college
-        years_to_college = college_age - current_age
-        
-        if years_to_college <= 0:
-            return jsonify({
-                'error': 'College start age must be greater than current age'
-            }), 400
-        
-        # Calculate future cost with inflation
-        future_cost = current_cost * ((1 + inflation_rate / 100) ** years_to_college)
-        
-        # Calculate net amount needed after current savings
-        net_amount_needed = max(0, future_cost - current_savings)
-        
-        # Calculate monthly SIP required
-        monthly_rate = return_rate / 12 / 100
-        num_months = years_to_college * 12
-        
-        if monthly_rate > 0:
-            # PMT formula for monthly SIP
-            monthly_sip = net_amount_needed * monthly_rate / ((1 + monthly_rate) ** num_months - 1)
-        else:
-            monthly_sip = net_amount_needed / num_months
-        
-        # Calculate total investment required
-        total_investment = monthly_sip * num_months + current_savings
-        
-        result = {
-            'current_age': current_age,
-            'college_age': college_age,
-            'years_to_college': years_to_college,
-            'current_cost': current_cost,
-            'future_cost': round(future_cost),
-            'current_savings': current_savings,
-            'net_amount_needed': round(net_amount_needed),
-            'monthly_sip_required': round(monthly_sip),
-            'total_investment': round(total_investment),
-            'inflation_rate': inflation_rate,
-            'return_rate': return_rate
-        }
-        
-        return jsonify(result)
-        
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/calculate-ppf', methods=['POST'])
-def calculate_ppf_route():
-    try:
-        data = request.get_json()
-        
-        annual_contribution = float(data.get('annual_contribution', 0))
-        duration_years = int(data.get('duration_years', 15))
-        interest_rate = float(data.get('interest_rate', 7.1))
-        contribution_frequency = data.get('contribution_frequency', 'monthly')
-        
-        # Calculate PPF returns
-        result = calculate_ppf_returns(annual_contribution, duration_years, interest_rate, contribution_frequency)
-        
-        return jsonify({
-            'status': 'success',
-            **result
-        })
-        
-    except Exception as e:
-        return jsonify({'status': 'error', 'error': str(e)}), 400
-
-def calculate_ulip_returns(mode, tenure_years, expected_return, existing_investment, monthly_investment=0, periodic_topup=0, lump_sum=0):
-    """
-    Calculate ULIP returns with compound interest
-    Supports both regular and one-time investment modes
-    """
-    try:
-        # Validate inputs
-        if tenure_years <= 0 or expected_return < 0:
-            raise ValueError("Invalid input values")
-        
-        if tenure_years < 1 or tenure_years > 30:
-            raise ValueError("Investment tenure must be between 1 and 30 years")
-        
-        if expected_return < 1 or expected_return > 20:
-            raise ValueError("Expected return must be between 1% and 20%")
-        
-        # Convert annual% to monthly: r = (expectedReturn / 12) / 100
-        monthly_rate = (expected_return / 12) / 100
-        months = tenure_years * 12
-        
-        # Calculate contributions future value
-        if mode == "Regular Investment":
-            if monthly_investment <= 0:
-                raise ValueError("Monthly investment must be greater than 0 for regular investment mode")
-            
-            base_monthly = monthly_investment + periodic_topup
-            
-            # FV_contrib = baseMonthly * (((1 + r)^n - 1) / r) * (1 + r)   // annuity-due
-            if monthly_rate > 0:
-                fv_contrib = base_monthly * (((1 + monthly_rate) ** months - 1) / monthly_rate) * (1 + monthly_rate)
-            else:
-                fv_contrib = base_monthly * months
-            
-            total_invested = (monthly_investment + periodic_topup) * months + existing_investment
-            
-        else:  # One-time Investment
-            if lump_sum <= 0:
-                raise ValueError("Lump sum must be greater than 0 for one-time investment mode")
-            
-            # FV_contrib = lumpSum * (1 + r)^n
-            fv_contrib = lump_sum * ((1 + monthly_rate) ** months)
-            total_invested = lump_sum + existing_investment
-        
-        # Existing corpus growth: FV_existing = existingInvestment * (1 + r)^n
-        fv_existing = existing_investment * ((1 + monthly_rate) ** months)
-        
-        # Projected Maturity Value: FV_total = FV_contrib + FV_existing
-        projected_maturity_value = fv_contrib + fv_existing
-        
-        # Estimated Absolute Return (%)
-        absolute_return_pct = 0
-        if total_invested > 0:
-            absolute_return_pct = ((projected_maturity_value - total_invested) / total_invested) * 100
-        
-        # Create summary message
-        if mode == "Regular Investment":
-            investment_amount = monthly_investment + periodic_topup
-            frequency_text = "monthly"
-        else:
-            investment_amount = lump_sum
-            frequency_text = "one-time"
-        
-        summary_message = f"If you invest ₹{investment_amount:,.0f} {frequency_text} for {tenure_years} years at {expected_return}% p.a., you may get ₹{projected_maturity_value:,.0f}."
-        
-        return {
-            'projected_maturity_value': round(projected_maturity_value),
-            'total_invested': round(total_invested),
-            'absolute_return_pct': round(absolute_return_pct, 2),
-            'summary_message': summary_message,
-            'mode': mode,
-            'tenure_years': tenure_years,
-            'expected_return': expected_return,
-            'existing_investment': existing_investment,
-            'fv_contrib': round(fv_contrib),
-            'fv_existing': round(fv_existing)
-        }
-        
-    except Exception as e:
-        raise e
-
-@app.route('/calculate-ulip', methods=['POST'])
-def calculate_ulip_route():
-    try:
-        data = request.get_json()
-        
-        mode = data.get('mode', 'Regular Investment')
-        tenure_years = int(data.get('tenure_years', 15))
-        expected_return = float(data.get('expected_return', 10))
-        existing_investment = float(data.get('existing_investment', 0))
-        monthly_investment = float(data.get('monthly_investment', 0))
-        periodic_topup = float(data.get('periodic_topup', 0))
-        lump_sum = float(data.get('lump_sum', 0))
-        
-        # Calculate ULIP returns
-        result = calculate_ulip_returns(
-            mode, tenure_years, expected_return, existing_investment,
-            monthly_investment, periodic_topup, lump_sum
-        )
-        
-        return jsonify({
-            'status': 'success',
-            **result
-        })
-        
-    except Exception as e:
-        return jsonify({'status': 'error', 'error': str(e)}), 400
-
-def calculate_retirement_corpus_planning(current_age, retirement_age, life_expectancy, monthly_income_desired, inflation_rate, pre_retirement_return, post_retirement_return, current_savings):
-    """
-    Calculate retirement planning with corpus requirement and monthly savings needed
-    """
-    try:
-        # Validate inputs
-        if current_age <= 0 or retirement_age <= current_age or life_expectancy <= retirement_age:
-            raise ValueError("Invalid age inputs")
-        if monthly_income_desired <= 0 or inflation_rate < 0 or pre_retirement_return <= 0 or post_retirement_return <= 0:
-            raise ValueError("Invalid financial inputs")
-        if current_savings < 0:
-            raise ValueError("Current savings cannot be negative")
-        
-        # Calculate key variables
-        years_to_retirement = retirement_age - current_age
-        years_in_retirement = life_expectancy - retirement_age
-        
-        # Convert percentages to decimals
-        inflation_decimal = inflation_rate / 100
-        pre_retirement_decimal = pre_retirement_return / 100
-        post_retirement_decimal = post_retirement_return / 100
-        
-        # Step 1: Calculate inflated monthly income needed at retirement
-        inflated_monthly_income = monthly_income_desired * ((1 + inflation_decimal) ** years_to_retirement)
-        annual_retirement_income = inflated_monthly_income * 12
-        
-        # Step 2: Calculate corpus needed at retirement using annuity formula
-        # Present value of annuity formula: PV = PMT * [(1 - (1 + r)^-n) / r]
-        if post_retirement_decimal > 0:
-            corpus_needed = annual_retirement_income * ((1 - (1 + post_retirement_decimal) ** (-years_in_retirement)) / post_retirement_decimal)
-        else:
-            # If post-retirement return is 0, corpus = total income needed
-            corpus_needed = annual_retirement_income * years_in_retirement
-        
-        # Step 3: Calculate how much current savings will grow
-        future_value_current_savings = current_savings * ((1 + pre_retirement_decimal) ** years_to_retirement)
-        
-        # Step 4: Calculate additional corpus needed
-        additional_corpus_needed = max(0, corpus_needed - future_value_current_savings)
-        
-        # Step 5: Calculate monthly savings required using future value of annuity formula
-        # Future value of annuity formula: FV = PMT * [((1 + r)^n - 1) / r]
-        if additional_corpus_needed > 0 and pre_retirement_decimal > 0:
-            monthly_pre_retirement_return = pre_retirement_decimal / 12
-            total_months = years_to_retirement * 12
-            
-            if monthly_pre_retirement_return > 0:
-                monthly_savings_needed = additional_corpus_needed / (((1 + monthly_pre_retirement_return) ** total_months - 1) / monthly_pre_retirement_return)
-            else:
-                monthly_savings_needed = additional_corpus_needed / total_months
-        else:
-            monthly_savings_needed = 0
-        
-        # Calculate summary metrics
-        total_investment_needed = monthly_savings_needed * years_to_retirement * 12
-        
-        return {
-            'required_retirement_corpus': round(corpus_needed),
-            'monthly_savings_required': round(monthly_savings_needed),
-            'annual_retirement_income_needed': round(annual_retirement_income),
-            'inflated_monthly_income': round(inflated_monthly_income),
-            'years_to_retirement': years_to_retirement,
-            'years_in_retirement': years_in_retirement,
-            'future_value_current_savings': round(future_value_current_savings),
-            'additional_corpus_needed': round(additional_corpus_needed),
-            'total_investment_needed': round(total_investment_needed),
-            'current_age': current_age,
-            'retirement_age': retirement_age,
-            'life_expectancy': life_expectancy,
-            'monthly_income_desired': monthly_income_desired,
-            'inflation_rate': inflation_rate,
-            'pre_retirement_return': pre_retirement_return,
-            'post_retirement_return': post_retirement_return,
-            'current_savings': current_savings
-        }
-        
-    except Exception as e:
-        raise Exception(f"Error calculating retirement planning: {str(e)}")
-
-@app.route('/calculate-retirement', methods=['POST'])
-def calculate_retirement_route():
-    try:
-        data = request.get_json()
-        
-        current_age = int(data.get('current_age', 0))
-        retirement_age = int(data.get('retirement_age', 0))
-        life_expectancy = int(data.get('life_expectancy', 0))
-        monthly_income_desired = float(data.get('monthly_income_desired', 0))
-        inflation_rate = float(data.get('inflation_rate', 6))
-        pre_retirement_return = float(data.get('pre_retirement_return', 8))
-        post_retirement_return = float(data.get('post_retirement_return', 6))
-        current_savings = float(data.get('current_savings', 0))
-        
-        # Calculate retirement planning
-        result = calculate_retirement_corpus_planning(
-            current_age, retirement_age, life_expectancy, monthly_income_desired,
-            inflation_rate, pre_retirement_return, post_retirement_return, current_savings
-        )
-        
-        return jsonify({
-            'status': 'success',
-            **result
-        })
-        
-    except Exception as e:
-        return jsonify({'status': 'error', 'error': str(e)}), 400
-
-def calculate_rule_of_72_results(interest_rate=None, years_to_double=None):
-    """
-    Calculate Rule of 72 estimates and exact calculations
-    Rule of 72 formula: Years to double = 72 / interest_rate
-    Exact formula: Years to double = ln(2) / ln(1 + rate/100)
-    """
-    try:
-        import math
-        
-        results = {}
-        
-        if interest_rate is not None:
-            # Calculate years to double from interest rate
-            rule_of_72_years = 72 / interest_rate if interest_rate > 0 else 0
-            exact_years = math.log(2) / math.log(1 + interest_rate/100) if interest_rate > 0 else 0
-            
-            results['years_to_double_rule_72'] = round(rule_of_72_years, 2)
-            results['years_to_double_exact'] = round(exact_years, 2)
-            results['interest_rate'] = interest_rate
-            results['summary_message'] = f"At {interest_rate}% annual interest, your money will double in {round(rule_of_72_years, 1)} years (Rule of 72 estimate)."
-            
-        if years_to_double is not None:
-            # Calculate required interest rate from years to double
-            required_rate_rule_72 = 72 / years_to_double if years_to_double > 0 else 0
-            # Exact: rate = (2^(1/years) - 1) * 100
-            required_rate_exact = (math.pow(2, 1/years_to_double) - 1) * 100 if years_to_double > 0 else 0
-            
-            results['required_rate_rule_72'] = round(required_rate_rule_72, 2)
-            results['required_rate_exact'] = round(required_rate_exact, 2)
-            results['years_to_double'] = years_to_double
-            results['summary_message'] = f"To double your money in {years_to_double} years, you need an annual return of {round(required_rate_rule_72, 1)}% (Rule of 72 estimate)."
-            
-        # Calculate accuracy comparison
-        if interest_rate is not None and interest_rate > 0:
-            rule_72_accuracy = abs(rule_of_72_years - exact_years) / exact_years * 100
-            results['accuracy_percentage'] = round(100 - rule_72_accuracy, 1)
-            
-        return results
-        
-    except Exception as e:
-        raise Exception(f"Error calculating Rule of 72: {str(e)}")
-
-@app.route('/calculate-rule-of-72', methods=['POST'])
-def calculate_rule_of_72_route():
-    try:
-        data = request.get_json()
-        
-        interest_rate = data.get('interest_rate')
-        years_to_double = data.get('years_to_double')
-        
-        # Validate that at least one input is provided
-        if interest_rate is None and years_to_double is None:
-            return jsonify({'status': 'error', 'error': 'Please provide either interest rate or years to double'}), 400
-            
-        # Convert to float if provided
-        if interest_rate is not None:
-            interest_rate = float(interest_rate)
-            if interest_rate <= 0 or interest_rate > 100:
-                return jsonify({'status': 'error', 'error': 'Interest rate must be between 0.1% and 100%'}), 400
-                
-        if years_to_double is not None:
-            years_to_double = float(years_to_double)
-            if years_to_double <= 0 or years_to_double > 200:
-                return jsonify({'status': 'error', 'error': 'Years to double must be between 0.1 and 200 years'}), 400
-        
-        # Calculate Rule of 72 results
-        result = calculate_rule_of_72_results(interest_rate, years_to_double)
-        
-        return jsonify({
-            'status': 'success',
-            **result
-        })
-        
-    except Exception as e:
-        return jsonify({'status': 'error', 'error': str(e)}), 400
-
-@app.route('/rbi-floating-rate-savings-bonds-calculator/')
-def rbi_floating_rate_savings_bonds_calculator():
-    return render_template('rbi_floating_rate_savings_bonds_calculator.html')
-
-def calculate_rbi_floating_rate_bonds_returns(investment_amount, interest_rate, bond_tenure_years):
-    """
-    Calculate RBI Floating Rate Savings Bonds returns
-    Features:
-    - Fixed 7-year tenure
-    - Half-yearly interest payout
-    - Interest rate: currently 8.05% (floating, reset every 6 months)
-    - Interest paid every 6 months
-    - Principal returned at maturity
-    """
-    try:
-        # Validate inputs
-        if investment_amount < 1000:
-            raise ValueError("Minimum investment amount is ₹1,000")
-        
-        if bond_tenure_years != 7:
-            raise ValueError("RBI Floating Rate Savings Bonds have a fixed tenure of 7 years")
-        
-        if interest_rate <= 0 or interest_rate > 20:
-            raise ValueError("Interest rate must be between 0% and 20%")
-        
-        # Calculate returns
-        annual_interest_rate = interest_rate / 100
-        half_yearly_rate = annual_interest_rate / 2
-        
-        # Calculate interest amounts
-        total_interest_per_year = investment_amount * annual_interest_rate
-        half_yearly_payout = investment_amount * half_yearly_rate
-        total_interest_over_tenure = total_interest_per_year * bond_tenure_years
-        maturity_amount = investment_amount + total_interest_over_tenure
-        
-        # Generate year-wise and half-yearly breakdown
-        yearly_data = []
-        half_yearly_data = []
-        cumulative_interest = 0
-        
-        for year in range(1, bond_tenure_years + 1):
-            year_interest = total_interest_per_year
-            cumulative_interest += year_interest
-            
-            yearly_data.append({
-                'year': year,
-                'interest_earned': round(year_interest, 2),
-                'cumulative_interest': round(cumulative_interest, 2),
-                'principal_outstanding': investment_amount
-            })
-            
-            # Half-yearly breakdown for this year
-            for half_year in range(1, 3):
-                payout_number = (year - 1) * 2 + half_year
-                half_yearly_data.append({
-                    'payout_number': payout_number,
-                    'year': year,
-                    'half_year': half_year,
-                    'payout_amount': round(half_yearly_payout, 2),
-                    'cumulative_interest': round(payout_number * half_yearly_payout, 2)
-                })
-        
-        # Calculate next rate revision date (Jan 1 or Jul 1)
-        current_month = datetime.now().month
-        current_year = datetime.now().year
-        
-        if current_month <= 6:
-            next_revision_date = f"Jul 1, {current_year}"
-        else:
-            next_revision_date = f"Jan 1, {current_year + 1}"
-        
-        return {
-            'investment_amount': round(investment_amount, 2),
-            'interest_rate': interest_rate,
-            'bond_tenure_years': bond_tenure_years,
-            'total_interest_per_year': round(total_interest_per_year, 2),
-            'half_yearly_payout': round(half_yearly_payout, 2),
-            'total_interest_over_tenure': round(total_interest_over_tenure, 2),
-            'maturity_amount': round(maturity_amount, 2),
-            'yearly_data': yearly_data,
-            'half_yearly_data': half_yearly_data,
-            'next_revision_date': next_revision_date,
-            'summary_text': f"For an investment of ₹{round(investment_amount):,} at {interest_rate}% interest, you will receive ₹{round(half_yearly_payout):,} every 6 months for 7 years."
-        }
-        
-    except Exception as e:
-        raise Exception(f"Error calculating RBI bond returns: {str(e)}")
-
-@app.route('/calculate-rbi-floating-rate-bonds', methods=['POST'])
-def calculate_rbi_floating_rate_bonds_route():
-    try:
-        data = request.get_json()
-        
-        investment_amount = float(data.get('investment_amount', 0))
-        interest_rate = float(data.get('interest_rate', 8.05))
-        bond_tenure_years = int(data.get('bond_tenure_years', 7))
-        
-        # Calculate RBI bond returns
-        result = calculate_rbi_floating_rate_bonds_returns(investment_amount, interest_rate, bond_tenure_years)
-        
-        return jsonify({
-            'status': 'success',
-            **result
-        })
-        
-    except Exception as e:
-        return jsonify({'status': 'error', 'error': str(e)}), 400
-
-@app.route('/gold-sip-calculator/')
-def gold_sip_calculator():
-    return render_template('gold_sip_calculator.html')
-
-@app.route('/kisan-vikas-patra-calculator/')
-def kisan_vikas_patra_calculator():
-    return render_template('kisan_vikas_patra_calculator.html')
-
-def calculate_inflation_impact(current_amount, inflation_rate, time_period):
-    """
-    Calculate inflation impact on money
-    Features:
-    - Calculate future value needed to maintain purchasing power
-    - Show price increase due to inflation
-    """
-    
-    # Handle zero amount case
-    if current_amount == 0:
-        return {
-            'current_amount': 0,
-            'inflation_rate': inflation_rate,
-            'time_period': time_period,
-            'future_value': 0,
-            'purchasing_power_lost': 0,
-            'yearly_data': [],
-            'monthly_data': []
-        }
-    
-    # Convert percentages to decimal
-    inflation_decimal = inflation_rate / 100
-    
-    # Calculate future value needed to maintain purchasing power
-    future_value = current_amount * pow(1 + inflation_decimal, time_period)
-    
-    # Calculate purchasing power lost
-    purchasing_power_lost = future_value - current_amount
-    
-    # Generate yearly breakdown
-    yearly_data = []
-    for year in range(1, time_period + 1):
-        year_future_value = current_amount * pow(1 + inflation_decimal, year)
-        year_purchasing_power_lost = year_future_value - current_amount
-        
-        yearly_data.append({
-            'year': year,
-            'current_value': current_amount,
-            'future_value': year_future_value,
-            'purchasing_power_lost': year_purchasing_power_lost
-        })
-    
-    # Generate monthly breakdown
-    monthly_data = []
-    monthly_inflation_rate = inflation_decimal / 12
-    total_months = time_period * 12
-    
-    for month in range(1, total_months + 1):
-        month_future_value = current_amount * pow(1 + monthly_inflation_rate, month)
-        month_purchasing_power_lost = month_future_value - current_amount
-        
-        monthly_data.append({
-            'month': month,
-            'current_value': current_amount,
-            'future_value': month_future_value,
-            'purchasing_power_lost': month_purchasing_power_lost
-        })
-    
-    return {
-        'current_amount': current_amount,
-        'inflation_rate': inflation_rate,
-        'time_period': time_period,
-        'future_value': future_value,
-        'purchasing_power_lost': purchasing_power_lost,
-        'yearly_data': yearly_data,
-        'monthly_data': monthly_data
-    }
-
-@app.route('/calculate-inflation', methods=['POST'])
-def calculate_inflation():
-    try:
-        data = request.get_json()
-        current_amount = float(data.get('current_amount', 100000))
-        inflation_rate = float(data.get('inflation_rate', 6.0))
-        time_period = int(data.get('time_period', 10))
-        
-        # Validate inputs
-        if current_amount < 0:
-            return jsonify({'error': 'Current amount cannot be negative'}), 400
-        if current_amount > 100000000:
-            return jsonify({'error': 'Current amount cannot exceed ₹10 Crores'}), 400
-        if inflation_rate < 0.0 or inflation_rate > 15.0:
-            return jsonify({'error': 'Inflation rate must be between 0% and 15%'}), 400
-        if time_period < 1 or time_period > 50:
-            return jsonify({'error': 'Time period must be between 1 and 50 years'}), 400
-        
-        # Calculate inflation impact
-        result = calculate_inflation_impact(current_amount, inflation_rate, time_period)
-        
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({'error': str(e)}), 400
-
-def calculate_gold_sip_returns(target_gold_amount, current_gold_price, expected_return, time_period, frequency):
-    """
-    Calculate Gold SIP returns
-    Gold SIP Features:
-    - Calculate required SIP amount to reach a target gold amount (in grams)
-    - Multiple investment frequencies: Monthly, Quarterly, Half-yearly, Yearly
-    - Expected gold appreciation rate adjustable from 1% to 25%
-    - Investment period from 1 to 50 years
-    """
-    
-    # Handle zero target amount case
-    if target_gold_amount == 0 or current_gold_price == 0:
-        return {
-            'target_gold_amount': 0,
-            'current_gold_price': current_gold_price,
-            'expected_return': expected_return,
-            'time_period': time_period,
-            'frequency': frequency,
-            'required_sip_amount': 0,
-            'total_investment': 0,
-            'wealth_gain': 0,
-            'final_gold_value': 0,
-            'yearly_data': [],
-            'monthly_data': []
-        }
-    
-    # Calculate target value in rupees at current price
-    target_amount = target_gold_amount * current_gold_price
-    
-    # Convert annual return to decimal
-    annual_rate = expected_return / 100
-    
-    # Calculate frequency multiplier
-    frequency_multiplier = {
-        'monthly': 12,
-        'quarterly': 4,
-        'half-yearly': 2,
-        'yearly': 1
-    }.get(frequency, 12)
-    
-    # Calculate periodic rate and number of payments
-    periodic_rate = annual_rate / frequency_multiplier
-    total_payments = time_period * frequency_multiplier
-    
-    # Calculate required SIP amount using Future Value of Annuity formula
-    if periodic_rate == 0:
-        required_sip = target_amount / total_payments
-    else:
-        future_value_factor = (pow(1 + periodic_rate, total_payments) - 1) / periodic_rate
-        required_sip = target_amount / future_value_factor
-    
-    # Calculate total investment
-    total_investment = required_sip * total_payments
-    
-    # Calculate wealth gain
-    wealth_gain = target_amount - total_investment
-    
-    # Calculate final gold value based on appreciation
-    final_gold_price = current_gold_price * pow(1 + annual_rate, time_period)
-    final_gold_value = target_gold_amount * final_gold_price
-    
-    # Generate detailed breakdown (yearly and monthly)
-    yearly_data = []
-    monthly_data = []
-    
-    current_gold_accumulated = 0
-    total_invested_so_far = 0
-    
-    for year in range(1, time_period + 1):
-        year_start_gold = current_gold_accumulated
-        year_start_invested = total_invested_so_far
-        
-        # Calculate gold price for this year
-        gold_price_this_year = current_gold_price * pow(1 + annual_rate, year - 1)
-        
-        # Calculate monthly progression for this year
-        for month in range(1, 13):
-            # Check if investment is made this month based on frequency
-            monthly_investment = 0
-            if frequency == 'monthly':
-                monthly_investment = required_sip
-            elif frequency == 'quarterly' and month % 3 == 0:
-                monthly_investment = required_sip
-            elif frequency == 'half-yearly' and month % 6 == 0:
-                monthly_investment = required_sip
-            elif frequency == 'yearly' and month == 12:
-                monthly_investment = required_sip
-            
-            # Calculate gold bought this month
-            gold_bought_this_month = 0
-            if monthly_investment > 0:
-                # Gold price for this specific month
-                month_factor = (month - 1) / 12.0
-                gold_price_this_month = current_gold_price * pow(1 + annual_rate, year - 1 + month_factor)
-                gold_bought_this_month = monthly_investment / gold_price_this_month
-                current_gold_accumulated += gold_bought_this_month
-                total_invested_so_far += monthly_investment
-            
-            # Calculate current value
-            current_month_gold_price = current_gold_price * pow(1 + annual_rate, year - 1 + (month - 1) / 12.0)
-            current_value = current_gold_accumulated * current_month_gold_price
-            
-            # Store monthly data
-            monthly_data.append({
-                'year': year,
-                'month': ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                         'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'][month-1],
-                'sip_amount': monthly_investment,
-                'gold_price': round(current_month_gold_price, 2),
-                'gold_bought': round(gold_bought_this_month, 3),
-                'total_gold': round(current_gold_accumulated, 2),
-                'value': round(current_value, 2)
-            })
-        
-        # Store yearly data
-        year_end_gold_price = current_gold_price * pow(1 + annual_rate, year)
-        yearly_investment = total_invested_so_far - year_start_invested
-        gold_accumulated_this_year = current_gold_accumulated - year_start_gold
-        total_value = current_gold_accumulated * year_end_gold_price
-        
-        yearly_data.append({
-            'year': year,
-            'investment': round(yearly_investment, 2),
-            'gold_accumulated': round(current_gold_accumulated, 2),
-            'gold_price': round(year_end_gold_price, 2),
-            'total_value': round(total_value, 2)
-        })
-    
-    return {
-        'target_gold_amount': target_gold_amount,
-        'current_gold_price': current_gold_price,
-        'expected_return': expected_return,
-        'time_period': time_period,
-        'frequency': frequency,
-        'required_sip_amount': round(required_sip, 2),
-        'total_investment': round(total_investment, 2),
-        'wealth_gain': round(wealth_gain, 2),
-        'final_gold_value': round(final_gold_value, 2),
-        'final_gold_price': round(final_gold_price, 2),
-        'yearly_data': yearly_data,
-        'monthly_data': monthly_data
-    }
-
-@app.route('/calculate-gold-sip', methods=['POST'])
-def calculate_gold_sip():
-    try:
-        data = request.get_json()
-        target_gold_amount = float(data.get('target_gold_amount', 500))
-        current_gold_price = float(data.get('current_gold_price', 6500))
-        expected_return = float(data.get('expected_return', 10.0))
-        time_period = int(data.get('time_period', 10))
-        frequency = data.get('frequency', 'monthly')
-        
-        # Validate inputs
-        if target_gold_amount < 1:
-            return jsonify({'error': 'Target gold amount must be at least 1 gram'}), 400
-        if target_gold_amount > 10000:
-            return jsonify({'error': 'Target gold amount cannot exceed 10,000 grams'}), 400
-        if current_gold_price < 1000 or current_gold_price > 20000:
-            return jsonify({'error': 'Gold price must be between ₹1,000 and ₹20,000 per gram'}), 400
-        if expected_return < 1.0 or expected_return > 25.0:
-            return jsonify({'error': 'Expected return must be between 1% and 25%'}), 400
-        if time_period < 1 or time_period > 50:
-            return jsonify({'error': 'Investment period must be between 1 and 50 years'}), 400
-        if frequency not in ['monthly', 'quarterly', 'half-yearly', 'yearly']:
-            return jsonify({'error': 'Invalid frequency selected'}), 400
-        
-        # Calculate Gold SIP returns
-        result = calculate_gold_sip_returns(target_gold_amount, current_gold_price, expected_return, time_period, frequency)
-        
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({'error': str(e)}), 400
-
-def calculate_kvp_returns(investment_amount, interest_rate, maturity_years=None, lock_in_period=2.5):
-    """
-    Calculate Kisan Vikas Patra returns
-    KVP Features:
-    - Government savings scheme that doubles the investment
-    - Current interest rate around 7.5% per annum (compounded annually)
-    - Fixed maturity period when investment doubles
-    - Minimum investment: ₹1,000
-    - No maximum investment limit
-    """
-    
-    # Handle zero investment case
-    if investment_amount == 0:
-        return {
-            'investment_amount': 0,
-            'interest_rate': interest_rate,
-            'maturity_years': 0,
-            'maturity_amount': 0,
-            'total_interest': 0,
-            'doubling_period': 0,
-            'yearly_data': [],
-            'monthly_data': []
-        }
-    
-    # Convert interest rate to decimal
-    annual_rate = interest_rate / 100
-    
-    # Calculate doubling period if not provided
-    if maturity_years is None:
-        # Using Rule of 72 or precise calculation: ln(2)/ln(1+r)
-        doubling_period = math.log(2) / math.log(1 + annual_rate)
-        maturity_years = round(doubling_period, 1)
-    else:
-        doubling_period = maturity_years
-    
-    # For KVP, the investment always doubles at maturity
-    maturity_amount = investment_amount * 2
-    
-    # Calculate value at lock-in period (partial growth)
-    lock_in_amount = investment_amount * pow(1 + annual_rate, lock_in_period)
-    
-    # Calculate total interest earned (which is always equal to principal in KVP)
-    total_interest = maturity_amount - investment_amount
-    lock_in_interest = lock_in_amount - investment_amount
-    
-    # Generate yearly breakdown - showing progression to doubling
-    yearly_data = []
-    for year in range(1, int(maturity_years) + 2):  # +2 to show final year
-        if year <= maturity_years:
-            # For KVP, calculate gradual progression towards doubling
-            if year >= maturity_years:
-                # At maturity, amount is exactly double
-                year_amount = investment_amount * 2
-            else:
-                # Progressive growth using compound interest during the period
-                year_amount = investment_amount * pow(1 + annual_rate, year)
-            
-            year_interest = year_amount - investment_amount
-            yearly_data.append({
-                'year': year,
-                'amount': round(year_amount, 2),
-                'interest_earned': round(year_interest, 2),
-                'interest_rate': interest_rate
-            })
-    
-    # Generate monthly breakdown for first 2 years to show progression
-    monthly_data = []
-    for year in range(1, min(3, int(maturity_years) + 1)):  # Show first 2 years monthly
-        for month in range(1, 13):
-            months_elapsed = (year - 1) * 12 + month
-            months_factor = months_elapsed / 12.0
-            month_amount = investment_amount * pow(1 + annual_rate, months_factor)
-            month_interest = month_amount - investment_amount
-            
-            monthly_data.append({
-                'year': year,
-                'month': ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                         'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'][month-1],
-                'amount': round(month_amount, 2),
-                'interest_earned': round(month_interest, 2)
-            })
-    
-    # Calculate maturity date (assuming investment starts today)
-    from datetime import datetime, timedelta
-    import calendar
-    
-    today = datetime.now()
-    # Calculate maturity date by adding years and days
-    years_to_add = int(maturity_years)
-    days_to_add = int((maturity_years - years_to_add) * 365.25)  # Account for leap years
-    
-    try:
-        maturity_date = today.replace(year=today.year + years_to_add)
-        maturity_date = maturity_date + timedelta(days=days_to_add)
-    except ValueError:
-        # Handle leap year edge case (Feb 29)
-        maturity_date = today.replace(year=today.year + years_to_add, month=2, day=28)
-        maturity_date = maturity_date + timedelta(days=days_to_add)
-    
-    # Calculate lock-in date
-    lock_in_years_to_add = int(lock_in_period)
-    lock_in_days_to_add = int((lock_in_period - lock_in_years_to_add) * 365.25)
-    
-    try:
-        lock_in_date = today.replace(year=today.year + lock_in_years_to_add)
-        lock_in_date = lock_in_date + timedelta(days=lock_in_days_to_add)
-    except ValueError:
-        # Handle leap year edge case (Feb 29)
-        lock_in_date = today.replace(year=today.year + lock_in_years_to_add, month=2, day=28)
-        lock_in_date = lock_in_date + timedelta(days=lock_in_days_to_add)
-    
-    # Format dates
-    maturity_date_formatted = maturity_date.strftime("%b %Y")
-    lock_in_date_formatted = lock_in_date.strftime("%b %Y")
-    
-    return {
-        'investment_amount': investment_amount,
-        'interest_rate': interest_rate,
-        'maturity_years': round(maturity_years, 1),
-        'lock_in_period': lock_in_period,
-        'maturity_amount': round(maturity_amount, 2),
-        'lock_in_amount': round(lock_in_amount, 2),
-        'total_interest': round(total_interest, 2),
-        'lock_in_interest': round(lock_in_interest, 2),
-        'doubling_period': round(doubling_period, 1),
-        'maturity_date': maturity_date_formatted,
-        'lock_in_date': lock_in_date_formatted,
-        'maturity_date_full': maturity_date.strftime("%d %B %Y"),
-        'yearly_data': yearly_data,
-        'monthly_data': monthly_data
-    }
-
-@app.route('/calculate-kvp', methods=['POST'])
-def calculate_kvp():
-    try:
-        data = request.get_json()
-        investment_amount = float(data.get('investment_amount', 50000))
-        interest_rate = float(data.get('interest_rate', 7.5))
-        maturity_years = data.get('maturity_years', None)
-        lock_in_period = float(data.get('lock_in_period', 2.5))
-        if maturity_years is not None:
-            maturity_years = float(maturity_years)
-        
-        # Validate inputs
-        if investment_amount < 1000:
-            return jsonify({'error': 'Minimum investment amount is ₹1,000'}), 400
-        if investment_amount > 100000000:
-            return jsonify({'error': 'Investment amount cannot exceed ₹10 Crores'}), 400
-        if interest_rate < 1.0 or interest_rate > 15.0:
-            return jsonify({'error': 'Interest rate must be between 1% and 15%'}), 400
-        if maturity_years is not None and (maturity_years < 1 or maturity_years > 50):
-            return jsonify({'error': 'Maturity period must be between 1 and 50 years'}), 400
-        if lock_in_period < 1 or lock_in_period > 10:
-            return jsonify({'error': 'Lock-in period must be between 1 and 10 years'}), 400
-        
-        # Calculate KVP returns
-        result = calculate_kvp_returns(investment_amount, interest_rate, maturity_years, lock_in_period)
-        
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({'error': str(e)}), 400
-
-@app.route('/national-savings-certificate-calculator/')
-def national_savings_certificate_calculator():
-    return render_template('national_savings_certificate_calculator.html')
-
-def calculate_nsc_returns(investment_amount, interest_rate):
-    """
-    Calculate National Savings Certificate (NSC) returns
-    NSC Features:
-    - Government savings scheme with fixed interest rate
-    - Fixed tenure of 5 years (not flexible)
-    - Interest compounded annually but paid at maturity
-    - Tax benefits under Section 80C up to ₹1.5 lakh
-    - Minimum investment: ₹1,000 (can also be ₹100)
-    - No maximum investment limit
-    """
-    
-    # NSC has a fixed tenure of 5 years
-    tenure_years = 5
-    
-    # Handle zero investment case
-    if investment_amount == 0:
-        return {
-            'investment_amount': 0,
-            'interest_rate': interest_rate,
-            'tenure_years': tenure_years,
-            'maturity_amount': 0,
-            'total_interest': 0,
-            'tax_benefit': 0,
-            'yearly_data': [],
-            'monthly_data': []
-        }
-    
-    # Convert interest rate to decimal
-    annual_rate = interest_rate / 100
-    
-    # Calculate maturity amount using compound interest formula
-    maturity_amount = investment_amount * pow(1 + annual_rate, tenure_years)
-    
-    # Calculate total interest earned
-    total_interest = maturity_amount - investment_amount
-    
-    # Calculate tax benefit (80C allows deduction up to ₹1.5 lakh)
-    max_80c_limit = 150000
-    tax_benefit_amount = min(investment_amount, max_80c_limit)
-    
-    # Generate yearly breakdown for all 5 years
-    yearly_data = []
-    cumulative_amount = investment_amount
-    for year in range(1, tenure_years + 1):
-        # Calculate amount at end of this year
-        year_end_amount = investment_amount * pow(1 + annual_rate, year)
-        year_interest = year_end_amount - cumulative_amount
-        cumulative_interest = year_end_amount - investment_amount
-        
-        yearly_data.append({
-            'year': year,
-            'opening_balance': round(cumulative_amount, 2),
-            'interest_earned': round(year_interest, 2),
-            'closing_balance': round(year_end_amount, 2),
-            'cumulative_interest': round(cumulative_interest, 2)
-        })
-        cumulative_amount = year_end_amount
-    
-    # Generate monthly breakdown for first 2 years to show progression
-    monthly_data = []
-    for year in range(1, min(3, tenure_years + 1)):  # Show first 2 years monthly
-        for month in range(1, 13):
-            months_elapsed = (year - 1) * 12 + month
-            months_factor = months_elapsed / 12.0
-            month_amount = investment_amount * pow(1 + annual_rate, months_factor)
-            month_interest = month_amount - investment_amount
-            
-            monthly_data.append({
-                'year': year,
-                'month': ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                         'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'][month-1],
-                'amount': round(month_amount, 2),
-                'interest_earned': round(month_interest, 2)
-            })
-    
-    # Calculate maturity date (assuming investment starts today)
-    from datetime import datetime, timedelta
-    import calendar
-    
-    today = datetime.now()
-    try:
-        maturity_date = today.replace(year=today.year + tenure_years)
-    except ValueError:
-        # Handle leap year edge case (Feb 29)
-        maturity_date = today.replace(year=today.year + tenure_years, month=2, day=28)
-    
-    # Format dates
-    maturity_date_formatted = maturity_date.strftime("%b %Y")
-    
-    return {
-        'investment_amount': investment_amount,
-        'interest_rate': interest_rate,
-        'tenure_years': tenure_years,
-        'maturity_amount': round(maturity_amount, 2),
-        'total_interest': round(total_interest, 2),
-        'tax_benefit': round(tax_benefit_amount, 2),
-        'maturity_date': maturity_date_formatted,
-        'maturity_date_full': maturity_date.strftime("%d %B %Y"),
-        'yearly_data': yearly_data,
-        'monthly_data': monthly_data
-    }
-
-@app.route('/calculate-nsc', methods=['POST'])
-def calculate_nsc():
-    try:
-        data = request.get_json()
-        investment_amount = float(data.get('investment_amount', 50000))
-        interest_rate = float(data.get('interest_rate', 6.8))
-        # tenure_years is not needed as NSC has fixed 5-year tenure
-        
-        # Validate inputs
-        if investment_amount < 100:
-            return jsonify({'error': 'Minimum investment amount is ₹100'}), 400
-        if investment_amount > 100000000:
-            return jsonify({'error': 'Investment amount cannot exceed ₹10 Crores'}), 400
-        if interest_rate < 1.0 or interest_rate > 15.0:
-            return jsonify({'error': 'Interest rate must be between 1% and 15%'}), 400
-        
-        # Calculate NSC returns (fixed 5-year tenure)
-        result = calculate_nsc_returns(investment_amount, interest_rate)
-        
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({'error': str(e)}), 400
-
-def calculate_goal_sip_with_inflation_and_tax_returns(present_goal_value, years_to_goal, inflation_rate, expected_return, tax_rate, compounding_frequency='monthly'):
-    """
-    Calculate Goal-based SIP with inflation and tax considerations
-    """
-    
-    # Step 1: Calculate inflation-adjusted goal value
-    inflation_adjusted_goal = present_goal_value * pow(1 + inflation_rate / 100, years_to_goal)
-    
-    # Step 2: Calculate net post-tax return
-    net_post_tax_return = expected_return - (expected_return * tax_rate / 100)
-    
-    # Step 3: Calculate required SIP amount
-    # Use the inflation-adjusted goal as the target amount
-    frequency_multiplier = {
-        'monthly': 12,
-        'quarterly': 4,
-        'half-yearly': 2,
-        'yearly': 1
-    }.get(compounding_frequency, 12)
-    
-    periodic_rate = net_post_tax_return / (100 * frequency_multiplier)
-    total_payments = years_to_goal * frequency_multiplier
-    
-    if periodic_rate == 0:
-        required_sip = inflation_adjusted_goal / total_payments
-    else:
-        future_value_factor = (pow(1 + periodic_rate, total_payments) - 1) / periodic_rate
-        required_sip = inflation_adjusted_goal / future_value_factor
-    
-    # Step 4: Calculate total invested and maturity value
-    total_invested = required_sip * total_payments
-    maturity_value = inflation_adjusted_goal
-    
-    # Step 5: Calculate gain
-    gain = maturity_value - total_invested
-    
-    # Step 6: Calculate year-wise breakdown
-    yearly_breakdown = []
-    current_value = 0
-    total_invested_so_far = 0
-    
-    for year in range(1, years_to_goal + 1):
-        year_start_value = current_value
-        year_start_invested = total_invested_so_far
-        
-        # Calculate yearly progression
-        if compounding_frequency == 'monthly':
-            yearly_investment = required_sip * 12
-            for month in range(12):
-                current_value += required_sip
-                total_invested_so_far += required_sip
-                current_value = current_value * (1 + periodic_rate)
-        elif compounding_frequency == 'quarterly':
-            yearly_investment = required_sip * 4
-            for quarter in range(4):
-                current_value += required_sip
-                total_invested_so_far += required_sip
-                current_value = current_value * (1 + periodic_rate)
-        elif compounding_frequency == 'half-yearly':
-            yearly_investment = required_sip * 2
-            for half_year in range(2):
-                current_value += required_sip
-                total_invested_so_far += required_sip
-                current_value = current_value * (1 + periodic_rate)
-        elif compounding_frequency == 'yearly':
-            yearly_investment = required_sip
-            current_value += required_sip
-            total_invested_so_far += required_sip
-            current_value = current_value * (1 + periodic_rate)
-        
-        yearly_breakdown.append({
-            'year': year,
-            'yearly_investment': yearly_investment,
-            'cumulative_investment': total_invested_so_far,
-            'portfolio_value': current_value,
-            'gains': current_value - total_invested_so_far
-        })
-    
-    return {
-        'present_goal_value': present_goal_value,
-        'years_to_goal': years_to_goal,
-        'inflation_rate': inflation_rate,
-        'expected_return': expected_return,
-        'tax_rate': tax_rate,
-        'compounding_frequency': compounding_frequency,
-        'inflation_adjusted_goal': round(inflation_adjusted_goal, 2),
-        'net_post_tax_return': round(net_post_tax_return, 2),
-        'monthly_sip_required': round(required_sip if compounding_frequency == 'monthly' else required_sip * frequency_multiplier / 12, 2),
-        'total_invested': round(total_invested, 2),
-        'maturity_value': round(maturity_value, 2),
-        'gain': round(gain, 2),
-        'yearly_breakdown': yearly_breakdown
-    }
-
-@app.route('/calculate-goal-sip-with-inflation-and-tax', methods=['POST'])
-def calculate_goal_sip_with_inflation_and_tax_route():
-    try:
-        data = request.get_json()
-        present_goal_value = float(data.get('present_goal_value', 500000))
-        years_to_goal = int(data.get('years_to_goal', 15))
-        inflation_rate = float(data.get('inflation_rate', 6.0))
-        expected_return = float(data.get('expected_return', 12.0))
-        tax_rate = float(data.get('tax_rate', 10.0))
-        compounding_frequency = data.get('compounding_frequency', 'monthly')
-        
-        # Validate inputs
-        if present_goal_value <= 0:
-            return jsonify({'error': 'Present goal value must be greater than 0'}), 400
-        if present_goal_value > 100000000:
-            return jsonify({'error': 'Present goal value cannot exceed ₹10 Crores'}), 400
-        if years_to_goal <= 0 or years_to_goal > 50:
-            return jsonify({'error': 'Years to goal must be between 1 and 50'}), 400
-        if inflation_rate < 0 or inflation_rate > 25:
-            return jsonify({'error': 'Inflation rate must be between 0% and 25%'}), 400
-        if expected_return < 1 or expected_return > 30:
-            return jsonify({'error': 'Expected return must be between 1% and 30%'}), 400
-        if tax_rate < 0 or tax_rate > 50:
-            return jsonify({'error': 'Tax rate must be between 0% and 50%'}), 400
-        if compounding_frequency not in ['monthly', 'quarterly', 'half-yearly', 'yearly']:
-            return jsonify({'error': 'Invalid compounding frequency'}), 400
-        
-        # Calculate Goal-based SIP with inflation and tax
-        result = calculate_goal_sip_with_inflation_and_tax_returns(
-            present_goal_value, years_to_goal, inflation_rate, 
-            expected_return, tax_rate, compounding_frequency
-        )
-        
-        return jsonify({'status': 'success', **result})
-    except Exception as e:
-        return jsonify({'status': 'error', 'error': str(e)}), 400
-
-@app.route('/floating-interest-rate-emi-calculator/')
-def floating_interest_rate_emi_calculator():
-    return render_template('floating_interest_rate_emi_calculator.html')
-
-def calculate_floating_interest_rate_emi(principal, initial_rate, revised_rate, transition_year, tenure_years):
-    """
-    Calculate Floating Interest Rate EMI with rate change during loan tenure
-    """
-    total_months = tenure_years * 12
-    transition_month = transition_year * 12
-    
-    # Calculate initial EMI based on initial interest rate for full tenure
-    initial_monthly_rate = initial_rate / (12 * 100)
-    if initial_monthly_rate == 0:
-        initial_emi = principal / total_months
-    else:
-        initial_emi = principal * initial_monthly_rate * ((1 + initial_monthly_rate) ** total_months) / (((1 + initial_monthly_rate) ** total_months) - 1)
-    
-    # Calculate outstanding balance at transition point
-    outstanding_at_transition = principal
-    total_interest_paid = 0
-    
-    # Calculate payments before rate change
-    for month in range(1, min(transition_month + 1, total_months + 1)):
-        interest_payment = outstanding_at_transition * initial_monthly_rate
-        principal_payment = initial_emi - interest_payment
-        outstanding_at_transition -= principal_payment
-        total_interest_paid += interest_payment
-        
-        if outstanding_at_transition <= 0:
-            break
-    
-    # If loan is not fully paid, calculate new EMI for remaining tenure
-    if outstanding_at_transition > 0 and transition_month < total_months:
-        remaining_months = total_months - transition_month
-        revised_monthly_rate = revised_rate / (12 * 100)
-        
-        if revised_monthly_rate == 0:
-            revised_emi = outstanding_at_transition / remaining_months
-        else:
-            revised_emi = outstanding_at_transition * revised_monthly_rate * ((1 + revised_monthly_rate) ** remaining_months) / (((1 + revised_monthly_rate) ** remaining_months) - 1)
-        
-        # Calculate remaining interest
-        remaining_interest = (revised_emi * remaining_months) - outstanding_at_transition
-        total_interest_paid += remaining_interest
-    else:
-        revised_emi = initial_emi
-    
-    total_amount = principal + total_interest_paid
-    
-    return {
-        'principal': principal,
-        'initial_rate': initial_rate,
-        'revised_rate': revised_rate,
-        'transition_year': transition_year,
-        'tenure_years': tenure_years,
-        'initial_emi': round(initial_emi, 2),
-        'revised_emi': round(revised_emi, 2),
-        'total_interest': round(total_interest_paid, 2),
-        'total_amount': round(total_amount, 2),
-        'outstanding_at_transition': round(max(0, outstanding_at_transition), 2)
-    }
-
-def generate_floating_interest_rate_emi_schedule(principal, initial_rate, revised_rate, transition_year, tenure_years, start_year=2025):
-    """
-    Generate yearly amortization schedule for floating interest rate EMI
-    """
-    total_months = tenure_years * 12
-    transition_month = transition_year * 12
-    
-    # Calculate initial EMI
-    initial_monthly_rate = initial_rate / (12 * 100)
-    if initial_monthly_rate == 0:
-        initial_emi = principal / total_months
-    else:
-        initial_emi = principal * initial_monthly_rate * ((1 + initial_monthly_rate) ** total_months) / (((1 + initial_monthly_rate) ** total_months) - 1)
-    
-    yearly_schedule = []
-    remaining_principal = principal
-    current_year = start_year
-    month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                   'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-    
-    total_months_processed = 0
-    current_month = 0
-    
-    while total_months_processed < total_months and remaining_principal > 0:
-        year_principal = 0
-        year_interest = 0
-        year_payments = 0
-        monthly_data = []
-        
-        # Calculate months for this year
-        months_to_process = min(12, total_months - total_months_processed)
-        
-        for month_idx in range(months_to_process):
-            if total_months_processed >= total_months or remaining_principal <= 0:
-                break
-                
-            total_months_processed += 1
-            
-            # Determine which rate to use
-            if total_months_processed <= transition_month:
-                current_rate = initial_monthly_rate
-                current_emi = initial_emi
-            else:
-                # Recalculate EMI for remaining tenure if this is the first month after transition
-                if total_months_processed == transition_month + 1:
-                    remaining_months = total_months - transition_month
-                    revised_monthly_rate = revised_rate / (12 * 100)
-                    
-                    if revised_monthly_rate == 0:
-                        revised_emi = remaining_principal / remaining_months
-                    else:
-                        revised_emi = remaining_principal * revised_monthly_rate * ((1 + revised_monthly_rate) ** remaining_months) / (((1 + revised_monthly_rate) ** remaining_months) - 1)
-                    
-                    current_emi = revised_emi
-                
-                current_rate = revised_rate / (12 * 100)
-            
-            interest_payment = remaining_principal * current_rate
-            principal_payment = min(current_emi - interest_payment, remaining_principal)
-            
-            year_principal += principal_payment
-            year_interest += interest_payment
-            year_payments += (principal_payment + interest_payment)
-            
-            remaining_principal -= principal_payment
-            
-            # Calculate loan paid percentage for this month
-            loan_paid_percentage = ((principal - remaining_principal) / principal) * 100
-            
-            # Get the correct month name
-            month_name = month_names[(current_month + month_idx) % 12]
-            
-            # Store monthly data
-            monthly_data.append({
-                'month': month_name,
-                'principal': round(principal_payment, 2),
-                'interest': round(interest_payment, 2),
-                'total_payment': round(principal_payment + interest_payment, 2),
-                'balance': round(max(0, remaining_principal), 2),
-                'loan_paid_percentage': round(loan_paid_percentage, 2),
-                'rate_used': round(current_rate * 12 * 100, 2)
-            })
-        
-        # Calculate loan paid percentage for the year
-        loan_paid_percentage = ((principal - remaining_principal) / principal) * 100
-        
-        yearly_schedule.append({
-            'year': current_year,
-            'principal': round(year_principal, 2),
-            'interest': round(year_interest, 2),
-            'total_payment': round(year_payments, 2),
-            'balance': round(max(0, remaining_principal), 2),
-            'loan_paid_percentage': round(loan_paid_percentage, 2),
-            'months_in_year': months_to_process,
-            'monthly_data': monthly_data
-        })
-        
-        # Move to next year
-        current_year += 1
-        current_month = 0
-        
-        # Stop if loan is fully paid
-        if remaining_principal <= 0.01:  # Small threshold for rounding errors
-            break
-    
-    return yearly_schedule
-
-@app.route('/calculate-floating-interest-rate-emi', methods=['POST'])
-def calculate_floating_interest_rate_emi_route():
-    try:
-        data = request.get_json()
-        principal = float(data.get('loanAmount', 1000000))
-        initial_rate = float(data.get('initialRate', 10.0))
-        revised_rate = float(data.get('revisedRate', 12.0))
-        transition_year = int(data.get('transitionYear', 3))
-        tenure_years = int(data.get('tenureYears', 15))
-        
-        # Validate inputs
-        if principal < 1000 or principal > 50000000:
-            return jsonify({'status': 'error', 'error': 'Loan amount must be between ₹1,000 and ₹5 Crores'}), 400
-        if initial_rate < 0.1 or initial_rate > 36:
-            return jsonify({'status': 'error', 'error': 'Initial interest rate must be between 0.1% and 36%'}), 400
-        if revised_rate < 0.1 or revised_rate > 36:
-            return jsonify({'status': 'error', 'error': 'Revised interest rate must be between 0.1% and 36%'}), 400
-        if transition_year < 1 or transition_year > tenure_years:
-            return jsonify({'status': 'error', 'error': 'Transition year must be between 1 and loan tenure'}), 400
-        if tenure_years < 1 or tenure_years > 30:
-            return jsonify({'status': 'error', 'error': 'Loan tenure must be between 1 and 30 years'}), 400
-        
-        # Calculate floating interest rate EMI
-        result = calculate_floating_interest_rate_emi(principal, initial_rate, revised_rate, transition_year, tenure_years)
-        
-        # Generate balance schedule
-        balance_schedule = generate_floating_interest_rate_emi_schedule(principal, initial_rate, revised_rate, transition_year, tenure_years)
-        
-        result['balanceSchedule'] = balance_schedule
-        
-        return jsonify({'status': 'success', **result})
-    except Exception as e:
-        return jsonify({'status': 'error', 'error': str(e)}), 400
-    
-
-# Add this route to your existing app.py file
-
-@app.route('/rd-vs-sip-calculator/')
-def rd_vs_sip_calculator():
-    return render_template('rd_vs_sip_calculator.html')
-
-def calculate_rd_returns(monthly_amount, duration_years, annual_rate, compounding_frequency):
-    """
-    Calculate RD (Recurring Deposit) maturity returns
-    Formula: A = P × [(1 + r/n)^(nt) - 1] / (r/n) × (1 + r/n)
-    """
-    months = duration_years * 12
-    
-    # Compounding frequency mapping
-    frequency_map = {
-        'monthly': 12,
-        'quarterly': 4,
-        'annually': 1
-    }
-    
-    n = frequency_map.get(compounding_frequency, 12)
-    r = annual_rate / 100
-    
-    if r == 0:
-        maturity_value = monthly_amount * months
-        total_invested = monthly_amount * months
-        interest_earned = 0
-    else:
-        # RD calculation with compound interest
-        rate_per_period = r / n
-        total_periods = duration_years * n
-        
-        # Calculate maturity value using RD formula
-        compound_factor = ((1 + rate_per_period) ** total_periods - 1) / rate_per_period
-        maturity_value = monthly_amount * (12 / n) * compound_factor * (1 + rate_per_period)
-        
-        total_invested = monthly_amount * months
-        interest_earned = maturity_value - total_invested
-    
-    return {
-        'maturity_value': round(maturity_value, 2),
-        'total_invested': round(total_invested, 2),
-        'interest_earned': round(interest_earned, 2)
-    }
-
-def calculate_basic_sip_returns(monthly_amount, duration_years, expected_return):
-    """
-    Calculate SIP (Systematic Investment Plan) returns
-    Formula: FV = P × [((1 + r)^n - 1) / r] × (1 + r)
-    """
-    months = duration_years * 12
-    monthly_rate = expected_return / (12 * 100)
-    
-    if monthly_rate == 0:
-        maturity_value = monthly_amount * months
-        total_invested = monthly_amount * months
-        gains_earned = 0
-    else:
-        # SIP calculation
-        maturity_value = monthly_amount * (((1 + monthly_rate) ** months - 1) / monthly_rate) * (1 + monthly_rate)
-        total_invested = monthly_amount * months
-        gains_earned = maturity_value - total_invested
-    
-    return {
-        'maturity_value': round(maturity_value, 2),
-        'total_invested': round(total_invested, 2),
-        'gains_earned': round(gains_earned, 2)
-    }
-
-@app.route('/calculate-rd-vs-sip', methods=['POST'])
-def calculate_rd_vs_sip():
-    try:
-        data = request.get_json()
-        
-        # RD inputs
-        rd_amount = float(data.get('rdAmount', 5000))
-        rd_duration = int(data.get('rdDuration', 5))
-        rd_rate = float(data.get('rdRate', 6.5))
-        rd_compounding = data.get('rdCompounding', 'quarterly')
-        
-        # SIP inputs
-        sip_amount = float(data.get('sipAmount', 5000))
-        sip_duration = int(data.get('sipDuration', 5))
-        sip_return = float(data.get('sipReturn', 12))
-        
-        # Validate inputs
-        if rd_amount < 100 or rd_amount > 1000000:
-            return jsonify({'error': 'RD amount must be between ₹100 and ₹10,00,000'}), 400
-        if sip_amount < 100 or sip_amount > 1000000:
-            return jsonify({'error': 'SIP amount must be between ₹100 and ₹10,00,000'}), 400
-        if rd_duration < 1 or rd_duration > 30:
-            return jsonify({'error': 'Duration must be between 1 and 30 years'}), 400
-        if sip_duration < 1 or sip_duration > 30:
-            return jsonify({'error': 'Duration must be between 1 and 30 years'}), 400
-        if rd_rate < 1 or rd_rate > 20:
-            return jsonify({'error': 'RD interest rate must be between 1% and 20%'}), 400
-        if sip_return < 1 or sip_return > 30:
-            return jsonify({'error': 'SIP expected return must be between 1% and 30%'}), 400
-        
-        # Calculate returns
-        rd_results = calculate_rd_returns(rd_amount, rd_duration, rd_rate, rd_compounding)
-        sip_results = calculate_basic_sip_returns(sip_amount, sip_duration, sip_return)
-        
-        # Calculate comparison metrics
-        rd_invested = rd_results['total_invested']
-        sip_invested = sip_results['total_invested']
-        rd_maturity = rd_results['maturity_value']
-        sip_maturity = sip_results['maturity_value']
-        
-        difference_amount = sip_maturity - rd_maturity
-        if rd_maturity > 0:
-            percentage_gain = ((sip_maturity - rd_maturity) / rd_maturity) * 100
-        else:
-            percentage_gain = 0
-        
-        return jsonify({
-            'status': 'success',
-            'rd': rd_results,
-            'sip': sip_results,
-            'comparison': {
-                'difference_amount': round(difference_amount, 2),
-                'percentage_gain': round(percentage_gain, 2),
-                'better_option': 'SIP' if sip_maturity > rd_maturity else 'RD'
-            }
-        })
-    
-    except Exception as e:
-        return jsonify({'status': 'error', 'error': str(e)}), 400
-
-
-
-# PPF vs SIP Calculator Flask Routes
-# Add these routes and functions to your app.py file
-
-
-@app.route('/ppf-vs-sip-calculator/')
-def ppf_vs_sip_calculator():
-    return render_template('ppf_vs_sip_calculator.html')
-
-@app.route('/nps-vs-sip-calculator/')
-def nps_vs_sip_calculator():
-    return render_template('nps_vs_sip_calculator.html')
-
-@app.route('/ulip-vs-sip-calculator/')
-def ulip_vs_sip_calculator():
-    return render_template('ulip_vs_sip_calculator.html')
-
-@app.route('/calculate-ppf-vs-sip-comparison', methods=['POST'])
-def calculate_ppf_vs_sip_comparison():
-    try:
-        data = request.get_json()
-        
-        # Extract input parameters
-        ppf_annual_amount = float(data.get('ppfAnnualAmount', 150000))
-        ppf_interest_rate = float(data.get('ppfInterestRate', 7.1))
-        sip_monthly_amount = float(data.get('sipMonthlyAmount', 12500))
-        sip_return_rate = float(data.get('sipReturnRate', 12.0))
-        duration_years = int(data.get('duration', 15))
-        
-        # Calculate PPF returns
-        ppf_result = calculate_ppf_returns_backend(ppf_annual_amount, ppf_interest_rate, duration_years)
-        
-        # Calculate SIP returns
-        sip_result = calculate_sip_returns_backend(sip_monthly_amount, sip_return_rate, duration_years)
-        
-        # Compare results
-        comparison = compare_ppf_sip_results(ppf_result, sip_result, duration_years)
-        
-        return jsonify({
-            'status': 'success',
-            'ppf': ppf_result,
-            'sip': sip_result,
-            'comparison': comparison
-        })
-        
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        }), 400
-
-def calculate_ppf_returns_backend(annual_amount, interest_rate, duration_years):
-    """
-    Calculate PPF returns with compound interest
-    PPF compounds annually and has a 15-year lock-in period
-    """
-    try:
-        annual_rate = interest_rate / 100
-        total_invested = 0
-        maturity_value = 0
-        yearly_breakdown = []
-        
-        for year in range(1, duration_years + 1):
-            total_invested += annual_amount
-            
-            # PPF compounds annually
-            if year == 1:
-                maturity_value = annual_amount * (1 + annual_rate)
-            else:
-                maturity_value = (maturity_value + annual_amount) * (1 + annual_rate)
-            
-            interest_earned = maturity_value - total_invested
-            
-            yearly_breakdown.append({
-                'year': year,
-                'invested': round(total_invested, 2),
-                'interest': round(interest_earned, 2),
-                'balance': round(maturity_value, 2)
-            })
-        
-        net_gain = maturity_value - total_invested
-        total_return = (net_gain / total_invested) * 100 if total_invested > 0 else 0
-        
-        return {
-            'totalInvested': round(total_invested, 2),
-            'maturityValue': round(maturity_value, 2),
-            'netGain': round(net_gain, 2),
-            'totalReturn': round(total_return, 2),
-            'annualReturn': interest_rate,
-            'yearlyBreakdown': yearly_breakdown,
-            'investmentType': 'PPF'
-        }
-        
-    except Exception as e:
-        raise Exception(f"Error calculating PPF returns: {str(e)}")
-
-def calculate_sip_returns_backend(monthly_amount, annual_return_rate, duration_years):
-    """
-    Calculate SIP returns using compound interest formula
-    Each monthly investment compounds for the remaining period
-    """
-    try:
-        monthly_rate = annual_return_rate / (12 * 100)
-        total_months = duration_years * 12
-        
-        total_invested = 0
-        maturity_value = 0
-        monthly_breakdown = []
-        yearly_breakdown = []
-        
-        # Calculate monthly SIP returns
-        for month in range(1, total_months + 1):
-            total_invested += monthly_amount
-            
-            # Each SIP installment compounds for remaining months
-            if month == 1:
-                maturity_value = monthly_amount
-            else:
-                maturity_value = (maturity_value * (1 + monthly_rate)) + monthly_amount
-            
-            monthly_breakdown.append({
-                'month': month,
-                'invested': round(total_invested, 2),
-                'balance': round(maturity_value, 2)
-            })
-            
-            # Create yearly breakdown
-            if month % 12 == 0:
-                year = month // 12
-                returns_earned = maturity_value - total_invested
-                
-                yearly_breakdown.append({
-                    'year': year,
-                    'invested': round(total_invested, 2),
-                    'returns': round(returns_earned, 2),
-                    'balance': round(maturity_value, 2)
-                })
-        
-        # Handle partial year if needed
-        if total_months % 12 != 0:
-            year = math.ceil(total_months / 12)
-            returns_earned = maturity_value - total_invested
-            
-            yearly_breakdown.append({
-                'year': year,
-                'invested': round(total_invested, 2),
-                'returns': round(returns_earned, 2),
-                'balance': round(maturity_value, 2)
-            })
-        
-        net_gain = maturity_value - total_invested
-        total_return = (net_gain / total_invested) * 100 if total_invested > 0 else 0
-        
-        return {
-            'totalInvested': round(total_invested, 2),
-            'maturityValue': round(maturity_value, 2),
-            'netGain': round(net_gain, 2),
-            'totalReturn': round(total_return, 2),
-            'annualReturn': annual_return_rate,
-            'yearlyBreakdown': yearly_breakdown,
-            'monthlyBreakdown': monthly_breakdown,
-            'investmentType': 'SIP'
-        }
-        
-    except Exception as e:
-        raise Exception(f"Error calculating SIP returns: {str(e)}")
-
-def compare_ppf_sip_results(ppf_result, sip_result, duration_years):
-    """
-    Compare PPF and SIP results and generate detailed comparison
-    """
-    try:
-        # Basic comparison metrics
-        maturity_difference = abs(sip_result['maturityValue'] - ppf_result['maturityValue'])
-        better_option = 'SIP' if sip_result['maturityValue'] > ppf_result['maturityValue'] else 'PPF'
-        
-        # Calculate advantage percentage
-        higher_value = max(sip_result['maturityValue'], ppf_result['maturityValue'])
-        lower_value = min(sip_result['maturityValue'], ppf_result['maturityValue'])
-        advantage_percentage = ((higher_value - lower_value) / lower_value) * 100 if lower_value > 0 else 0
-        
-        # Create year-wise comparison
-        yearly_breakdown = []
-        for year in range(1, duration_years + 1):
-            # Find PPF data for this year
-            ppf_data = next((item for item in ppf_result['yearlyBreakdown'] if item['year'] == year), {})
-            
-            # Find SIP data for this year
-            sip_data = next((item for item in sip_result['yearlyBreakdown'] if item['year'] == year), {})
-            
-            ppf_balance = ppf_data.get('balance', 0)
-            sip_balance = sip_data.get('balance', 0)
-            
-            year_better_option = 'SIP' if sip_balance > ppf_balance else 'PPF'
-            year_advantage = abs(sip_balance - ppf_balance)
-            
-            yearly_breakdown.append({
-                'year': year,
-                'ppf': {
-                    'invested': ppf_data.get('invested', 0),
-                    'interest': ppf_data.get('interest', 0),
-                    'balance': ppf_balance
-                },
-                'sip': {
-                    'invested': sip_data.get('invested', 0),
-                    'returns': sip_data.get('returns', 0),
-                    'balance': sip_balance
-                },
-                'betterOption': year_better_option,
-                'advantage': round(year_advantage, 2)
-            })
-        
-        # Calculate additional metrics
-        ppf_cagr = calculate_cagr(ppf_result['totalInvested'], ppf_result['maturityValue'], duration_years)
-        sip_cagr = calculate_cagr(sip_result['totalInvested'], sip_result['maturityValue'], duration_years)
-        
-        return {
-            'maturityDifference': round(maturity_difference, 2),
-            'betterOption': better_option,
-            'advantagePercentage': round(advantage_percentage, 2),
-            'yearlyBreakdown': yearly_breakdown,
-            'ppfCagr': round(ppf_cagr, 2),
-            'sipCagr': round(sip_cagr, 2),
-            'investmentComparison': {
-                'ppfTotalInvested': ppf_result['totalInvested'],
-                'sipTotalInvested': sip_result['totalInvested'],
-                'investmentDifference': abs(ppf_result['totalInvested'] - sip_result['totalInvested'])
-            }
-        }
-        
-    except Exception as e:
-        raise Exception(f"Error comparing results: {str(e)}")
-
-def calculate_cagr(initial_value, final_value, years):
-    """
-    Calculate Compound Annual Growth Rate (CAGR)
-    CAGR = (Final Value / Initial Value)^(1/years) - 1
-    """
-    try:
-        if initial_value <= 0 or final_value <= 0 or years <= 0:
-            return 0
-        
-        cagr = (pow(final_value / initial_value, 1 / years) - 1) * 100
-        return cagr
-        
-    except Exception as e:
-        return 0
-
-# Additional utility functions for PPF vs SIP calculations
-
-def calculate_ppf_extended_returns(annual_amount, interest_rate, duration_years, extension_years=0):
-    """
-    Calculate PPF returns with optional extension beyond 15 years
-    PPF can be extended in blocks of 5 years after initial 15-year period
-    """
-    try:
-        total_duration = duration_years + extension_years
-        
-        # Initial PPF calculation for base period
-        base_result = calculate_ppf_returns_backend(annual_amount, interest_rate, duration_years)
-        
-        if extension_years == 0:
-            return base_result
-        
-        # Extension period calculation (only interest compounds, no new investments)
-        extended_value = base_result['maturityValue']
-        annual_rate = interest_rate / 100
-        
-        for year in range(extension_years):
-            extended_value *= (1 + annual_rate)
-        
-        extended_result = base_result.copy()
-        extended_result['maturityValue'] = round(extended_value, 2)
-        extended_result['netGain'] = round(extended_value - base_result['totalInvested'], 2)
-        extended_result['totalReturn'] = round(((extended_value - base_result['totalInvested']) / base_result['totalInvested']) * 100, 2)
-        
-        return extended_result
-        
-    except Exception as e:
-        raise Exception(f"Error calculating extended PPF returns: {str(e)}")
-
-def calculate_tax_impact_comparison(ppf_result, sip_result, tax_rate=0):
-    """
-    Calculate tax impact on PPF vs SIP returns
-    PPF is tax-free (EEE status), SIP may have capital gains tax
-    """
-    try:
-        # PPF is completely tax-free
-        ppf_post_tax = ppf_result.copy()
-        
-        # SIP may have tax on gains (LTCG/STCG)
-        sip_post_tax = sip_result.copy()
-        
-        if tax_rate > 0:
-            # Apply tax on SIP gains
-            sip_tax_amount = sip_result['netGain'] * (tax_rate / 100)
-            sip_post_tax['netGain'] = round(sip_result['netGain'] - sip_tax_amount, 2)
-            sip_post_tax['maturityValue'] = round(sip_result['totalInvested'] + sip_post_tax['netGain'], 2)
-            sip_post_tax['totalReturn'] = round((sip_post_tax['netGain'] / sip_result['totalInvested']) * 100, 2)
-        
-        return {
-            'ppfPostTax': ppf_post_tax,
-            'sipPostTax': sip_post_tax,
-            'taxSavings': round((sip_result['netGain'] - sip_post_tax['netGain']), 2) if tax_rate > 0 else 0
-        }
-        
-    except Exception as e:
-        raise Exception(f"Error calculating tax impact: {str(e)}")
-
-
-
-# Add this route to your existing app.py file
-
-@app.route('/fd-vs-sip-calculator/')
-def fd_vs_sip_calculator():
-    return render_template('fd_vs_sip_calculator.html')
-
-def calculate_fd_returns(monthly_investment, duration_years, interest_rate, compounding_frequency):
-    """
-    Calculate Fixed Deposit returns with compound interest
-    """
-    try:
-        # Convert to monthly investment to total investment
-        total_investment = monthly_investment * 12 * duration_years
-        
-        # Determine compounding periods per year
-        if compounding_frequency == 'monthly':
-            n = 12
-        elif compounding_frequency == 'quarterly':
-            n = 4
-        elif compounding_frequency == 'annually':
-            n = 1
-        else:
-            n = 4  # default to quarterly
-        
-        # Convert annual rate to decimal
-        r = interest_rate / 100
-        
-        # Calculate compound interest: A = P(1 + r/n)^(nt)
-        maturity_value = total_investment * ((1 + r/n) ** (n * duration_years))
-        
-        # Calculate interest earned
-        interest_earned = maturity_value - total_investment
-        
-        return {
-            'total_invested': round(total_investment, 2),
-            'maturity_value': round(maturity_value, 2),
-            'interest_earned': round(interest_earned, 2),
-            'interest_rate': interest_rate,
-            'duration_years': duration_years,
-            'compounding_frequency': compounding_frequency
-        }
-    
-    except Exception as e:
-        return {
-            'error': str(e)
-        }
-
-def calculate_sip_returns_fd_comparison(monthly_sip, duration_years, expected_cagr):
-    """
-    Calculate SIP returns for FD comparison with monthly compounding
-    """
-    try:
-        # Convert annual CAGR to monthly rate
-        monthly_rate = (expected_cagr / 100) / 12
-        
-        # Total number of months
-        total_months = duration_years * 12
-        
-        # Calculate future value of SIP using FV formula
-        # FV = SIP * [((1 + r)^n - 1) / r] * (1 + r)
-        if monthly_rate == 0:
-            estimated_value = monthly_sip * total_months
-        else:
-            estimated_value = monthly_sip * (((1 + monthly_rate) ** total_months - 1) / monthly_rate) * (1 + monthly_rate)
-        
-        # Calculate total investment
-        total_invested = monthly_sip * total_months
-        
-        # Calculate gains
-        gain_from_sip = estimated_value - total_invested
-        
-        return {
-            'total_invested': round(total_invested, 2),
-            'estimated_value': round(estimated_value, 2),
-            'gain_from_sip': round(gain_from_sip, 2),
-            'expected_cagr': expected_cagr,
-            'duration_years': duration_years
-        }
-    
-    except Exception as e:
-        return {
-            'error': str(e)
-        }
-
-@app.route('/calculate-fd-vs-sip', methods=['POST'])
-def calculate_fd_vs_sip():
-    try:
-        data = request.get_json()
-        
-        # FD inputs
-        fd_monthly_investment = float(data.get('fdMonthlyInvestment', 5000))
-        fd_duration_years = int(data.get('fdDurationYears', 5))
-        fd_interest_rate = float(data.get('fdInterestRate', 6.5))
-        fd_compounding_frequency = data.get('fdCompoundingFrequency', 'quarterly')
-        
-        # SIP inputs
-        sip_monthly_amount = float(data.get('sipMonthlyAmount', 5000))
-        sip_duration_years = int(data.get('sipDurationYears', 5))
-        sip_expected_cagr = float(data.get('sipExpectedCagr', 12))
-        
-        # Validate inputs
-        if (fd_monthly_investment <= 0 or fd_duration_years <= 0 or fd_interest_rate < 0 or
-            sip_monthly_amount <= 0 or sip_duration_years <= 0 or sip_expected_cagr < 0):
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid input values. Please check all fields.'
-            })
-        
-        # Calculate FD returns
-        fd_results = calculate_fd_returns(
-            fd_monthly_investment, fd_duration_years, fd_interest_rate, fd_compounding_frequency
-        )
-        
-        # Calculate SIP returns
-        sip_results = calculate_sip_returns_fd_comparison(
-            sip_monthly_amount, sip_duration_years, sip_expected_cagr
-        )
-        
-        # Check for calculation errors
-        if 'error' in fd_results or 'error' in sip_results:
-            return jsonify({
-                'status': 'error',
-                'error': fd_results.get('error', sip_results.get('error', 'Calculation error'))
-            })
-        
-        # Compare results
-        fd_final_value = fd_results['maturity_value']
-        sip_final_value = sip_results['estimated_value']
-        
-        if fd_final_value > sip_final_value:
-            better_option = 'FD'
-            difference = fd_final_value - sip_final_value
-        elif sip_final_value > fd_final_value:
-            better_option = 'SIP'
-            difference = sip_final_value - fd_final_value
-        else:
-            better_option = 'Equal'
-            difference = 0
-        
-        # Calculate percentage difference
-        if fd_final_value > 0:
-            percentage_difference = (difference / min(fd_final_value, sip_final_value)) * 100
-        else:
-            percentage_difference = 0
-        
-        return jsonify({
-            'status': 'success',
-            'fd_results': fd_results,
-            'sip_results': sip_results,
-            'comparison': {
-                'better_option': better_option,
-                'difference': round(difference, 2),
-                'percentage_difference': round(percentage_difference, 2)
-            }
-        })
-    
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-@app.route('/rd-vs-fd-vs-sip-calculator/')
-def rd_vs_fd_vs_sip_calculator():
-    return render_template('rd_vs_fd_vs_sip_calculator.html')
-
-@app.route('/calculate-rd-vs-fd-vs-sip', methods=['POST'])
-def calculate_rd_vs_fd_vs_sip():
-    try:
-        data = request.get_json()
-        
-        # Common inputs
-        tenure_years = int(data.get('tenureYears', 5))
-        
-        # RD inputs
-        rd_monthly_deposit = float(data.get('rdMonthlyDeposit', 5000))
-        rd_annual_rate = float(data.get('rdAnnualRate', 6.8))
-        
-        # FD inputs
-        fd_type = data.get('fdType', 'lumpsum')
-        fd_lump_sum = float(data.get('fdLumpSum', 300000))
-        fd_annual_rate = float(data.get('fdAnnualRate', 7.0))
-        fd_compounding = data.get('fdCompounding', 'quarterly')
-        
-        # SIP inputs
-        sip_monthly_investment = float(data.get('sipMonthlyInvestment', 5000))
-        sip_expected_return = float(data.get('sipExpectedReturn', 12.0))
-        
-        # Advanced options
-        show_cagr = data.get('showCagr', False)
-        add_tax = data.get('addTax', False)
-        
-        # Validate inputs
-        if (tenure_years <= 0 or rd_monthly_deposit <= 0 or rd_annual_rate < 0 or
-            fd_lump_sum <= 0 or fd_annual_rate < 0 or sip_monthly_investment <= 0 or
-            sip_expected_return < 0):
-            return jsonify({
-                'status': 'error',
-                'error': 'Invalid input values. Please check all fields.'
-            })
-        
-        # Calculate RD returns (quarterly compounding)
-        rd_results = calculate_rd_vs_fd_vs_sip_rd(rd_monthly_deposit, rd_annual_rate, tenure_years)
-        
-        # Determine FD investment amount
-        if fd_type == 'match':
-            # Match with RD total investment
-            fd_investment = rd_monthly_deposit * 12 * tenure_years
-        else:
-            fd_investment = fd_lump_sum
-        
-        # Calculate FD returns
-        fd_results = calculate_rd_vs_fd_vs_sip_fd(fd_investment, fd_annual_rate, tenure_years, fd_compounding)
-        
-        # Calculate SIP returns
-        sip_results = calculate_rd_vs_fd_vs_sip_sip(sip_monthly_investment, sip_expected_return, tenure_years)
-        
-        # Add effective CAGR if requested
-        if show_cagr:
-            rd_results['effective_cagr'] = calculate_effective_cagr(rd_results['total_invested'], rd_results['maturity_value'], tenure_years)
-            fd_results['effective_cagr'] = calculate_effective_cagr(fd_results['total_invested'], fd_results['maturity_value'], tenure_years)
-            sip_results['effective_cagr'] = calculate_effective_cagr(sip_results['total_invested'], sip_results['maturity_value'], tenure_years)
-        
-        # Determine ranking
-        results = [
-            {'type': 'RD', 'value': rd_results['maturity_value']},
-            {'type': 'FD', 'value': fd_results['maturity_value']},
-            {'type': 'SIP', 'value': sip_results['maturity_value']}
-        ]
-        results.sort(key=lambda x: x['value'], reverse=True)
-        ranking = [result['type'] for result in results]
-        
-        return jsonify({
-            'status': 'success',
-            'rd_results': rd_results,
-            'fd_results': fd_results,
-            'sip_results': sip_results,
-            'ranking': ranking,
-            'tenure_years': tenure_years
-        })
-    
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-def calculate_rd_vs_fd_vs_sip_rd(monthly_deposit, annual_rate, years):
-    """Calculate RD returns with quarterly compounding"""
-    quarterly_rate = annual_rate / 400  # Convert to quarterly rate
-    total_quarters = years * 4
-    
-    # RD formula: M = R * ((1+i)^n - 1) / (1 - (1+i)^(-1/3))
-    if quarterly_rate == 0:
-        maturity_value = monthly_deposit * 12 * years
-    else:
-        numerator = (1 + quarterly_rate) ** total_quarters - 1
-        denominator = 1 - (1 + quarterly_rate) ** (-1/3)
-        maturity_value = monthly_deposit * (numerator / denominator)
-    
-    total_invested = monthly_deposit * 12 * years
-    interest_earned = maturity_value - total_invested
-    
-    return {
-        'total_invested': round(total_invested),
-        'maturity_value': round(maturity_value),
-        'interest_earned': round(interest_earned)
-    }
-
-def calculate_rd_vs_fd_vs_sip_fd(principal, annual_rate, years, compounding):
-    """Calculate FD returns with specified compounding"""
-    compounding_frequency = {
-        'annual': 1,
-        'halfyearly': 2,
-        'quarterly': 4,
-        'monthly': 12
-    }.get(compounding, 4)
-    
-    rate = annual_rate / 100
-    maturity_value = principal * (1 + rate / compounding_frequency) ** (compounding_frequency * years)
-    interest_earned = maturity_value - principal
-    
-    return {
-        'total_invested': round(principal),
-        'maturity_value': round(maturity_value),
-        'interest_earned': round(interest_earned)
-    }
-
-def calculate_rd_vs_fd_vs_sip_sip(monthly_investment, expected_return, years):
-    """Calculate SIP returns using annuity-due formula"""
-    monthly_rate = expected_return / 12 / 100
-    total_months = years * 12
-    
-    if monthly_rate == 0:
-        maturity_value = monthly_investment * total_months
-    else:
-        # Annuity-due formula
-        numerator = (1 + monthly_rate) ** total_months - 1
-        maturity_value = monthly_investment * (numerator / monthly_rate) * (1 + monthly_rate)
-    
-    total_invested = monthly_investment * total_months
-    gains_earned = maturity_value - total_invested
-    
-    return {
-        'total_invested': round(total_invested),
-        'maturity_value': round(maturity_value),
-        'gains_earned': round(gains_earned)
-    }
-
-def calculate_effective_cagr(initial_amount, final_amount, years):
-    """Calculate effective CAGR"""
-    if initial_amount <= 0 or years <= 0:
-        return 0
-    return ((final_amount / initial_amount) ** (1 / years) - 1) * 100
-
-
-
-# Add this route to your app.py file
-
-@app.route('/sip-calculator-vs-interest-calculator/')
-def sip_calculator_vs_interest_calculator():
-    return render_template('sip_calculator_vs_interest_calculator.html')
-
-# Add this calculation function to your app.py file
-def calculate_sip_vs_interest_comparison(sip_amount, sip_years, sip_return, principal_amount, interest_years, interest_rate, compounding_frequency):
-    """
-    Calculate SIP vs Interest Calculator comparison
-    """
-    try:
-        # SIP Calculations
-        monthly_rate = sip_return / (12 * 100)
-        total_months = sip_years * 12
-        
-        # SIP Future Value using standard SIP formula
-        if monthly_rate > 0:
-            sip_maturity = sip_amount * (((1 + monthly_rate) ** total_months - 1) / monthly_rate) * (1 + monthly_rate)
-        else:
-            sip_maturity = sip_amount * total_months
-        
-        sip_invested = sip_amount * total_months
-        sip_gain = sip_maturity - sip_invested
-        
-        # Interest/FD Calculations
-        annual_rate = interest_rate / 100
-        interest_years_actual = interest_years
-        
-        # Compounding frequency mapping
-        frequency_map = {
-            'monthly': 12,
-            'quarterly': 4,
-            'annually': 1
-        }
-        
-        frequency = frequency_map.get(compounding_frequency, 4)
-        
-        # Compound Interest Formula: A = P(1 + r/n)^(nt)
-        interest_maturity = principal_amount * ((1 + annual_rate / frequency) ** (frequency * interest_years_actual))
-        interest_earned = interest_maturity - principal_amount
-        
-        # Comparison Analysis
-        better_option = "SIP" if sip_maturity > interest_maturity else "Interest Calculator"
-        return_difference = abs(sip_maturity - interest_maturity)
-        
-        # Calculate year-wise breakdown for chart
-        yearly_breakdown = []
-        for year in range(1, max(sip_years, interest_years) + 1):
-            # SIP yearly calculation
-            if year <= sip_years:
-                months_completed = year * 12
-                if monthly_rate > 0:
-                    sip_year_value = sip_amount * (((1 + monthly_rate) ** months_completed - 1) / monthly_rate) * (1 + monthly_rate)
-                else:
-                    sip_year_value = sip_amount * months_completed
-                sip_year_invested = sip_amount * months_completed
-            else:
-                sip_year_value = sip_maturity
-                sip_year_invested = sip_invested
-            
-            # Interest yearly calculation
-            if year <= interest_years:
-                interest_year_value = principal_amount * ((1 + annual_rate / frequency) ** (frequency * year))
-            else:
-                interest_year_value = interest_maturity
-            
-            yearly_breakdown.append({
-                'year': year,
-                'sip_invested': round(sip_year_invested, 2),
-                'sip_value': round(sip_year_value, 2),
-                'interest_principal': principal_amount,
-                'interest_value': round(interest_year_value, 2)
-            })
-        
-        return {
-            'sip_amount': sip_amount,
-            'sip_years': sip_years,
-            'sip_return': sip_return,
-            'sip_invested': round(sip_invested, 2),
-            'sip_maturity': round(sip_maturity, 2),
-            'sip_gain': round(sip_gain, 2),
-            'principal_amount': principal_amount,
-            'interest_years': interest_years,
-            'interest_rate': interest_rate,
-            'compounding_frequency': compounding_frequency,
-            'interest_maturity': round(interest_maturity, 2),
-            'interest_earned': round(interest_earned, 2),
-            'better_option': better_option,
-            'return_difference': round(return_difference, 2),
-            'yearly_breakdown': yearly_breakdown
-        }
-    
-    except Exception as e:
-        return {
-            'error': str(e)
-        }
-
-@app.route('/calculate-sip-vs-interest', methods=['POST'])
-def calculate_sip_vs_interest():
-    try:
-        data = request.get_json()
-        
-        # SIP inputs
-        sip_amount = float(data.get('sipAmount', 5000))
-        sip_years = int(data.get('sipYears', 5))
-        sip_return = float(data.get('sipReturn', 12))
-        
-        # Interest inputs
-        principal_amount = float(data.get('principalAmount', 300000))
-        interest_years = int(data.get('interestYears', 5))
-        interest_rate = float(data.get('interestRate', 6.5))
-        compounding_frequency = data.get('compoundingFrequency', 'quarterly')
-        
-        # Validation
-        if sip_amount <= 0 or sip_amount > 1000000:
-            return jsonify({'error': 'SIP amount must be between ₹1 and ₹10,00,000'}), 400
-        if sip_years <= 0 or sip_years > 50:
-            return jsonify({'error': 'SIP duration must be between 1 and 50 years'}), 400
-        if sip_return < 1 or sip_return > 30:
-            return jsonify({'error': 'SIP return must be between 1% and 30%'}), 400
-        if principal_amount <= 0 or principal_amount > 100000000:
-            return jsonify({'error': 'Principal amount must be between ₹1 and ₹10 Crores'}), 400
-        if interest_years <= 0 or interest_years > 50:
-            return jsonify({'error': 'Interest duration must be between 1 and 50 years'}), 400
-        if interest_rate < 0.1 or interest_rate > 20:
-            return jsonify({'error': 'Interest rate must be between 0.1% and 20%'}), 400
-        if compounding_frequency not in ['monthly', 'quarterly', 'annually']:
-            return jsonify({'error': 'Invalid compounding frequency'}), 400
-        
-        # Calculate comparison
-        result = calculate_sip_vs_interest_comparison(
-            sip_amount, sip_years, sip_return, 
-            principal_amount, interest_years, interest_rate, compounding_frequency
-        )
-        
-        if 'error' in result:
-            return jsonify({'status': 'error', 'error': result['error']}), 400
-        
-        return jsonify({'status': 'success', **result})
-    
-    except Exception as e:
-        return jsonify({'status': 'error', 'error': str(e)}), 400
-
-
-
-# Add these routes and functions to your existing app.py file
-
-@app.route('/index-fund-calculator/')
-def index_fund_calculator():
-    return render_template('index_fund_calculator.html')
-
-@app.route('/calculate-index-fund', methods=['POST'])
-def calculate_index_fund():
-    try:
-        data = request.get_json()
-        
-        investment_type = data.get('investmentType', 'sip')
-        expected_return = float(data.get('expectedReturn', 12))
-        investment_duration = int(data.get('investmentDuration', 10))
-        
-        if investment_type == 'sip':
-            monthly_amount = float(data.get('monthlyAmount', 5000))
-            if monthly_amount <= 0 or investment_duration <= 0:
-                return jsonify({
-                    'status': 'error',
-                    'error': 'Invalid input values'
-                })
-            
-            # Calculate SIP returns
-            results = calculate_index_fund_sip_returns(monthly_amount, expected_return, investment_duration)
-            
-        else:  # lumpsum
-            lumpsum_amount = float(data.get('lumpsumAmount', 100000))
-            if lumpsum_amount <= 0 or investment_duration <= 0:
-                return jsonify({
-                    'status': 'error',
-                    'error': 'Invalid input values'
-                })
-            
-            # Calculate Lumpsum returns
-            results = calculate_index_fund_lumpsum_returns(lumpsum_amount, expected_return, investment_duration)
-        
-        return jsonify({
-            'status': 'success',
-            'investmentType': investment_type,
-            'totalInvested': results['total_invested'],
-            'maturityAmount': results['maturity_amount'],
-            'totalGain': results['total_gain'],
-            'expectedReturn': expected_return,
-            'investmentDuration': investment_duration,
-            'yearlyBreakdown': results['yearly_breakdown']
-        })
-    
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        })
-
-def calculate_index_fund_sip_returns(monthly_amount, annual_return_rate, tenure_years):
-    """
-    Calculate SIP returns for index fund using future value of annuity formula
-    """
-    monthly_return_rate = annual_return_rate / (12 * 100)
-    total_months = tenure_years * 12
-    
-    # Future value of SIP
-    if monthly_return_rate > 0:
-        maturity_amount = monthly_amount * (((1 + monthly_return_rate) ** total_months - 1) / monthly_return_rate)
-    else:
-        maturity_amount = monthly_amount * total_months
-    
-    total_invested = monthly_amount * total_months
-    total_gain = maturity_amount - total_invested
-    
-    # Generate yearly breakdown
-    yearly_breakdown = []
-    current_value = 0
-    cumulative_invested = 0
-    
-    for year in range(1, tenure_years + 1):
-        year_invested = monthly_amount * 12
-        cumulative_invested += year_invested
-        
-        # Calculate value at end of year
-        months_completed = year * 12
-        if monthly_return_rate > 0:
-            year_end_value = monthly_amount * (((1 + monthly_return_rate) ** months_completed - 1) / monthly_return_rate)
-        else:
-            year_end_value = monthly_amount * months_completed
-        
-        year_gain = year_end_value - cumulative_invested
-        
-        yearly_breakdown.append({
-            'year': year,
-            'invested_this_year': year_invested,
-            'cumulative_invested': cumulative_invested,
-            'current_value': year_end_value,
-            'gain': year_gain
-        })
-    
-    return {
-        'total_invested': round(total_invested, 2),
-        'maturity_amount': round(maturity_amount, 2),
-        'total_gain': round(total_gain, 2),
-        'yearly_breakdown': yearly_breakdown
-    }
-
-def calculate_index_fund_lumpsum_returns(lumpsum_amount, annual_return_rate, tenure_years):
-    """
-    Calculate Lumpsum returns for index fund using compound interest formula
-    """
-    annual_return_decimal = annual_return_rate / 100
-    
-    # Compound interest calculation
-    maturity_amount = lumpsum_amount * ((1 + annual_return_decimal) ** tenure_years)
-    total_gain = maturity_amount - lumpsum_amount
-    
-    # Generate yearly breakdown
-    yearly_breakdown = []
-    current_value = lumpsum_amount
-    
-    for year in range(1, tenure_years + 1):
-        previous_value = current_value
-        current_value = lumpsum_amount * ((1 + annual_return_decimal) ** year)
-        year_gain = current_value - previous_value
-        total_gain_so_far = current_value - lumpsum_amount
-        
-        yearly_breakdown.append({
-            'year': year,
-            'invested_this_year': lumpsum_amount if year == 1 else 0,
-            'cumulative_invested': lumpsum_amount,
-            'current_value': current_value,
-            'gain': total_gain_so_far
-        })
-    
-    return {
-        'total_invested': round(lumpsum_amount, 2),
-        'maturity_amount': round(maturity_amount, 2),
-        'total_gain': round(total_gain, 2),
-        'yearly_breakdown': yearly_breakdown
-    }
-
-
-# Add this route to your existing app.py file
-
-@app.route('/stock-return-calculator/')
-def stock_return_calculator():
-    return render_template('stock_return_calculator.html')
-
-def calculate_stock_return_metrics(buy_price, sell_price, num_shares, holding_years, dividends=0):
-    """
-    Calculate stock return metrics including absolute return and CAGR
-    """
-    try:
-        # Input validation
-        if buy_price <= 0 or sell_price <= 0 or num_shares <= 0 or holding_years <= 0:
-            return {
-                'status': 'error',
-                'error': 'All values must be positive'
-            }
-        
-        # Calculate investment metrics
-        total_invested = buy_price * num_shares
-        total_value = (sell_price * num_shares) + dividends
-        net_profit = total_value - total_invested
-        
-        # Calculate absolute return percentage
-        absolute_return = (net_profit / total_invested) * 100
-        
-        # Calculate CAGR (Compound Annual Growth Rate)
-        cagr = 0
-        if holding_years > 0 and total_invested > 0:
-            cagr = (((total_value / total_invested) ** (1 / holding_years)) - 1) * 100
-        
-        # Determine if profit is positive for styling
-        is_profitable = net_profit > 0
-        
-        return {
-            'status': 'success',
-            'total_invested': round(total_invested, 2),
-            'total_value': round(total_value, 2),
-            'net_profit': round(net_profit, 2),
-            'absolute_return': round(absolute_return, 2),
-            'cagr': round(cagr, 2),
-            'is_profitable': is_profitable,
-            'buy_price': buy_price,
-            'sell_price': sell_price,
-            'num_shares': num_shares,
-            'holding_years': holding_years,
-            'dividends': dividends
-        }
-    
-    except Exception as e:
-        return {
-            'status': 'error',
-            'error': str(e)
-        }
-
-@app.route('/calculate-stock-return', methods=['POST'])
-def calculate_stock_return():
-    try:
-        data = request.get_json()
-        
-        buy_price = float(data.get('buyPrice', 0))
-        sell_price = float(data.get('sellPrice', 0))
-        num_shares = int(data.get('numShares', 0))
-        holding_years = float(data.get('holdingYears', 0))
-        dividends = float(data.get('dividends', 0))
-        
-        result = calculate_stock_return_metrics(buy_price, sell_price, num_shares, holding_years, dividends)
-        
-        return jsonify(result)
-    
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        }), 400
-
-
-# Add this to your existing app.py file
-
-# XIRR Calculator Route
-@app.route('/xirr-calculator/')
-def xirr_calculator():
-    return render_template('xirr_calculator.html')
-
-@app.route('/pradhan-mantri-shram-yogi-maandhan-calculator/')
-def pradhan_mantri_shram_yogi_maandhan_calculator():
-    return render_template('pradhan_mantri_shram_yogi_maandhan_calculator.html')
-
-@app.route('/pradhan-mantri-vaya-vandana-yojana-calculator/')
-def pradhan_mantri_vaya_vandana_yojana_calculator():
-    return render_template('pradhan_mantri_vaya_vandana_yojana_calculator.html')
-
-def calculate_pmsym_returns(joining_age, pension_amount, interest_rate):
-    """
-    Calculate PMSYM (Pradhan Mantri Shram Yogi Maandhan) returns
-    PMSYM Features:
-    - Age at joining: 18-40 years
-    - Monthly contribution: ₹55 to ₹110 based on age (calculated automatically)
-    - Government contribution: 50% of subscriber's contribution
-    - Pension amount: ₹3000 per month after 60 years (fixed)
-    - Interest rate: 8% per annum (fixed)
-    """
-    
-    # Validate age range
-    if joining_age < 18 or joining_age > 40:
-        return {
-            'error': 'Joining age must be between 18 and 40 years'
-        }
-    
-    # Fixed PMSYM parameters
-    pension_amount = 3000  # Fixed pension amount
-    interest_rate = 8.0    # Fixed interest rate
-    
-    # Calculate years of contribution
-    years_of_contribution = int(60 - joining_age)
-    
-    # PMSYM contribution structure based on age
-    if joining_age <= 29:
-        monthly_contribution = 55
-    elif joining_age <= 30:
-        monthly_contribution = 60
-    elif joining_age <= 31:
-        monthly_contribution = 65
-    elif joining_age <= 32:
-        monthly_contribution = 70
-    elif joining_age <= 33:
-        monthly_contribution = 75
-    elif joining_age <= 34:
-        monthly_contribution = 80
-    elif joining_age <= 35:
-        monthly_contribution = 85
-    elif joining_age <= 36:
-        monthly_contribution = 90
-    elif joining_age <= 37:
-        monthly_contribution = 95
-    elif joining_age <= 38:
-        monthly_contribution = 100
-    elif joining_age <= 39:
-        monthly_contribution = 105
-    else:
-        monthly_contribution = 110
-    
-    # Government contribution is 50% of subscriber contribution
-    government_contribution = monthly_contribution * 0.5
-    
-    # Calculate total contributions
-    total_subscriber_contribution = monthly_contribution * 12 * years_of_contribution
-    total_government_contribution = government_contribution * 12 * years_of_contribution
-    total_contribution = total_subscriber_contribution + total_government_contribution
-    
-    # Generate yearly breakdown
-    yearly_breakdown = []
-    current_corpus = 0
-    annual_rate = interest_rate / 100
-    monthly_rate = annual_rate / 12
-    
-    for year in range(1, years_of_contribution + 1):
-        # Calculate monthly progression for this year
-        for month in range(12):
-            monthly_total = monthly_contribution + government_contribution
-            current_corpus += monthly_total
-            current_corpus = current_corpus * (1 + monthly_rate)
-        
-        yearly_breakdown.append({
-            'year': year,
-            'age': joining_age + year,
-            'yearly_subscriber_contribution': monthly_contribution * 12,
-            'yearly_government_contribution': government_contribution * 12,
-            'total_yearly_contribution': (monthly_contribution + government_contribution) * 12,
-            'corpus_at_year_end': current_corpus,
-            'cumulative_subscriber_contribution': monthly_contribution * 12 * year,
-            'cumulative_government_contribution': government_contribution * 12 * year
-        })
-    
-    return {
-        'joining_age': joining_age,
-        'monthly_contribution': monthly_contribution,
-        'government_contribution': government_contribution,
-        'pension_amount': pension_amount,
-        'interest_rate': interest_rate,
-        'years_of_contribution': years_of_contribution,
-        'total_subscriber_contribution': round(total_subscriber_contribution, 2),
-        'total_government_contribution': round(total_government_contribution, 2),
-        'total_contribution': round(total_contribution, 2),
-        'corpus_at_60': round(current_corpus, 2),
-        'yearly_breakdown': yearly_breakdown
-    }
-
-def calculate_xirr_iterative(cash_flows):
-    """
-    Calculate XIRR using Newton-Raphson method (similar to Excel's XIRR)
-    cash_flows: list of dictionaries with 'date' and 'amount' keys
-    """
-    if len(cash_flows) < 2:
-        return None
-    
-    # Sort cash flows by date
-    sorted_flows = sorted(cash_flows, key=lambda x: x['date'])
-    
-    # Check if there's at least one positive and one negative cash flow
-    has_positive = any(cf['amount'] > 0 for cf in sorted_flows)
-    has_negative = any(cf['amount'] < 0 for cf in sorted_flows)
-    
-    if not (has_positive and has_negative):
-        return None
-    
-    # Calculate days from first date
-    base_date = sorted_flows[0]['date']
-    
-    # Initial guess for XIRR (10%)
-    rate = 0.1
-    max_iterations = 100
-    tolerance = 1e-6
-    
-    for iteration in range(max_iterations):
-        npv = 0
-        dnpv = 0  # Derivative of NPV
-        
-        for cf in sorted_flows:
-            days_diff = (cf['date'] - base_date).days
-            years_diff = days_diff / 365.0
-            
-            if years_diff == 0:
-                npv += cf['amount']
-                continue
-            
-            # NPV calculation
-            factor = (1 + rate) ** years_diff
-            npv += cf['amount'] / factor
-            
-            # Derivative calculation
-            dnpv -= cf['amount'] * years_diff / (factor * (1 + rate))
-        
-        # Check convergence
-        if abs(npv) < tolerance:
-            return rate
-        
-        # Newton-Raphson update
-        if abs(dnpv) < 1e-10:  # Avoid division by zero
-            break
-        
-        new_rate = rate - npv / dnpv
-        
-        # Check for reasonable bounds
-        if new_rate < -0.99 or new_rate > 10:  # Limit between -99% and 1000%
-            break
-        
-        rate = new_rate
-    
-    return rate if abs(npv) < 0.01 else None
-
-def calculate_xirr_summary_data(cash_flows):
-    """
-    Calculate summary data for XIRR analysis
-    """
-    total_invested = sum(cf['amount'] for cf in cash_flows if cf['amount'] < 0)
-    total_withdrawn = sum(cf['amount'] for cf in cash_flows if cf['amount'] > 0)
-    net_gain_loss = total_withdrawn + total_invested  # invested is negative
-    
-    # Calculate XIRR
-    xirr_rate = calculate_xirr_iterative(cash_flows)
-    xirr_percentage = round(xirr_rate * 100, 2) if xirr_rate is not None else None
-    
-    # Calculate cumulative cash flows for chart
-    cumulative_flows = []
-    running_total = 0
-    
-    for cf in sorted(cash_flows, key=lambda x: x['date']):
-        running_total += cf['amount']
-        cumulative_flows.append({
-            'date': cf['date'].strftime('%Y-%m-%d'),
-            'amount': round(running_total, 2),
-            'label': cf['date'].strftime('%b %Y')
-        })
-    
-    return {
-        'total_invested': round(abs(total_invested), 2),
-        'total_withdrawn': round(total_withdrawn, 2),
-        'net_gain_loss': round(net_gain_loss, 2),
-        'xirr_percentage': xirr_percentage,
-        'cumulative_flows': cumulative_flows,
-        'cash_flow_count': len(cash_flows)
-    }
-
-@app.route('/calculate-pmsym', methods=['POST'])
-def calculate_pmsym():
-    try:
-        data = request.get_json()
-        joining_age = int(float(data.get('joining_age', 25)))
-        pension_amount = 3000  # Fixed pension amount
-        interest_rate = 8.0    # Fixed interest rate
-        
-        # Calculate PMSYM returns
-        result = calculate_pmsym_returns(joining_age, pension_amount, interest_rate)
-        
-        if 'error' in result:
-            return jsonify(result)
-        
-        return jsonify(result)
-        
-    except Exception as e:
-        return jsonify({'error': f'Calculation error: {str(e)}'})
-
-@app.route('/calculate-xirr-analysis', methods=['POST'])
-def calculate_xirr_analysis():
-    try:
-        data = request.get_json()
-        cash_flows_data = data.get('cashFlows', [])
-        
-        if not cash_flows_data or len(cash_flows_data) < 2:
-            return jsonify({
-                'status': 'error',
-                'error': 'At least 2 cash flows are required for XIRR calculation'
-            })
-        
-        # Convert to proper format
-        cash_flows = []
-        for cf in cash_flows_data:
-            try:
-                date_obj = datetime.strptime(cf['date'], '%Y-%m-%d').date()
-                amount = float(cf['amount'])
-                
-                if amount == 0:
-                    continue  # Skip zero amounts
-                
-                cash_flows.append({
-                    'date': date_obj,
-                    'amount': amount
-                })
-            except (ValueError, KeyError) as e:
-                return jsonify({
-                    'status': 'error',
-                    'error': f'Invalid cash flow data: {str(e)}'
-                })
-        
-        if len(cash_flows) < 2:
-            return jsonify({
-                'status': 'error',
-                'error': 'At least 2 valid cash flows are required'
-            })
-        
-        # Calculate XIRR analysis
-        result = calculate_xirr_summary_data(cash_flows)
-        
-        return jsonify({
-            'status': 'success',
-            **result
-        })
-        
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        }), 400
-
-@app.route('/income-tax-calculator-with-old-and-new-tax-regime/')
-def income_tax_calculator_with_old_and_new_tax_regime():
-    return render_template('income_tax_calculator_with_old_and_new_tax_regime.html')
-
-def calculate_income_tax_old_new_regime(financial_year, age_group, income_details, deductions):
-    """
-    Calculate income tax for both old and new tax regimes
-    """
-    # Total income calculation
-    total_income = (
-        income_details.get('salary', 0) +
-        income_details.get('rental_income', 0) +
-        income_details.get('digital_asset_income', 0) +
-        income_details.get('other_income', 0) -
-        income_details.get('exempt_allowances', 0) -
-        income_details.get('self_occupied_property_loss', 0)
-    )
-    
-    # Interest on home loan for let-out property reduces rental income
-    rental_income_net = income_details.get('rental_income', 0) - income_details.get('interest_home_loan_letout', 0)
-    total_income = (
-        income_details.get('salary', 0) +
-        max(0, rental_income_net) +
-        income_details.get('digital_asset_income', 0) +
-        income_details.get('other_income', 0) -
-        income_details.get('exempt_allowances', 0) -
-        income_details.get('self_occupied_property_loss', 0)
-    )
-    
-    # OLD TAX REGIME CALCULATION
-    old_regime_tax = calculate_old_regime_tax(total_income, age_group, deductions, financial_year)
-    
-    # NEW TAX REGIME CALCULATION
-    new_regime_tax = calculate_new_regime_tax(total_income, age_group, financial_year)
-    
-    # Calculate savings/difference
-    savings_amount = old_regime_tax['total_tax'] - new_regime_tax['total_tax']
-    better_regime = 'New Regime' if savings_amount > 0 else 'Old Regime'
-    if abs(savings_amount) < 100:
-        better_regime = 'Both Similar'
-    
-    return {
-        'total_income': total_income,
-        'old_regime': old_regime_tax,
-        'new_regime': new_regime_tax,
-        'savings_amount': abs(savings_amount),
-        'better_regime': better_regime,
-        'financial_year': financial_year,
-        'age_group': age_group
-    }
-
-def calculate_old_regime_tax(total_income, age_group, deductions, financial_year):
-    """
-    Calculate tax under old regime with deductions
-    """
-    # Apply Section 80C, 80D, etc. deductions
-    section_80c = min(deductions.get('section_80c', 0), 150000)
-    section_80d = min(deductions.get('section_80d', 0), get_80d_limit(age_group))
-    section_80g = deductions.get('section_80g', 0)  # 100% deduction for donations
-    section_80tta = min(deductions.get('section_80tta', 0), 10000)
-    section_80ccd1 = min(deductions.get('section_80ccd1', 0), 50000)
-    section_80ccd2 = deductions.get('section_80ccd2', 0)  # No limit for employer NPS
-    section_80eea = min(deductions.get('section_80eea', 0), 150000)
-    other_deductions = deductions.get('other_deductions', 0)
-    
-    total_deductions = (section_80c + section_80d + section_80g + section_80tta + 
-                       section_80ccd1 + section_80ccd2 + section_80eea + other_deductions)
-    
-    # Taxable income after deductions
-    taxable_income = max(0, total_income - total_deductions)
-    
-    # Calculate tax based on slabs for old regime
-    income_tax = calculate_tax_slabs_old_regime(taxable_income, age_group, financial_year)
-    
-    # Add cess (4% on income tax)
-    cess = income_tax * 0.04
-    total_tax = income_tax + cess
-    
-    return {
-        'taxable_income': taxable_income,
-        'total_deductions': total_deductions,
-        'income_tax': income_tax,
-        'cess': cess,
-        'total_tax': total_tax,
-        'deduction_breakdown': {
-            'section_80c': section_80c,
-            'section_80d': section_80d,
-            'section_80g': section_80g,
-            'section_80tta': section_80tta,
-            'section_80ccd1': section_80ccd1,
-            'section_80ccd2': section_80ccd2,
-            'section_80eea': section_80eea,
-            'other_deductions': other_deductions
-        }
-    }
-
-def calculate_new_regime_tax(total_income, age_group, financial_year):
-    """
-    Calculate tax under new regime (no deductions but lower rates)
-    """
-    # Standard deduction of Rs. 50,000 for salaried individuals
-    standard_deduction = 50000
-    taxable_income = max(0, total_income - standard_deduction)
-    
-    # Calculate tax based on new regime slabs
-    income_tax = calculate_tax_slabs_new_regime(taxable_income, financial_year)
-    
-    # Add cess (4% on income tax)
-    cess = income_tax * 0.04
-    total_tax = income_tax + cess
-    
-    return {
-        'taxable_income': taxable_income,
-        'standard_deduction': standard_deduction,
-        'income_tax': income_tax,
-        'cess': cess,
-        'total_tax': total_tax
-    }
-
-def calculate_tax_slabs_old_regime(taxable_income, age_group, financial_year):
-    """
-    Calculate income tax based on old regime slabs
-    """
-    if financial_year in ['FY 2024-2025', 'FY 2025-2026']:
-        if age_group == '0-60':
-            # Below 60 years
-            if taxable_income <= 250000:
-                return 0
-            elif taxable_income <= 500000:
-                return (taxable_income - 250000) * 0.05
-            elif taxable_income <= 1000000:
-                return 12500 + (taxable_income - 500000) * 0.20
-            else:
-                return 112500 + (taxable_income - 1000000) * 0.30
-        elif age_group == '60-80':
-            # Senior citizen (60-80 years)
-            if taxable_income <= 300000:
-                return 0
-            elif taxable_income <= 500000:
-                return (taxable_income - 300000) * 0.05
-            elif taxable_income <= 1000000:
-                return 10000 + (taxable_income - 500000) * 0.20
-            else:
-                return 110000 + (taxable_income - 1000000) * 0.30
-        else:
-            # Super senior citizen (80+ years)
-            if taxable_income <= 500000:
-                return 0
-            elif taxable_income <= 1000000:
-                return (taxable_income - 500000) * 0.20
-            else:
-                return 100000 + (taxable_income - 1000000) * 0.30
-    
-    return 0
-
-def calculate_tax_slabs_new_regime(taxable_income, financial_year):
-    """
-    Calculate income tax based on new regime slabs
-    """
-    if financial_year in ['FY 2024-2025', 'FY 2025-2026']:
-        # New regime slabs (same for all age groups)
-        if taxable_income <= 300000:
-            return 0
-        elif taxable_income <= 600000:
-            return (taxable_income - 300000) * 0.05
-        elif taxable_income <= 900000:
-            return 15000 + (taxable_income - 600000) * 0.10
-        elif taxable_income <= 1200000:
-            return 45000 + (taxable_income - 900000) * 0.15
-        elif taxable_income <= 1500000:
-            return 90000 + (taxable_income - 1200000) * 0.20
-        else:
-            return 150000 + (taxable_income - 1500000) * 0.30
-    
-    return 0
-
-def get_80d_limit(age_group):
-    """
-    Get Section 80D deduction limit based on age group
-    """
-    if age_group == '80+':
-        return 50000  # For super senior citizens
-    elif age_group == '60-80':
-        return 50000  # For senior citizens
-    else:
-        return 25000  # For individuals below 60
-
-@app.route('/calculate-income-tax-old-new-regime', methods=['POST'])
-def calculate_income_tax_old_new_regime_api():
-    try:
-        data = request.get_json()
-        
-        # Extract basic details
-        financial_year = data.get('financial_year', 'FY 2024-2025')
-        age_group = data.get('age_group', '0-60')
-        
-        # Extract income details
-        income_details = {
-            'salary': float(data.get('salary', 0)),
-            'exempt_allowances': float(data.get('exempt_allowances', 0)),
-            'self_occupied_property_loss': float(data.get('self_occupied_property_loss', 0)),
-            'rental_income': float(data.get('rental_income', 0)),
-            'digital_asset_income': float(data.get('digital_asset_income', 0)),
-            'interest_home_loan_letout': float(data.get('interest_home_loan_letout', 0)),
-            'other_income': float(data.get('other_income', 0))
-        }
-        
-        # Extract deductions
-        deductions = {
-            'section_80c': float(data.get('section_80c', 0)),
-            'section_80d': float(data.get('section_80d', 0)),
-            'section_80g': float(data.get('section_80g', 0)),
-            'section_80tta': float(data.get('section_80tta', 0)),
-            'section_80ccd1': float(data.get('section_80ccd1', 0)),
-            'section_80ccd2': float(data.get('section_80ccd2', 0)),
-            'section_80eea': float(data.get('section_80eea', 0)),
-            'other_deductions': float(data.get('other_deductions', 0))
-        }
-        
-        # Calculate tax
-        result = calculate_income_tax_old_new_regime(financial_year, age_group, income_details, deductions)
-        
-        return jsonify({
-            'status': 'success',
-            **result
-        })
-        
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        }), 400
-
-@app.route('/tds-calculator/')
-def tds_calculator():
-    return render_template('tds_calculator.html')
-
-def calculate_tds_amount(payment_type, payment_amount, pan_available, category, regime_type='old'):
-    """
-    Calculate TDS amount based on payment type, PAN availability, category, and tax regime
-    
-    Args:
-        payment_type: Type of payment (e.g., '192A', '194A', etc.)
-        payment_amount: Amount of payment
-        pan_available: Whether PAN is available ('yes' or 'no')
-        category: 'individual' or 'other'
-        regime_type: Tax regime type ('old' or 'new')
-    
-    Returns:
-        dict: TDS calculation result
-    """
-    try:
-        # Validate inputs
-        if payment_amount <= 0:
-            raise ValueError("Payment amount must be greater than 0")
-        
-        # TDS rates based on section, PAN availability, and tax regime
-        old_regime_tds_rates = {
-            '192A': {  # Payment of accumulated balance due to an employee
-                'pan_available': 10.0,
-                'pan_not_available': 20.0,
-                'threshold': 30000
-            },
-            '194A': {  # Interest other than securities
-                'pan_available': 10.0,
-                'pan_not_available': 20.0,
-                'threshold': 40000 if category == 'individual' else 40000
-            },
-            '194H': {  # Commission or brokerage
-                'pan_available': 5.0,
-                'pan_not_available': 20.0,
-                'threshold': 15000
-            },
-            '194I': {  # Rent (plant/machinery/building)
-                'pan_available': 10.0,
-                'pan_not_available': 20.0,
-                'threshold': 240000
-            },
-            '194J': {  # Fees for professional/technical services
-                'pan_available': 10.0,
-                'pan_not_available': 20.0,
-                'threshold': 30000
-            },
-            '194C': {  # Payment to contractors
-                'pan_available': 1.0,
-                'pan_not_available': 20.0,
-                'threshold': 30000
-            },
-            '194D': {  # Insurance commission
-                'pan_available': 5.0,
-                'pan_not_available': 20.0,
-                'threshold': 15000
-            },
-            '194G': {  # Commission on sale of lottery tickets
-                'pan_available': 5.0,
-                'pan_not_available': 20.0,
-                'threshold': 15000
-            },
-            '194K': {  # Payment in respect of units
-                'pan_available': 10.0,
-                'pan_not_available': 20.0,
-                'threshold': 25000
-            },
-            '194LA': {  # Payment of compensation for compulsory acquisition
-                'pan_available': 10.0,
-                'pan_not_available': 20.0,
-                'threshold': 250000
-            },
-            '194M': {  # Payment of certain sums by e-commerce operator
-                'pan_available': 0.1,
-                'pan_not_available': 5.0,
-                'threshold': 500000
-            },
-            '194N': {  # Payment in respect of cash withdrawal
-                'pan_available': 2.0,
-                'pan_not_available': 2.0,
-                'threshold': 1000000
-            },
-            '194O': {  # Payment by e-commerce operator to e-commerce participant
-                'pan_available': 1.0,
-                'pan_not_available': 5.0,
-                'threshold': 500000
-            }
-        }
-
-        # New regime TDS rates (some sections may have different rates/thresholds)
-        new_regime_tds_rates = {
-            '192A': {  # Payment of accumulated balance due to an employee
-                'pan_available': 10.0,
-                'pan_not_available': 20.0,
-                'threshold': 30000
-            },
-            '194A': {  # Interest other than securities - progressive slab rates in new regime
-                'pan_available': 'slab',  # Use slab structure
-                'pan_not_available': 20.0,
-                'threshold': 50000 if category == 'individual' else 50000,
-                'slabs': {
-                    'pan_available': [
-                        {'min': 0, 'max': 50000, 'rate': 0.0},
-                        {'min': 50001, 'max': 500000, 'rate': 10.0},
-                        {'min': 500001, 'max': float('inf'), 'rate': 15.0}
-                    ],
-                    'pan_not_available': [
-                        {'min': 0, 'max': 50000, 'rate': 0.0},
-                        {'min': 50001, 'max': float('inf'), 'rate': 20.0}
-                    ]
-                }
-            },
-            '194H': {  # Commission or brokerage
-                'pan_available': 5.0,
-                'pan_not_available': 20.0,
-                'threshold': 15000
-            },
-            '194I': {  # Rent (plant/machinery/building)
-                'pan_available': 10.0,
-                'pan_not_available': 20.0,
-                'threshold': 240000
-            },
-            '194J': {  # Fees for professional/technical services
-                'pan_available': 10.0,
-                'pan_not_available': 20.0,
-                'threshold': 30000
-            },
-            '194C': {  # Payment to contractors
-                'pan_available': 1.0,
-                'pan_not_available': 20.0,
-                'threshold': 30000
-            },
-            '194D': {  # Insurance commission
-                'pan_available': 5.0,
-                'pan_not_available': 20.0,
-                'threshold': 15000
-            },
-            '194G': {  # Commission on sale of lottery tickets
-                'pan_available': 5.0,
-                'pan_not_available': 20.0,
-                'threshold': 15000
-            },
-            '194K': {  # Payment in respect of units
-                'pan_available': 10.0,
-                'pan_not_available': 20.0,
-                'threshold': 25000
-            },
-            '194LA': {  # Payment of compensation for compulsory acquisition
-                'pan_available': 10.0,
-                'pan_not_available': 20.0,
-                'threshold': 250000
-            },
-            '194M': {  # Payment of certain sums by e-commerce operator
-                'pan_available': 0.1,
-                'pan_not_available': 5.0,
-                'threshold': 500000
-            },
-            '194N': {  # Payment in respect of cash withdrawal
-                'pan_available': 2.0,
-                'pan_not_available': 2.0,
-                'threshold': 1000000
-            },
-            '194O': {  # Payment by e-commerce operator to e-commerce participant
-                'pan_available': 1.0,
-                'pan_not_available': 5.0,
-                'threshold': 500000
-            }
-        }
-
-        # Choose the appropriate rates based on regime type
-        tds_rates = new_regime_tds_rates if regime_type == 'new' else old_regime_tds_rates
-        
-        # Get TDS rate configuration
-        if payment_type not in tds_rates:
-            raise ValueError(f"Invalid payment type: {payment_type}")
-        
-        rate_config = tds_rates[payment_type]
-        threshold = rate_config['threshold']
-        
-        # Determine applicable rate and calculate TDS
-        pan_key = 'pan_available' if pan_available.lower() == 'yes' else 'pan_not_available'
-        
-        # Check if this section uses slab structure
-        if 'slabs' in rate_config and rate_config[pan_key] == 'slab':
-            # Slab-based calculation
-            slabs = rate_config['slabs'][pan_key]
-            tds_amount = 0
-            applicable_rate = 0
-            threshold_message = ""
-            
-            if payment_amount < threshold:
-                tds_amount = 0
-                applicable_rate = 0
-                threshold_message = f"No TDS required as payment amount (₹{payment_amount:,.2f}) is below threshold (₹{threshold:,.2f})"
-            else:
-                # Calculate TDS using slab structure
-                for slab in slabs:
-                    if payment_amount >= slab['min'] and payment_amount <= slab['max']:
-                        applicable_rate = slab['rate']
-                        tds_amount = (payment_amount * applicable_rate) / 100
-                        
-                        if applicable_rate == 0:
-                            threshold_message = f"No TDS required as payment amount (₹{payment_amount:,.2f}) is below threshold (₹{threshold:,.2f})"
-                        else:
-                            # Determine which slab this falls into for messaging
-                            if applicable_rate == 15.0:
-                                threshold_message = f"TDS at {applicable_rate}% as payment amount (₹{payment_amount:,.2f}) exceeds ₹5,00,000 slab (New Regime)"
-                            else:
-                                threshold_message = f"TDS at {applicable_rate}% as payment amount (₹{payment_amount:,.2f}) exceeds threshold (₹{threshold:,.2f})"
-                        break
-        else:
-            # Traditional flat rate calculation
-            if pan_available.lower() == 'yes':
-                applicable_rate = rate_config['pan_available']
-            else:
-                applicable_rate = rate_config['pan_not_available']
-            
-            # Check if payment exceeds threshold
-            if payment_amount < threshold:
-                tds_amount = 0
-                applicable_rate = 0
-                threshold_message = f"No TDS required as payment amount (₹{payment_amount:,.2f}) is below threshold (₹{threshold:,.2f})"
-            else:
-                tds_amount = (payment_amount * applicable_rate) / 100
-                threshold_message = f"TDS applicable as payment amount (₹{payment_amount:,.2f}) exceeds threshold (₹{threshold:,.2f})"
-        
-        # Calculate net amount after TDS
-        net_amount = payment_amount - tds_amount
-        
-        return {
-            'payment_amount': payment_amount,
-            'tds_amount': round(tds_amount, 2),
-            'net_amount': round(net_amount, 2),
-            'applicable_rate': applicable_rate,
-            'threshold': threshold,
-            'threshold_message': threshold_message,
-            'payment_type': payment_type,
-            'pan_available': pan_available,
-            'category': category,
-            'regime_type': regime_type,
-            'tds_percentage': applicable_rate
-        }
-        
-    except Exception as e:
-        raise Exception(f"Error calculating TDS: {str(e)}")
-
-@app.route('/calculate-tds', methods=['POST'])
-def calculate_tds_route():
-    try:
-        data = request.get_json()
-        
-        payment_type = data.get('payment_type', '194A')
-        payment_amount = float(data.get('payment_amount', 0))
-        pan_available = data.get('pan_available', 'yes')
-        category = data.get('category', 'individual')
-        regime_type = data.get('regime_type', 'old')
-        
-        # Calculate TDS
-        result = calculate_tds_amount(payment_type, payment_amount, pan_available, category, regime_type)
-        
-        return jsonify({
-            'status': 'success',
-            **result
-        })
-        
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        }), 400
-
-@app.route('/hra-calculator/')
-def hra_calculator():
-    return render_template('hra_calculator.html')
-
-def calculate_hra_exemption(basic_salary_annual, da_received_annual, hra_received_annual, rent_paid_annual, city_type):
-    """
-    Calculate HRA exemption based on Income Tax rules (Annual basis as per ClearTax)
-    
-    HRA exemption is the minimum of:
-    1. Actual HRA received
-    2. 50% of basic salary (Metro) or 40% (Non-Metro)  
-    3. Rent paid - 10% of total salary (Basic + DA)
-    
-    Returns:
-    - HRA exempt amount
-    - Taxable HRA amount
-    """
-    try:
-        # Validate inputs
-        if basic_salary_annual <= 0:
-            raise ValueError("Basic salary must be greater than 0")
-        if da_received_annual < 0:
-            raise ValueError("Dearness Allowance cannot be negative")
-        if hra_received_annual < 0:
-            raise ValueError("HRA received cannot be negative")
-        if rent_paid_annual < 0:
-            raise ValueError("Rent paid cannot be negative")
-        if city_type not in ['metro', 'non-metro']:
-            raise ValueError("City type must be 'metro' or 'non-metro'")
-        
-        # Calculate total salary (Basic + DA) as per ClearTax calculation
-        total_salary_annual = basic_salary_annual + da_received_annual
-        
-        # Calculate the three components for HRA exemption
-        # 1. Actual HRA received
-        actual_hra = hra_received_annual
-        
-        # 2. Percentage of basic salary based on city type (Note: Only basic salary, not total)
-        if city_type == 'metro':
-            salary_percentage = basic_salary_annual * 0.50  # 50% for metro cities
-        else:
-            salary_percentage = basic_salary_annual * 0.40  # 40% for non-metro cities
-        
-        # 3. Rent paid minus 10% of total salary (Basic + DA)
-        ten_percent_total_salary = total_salary_annual * 0.10
-        rent_minus_ten_percent = max(0, rent_paid_annual - ten_percent_total_salary)
-        
-        # HRA exemption is minimum of the three
-        hra_exempt = min(actual_hra, salary_percentage, rent_minus_ten_percent)
-        
-        # Taxable HRA is HRA received minus exempt amount
-        taxable_hra = max(0, hra_received_annual - hra_exempt)
-        
-        return {
-            'basic_salary_annual': basic_salary_annual,
-            'da_received_annual': da_received_annual,
-            'total_salary_annual': total_salary_annual,
-            'hra_received_annual': hra_received_annual,
-            'rent_paid_annual': rent_paid_annual,
-            'city_type': city_type,
-            'actual_hra': round(actual_hra, 2),
-            'salary_percentage': round(salary_percentage, 2),
-            'rent_minus_ten_percent': round(rent_minus_ten_percent, 2),
-            'hra_exempt': round(hra_exempt, 2),
-            'taxable_hra': round(taxable_hra, 2),
-            'ten_percent_total_salary': round(ten_percent_total_salary, 2)
-        }
-        
-    except Exception as e:
-        raise Exception(f"Error calculating HRA exemption: {str(e)}")
-
-@app.route('/calculate-hra', methods=['POST'])
-def calculate_hra_route():
-    try:
-        data = request.get_json()
-        
-        basic_salary_annual = float(data.get('basic_salary_annual', 0))
-        da_received_annual = float(data.get('da_received_annual', 0))
-        hra_received_annual = float(data.get('hra_received_annual', 0))
-        rent_paid_annual = float(data.get('rent_paid_annual', 0))
-        city_type = data.get('city_type', 'metro').lower()
-        
-        # Calculate HRA exemption
-        result = calculate_hra_exemption(basic_salary_annual, da_received_annual, hra_received_annual, rent_paid_annual, city_type)
-        
-        return jsonify({
-            'status': 'success',
-            **result
-        })
-        
-    except Exception as e:
-        return jsonify({'status': 'error', 'error': str(e)}), 400
-
-@app.route('/ctc-calculator/')
-def ctc_calculator():
-    return render_template('ctc_calculator.html')
-
-@app.route('/calculate-ctc', methods=['POST'])
-def calculate_ctc_route():
-    try:
-        data = request.get_json()
-        
-        annual_ctc = float(data.get('annual_ctc', 0))
-        basic_salary_percent = float(data.get('basic_salary_percent', 40))
-        hra_percent = float(data.get('hra_percent', 40))
-        special_allowance = float(data.get('special_allowance', 0))
-        bonus_amount = float(data.get('bonus_amount', 0))
-        employer_pf_percent = float(data.get('employer_pf_percent', 12))
-        employee_pf_percent = float(data.get('employee_pf_percent', 12))
-        gratuity_percent = float(data.get('gratuity_percent', 4.81))
-        professional_tax = float(data.get('professional_tax', 2400))
-        
-        # Tax regime and deductions
-        tax_regime = data.get('tax_regime', 'new')
-        metro_city = data.get('metro_city', True)
-        monthly_rent = float(data.get('monthly_rent', 0))
-        section_80c = float(data.get('section_80c', 0))
-        section_80ccd1b = float(data.get('section_80ccd1b', 0))
-        section_80d = float(data.get('section_80d', 0))
-        senior_citizens = data.get('senior_citizens', False)
-        include_parents = data.get('include_parents', False)
-        section_80tta = float(data.get('section_80tta', 0))
-        home_loan_interest = float(data.get('home_loan_interest', 0))
-        property_rented_out = data.get('property_rented_out', False)
-        epf_applicable = data.get('epf_applicable', True)
-        professional_tax_applicable = data.get('professional_tax_applicable', True)
-        
-        # Calculate CTC breakdown
-        result = calculate_ctc_breakdown(annual_ctc, basic_salary_percent, hra_percent, 
-                                       special_allowance, bonus_amount, employer_pf_percent, 
-                                       employee_pf_percent, gratuity_percent, professional_tax,
-                                       tax_regime, metro_city, monthly_rent, section_80c,
-                                       section_80ccd1b, section_80d, senior_citizens, include_parents,
-                                       section_80tta, home_loan_interest, property_rented_out,
-                                       epf_applicable, professional_tax_applicable)
-        
-        return jsonify({
-            'status': 'success',
-            **result
-        })
-        
-    except Exception as e:
-        return jsonify({'status': 'error', 'error': str(e)}), 400
-
-def calculate_ctc_breakdown(annual_ctc, basic_salary_percent, hra_percent, special_allowance, 
-                          bonus_amount, employer_pf_percent, employee_pf_percent, 
-                          gratuity_percent, professional_tax, tax_regime='new', metro_city=True,
-                          monthly_rent=0, section_80c=0, section_80ccd1b=0, section_80d=0,
-                          senior_citizens=False, include_parents=False, section_80tta=0,
-                          home_loan_interest=0, property_rented_out=False, epf_applicable=True,
-                          professional_tax_applicable=True):
-    """
-    Calculate detailed CTC breakdown and take-home salary with tax regime support
-    """
-    
-    # Calculate basic salary
-    basic_salary_annual = (annual_ctc * basic_salary_percent) / 100
-    basic_salary_monthly = basic_salary_annual / 12
-    
-    # Calculate HRA
-    hra_annual = (basic_salary_annual * hra_percent) / 100
-    hra_monthly = hra_annual / 12
-    
-    # Calculate employer contributions
-    employer_pf_annual = (basic_salary_annual * employer_pf_percent) / 100
-    employer_pf_monthly = employer_pf_annual / 12
-    
-    gratuity_annual = (basic_salary_annual * gratuity_percent) / 100
-    gratuity_monthly = gratuity_annual / 12
-    
-    # Calculate gross salary (CTC - employer contributions)
-    gross_salary_annual = annual_ctc - employer_pf_annual - gratuity_annual
-    gross_salary_monthly = gross_salary_annual / 12
-    
-    # Calculate employee deductions
-    employee_pf_annual = (basic_salary_annual * employee_pf_percent) / 100
-    employee_pf_monthly = employee_pf_annual / 12
-    
-    professional_tax_monthly = professional_tax / 12 if professional_tax_applicable else 0
-    
-    # Calculate HRA exemption for old regime
-    hra_exemption = 0
-    if tax_regime == 'old' and monthly_rent > 0:
-        # HRA exemption calculation
-        annual_rent = monthly_rent * 12
-        hra_percent_limit = 0.5 if metro_city else 0.4
-        hra_limit_basic = basic_salary_annual * hra_percent_limit
-        rent_minus_10_percent_basic = annual_rent - (basic_salary_annual * 0.1)
-        
-        hra_exemption = min(hra_annual, hra_limit_basic, max(0, rent_minus_10_percent_basic))
-    
-    # Calculate income tax based on regime
-    if tax_regime == 'old':
-        # Old tax regime with deductions
-        total_deductions = 0
-        
-        # Standard deduction
-        standard_deduction = min(50000, gross_salary_annual)
-        total_deductions += standard_deduction
-        
-        # EPF deduction
-        if epf_applicable:
-            total_deductions += employee_pf_annual
-        
-        # HRA exemption
-        total_deductions += hra_exemption
-        
-        # Section 80C (max 150000)
-        total_deductions += min(section_80c, 150000)
-        
-        # Section 80CCD(1B) - NPS (max 50000)
-        total_deductions += min(section_80ccd1b, 50000)
-        
-        # Section 80D - Health Insurance
-        health_insurance_limit = 25000
-        if senior_citizens:
-            health_insurance_limit = 50000
-        if include_parents:
-            health_insurance_limit += 25000 if not senior_citizens else 50000
-        total_deductions += min(section_80d, health_insurance_limit)
-        
-        # Section 80TTA - Savings Interest (max 10000)
-        total_deductions += min(section_80tta, 10000)
-        
-        # Home loan interest deduction
-        home_loan_limit = 200000 if not property_rented_out else 300000
-        total_deductions += min(home_loan_interest, home_loan_limit)
-        
-        taxable_income = max(0, gross_salary_annual - total_deductions)
-        
-        # Old regime tax slabs
-        income_tax_annual = 0
-        if taxable_income > 250000:
-            if taxable_income <= 500000:
-                income_tax_annual = (taxable_income - 250000) * 0.05
-            elif taxable_income <= 1000000:
-                income_tax_annual = 250000 * 0.05 + (taxable_income - 500000) * 0.20
-            else:
-                income_tax_annual = 250000 * 0.05 + 500000 * 0.20 + (taxable_income - 1000000) * 0.30
-    else:
-        # New tax regime (no deductions except standard deduction and EPF)
-        total_deductions = 0
-        
-        # Standard deduction
-        standard_deduction = min(50000, gross_salary_annual)
-        total_deductions += standard_deduction
-        
-        # EPF deduction (always allowed)
-        if epf_applicable:
-            total_deductions += employee_pf_annual
-        
-        taxable_income = max(0, gross_salary_annual - total_deductions)
-        
-        # New regime tax slabs (2024-25)
-        income_tax_annual = 0
-        if taxable_income > 300000:
-            if taxable_income <= 600000:
-                income_tax_annual = (taxable_income - 300000) * 0.05
-            elif taxable_income <= 900000:
-                income_tax_annual = 300000 * 0.05 + (taxable_income - 600000) * 0.10
-            elif taxable_income <= 1200000:
-                income_tax_annual = 300000 * 0.05 + 300000 * 0.10 + (taxable_income - 900000) * 0.15
-            elif taxable_income <= 1500000:
-                income_tax_annual = 300000 * 0.05 + 300000 * 0.10 + 300000 * 0.15 + (taxable_income - 1200000) * 0.20
-            else:
-                income_tax_annual = 300000 * 0.05 + 300000 * 0.10 + 300000 * 0.15 + 300000 * 0.20 + (taxable_income - 1500000) * 0.30
-    
-    income_tax_monthly = income_tax_annual / 12
-    
-    # Calculate take-home salary
-    total_deductions_monthly = employee_pf_monthly + professional_tax_monthly + income_tax_monthly
-    total_deductions_annual = total_deductions_monthly * 12
-    
-    takehome_monthly = gross_salary_monthly - total_deductions_monthly
-    takehome_annual = takehome_monthly * 12
-    
-    takehome_percentage = (takehome_annual / annual_ctc) * 100
-    
-    total_contributions_monthly = employer_pf_monthly + gratuity_monthly
-    total_contributions_annual = total_contributions_monthly * 12
-    
-    bonus_monthly = bonus_amount / 12
-    special_allowance_monthly = special_allowance / 12
-    
-    return {
-        'annual_ctc': round(annual_ctc, 2),
-        'monthly_gross': round(gross_salary_monthly, 2),
-        'monthly_takehome': round(takehome_monthly, 2),
-        'takehome_percentage': round(takehome_percentage, 2),
-        'basic_salary_monthly': round(basic_salary_monthly, 2),
-        'hra_monthly': round(hra_monthly, 2),
-        'special_allowance_monthly': round(special_allowance_monthly, 2),
-        'bonus_monthly': round(bonus_monthly, 2),
-        'gross_salary_monthly': round(gross_salary_monthly, 2),
-        'employee_pf_monthly': round(employee_pf_monthly, 2),
-        'professional_tax_monthly': round(professional_tax_monthly, 2),
-        'income_tax_monthly': round(income_tax_monthly, 2),
-        'total_deductions_monthly': round(total_deductions_monthly, 2),
-        'employer_pf_monthly': round(employer_pf_monthly, 2),
-        'gratuity_monthly': round(gratuity_monthly, 2),
-        'total_contributions_monthly': round(total_contributions_monthly, 2),
-        'takehome_annual': round(takehome_annual, 2),
-        'total_deductions_annual': round(total_deductions_annual, 2),
-        'total_contributions_annual': round(total_contributions_annual, 2),
-        'basic_salary_annual': round(basic_salary_annual, 2),
-        'hra_annual': round(hra_annual, 2),
-        'employee_pf_annual': round(employee_pf_annual, 2),
-        'employer_pf_annual': round(employer_pf_annual, 2),
-        'gratuity_annual': round(gratuity_annual, 2),
-        'income_tax_annual': round(income_tax_annual, 2),
-        'tax_regime': tax_regime,
-        'hra_exemption': round(hra_exemption, 2),
-        'taxable_income': round(taxable_income, 2)
-    }
-
-# Daily Compound Interest Calculator
-@app.route('/daily-compound-interest-calculator/')
-def daily_compound_interest_calculator():
-    return render_template('daily_compound_interest_calculator.html')
-
-@app.route('/calculate-daily-compound-interest', methods=['POST'])
-def calculate_daily_compound_interest_route():
-    try:
-        data = request.get_json()
-        
-        principal = float(data.get('principal', 0))
-        annual_rate = float(data.get('annual_rate', 10))
-        time_years = float(data.get('time_years', 1))
-        time_period_value = data.get('time_period_value', 1)
-        time_period_unit = data.get('time_period_unit', 'days')
-        compounding_frequency = data.get('compounding_frequency', 'monthly')
-        
-        # Validate inputs
-        if principal <= 0:
-            return jsonify({'error': 'Principal amount must be greater than 0'}), 400
-        if annual_rate <= 0:
-            return jsonify({'error': 'Interest rate must be greater than 0'}), 400
-        if time_years <= 0:
-            return jsonify({'error': 'Time period must be greater than 0'}), 400
-        if principal > 10000000:  # 1 crore limit
-            return jsonify({'error': 'Principal amount cannot exceed ₹1,00,00,000'}), 400
-        if annual_rate > 50:
-            return jsonify({'error': 'Interest rate cannot exceed 50%'}), 400
-        if time_years > 50:
-            return jsonify({'error': 'Time period cannot exceed 50 years'}), 400
-        
-        # Calculate compound interest
-        result = calculate_daily_compound_interest_logic(principal, annual_rate, time_years, compounding_frequency, time_period_value, time_period_unit)
-        
-        return jsonify({
-            'status': 'success',
-            **result
-        })
-        
-    except Exception as e:
-        return jsonify({'status': 'error', 'error': str(e)}), 400
-
-def calculate_daily_compound_interest_logic(principal, annual_rate, time_years, compounding_frequency, time_period_value=1, time_period_unit='days'):
-    """
-    Calculate compound interest using the formula: A = P(1 + r/n)^(nt)
-    Where:
-    - P = Principal amount
-    - r = Annual interest rate (as decimal)
-    - n = Number of times interest is compounded per year
-    - t = Time in years
-    """
-    
-    # Convert percentage to decimal
-    rate_decimal = annual_rate / 100
-    
-    # Define compounding frequencies
-    frequency_map = {
-        'daily': 365,
-        'weekly': 52,
-        'monthly': 12,
-        'quarterly': 4,
-        'half-yearly': 2,
-        'annually': 1
-    }
-    
-    n = frequency_map.get(compounding_frequency, 365)
-    
-    # Calculate future value using compound interest formula
-    future_value = principal * ((1 + rate_decimal / n) ** (n * time_years))
-    
-    # Calculate interest earned
-    interest_earned = future_value - principal
-    
-    # Calculate comparison table for all frequencies
-    comparison_data = []
-    for freq_name, freq_value in frequency_map.items():
-        fv = principal * ((1 + rate_decimal / freq_value) ** (freq_value * time_years))
-        interest = fv - principal
-        comparison_data.append({
-            'frequency': freq_name.title().replace('-', ' '),
-            'future_value': round(fv, 2),
-            'interest_earned': round(interest, 2),
-            'difference': round(interest - interest_earned, 2) if freq_name != compounding_frequency else 0
-        })
-    
-    # Sort comparison data by interest earned (descending)
-    comparison_data.sort(key=lambda x: x['interest_earned'], reverse=True)
-    
-    # Calculate monthly breakdown for visualization (if time > 1 year)
-    monthly_breakdown = []
-    if time_years >= 1:
-        for month in range(1, min(int(time_years * 12) + 1, 61)):  # Max 5 years monthly data
-            time_months = month / 12
-            monthly_fv = principal * ((1 + rate_decimal / n) ** (n * time_months))
-            monthly_breakdown.append({
-                'month': month,
-                'time_years': round(time_months, 2),
-                'future_value': round(monthly_fv, 2),
-                'interest_earned': round(monthly_fv - principal, 2)
-            })
-    
-    # Create more descriptive summary text
-    unit_text = time_period_unit[:-1] if time_period_value == 1 else time_period_unit
-    summary_text = f"Investing ₹{principal:,.0f} at {annual_rate}% compounded {compounding_frequency} for {time_period_value} {unit_text} will grow to ₹{future_value:,.2f}."
-    
-    return {
-        'principal': round(principal, 2),
-        'annual_rate': annual_rate,
-        'time_years': time_years,
-        'time_period_value': time_period_value,
-        'time_period_unit': time_period_unit,
-        'compounding_frequency': compounding_frequency,
-        'future_value': round(future_value, 2),
-        'interest_earned': round(interest_earned, 2),
-        'effective_rate': round(((future_value / principal) ** (1 / time_years) - 1) * 100, 2),
-        'comparison_data': comparison_data,
-        'monthly_breakdown': monthly_breakdown,
-        'summary_text': summary_text
-    }
-
-@app.route('/gst-calculator/')
-def gst_calculator():
-    return render_template('gst_calculator.html')
-
-@app.route('/reverse-gst-calculator/')
-def reverse_gst_calculator():
-    return render_template('reverse_gst_calculator.html')
-
-def calculate_gst_amounts(amount, gst_rate, calculation_type):
-    """
-    Calculate GST amounts based on amount, rate and calculation type
-    """
-    try:
-        # Validate inputs
-        if amount < 0:
-            raise ValueError("Amount cannot be negative")
-        
-        if gst_rate < 0 or gst_rate > 100:
-            raise ValueError("GST rate must be between 0 and 100")
-        
-        if calculation_type not in ['add', 'remove']:
-            raise ValueError("Calculation type must be 'add' or 'remove'")
-        
-        # Calculate based on type
-        if calculation_type == 'add':
-            # Add GST: amount is exclusive of GST
-            base_amount = amount
-            gst_amount = amount * (gst_rate / 100)
-            total_amount = amount + gst_amount
-        else:
-            # Remove GST: amount is inclusive of GST
-            total_amount = amount
-            gst_amount = amount * (gst_rate / (100 + gst_rate))
-            base_amount = amount - gst_amount
-        
-        return {
-            'original_amount': round(amount, 2),
-            'base_amount': round(base_amount, 2),
-            'gst_amount': round(gst_amount, 2),
-            'total_amount': round(total_amount, 2),
-            'gst_rate': gst_rate,
-            'calculation_type': calculation_type,
-            'gst_percentage_of_total': round((gst_amount / total_amount) * 100, 2) if total_amount > 0 else 0,
-            'effective_rate': round((gst_amount / base_amount) * 100, 2) if base_amount > 0 else 0
-        }
-        
-    except Exception as e:
-        raise ValueError(f"GST calculation error: {str(e)}")
-
-@app.route('/calculate-gst', methods=['POST'])
-def calculate_gst():
-    try:
-        data = request.get_json()
-        
-        # Extract parameters
-        amount = float(data.get('amount', 0))
-        gst_rate = float(data.get('gst_rate', 0))
-        calculation_type = data.get('calculation_type', 'add')
-        
-        # Validate amount limit
-        if amount > 10000000:  # 1 crore limit
-            return jsonify({'error': 'Amount cannot exceed ₹1,00,00,000'})
-        
-        # Calculate GST
-        result = calculate_gst_amounts(amount, gst_rate, calculation_type)
-        
-        # Add additional information
-        result['calculation_summary'] = generate_gst_summary(result)
-        result['breakdown_steps'] = generate_gst_breakdown_steps(result)
-        
-        return jsonify(result)
-        
-    except ValueError as e:
-        return jsonify({'error': str(e)})
-    except Exception as e:
-        return jsonify({'error': f'Calculation failed: {str(e)}'})
-
-@app.route('/calculate-reverse-gst', methods=['POST'])
-def calculate_reverse_gst():
-    try:
-        data = request.get_json()
-        
-        # Extract parameters
-        inclusive_amount = float(data.get('inclusive_amount', 0))
-        gst_rate = float(data.get('gst_rate', 0))
-        transaction_type = data.get('transaction_type', 'intra-state')
-        
-        # Validate inputs
-        if inclusive_amount <= 0:
-            return jsonify({'error': 'Amount must be greater than 0'})
-        
-        if inclusive_amount > 20000000:  # 2 crore limit
-            return jsonify({'error': 'Amount cannot exceed ₹2,00,00,000'})
-        
-        if gst_rate < 0 or gst_rate > 100:
-            return jsonify({'error': 'GST rate must be between 0 and 100'})
-        
-        if transaction_type not in ['intra-state', 'inter-state']:
-            return jsonify({'error': 'Transaction type must be intra-state or inter-state'})
-        
-        # Calculate reverse GST
-        result = calculate_reverse_gst_amounts(inclusive_amount, gst_rate, transaction_type)
-        
-        # Add additional information
-        result['calculation_summary'] = generate_reverse_gst_summary(result)
-        
-        return jsonify(result)
-        
-    except ValueError as e:
-        return jsonify({'error': str(e)})
-    except Exception as e:
-        return jsonify({'error': f'Calculation failed: {str(e)}'})
-
-def calculate_reverse_gst_amounts(inclusive_amount, gst_rate, transaction_type):
-    """
-    Calculate reverse GST amounts from inclusive amount
-    """
-    try:
-        # Calculate base price and GST amount
-        base_price = inclusive_amount / (1 + (gst_rate / 100))
-        gst_amount = inclusive_amount - base_price
-        
-        # Initialize tax components
-        cgst = 0
-        sgst = 0
-        igst = 0
-        
-        if transaction_type == 'intra-state':
-            # For intra-state: CGST + SGST = GST Amount
-            cgst = gst_amount / 2
-            sgst = gst_amount / 2
-        else:
-            # For inter-state: IGST = GST Amount
-            igst = gst_amount
-        
-        return {
-            'inclusive_amount': round(inclusive_amount, 2),
-            'base_price': round(base_price, 2),
-            'gst_amount': round(gst_amount, 2),
-            'gst_rate': gst_rate,
-            'transaction_type': transaction_type,
-            'cgst': round(cgst, 2),
-            'sgst': round(sgst, 2),
-            'igst': round(igst, 2),
-            'gst_percentage_of_total': round((gst_amount / inclusive_amount) * 100, 2) if inclusive_amount > 0 else 0,
-            'effective_rate': round((gst_amount / base_price) * 100, 2) if base_price > 0 else 0
-        }
-        
-    except Exception as e:
-        raise ValueError(f"Reverse GST calculation error: {str(e)}")
-
-def generate_reverse_gst_summary(result):
-    """Generate a text summary of the reverse GST calculation"""
-    summary = f"₹{result['inclusive_amount']:,.2f} includes ₹{result['gst_amount']:,.2f} in GST at {result['gst_rate']}%.\n"
-    summary += f"• Base Price: ₹{result['base_price']:,.2f}\n"
-    summary += f"• GST Amount: ₹{result['gst_amount']:,.2f}\n"
-    
-    if result['transaction_type'] == 'intra-state':
-        summary += f"• CGST ({result['gst_rate']/2}%): ₹{result['cgst']:,.2f}\n"
-        summary += f"• SGST ({result['gst_rate']/2}%): ₹{result['sgst']:,.2f}"
-    else:
-        summary += f"• IGST ({result['gst_rate']}%): ₹{result['igst']:,.2f}"
-    
-    return summary
-
-def generate_gst_summary(result):
-    """Generate a text summary of the GST calculation"""
-    type_text = "Add GST (Exclusive)" if result['calculation_type'] == 'add' else "Remove GST (Inclusive)"
-    
-    summary = f"For an amount of ₹{result['original_amount']:,.2f} with {result['gst_rate']}% GST ({type_text}):\n"
-    summary += f"• Base Amount: ₹{result['base_amount']:,.2f}\n"
-    summary += f"• GST Amount: ₹{result['gst_amount']:,.2f}\n"
-    summary += f"• Total Amount: ₹{result['total_amount']:,.2f}"
-    
-    return summary
-
-def generate_gst_breakdown_steps(result):
-    """Generate step-by-step calculation breakdown"""
-    steps = []
-    
-    if result['calculation_type'] == 'add':
-        steps.append(f"Step 1: Base Amount = ₹{result['original_amount']:,.2f} (given)")
-        steps.append(f"Step 2: GST Amount = Base Amount × (GST Rate / 100)")
-        steps.append(f"Step 2: GST Amount = ₹{result['base_amount']:,.2f} × ({result['gst_rate']} / 100)")
-        steps.append(f"Step 2: GST Amount = ₹{result['gst_amount']:,.2f}")
-        steps.append(f"Step 3: Total Amount = Base Amount + GST Amount")
-        steps.append(f"Step 3: Total Amount = ₹{result['base_amount']:,.2f} + ₹{result['gst_amount']:,.2f}")
-        steps.append(f"Step 3: Total Amount = ₹{result['total_amount']:,.2f}")
-    else:
-        steps.append(f"Step 1: Total Amount = ₹{result['original_amount']:,.2f} (given)")
-        steps.append(f"Step 2: GST Amount = Total Amount × (GST Rate / (100 + GST Rate))")
-        steps.append(f"Step 2: GST Amount = ₹{result['total_amount']:,.2f} × ({result['gst_rate']} / (100 + {result['gst_rate']}))")
-        steps.append(f"Step 2: GST Amount = ₹{result['gst_amount']:,.2f}")
-        steps.append(f"Step 3: Base Amount = Total Amount - GST Amount")
-        steps.append(f"Step 3: Base Amount = ₹{result['total_amount']:,.2f} - ₹{result['gst_amount']:,.2f}")
-        steps.append(f"Step 3: Base Amount = ₹{result['base_amount']:,.2f}")
-    
-    return steps
-
-@app.route('/sovereign-gold-bonds-calculator/')
-def sovereign_gold_bonds_calculator():
-    return render_template('sovereign_gold_bonds_calculator.html')
-
-@app.route('/calculate-sgb', methods=['POST'])
-def calculate_sgb():
-    try:
-        data = request.get_json()
-        
-        # Input parameters
-        investment_quantity = float(data.get('investment_quantity', 1))  # in grams
-        issue_price_per_gram = float(data.get('issue_price_per_gram', 6000))  # in ₹
-        expected_gold_price_maturity = float(data.get('expected_gold_price_maturity', 7500))  # in ₹
-        interest_rate = float(data.get('interest_rate', 2.5))  # in %
-        tenure_years = int(data.get('tenure_years', 8))  # in years
-        
-        # Validate inputs
-        if investment_quantity <= 0:
-            return jsonify({'error': 'Investment quantity must be greater than 0'}), 400
-        if issue_price_per_gram <= 0:
-            return jsonify({'error': 'Issue price must be greater than 0'}), 400
-        if expected_gold_price_maturity <= 0:
-            return jsonify({'error': 'Expected gold price must be greater than 0'}), 400
-        if interest_rate < 0:
-            return jsonify({'error': 'Interest rate cannot be negative'}), 400
-        if tenure_years <= 0:
-            return jsonify({'error': 'Tenure must be greater than 0'}), 400
-        
-        # Calculate SGB returns
-        result = calculate_sgb_returns(
-            investment_quantity,
-            issue_price_per_gram,
-            expected_gold_price_maturity,
-            interest_rate,
-            tenure_years
-        )
-        
-        return jsonify(result)
-        
-    except ValueError as e:
-        return jsonify({'error': f'Invalid input: {str(e)}'}), 400
-    except Exception as e:
-        return jsonify({'error': str(e)}), 400
-
-def calculate_sgb_returns(investment_quantity, issue_price_per_gram, expected_gold_price_maturity, interest_rate, tenure_years):
-    """
-    Calculate Sovereign Gold Bonds (SGB) returns
-    Features:
-    - Calculate total investment amount
-    - Calculate interest earned over tenure
-    - Calculate capital gain based on gold price appreciation
-    - Calculate total return and annualized return
-    """
-    
-    # Calculate total investment
-    total_investment = investment_quantity * issue_price_per_gram
-    
-    # Calculate annual interest amount (interest is paid on issue price, not current market price)
-    annual_interest = total_investment * (interest_rate / 100)
-    total_interest_earned = annual_interest * tenure_years
-    
-    # Calculate maturity value (based on expected gold price)
-    maturity_value = investment_quantity * expected_gold_price_maturity
-    
-    # Calculate capital gain
-    capital_gain = maturity_value - total_investment
-    
-    # Calculate total return (maturity value + interest earned)
-    total_return = maturity_value + total_interest_earned
-    
-    # Calculate total gain (total return - investment)
-    total_gain = total_return - total_investment
-    
-    # Calculate annualized return
-    if total_investment > 0 and tenure_years > 0:
-        annualized_return = ((total_return / total_investment) ** (1 / tenure_years) - 1) * 100
-    else:
-        annualized_return = 0
-    
-    # Generate year-wise breakdown
-    year_wise_data = []
-    cumulative_interest = 0
-    
-    for year in range(1, tenure_years + 1):
-        cumulative_interest += annual_interest
-        
-        year_wise_data.append({
-            'year': year,
-            'annual_interest': annual_interest,
-            'cumulative_interest': cumulative_interest,
-            'investment_value': total_investment,  # SGB investment remains same
-            'estimated_gold_value': total_investment * (1 + ((expected_gold_price_maturity - issue_price_per_gram) / issue_price_per_gram) * (year / tenure_years)),
-            'total_value_with_interest': total_investment * (1 + ((expected_gold_price_maturity - issue_price_per_gram) / issue_price_per_gram) * (year / tenure_years)) + cumulative_interest
-        })
-    
-    return {
-        'investment_quantity': investment_quantity,
-        'issue_price_per_gram': issue_price_per_gram,
-        'expected_gold_price_maturity': expected_gold_price_maturity,
-        'interest_rate': interest_rate,
-        'tenure_years': tenure_years,
-        'total_investment': round(total_investment, 2),
-        'total_interest_earned': round(total_interest_earned, 2),
-        'maturity_value': round(maturity_value, 2),
-        'capital_gain': round(capital_gain, 2),
-        'total_return': round(total_return, 2),
-        'total_gain': round(total_gain, 2),
-        'annualized_return': round(annualized_return, 2),
-        'annual_interest': round(annual_interest, 2),
-        'year_wise_data': year_wise_data
-    }
-
-@app.route('/post-office-rd-calculator/')
-def post_office_rd_calculator():
-    return render_template('post_office_rd_calculator.html')
-
-@app.route('/calculate-post-office-rd', methods=['POST'])
-def calculate_post_office_rd():
-    try:
-        data = request.get_json()
-        
-        monthly_amount = float(data.get('monthly_amount', 0))
-        tenure_years = int(data.get('tenure_years', 1))
-        interest_rate = float(data.get('interest_rate', 6.7))
-        
-        # Validation
-        if monthly_amount < 100:
-            return jsonify({'error': 'Monthly deposit amount must be at least ₹100'})
-        
-        if tenure_years < 1 or tenure_years > 30:
-            return jsonify({'error': 'Tenure must be between 1 and 30 years'})
-        
-        if interest_rate < 1.0 or interest_rate > 15.0:
-            return jsonify({'error': 'Interest rate must be between 1% and 15%'})
-        
-        # Post Office RD calculation using the formula:
-        # M = R × [(1 + i)^n − 1] / [1 − (1 + i)^(-1/3)]
-        # Where:
-        # R = Monthly deposit
-        # i = Interest rate per quarter = annual rate / 400
-        # n = total quarters = years × 4
-        
-        quarterly_rate = interest_rate / 400  # Interest rate per quarter
-        total_quarters = tenure_years * 4
-        total_months = tenure_years * 12
-        
-        if quarterly_rate == 0:
-            # If no interest
-            maturity_value = monthly_amount * total_months
-        else:
-            # Apply RD formula
-            numerator = ((1 + quarterly_rate) ** total_quarters) - 1
-            denominator = 1 - ((1 + quarterly_rate) ** (-1/3))
-            maturity_value = monthly_amount * (numerator / denominator)
-        
-        total_investment = monthly_amount * total_months
-        total_interest = maturity_value - total_investment
-        
-        # Calculate maturity date
-        from datetime import datetime, timedelta
-        today = datetime.now()
-        maturity_date = datetime(today.year + tenure_years, today.month, today.day)
-        
-        # Generate year-wise data
-        year_wise_data = []
-        cumulative_investment = 0
-        cumulative_value = 0
-        
-        for year in range(1, tenure_years + 1):
-            yearly_deposits = monthly_amount * 12
-            cumulative_investment += yearly_deposits
-            
-            # Calculate value at end of year using compound growth
-            quarters_completed = year * 4
-            
-            if quarterly_rate == 0:
-                year_end_value = cumulative_investment
-            else:
-                numerator_year = ((1 + quarterly_rate) ** quarters_completed) - 1
-                denominator_year = 1 - ((1 + quarterly_rate) ** (-1/3))
-                year_end_value = monthly_amount * (numerator_year / denominator_year)
-            
-            opening_balance = cumulative_value
-            year_interest = year_end_value - opening_balance - yearly_deposits
-            cumulative_value = year_end_value
-            
-            year_wise_data.append({
-                'year': year,
-                'quarterly_deposits': yearly_deposits / 4,
-                'opening_balance': round(opening_balance),
-                'interest_earned': round(max(0, year_interest)),
-                'closing_balance': round(year_end_value),
-                'total_invested': round(cumulative_investment)
-            })
-        
-        return jsonify({
-            'total_investment': round(total_investment),
-            'total_interest': round(total_interest),
-            'maturity_value': round(maturity_value),
-            'maturity_date': maturity_date.strftime('%b %Y'),
-            'monthly_amount': monthly_amount,
-            'tenure_years': tenure_years,
-            'interest_rate': interest_rate,
-            'year_wise_data': year_wise_data
-        })
-        
-    except Exception as e:
-        return jsonify({'error': f'Calculation error: {str(e)}'})
-
-@app.route('/future-value-calculator/')
-def future_value_calculator():
-    return render_template('future_value_calculator.html')
-
-def calculate_future_value_returns(principal, annual_rate, time_years, compounding_frequency):
-    """
-    Calculate Future Value using compound interest formula
-    FV = P × (1 + r/n) ^ (nt)
-    
-    Where:
-    P = Principal
-    r = Annual rate (as decimal)
-    n = Frequency per year (12 for monthly, etc.)
-    t = Time in years
-    """
-    try:
-        # Validate inputs
-        if principal <= 0:
-            raise ValueError("Principal amount must be greater than 0")
-        if annual_rate < 0:
-            raise ValueError("Interest rate cannot be negative")
-        if time_years <= 0:
-            raise ValueError("Time period must be greater than 0")
-        
-        # Set compounding frequency based on selection
-        frequency_mapping = {
-            'annually': 1,
-            'semi-annually': 2,
-            'quarterly': 4,
-            'monthly': 12,
-            'daily': 365
-        }
-        
-        n = frequency_mapping.get(compounding_frequency, 12)
-        r = annual_rate / 100  # Convert percentage to decimal
-        
-        # Calculate future value using compound interest formula
-        future_value = principal * ((1 + r / n) ** (n * time_years))
-        total_interest = future_value - principal
-        
-        # Generate year-wise breakdown
-        year_wise_data = []
-        for year in range(1, int(time_years) + 1):
-            year_fv = principal * ((1 + r / n) ** (n * year))
-            year_interest = year_fv - principal
-            
-            year_wise_data.append({
-                'year': year,
-                'principal': round(principal, 2),
-                'interest_earned': round(year_interest, 2),
-                'future_value': round(year_fv, 2),
-                'growth_rate': round(((year_fv - principal) / principal) * 100, 2)
-            })
-        
-        return {
-            'principal': round(principal, 2),
-            'future_value': round(future_value, 2),
-            'total_interest': round(total_interest, 2),
-            'annual_rate': annual_rate,
-            'time_years': time_years,
-            'compounding_frequency': compounding_frequency,
-            'compounding_periods_per_year': n,
-            'year_wise_data': year_wise_data,
-            'effective_annual_rate': round(((1 + r / n) ** n - 1) * 100, 2)
-        }
-        
-    except Exception as e:
-        raise Exception(f"Error calculating future value: {str(e)}")
-
-@app.route('/calculate-future-value', methods=['POST'])
-def calculate_future_value_route():
-    try:
-        data = request.get_json()
-        
-        principal = float(data.get('principal', 0))
-        annual_rate = float(data.get('annual_rate', 8))
-        time_years = float(data.get('time_years', 5))
-        compounding_frequency = data.get('compounding_frequency', 'monthly')
-        
-        # Calculate future value returns
-        result = calculate_future_value_returns(principal, annual_rate, time_years, compounding_frequency)
-        
-        return jsonify({
-            'status': 'success',
-            **result
-        })
-        
-    except Exception as e:
-        return jsonify({'status': 'error', 'error': str(e)}), 400
-
-
-# Marriage Planning Calculator Routes
-@app.route('/marriage-planning-calculator/')
-def marriage_planning_calculator():
-    return render_template('marriage_planning_calculator.html')
-
-@app.route('/calculate-marriage-planning', methods=['POST'])
-def calculate_marriage_planning_route():
-    try:
-        data = request.get_json()
-        
-        current_marriage_cost = float(data.get('current_marriage_cost', 500000))
-        inflation_rate = float(data.get('inflation_rate', 6))
-        current_age = int(data.get('current_age', 5))
-        marriage_age = int(data.get('marriage_age', 25))
-        expected_return = float(data.get('expected_return', 8))
-        existing_savings = float(data.get('existing_savings', 0))
-        
-        # Validate inputs
-        if marriage_age <= current_age:
-            return jsonify({'error': 'Marriage age must be greater than current age'}), 400
-        
-        if current_age < 0 or current_age > 25:
-            return jsonify({'error': 'Current age must be between 0 and 25 years'}), 400
-            
-        if marriage_age < 18 or marriage_age > 35:
-            return jsonify({'error': 'Marriage age must be between 18 and 35 years'}), 400
-            
-        if inflation_rate < 3 or inflation_rate > 12:
-            return jsonify({'error': 'Inflation rate must be between 3% and 12%'}), 400
-            
-        if expected_return < 4 or expected_return > 20:
-            return jsonify({'error': 'Expected return must be between 4% and 20%'}), 400
-        
-        # Calculate marriage planning
-        result = calculate_marriage_planning_details(
-            current_marriage_cost, inflation_rate, current_age, 
-            marriage_age, expected_return, existing_savings
-        )
-        
-        return jsonify(result)
-        
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-def calculate_marriage_planning_details(current_cost, inflation_rate, current_age, marriage_age, expected_return, existing_savings):
-    """
-    Calculate marriage planning details
-    """
-    try:
-        # Calculate years until marriage
-        years_until_marriage = marriage_age - current_age
-        
-        # Calculate future marriage cost with inflation
-        future_cost = current_cost * ((1 + inflation_rate / 100) ** years_until_marriage)
-        
-        # Calculate growth of existing savings
-        future_value_existing_savings = existing_savings * ((1 + expected_return / 100) ** years_until_marriage)
-        
-        # Calculate required corpus (considering existing savings growth)
-        required_corpus = max(0, future_cost - future_value_existing_savings)
-        
-        # Calculate monthly investment required using SIP formula
-        monthly_rate = expected_return / 12 / 100
-        total_months = years_until_marriage * 12
-        
-        monthly_investment = 0
-        if required_corpus > 0 and total_months > 0:
-            if monthly_rate > 0:
-                # PMT formula for SIP
-                monthly_investment = required_corpus * monthly_rate / ((1 + monthly_rate) ** total_months - 1)
-            else:
-                monthly_investment = required_corpus / total_months
-        
-        # Calculate yearly breakdown for table
-        year_wise_data = []
-        total_invested = 0
-        portfolio_value = existing_savings
-        annual_investment = monthly_investment * 12
-        
-        for year in range(1, years_until_marriage + 1):
-            opening_balance = portfolio_value
-            
-            # Calculate returns (simplified model - assumes investment happens at beginning of year)
-            returns_earned = (opening_balance + annual_investment) * (expected_return / 100)
-            closing_balance = opening_balance + annual_investment + returns_earned
-            
-            total_invested += annual_investment
-            portfolio_value = closing_balance
-            
-            year_wise_data.append({
-                'year': year,
-                'annual_investment': round(annual_investment, 2),
-                'opening_balance': round(opening_balance, 2),
-                'returns_earned': round(returns_earned, 2),
-                'closing_balance': round(closing_balance, 2),
-                'total_invested_till_date': round(total_invested, 2)
-            })
-        
-        # Calculate total growth
-        final_value = portfolio_value
-        total_growth = final_value - total_invested - existing_savings
-        
-        return {
-            'future_marriage_cost': round(future_cost, 2),
-            'monthly_investment_required': round(monthly_investment, 2),
-            'total_corpus_required': round(required_corpus, 2),
-            'years_until_marriage': years_until_marriage,
-            'total_investment': round(total_invested, 2),
-            'investment_growth': round(total_growth, 2),
-            'existing_savings': existing_savings,
-            'future_value_existing_savings': round(future_value_existing_savings, 2),
-            'final_portfolio_value': round(final_value, 2),
-            'year_wise_data': year_wise_data
-        }
-        
-    except Exception as e:
-        raise Exception(f"Error in marriage planning calculation: {str(e)}")
-
-def calculate_vacation_savings_planning(vacation_cost, months_until_vacation, current_savings, expected_return, expected_inflation=0):
-    """
-    Calculate vacation savings plan with optional investment returns and inflation adjustment
-    """
-    try:
-        # Calculate inflation-adjusted vacation cost
-        years_until_vacation = months_until_vacation / 12
-        inflation_adjusted_cost = vacation_cost * ((1 + expected_inflation / 100) ** years_until_vacation)
-        
-        remaining_amount = inflation_adjusted_cost - current_savings
-        monthly_rate = expected_return / 12 / 100
-        
-        if remaining_amount <= 0:
-            # Already have enough savings
-            return {
-                'vacation_cost': vacation_cost,
-                'inflation_adjusted_cost': inflation_adjusted_cost,
-                'months_until_vacation': months_until_vacation,
-                'current_savings': current_savings,
-                'expected_return': expected_return,
-                'expected_inflation': expected_inflation,
-                'remaining_amount': 0,
-                'monthly_savings_needed': 0,
-                'estimated_accumulated_value': current_savings,
-                'total_investment_returns': 0,
-                'month_wise_data': []
-            }
-        
-        # Calculate monthly savings needed
-        if expected_return > 0 and months_until_vacation > 1:
-            # With investment returns - use compound interest formula
-            # Future value of current savings
-            future_value_current_savings = current_savings * ((1 + monthly_rate) ** months_until_vacation)
-            
-            # Remaining amount needed after current savings grow
-            remaining_needed = inflation_adjusted_cost - future_value_current_savings
-            
-            if remaining_needed > 0:
-                # Calculate monthly investment needed using PMT formula
-                # PMT = [PV * r] / [(1 + r)^n - 1]
-                monthly_savings_needed = (remaining_needed * monthly_rate) / ((1 + monthly_rate) ** months_until_vacation - 1)
-            else:
-                monthly_savings_needed = 0
-                
-            # Calculate estimated accumulated value
-            if monthly_savings_needed > 0:
-                future_value_monthly_savings = monthly_savings_needed * (((1 + monthly_rate) ** months_until_vacation - 1) / monthly_rate)
-                estimated_accumulated_value = future_value_current_savings + future_value_monthly_savings
-            else:
-                estimated_accumulated_value = future_value_current_savings
-                
-            # Calculate total investment returns
-            total_contributions = current_savings + (monthly_savings_needed * months_until_vacation)
-            total_investment_returns = estimated_accumulated_value - total_contributions
-        else:
-            # Simple calculation without returns
-            monthly_savings_needed = remaining_amount / months_until_vacation
-            estimated_accumulated_value = inflation_adjusted_cost
-            total_investment_returns = 0
-        
-        # Generate month-wise data
-        month_wise_data = []
-        cumulative_savings = current_savings
-        total_investment_growth = 0
-        
-        for month in range(1, months_until_vacation + 1):
-            # Add monthly savings
-            monthly_contribution = monthly_savings_needed
-            cumulative_savings += monthly_contribution
-            
-            # Calculate investment growth for this month
-            if expected_return > 0:
-                # Growth on current balance + monthly contribution
-                previous_total = cumulative_savings - monthly_contribution + total_investment_growth
-                monthly_growth = (previous_total + monthly_contribution) * monthly_rate
-                total_investment_growth += monthly_growth
-            else:
-                monthly_growth = 0
-            
-            total_amount = cumulative_savings + total_investment_growth
-            progress = min((total_amount / inflation_adjusted_cost) * 100, 100)
-            
-            month_wise_data.append({
-                'month': month,
-                'monthly_savings': round(monthly_contribution, 2),
-                'cumulative_savings': round(cumulative_savings, 2),
-                'investment_growth': round(total_investment_growth, 2),
-                'total_amount': round(total_amount, 2),
-                'progress': round(progress, 1)
-            })
-        
-        return {
-            'vacation_cost': vacation_cost,
-            'inflation_adjusted_cost': round(inflation_adjusted_cost, 2),
-            'months_until_vacation': months_until_vacation,
-            'current_savings': current_savings,
-            'expected_return': expected_return,
-            'expected_inflation': expected_inflation,
-            'remaining_amount': round(remaining_amount, 2),
-            'monthly_savings_needed': round(monthly_savings_needed, 2),
-            'estimated_accumulated_value': round(estimated_accumulated_value, 2),
-            'total_investment_returns': round(total_investment_returns, 2),
-            'month_wise_data': month_wise_data
-        }
-        
-    except Exception as e:
-        raise Exception(f"Error in vacation savings calculation: {str(e)}")
-
-@app.route('/calculate-vacation-savings', methods=['POST'])
-def calculate_vacation_savings_route():
-    try:
-        data = request.get_json()
-        
-        vacation_cost = float(data.get('vacation_cost', 0))
-        months_until_vacation = int(data.get('months_until_vacation', 1))
-        current_savings = float(data.get('current_savings', 0))
-        expected_return = float(data.get('expected_return', 0))
-        expected_inflation = float(data.get('expected_inflation', 6))
-        
-        # Validate inputs
-        if vacation_cost <= 0:
-            return jsonify({'status': 'error', 'error': 'Vacation cost must be greater than 0'}), 400
-            
-        if months_until_vacation <= 0:
-            return jsonify({'status': 'error', 'error': 'Months until vacation must be greater than 0'}), 400
-            
-        if current_savings < 0:
-            return jsonify({'status': 'error', 'error': 'Current savings cannot be negative'}), 400
-            
-        if current_savings > vacation_cost:
-            return jsonify({'status': 'error', 'error': 'Current savings cannot exceed vacation cost'}), 400
-            
-        if expected_return < 0 or expected_return > 30:
-            return jsonify({'status': 'error', 'error': 'Expected return must be between 0% and 30%'}), 400
-            
-        if expected_inflation < 0 or expected_inflation > 20:
-            return jsonify({'status': 'error', 'error': 'Expected inflation must be between 0% and 20%'}), 400
-        
-        # Calculate vacation savings plan
-        result = calculate_vacation_savings_planning(
-            vacation_cost, months_until_vacation, current_savings, expected_return, expected_inflation
-        )
-        
-        return jsonify({
-            'status': 'success',
-            **result
-        })
-        
-    except Exception as e:
-        return jsonify({'status': 'error', 'error': str(e)}), 400
-
-@app.route('/pension-calculator/')
-def pension_retirement_calculator():
-    return render_template('pension_calculator.html')
-
-@app.route('/calculate-pension-requirements', methods=['POST'])
-def calculate_pension_requirements():
-    try:
-        data = request.get_json()
-        
-        # Input parameters
-        current_expenses = float(data.get('current_expenses', 0))
-        current_age = int(data.get('current_age', 25))
-        retirement_age = int(data.get('retirement_age', 60))
-        life_expectancy = int(data.get('life_expectancy', 85))
-        retirement_expense_ratio = float(data.get('retirement_expense_ratio', 100)) / 100
-        inflation_rate = float(data.get('inflation_rate', 6)) / 100
-        pre_retirement_return = float(data.get('pre_retirement_return', 8)) / 100
-        post_retirement_return = float(data.get('post_retirement_return', 6)) / 100
-        existing_savings = float(data.get('existing_savings', 0))
-        
-        # Validation
-        if current_age >= retirement_age:
-            return jsonify({'error': 'Current age must be less than retirement age'}), 400
-            
-        if retirement_age >= life_expectancy:
-            return jsonify({'error': 'Retirement age must be less than life expectancy'}), 400
-            
-        if current_expenses <= 0:
-            return jsonify({'error': 'Current monthly expenses must be greater than 0'}), 400
-        
-        # Calculate pension requirements
-        result = calculate_pension_needs(
-            current_expenses, current_age, retirement_age, life_expectancy,
-            retirement_expense_ratio, inflation_rate, pre_retirement_return,
-            post_retirement_return, existing_savings
-        )
-        
-        return jsonify(result)
-        
-    except Exception as e:
-        return jsonify({'error': str(e)}), 400
-
-def calculate_pension_needs(current_expenses, current_age, retirement_age, life_expectancy,
-                           retirement_expense_ratio, inflation_rate, pre_retirement_return,
-                           post_retirement_return, existing_savings):
-    """
-    Calculate pension planning requirements using standard financial formulas
-    """
-    
-    # Years calculations
-    years_to_retirement = retirement_age - current_age
-    retirement_years = life_expectancy - retirement_age
-    
-    # Calculate inflated monthly expenses at retirement
-    inflated_monthly_expenses = current_expenses * ((1 + inflation_rate) ** years_to_retirement) * retirement_expense_ratio
-    
-    # Calculate annual expenses at retirement
-    inflated_annual_expenses = inflated_monthly_expenses * 12
-    
-    # Calculate retirement corpus needed using present value of annuity formula
-    # For post-retirement returns adjusted for inflation
-    real_post_retirement_return = (1 + post_retirement_return) / (1 + inflation_rate) - 1
-    
-    if real_post_retirement_return <= 0:
-        # If real return is negative or zero, use simple multiplication
-        retirement_corpus_needed = inflated_annual_expenses * retirement_years
-    else:
-        # Present value of annuity formula: PV = PMT * [(1 - (1 + r)^-n) / r]
-        pv_factor = (1 - (1 + real_post_retirement_return) ** (-retirement_years)) / real_post_retirement_return
-        retirement_corpus_needed = inflated_annual_expenses * pv_factor
-    
-    # Adjust corpus for existing savings growth
-    existing_savings_future_value = existing_savings * ((1 + pre_retirement_return) ** years_to_retirement)
-    net_corpus_needed = retirement_corpus_needed - existing_savings_future_value
-    
-    # Calculate monthly savings required using future value of annuity formula
-    if net_corpus_needed <= 0:
-        monthly_savings_required = 0
-        annual_savings_required = 0
-    else:
-        # Future value of annuity formula: FV = PMT * [((1 + r)^n - 1) / r]
-        monthly_return = pre_retirement_return / 12
-        total_months = years_to_retirement * 12
-        
-        if monthly_return <= 0:
-            monthly_savings_required = net_corpus_needed / total_months
-        else:
-            fv_factor = ((1 + monthly_return) ** total_months - 1) / monthly_return
-            monthly_savings_required = net_corpus_needed / fv_factor
-        
-        annual_savings_required = monthly_savings_required * 12
-    
-    # Create year-wise breakdown for first 10 years
-    year_wise_data = []
-    cumulative_savings = existing_savings
-    
-    for year in range(1, min(years_to_retirement + 1, 11)):
-        annual_investment = annual_savings_required
-        opening_balance = cumulative_savings
-        growth = opening_balance * pre_retirement_return
-        closing_balance = opening_balance + annual_investment + growth
-        
-        year_wise_data.append({
-            'year': year,
-            'age': current_age + year,
-            'annual_investment': round(annual_investment),
-            'opening_balance': round(opening_balance),
-            'growth': round(growth),
-            'closing_balance': round(closing_balance),
-            'cumulative_investment': round(annual_investment * year + existing_savings)
-        })
-        
-        cumulative_savings = closing_balance
-    
-    # Summary calculation
-    total_investment_needed = annual_savings_required * years_to_retirement
-    summary_statement = f"To sustain ₹{format_currency_simple(inflated_monthly_expenses)}/month in retirement, you'll need a corpus of ₹{format_currency_simple(retirement_corpus_needed)} and must save ₹{format_currency_simple(monthly_savings_required)}/month."
-    
-    return {
-        'current_expenses': round(current_expenses),
-        'current_age': current_age,
-        'retirement_age': retirement_age,
-        'life_expectancy': life_expectancy,
-        'years_to_retirement': years_to_retirement,
-        'retirement_years': retirement_years,
-        'inflated_monthly_expenses': round(inflated_monthly_expenses),
-        'inflated_annual_expenses': round(inflated_annual_expenses),
-        'retirement_corpus_needed': round(retirement_corpus_needed),
-        'existing_savings_future_value': round(existing_savings_future_value),
-        'net_corpus_needed': round(max(0, net_corpus_needed)),
-        'monthly_savings_required': round(monthly_savings_required),
-        'annual_savings_required': round(annual_savings_required),
-        'total_investment_needed': round(total_investment_needed),
-        'summary_statement': summary_statement,
-        'year_wise_data': year_wise_data,
-        'retirement_expense_ratio': retirement_expense_ratio * 100,
-        'inflation_rate': inflation_rate * 100,
-        'pre_retirement_return': pre_retirement_return * 100,
-        'post_retirement_return': post_retirement_return * 100
-    }
-
-def format_currency_simple(amount):
-    """Simple currency formatting for summary statements"""
-    if amount >= 10000000:  # 1 crore
-        return f"{amount/10000000:.1f} Cr"
-    elif amount >= 100000:  # 1 lakh
-        return f"{amount/100000:.1f} L"
-    elif amount >= 1000:  # 1 thousand
-        return f"{amount/1000:.0f}K"
-    else:
-        return f"{amount:.0f}"
-
-# ELSS vs SIP Calculator Routes
-
-@app.route('/elss-vs-sip-calculator/')
-def elss_vs_sip_calculator():
-    return render_template('elss_vs_sip_calculator.html')
-
-@app.route('/calculate-elss-vs-sip', methods=['POST'])
-def calculate_elss_vs_sip():
-    try:
-        data = request.get_json()
-        
-        # Extract input parameters
-        monthly_investment = float(data.get('monthly_investment', 5000))
-        investment_duration = int(data.get('investment_duration', 10))
-        sip_return_rate = float(data.get('sip_return_rate', 12.0))
-        elss_return_rate = float(data.get('elss_return_rate', 14.0))
-        tax_slab = float(data.get('tax_slab', 30))
-        
-        # Validate inputs
-        if monthly_investment < 500 or monthly_investment > 50000:
-            return jsonify({'error': 'Monthly investment must be between ₹500 and ₹50,000'}), 400
-        
-        if investment_duration < 3 or investment_duration > 30:
-            return jsonify({'error': 'Investment duration must be between 3 and 30 years'}), 400
-        
-        if sip_return_rate < 5 or sip_return_rate > 25:
-            return jsonify({'error': 'SIP return rate must be between 5% and 25%'}), 400
-        
-        if elss_return_rate < 8 or elss_return_rate > 30:
-            return jsonify({'error': 'ELSS return rate must be between 8% and 30%'}), 400
-        
-        if tax_slab < 5 or tax_slab > 30:
-            return jsonify({'error': 'Tax slab must be between 5% and 30%'}), 400
-        
-        # Calculate comparison results
-        result = calculate_elss_vs_sip_comparison(
-            monthly_investment, investment_duration, 
-            sip_return_rate, elss_return_rate, tax_slab
-        )
-        
-        return jsonify(result)
-        
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-def calculate_elss_vs_sip_comparison(monthly_investment, investment_duration, sip_return_rate, elss_return_rate, tax_slab):
-    """
-    Calculate and compare ELSS vs Regular SIP investments
-    """
-    try:
-        annual_investment = monthly_investment * 12
-        total_months = investment_duration * 12
-        
-        # Convert annual rates to monthly
-        sip_monthly_rate = sip_return_rate / (12 * 100)
-        elss_monthly_rate = elss_return_rate / (12 * 100)
-        
-        # Calculate SIP future value using compound interest formula
-        # FV = PMT * [((1 + r)^n - 1) / r] * (1 + r)
-        if sip_monthly_rate > 0:
-            sip_final_value = monthly_investment * (((pow(1 + sip_monthly_rate, total_months) - 1) / sip_monthly_rate) * (1 + sip_monthly_rate))
-        else:
-            sip_final_value = monthly_investment * total_months
-        
-        # Calculate ELSS future value using compound interest formula
-        if elss_monthly_rate > 0:
-            elss_final_value = monthly_investment * (((pow(1 + elss_monthly_rate, total_months) - 1) / elss_monthly_rate) * (1 + elss_monthly_rate))
-        else:
-            elss_final_value = monthly_investment * total_months
-        
-        # Calculate tax benefits
-        # ELSS eligible for tax deduction up to ₹1.5 lakh per year under Section 80C
-        elss_eligible_for_tax = min(annual_investment, 150000)
-        annual_tax_saved = elss_eligible_for_tax * (tax_slab / 100)
-        total_tax_saved = annual_tax_saved * investment_duration
-        
-        # Net benefit calculation (ELSS value + tax saved - SIP value)
-        net_benefit = (elss_final_value + total_tax_saved) - sip_final_value
-        
-        # Year-wise breakdown
-        year_wise_data = []
-        sip_running_value = 0
-        elss_running_value = 0
-        cumulative_tax_saved = 0
-        
-        for year in range(1, investment_duration + 1):
-            # Calculate values at end of each year
-            months_completed = year * 12
-            
-            # SIP value at end of year
-            if sip_monthly_rate > 0:
-                sip_running_value = monthly_investment * (((pow(1 + sip_monthly_rate, months_completed) - 1) / sip_monthly_rate) * (1 + sip_monthly_rate))
-            else:
-                sip_running_value = monthly_investment * months_completed
-            
-            # ELSS value at end of year
-            if elss_monthly_rate > 0:
-                elss_running_value = monthly_investment * (((pow(1 + elss_monthly_rate, months_completed) - 1) / elss_monthly_rate) * (1 + elss_monthly_rate))
-            else:
-                elss_running_value = monthly_investment * months_completed
-            
-            # Cumulative tax saved
-            cumulative_tax_saved += annual_tax_saved
-            
-            year_wise_data.append({
-                'year': year,
-                'annual_investment': annual_investment,
-                'sip_value': round(sip_running_value),
-                'elss_value': round(elss_running_value),
-                'annual_tax_saved': round(annual_tax_saved),
-                'elss_advantage': round((elss_running_value + cumulative_tax_saved) - sip_running_value)
-            })
-        
-        return {
-            'monthly_investment': monthly_investment,
-            'investment_duration': investment_duration,
-            'sip_return_rate': sip_return_rate,
-            'elss_return_rate': elss_return_rate,
-            'tax_slab': tax_slab,
-            'annual_investment': annual_investment,
-            'sip_final_value': round(sip_final_value),
-            'elss_final_value': round(elss_final_value),
-            'total_tax_saved': round(total_tax_saved),
-            'net_benefit': round(net_benefit),
-            'annual_tax_saved': round(annual_tax_saved),
-            'elss_eligible_for_tax': elss_eligible_for_tax,
-            'year_wise_data': year_wise_data
-        }
-        
-    except Exception as e:
-        raise Exception(f"Error calculating ELSS vs SIP comparison: {str(e)}")
-
-@app.route('/capital-gains-calculator-with-and-without-tax-slabs/')
-def capital_gains_calculator_with_and_without_tax_slabs():
-    """
-    Capital Gains Calculator (With & Without Tax Slabs)
-    
-    Calculates capital gains tax for various asset types including:
-    - Equity shares and mutual funds
-    - Debt mutual funds
-    - Property
-    - Gold and unlisted shares
-    - Crypto (VDA)
-    
-    Features:
-    - STCG/LTCG classification based on holding period
-    - Indexation benefits where applicable
-    - Tax exemptions (Section 54/54F/54EC for property, LTCG exemptions for equity)
-    - Tax calculation with and without income tax slab impact
-    - Cess and surcharge calculations
-    """
-    return render_template('capital_gains_calculator_with_and_without_tax_slabs.html')
+app = Flask(__name__)
+startup_profile.init_app(app)
+metrics.init_app(app)
+profiling.init_app(app)
+json_provider.init_app(app)
+compression.init_app(app)
+response_cache.init_app(app)
+page_cache.init_app(app)
+assets.init_app(app)
+vendor.init_app(app)
+batch.init_app(app)
+startup_profile.mark('app_setup')
+
+# Calculator code is imported on the first request to each blueprint's routes
+for blueprint in (loans, investments, tax, government_schemes, comparisons):
+    app.register_blueprint(blueprint.bp)
+startup_profile.mark('route_registration')
+
+prerender.init_app(app)
+
+if page_cache.TEMPLATE_WARM:
+    page_cache.warm(app)
+    startup_profile.mark('template_warming')
+
+startup_profile.finish(app)
 
 if __name__ == '__main__':
     app.run(debug=True) 
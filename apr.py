@@ -0,0 +1,138 @@
+import numpy as np
+
+import amortization
+import solver
+
+# APRs are solved between these monthly rates (-100% and 1000% a year). Fees
+# that push the APR beyond the upper one give no APR rather than the bound;
+# payments short of the amount disbursed give a negative APR.
+APR_MIN_MONTHLY_RATE = -100 / (12 * 100)
+APR_MAX_MONTHLY_RATE = 1000 / (12 * 100)
+
+def loan_cash_flows(principal, payment, periods, fees=0, advance=False):
+    """
+    Lender's cash flows for a level-payment loan: the amount actually paid out
+    at t=0 (net of fees, and of the first EMI when it is collected in
+    advance) followed by the EMIs.
+
+    `fees` may be an array, giving one row of cash flows per fee level.
+    """
+    fees = np.asarray(fees, dtype=float)
+    remaining = periods - 1 if advance else periods
+    disbursed = principal - fees - (payment if advance else 0)
+
+    flows = np.empty(fees.shape + (max(remaining, 0) + 1,))
+    flows[..., 0] = -disbursed
+    flows[..., 1:] = payment
+    return flows
+
+def irr(cash_flows, x0=None, lo=0.0, hi=solver.MAX_MONTHLY_RATE, xtol=solver.DEFAULT_XTOL,
+        rtol=solver.DEFAULT_RTOL, max_iterations=solver.DEFAULT_MAX_ITERATIONS):
+    """
+    Periodic internal rate of return of a cash-flow vector, or of every row
+    of a matrix at once.
+
+    All rows take Newton steps on NPV(r) = sum c_k (1+r)^-k together; a row
+    whose step leaves its bracket bisects instead. Rows with no root in
+    [lo, hi] are clamped to the bound nearer the root. Returns a solver.Root
+    whose root is a float for a vector and an array for a matrix.
+    """
+    flows = np.asarray(cash_flows, dtype=float)
+    single = flows.ndim == 1
+    flows = np.atleast_2d(flows)
+    k = np.arange(flows.shape[1])
+    weighted = flows * k
+
+    def npv_and_slope(rate):
+        discount = (1 + rate[:, None]) ** -k
+        npv = (flows * discount).sum(axis=1)
+        slope = -(weighted * discount).sum(axis=1) / (1 + rate)
+        return npv, slope
+
+    rows = flows.shape[0]
+    lo = np.full(rows, float(lo))
+    hi = np.full(rows, float(hi))
+    f_lo = npv_and_slope(lo)[0]
+    f_hi = npv_and_slope(hi)[0]
+
+    # Without a sign change the root lies beyond the bound with the smaller |NPV|
+    bracketed = f_lo * f_hi <= 0
+    x = np.where(np.abs(f_lo) <= np.abs(f_hi), lo, hi)
+
+    guess = (lo + hi) / 2 if x0 is None else np.broadcast_to(np.asarray(x0, dtype=float), (rows,))
+    guess = np.where((guess > lo) & (guess < hi), guess, (lo + hi) / 2)
+    x = np.where(bracketed, guess, x)
+
+    active = bracketed & (f_lo != 0) & (f_hi != 0)
+    x = np.where(f_lo == 0, lo, np.where(f_hi == 0, hi, x))
+
+    iterations = 0
+    while active.any() and iterations < max_iterations:
+        iterations += 1
+        fx, slope = npv_and_slope(x)
+
+        # Every evaluation narrows the bracket
+        same_as_lo = (fx < 0) == (f_lo < 0)
+        lo = np.where(active & same_as_lo, x, lo)
+        f_lo = np.where(active & same_as_lo, fx, f_lo)
+        hi = np.where(active & ~same_as_lo, x, hi)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            newton = x - fx / slope
+        step_ok = np.isfinite(newton) & (newton >= lo) & (newton <= hi)
+        new_x = np.where(step_ok, newton, (lo + hi) / 2)
+
+        done = (fx == 0) | (np.abs(new_x - x) <= xtol + rtol * np.abs(new_x))
+        x = np.where(active & (fx != 0), new_x, x)
+        active &= ~done
+
+    converged = bracketed & ~active
+    if single:
+        return solver.Root(float(x[0]), iterations, bool(converged[0]), 'newton')
+    return solver.Root(x, iterations, converged, 'newton')
+
+def amortized_cash_flows(principal, periodic_rate, payment, periods, fees=0, advance=False):
+    """
+    Lender's cash flows from the actual amortization: level EMIs until the
+    balance is cleared, the last one only the outstanding balance and its
+    interest. `periods` must be enough to clear the loan (the exact tenure
+    rounded up). With EMI in advance the first EMI is netted off the
+    disbursement.
+    """
+    if advance:
+        interest, principal_paid, balance = amortization.amortize_advance(principal, periodic_rate, periods, payment, clamp=True)
+    else:
+        interest, principal_paid, balance = amortization.amortize(principal, periodic_rate, periods, payment, clamp=True)
+    payments = (interest + principal_paid)[:amortization.active_periods(balance)]
+
+    if advance:
+        return np.concatenate(([-(principal - fees - payments[0])], payments[1:]))
+    return np.concatenate(([-(principal - fees)], payments))
+
+def cash_flow_apr(flows, **tolerances):
+    """
+    APR in percent from lender's cash flows, one row per loan; None (NaN for
+    rows of a matrix) when the IRR lies outside [APR_MIN_MONTHLY_RATE,
+    APR_MAX_MONTHLY_RATE], in practice only when fees push it above 1000%
+    """
+    flows = np.asarray(flows, dtype=float)
+
+    # Flat-rate approximation on the amount actually disbursed as a start
+    disbursed = -flows[..., 0]
+    payments = flows.shape[-1] - 1
+    mean_payment = flows[..., 1:].mean(axis=-1) if payments else 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        guess = np.where((disbursed > 0) & (payments > 0), mean_payment / disbursed - 1 / max(payments, 1), np.nan)
+
+    root = irr(flows, guess, lo=APR_MIN_MONTHLY_RATE, hi=APR_MAX_MONTHLY_RATE, **tolerances)
+    if flows.ndim == 1:
+        return root.root * 12 * 100 if root.converged else None
+    return np.where(root.converged, root.root * 12 * 100, np.nan)
+
+def loan_apr(principal, payment, periods, fees=0, advance=False, **tolerances):
+    """
+    Annual percentage rate of a level-payment loan from the IRR of its
+    fee-adjusted cash flows. `fees` may be an array to price a whole grid of
+    fee levels in one solve, in which case an array of APRs is returned.
+    """
+    return cash_flow_apr(loan_cash_flows(principal, payment, periods, fees, advance), **tolerances)
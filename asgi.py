@@ -0,0 +1,316 @@
+import asyncio
+import io
+import json
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from werkzeug.exceptions import HTTPException
+from werkzeug.routing import RequestRedirect
+
+from app import app as flask_app
+
+# ASGI entry point (e.g. `uvicorn asgi:app`). Requests to the CPU-heavy
+# endpoints run on a pool of ASGI_HEAVY_CONCURRENCY threads, so they cannot
+# hold up the cheap calculators, which have their own pool.
+ASGI_HEAVY_CONCURRENCY = int(os.environ.get('ASGI_HEAVY_CONCURRENCY', os.cpu_count() or 2))
+ASGI_LIGHT_CONCURRENCY = int(os.environ.get('ASGI_LIGHT_CONCURRENCY', 32))
+
+# Requests still waiting for a slot after this many seconds get a 503
+ASGI_QUEUE_TIMEOUT = float(os.environ.get('ASGI_QUEUE_TIMEOUT', 30))
+
+# Chunks of a streamed heavy response buffered ahead of a slow client
+ASGI_STREAM_BUFFER = 8
+
+# Endpoints whose cost grows with the schedule length, grid size or number
+# of cash flows: every calculator returning a per-period schedule or
+# breakdown, the grids, streams and exports, batches and XIRR.
+# ASGI_HEAVY_ENDPOINTS (comma-separated) replaces the list.
+HEAVY_ENDPOINTS = {
+    'calculate_batch',
+    'loans.calculate',
+    'loans.calculate_step_up_emi_route',
+    'loans.calculate_flat_interest_rate_emi',
+    'loans.calculate_reducing_loan_emi_route',
+    'loans.calculate_reducing_balance_emi_route',
+    'loans.calculate_reducing_rate_emi_route',
+    'loans.calculate_no_cost_emi_route',
+    'loans.calculate_bullet_emi_route',
+    'loans.calculate_reverse_emi',
+    'loans.calculate_home_loan',
+    'loans.calculate_home_loan_eligibility',
+    'loans.calculate_affordability',
+    'loans.calculate_refinance',
+    'loans.calculate_loan_amount',
+    'loans.calculate_loan_tenure',
+    'loans.calculate_interest_rate',
+    'loans.stream_schedule',
+    'loans.export_schedule',
+    'loans.calculate_emi_grid',
+    'loans.calculate_car_loan_emi',
+    'loans.calculate_two_wheeler_loan_emi',
+    'loans.calculate_personal_loan_emi',
+    'loans.calculate_business_loan_emi',
+    'loans.calculate_education_loan_emi',
+    'loans.calculate_credit_card_emi',
+    'loans.calculate_mobile_phone_emi',
+    'loans.calculate_laptop_emi',
+    'loans.calculate_land_loan_emi',
+    'loans.calculate_commercial_property_emi',
+    'loans.calculate_commercial_vehicle_emi',
+    'loans.calculate_tractor_loan_emi',
+    'loans.calculate_daily_emi',
+    'loans.calculate_weekly_emi',
+    'loans.calculate_monthly_emi',
+    'loans.calculate_quarterly_emi',
+    'loans.calculate_loan_against_property_emi',
+    'loans.calculate_gold_loan_emi',
+    'loans.calculate_emi_with_part_payment',
+    'loans.calculate_floating_interest_rate_emi_route',
+    'comparisons.calculate_flat_vs_reducing_rate_interest',
+    'comparisons.calculate_lumpsum_vs_sip',
+    'comparisons.calculate_ppf_vs_sip_comparison',
+    'investments.calculate_step_up_sip',
+    'investments.calculate_daily_sip',
+    'investments.calculate_sip_grid',
+    'investments.calculate_xirr_analysis',
+    'investments.calculate_daily_compound_interest_route',
+    'investments.calculate_vacation_savings_route',
+    'investments.calculate_goal_sip',
+    'investments.calculate_expense_ratio'
+}
+ASGI_HEAVY_ENDPOINTS = {name.strip() for name in os.environ.get('ASGI_HEAVY_ENDPOINTS', '').split(',')
+                        if name.strip()} or HEAVY_ENDPOINTS
+
+class ResponseAborted(Exception):
+    """
+    Raised in the app's thread when the response can no longer be sent
+    """
+
+class RequestClass:
+    """
+    Admission limit for one class of requests, and the thread pool they run on
+    """
+
+    def __init__(self, name, limit):
+        self.name = name
+        self.limit = limit
+        self.semaphore = None
+        self.executor = None
+        self.active = 0
+        self.queued = 0
+        self.rejected = 0
+
+    async def acquire(self):
+        # Created on first use so it belongs to the server's event loop
+        if self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(self.limit)
+            self.executor = ThreadPoolExecutor(self.limit, thread_name_prefix=f'asgi-{self.name}')
+        self.queued += 1
+        try:
+            await asyncio.wait_for(self.semaphore.acquire(), ASGI_QUEUE_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            return False
+        finally:
+            self.queued -= 1
+        self.active += 1
+        return True
+
+    def release(self):
+        self.active -= 1
+        self.semaphore.release()
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+
+    def stats(self):
+        return {
+            'limit': self.limit,
+            'active': self.active,
+            'queued': self.queued,
+            'rejected': self.rejected
+        }
+
+classes = {
+    'heavy': RequestClass('heavy', ASGI_HEAVY_CONCURRENCY),
+    'light': RequestClass('light', ASGI_LIGHT_CONCURRENCY)
+}
+
+def class_stats():
+    return {name: request_class.stats() for name, request_class in classes.items()}
+
+@lru_cache(maxsize=4096)
+def classify(method, path):
+    """
+    'heavy' or 'light', from the endpoint the path routes to
+    """
+    try:
+        endpoint, _ = flask_app.url_map.bind('localhost').match(path, method)
+    except (HTTPException, RequestRedirect):
+        return 'light'
+    return 'heavy' if endpoint in ASGI_HEAVY_ENDPOINTS else 'light'
+
+def wsgi_environ(scope, body):
+    """
+    PEP 3333 environ for an ASGI HTTP scope
+    """
+    server = scope.get('server') or ('localhost', 80)
+    client = scope.get('client') or ('', 0)
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', '').encode('utf-8').decode('latin-1'),
+        'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1] or 80),
+        'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+        'REMOTE_ADDR': client[0],
+        'REMOTE_PORT': str(client[1]),
+        'CONTENT_LENGTH': str(len(body)),
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': False,
+        'wsgi.run_once': False
+    }
+    for name, value in scope.get('headers', []):
+        name = name.decode('latin-1').upper().replace('-', '_')
+        value = value.decode('latin-1')
+        if name == 'CONTENT_TYPE':
+            environ['CONTENT_TYPE'] = value
+        elif name != 'CONTENT_LENGTH':
+            key = f'HTTP_{name}'
+            environ[key] = f'{environ[key]},{value}' if key in environ else value
+    return environ
+
+def run_wsgi(environ, emit):
+    """
+    Call the Flask app and pass each ASGI response message to emit() as the
+    body is produced. The status line is held back until the first chunk,
+    as WSGI allows start_response to be called again before then.
+    """
+    started = {}
+
+    def start_response(status, headers, exc_info=None):
+        if exc_info and started.get('sent'):
+            raise exc_info[1].with_traceback(exc_info[2])
+        started['status'] = int(status.split(' ', 1)[0])
+        started['headers'] = [(name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers]
+
+    def send_start():
+        if not started.get('sent'):
+            started['sent'] = True
+            emit({'type': 'http.response.start', 'status': started['status'], 'headers': started['headers']})
+
+    body = flask_app(environ, start_response)
+    try:
+        for chunk in body:
+            if chunk:
+                send_start()
+                emit({'type': 'http.response.body', 'body': bytes(chunk), 'more_body': True})
+        send_start()
+        emit({'type': 'http.response.body', 'body': b'', 'more_body': False})
+    finally:
+        if hasattr(body, 'close'):
+            body.close()
+
+async def read_body(receive):
+    chunks = []
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            return None
+        chunks.append(message.get('body', b''))
+        if not message.get('more_body'):
+            return b''.join(chunks)
+
+async def send_error(send, status, message, headers=()):
+    body = json.dumps({'status': 'error', 'error': message}).encode('utf-8')
+    await send({'type': 'http.response.start', 'status': status,
+                'headers': [(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode('latin-1'))]
+                + list(headers)})
+    await send({'type': 'http.response.body', 'body': body})
+
+async def run_in_executor(executor, environ, send):
+    """
+    Run the app on a pool thread, relaying its messages through a bounded
+    queue so a streamed body is sent while it is produced. When the client
+    goes away or the request is cancelled, the queue is drained and the
+    thread's next message raises ResponseAborted, so it never waits on a
+    queue nobody reads. The pool slot is held until the thread finishes.
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(ASGI_STREAM_BUFFER)
+    closed = threading.Event()
+    done = object()
+
+    def emit(message):
+        if closed.is_set():
+            raise ResponseAborted()
+        asyncio.run_coroutine_threadsafe(queue.put(message), loop).result()
+
+    def produce():
+        try:
+            run_wsgi(environ, emit)
+        except ResponseAborted:
+            pass
+        finally:
+            if not closed.is_set():
+                asyncio.run_coroutine_threadsafe(queue.put(done), loop).result()
+
+    future = loop.run_in_executor(executor, produce)
+    try:
+        while True:
+            message = await queue.get()
+            if message is done:
+                break
+            await send(message)
+    except OSError:
+        # The client went away; the app stops at its next message
+        pass
+    finally:
+        # Set before draining: a put already submitted finds room, later ones are never made
+        closed.set()
+        while not queue.empty():
+            queue.get_nowait()
+        await future
+
+async def lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            for request_class in classes.values():
+                request_class.shutdown()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+async def app(scope, receive, send):
+    """
+    ASGI application serving the Flask app
+    """
+    if scope['type'] == 'lifespan':
+        await lifespan(receive, send)
+        return
+    if scope['type'] != 'http':
+        raise ValueError(f"Unsupported ASGI scope type {scope['type']}")
+
+    body = await read_body(receive)
+    if body is None:
+        return
+
+    current = classes[classify(scope['method'], scope['path'])]
+    if not await current.acquire():
+        await send_error(send, 503, 'Server busy, please retry shortly', [(b'retry-after', b'1')])
+        return
+    try:
+        await run_in_executor(current.executor, wsgi_environ(scope, body), send)
+    finally:
+        current.release()
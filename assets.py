@@ -0,0 +1,354 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+
+import click
+from flask import current_app, request, url_for
+from markupsafe import Markup, escape
+
+# Build output under static/, written by `flask --app index build-assets`.
+# Without a manifest the original files are served unchanged.
+ASSET_BUILD_DIR = 'dist'
+ASSET_MANIFEST_NAME = 'manifest.json'
+
+# Fingerprinted build output and versioned third-party libraries never
+# change, so browsers may keep them for a year without revalidating
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+IMMUTABLE_PREFIXES = (f'{ASSET_BUILD_DIR}/', 'vendor/')
+
+MINIFIED_TYPES = ('.js', '.css')
+
+# Templates reference groups of assets as asset_tags('css/a.css', 'css/b.css')
+ASSET_TAGS_CALL = re.compile(r"asset_tags\(([^)]*)\)")
+QUOTED_NAME = re.compile(r"'([^']+)'")
+
+JS_REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+JS_REGEX_KEYWORDS = {'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete', 'void',
+                     'throw', 'instanceof', 'yield', 'await'}
+
+def skip_quoted(source, start):
+    """
+    End index of the string literal starting at `start`
+    """
+    quote = source[start]
+    i = start + 1
+    while i < len(source):
+        char = source[i]
+        if char == '\\':
+            i += 2
+            continue
+        i += 1
+        if char == quote or char == '\n':
+            break
+    return i
+
+def skip_js_regex(source, start):
+    """
+    End index, including flags, of the regular expression literal at `start`
+    """
+    i = start + 1
+    in_class = False
+    while i < len(source):
+        char = source[i]
+        if char == '\\':
+            i += 2
+            continue
+        i += 1
+        if char == '[':
+            in_class = True
+        elif char == ']':
+            in_class = False
+        elif char == '/' and not in_class:
+            break
+        elif char == '\n':
+            break
+    while i < len(source) and (source[i].isalnum() or source[i] in '_$'):
+        i += 1
+    return i
+
+def skip_js_template(source, start):
+    """
+    End index of the template literal at `start`, including any nested
+    ${...} expressions
+    """
+    i = start + 1
+    while i < len(source):
+        char = source[i]
+        if char == '\\':
+            i += 2
+        elif char == '`':
+            return i + 1
+        elif source.startswith('${', i):
+            i = skip_js_code(source, i + 2, until='}')
+        else:
+            i += 1
+    return i
+
+def skip_js_code(source, start, until):
+    """
+    End index just past the `until` character closing a nested code block
+    """
+    depth = 0
+    i = start
+    while i < len(source):
+        char = source[i]
+        if char in '\'"':
+            i = skip_quoted(source, i)
+        elif char == '`':
+            i = skip_js_template(source, i)
+        elif source.startswith('//', i):
+            i = source.find('\n', i)
+            i = len(source) if i < 0 else i
+        elif source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            i = len(source) if end < 0 else end + 2
+        else:
+            if char == '{':
+                depth += 1
+            elif char == until and depth == 0:
+                return i + 1
+            elif char == '}':
+                depth -= 1
+            i += 1
+    return i
+
+def regex_allowed(code):
+    """
+    Whether a '/' following the emitted code starts a regular expression
+    rather than a division
+    """
+    stripped = code.rstrip()
+    if not stripped:
+        return True
+    if stripped[-1] in JS_REGEX_PRECEDERS:
+        return True
+    word = re.search(r'[A-Za-z_$][\w$]*$', stripped)
+    return bool(word) and word.group() in JS_REGEX_KEYWORDS
+
+def minify_js(source):
+    """
+    Conservative JavaScript minification: drops comments, indentation and
+    blank lines and collapses runs of spaces. Line breaks are kept, so
+    automatic semicolon insertion behaves exactly as in the source.
+    """
+    out = []
+    i = 0
+    line_start = True
+    while i < len(source):
+        char = source[i]
+        if char == '\n':
+            while out and out[-1] in (' ', '\t'):
+                out.pop()
+            if out and out[-1] != '\n':
+                out.append('\n')
+            line_start = True
+            i += 1
+            continue
+        if char in ' \t\r':
+            if not line_start and out and out[-1] != ' ':
+                out.append(' ')
+            i += 1
+            continue
+
+        if source.startswith('//', i):
+            end = source.find('\n', i)
+            i = len(source) if end < 0 else end
+            continue
+        if source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            end = len(source) if end < 0 else end + 2
+            if '\n' in source[i:end]:
+                while out and out[-1] in (' ', '\t'):
+                    out.pop()
+                if out and out[-1] != '\n':
+                    out.append('\n')
+                line_start = True
+            elif not line_start and out and out[-1] != ' ':
+                out.append(' ')
+            i = end
+            continue
+
+        line_start = False
+        if char in '\'"':
+            end = skip_quoted(source, i)
+        elif char == '`':
+            end = skip_js_template(source, i)
+        elif char == '/' and regex_allowed(''.join(out[-40:])):
+            end = skip_js_regex(source, i)
+        else:
+            end = i + 1
+        out.append(source[i:end])
+        i = end
+
+    return ''.join(out).strip() + '\n'
+
+def minify_css(source):
+    """
+    Drop comments and collapse whitespace, also around braces, semicolons
+    and commas
+    """
+    out = []
+    i = 0
+    while i < len(source):
+        char = source[i]
+        if source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            i = len(source) if end < 0 else end + 2
+            continue
+        if char in '\'"':
+            end = skip_quoted(source, i)
+            out.append(source[i:end])
+            i = end
+            continue
+        if char.isspace():
+            if out and out[-1] != ' ':
+                out.append(' ')
+            i += 1
+            continue
+        if char in '{};,':
+            if out and out[-1] == ' ':
+                out.pop()
+            if char == '}' and out and out[-1] == ';':
+                out.pop()
+            out.append(char)
+            i += 1
+            while i < len(source) and source[i].isspace():
+                i += 1
+            continue
+        out.append(char)
+        i += 1
+    return ''.join(out).strip() + '\n'
+
+def minify(name, body):
+    if name.endswith('.js'):
+        return minify_js(body)
+    if name.endswith('.css'):
+        return minify_css(body)
+    return body
+
+def fingerprinted_name(name, content):
+    """
+    css/style.css -> dist/css/style.<hash>.min.css
+    """
+    stem, extension = os.path.splitext(name)
+    digest = hashlib.sha1(content.encode('utf-8')).hexdigest()[:12]
+    suffix = '.min' if extension in MINIFIED_TYPES else ''
+    return f'{ASSET_BUILD_DIR}/{stem}.{digest}{suffix}{extension}'
+
+def template_asset_groups(template_folder):
+    """
+    Every group of assets the templates include through asset_tags()
+    """
+    groups = set()
+    for filename in sorted(os.listdir(template_folder)):
+        if not filename.endswith('.html'):
+            continue
+        with open(os.path.join(template_folder, filename), encoding='utf-8') as handle:
+            for call in ASSET_TAGS_CALL.finditer(handle.read()):
+                names = tuple(QUOTED_NAME.findall(call.group(1)))
+                if len(names) > 1:
+                    groups.add(names)
+    return groups
+
+def build_assets(app, bundle=False):
+    """
+    Minify and fingerprint every JS/CSS file under static/ into static/dist,
+    optionally concatenating each group included through asset_tags() into
+    one bundle, and write the manifest mapping original names to built ones.
+    """
+    static_folder = app.static_folder
+    build_dir = os.path.join(static_folder, ASSET_BUILD_DIR)
+    if os.path.isdir(build_dir):
+        shutil.rmtree(build_dir)
+
+    def write(name, content):
+        built = fingerprinted_name(name, content)
+        path = os.path.join(static_folder, built)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as handle:
+            handle.write(content)
+        return built
+
+    minified = {}
+    manifest = {'files': {}, 'bundles': {}}
+    for root, dirs, files in os.walk(static_folder):
+        # Vendored libraries are already minified and versioned
+        dirs[:] = [name for name in dirs if root != static_folder or name not in (ASSET_BUILD_DIR, 'vendor')]
+        for filename in sorted(files):
+            if not filename.endswith(MINIFIED_TYPES):
+                continue
+            source = os.path.join(root, filename)
+            name = os.path.relpath(source, static_folder).replace(os.sep, '/')
+            with open(source, encoding='utf-8') as handle:
+                minified[name] = minify(name, handle.read())
+            manifest['files'][name] = write(name, minified[name])
+
+    if bundle:
+        for names in sorted(template_asset_groups(os.path.join(app.root_path, app.template_folder))):
+            if not all(name in minified for name in names):
+                continue
+            # Each file ends with a newline; a semicolon also ends an unterminated JS statement
+            separator = ';\n' if names[0].endswith('.js') else ''
+            content = separator.join(minified[name] for name in names)
+            stem, extension = os.path.splitext(names[-1])
+            manifest['bundles']['+'.join(names)] = write(f'{stem}.bundle{extension}', content)
+
+    with open(os.path.join(build_dir, ASSET_MANIFEST_NAME), 'w', encoding='utf-8') as handle:
+        json.dump(manifest, handle, indent=2, sort_keys=True)
+    return manifest
+
+def load_manifest(app):
+    try:
+        with open(os.path.join(app.static_folder, ASSET_BUILD_DIR, ASSET_MANIFEST_NAME), encoding='utf-8') as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return {'files': {}, 'bundles': {}}
+
+def asset_tag(name, url):
+    if name.endswith('.css'):
+        return f'<link rel="stylesheet" href="{escape(url)}">'
+    return f'<script src="{escape(url)}"></script>'
+
+def asset_url(name):
+    """
+    URL of a static file, fingerprinted when the assets have been built
+    """
+    manifest = current_app.extensions['assets']
+    return url_for('static', filename=manifest['files'].get(name, name))
+
+def asset_tags(*names):
+    """
+    <link>/<script> tags for a group of static files, or for their bundle
+    """
+    bundled = current_app.extensions['assets']['bundles'].get('+'.join(names))
+    if bundled:
+        return Markup(asset_tag(names[-1], url_for('static', filename=bundled)))
+    return Markup('\n'.join(asset_tag(name, asset_url(name)) for name in names))
+
+def init_app(app):
+    """
+    asset_url()/asset_tags() template helpers resolving static files through
+    the build manifest, the build-assets command and immutable caching of
+    fingerprinted and versioned files
+    """
+    app.extensions['assets'] = load_manifest(app)
+    app.jinja_env.globals.update(asset_url=asset_url, asset_tags=asset_tags)
+
+    @app.cli.command('build-assets')
+    @click.option('--bundle', is_flag=True, help='Also concatenate each asset_tags() group into one file.')
+    def build_assets_command(bundle):
+        """Minify and fingerprint static/js and static/css into static/dist."""
+        built = build_assets(app, bundle)
+        app.extensions['assets'] = built
+        print(f"Built {len(built['files'])} assets and {len(built['bundles'])} bundles "
+              f"into {os.path.join(app.static_folder, ASSET_BUILD_DIR)}")
+
+    @app.after_request
+    def cache_immutable_assets(response):
+        if request.endpoint == 'static' and response.status_code in (200, 304):
+            filename = (request.view_args or {}).get('filename', '')
+            if filename.startswith(IMMUTABLE_PREFIXES) and not filename.endswith('.json'):
+                response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+        return response
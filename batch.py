@@ -0,0 +1,140 @@
+import os
+from functools import partial
+
+from flask import request, jsonify
+from werkzeug.exceptions import HTTPException
+from werkzeug.utils import import_string
+
+# Upper bound on scenarios per request, overridable per deployment
+BATCH_MAX_ITEMS = int(os.environ.get('BATCH_MAX_ITEMS', 500))
+
+# Only the calculation endpoints can be batched
+BATCH_PATH_PREFIX = '/calculate'
+
+# Endpoint name -> function taking the JSON payload and returning (body, status).
+# Registered endpoints are evaluated without building a request per scenario.
+PAYLOAD_HANDLERS = {}
+
+def register(endpoint, handler, *args):
+    """
+    Register a payload handler for an endpoint. The handler may be given as
+    a "module:function" import string, imported on its first use; any extra
+    arguments are bound in front of the payload.
+    """
+    PAYLOAD_HANDLERS[endpoint] = (handler, args)
+
+def payload_handler(endpoint):
+    """
+    Registered handler for an endpoint, or None
+    """
+    entry = PAYLOAD_HANDLERS.get(endpoint)
+    if entry is None:
+        return None
+
+    handler, args = entry
+    if isinstance(handler, str):
+        handler = import_string(handler)
+    if args:
+        handler = partial(handler, *args)
+    PAYLOAD_HANDLERS[endpoint] = (handler, ())
+    return handler
+
+def batch_items(data):
+    """
+    Normalize a batch request into a list of (route, payload) pairs. Accepts
+    {"route": ..., "payloads": [...]} for a sweep over one calculator or
+    {"items": [{"route": ..., "payload": {...}}, ...]} for mixed calculators.
+    """
+    if not isinstance(data, dict):
+        raise ValueError('Batch request must be a JSON object')
+
+    if 'payloads' in data:
+        payloads = data['payloads']
+        if not isinstance(payloads, list):
+            raise ValueError('payloads must be a list')
+        items = [{'route': data.get('route'), 'payload': payload} for payload in payloads]
+    else:
+        items = data.get('items')
+        if not isinstance(items, list):
+            raise ValueError('Batch request needs an items or payloads list')
+
+    if not items:
+        raise ValueError('Batch request has no items')
+    if len(items) > BATCH_MAX_ITEMS:
+        raise ValueError(f'Batch request is limited to {BATCH_MAX_ITEMS} items')
+
+    pairs = []
+    for item in items:
+        if not isinstance(item, dict):
+            raise ValueError('Each batch item must be a JSON object')
+        pairs.append((item.get('route'), item.get('payload')))
+    return pairs
+
+def resolve_route(app, route):
+    """
+    Endpoint name and view for a POST /calculate-* route
+    """
+    if not isinstance(route, str) or not route.startswith(BATCH_PATH_PREFIX):
+        raise ValueError(f'Route {route!r} cannot be batched')
+
+    endpoint, _ = app.url_map.bind('').match(route, method='POST')
+    return endpoint, app.view_functions[endpoint]
+
+def evaluate(app, endpoint, view, route, payload):
+    """
+    Run one scenario, returning (body, status)
+    """
+    handler = payload_handler(endpoint)
+    if handler is not None:
+        return handler(payload)
+
+    # Other calculators read the payload from the request, so give each
+    # scenario its own request context
+    with app.test_request_context(route, method='POST', json=payload):
+        response = app.make_response(view())
+    return response.get_json(silent=True), response.status_code
+
+def run_batch(app, data):
+    """
+    Evaluate every scenario of a batch request in order. A failing scenario
+    is reported in its own result and does not abort the batch.
+    """
+    resolved = {}
+    results = []
+    for index, (route, payload) in enumerate(batch_items(data)):
+        try:
+            # Scenarios of a sweep share one route lookup
+            if route not in resolved:
+                resolved[route] = resolve_route(app, route)
+            endpoint, view = resolved[route]
+            body, status = evaluate(app, endpoint, view, route, payload)
+        except HTTPException as e:
+            body, status = {'error': e.description}, e.code
+        except Exception as e:
+            body, status = {'error': str(e)}, 400
+
+        results.append({
+            'index': index,
+            'route': route,
+            'statusCode': status,
+            'result': body
+        })
+    return results
+
+def init_app(app):
+    """
+    POST /batch evaluates many calculator scenarios in one request
+    """
+
+    @app.route('/batch', methods=['POST'])
+    def calculate_batch():
+        try:
+            results = run_batch(app, request.get_json())
+        except Exception as e:
+            return jsonify({'status': 'error', 'error': str(e)}), 400
+
+        return jsonify({
+            'status': 'success',
+            'count': len(results),
+            'results': results
+        })
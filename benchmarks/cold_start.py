@@ -0,0 +1,68 @@
+"""
+Cold-start budget check: imports the Vercel entry point in fresh
+interpreters and serves one request, as a serverless cold start does.
+
+    python benchmarks/cold_start.py [runs] [route]
+
+Exits non-zero when the median exceeds COLD_START_BUDGET_MS.
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Median import + first request time allowed, in milliseconds
+COLD_START_BUDGET_MS = float(os.environ.get('COLD_START_BUDGET_MS', 500))
+
+DEFAULT_RUNS = 10
+DEFAULT_ROUTE = '/'
+
+PROBE = '''
+import json, sys, time
+start = time.perf_counter()
+import index
+imported = time.perf_counter()
+response = index.app.test_client().get(sys.argv[1])
+served = time.perf_counter()
+print(json.dumps({
+    'importMs': (imported - start) * 1000,
+    'firstRequestMs': (served - imported) * 1000,
+    'statusCode': response.status_code
+}))
+'''
+
+def measure(route):
+    """
+    Timings of one cold start in a fresh interpreter
+    """
+    output = subprocess.run([sys.executable, '-c', PROBE, route], cwd=ROOT, check=True,
+                            capture_output=True, text=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+def main(runs=DEFAULT_RUNS, route=DEFAULT_ROUTE):
+    samples = [measure(route) for _ in range(runs)]
+    import_ms = statistics.median(sample['importMs'] for sample in samples)
+    request_ms = statistics.median(sample['firstRequestMs'] for sample in samples)
+    total_ms = statistics.median(sample['importMs'] + sample['firstRequestMs'] for sample in samples)
+
+    print(json.dumps({
+        'route': route,
+        'runs': runs,
+        'statusCode': samples[-1]['statusCode'],
+        'importMs': round(import_ms, 1),
+        'firstRequestMs': round(request_ms, 1),
+        'totalMs': round(total_ms, 1),
+        'budgetMs': COLD_START_BUDGET_MS
+    }, indent=2))
+
+    if total_ms > COLD_START_BUDGET_MS:
+        print(f'Cold start of {total_ms:.1f} ms exceeds the {COLD_START_BUDGET_MS:.0f} ms budget', file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    sys.exit(main(int(args[0]) if args else DEFAULT_RUNS, args[1] if len(args) > 1 else DEFAULT_ROUTE))
@@ -0,0 +1,310 @@
+"""
+Load test: replays a weighted mix of requests from a JSON traffic profile
+against the app served by a local WSGI server, and reports throughput,
+p50/p95/p99 latency per request and the server's memory.
+
+    python benchmarks/load_test.py [profile] [--url URL] [--concurrency N]
+                                   [--duration SECONDS] [--output PATH]
+
+Without --url the app is started in a separate process on a free local
+port, so the load generator does not compete with it for the GIL; the
+server inherits the environment (RESPONSE_CACHE_ENABLED=0 etc.). Exits
+non-zero when the profile's "limits" are exceeded.
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_PROFILE = os.path.join(ROOT, 'benchmarks', 'profiles', 'default.json')
+
+PERCENTILES = (50, 95, 99)
+
+# How often the server's resident memory is sampled during a run, in seconds
+MEMORY_SAMPLE_SECONDS = 0.5
+
+SERVER = '''
+import logging
+from werkzeug.serving import make_server
+import index
+logging.getLogger('werkzeug').setLevel(logging.ERROR)
+server = make_server('127.0.0.1', 0, index.app, threaded=True)
+print(server.server_port, flush=True)
+server.serve_forever()
+'''
+
+def load_profile(path):
+    """
+    A traffic profile: run settings and the weighted requests to replay.
+    Each request has a name, weight, method, path and optional json body;
+    "vary" maps body fields to a [low, high] range drawn per request, which
+    mimics slider traffic and keeps the response cache honest.
+    """
+    with open(path, encoding='utf-8') as f:
+        profile = json.load(f)
+    requests = profile.get('requests') or []
+    if not requests:
+        raise ValueError(f'{path} defines no requests')
+    for entry in requests:
+        for field in ('name', 'path'):
+            if field not in entry:
+                raise ValueError(f'Every request in {path} needs a {field}')
+        if entry.get('weight', 1) <= 0:
+            raise ValueError(f"Request {entry['name']} needs a positive weight")
+    return profile
+
+def request_body(entry, rng):
+    body = entry.get('json')
+    if body is None:
+        return None
+    vary = entry.get('vary')
+    if vary:
+        body = dict(body)
+        for field, (low, high) in vary.items():
+            body[field] = rng.randint(int(low), int(high))
+    return json.dumps(body).encode('utf-8')
+
+def percentile(ordered, percent):
+    """
+    Nearest-rank percentile of an already sorted list
+    """
+    if not ordered:
+        return None
+    rank = max(1, -(-len(ordered) * percent // 100))
+    return ordered[int(rank) - 1]
+
+def error_body(body, headers):
+    """
+    The app reports some failures as 200 responses with an error field
+    """
+    if headers.get('Content-Encoding') or not headers.get('Content-Type', '').startswith('application/json'):
+        return False
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return True
+    return isinstance(data, dict) and 'error' in data and data.get('status') != 'success'
+
+class Server:
+    """
+    The app on a free local port in its own interpreter
+    """
+
+    def __init__(self):
+        self.process = subprocess.Popen([sys.executable, '-c', SERVER], cwd=ROOT, stdout=subprocess.PIPE, text=True)
+        line = self.process.stdout.readline()
+        if not line:
+            raise RuntimeError('The load-test server failed to start')
+        self.url = f'http://127.0.0.1:{int(line)}'
+
+    def memory(self):
+        """
+        Current and peak resident set size in MiB, where /proc is available
+        """
+        try:
+            with open(f'/proc/{self.process.pid}/status', encoding='ascii') as f:
+                fields = dict(line.split(':', 1) for line in f if ':' in line)
+        except OSError:
+            return None
+        return {
+            'rssMiB': round(int(fields['VmRSS'].split()[0]) / 1024, 1),
+            'peakRssMiB': round(int(fields['VmHWM'].split()[0]) / 1024, 1)
+        }
+
+    def stop(self):
+        self.process.terminate()
+        self.process.wait()
+
+class LoadRun:
+    """
+    Closed-loop workers, each sending its next request as soon as the
+    previous one completes. Samples taken before the warm-up ends are
+    discarded.
+    """
+
+    def __init__(self, url, profile, concurrency, duration, warmup, seed):
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == 'https' else 80)
+        self.connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+        self.prefix = parts.path.rstrip('/')
+        self.headers = profile.get('headers', {})
+        self.requests = profile['requests']
+        self.weights = [entry.get('weight', 1) for entry in self.requests]
+        self.concurrency = concurrency
+        self.duration = duration
+        self.warmup = warmup
+        self.seed = seed
+        self.lock = threading.Lock()
+        self.samples = []
+        self.failures = {}
+
+    def send(self, entry, rng):
+        body = request_body(entry, rng)
+        headers = dict(self.headers)
+        if body is not None:
+            headers['Content-Type'] = 'application/json'
+        connection = self.connection_class(self.host, self.port, timeout=60)
+        started = time.perf_counter()
+        try:
+            connection.request(entry.get('method', 'POST' if body is not None else 'GET'),
+                               self.prefix + entry['path'], body=body, headers=headers)
+            response = connection.getresponse()
+            data = response.read()
+            elapsed = time.perf_counter() - started
+        finally:
+            connection.close()
+        failed = response.status >= 400 or error_body(data, response.headers)
+        return elapsed, response.status, len(data), failed
+
+    def worker(self, index, measure_from, stop_at):
+        rng = random.Random(self.seed * 1000 + index)
+        while True:
+            now = time.perf_counter()
+            if now >= stop_at:
+                return
+            entry = rng.choices(self.requests, self.weights)[0]
+            try:
+                elapsed, status, size, failed = self.send(entry, rng)
+            except (OSError, http.client.HTTPException) as e:
+                elapsed, status, size, failed = time.perf_counter() - now, type(e).__name__, 0, True
+            if now < measure_from:
+                continue
+            with self.lock:
+                self.samples.append((entry['name'], elapsed, size, failed))
+                if failed:
+                    key = f"{entry['name']} {status}"
+                    self.failures[key] = self.failures.get(key, 0) + 1
+
+    def run(self, server=None):
+        started = time.perf_counter()
+        measure_from = started + self.warmup
+        stop_at = measure_from + self.duration
+        workers = [threading.Thread(target=self.worker, args=(index, measure_from, stop_at), daemon=True)
+                   for index in range(self.concurrency)]
+        for thread in workers:
+            thread.start()
+
+        memory_start = memory_samples = None
+        if server is not None:
+            while time.perf_counter() < measure_from:
+                time.sleep(0.05)
+            memory_start = server.memory()
+            memory_samples = []
+            while any(thread.is_alive() for thread in workers):
+                sample = server.memory()
+                if sample is not None:
+                    memory_samples.append(sample['rssMiB'])
+                time.sleep(MEMORY_SAMPLE_SECONDS)
+        for thread in workers:
+            thread.join()
+        elapsed = max(time.perf_counter() - measure_from, 1e-9)
+
+        memory = None
+        if memory_start is not None:
+            memory_end = server.memory()
+            memory = {
+                'startRssMiB': memory_start['rssMiB'],
+                'maxSampledRssMiB': max(memory_samples, default=memory_start['rssMiB']),
+                'endRssMiB': memory_end['rssMiB'],
+                'peakRssMiB': memory_end['peakRssMiB']
+            }
+        return self.report(elapsed, memory)
+
+    def report(self, elapsed, memory):
+        by_name = {}
+        for name, seconds, size, failed in self.samples:
+            by_name.setdefault(name, []).append((seconds, size, failed))
+
+        def summary(samples):
+            latencies = sorted(seconds for seconds, _, _ in samples)
+            result = {
+                'requests': len(samples),
+                'errors': sum(1 for _, _, failed in samples if failed),
+                'throughputRps': round(len(samples) / elapsed, 1),
+                'meanBytes': round(sum(size for _, size, _ in samples) / len(samples)) if samples else 0
+            }
+            for percent in PERCENTILES:
+                value = percentile(latencies, percent)
+                result[f'p{percent}Ms'] = round(value * 1000, 2) if value is not None else None
+            result['maxMs'] = round(latencies[-1] * 1000, 2) if latencies else None
+            return result
+
+        overall = summary([(seconds, size, failed) for _, seconds, size, failed in self.samples])
+        return {
+            'concurrency': self.concurrency,
+            'durationSeconds': round(elapsed, 2),
+            'overall': overall,
+            'requests': {name: summary(samples) for name, samples in sorted(by_name.items())},
+            'failures': self.failures,
+            'memory': memory
+        }
+
+def check_limits(report, limits):
+    """
+    Breaches of the profile's limits: maxErrorRate, minThroughputRps, p50Ms,
+    p95Ms, p99Ms and maxPeakRssMiB
+    """
+    overall = report['overall']
+    breaches = []
+    if 'maxErrorRate' in limits and overall['requests']:
+        error_rate = overall['errors'] / overall['requests']
+        if error_rate > limits['maxErrorRate']:
+            breaches.append(f"error rate {error_rate:.2%} > {limits['maxErrorRate']:.2%}")
+    if 'minThroughputRps' in limits and overall['throughputRps'] < limits['minThroughputRps']:
+        breaches.append(f"throughput {overall['throughputRps']} rps < {limits['minThroughputRps']} rps")
+    for percent in PERCENTILES:
+        field = f'p{percent}Ms'
+        if field in limits and overall[field] is not None and overall[field] > limits[field]:
+            breaches.append(f'p{percent} {overall[field]} ms > {limits[field]} ms')
+    memory = report['memory']
+    if 'maxPeakRssMiB' in limits and memory is not None and memory['peakRssMiB'] > limits['maxPeakRssMiB']:
+        breaches.append(f"peak RSS {memory['peakRssMiB']} MiB > {limits['maxPeakRssMiB']} MiB")
+    return breaches
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Replay a traffic profile against the app')
+    parser.add_argument('profile', nargs='?', default=DEFAULT_PROFILE, help='JSON traffic profile')
+    parser.add_argument('--url', help='load an already running server instead of starting one')
+    parser.add_argument('--concurrency', type=int, help="overrides the profile's concurrency")
+    parser.add_argument('--duration', type=float, help="overrides the profile's durationSeconds")
+    parser.add_argument('--warmup', type=float, help="overrides the profile's warmupSeconds")
+    parser.add_argument('--seed', type=int, default=1, help='seed of the request mix')
+    parser.add_argument('--output', help='also write the report to this file')
+    args = parser.parse_args(argv)
+
+    profile = load_profile(args.profile)
+    concurrency = args.concurrency or profile.get('concurrency', 8)
+    duration = args.duration if args.duration is not None else profile.get('durationSeconds', 30)
+    warmup = args.warmup if args.warmup is not None else profile.get('warmupSeconds', 3)
+
+    server = None if args.url else Server()
+    try:
+        run = LoadRun(args.url or server.url, profile, concurrency, duration, warmup, args.seed)
+        report = run.run(server)
+    finally:
+        if server is not None:
+            server.stop()
+
+    report = dict({'profile': os.path.relpath(args.profile, ROOT), 'target': args.url or 'local'}, **report)
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+
+    breaches = check_limits(report, profile.get('limits', {}))
+    for breach in breaches:
+        print(f'Limit exceeded: {breach}', file=sys.stderr)
+    return 1 if breaches else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,298 @@
+"""
+Micro-benchmarks of the pure calculation functions, with realistic and
+worst-case inputs, stored as JSON baselines to compare commits against.
+
+    python benchmarks/micro.py [--filter TEXT] [--save [PATH]] [--compare [PATH]]
+
+Memoized calculators are timed through their undecorated function, so every
+call does the full calculation. With --compare the run exits non-zero when
+a case is more than MICRO_REGRESSION_PERCENT slower than in the baseline.
+"""
+import argparse
+import datetime
+import importlib
+import inspect
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+DEFAULT_BASELINE = os.path.join(ROOT, 'benchmarks', 'baseline.json')
+
+# Slowdown over the baseline median reported as a regression, in percent
+MICRO_REGRESSION_PERCENT = float(os.environ.get('MICRO_REGRESSION_PERCENT', 25))
+
+# Each case is timed MICRO_REPEAT times over a batch of calls sized to take at
+# least MICRO_MIN_SECONDS
+MICRO_REPEAT = int(os.environ.get('MICRO_REPEAT', 5))
+MICRO_MIN_SECONDS = float(os.environ.get('MICRO_MIN_SECONDS', 0.2))
+
+def monthly_cash_flows(count, amount=-5000.0, start=datetime.date(2010, 1, 1)):
+    """
+    `count` monthly SIP instalments followed by one redemption
+    """
+    flows = []
+    for index in range(count):
+        year, month = divmod(start.month - 1 + index, 12)
+        flows.append({'date': datetime.date(start.year + year, month + 1, 1), 'amount': amount})
+    redemption = -amount * count * 1.6
+    flows.append({'date': flows[-1]['date'] + datetime.timedelta(days=30), 'amount': redemption})
+    return flows
+
+def xirr_arguments(count):
+    flows = monthly_cash_flows(count)
+    return {'dates': [flow['date'] for flow in flows], 'amounts': [flow['amount'] for flow in flows]}
+
+INCOME = {'salary': 2400000, 'rental_income': 360000, 'interest_home_loan_letout': 150000,
+          'other_income': 50000, 'exempt_allowances': 120000}
+DEDUCTIONS = {'section_80c': 150000, 'section_80d': 50000, 'section_80ccd1': 50000, 'home_loan_interest': 200000}
+
+# (name, 'module:function', arguments). Arguments are a dict of keyword
+# arguments, a list of them (one timed call runs them all) or a zero-argument
+# function building them once before timing.
+CASES = [
+    # Loans
+    ('emi', 'loan_engine:calculate_emi',
+     {'principal': 3000000, 'annual_rate': 8.5, 'tenure_months': 240}),
+    ('emi_360_months', 'loan_engine:calculate_emi',
+     {'principal': 10000000, 'annual_rate': 9.25, 'tenure_months': 360, 'emi_advance': True}),
+    ('yearly_schedule', 'loan_engine:calculate_yearly_payment_schedule',
+     {'principal': 3000000, 'annual_rate': 8.5, 'tenure_months': 240}),
+    ('yearly_schedule_360_months', 'loan_engine:calculate_yearly_payment_schedule',
+     {'principal': 10000000, 'annual_rate': 9.25, 'tenure_months': 360}),
+    ('amortization_360_months', 'loan_engine:calculate_amortization_schedule',
+     {'principal': 10000000, 'annual_rate': 9.25, 'tenure_months': 360}),
+    ('loan_apr_360_months', 'apr:loan_apr',
+     {'principal': 10000000, 'payment': 85000, 'periods': 360, 'fees': 50000}),
+    ('flat_interest_schedule_30y', 'calculators.loans:generate_flat_interest_yearly_schedule',
+     {'principal': 2000000, 'annual_rate': 10, 'tenure_years': 30}),
+    ('step_up_emi_30y', 'calculators.loans:generate_step_up_emi_yearly_schedule',
+     {'principal': 5000000, 'annual_rate': 9, 'tenure_years': 30, 'initial_emi': 45000,
+      'step_up_amount': 5, 'step_up_frequency': 'yearly'}),
+    ('reducing_rate_schedule_30y', 'calculators.loans:generate_reducing_rate_emi_schedule',
+     {'principal': 5000000, 'initial_rate': 9.5, 'reduced_rate': 8.0, 'transition_year': 5, 'tenure_years': 30}),
+    ('floating_rate_schedule_30y', 'calculators.loans:generate_floating_interest_rate_emi_schedule',
+     {'principal': 5000000, 'initial_rate': 8.0, 'revised_rate': 9.5, 'transition_year': 3, 'tenure_years': 30}),
+    ('home_loan_schedule_360_months', 'calculators.loans:generate_home_loan_schedule',
+     {'loan_amount': 10000000, 'monthly_rate': 9.25 / 1200, 'total_months': 360, 'emi': 82268,
+      'monthly_property_tax': 1000, 'monthly_home_insurance': 500, 'maintenance_monthly': 3000}),
+    ('part_payment_reduce_tenure', 'calculators.loans:calculate_emi_with_part_payment_returns',
+     {'loan_amount': 5000000, 'interest_rate': 8.5, 'tenure_years': 30, 'part_payment_amount': 500000,
+      'part_payment_month': 24}),
+    ('part_payment_reduce_emi', 'calculators.loans:calculate_emi_with_part_payment_returns',
+     {'loan_amount': 5000000, 'interest_rate': 8.5, 'tenure_years': 30, 'part_payment_amount': 500000,
+      'part_payment_month': 24, 'part_payment_option': 'reduceEmi'}),
+    ('bullet_emi_schedule_30y', 'calculators.loans:generate_bullet_emi_payment_schedule',
+     {'actual_loan_amount': 5000000, 'annual_rate': 9, 'tenure_years': 30}),
+    ('no_cost_emi_24_months', 'calculators.loans:calculate_no_cost_emi',
+     {'mrp_price': 80000, 'tenure_months': 24, 'regular_interest_rate': 16}),
+
+    # Investments
+    ('sip_monthly_10y', 'calculators.common:calculate_sip_returns',
+     {'sip_amount': 10000, 'frequency': 'monthly', 'annual_return_rate': 12, 'tenure_years': 10, 'inflation_rate': 6}),
+    ('sip_daily_40y', 'calculators.common:calculate_sip_returns',
+     {'sip_amount': 500, 'frequency': 'daily', 'annual_return_rate': 12, 'tenure_years': 40, 'inflation_rate': 6}),
+    ('step_up_sip_monthly_10y', 'calculators.investments:calculate_step_up_sip_returns',
+     {'initial_sip_amount': 10000, 'annual_step_up_percentage': 10, 'frequency': 'monthly',
+      'annual_return_rate': 12, 'tenure_years': 10, 'inflation_rate': 6}),
+    ('step_up_sip_daily_40y', 'calculators.investments:calculate_step_up_sip_returns',
+     {'initial_sip_amount': 500, 'annual_step_up_percentage': 10, 'frequency': 'daily',
+      'annual_return_rate': 12, 'tenure_years': 40, 'inflation_rate': 6}),
+    ('step_up_sip_daily_40y_fixed', 'calculators.investments:calculate_step_up_sip_returns',
+     {'initial_sip_amount': 500, 'annual_step_up_percentage': 0, 'frequency': 'daily',
+      'annual_return_rate': 12, 'tenure_years': 40, 'inflation_rate': 6, 'step_up_type': 'fixed',
+      'fixed_step_up_amount': 50}),
+    ('step_up_sip_bajaj_daily_40y', 'calculators.investments:calculate_step_up_sip_returns_bajaj_method',
+     {'initial_sip_amount': 500, 'annual_step_up_percentage': 10, 'frequency': 'daily',
+      'annual_return_rate': 12, 'tenure_years': 40, 'inflation_rate': 6}),
+    ('fd_monthly_10y', 'calculators.common:calculate_fd_returns',
+     {'monthly_investment': 10000, 'duration_years': 10, 'interest_rate': 7, 'compounding_frequency': 'quarterly'}),
+    ('rd_40y', 'calculators.common:calculate_rd_returns',
+     {'monthly_amount': 5000, 'duration_years': 40, 'annual_rate': 7, 'compounding_frequency': 'quarterly'}),
+    ('swp_monthly_30y', 'calculators.investments:calculate_swp_returns',
+     {'initial_investment': 10000000, 'annual_return_rate': 8, 'withdrawal_amount': 50000, 'tenure_years': 30,
+      'withdrawal_frequency': 'monthly'}),
+    ('compound_interest_daily_50y', 'calculators.investments:calculate_compound_interest_returns',
+     {'principal_amount': 100000, 'annual_interest_rate': 8, 'tenure_years': 50, 'compounding_frequency': 'daily'}),
+    ('sip_inflation_tax_40y', 'calculators.investments:calculate_sip_with_inflation_and_tax_returns',
+     {'sip_amount': 10000, 'annual_return_rate': 12, 'tenure_years': 40, 'inflation_rate': 6, 'tax_rate': 12.5}),
+    ('sip_delay_30y', 'calculators.investments:calculate_sip_delay_returns',
+     {'sip_amount': 10000, 'expected_return': 12, 'investment_period': 30, 'delay_months': 36}),
+    ('ulip_30y', 'calculators.investments:calculate_ulip_returns',
+     {'mode': 'Regular Investment', 'tenure_years': 30, 'expected_return': 10, 'existing_investment': 100000,
+      'monthly_investment': 10000, 'periodic_topup': 25000, 'lump_sum': 0}),
+    ('retirement_corpus', 'calculators.investments:calculate_retirement_corpus_planning',
+     {'current_age': 25, 'retirement_age': 60, 'life_expectancy': 90, 'monthly_income_desired': 100000,
+      'inflation_rate': 6, 'pre_retirement_return': 12, 'post_retirement_return': 7, 'current_savings': 500000}),
+    ('stock_average_500_purchases', 'calculators.investments:calculate_stock_average_returns',
+     {'purchases': [{'shares': 10 + index % 7, 'price': 100 + index % 50} for index in range(500)],
+      'current_market_price': 140}),
+    ('xirr_summary_120_flows', 'calculators.investments:calculate_xirr_summary_data',
+     lambda: {'cash_flows': monthly_cash_flows(120)}),
+    ('xirr_120_flows', 'xirr:xirr', lambda: xirr_arguments(120)),
+    ('xirr_5000_flows', 'xirr:xirr', lambda: xirr_arguments(5000)),
+
+    # Government schemes
+    ('ppf_15y', 'calculators.government_schemes:calculate_ppf_returns',
+     {'annual_contribution': 150000, 'duration_years': 15, 'interest_rate': 7.1, 'contribution_frequency': 'yearly'}),
+    ('ppf_50y_monthly', 'calculators.government_schemes:calculate_ppf_returns',
+     {'annual_contribution': 150000, 'duration_years': 50, 'interest_rate': 7.1, 'contribution_frequency': 'monthly'}),
+    ('nps_age_18', 'calculators.government_schemes:calculate_nps_returns',
+     {'current_age': 18, 'retirement_age': 60, 'monthly_contribution': 5000, 'expected_return': 10,
+      'annual_increase': 10, 'annuity_percentage': 40, 'annuity_return': 6}),
+    ('epf_40y', 'calculators.government_schemes:calculate_epf_returns',
+     {'basic_salary': 50000, 'employee_contribution': 12, 'employer_contribution': 12, 'interest_rate': 8.25,
+      'years_of_service': 40, 'salary_increase': 8}),
+    ('ssy_monthly', 'calculators.government_schemes:calculate_ssy_returns',
+     {'annual_investment': 150000, 'annual_interest_rate': 8.2, 'investment_period': 15,
+      'investment_frequency': 'monthly', 'investment_amount': 12500}),
+    ('apy_all_ages', 'calculators.government_schemes:calculate_apy_returns',
+     [{'joining_age': age, 'pension_amount': pension}
+      for age in range(18, 41) for pension in (1000, 2000, 3000, 4000, 5000)]),
+    ('pmsym_all_ages', 'calculators.government_schemes:calculate_pmsym_returns',
+     [{'joining_age': age, 'pension_amount': 3000, 'interest_rate': 8} for age in range(18, 41)]),
+    ('kvp', 'calculators.government_schemes:calculate_kvp_returns',
+     {'investment_amount': 100000, 'interest_rate': 7.5}),
+
+    # Tax
+    ('income_tax_both_regimes', 'calculators.tax:calculate_income_tax_old_new_regime',
+     {'financial_year': 'FY 2024-2025', 'age_group': '0-60', 'income_details': INCOME, 'deductions': DEDUCTIONS}),
+    ('hra_exemption', 'calculators.tax:calculate_hra_exemption',
+     {'basic_salary_annual': 1200000, 'da_received_annual': 0, 'hra_received_annual': 480000,
+      'rent_paid_annual': 420000, 'city_type': 'metro'}),
+    ('gratuity', 'calculators.tax:calculate_gratuity_returns',
+     {'last_salary': 150000, 'years_of_service': 25, 'gratuity_type': 'covered', 'custom_days': 15}),
+    ('gst_add', 'calculators.tax:calculate_gst_amounts',
+     {'amount': 125000, 'gst_rate': 18, 'calculation_type': 'add'}),
+
+    # Comparisons
+    ('flat_vs_reducing_schedule_30y', 'calculators.comparisons:generate_flat_vs_reducing_comparison_schedule',
+     {'principal': 5000000, 'annual_rate': 9, 'tenure_years': 30}),
+    ('lumpsum_vs_sip_schedule_40y', 'calculators.comparisons:generate_lumpsum_vs_sip_schedule',
+     {'investment_amount': 1000000, 'monthly_sip': 10000, 'expected_return_percent': 12,
+      'investment_period_years': 40}),
+    ('sip_vs_interest_daily', 'calculators.comparisons:calculate_sip_vs_interest_comparison',
+     {'sip_amount': 10000, 'sip_years': 30, 'sip_return': 12, 'principal_amount': 1000000, 'interest_years': 30,
+      'interest_rate': 7, 'compounding_frequency': 'daily'}),
+    ('elss_vs_sip_40y', 'calculators.comparisons:calculate_elss_vs_sip_comparison',
+     {'monthly_investment': 12500, 'investment_duration': 40, 'sip_return_rate': 12, 'elss_return_rate': 13,
+      'tax_slab': 30}),
+
+    # Sensitivity grids
+    ('emi_grid_10k_cells', 'sensitivity:calculate_emi_grid',
+     {'data': {'loanAmount': {'start': 1000000, 'stop': 10000000, 'count': 100},
+               'interestRate': {'start': 6, 'stop': 15, 'count': 100}, 'tenureMonths': 240}}),
+    ('sip_grid_10k_cells', 'sensitivity:calculate_sip_grid',
+     {'data': {'sipAmount': {'start': 1000, 'stop': 100000, 'count': 100},
+               'returnRate': {'start': 4, 'stop': 20, 'count': 100}, 'tenureYears': 40}})
+]
+
+def resolve(target):
+    """
+    The function behind 'module:function', unwrapped from any memoizing decorator
+    """
+    module_name, function_name = target.split(':')
+    function = getattr(importlib.import_module(module_name), function_name)
+    return inspect.unwrap(function)
+
+def case_call(target, arguments):
+    function = resolve(target)
+    if callable(arguments):
+        arguments = arguments()
+    if isinstance(arguments, list):
+        calls = arguments
+        return lambda: [function(**kwargs) for kwargs in calls]
+    return lambda: function(**arguments)
+
+def measure(call):
+    """
+    Seconds per call: minimum and median over MICRO_REPEAT timed batches
+    """
+    timer = timeit.Timer(call)
+    number, _ = timer.autorange()
+    while number * timer.timeit(1) < MICRO_MIN_SECONDS and number < 1 << 20:
+        number *= 2
+    samples = [seconds / number for seconds in timer.repeat(MICRO_REPEAT, number)]
+    return {'calls': number, 'minUs': round(min(samples) * 1e6, 3), 'medianUs': round(statistics.median(samples) * 1e6, 3)}
+
+def environment():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, check=True,
+                                capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    numpy = sys.modules.get('numpy')
+    return {
+        'commit': commit,
+        'python': platform.python_version(),
+        'numpy': numpy.__version__ if numpy is not None else None,
+        'machine': platform.machine(),
+        'recordedAt': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds')
+    }
+
+def compare(results, baseline):
+    """
+    Cases slower than the baseline median by more than MICRO_REGRESSION_PERCENT
+    """
+    regressions = []
+    for name, result in results.items():
+        before = baseline['results'].get(name)
+        if before is None:
+            continue
+        change = (result['medianUs'] / before['medianUs'] - 1) * 100
+        result['baselineMedianUs'] = before['medianUs']
+        result['changePercent'] = round(change, 1)
+        if change > MICRO_REGRESSION_PERCENT:
+            regressions.append(name)
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Micro-benchmarks of the calculation functions')
+    parser.add_argument('--filter', help='only run cases whose name contains this text')
+    parser.add_argument('--save', nargs='?', const=DEFAULT_BASELINE, help='write the results as a baseline')
+    parser.add_argument('--compare', nargs='?', const=DEFAULT_BASELINE, help='compare against a baseline')
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    results = {}
+    for name, target, arguments in CASES:
+        if args.filter and args.filter not in name:
+            continue
+        results[name] = dict(measure(case_call(target, arguments)), function=target)
+        print(f"{name:40} {results[name]['medianUs']:>14,.1f} us", file=sys.stderr)
+
+    report = {'environment': environment(), 'results': results}
+    regressions = compare(results, baseline) if baseline is not None else []
+    if baseline is not None:
+        report['baseline'] = baseline['environment']
+        report['regressions'] = regressions
+        report['regressionPercent'] = MICRO_REGRESSION_PERCENT
+        for key in ('python', 'numpy', 'machine'):
+            if baseline['environment'].get(key) != report['environment'][key]:
+                print(f"Warning: the baseline was recorded with {key} {baseline['environment'].get(key)}, this run "
+                      f"uses {report['environment'][key]}; re-save it on this machine before comparing", file=sys.stderr)
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump({'environment': report['environment'], 'results': results}, f, indent=2, sort_keys=True)
+            f.write('\n')
+    print(json.dumps(report, indent=2))
+
+    if regressions:
+        print(f"{len(regressions)} case(s) more than {MICRO_REGRESSION_PERCENT:.0f}% slower than the baseline: "
+              f"{', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,34 @@
+from werkzeug.utils import cached_property, import_string
+
+import page_cache
+import response_cache
+
+class LazyView:
+    """
+    View that imports its calculator module on the first request, so
+    registering the routes does not pay for loading every calculator
+    """
+
+    def __init__(self, import_name):
+        self.__module__, self.__name__ = import_name.rsplit('.', 1)
+        self.import_name = import_name
+
+    @cached_property
+    def view(self):
+        return import_string(self.import_name)
+
+    def __call__(self, *args, **kwargs):
+        return self.view(*args, **kwargs)
+
+def add_lazy_routes(blueprint, module, routes, exempt=()):
+    """
+    Register (rule, view name[, methods]) routes whose views live in `module`.
+    Routes without methods are the GET calculator pages.
+    """
+    for rule, name, *methods in routes:
+        view = LazyView(f'{module}.{name}')
+        if not methods:
+            view = page_cache.page(view)
+        if name in exempt:
+            view = response_cache.exempt(view)
+        blueprint.add_url_rule(rule, name, view, methods=methods[0] if methods else None)
@@ -0,0 +1,28 @@
+from flask import Blueprint
+
+from blueprints import add_lazy_routes
+
+bp = Blueprint('comparisons', __name__)
+
+ROUTES = [
+    ('/flat-vs-reducing-rate-interest-calculator/', 'flat_vs_reducing_rate_interest_calculator'),
+    ('/lumpsum-vs-sip-calculator/', 'lumpsum_vs_sip_calculator'),
+    ('/calculate-flat-vs-reducing-rate-interest', 'calculate_flat_vs_reducing_rate_interest', ['POST']),
+    ('/calculate-lumpsum-vs-sip', 'calculate_lumpsum_vs_sip', ['POST']),
+    ('/rd-vs-sip-calculator/', 'rd_vs_sip_calculator'),
+    ('/calculate-rd-vs-sip', 'calculate_rd_vs_sip', ['POST']),
+    ('/ppf-vs-sip-calculator/', 'ppf_vs_sip_calculator'),
+    ('/nps-vs-sip-calculator/', 'nps_vs_sip_calculator'),
+    ('/ulip-vs-sip-calculator/', 'ulip_vs_sip_calculator'),
+    ('/calculate-ppf-vs-sip-comparison', 'calculate_ppf_vs_sip_comparison', ['POST']),
+    ('/fd-vs-sip-calculator/', 'fd_vs_sip_calculator'),
+    ('/calculate-fd-vs-sip', 'calculate_fd_vs_sip', ['POST']),
+    ('/rd-vs-fd-vs-sip-calculator/', 'rd_vs_fd_vs_sip_calculator'),
+    ('/calculate-rd-vs-fd-vs-sip', 'calculate_rd_vs_fd_vs_sip', ['POST']),
+    ('/sip-calculator-vs-interest-calculator/', 'sip_calculator_vs_interest_calculator'),
+    ('/calculate-sip-vs-interest', 'calculate_sip_vs_interest', ['POST']),
+    ('/elss-vs-sip-calculator/', 'elss_vs_sip_calculator'),
+    ('/calculate-elss-vs-sip', 'calculate_elss_vs_sip', ['POST'])
+]
+
+add_lazy_routes(bp, 'calculators.comparisons', ROUTES)
@@ -0,0 +1,45 @@
+from flask import Blueprint
+
+from blueprints import add_lazy_routes
+
+bp = Blueprint('government_schemes', __name__)
+
+ROUTES = [
+    ('/nps-calculator/', 'nps_calculator'),
+    ('/calculate-nps', 'calculate_nps', ['POST']),
+    ('/epf-calculator/', 'epf_calculator'),
+    ('/calculate-epf', 'calculate_epf', ['POST']),
+    ('/post-office-monthly-income-scheme-calculator/', 'post_office_monthly_income_scheme_calculator'),
+    ('/calculate-post-office-monthly-income-scheme', 'calculate_post_office_monthly_income_scheme', ['POST']),
+    ('/senior-citizen-savings-scheme-calculator/', 'senior_citizen_savings_scheme_calculator'),
+    ('/sukanya-samriddhi-yojana-calculator/', 'sukanya_samriddhi_yojana_calculator'),
+    ('/calculate-scss', 'calculate_scss', ['POST']),
+    ('/calculate-ssy', 'calculate_ssy', ['POST']),
+    ('/atal-pension-yojana-calculator/', 'atal_pension_yojana_calculator'),
+    ('/calculate-apy', 'calculate_apy', ['POST']),
+    ('/ppf-calculator/', 'ppf_calculator'),
+    ('/calculate-ppf', 'calculate_ppf_route', ['POST']),
+    ('/rbi-floating-rate-savings-bonds-calculator/', 'rbi_floating_rate_savings_bonds_calculator'),
+    ('/calculate-rbi-floating-rate-bonds', 'calculate_rbi_floating_rate_bonds_route', ['POST']),
+    ('/kisan-vikas-patra-calculator/', 'kisan_vikas_patra_calculator'),
+    ('/calculate-kvp', 'calculate_kvp', ['POST']),
+    ('/national-savings-certificate-calculator/', 'national_savings_certificate_calculator'),
+    ('/calculate-nsc', 'calculate_nsc', ['POST']),
+    ('/pradhan-mantri-shram-yogi-maandhan-calculator/', 'pradhan_mantri_shram_yogi_maandhan_calculator'),
+    ('/pradhan-mantri-vaya-vandana-yojana-calculator/', 'pradhan_mantri_vaya_vandana_yojana_calculator'),
+    ('/calculate-pmsym', 'calculate_pmsym', ['POST']),
+    ('/sovereign-gold-bonds-calculator/', 'sovereign_gold_bonds_calculator'),
+    ('/calculate-sgb', 'calculate_sgb', ['POST']),
+    ('/post-office-rd-calculator/', 'post_office_rd_calculator'),
+    ('/calculate-post-office-rd', 'calculate_post_office_rd', ['POST'])
+]
+
+# Results depend on the current date, so they are never served from the response cache
+EXEMPT = [
+    'calculate_rbi_floating_rate_bonds_route',
+    'calculate_kvp',
+    'calculate_nsc',
+    'calculate_post_office_rd'
+]
+
+add_lazy_routes(bp, 'calculators.government_schemes', ROUTES, EXEMPT)
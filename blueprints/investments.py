@@ -0,0 +1,101 @@
+from flask import Blueprint
+
+import batch
+from blueprints import add_lazy_routes
+
+bp = Blueprint('investments', __name__)
+
+ROUTES = [
+    ('/', 'sip_calculator'),
+    ('/sip-calculator/', 'sip_calculator_redirect'),
+    ('/mutual-funds-expense-ratio-calculator/', 'mutual_funds_expense_ratio_calculator'),
+    ('/expense-ratio-calculator/', 'expense_ratio_calculator'),
+    ('/daily-sip-calculator/', 'daily_sip_calculator'),
+    ('/monthly-sip-calculator/', 'monthly_sip_calculator'),
+    ('/quarterly-sip-calculator/', 'quarterly_sip_calculator'),
+    ('/yearly-sip-calculator/', 'yearly_sip_calculator'),
+    ('/reverse-sip-calculator/', 'reverse_sip_calculator'),
+    ('/lump-sum-or-one-time-sip-calculator/', 'lump_sum_sip_calculator'),
+    ('/sip-calculator-with-expense-ratio/', 'sip_calculator_with_expense_ratio'),
+    ('/sip-calculator-with-inflation/', 'sip_calculator_with_inflation'),
+    ('/sip-calculator-with-inflation-and-tax/', 'sip_calculator_with_inflation_and_tax'),
+    ('/sip-calculator-with-inflation-and-tax-2/', 'sip_calculator_with_inflation_and_tax_2'),
+    ('/sip-delay-calculator/', 'sip_delay_calculator'),
+    ('/sip-exit-load-calculator/', 'sip_exit_load_calculator'),
+    ('/stock-average-calculator/', 'stock_average_calculator'),
+    ('/calculate-sip', 'calculate_sip', ['POST']),
+    ('/calculate-sip-grid', 'calculate_sip_grid', ['POST']),
+    ('/calculate-lump-sum-sip', 'calculate_lump_sum_sip', ['POST']),
+    ('/calculate-daily-sip', 'calculate_daily_sip', ['POST']),
+    ('/calculate-monthly-sip', 'calculate_monthly_sip', ['POST']),
+    ('/calculate-quarterly-sip', 'calculate_quarterly_sip', ['POST']),
+    ('/calculate-yearly-sip', 'calculate_yearly_sip', ['POST']),
+    ('/calculate-sip-with-expense-ratio', 'calculate_sip_with_expense_ratio', ['POST']),
+    ('/calculate-sip-with-inflation', 'calculate_sip_with_inflation', ['POST']),
+    ('/calculate-sip-with-inflation-and-tax', 'calculate_sip_with_inflation_and_tax', ['POST']),
+    ('/calculate-reverse-sip', 'calculate_reverse_sip', ['POST']),
+    ('/calculate-sip-delay', 'calculate_sip_delay', ['POST']),
+    ('/calculate-sip-exit-load', 'calculate_sip_exit_load', ['POST']),
+    ('/calculate-stock-average', 'calculate_stock_average', ['POST']),
+    ('/step-up-sip-calculator/', 'step_up_sip_calculator'),
+    ('/cagr-sip-calculator/', 'cagr_sip_calculator'),
+    ('/reverse-cagr-calculator/', 'reverse_cagr_calculator'),
+    ('/calculate-reverse-cagr', 'calculate_reverse_cagr_route', ['POST']),
+    ('/roi-calculator/', 'roi_calculator'),
+    ('/fd-calculator/', 'fd_calculator'),
+    ('/rd-calculator/', 'rd_calculator'),
+    ('/compound-interest-calculator/', 'compound_interest_calculator'),
+    ('/swp-calculator/', 'swp_calculator'),
+    ('/elss-sip-calculator/', 'elss_sip_calculator'),
+    ('/calculate-step-up-sip', 'calculate_step_up_sip', ['POST']),
+    ('/calculate-cagr', 'calculate_cagr', ['POST']),
+    ('/calculate-roi', 'calculate_roi', ['POST']),
+    ('/calculate-fd', 'calculate_fd', ['POST']),
+    ('/calculate-rd', 'calculate_rd', ['POST']),
+    ('/calculate-compound-interest', 'calculate_compound_interest', ['POST']),
+    ('/calculate-swp', 'calculate_swp', ['POST']),
+    ('/calculate-elss-sip', 'calculate_elss_sip', ['POST']),
+    ('/etf-return-calculator/', 'etf_return_calculator'),
+    ('/exit-load-calculator/', 'exit_load_calculator'),
+    ('/calculate-exit-load', 'calculate_exit_load', ['POST']),
+    ('/calculate-mutual-fund-expense-ratio', 'calculate_mutual_fund_expense_ratio', ['POST']),
+    ('/calculate-expense-ratio', 'calculate_expense_ratio', ['POST']),
+    ('/goal-sip-calculator/', 'goal_sip_calculator'),
+    ('/calculate-goal-sip', 'calculate_goal_sip', ['POST']),
+    ('/inflation-calculator/', 'inflation_calculator'),
+    ('/ulip-return-calculator/', 'ulip_return_calculator'),
+    ('/vacation-saving-planner-calculator/', 'vacation_saving_planner_calculator'),
+    ('/child-education-calculator/', 'child_education_calculator'),
+    ('/retirement-calculator/', 'retirement_calculator'),
+    ('/net-worth-calculator/', 'net_worth_calculator'),
+    ('/rule-of-72-calculator/', 'rule_of_72_calculator'),
+    ('/calculate-child-education/', 'calculate_child_education', ['POST']),
+    ('/calculate-ulip', 'calculate_ulip_route', ['POST']),
+    ('/calculate-retirement', 'calculate_retirement_route', ['POST']),
+    ('/calculate-rule-of-72', 'calculate_rule_of_72_route', ['POST']),
+    ('/gold-sip-calculator/', 'gold_sip_calculator'),
+    ('/calculate-inflation', 'calculate_inflation', ['POST']),
+    ('/calculate-gold-sip', 'calculate_gold_sip', ['POST']),
+    ('/calculate-goal-sip-with-inflation-and-tax', 'calculate_goal_sip_with_inflation_and_tax_route', ['POST']),
+    ('/index-fund-calculator/', 'index_fund_calculator'),
+    ('/calculate-index-fund', 'calculate_index_fund', ['POST']),
+    ('/stock-return-calculator/', 'stock_return_calculator'),
+    ('/calculate-stock-return', 'calculate_stock_return', ['POST']),
+    ('/xirr-calculator/', 'xirr_calculator'),
+    ('/calculate-xirr-analysis', 'calculate_xirr_analysis', ['POST']),
+    ('/daily-compound-interest-calculator/', 'daily_compound_interest_calculator'),
+    ('/calculate-daily-compound-interest', 'calculate_daily_compound_interest_route', ['POST']),
+    ('/future-value-calculator/', 'future_value_calculator'),
+    ('/calculate-future-value', 'calculate_future_value_route', ['POST']),
+    ('/marriage-planning-calculator/', 'marriage_planning_calculator'),
+    ('/calculate-marriage-planning', 'calculate_marriage_planning_route', ['POST']),
+    ('/calculate-vacation-savings', 'calculate_vacation_savings_route', ['POST']),
+    ('/pension-calculator/', 'pension_retirement_calculator'),
+    ('/calculate-pension-requirements', 'calculate_pension_requirements', ['POST'])
+]
+
+add_lazy_routes(bp, 'calculators.investments', ROUTES)
+
+# Calculators /batch evaluates straight from the JSON payload
+batch.register('investments.calculate_sip', 'calculators.common:sip_result')
+batch.register('investments.calculate_fd', 'calculators.investments:fd_result')
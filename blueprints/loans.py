@@ -0,0 +1,118 @@
+from flask import Blueprint
+
+import batch
+from blueprints import add_lazy_routes
+
+bp = Blueprint('loans', __name__)
+
+ROUTES = [
+    ('/home-loan-emi-calculator/', 'home_loan_calculator'),
+    ('/home-loan-eligibility-calculator/', 'home_loan_eligibility_calculator'),
+    ('/home-loan-affordability-calculator/', 'home_loan_affordability_calculator'),
+    ('/home-loan-refinance-calculator/', 'home_loan_refinance_calculator'),
+    ('/loan-amount-calculator/', 'loan_amount_calculator'),
+    ('/loan-tenure-calculator/', 'loan_tenure_calculator'),
+    ('/interest-rate-calculator/', 'interest_rate_calculator'),
+    ('/car-loan-emi-calculator/', 'car_loan_emi_calculator'),
+    ('/two-wheeler-loan-emi-calculator/', 'two_wheeler_loan_emi_calculator'),
+    ('/personal-loan-emi-calculator/', 'personal_loan_emi_calculator'),
+    ('/business-loan-emi-calculator/', 'business_loan_emi_calculator'),
+    ('/education-loan-emi-calculator/', 'education_loan_emi_calculator'),
+    ('/credit-card-emi-calculator/', 'credit_card_emi_calculator'),
+    ('/mobile-phone-emi-calculator/', 'mobile_phone_emi_calculator'),
+    ('/laptop-emi-calculator/', 'laptop_emi_calculator'),
+    ('/land-loan-emi-calculator/', 'land_loan_emi_calculator'),
+    ('/tractor-loan-emi-calculator/', 'tractor_loan_emi_calculator'),
+    ('/commercial-property-loan-emi-calculator/', 'commercial_property_emi_calculator'),
+    ('/commercial-vehicle-emi-calculator/', 'commercial_vehicle_emi_calculator'),
+    ('/daily-emi-calculator/', 'daily_emi_calculator'),
+    ('/weekly-emi-calculator/', 'weekly_emi_calculator'),
+    ('/monthly-emi-calculator/', 'monthly_emi_calculator'),
+    ('/emi-calculator-with-part-payment/', 'emi_calculator_with_part_payment'),
+    ('/flat-interest-rate-emi-calculator/', 'flat_interest_rate_emi_calculator'),
+    ('/step-up-emi-calculator/', 'step_up_emi_calculator'),
+    ('/bullet-emi-calculator/', 'bullet_emi_calculator'),
+    ('/reverse-emi-calculator/', 'reverse_emi_calculator'),
+    ('/no-cost-emi-calculator/', 'no_cost_emi_calculator'),
+    ('/reducing-loan-emi-calculator/', 'reducing_loan_emi_calculator'),
+    ('/reducing-balance-emi-calculator/', 'reducing_balance_emi_calculator'),
+    ('/reducing-rate-emi-calculator/', 'reducing_rate_emi_calculator'),
+    ('/emi-overdue-status-calculator/', 'emi_overdue_status_calculator'),
+    ('/calculate-emi-overdue-status', 'calculate_emi_overdue_status_route', ['POST']),
+    ('/calculate', 'calculate', ['POST']),
+    ('/calculate-step-up-emi', 'calculate_step_up_emi_route', ['POST']),
+    ('/calculate-flat-interest-rate-emi', 'calculate_flat_interest_rate_emi', ['POST']),
+    ('/calculate-reducing-loan-emi', 'calculate_reducing_loan_emi_route', ['POST']),
+    ('/calculate-reducing-balance-emi', 'calculate_reducing_balance_emi_route', ['POST']),
+    ('/calculate-reducing-rate-emi', 'calculate_reducing_rate_emi_route', ['POST']),
+    ('/calculate-no-cost-emi', 'calculate_no_cost_emi_route', ['POST']),
+    ('/calculate-bullet-emi', 'calculate_bullet_emi_route', ['POST']),
+    ('/calculate-reverse-emi', 'calculate_reverse_emi', ['POST']),
+    ('/calculate-home-loan', 'calculate_home_loan', ['POST']),
+    ('/calculate-home-loan-eligibility', 'calculate_home_loan_eligibility', ['POST']),
+    ('/calculate-affordability', 'calculate_affordability', ['POST']),
+    ('/calculate-refinance', 'calculate_refinance', ['POST']),
+    ('/calculate-loan-amount', 'calculate_loan_amount', ['POST']),
+    ('/calculate-loan-tenure', 'calculate_loan_tenure', ['POST']),
+    ('/calculate-interest-rate', 'calculate_interest_rate', ['POST']),
+    ('/stream-schedule/<product>', 'stream_schedule', ['POST']),
+    ('/export/<product>', 'export_schedule', ['POST']),
+    ('/calculate-emi-grid', 'calculate_emi_grid', ['POST']),
+    ('/calculate-car-loan-emi', 'calculate_car_loan_emi', ['POST']),
+    ('/calculate-two-wheeler-loan-emi', 'calculate_two_wheeler_loan_emi', ['POST']),
+    ('/calculate-personal-loan-emi', 'calculate_personal_loan_emi', ['POST']),
+    ('/calculate-business-loan-emi', 'calculate_business_loan_emi', ['POST']),
+    ('/calculate-education-loan-emi', 'calculate_education_loan_emi', ['POST']),
+    ('/calculate-credit-card-emi', 'calculate_credit_card_emi', ['POST']),
+    ('/calculate-mobile-phone-emi', 'calculate_mobile_phone_emi', ['POST']),
+    ('/calculate-laptop-emi', 'calculate_laptop_emi', ['POST']),
+    ('/calculate-land-loan-emi', 'calculate_land_loan_emi', ['POST']),
+    ('/calculate-commercial-property-emi', 'calculate_commercial_property_emi', ['POST']),
+    ('/calculate-commercial-vehicle-emi', 'calculate_commercial_vehicle_emi', ['POST']),
+    ('/calculate-tractor-loan-emi', 'calculate_tractor_loan_emi', ['POST']),
+    ('/calculate-daily-emi', 'calculate_daily_emi', ['POST']),
+    ('/calculate-weekly-emi', 'calculate_weekly_emi', ['POST']),
+    ('/calculate-monthly-emi', 'calculate_monthly_emi', ['POST']),
+    ('/loan-against-property-emi-calculator/', 'loan_against_property_emi_calculator'),
+    ('/calculate-loan-against-property-emi', 'calculate_loan_against_property_emi', ['POST']),
+    ('/gold-loan-emi-calculator/', 'gold_loan_emi_calculator'),
+    ('/quarterly-emi-calculator/', 'quarterly_emi_calculator'),
+    ('/calculate-gold-loan-emi', 'calculate_gold_loan_emi', ['POST']),
+    ('/calculate-quarterly-emi', 'calculate_quarterly_emi', ['POST']),
+    ('/calculate-emi-with-part-payment', 'calculate_emi_with_part_payment', ['POST']),
+    ('/floating-interest-rate-emi-calculator/', 'floating_interest_rate_emi_calculator'),
+    ('/calculate-floating-interest-rate-emi', 'calculate_floating_interest_rate_emi_route', ['POST'])
+]
+
+# Results depend on the current date, so they are never served from the response cache
+EXEMPT = [
+    'calculate_credit_card_emi',
+    'calculate_mobile_phone_emi',
+    'calculate_laptop_emi'
+]
+
+add_lazy_routes(bp, 'calculators.loans', ROUTES, EXEMPT)
+
+# Calculators /batch evaluates straight from the JSON payload
+LOAN_PRODUCT_ENDPOINTS = {
+    'calculate': 'emi',
+    'calculate_car_loan_emi': 'car_loan',
+    'calculate_two_wheeler_loan_emi': 'two_wheeler_loan',
+    'calculate_personal_loan_emi': 'personal_loan',
+    'calculate_business_loan_emi': 'business_loan',
+    'calculate_credit_card_emi': 'credit_card',
+    'calculate_mobile_phone_emi': 'mobile_phone_loan',
+    'calculate_laptop_emi': 'laptop_loan',
+    'calculate_land_loan_emi': 'land_loan',
+    'calculate_commercial_property_emi': 'commercial_property_loan',
+    'calculate_commercial_vehicle_emi': 'commercial_vehicle_loan',
+    'calculate_tractor_loan_emi': 'tractor_loan',
+    'calculate_daily_emi': 'daily',
+    'calculate_weekly_emi': 'weekly',
+    'calculate_monthly_emi': 'monthly',
+    'calculate_loan_against_property_emi': 'loan_against_property',
+    'calculate_quarterly_emi': 'quarterly'
+}
+
+for endpoint, product in LOAN_PRODUCT_ENDPOINTS.items():
+    batch.register(f'loans.{endpoint}', 'calculators.loans:loan_product_result', product)
@@ -0,0 +1,26 @@
+from flask import Blueprint
+
+from blueprints import add_lazy_routes
+
+bp = Blueprint('tax', __name__)
+
+ROUTES = [
+    ('/gratuity-calculator/', 'gratuity_calculator'),
+    ('/calculate-gratuity', 'calculate_gratuity', ['POST']),
+    ('/ltcg-calculator/', 'ltcg_calculator'),
+    ('/income-tax-calculator-with-old-and-new-tax-regime/', 'income_tax_calculator_with_old_and_new_tax_regime'),
+    ('/calculate-income-tax-old-new-regime', 'calculate_income_tax_old_new_regime_api', ['POST']),
+    ('/tds-calculator/', 'tds_calculator'),
+    ('/calculate-tds', 'calculate_tds_route', ['POST']),
+    ('/hra-calculator/', 'hra_calculator'),
+    ('/calculate-hra', 'calculate_hra_route', ['POST']),
+    ('/ctc-calculator/', 'ctc_calculator'),
+    ('/calculate-ctc', 'calculate_ctc_route', ['POST']),
+    ('/gst-calculator/', 'gst_calculator'),
+    ('/reverse-gst-calculator/', 'reverse_gst_calculator'),
+    ('/calculate-gst', 'calculate_gst', ['POST']),
+    ('/calculate-reverse-gst', 'calculate_reverse_gst', ['POST']),
+    ('/capital-gains-calculator-with-and-without-tax-slabs/', 'capital_gains_calculator_with_and_without_tax_slabs')
+]
+
+add_lazy_routes(bp, 'calculators.tax', ROUTES)
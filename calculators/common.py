@@ -0,0 +1,247 @@
+
+from result_cache import memoize
+
+def calculate_flat_interest_emi(principal, annual_rate, tenure_years):
+    """
+    Calculate flat interest rate EMI
+    In flat interest rate, interest is calculated on the original principal for the entire tenure
+    """
+    total_interest = principal * (annual_rate / 100) * tenure_years
+    total_amount = principal + total_interest
+    
+    # For flat interest rate, we'll use monthly payments as standard
+    total_payments = tenure_years * 12
+    flat_emi = total_amount / total_payments
+    
+    # Calculate effective interest rate (equivalent compound rate)
+    # This is the compound rate that would result in the same total payment
+    monthly_rate = (annual_rate / 100) / 12
+    compound_emi = principal * monthly_rate * ((1 + monthly_rate) ** (tenure_years * 12)) / (((1 + monthly_rate) ** (tenure_years * 12)) - 1)
+    compound_total = compound_emi * (tenure_years * 12)
+    
+    # Calculate effective rate using formula: ((Total/Principal)^(1/years) - 1) * 100
+    effective_rate = ((total_amount / principal) ** (1 / tenure_years) - 1) * 100
+    
+    return {
+        'flatEmi': round(flat_emi, 2),
+        'totalInterest': round(total_interest, 2),
+        'totalAmount': round(total_amount, 2),
+        'effectiveRate': round(effective_rate, 2),
+        'compoundEmi': round(compound_emi, 2),
+        'compoundTotal': round(compound_total, 2),
+        'totalPayments': total_payments
+    }
+
+@memoize()
+def calculate_sip_returns(sip_amount, frequency, annual_return_rate, tenure_years, inflation_rate):
+    """
+    Calculate SIP returns with inflation adjustment
+    """
+    # Convert frequency to investments per year
+    frequency_multiplier = {
+        'daily': 365,
+        'monthly': 12,
+        'quarterly': 4,
+        'yearly': 1,
+        'one-time': 1
+    }
+    
+    investments_per_year = frequency_multiplier.get(frequency, 12)
+    
+    # Periodic return rate
+    if frequency == 'one-time':
+        # One-time investment calculation
+        total_invested = sip_amount
+        future_value = sip_amount * ((1 + annual_return_rate / 100) ** tenure_years)
+        total_returns = future_value - total_invested
+    else:
+        # SIP calculation using compound interest formula
+        periodic_rate = annual_return_rate / (100 * investments_per_year)
+        total_periods = tenure_years * investments_per_year
+        
+        # Future Value of SIP using the formula: FV = PMT * [((1 + r)^n - 1) / r] * (1 + r)
+        # Using annuity due formula as SIP investments are typically made at the beginning of period
+        if periodic_rate == 0:
+            future_value = sip_amount * total_periods
+        else:
+            future_value = sip_amount * (((1 + periodic_rate) ** total_periods - 1) / periodic_rate) * (1 + periodic_rate)
+        
+        total_invested = sip_amount * total_periods
+        total_returns = future_value - total_invested
+    
+    # Calculate inflation-adjusted value
+    inflation_adjusted_value = future_value / ((1 + inflation_rate / 100) ** tenure_years)
+    
+    # Calculate year-wise breakdown
+    yearly_breakdown = []
+    
+    for year in range(1, tenure_years + 1):
+        if frequency == 'one-time':
+            if year == 1:
+                yearly_invested = sip_amount
+                cumulative_invested = sip_amount
+            else:
+                yearly_invested = 0
+                cumulative_invested = sip_amount
+            cumulative_value = sip_amount * ((1 + annual_return_rate / 100) ** year)
+        else:
+            yearly_invested = sip_amount * investments_per_year
+            cumulative_invested = yearly_invested * year  # Total invested up to this year
+            
+            # Calculate cumulative value at the end of this year
+            if periodic_rate == 0:
+                cumulative_value = cumulative_invested
+            else:
+                periods_completed = year * investments_per_year
+                cumulative_value = sip_amount * (((1 + periodic_rate) ** periods_completed - 1) / periodic_rate) * (1 + periodic_rate)
+        
+        yearly_returns = cumulative_value - cumulative_invested
+        inflation_adjusted_cumulative = cumulative_value / ((1 + inflation_rate / 100) ** year)
+        
+        yearly_breakdown.append({
+            'year': year,
+            'yearly_invested': round(yearly_invested, 2),
+            'cumulative_invested': round(cumulative_invested, 2),
+            'cumulative_value': round(cumulative_value, 2),
+            'yearly_returns': round(yearly_returns, 2),
+            'inflation_adjusted_value': round(inflation_adjusted_cumulative, 2)
+        })
+    
+    return {
+        'total_invested': round(total_invested, 2),
+        'future_value': round(future_value, 2),
+        'total_returns': round(total_returns, 2),
+        'inflation_adjusted_value': round(inflation_adjusted_value, 2),
+        'real_returns': round(inflation_adjusted_value - total_invested, 2),
+        'yearly_breakdown': yearly_breakdown
+    }
+
+def sip_result(data):
+    """
+    SIP maturity summary for a /calculate-sip payload, returning the response
+    body and status code
+    """
+    try:
+        sip_amount = float(data.get('sipAmount', 0))
+        frequency = data.get('frequency', 'monthly')
+        annual_return_rate = float(data.get('returnRate', 12))
+        tenure_years = int(data.get('tenureYears', 10))
+        inflation_rate = float(data.get('inflationRate', 6))
+        
+        if sip_amount <= 0 or tenure_years <= 0:
+            return {
+                'status': 'error',
+                'error': 'Invalid input values'
+            }, 200
+        
+        # Calculate SIP returns
+        results = calculate_sip_returns(sip_amount, frequency, annual_return_rate, tenure_years, inflation_rate)
+        
+        # Calculate percentage breakdown for chart
+        total_amount = results['future_value']
+        invested_percentage = (results['total_invested'] / total_amount) * 100 if total_amount > 0 else 0
+        returns_percentage = (results['total_returns'] / total_amount) * 100 if total_amount > 0 else 0
+        
+        return {
+            'status': 'success',
+            'sipAmount': sip_amount,
+            'frequency': frequency,
+            'totalInvested': results['total_invested'],
+            'futureValue': results['future_value'],
+            'totalReturns': results['total_returns'],
+            'inflationAdjustedValue': results['inflation_adjusted_value'],
+            'realReturns': results['real_returns'],
+            'investedPercentage': round(invested_percentage, 1),
+            'returnsPercentage': round(returns_percentage, 1),
+            'yearlyBreakdown': results['yearly_breakdown'],
+            'returnRate': annual_return_rate,
+            'tenureYears': tenure_years,
+            'inflationRate': inflation_rate
+        }, 200
+    
+    except Exception as e:
+        return {
+            'status': 'error',
+            'error': str(e)
+        }, 200
+
+def calculate_rd_returns(monthly_amount, duration_years, annual_rate, compounding_frequency):
+    """
+    Calculate RD (Recurring Deposit) maturity returns
+    Formula: A = P × [(1 + r/n)^(nt) - 1] / (r/n) × (1 + r/n)
+    """
+    months = duration_years * 12
+    
+    # Compounding frequency mapping
+    frequency_map = {
+        'monthly': 12,
+        'quarterly': 4,
+        'annually': 1
+    }
+    
+    n = frequency_map.get(compounding_frequency, 12)
+    r = annual_rate / 100
+    
+    if r == 0:
+        maturity_value = monthly_amount * months
+        total_invested = monthly_amount * months
+        interest_earned = 0
+    else:
+        # RD calculation with compound interest
+        rate_per_period = r / n
+        total_periods = duration_years * n
+        
+        # Calculate maturity value using RD formula
+        compound_factor = ((1 + rate_per_period) ** total_periods - 1) / rate_per_period
+        maturity_value = monthly_amount * (12 / n) * compound_factor * (1 + rate_per_period)
+        
+        total_invested = monthly_amount * months
+        interest_earned = maturity_value - total_invested
+    
+    return {
+        'maturity_value': round(maturity_value, 2),
+        'total_invested': round(total_invested, 2),
+        'interest_earned': round(interest_earned, 2)
+    }
+
+@memoize()
+def calculate_fd_returns(monthly_investment, duration_years, interest_rate, compounding_frequency):
+    """
+    Calculate Fixed Deposit returns with compound interest
+    """
+    try:
+        # Convert to monthly investment to total investment
+        total_investment = monthly_investment * 12 * duration_years
+        
+        # Determine compounding periods per year
+        if compounding_frequency == 'monthly':
+            n = 12
+        elif compounding_frequency == 'quarterly':
+            n = 4
+        elif compounding_frequency == 'annually':
+            n = 1
+        else:
+            n = 4  # default to quarterly
+        
+        # Convert annual rate to decimal
+        r = interest_rate / 100
+        
+        # Calculate compound interest: A = P(1 + r/n)^(nt)
+        maturity_value = total_investment * ((1 + r/n) ** (n * duration_years))
+        
+        # Calculate interest earned
+        interest_earned = maturity_value - total_investment
+        
+        return {
+            'total_invested': round(total_investment, 2),
+            'maturity_value': round(maturity_value, 2),
+            'interest_earned': round(interest_earned, 2),
+            'interest_rate': interest_rate,
+            'duration_years': duration_years,
+            'compounding_frequency': compounding_frequency
+        }
+    
+    except Exception as e:
+        return {
+            'error': str(e)
+        }
@@ -0,0 +1,1228 @@
+from flask import render_template, request, jsonify
+import math
+
+from calculators.common import calculate_fd_returns, calculate_flat_interest_emi, calculate_rd_returns
+
+def flat_vs_reducing_rate_interest_calculator():
+    return render_template('flat_vs_reducing_rate_interest_calculator.html')
+
+def lumpsum_vs_sip_calculator():
+    return render_template('lumpsum_vs_sip_calculator.html')
+
+def calculate_flat_vs_reducing_rate_comparison(principal, annual_rate, tenure_years):
+    """
+    Calculate and compare flat interest rate vs reducing interest rate (compound) EMI
+    """
+    # Calculate flat interest EMI
+    flat_calculation = calculate_flat_interest_emi(principal, annual_rate, tenure_years)
+    
+    # Calculate reducing interest rate EMI (compound)
+    tenure_months = tenure_years * 12
+    monthly_rate = annual_rate / (12 * 100)
+    
+    if monthly_rate > 0:
+        reducing_emi = principal * monthly_rate * ((1 + monthly_rate) ** tenure_months) / (((1 + monthly_rate) ** tenure_months) - 1)
+    else:
+        reducing_emi = principal / tenure_months
+    
+    reducing_total_amount = reducing_emi * tenure_months
+    reducing_total_interest = reducing_total_amount - principal
+    
+    # Calculate differences
+    emi_difference = flat_calculation['flatEmi'] - reducing_emi
+    total_savings = flat_calculation['totalInterest'] - reducing_total_interest
+    
+    return {
+        'flatEmi': flat_calculation['flatEmi'],
+        'flatTotalInterest': flat_calculation['totalInterest'],
+        'flatTotalAmount': flat_calculation['totalAmount'],
+        'reducingEmi': round(reducing_emi, 2),
+        'reducingTotalInterest': round(reducing_total_interest, 2),
+        'reducingTotalAmount': round(reducing_total_amount, 2),
+        'emiDifference': round(emi_difference, 2),
+        'totalSavings': round(total_savings, 2),
+        'loanAmount': principal
+    }
+
+def generate_flat_vs_reducing_comparison_schedule(principal, annual_rate, tenure_years, start_year=2025):
+    """
+    Generate year-wise comparison schedule between flat and reducing interest rates
+    """
+    # Flat interest calculations
+    flat_calculation = calculate_flat_interest_emi(principal, annual_rate, tenure_years)
+    flat_emi = flat_calculation['flatEmi']
+    
+    # Calculate flat interest per payment (constant for flat rate)
+    total_flat_interest = principal * (annual_rate / 100) * tenure_years
+    flat_interest_per_payment = total_flat_interest / (tenure_years * 12)
+    flat_principal_per_payment = principal / (tenure_years * 12)
+    
+    # Reducing interest calculations
+    tenure_months = tenure_years * 12
+    monthly_rate = annual_rate / (12 * 100)
+    
+    if monthly_rate > 0:
+        reducing_emi = principal * monthly_rate * ((1 + monthly_rate) ** tenure_months) / (((1 + monthly_rate) ** tenure_months) - 1)
+    else:
+        reducing_emi = principal / tenure_months
+    
+    comparison_schedule = []
+    flat_remaining_balance = principal
+    reducing_remaining_balance = principal
+    
+    for year in range(tenure_years):
+        current_year = start_year + year
+        
+        # Flat interest calculations for the year
+        flat_year_principal = flat_principal_per_payment * 12
+        flat_year_interest = flat_interest_per_payment * 12
+        flat_remaining_balance -= flat_year_principal
+        
+        # Reducing interest calculations for the year
+        reducing_year_principal = 0
+        reducing_year_interest = 0
+        
+        # Calculate 12 months for reducing interest
+        for month in range(12):
+            if reducing_remaining_balance <= 0:
+                break
+                
+            interest_payment = reducing_remaining_balance * monthly_rate
+            principal_payment = min(reducing_emi - interest_payment, reducing_remaining_balance)
+            
+            reducing_year_principal += principal_payment
+            reducing_year_interest += interest_payment
+            reducing_remaining_balance -= principal_payment
+        
+        # Calculate interest savings for this year
+        interest_savings = flat_year_interest - reducing_year_interest
+        
+        comparison_schedule.append({
+            'year': current_year,
+            'flatEmi': round(flat_emi, 2),
+            'flatInterest': round(flat_year_interest, 2),
+            'flatBalance': round(max(0, flat_remaining_balance), 2),
+            'reducingEmi': round(reducing_emi, 2),
+            'reducingInterest': round(reducing_year_interest, 2),
+            'reducingBalance': round(max(0, reducing_remaining_balance), 2),
+            'interestSavings': round(interest_savings, 2)
+        })
+    
+    return comparison_schedule
+
+def calculate_flat_vs_reducing_rate_interest():
+    try:
+        data = request.get_json()
+        
+        loan_amount = float(data.get('loanAmount', 0))
+        interest_rate = float(data.get('interestRate', 0))
+        tenure_years = int(data.get('tenureYears', 0))
+        
+        # Calculate comparison
+        comparison = calculate_flat_vs_reducing_rate_comparison(loan_amount, interest_rate, tenure_years)
+        
+        # Generate comparison schedule
+        comparison_schedule = generate_flat_vs_reducing_comparison_schedule(
+            loan_amount, interest_rate, tenure_years
+        )
+        
+        return jsonify({
+            'status': 'success',
+            'flatEmi': comparison['flatEmi'],
+            'flatTotalInterest': comparison['flatTotalInterest'],
+            'flatTotalAmount': comparison['flatTotalAmount'],
+            'reducingEmi': comparison['reducingEmi'],
+            'reducingTotalInterest': comparison['reducingTotalInterest'],
+            'reducingTotalAmount': comparison['reducingTotalAmount'],
+            'emiDifference': comparison['emiDifference'],
+            'totalSavings': comparison['totalSavings'],
+            'loanAmount': loan_amount,
+            'comparisonSchedule': comparison_schedule
+        })
+    
+    except Exception as e:
+        return jsonify({'status': 'error', 'error': str(e)}), 400
+
+def calculate_lumpsum_vs_sip_comparison(investment_amount, monthly_sip, expected_return_percent, investment_period_years):
+    """
+    Calculate and compare lumpsum investment vs SIP investment
+    """
+    annual_return_rate = expected_return_percent / 100
+    monthly_return_rate = annual_return_rate / 12
+    total_months = investment_period_years * 12
+    
+    # Lumpsum calculation (compound interest)
+    lumpsum_maturity_value = investment_amount * ((1 + annual_return_rate) ** investment_period_years)
+    lumpsum_gains = lumpsum_maturity_value - investment_amount
+    
+    # SIP calculation (future value of annuity)
+    if monthly_return_rate > 0:
+        sip_maturity_value = monthly_sip * (((1 + monthly_return_rate) ** total_months - 1) / monthly_return_rate)
+    else:
+        sip_maturity_value = monthly_sip * total_months
+    
+    sip_total_investment = monthly_sip * total_months
+    sip_gains = sip_maturity_value - sip_total_investment
+    
+    # Determine better option
+    if investment_amount == 0:
+        better_option = "SIP"
+        difference = sip_maturity_value
+    elif monthly_sip == 0:
+        better_option = "Lumpsum"
+        difference = lumpsum_maturity_value
+    elif lumpsum_maturity_value > sip_maturity_value:
+        better_option = "Lumpsum"
+        difference = lumpsum_maturity_value - sip_maturity_value
+    else:
+        better_option = "SIP"
+        difference = sip_maturity_value - lumpsum_maturity_value
+    
+    return {
+        'lumpsumInvestment': round(investment_amount, 2),
+        'lumpsumMaturityValue': round(lumpsum_maturity_value, 2),
+        'lumpsumGains': round(lumpsum_gains, 2),
+        'sipTotalInvestment': round(sip_total_investment, 2),
+        'sipMaturityValue': round(sip_maturity_value, 2),
+        'sipGains': round(sip_gains, 2),
+        'betterOption': better_option,
+        'difference': round(difference, 2)
+    }
+
+def generate_lumpsum_vs_sip_schedule(investment_amount, monthly_sip, expected_return_percent, investment_period_years, start_year=2025):
+    """
+    Generate year-wise comparison schedule between lumpsum and SIP investments
+    """
+    annual_return_rate = expected_return_percent / 100
+    monthly_return_rate = annual_return_rate / 12
+    
+    comparison_schedule = []
+    
+    # Lumpsum tracking
+    lumpsum_value = investment_amount
+    
+    # SIP tracking
+    sip_total_invested = 0
+    sip_value = 0
+    
+    for year in range(1, investment_period_years + 1):
+        current_year = start_year + year - 1
+        
+        # Lumpsum grows by annual return rate
+        lumpsum_value *= (1 + annual_return_rate)
+        lumpsum_gains = lumpsum_value - investment_amount
+        
+        # SIP: Add 12 months of SIP with monthly compounding
+        for month in range(12):
+            sip_total_invested += monthly_sip
+            sip_value = (sip_value + monthly_sip) * (1 + monthly_return_rate)
+        
+        sip_gains = sip_value - sip_total_invested
+        
+        # Calculate which is better for this year
+        if investment_amount == 0:
+            better_option = "SIP"
+            advantage = sip_value
+        elif monthly_sip == 0:
+            better_option = "Lumpsum"
+            advantage = lumpsum_value
+        elif lumpsum_value > sip_value:
+            better_option = "Lumpsum"
+            advantage = lumpsum_value - sip_value
+        else:
+            better_option = "SIP"
+            advantage = sip_value - lumpsum_value
+        
+        comparison_schedule.append({
+            'year': current_year,
+            'lumpsumValue': round(lumpsum_value, 2),
+            'lumpsumGains': round(lumpsum_gains, 2),
+            'sipTotalInvested': round(sip_total_invested, 2),
+            'sipValue': round(sip_value, 2),
+            'sipGains': round(sip_gains, 2),
+            'betterOption': better_option,
+            'advantage': round(advantage, 2)
+        })
+    
+    return comparison_schedule
+
+def calculate_lumpsum_vs_sip():
+    try:
+        data = request.get_json()
+        
+        investment_amount = float(data.get('investmentAmount', 0))
+        monthly_sip = float(data.get('monthlySip', 0))
+        expected_return = float(data.get('expectedReturn', 0))
+        investment_period = int(data.get('investmentPeriod', 0))
+        
+        # Validate inputs
+        if investment_amount < 0 or monthly_sip < 0 or expected_return < 0 or investment_period < 1:
+            return jsonify({'status': 'error', 'error': 'Please enter positive values (investment period must be at least 1 year)'}), 400
+        
+        if investment_amount == 0 and monthly_sip == 0:
+            return jsonify({'status': 'error', 'error': 'Please enter either a lumpsum amount or SIP amount (or both)'}), 400
+        
+        # Calculate lumpsum vs SIP comparison
+        comparison = calculate_lumpsum_vs_sip_comparison(investment_amount, monthly_sip, expected_return, investment_period)
+        
+        # Generate comparison schedule
+        comparison_schedule = generate_lumpsum_vs_sip_schedule(
+            investment_amount, monthly_sip, expected_return, investment_period
+        )
+        
+        return jsonify({
+            'status': 'success',
+            'lumpsumInvestment': comparison['lumpsumInvestment'],
+            'lumpsumMaturityValue': comparison['lumpsumMaturityValue'],
+            'lumpsumGains': comparison['lumpsumGains'],
+            'sipTotalInvestment': comparison['sipTotalInvestment'],
+            'sipMaturityValue': comparison['sipMaturityValue'],
+            'sipGains': comparison['sipGains'],
+            'betterOption': comparison['betterOption'],
+            'difference': comparison['difference'],
+            'comparisonSchedule': comparison_schedule
+        })
+    
+    except Exception as e:
+        return jsonify({'status': 'error', 'error': str(e)}), 400
+    
+
+# Add this route to your existing app.py file
+
+def rd_vs_sip_calculator():
+    return render_template('rd_vs_sip_calculator.html')
+
+def calculate_basic_sip_returns(monthly_amount, duration_years, expected_return):
+    """
+    Calculate SIP (Systematic Investment Plan) returns
+    Formula: FV = P × [((1 + r)^n - 1) / r] × (1 + r)
+    """
+    months = duration_years * 12
+    monthly_rate = expected_return / (12 * 100)
+    
+    if monthly_rate == 0:
+        maturity_value = monthly_amount * months
+        total_invested = monthly_amount * months
+        gains_earned = 0
+    else:
+        # SIP calculation
+        maturity_value = monthly_amount * (((1 + monthly_rate) ** months - 1) / monthly_rate) * (1 + monthly_rate)
+        total_invested = monthly_amount * months
+        gains_earned = maturity_value - total_invested
+    
+    return {
+        'maturity_value': round(maturity_value, 2),
+        'total_invested': round(total_invested, 2),
+        'gains_earned': round(gains_earned, 2)
+    }
+
+def calculate_rd_vs_sip():
+    try:
+        data = request.get_json()
+        
+        # RD inputs
+        rd_amount = float(data.get('rdAmount', 5000))
+        rd_duration = int(data.get('rdDuration', 5))
+        rd_rate = float(data.get('rdRate', 6.5))
+        rd_compounding = data.get('rdCompounding', 'quarterly')
+        
+        # SIP inputs
+        sip_amount = float(data.get('sipAmount', 5000))
+        sip_duration = int(data.get('sipDuration', 5))
+        sip_return = float(data.get('sipReturn', 12))
+        
+        # Validate inputs
+        if rd_amount < 100 or rd_amount > 1000000:
+            return jsonify({'error': 'RD amount must be between ₹100 and ₹10,00,000'}), 400
+        if sip_amount < 100 or sip_amount > 1000000:
+            return jsonify({'error': 'SIP amount must be between ₹100 and ₹10,00,000'}), 400
+        if rd_duration < 1 or rd_duration > 30:
+            return jsonify({'error': 'Duration must be between 1 and 30 years'}), 400
+        if sip_duration < 1 or sip_duration > 30:
+            return jsonify({'error': 'Duration must be between 1 and 30 years'}), 400
+        if rd_rate < 1 or rd_rate > 20:
+            return jsonify({'error': 'RD interest rate must be between 1% and 20%'}), 400
+        if sip_return < 1 or sip_return > 30:
+            return jsonify({'error': 'SIP expected return must be between 1% and 30%'}), 400
+        
+        # Calculate returns
+        rd_results = calculate_rd_returns(rd_amount, rd_duration, rd_rate, rd_compounding)
+        sip_results = calculate_basic_sip_returns(sip_amount, sip_duration, sip_return)
+        
+        # Calculate comparison metrics
+        rd_invested = rd_results['total_invested']
+        sip_invested = sip_results['total_invested']
+        rd_maturity = rd_results['maturity_value']
+        sip_maturity = sip_results['maturity_value']
+        
+        difference_amount = sip_maturity - rd_maturity
+        if rd_maturity > 0:
+            percentage_gain = ((sip_maturity - rd_maturity) / rd_maturity) * 100
+        else:
+            percentage_gain = 0
+        
+        return jsonify({
+            'status': 'success',
+            'rd': rd_results,
+            'sip': sip_results,
+            'comparison': {
+                'difference_amount': round(difference_amount, 2),
+                'percentage_gain': round(percentage_gain, 2),
+                'better_option': 'SIP' if sip_maturity > rd_maturity else 'RD'
+            }
+        })
+    
+    except Exception as e:
+        return jsonify({'status': 'error', 'error': str(e)}), 400
+
+
+
+# PPF vs SIP Calculator Flask Routes
+# Add these routes and functions to your app.py file
+
+
+def ppf_vs_sip_calculator():
+    return render_template('ppf_vs_sip_calculator.html')
+
+def nps_vs_sip_calculator():
+    return render_template('nps_vs_sip_calculator.html')
+
+def ulip_vs_sip_calculator():
+    return render_template('ulip_vs_sip_calculator.html')
+
+def calculate_ppf_vs_sip_comparison():
+    try:
+        data = request.get_json()
+        
+        # Extract input parameters
+        ppf_annual_amount = float(data.get('ppfAnnualAmount', 150000))
+        ppf_interest_rate = float(data.get('ppfInterestRate', 7.1))
+        sip_monthly_amount = float(data.get('sipMonthlyAmount', 12500))
+        sip_return_rate = float(data.get('sipReturnRate', 12.0))
+        duration_years = int(data.get('duration', 15))
+        
+        # Calculate PPF returns
+        ppf_result = calculate_ppf_returns_backend(ppf_annual_amount, ppf_interest_rate, duration_years)
+        
+        # Calculate SIP returns
+        sip_result = calculate_sip_returns_backend(sip_monthly_amount, sip_return_rate, duration_years)
+        
+        # Compare results
+        comparison = compare_ppf_sip_results(ppf_result, sip_result, duration_years)
+        
+        return jsonify({
+            'status': 'success',
+            'ppf': ppf_result,
+            'sip': sip_result,
+            'comparison': comparison
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'error': str(e)
+        }), 400
+
+def calculate_ppf_returns_backend(annual_amount, interest_rate, duration_years):
+    """
+    Calculate PPF returns with compound interest
+    PPF compounds annually and has a 15-year lock-in period
+    """
+    try:
+        annual_rate = interest_rate / 100
+        total_invested = 0
+        maturity_value = 0
+        yearly_breakdown = []
+        
+        for year in range(1, duration_years + 1):
+            total_invested += annual_amount
+            
+            # PPF compounds annually
+            if year == 1:
+                maturity_value = annual_amount * (1 + annual_rate)
+            else:
+                maturity_value = (maturity_value + annual_amount) * (1 + annual_rate)
+            
+            interest_earned = maturity_value - total_invested
+            
+            yearly_breakdown.append({
+                'year': year,
+                'invested': round(total_invested, 2),
+                'interest': round(interest_earned, 2),
+                'balance': round(maturity_value, 2)
+            })
+        
+        net_gain = maturity_value - total_invested
+        total_return = (net_gain / total_invested) * 100 if total_invested > 0 else 0
+        
+        return {
+            'totalInvested': round(total_invested, 2),
+            'maturityValue': round(maturity_value, 2),
+            'netGain': round(net_gain, 2),
+            'totalReturn': round(total_return, 2),
+            'annualReturn': interest_rate,
+            'yearlyBreakdown': yearly_breakdown,
+            'investmentType': 'PPF'
+        }
+        
+    except Exception as e:
+        raise Exception(f"Error calculating PPF returns: {str(e)}")
+
+def calculate_sip_returns_backend(monthly_amount, annual_return_rate, duration_years):
+    """
+    Calculate SIP returns using compound interest formula
+    Each monthly investment compounds for the remaining period
+    """
+    try:
+        monthly_rate = annual_return_rate / (12 * 100)
+        total_months = duration_years * 12
+        
+        total_invested = 0
+        maturity_value = 0
+        monthly_breakdown = []
+        yearly_breakdown = []
+        
+        # Calculate monthly SIP returns
+        for month in range(1, total_months + 1):
+            total_invested += monthly_amount
+            
+            # Each SIP installment compounds for remaining months
+            if month == 1:
+                maturity_value = monthly_amount
+            else:
+                maturity_value = (maturity_value * (1 + monthly_rate)) + monthly_amount
+            
+            monthly_breakdown.append({
+                'month': month,
+                'invested': round(total_invested, 2),
+                'balance': round(maturity_value, 2)
+            })
+            
+            # Create yearly breakdown
+            if month % 12 == 0:
+                year = month // 12
+                returns_earned = maturity_value - total_invested
+                
+                yearly_breakdown.append({
+                    'year': year,
+                    'invested': round(total_invested, 2),
+                    'returns': round(returns_earned, 2),
+                    'balance': round(maturity_value, 2)
+                })
+        
+        # Handle partial year if needed
+        if total_months % 12 != 0:
+            year = math.ceil(total_months / 12)
+            returns_earned = maturity_value - total_invested
+            
+            yearly_breakdown.append({
+                'year': year,
+                'invested': round(total_invested, 2),
+                'returns': round(returns_earned, 2),
+                'balance': round(maturity_value, 2)
+            })
+        
+        net_gain = maturity_value - total_invested
+        total_return = (net_gain / total_invested) * 100 if total_invested > 0 else 0
+        
+        return {
+            'totalInvested': round(total_invested, 2),
+            'maturityValue': round(maturity_value, 2),
+            'netGain': round(net_gain, 2),
+            'totalReturn': round(total_return, 2),
+            'annualReturn': annual_return_rate,
+            'yearlyBreakdown': yearly_breakdown,
+            'monthlyBreakdown': monthly_breakdown,
+            'investmentType': 'SIP'
+        }
+        
+    except Exception as e:
+        raise Exception(f"Error calculating SIP returns: {str(e)}")
+
+def compare_ppf_sip_results(ppf_result, sip_result, duration_years):
+    """
+    Compare PPF and SIP results and generate detailed comparison
+    """
+    try:
+        # Basic comparison metrics
+        maturity_difference = abs(sip_result['maturityValue'] - ppf_result['maturityValue'])
+        better_option = 'SIP' if sip_result['maturityValue'] > ppf_result['maturityValue'] else 'PPF'
+        
+        # Calculate advantage percentage
+        higher_value = max(sip_result['maturityValue'], ppf_result['maturityValue'])
+        lower_value = min(sip_result['maturityValue'], ppf_result['maturityValue'])
+        advantage_percentage = ((higher_value - lower_value) / lower_value) * 100 if lower_value > 0 else 0
+        
+        # Create year-wise comparison
+        yearly_breakdown = []
+        for year in range(1, duration_years + 1):
+            # Find PPF data for this year
+            ppf_data = next((item for item in ppf_result['yearlyBreakdown'] if item['year'] == year), {})
+            
+            # Find SIP data for this year
+            sip_data = next((item for item in sip_result['yearlyBreakdown'] if item['year'] == year), {})
+            
+            ppf_balance = ppf_data.get('balance', 0)
+            sip_balance = sip_data.get('balance', 0)
+            
+            year_better_option = 'SIP' if sip_balance > ppf_balance else 'PPF'
+            year_advantage = abs(sip_balance - ppf_balance)
+            
+            yearly_breakdown.append({
+                'year': year,
+                'ppf': {
+                    'invested': ppf_data.get('invested', 0),
+                    'interest': ppf_data.get('interest', 0),
+                    'balance': ppf_balance
+                },
+                'sip': {
+                    'invested': sip_data.get('invested', 0),
+                    'returns': sip_data.get('returns', 0),
+                    'balance': sip_balance
+                },
+                'betterOption': year_better_option,
+                'advantage': round(year_advantage, 2)
+            })
+        
+        # Calculate additional metrics
+        ppf_cagr = calculate_cagr(ppf_result['totalInvested'], ppf_result['maturityValue'], duration_years)
+        sip_cagr = calculate_cagr(sip_result['totalInvested'], sip_result['maturityValue'], duration_years)
+        
+        return {
+            'maturityDifference': round(maturity_difference, 2),
+            'betterOption': better_option,
+            'advantagePercentage': round(advantage_percentage, 2),
+            'yearlyBreakdown': yearly_breakdown,
+            'ppfCagr': round(ppf_cagr, 2),
+            'sipCagr': round(sip_cagr, 2),
+            'investmentComparison': {
+                'ppfTotalInvested': ppf_result['totalInvested'],
+                'sipTotalInvested': sip_result['totalInvested'],
+                'investmentDifference': abs(ppf_result['totalInvested'] - sip_result['totalInvested'])
+            }
+        }
+        
+    except Exception as e:
+        raise Exception(f"Error comparing results: {str(e)}")
+
+def calculate_cagr(initial_value, final_value, years):
+    """
+    Calculate Compound Annual Growth Rate (CAGR)
+    CAGR = (Final Value / Initial Value)^(1/years) - 1
+    """
+    try:
+        if initial_value <= 0 or final_value <= 0 or years <= 0:
+            return 0
+        
+        cagr = (pow(final_value / initial_value, 1 / years) - 1) * 100
+        return cagr
+        
+    except Exception as e:
+        return 0
+
+# Additional utility functions for PPF vs SIP calculations
+
+def calculate_ppf_extended_returns(annual_amount, interest_rate, duration_years, extension_years=0):
+    """
+    Calculate PPF returns with optional extension beyond 15 years
+    PPF can be extended in blocks of 5 years after initial 15-year period
+    """
+    try:
+        total_duration = duration_years + extension_years
+        
+        # Initial PPF calculation for base period
+        base_result = calculate_ppf_returns_backend(annual_amount, interest_rate, duration_years)
+        
+        if extension_years == 0:
+            return base_result
+        
+        # Extension period calculation (only interest compounds, no new investments)
+        extended_value = base_result['maturityValue']
+        annual_rate = interest_rate / 100
+        
+        for year in range(extension_years):
+            extended_value *= (1 + annual_rate)
+        
+        extended_result = base_result.copy()
+        extended_result['maturityValue'] = round(extended_value, 2)
+        extended_result['netGain'] = round(extended_value - base_result['totalInvested'], 2)
+        extended_result['totalReturn'] = round(((extended_value - base_result['totalInvested']) / base_result['totalInvested']) * 100, 2)
+        
+        return extended_result
+        
+    except Exception as e:
+        raise Exception(f"Error calculating extended PPF returns: {str(e)}")
+
+def calculate_tax_impact_comparison(ppf_result, sip_result, tax_rate=0):
+    """
+    Calculate tax impact on PPF vs SIP returns
+    PPF is tax-free (EEE status), SIP may have capital gains tax
+    """
+    try:
+        # PPF is completely tax-free
+        ppf_post_tax = ppf_result.copy()
+        
+        # SIP may have tax on gains (LTCG/STCG)
+        sip_post_tax = sip_result.copy()
+        
+        if tax_rate > 0:
+            # Apply tax on SIP gains
+            sip_tax_amount = sip_result['netGain'] * (tax_rate / 100)
+            sip_post_tax['netGain'] = round(sip_result['netGain'] - sip_tax_amount, 2)
+            sip_post_tax['maturityValue'] = round(sip_result['totalInvested'] + sip_post_tax['netGain'], 2)
+            sip_post_tax['totalReturn'] = round((sip_post_tax['netGain'] / sip_result['totalInvested']) * 100, 2)
+        
+        return {
+            'ppfPostTax': ppf_post_tax,
+            'sipPostTax': sip_post_tax,
+            'taxSavings': round((sip_result['netGain'] - sip_post_tax['netGain']), 2) if tax_rate > 0 else 0
+        }
+        
+    except Exception as e:
+        raise Exception(f"Error calculating tax impact: {str(e)}")
+
+
+
+# Add this route to your existing app.py file
+
+def fd_vs_sip_calculator():
+    return render_template('fd_vs_sip_calculator.html')
+
+def calculate_sip_returns_fd_comparison(monthly_sip, duration_years, expected_cagr):
+    """
+    Calculate SIP returns for FD comparison with monthly compounding
+    """
+    try:
+        # Convert annual CAGR to monthly rate
+        monthly_rate = (expected_cagr / 100) / 12
+        
+        # Total number of months
+        total_months = duration_years * 12
+        
+        # Calculate future value of SIP using FV formula
+        # FV = SIP * [((1 + r)^n - 1) / r] * (1 + r)
+        if monthly_rate == 0:
+            estimated_value = monthly_sip * total_months
+        else:
+            estimated_value = monthly_sip * (((1 + monthly_rate) ** total_months - 1) / monthly_rate) * (1 + monthly_rate)
+        
+        # Calculate total investment
+        total_invested = monthly_sip * total_months
+        
+        # Calculate gains
+        gain_from_sip = estimated_value - total_invested
+        
+        return {
+            'total_invested': round(total_invested, 2),
+            'estimated_value': round(estimated_value, 2),
+            'gain_from_sip': round(gain_from_sip, 2),
+            'expected_cagr': expected_cagr,
+            'duration_years': duration_years
+        }
+    
+    except Exception as e:
+        return {
+            'error': str(e)
+        }
+
+def calculate_fd_vs_sip():
+    try:
+        data = request.get_json()
+        
+        # FD inputs
+        fd_monthly_investment = float(data.get('fdMonthlyInvestment', 5000))
+        fd_duration_years = int(data.get('fdDurationYears', 5))
+        fd_interest_rate = float(data.get('fdInterestRate', 6.5))
+        fd_compounding_frequency = data.get('fdCompoundingFrequency', 'quarterly')
+        
+        # SIP inputs
+        sip_monthly_amount = float(data.get('sipMonthlyAmount', 5000))
+        sip_duration_years = int(data.get('sipDurationYears', 5))
+        sip_expected_cagr = float(data.get('sipExpectedCagr', 12))
+        
+        # Validate inputs
+        if (fd_monthly_investment <= 0 or fd_duration_years <= 0 or fd_interest_rate < 0 or
+            sip_monthly_amount <= 0 or sip_duration_years <= 0 or sip_expected_cagr < 0):
+            return jsonify({
+                'status': 'error',
+                'error': 'Invalid input values. Please check all fields.'
+            })
+        
+        # Calculate FD returns
+        fd_results = calculate_fd_returns(
+            fd_monthly_investment, fd_duration_years, fd_interest_rate, fd_compounding_frequency
+        )
+        
+        # Calculate SIP returns
+        sip_results = calculate_sip_returns_fd_comparison(
+            sip_monthly_amount, sip_duration_years, sip_expected_cagr
+        )
+        
+        # Check for calculation errors
+        if 'error' in fd_results or 'error' in sip_results:
+            return jsonify({
+                'status': 'error',
+                'error': fd_results.get('error', sip_results.get('error', 'Calculation error'))
+            })
+        
+        # Compare results
+        fd_final_value = fd_results['maturity_value']
+        sip_final_value = sip_results['estimated_value']
+        
+        if fd_final_value > sip_final_value:
+            better_option = 'FD'
+            difference = fd_final_value - sip_final_value
+        elif sip_final_value > fd_final_value:
+            better_option = 'SIP'
+            difference = sip_final_value - fd_final_value
+        else:
+            better_option = 'Equal'
+            difference = 0
+        
+        # Calculate percentage difference
+        if fd_final_value > 0:
+            percentage_difference = (difference / min(fd_final_value, sip_final_value)) * 100
+        else:
+            percentage_difference = 0
+        
+        return jsonify({
+            'status': 'success',
+            'fd_results': fd_results,
+            'sip_results': sip_results,
+            'comparison': {
+                'better_option': better_option,
+                'difference': round(difference, 2),
+                'percentage_difference': round(percentage_difference, 2)
+            }
+        })
+    
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'error': str(e)
+        })
+
+def rd_vs_fd_vs_sip_calculator():
+    return render_template('rd_vs_fd_vs_sip_calculator.html')
+
+def calculate_rd_vs_fd_vs_sip():
+    try:
+        data = request.get_json()
+        
+        # Common inputs
+        tenure_years = int(data.get('tenureYears', 5))
+        
+        # RD inputs
+        rd_monthly_deposit = float(data.get('rdMonthlyDeposit', 5000))
+        rd_annual_rate = float(data.get('rdAnnualRate', 6.8))
+        
+        # FD inputs
+        fd_type = data.get('fdType', 'lumpsum')
+        fd_lump_sum = float(data.get('fdLumpSum', 300000))
+        fd_annual_rate = float(data.get('fdAnnualRate', 7.0))
+        fd_compounding = data.get('fdCompounding', 'quarterly')
+        
+        # SIP inputs
+        sip_monthly_investment = float(data.get('sipMonthlyInvestment', 5000))
+        sip_expected_return = float(data.get('sipExpectedReturn', 12.0))
+        
+        # Advanced options
+        show_cagr = data.get('showCagr', False)
+        add_tax = data.get('addTax', False)
+        
+        # Validate inputs
+        if (tenure_years <= 0 or rd_monthly_deposit <= 0 or rd_annual_rate < 0 or
+            fd_lump_sum <= 0 or fd_annual_rate < 0 or sip_monthly_investment <= 0 or
+            sip_expected_return < 0):
+            return jsonify({
+                'status': 'error',
+                'error': 'Invalid input values. Please check all fields.'
+            })
+        
+        # Calculate RD returns (quarterly compounding)
+        rd_results = calculate_rd_vs_fd_vs_sip_rd(rd_monthly_deposit, rd_annual_rate, tenure_years)
+        
+        # Determine FD investment amount
+        if fd_type == 'match':
+            # Match with RD total investment
+            fd_investment = rd_monthly_deposit * 12 * tenure_years
+        else:
+            fd_investment = fd_lump_sum
+        
+        # Calculate FD returns
+        fd_results = calculate_rd_vs_fd_vs_sip_fd(fd_investment, fd_annual_rate, tenure_years, fd_compounding)
+        
+        # Calculate SIP returns
+        sip_results = calculate_rd_vs_fd_vs_sip_sip(sip_monthly_investment, sip_expected_return, tenure_years)
+        
+        # Add effective CAGR if requested
+        if show_cagr:
+            rd_results['effective_cagr'] = calculate_effective_cagr(rd_results['total_invested'], rd_results['maturity_value'], tenure_years)
+            fd_results['effective_cagr'] = calculate_effective_cagr(fd_results['total_invested'], fd_results['maturity_value'], tenure_years)
+            sip_results['effective_cagr'] = calculate_effective_cagr(sip_results['total_invested'], sip_results['maturity_value'], tenure_years)
+        
+        # Determine ranking
+        results = [
+            {'type': 'RD', 'value': rd_results['maturity_value']},
+            {'type': 'FD', 'value': fd_results['maturity_value']},
+            {'type': 'SIP', 'value': sip_results['maturity_value']}
+        ]
+        results.sort(key=lambda x: x['value'], reverse=True)
+        ranking = [result['type'] for result in results]
+        
+        return jsonify({
+            'status': 'success',
+            'rd_results': rd_results,
+            'fd_results': fd_results,
+            'sip_results': sip_results,
+            'ranking': ranking,
+            'tenure_years': tenure_years
+        })
+    
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'error': str(e)
+        })
+
+def calculate_rd_vs_fd_vs_sip_rd(monthly_deposit, annual_rate, years):
+    """Calculate RD returns with quarterly compounding"""
+    quarterly_rate = annual_rate / 400  # Convert to quarterly rate
+    total_quarters = years * 4
+    
+    # RD formula: M = R * ((1+i)^n - 1) / (1 - (1+i)^(-1/3))
+    if quarterly_rate == 0:
+        maturity_value = monthly_deposit * 12 * years
+    else:
+        numerator = (1 + quarterly_rate) ** total_quarters - 1
+        denominator = 1 - (1 + quarterly_rate) ** (-1/3)
+        maturity_value = monthly_deposit * (numerator / denominator)
+    
+    total_invested = monthly_deposit * 12 * years
+    interest_earned = maturity_value - total_invested
+    
+    return {
+        'total_invested': round(total_invested),
+        'maturity_value': round(maturity_value),
+        'interest_earned': round(interest_earned)
+    }
+
+def calculate_rd_vs_fd_vs_sip_fd(principal, annual_rate, years, compounding):
+    """Calculate FD returns with specified compounding"""
+    compounding_frequency = {
+        'annual': 1,
+        'halfyearly': 2,
+        'quarterly': 4,
+        'monthly': 12
+    }.get(compounding, 4)
+    
+    rate = annual_rate / 100
+    maturity_value = principal * (1 + rate / compounding_frequency) ** (compounding_frequency * years)
+    interest_earned = maturity_value - principal
+    
+    return {
+        'total_invested': round(principal),
+        'maturity_value': round(maturity_value),
+        'interest_earned': round(interest_earned)
+    }
+
+def calculate_rd_vs_fd_vs_sip_sip(monthly_investment, expected_return, years):
+    """Calculate SIP returns using annuity-due formula"""
+    monthly_rate = expected_return / 12 / 100
+    total_months = years * 12
+    
+    if monthly_rate == 0:
+        maturity_value = monthly_investment * total_months
+    else:
+        # Annuity-due formula
+        numerator = (1 + monthly_rate) ** total_months - 1
+        maturity_value = monthly_investment * (numerator / monthly_rate) * (1 + monthly_rate)
+    
+    total_invested = monthly_investment * total_months
+    gains_earned = maturity_value - total_invested
+    
+    return {
+        'total_invested': round(total_invested),
+        'maturity_value': round(maturity_value),
+        'gains_earned': round(gains_earned)
+    }
+
+def calculate_effective_cagr(initial_amount, final_amount, years):
+    """Calculate effective CAGR"""
+    if initial_amount <= 0 or years <= 0:
+        return 0
+    return ((final_amount / initial_amount) ** (1 / years) - 1) * 100
+
+
+
+# Add this route to your app.py file
+
+def sip_calculator_vs_interest_calculator():
+    return render_template('sip_calculator_vs_interest_calculator.html')
+
+# Add this calculation function to your app.py file
+def calculate_sip_vs_interest_comparison(sip_amount, sip_years, sip_return, principal_amount, interest_years, interest_rate, compounding_frequency):
+    """
+    Calculate SIP vs Interest Calculator comparison
+    """
+    try:
+        # SIP Calculations
+        monthly_rate = sip_return / (12 * 100)
+        total_months = sip_years * 12
+        
+        # SIP Future Value using standard SIP formula
+        if monthly_rate > 0:
+            sip_maturity = sip_amount * (((1 + monthly_rate) ** total_months - 1) / monthly_rate) * (1 + monthly_rate)
+        else:
+            sip_maturity = sip_amount * total_months
+        
+        sip_invested = sip_amount * total_months
+        sip_gain = sip_maturity - sip_invested
+        
+        # Interest/FD Calculations
+        annual_rate = interest_rate / 100
+        interest_years_actual = interest_years
+        
+        # Compounding frequency mapping
+        frequency_map = {
+            'monthly': 12,
+            'quarterly': 4,
+            'annually': 1
+        }
+        
+        frequency = frequency_map.get(compounding_frequency, 4)
+        
+        # Compound Interest Formula: A = P(1 + r/n)^(nt)
+        interest_maturity = principal_amount * ((1 + annual_rate / frequency) ** (frequency * interest_years_actual))
+        interest_earned = interest_maturity - principal_amount
+        
+        # Comparison Analysis
+        better_option = "SIP" if sip_maturity > interest_maturity else "Interest Calculator"
+        return_difference = abs(sip_maturity - interest_maturity)
+        
+        # Calculate year-wise breakdown for chart
+        yearly_breakdown = []
+        for year in range(1, max(sip_years, interest_years) + 1):
+            # SIP yearly calculation
+            if year <= sip_years:
+                months_completed = year * 12
+                if monthly_rate > 0:
+                    sip_year_value = sip_amount * (((1 + monthly_rate) ** months_completed - 1) / monthly_rate) * (1 + monthly_rate)
+                else:
+                    sip_year_value = sip_amount * months_completed
+                sip_year_invested = sip_amount * months_completed
+            else:
+                sip_year_value = sip_maturity
+                sip_year_invested = sip_invested
+            
+            # Interest yearly calculation
+            if year <= interest_years:
+                interest_year_value = principal_amount * ((1 + annual_rate / frequency) ** (frequency * year))
+            else:
+                interest_year_value = interest_maturity
+            
+            yearly_breakdown.append({
+                'year': year,
+                'sip_invested': round(sip_year_invested, 2),
+                'sip_value': round(sip_year_value, 2),
+                'interest_principal': principal_amount,
+                'interest_value': round(interest_year_value, 2)
+            })
+        
+        return {
+            'sip_amount': sip_amount,
+            'sip_years': sip_years,
+            'sip_return': sip_return,
+            'sip_invested': round(sip_invested, 2),
+            'sip_maturity': round(sip_maturity, 2),
+            'sip_gain': round(sip_gain, 2),
+            'principal_amount': principal_amount,
+            'interest_years': interest_years,
+            'interest_rate': interest_rate,
+            'compounding_frequency': compounding_frequency,
+            'interest_maturity': round(interest_maturity, 2),
+            'interest_earned': round(interest_earned, 2),
+            'better_option': better_option,
+            'return_difference': round(return_difference, 2),
+            'yearly_breakdown': yearly_breakdown
+        }
+    
+    except Exception as e:
+        return {
+            'error': str(e)
+        }
+
+def calculate_sip_vs_interest():
+    try:
+        data = request.get_json()
+        
+        # SIP inputs
+        sip_amount = float(data.get('sipAmount', 5000))
+        sip_years = int(data.get('sipYears', 5))
+        sip_return = float(data.get('sipReturn', 12))
+        
+        # Interest inputs
+        principal_amount = float(data.get('principalAmount', 300000))
+        interest_years = int(data.get('interestYears', 5))
+        interest_rate = float(data.get('interestRate', 6.5))
+        compounding_frequency = data.get('compoundingFrequency', 'quarterly')
+        
+        # Validation
+        if sip_amount <= 0 or sip_amount > 1000000:
+            return jsonify({'error': 'SIP amount must be between ₹1 and ₹10,00,000'}), 400
+        if sip_years <= 0 or sip_years > 50:
+            return jsonify({'error': 'SIP duration must be between 1 and 50 years'}), 400
+        if sip_return < 1 or sip_return > 30:
+            return jsonify({'error': 'SIP return must be between 1% and 30%'}), 400
+        if principal_amount <= 0 or principal_amount > 100000000:
+            return jsonify({'error': 'Principal amount must be between ₹1 and ₹10 Crores'}), 400
+        if interest_years <= 0 or interest_years > 50:
+            return jsonify({'error': 'Interest duration must be between 1 and 50 years'}), 400
+        if interest_rate < 0.1 or interest_rate > 20:
+            return jsonify({'error': 'Interest rate must be between 0.1% and 20%'}), 400
+        if compounding_frequency not in ['monthly', 'quarterly', 'annually']:
+            return jsonify({'error': 'Invalid compounding frequency'}), 400
+        
+        # Calculate comparison
+        result = calculate_sip_vs_interest_comparison(
+            sip_amount, sip_years, sip_return, 
+            principal_amount, interest_years, interest_rate, compounding_frequency
+        )
+        
+        if 'error' in result:
+            return jsonify({'status': 'error', 'error': result['error']}), 400
+        
+        return jsonify({'status': 'success', **result})
+    
+    except Exception as e:
+        return jsonify({'status': 'error', 'error': str(e)}), 400
+
+# ELSS vs SIP Calculator Routes
+
+def elss_vs_sip_calculator():
+    return render_template('elss_vs_sip_calculator.html')
+
+def calculate_elss_vs_sip():
+    try:
+        data = request.get_json()
+        
+        # Extract input parameters
+        monthly_investment = float(data.get('monthly_investment', 5000))
+        investment_duration = int(data.get('investment_duration', 10))
+        sip_return_rate = float(data.get('sip_return_rate', 12.0))
+        elss_return_rate = float(data.get('elss_return_rate', 14.0))
+        tax_slab = float(data.get('tax_slab', 30))
+        
+        # Validate inputs
+        if monthly_investment < 500 or monthly_investment > 50000:
+            return jsonify({'error': 'Monthly investment must be between ₹500 and ₹50,000'}), 400
+        
+        if investment_duration < 3 or investment_duration > 30:
+            return jsonify({'error': 'Investment duration must be between 3 and 30 years'}), 400
+        
+        if sip_return_rate < 5 or sip_return_rate > 25:
+            return jsonify({'error': 'SIP return rate must be between 5% and 25%'}), 400
+        
+        if elss_return_rate < 8 or elss_return_rate > 30:
+            return jsonify({'error': 'ELSS return rate must be between 8% and 30%'}), 400
+        
+        if tax_slab < 5 or tax_slab > 30:
+            return jsonify({'error': 'Tax slab must be between 5% and 30%'}), 400
+        
+        # Calculate comparison results
+        result = calculate_elss_vs_sip_comparison(
+            monthly_investment, investment_duration, 
+            sip_return_rate, elss_return_rate, tax_slab
+        )
+        
+        return jsonify(result)
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+def calculate_elss_vs_sip_comparison(monthly_investment, investment_duration, sip_return_rate, elss_return_rate, tax_slab):
+    """
+    Calculate and compare ELSS vs Regular SIP investments
+    """
+    try:
+        annual_investment = monthly_investment * 12
+        total_months = investment_duration * 12
+        
+        # Convert annual rates to monthly
+        sip_monthly_rate = sip_return_rate / (12 * 100)
+        elss_monthly_rate = elss_return_rate / (12 * 100)
+        
+        # Calculate SIP future value using compound interest formula
+        # FV = PMT * [((1 + r)^n - 1) / r] * (1 + r)
+        if sip_monthly_rate > 0:
+            sip_final_value = monthly_investment * (((pow(1 + sip_monthly_rate, total_months) - 1) / sip_monthly_rate) * (1 + sip_monthly_rate))
+        else:
+            sip_final_value = monthly_investment * total_months
+        
+        # Calculate ELSS future value using compound interest formula
+        if elss_monthly_rate > 0:
+            elss_final_value = monthly_investment * (((pow(1 + elss_monthly_rate, total_months) - 1) / elss_monthly_rate) * (1 + elss_monthly_rate))
+        else:
+            elss_final_value = monthly_investment * total_months
+        
+        # Calculate tax benefits
+        # ELSS eligible for tax deduction up to ₹1.5 lakh per year under Section 80C
+        elss_eligible_for_tax = min(annual_investment, 150000)
+        annual_tax_saved = elss_eligible_for_tax * (tax_slab / 100)
+        total_tax_saved = annual_tax_saved * investment_duration
+        
+        # Net benefit calculation (ELSS value + tax saved - SIP value)
+        net_benefit = (elss_final_value + total_tax_saved) - sip_final_value
+        
+        # Year-wise breakdown
+        year_wise_data = []
+        sip_running_value = 0
+        elss_running_value = 0
+        cumulative_tax_saved = 0
+        
+        for year in range(1, investment_duration + 1):
+            # Calculate values at end of each year
+            months_completed = year * 12
+            
+            # SIP value at end of year
+            if sip_monthly_rate > 0:
+                sip_running_value = monthly_investment * (((pow(1 + sip_monthly_rate, months_completed) - 1) / sip_monthly_rate) * (1 + sip_monthly_rate))
+            else:
+                sip_running_value = monthly_investment * months_completed
+            
+            # ELSS value at end of year
+            if elss_monthly_rate > 0:
+                elss_running_value = monthly_investment * (((pow(1 + elss_monthly_rate, months_completed) - 1) / elss_monthly_rate) * (1 + elss_monthly_rate))
+            else:
+                elss_running_value = monthly_investment * months_completed
+            
+            # Cumulative tax saved
+            cumulative_tax_saved += annual_tax_saved
+            
+            year_wise_data.append({
+                'year': year,
+                'annual_investment': annual_investment,
+                'sip_value': round(sip_running_value),
+                'elss_value': round(elss_running_value),
+                'annual_tax_saved': round(annual_tax_saved),
+                'elss_advantage': round((elss_running_value + cumulative_tax_saved) - sip_running_value)
+            })
+        
+        return {
+            'monthly_investment': monthly_investment,
+            'investment_duration': investment_duration,
+            'sip_return_rate': sip_return_rate,
+            'elss_return_rate': elss_return_rate,
+            'tax_slab': tax_slab,
+            'annual_investment': annual_investment,
+            'sip_final_value': round(sip_final_value),
+            'elss_final_value': round(elss_final_value),
+            'total_tax_saved': round(total_tax_saved),
+            'net_benefit': round(net_benefit),
+            'annual_tax_saved': round(annual_tax_saved),
+            'elss_eligible_for_tax': elss_eligible_for_tax,
+            'year_wise_data': year_wise_data
+        }
+        
+    except Exception as e:
+        raise Exception(f"Error calculating ELSS vs SIP comparison: {str(e)}")
@@ -0,0 +1,1527 @@
+from flask import render_template, request, jsonify
+import math
+from datetime import datetime
+
+from result_cache import memoize
+
+def nps_calculator():
+    return render_template('nps_calculator.html')
+
+def calculate_nps_returns(current_age, retirement_age, monthly_contribution, expected_return, annual_increase, annuity_percentage, annuity_return):
+    """
+    Calculate NPS returns following SBI methodology
+    """
+    investment_years = retirement_age - current_age
+    monthly_rate = expected_return / (100 * 12)
+    
+    # Total investment amount (fixed monthly contribution)
+    investment_amount = monthly_contribution * 12 * investment_years
+    
+    # Calculate pension wealth using SIP formula
+    if monthly_rate > 0:
+        pension_wealth = monthly_contribution * (((1 + monthly_rate) ** (investment_years * 12)) - 1) / monthly_rate * (1 + monthly_rate)
+    else:
+        pension_wealth = investment_amount
+    
+    # Calculate lump sum and annuity amounts based on annuity percentage
+    lump_sum_percentage = 100 - annuity_percentage
+    lump_sum_amount = pension_wealth * (lump_sum_percentage / 100)
+    annuity_amount = pension_wealth * (annuity_percentage / 100)
+    
+    # Calculate monthly pension using SBI's exact methodology
+    # SBI uses simple percentage calculation: Annuity Amount * Annual Rate / 12
+    if annuity_return > 0:
+        monthly_pension = annuity_amount * (annuity_return / 100) / 12
+    else:
+        monthly_pension = annuity_amount / (20 * 12)  # Default to 20 years if no return rate
+    
+    # Calculate investment gains
+    investment_gains = pension_wealth - investment_amount
+    
+    return {
+        'pension_wealth': round(pension_wealth, 2),
+        'investment_amount': round(investment_amount, 2),
+        'lump_sum_amount': round(lump_sum_amount, 2),
+        'annuity_amount': round(annuity_amount, 2),
+        'monthly_pension': round(monthly_pension, 2),
+        'investment_gains': round(investment_gains, 2)
+    }
+
+def calculate_nps():
+    try:
+        data = request.get_json()
+        
+        current_age = int(data.get('current_age', 0))
+        retirement_age = int(data.get('retirement_age', 0))
+        monthly_contribution = float(data.get('monthly_contribution', 0))
+        expected_return = float(data.get('expected_return', 0))
+        annual_increase = float(data.get('annual_increase', 0))
+        annuity_percentage = float(data.get('annuity_percentage', 40))
+        annuity_return = float(data.get('annuity_return', 6))
+        
+        if current_age <= 0 or retirement_age <= 0 or monthly_contribution <= 0 or expected_return <= 0 or current_age >= retirement_age:
+            return jsonify({'error': 'Invalid input values'}), 400
+        
+        result = calculate_nps_returns(current_age, retirement_age, monthly_contribution, expected_return, annual_increase, annuity_percentage, annuity_return)
+        
+        return jsonify(result)
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+def epf_calculator():
+    return render_template('epf_calculator.html')
+
+def calculate_epf_returns(basic_salary, employee_contribution, employer_contribution, interest_rate, years_of_service, salary_increase):
+    """
+    Calculate EPF returns with employee and employer contributions
+    """
+    # Handle 0 values gracefully
+    if basic_salary == 0 or years_of_service == 0:
+        return {
+            'total_corpus': 0,
+            'total_employee_contribution': 0,
+            'total_employer_contribution': 0,
+            'total_interest': 0,
+            'yearly_breakdown': []
+        }
+    
+    # Monthly calculations
+    monthly_interest_rate = interest_rate / (12 * 100)
+    
+    # Initialize variables
+    total_employee_contribution = 0
+    total_employer_contribution = 0
+    total_balance = 0
+    yearly_breakdown = []
+    
+    # Calculate for each year
+    for year in range(1, years_of_service + 1):
+        # Calculate current year's salary (with annual increase)
+        current_basic_salary = basic_salary * ((1 + salary_increase / 100) ** (year - 1))
+        
+        # Calculate contributions for this year
+        monthly_employee_contribution = current_basic_salary * (employee_contribution / 100)
+        monthly_employer_contribution = current_basic_salary * (employer_contribution / 100)
+        
+        # Annual contributions
+        annual_employee_contribution = monthly_employee_contribution * 12
+        annual_employer_contribution = monthly_employer_contribution * 12
+        
+        # Update totals
+        total_employee_contribution += annual_employee_contribution
+        total_employer_contribution += annual_employer_contribution
+        
+        # Calculate interest on existing balance for the year
+        year_start_balance = total_balance
+        monthly_balance = year_start_balance
+        interest_for_year = 0
+        
+        # Calculate month-wise interest and contributions (Standard EPF method)
+        for month in range(12):
+            # Calculate interest on beginning balance (before adding current month's contribution)
+            monthly_interest = monthly_balance * monthly_interest_rate
+            interest_for_year += monthly_interest
+            
+            # Add monthly contributions and interest
+            monthly_balance += monthly_employee_contribution + monthly_employer_contribution + monthly_interest
+        
+        total_balance = monthly_balance
+        
+        yearly_breakdown.append({
+            'year': year,
+            'basic_salary': round(current_basic_salary * 12, 2),  # Annual salary
+            'employee_contribution': round(annual_employee_contribution, 2),
+            'employer_contribution': round(annual_employer_contribution, 2),
+            'interest_earned': round(interest_for_year, 2),
+            'total_balance': round(total_balance, 2)
+        })
+    
+    # Calculate total interest earned
+    total_interest = total_balance - total_employee_contribution - total_employer_contribution
+    
+    return {
+        'total_corpus': round(total_balance, 2),
+        'total_employee_contributation': round(total_employee_contribution, 2),
+        'total_employer_contributation': round(total_employer_contribution, 2),
+        'total_interest': round(total_interest, 2),
+        'yearly_breakdown': yearly_breakdown
+    }
+
+def calculate_epf():
+    try:
+        data = request.get_json()
+        
+        basic_salary = float(data.get('basic_salary', 0))
+        employee_contribution = float(data.get('employee_contribution', 12))
+        employer_contribution = float(data.get('employer_contribution', 12))
+        interest_rate = float(data.get('interest_rate', 8.15))
+        years_of_service = int(data.get('years_of_service', 30))
+        salary_increase = float(data.get('salary_increase', 5))
+        
+        result = calculate_epf_returns(
+            basic_salary, employee_contribution, employer_contribution, interest_rate, years_of_service, salary_increase
+        )
+        
+        return jsonify(result)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+# Post Office Monthly Income Scheme Calculator Routes
+def post_office_monthly_income_scheme_calculator():
+    return render_template('post_office_monthly_income_scheme_calculator.html')
+
+def calculate_post_office_monthly_income_scheme_returns(yearly_investment, time_period, interest_rate):
+    """
+    Calculate Post Office Monthly Income Scheme returns
+    Formula:
+    - Monthly Interest = (Yearly Investment × Interest Rate) ÷ 12
+    - Total Interest = Monthly Interest × Total Months
+    - Maturity Value = Yearly Investment + Total Interest
+    """
+    try:
+        # Calculate monthly interest
+        monthly_interest = (yearly_investment * interest_rate) / (100 * 12)
+        
+        # Calculate total months
+        total_months = time_period * 12
+        
+        # Calculate total interest for the entire tenure
+        total_interest = monthly_interest * total_months
+        
+        # Calculate maturity value
+        maturity_value = yearly_investment + total_interest
+        
+        return {
+            'yearly_investment': yearly_investment,
+            'time_period': time_period,
+            'interest_rate': interest_rate,
+            'monthly_interest': round(monthly_interest, 2),
+            'total_interest': round(total_interest, 2),
+            'maturity_value': round(maturity_value, 2),
+            'invested_amount': yearly_investment
+        }
+    
+    except Exception as e:
+        return {
+            'error': str(e),
+            'monthly_interest': 0,
+            'total_interest': 0,
+            'maturity_value': 0,
+            'invested_amount': 0
+        }
+
+def calculate_post_office_monthly_income_scheme():
+    try:
+        data = request.get_json()
+        
+        yearly_investment = float(data.get('yearly_investment', 0))
+        time_period = float(data.get('time_period', 5))
+        interest_rate = float(data.get('interest_rate', 7.4))
+        
+        if yearly_investment <= 0 or time_period <= 0 or interest_rate <= 0:
+            return jsonify({'error': 'Invalid input values'}), 400
+        
+        result = calculate_post_office_monthly_income_scheme_returns(yearly_investment, time_period, interest_rate)
+        
+        return jsonify(result)
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+def senior_citizen_savings_scheme_calculator():
+    return render_template('senior_citizen_savings_scheme_calculator.html')
+
+def sukanya_samriddhi_yojana_calculator():
+    return render_template('sukanya_samriddhi_yojana_calculator.html')
+
+def calculate_scss_returns(investment_amount, annual_interest_rate, tenure_years):
+    """
+    Calculate SCSS returns with quarterly interest payouts
+    SCSS Features:
+    - Fixed interest rate (currently 8.2% per annum)
+    - Flexible tenure: 0 to 8 years
+    - Interest paid quarterly
+    """
+    # Total tenure
+    total_tenure = tenure_years
+    
+    # Quarterly interest rate
+    quarterly_rate = annual_interest_rate / (4 * 100)
+    total_quarters = total_tenure * 4
+    
+    # Calculate quarterly interest payout
+    quarterly_interest = investment_amount * quarterly_rate
+    
+    # Calculate total interest for all quarters
+    total_interest = quarterly_interest * total_quarters
+    
+    # Maturity amount (principal + total interest)
+    maturity_amount = investment_amount + total_interest
+    
+    # Generate quarterly breakdown
+    quarterly_breakdown = []
+    cumulative_interest = 0
+    
+    for quarter in range(1, total_quarters + 1):
+        cumulative_interest += quarterly_interest
+        year = ((quarter - 1) // 4) + 1
+        quarter_in_year = ((quarter - 1) % 4) + 1
+        
+        quarterly_breakdown.append({
+            'quarter': quarter,
+            'year': year,
+            'quarter_in_year': quarter_in_year,
+            'quarterly_interest': round(quarterly_interest, 2),
+            'cumulative_interest': round(cumulative_interest, 2),
+            'balance': round(investment_amount + cumulative_interest, 2)
+        })
+    
+    # Generate yearly summary
+    yearly_summary = []
+    for year in range(1, total_tenure + 1):
+        yearly_interest = quarterly_interest * 4
+        cumulative_interest_year_end = yearly_interest * year
+        
+        yearly_summary.append({
+            'year': year,
+            'yearly_interest': round(yearly_interest, 2),
+            'cumulative_interest': round(cumulative_interest_year_end, 2),
+            'balance': round(investment_amount + cumulative_interest_year_end, 2)
+        })
+    
+    return {
+        'investment_amount': investment_amount,
+        'annual_interest_rate': annual_interest_rate,
+        'tenure_years': tenure_years,
+        'total_tenure': total_tenure,
+        'quarterly_interest': round(quarterly_interest, 2),
+        'total_interest': round(total_interest, 2),
+        'maturity_amount': round(maturity_amount, 2),
+        'quarterly_breakdown': quarterly_breakdown,
+        'yearly_summary': yearly_summary
+    }
+
+def calculate_scss():
+    try:
+        data = request.get_json()
+        investment_amount = float(data.get('investment_amount', 0))
+        annual_interest_rate = float(data.get('annual_interest_rate', 8.2))
+        tenure_years = int(data.get('tenure_years', 5))
+        
+        # Validate inputs
+        if investment_amount < 0:
+            return jsonify({'error': 'Investment amount cannot be negative'}), 400
+        if investment_amount > 10000000:
+            return jsonify({'error': 'Maximum investment amount is ₹1,00,00,000'}), 400
+        
+        # Calculate SCSS returns
+        result = calculate_scss_returns(investment_amount, annual_interest_rate, tenure_years)
+        
+        return jsonify(result)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+def calculate_ssy_returns(annual_investment, annual_interest_rate, investment_period, investment_frequency='yearly', investment_amount=0.0):
+    """
+    Calculate Sukanya Samriddhi Yojana returns
+    SSY Features:
+    - Annual investment: ₹250 to ₹1,50,000
+    - Investment period: Maximum 15 years from account opening
+    - Lock-in period: 21 years from account opening
+    - Interest compounded annually
+    - Tax benefits under Section 80C
+    """
+    # Total investment over the investment period
+    total_investment = annual_investment * investment_period
+    
+    # Maturity period is 21 years from account opening
+    maturity_period = 21
+    
+    # Calculate compound interest
+    # For investment period: contributions + interest
+    # For remaining years: only interest on accumulated amount
+    
+    accumulated_amount = 0
+    
+    # Calculate value after investment period (with annual contributions)
+    for year in range(1, investment_period + 1):
+        # Add annual investment at the beginning of the year
+        accumulated_amount += annual_investment
+        # Apply compound interest for the entire year
+        accumulated_amount = accumulated_amount * (1 + annual_interest_rate / 100)
+    
+    # Calculate growth for remaining years (no new investments)
+    remaining_years = maturity_period - investment_period
+    for year in range(remaining_years):
+        accumulated_amount = accumulated_amount * (1 + annual_interest_rate / 100)
+    
+    # Calculate final values
+    maturity_amount = accumulated_amount
+    total_interest = maturity_amount - total_investment
+    
+
+    
+    # Generate detailed breakdown (yearly and monthly)
+    yearly_breakdown = []
+    monthly_breakdown = []
+    temp_accumulated = 0
+    total_invested_so_far = 0
+    
+    # Calculate frequency multiplier for monthly breakdown
+    freq_multiplier = {'monthly': 12, 'quarterly': 4, 'half-yearly': 2, 'yearly': 1}
+    payments_per_year = freq_multiplier.get(investment_frequency, 1)
+    monthly_investment_amount = annual_investment / 12 if investment_frequency == 'monthly' else 0
+    
+    for year in range(1, maturity_period + 1):
+        year_start_balance = temp_accumulated
+        yearly_investment_amount = 0
+        
+        if year <= investment_period:
+            # Investment years
+            yearly_investment_amount = annual_investment
+            total_invested_so_far += annual_investment
+            temp_accumulated += annual_investment
+            temp_accumulated = temp_accumulated * (1 + annual_interest_rate / 100)
+            
+            # Generate monthly breakdown for this year
+            if investment_frequency == 'monthly':
+                monthly_balance = year_start_balance
+                for month in range(1, 13):
+                    monthly_balance += monthly_investment_amount
+                    monthly_interest = monthly_balance * (annual_interest_rate / 100) / 12
+                    monthly_balance += monthly_interest
+                    
+                    monthly_breakdown.append({
+                        'year': year,
+                        'month': month,
+                        'month_name': ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
+                                      'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'][month-1],
+                        'monthly_investment': monthly_investment_amount,
+                        'cumulative_investment': (year-1) * annual_investment + (month * monthly_investment_amount),
+                        'interest_earned': monthly_balance - ((year-1) * annual_investment + (month * monthly_investment_amount)),
+                        'balance': monthly_balance
+                    })
+            else:
+                # For non-monthly frequencies, show quarterly/half-yearly/yearly payments
+                payments_in_year = payments_per_year if year <= investment_period else 0
+                payment_amount = annual_investment / payments_per_year if payments_in_year > 0 else 0
+                
+                for month in range(1, 13):
+                    monthly_investment_this_month = 0
+                    
+                    # Determine if payment is made this month based on frequency
+                    if investment_frequency == 'quarterly' and month in [3, 6, 9, 12]:
+                        monthly_investment_this_month = payment_amount
+                    elif investment_frequency == 'half-yearly' and month in [6, 12]:
+                        monthly_investment_this_month = payment_amount
+                    elif investment_frequency == 'yearly' and month == 12:
+                        monthly_investment_this_month = payment_amount
+                    
+                    if month == 1:
+                        monthly_balance = year_start_balance + monthly_investment_this_month
+                    else:
+                        monthly_balance = monthly_breakdown[-1]['balance'] + monthly_investment_this_month
+                    
+                    monthly_interest = monthly_balance * (annual_interest_rate / 100) / 12
+                    monthly_balance += monthly_interest
+                    
+                    cumulative_investment = total_invested_so_far - annual_investment + sum(
+                        entry['monthly_investment'] for entry in monthly_breakdown 
+                        if entry['year'] == year and entry['month'] <= month
+                    ) + sum(entry['monthly_investment'] for entry in monthly_breakdown if entry['year'] < year)
+                    
+                    monthly_breakdown.append({
+                        'year': year,
+                        'month': month,
+                        'month_name': ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
+                                      'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'][month-1],
+                        'monthly_investment': monthly_investment_this_month,
+                        'cumulative_investment': cumulative_investment,
+                        'interest_earned': monthly_balance - cumulative_investment,
+                        'balance': monthly_balance
+                    })
+        else:
+            # Non-investment years (only interest)
+            temp_accumulated = temp_accumulated * (1 + annual_interest_rate / 100)
+            
+            # Monthly breakdown for non-investment years
+            for month in range(1, 13):
+                if month == 1:
+                    monthly_balance = year_start_balance
+                else:
+                    monthly_balance = monthly_breakdown[-1]['balance']
+                
+                monthly_interest = monthly_balance * (annual_interest_rate / 100) / 12
+                monthly_balance += monthly_interest
+                
+                monthly_breakdown.append({
+                    'year': year,
+                    'month': month,
+                    'month_name': ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
+                                  'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'][month-1],
+                    'monthly_investment': 0,
+                    'cumulative_investment': total_investment,
+                    'interest_earned': monthly_balance - total_investment,
+                    'balance': monthly_balance
+                })
+        
+        # Yearly summary
+        yearly_breakdown.append({
+            'year': year,
+            'annual_investment': yearly_investment_amount,
+            'total_invested': total_invested_so_far,
+            'interest_earned': temp_accumulated - total_invested_so_far,
+            'balance': temp_accumulated
+        })
+    
+    return {
+        'annual_investment': annual_investment,
+        'investment_amount': investment_amount,
+        'investment_frequency': investment_frequency,
+        'annual_interest_rate': annual_interest_rate,
+        'investment_period': investment_period,
+        'maturity_period': maturity_period,
+        'total_investment': round(total_investment, 2),
+        'maturity_amount': round(maturity_amount, 2),
+        'total_interest': round(total_interest, 2),
+        'yearly_breakdown': yearly_breakdown,
+        'monthly_breakdown': monthly_breakdown
+    }
+
+def calculate_ssy():
+    try:
+        data = request.get_json()
+        investment_amount = float(data.get('investment_amount', 0))
+        investment_frequency = data.get('investment_frequency', 'yearly')
+        annual_investment = float(data.get('annual_investment', 0))
+        annual_interest_rate = float(data.get('annual_interest_rate', 8.2))
+        investment_period = int(data.get('investment_period', 15))
+        
+        # Validate inputs
+        if annual_investment < 250:
+            return jsonify({'error': 'Minimum annual investment is ₹250'}), 400
+        if annual_investment > 150000:
+            return jsonify({'error': 'Maximum annual investment is ₹1,50,000'}), 400
+        if investment_period < 1 or investment_period > 15:
+            return jsonify({'error': 'Investment period must be between 1 and 15 years'}), 400
+        
+        # Calculate SSY returns
+        result = calculate_ssy_returns(annual_investment, annual_interest_rate, investment_period, investment_frequency, investment_amount)
+        
+        return jsonify(result)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+def atal_pension_yojana_calculator():
+    return render_template('atal_pension_yojana_calculator.html')
+
+def calculate_apy_returns(joining_age, pension_amount):
+    """
+    Calculate Atal Pension Yojana returns
+    APY Features:
+    - Entry age: 18-40 years
+    - Pension amounts: ₹1000, ₹2000, ₹3000, ₹4000, ₹5000 per month
+    - Government co-contribution: 50% of contribution or ₹1000 per year (whichever is lower) for first 5 years
+    - Maturity at age 60
+    - PFRDA standard return rate: 8.5% per annum
+    """
+    
+    # PFRDA standard return rate
+    expected_return_rate = 8.5
+    gov_co_contribution = True  # Always include government co-contribution as per APY rules
+    
+    # APY contribution matrix (simplified calculation based on age and pension amount)
+    # These are approximate monthly contributions required for each pension amount at different ages
+    contribution_matrix = {
+        1000: {18: 42, 25: 68, 30: 100, 35: 151, 40: 291},
+        2000: {18: 84, 25: 136, 30: 198, 35: 302, 40: 582},
+        3000: {18: 126, 25: 204, 30: 297, 35: 453, 40: 873},
+        4000: {18: 168, 25: 272, 30: 396, 35: 604, 40: 1164},
+        5000: {18: 210, 25: 340, 30: 495, 35: 755, 40: 1454}
+    }
+    
+    # Get base monthly contribution from matrix (using PFRDA standard rates)
+    age_brackets = sorted(contribution_matrix[pension_amount].keys())
+    closest_age = min(age_brackets, key=lambda x: abs(x - joining_age))
+    
+    # Interpolate for exact age
+    if joining_age in contribution_matrix[pension_amount]:
+        monthly_contribution = contribution_matrix[pension_amount][joining_age]
+    else:
+        # Linear interpolation between age brackets
+        if joining_age < closest_age:
+            lower_age = age_brackets[age_brackets.index(closest_age) - 1] if age_brackets.index(closest_age) > 0 else closest_age
+            upper_age = closest_age
+        else:
+            lower_age = closest_age
+            upper_age = age_brackets[age_brackets.index(closest_age) + 1] if age_brackets.index(closest_age) < len(age_brackets) - 1 else closest_age
+        
+        if lower_age == upper_age:
+            monthly_contribution = contribution_matrix[pension_amount][closest_age]
+        else:
+            lower_contrib = contribution_matrix[pension_amount][lower_age]
+            upper_contrib = contribution_matrix[pension_amount][upper_age]
+            # Linear interpolation
+            monthly_contribution = lower_contrib + (upper_contrib - lower_contrib) * (joining_age - lower_age) / (upper_age - lower_age)
+    
+    # Calculate investment period (from joining age to 60)
+    investment_period = 60 - joining_age
+    total_months = investment_period * 12
+    
+    # Calculate total contribution
+    total_contribution = monthly_contribution * total_months
+    
+    # Calculate government co-contribution (50% of contribution or ₹1000 per year, whichever is lower, for first 5 years)
+    gov_contribution = 0
+    if gov_co_contribution:
+        annual_contribution = monthly_contribution * 12
+        annual_gov_contribution = min(annual_contribution * 0.5, 1000)
+        gov_contribution_years = min(5, investment_period)
+        gov_contribution = annual_gov_contribution * gov_contribution_years
+    
+    # Calculate total corpus at age 60
+    monthly_rate = expected_return_rate / (12 * 100)
+    
+    # Future value of monthly contributions (annuity)
+    if monthly_rate > 0:
+        fv_contributions = monthly_contribution * (((1 + monthly_rate) ** total_months - 1) / monthly_rate)
+        
+        # Future value of government contributions (assuming they are made at the end of each year for first 5 years)
+        fv_gov_contribution = 0
+        if gov_co_contribution and gov_contribution > 0:
+            annual_gov_amount = gov_contribution / gov_contribution_years
+            for year in range(gov_contribution_years):
+                months_to_maturity = total_months - ((year + 1) * 12)
+                fv_gov_contribution += annual_gov_amount * ((1 + monthly_rate) ** months_to_maturity)
+    else:
+        fv_contributions = monthly_contribution * total_months
+        fv_gov_contribution = gov_contribution
+    
+    total_corpus = fv_contributions + fv_gov_contribution
+    investment_growth = total_corpus - total_contribution - gov_contribution
+    
+    # Calculate lump sum amount (200 times monthly pension as per APY rules)
+    lump_sum = pension_amount * 200
+    
+    # Generate detailed breakdown (yearly and monthly)
+    yearly_breakdown = []
+    monthly_breakdown = []
+    
+    accumulated_balance = 0
+    total_invested_so_far = 0
+    total_gov_contrib_so_far = 0
+    
+    month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
+                   'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+    
+    for year in range(1, investment_period + 1):
+        year_start_balance = accumulated_balance
+        yearly_contribution = monthly_contribution * 12
+        yearly_gov_contribution = 0
+        
+        # Government contribution for first 5 years
+        if gov_co_contribution and year <= 5:
+            yearly_gov_contribution = min(yearly_contribution * 0.5, 1000)
+        
+        total_invested_so_far += yearly_contribution
+        total_gov_contrib_so_far += yearly_gov_contribution
+        
+        # Calculate year-end balance with monthly compounding
+        year_end_balance = year_start_balance
+        for month in range(12):
+            # Add monthly contribution
+            year_end_balance += monthly_contribution
+            # Add monthly government contribution (distributed monthly)
+            year_end_balance += yearly_gov_contribution / 12
+            # Apply monthly interest
+            year_end_balance = year_end_balance * (1 + monthly_rate)
+        
+        accumulated_balance = year_end_balance
+        current_age_in_year = joining_age + year - 1
+        
+        yearly_breakdown.append({
+            'year': year,
+            'age': current_age_in_year,
+            'annual_contribution': yearly_contribution,
+            'gov_contribution': yearly_gov_contribution,
+            'total_invested': total_invested_so_far,
+            'investment_growth': accumulated_balance - total_invested_so_far - total_gov_contrib_so_far,
+            'balance': accumulated_balance
+        })
+        
+        # Monthly breakdown for this year
+        monthly_balance = year_start_balance
+        monthly_total_invested = total_invested_so_far - yearly_contribution
+        monthly_total_gov_contrib = total_gov_contrib_so_far - yearly_gov_contribution
+        
+        for month in range(1, 13):
+            # Add monthly amounts
+            monthly_balance += monthly_contribution
+            monthly_total_invested += monthly_contribution
+            
+            monthly_gov_contrib_this_month = yearly_gov_contribution / 12 if yearly_gov_contribution > 0 else 0
+            monthly_balance += monthly_gov_contrib_this_month
+            monthly_total_gov_contrib += monthly_gov_contrib_this_month
+            
+            # Apply monthly interest
+            monthly_balance = monthly_balance * (1 + monthly_rate)
+            
+            monthly_breakdown.append({
+                'year': year,
+                'month': month,
+                'month_name': month_names[month - 1],
+                'age': current_age_in_year,
+                'monthly_contribution': monthly_contribution,
+                'gov_contribution': monthly_gov_contrib_this_month,
+                'cumulative_investment': monthly_total_invested,
+                'investment_growth': monthly_balance - monthly_total_invested - monthly_total_gov_contrib,
+                'balance': monthly_balance
+            })
+    
+    return {
+        'joining_age': joining_age,
+        'pension_amount': pension_amount,
+        'expected_return_rate': expected_return_rate,
+        'investment_period': investment_period,
+        'monthly_contribution': round(monthly_contribution, 2),
+        'total_contribution': round(total_contribution, 2),
+        'gov_contribution': round(gov_contribution, 2),
+        'investment_growth': round(investment_growth, 2),
+        'total_corpus': round(total_corpus, 2),
+        'lump_sum': round(lump_sum, 2),
+        'yearly_breakdown': yearly_breakdown,
+        'monthly_breakdown': monthly_breakdown,
+        'pfrda_rate': expected_return_rate
+    }
+
+def calculate_apy():
+    try:
+        data = request.get_json()
+        joining_age = int(data.get('joining_age', 25))
+        pension_amount = int(data.get('pension_amount', 3000))
+        
+        # Validate inputs
+        if joining_age < 18 or joining_age > 40:
+            return jsonify({'error': 'Age must be between 18 and 40 years'}), 400
+        if pension_amount not in [1000, 2000, 3000, 4000, 5000]:
+            return jsonify({'error': 'Pension amount must be ₹1000, ₹2000, ₹3000, ₹4000, or ₹5000'}), 400
+        
+        # Calculate APY returns
+        result = calculate_apy_returns(joining_age, pension_amount)
+        
+        return jsonify(result)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+def ppf_calculator():
+    return render_template('ppf_calculator.html')
+
+@memoize()
+def calculate_ppf_returns(annual_contribution, duration_years, interest_rate, contribution_frequency):
+    """
+    Calculate PPF returns with compound interest
+    PPF compounds annually irrespective of contribution frequency
+    """
+    try:
+        # Validate inputs
+        if annual_contribution <= 0 or duration_years <= 0 or interest_rate < 0:
+            raise ValueError("Invalid input values")
+        
+        # PPF minimum duration is 15 years
+        if duration_years < 15:
+            raise ValueError("PPF minimum duration is 15 years")
+            
+        # PPF maximum contribution per year is ₹1,50,000
+        if annual_contribution > 150000:
+            raise ValueError("PPF maximum annual contribution is ₹1,50,000")
+            
+        # Total annual contribution is already calculated in frontend
+        total_annual_contribution = annual_contribution
+        
+        # PPF calculation with annual compounding
+        annual_rate = interest_rate / 100
+        total_investment = 0
+        maturity_value = 0
+        year_wise_data = []
+        
+        for year in range(1, duration_years + 1):
+            # Add annual contribution
+            total_investment += total_annual_contribution
+            
+            # Calculate interest on opening balance + contribution
+            # PPF interest is calculated on the minimum balance between 5th and last day of month
+            # For simplicity, we'll calculate interest on the full amount
+            opening_balance = maturity_value
+            closing_balance = (opening_balance + total_annual_contribution) * (1 + annual_rate)
+            
+            interest_earned = closing_balance - opening_balance - total_annual_contribution
+            maturity_value = closing_balance
+            
+            year_wise_data.append({
+                'year': year,
+                'annual_contribution': total_annual_contribution,
+                'opening_balance': round(opening_balance, 2),
+                'interest_earned': round(interest_earned, 2),
+                'closing_balance': round(closing_balance, 2),
+                'total_invested_till_date': round(total_investment, 2)
+            })
+        
+        total_interest = maturity_value - total_investment
+        
+        return {
+            'total_investment': round(total_investment, 2),
+            'total_interest': round(total_interest, 2),
+            'maturity_value': round(maturity_value, 2),
+            'investment_duration': duration_years,
+            'annual_contribution': total_annual_contribution,
+            'contribution_frequency': contribution_frequency,
+            'interest_rate': interest_rate,
+            'year_wise_data': year_wise_data
+        }
+        
+    except Exception as e:
+        raise Exception(f"Error calculating PPF returns: {str(e)}")
+
+def calculate_ppf_route():
+    try:
+        data = request.get_json()
+        
+        annual_contribution = float(data.get('annual_contribution', 0))
+        duration_years = int(data.get('duration_years', 15))
+        interest_rate = float(data.get('interest_rate', 7.1))
+        contribution_frequency = data.get('contribution_frequency', 'monthly')
+        
+        # Calculate PPF returns
+        result = calculate_ppf_returns(annual_contribution, duration_years, interest_rate, contribution_frequency)
+        
+        return jsonify({
+            'status': 'success',
+            **result
+        })
+        
+    except Exception as e:
+        return jsonify({'status': 'error', 'error': str(e)}), 400
+
+def rbi_floating_rate_savings_bonds_calculator():
+    return render_template('rbi_floating_rate_savings_bonds_calculator.html')
+
+def calculate_rbi_floating_rate_bonds_returns(investment_amount, interest_rate, bond_tenure_years):
+    """
+    Calculate RBI Floating Rate Savings Bonds returns
+    Features:
+    - Fixed 7-year tenure
+    - Half-yearly interest payout
+    - Interest rate: currently 8.05% (floating, reset every 6 months)
+    - Interest paid every 6 months
+    - Principal returned at maturity
+    """
+    try:
+        # Validate inputs
+        if investment_amount < 1000:
+            raise ValueError("Minimum investment amount is ₹1,000")
+        
+        if bond_tenure_years != 7:
+            raise ValueError("RBI Floating Rate Savings Bonds have a fixed tenure of 7 years")
+        
+        if interest_rate <= 0 or interest_rate > 20:
+            raise ValueError("Interest rate must be between 0% and 20%")
+        
+        # Calculate returns
+        annual_interest_rate = interest_rate / 100
+        half_yearly_rate = annual_interest_rate / 2
+        
+        # Calculate interest amounts
+        total_interest_per_year = investment_amount * annual_interest_rate
+        half_yearly_payout = investment_amount * half_yearly_rate
+        total_interest_over_tenure = total_interest_per_year * bond_tenure_years
+        maturity_amount = investment_amount + total_interest_over_tenure
+        
+        # Generate year-wise and half-yearly breakdown
+        yearly_data = []
+        half_yearly_data = []
+        cumulative_interest = 0
+        
+        for year in range(1, bond_tenure_years + 1):
+            year_interest = total_interest_per_year
+            cumulative_interest += year_interest
+            
+            yearly_data.append({
+                'year': year,
+                'interest_earned': round(year_interest, 2),
+                'cumulative_interest': round(cumulative_interest, 2),
+                'principal_outstanding': investment_amount
+            })
+            
+            # Half-yearly breakdown for this year
+            for half_year in range(1, 3):
+                payout_number = (year - 1) * 2 + half_year
+                half_yearly_data.append({
+                    'payout_number': payout_number,
+                    'year': year,
+                    'half_year': half_year,
+                    'payout_amount': round(half_yearly_payout, 2),
+                    'cumulative_interest': round(payout_number * half_yearly_payout, 2)
+                })
+        
+        # Calculate next rate revision date (Jan 1 or Jul 1)
+        current_month = datetime.now().month
+        current_year = datetime.now().year
+        
+        if current_month <= 6:
+            next_revision_date = f"Jul 1, {current_year}"
+        else:
+            next_revision_date = f"Jan 1, {current_year + 1}"
+        
+        return {
+            'investment_amount': round(investment_amount, 2),
+            'interest_rate': interest_rate,
+            'bond_tenure_years': bond_tenure_years,
+            'total_interest_per_year': round(total_interest_per_year, 2),
+            'half_yearly_payout': round(half_yearly_payout, 2),
+            'total_interest_over_tenure': round(total_interest_over_tenure, 2),
+            'maturity_amount': round(maturity_amount, 2),
+            'yearly_data': yearly_data,
+            'half_yearly_data': half_yearly_data,
+            'next_revision_date': next_revision_date,
+            'summary_text': f"For an investment of ₹{round(investment_amount):,} at {interest_rate}% interest, you will receive ₹{round(half_yearly_payout):,} every 6 months for 7 years."
+        }
+        
+    except Exception as e:
+        raise Exception(f"Error calculating RBI bond returns: {str(e)}")
+
+def calculate_rbi_floating_rate_bonds_route():
+    try:
+        data = request.get_json()
+        
+        investment_amount = float(data.get('investment_amount', 0))
+        interest_rate = float(data.get('interest_rate', 8.05))
+        bond_tenure_years = int(data.get('bond_tenure_years', 7))
+        
+        # Calculate RBI bond returns
+        result = calculate_rbi_floating_rate_bonds_returns(investment_amount, interest_rate, bond_tenure_years)
+        
+        return jsonify({
+            'status': 'success',
+            **result
+        })
+        
+    except Exception as e:
+        return jsonify({'status': 'error', 'error': str(e)}), 400
+
+def kisan_vikas_patra_calculator():
+    return render_template('kisan_vikas_patra_calculator.html')
+
+def calculate_kvp_returns(investment_amount, interest_rate, maturity_years=None, lock_in_period=2.5):
+    """
+    Calculate Kisan Vikas Patra returns
+    KVP Features:
+    - Government savings scheme that doubles the investment
+    - Current interest rate around 7.5% per annum (compounded annually)
+    - Fixed maturity period when investment doubles
+    - Minimum investment: ₹1,000
+    - No maximum investment limit
+    """
+    
+    # Handle zero investment case
+    if investment_amount == 0:
+        return {
+            'investment_amount': 0,
+            'interest_rate': interest_rate,
+            'maturity_years': 0,
+            'maturity_amount': 0,
+            'total_interest': 0,
+            'doubling_period': 0,
+            'yearly_data': [],
+            'monthly_data': []
+        }
+    
+    # Convert interest rate to decimal
+    annual_rate = interest_rate / 100
+    
+    # Calculate doubling period if not provided
+    if maturity_years is None:
+        # Using Rule of 72 or precise calculation: ln(2)/ln(1+r)
+        doubling_period = math.log(2) / math.log(1 + annual_rate)
+        maturity_years = round(doubling_period, 1)
+    else:
+        doubling_period = maturity_years
+    
+    # For KVP, the investment always doubles at maturity
+    maturity_amount = investment_amount * 2
+    
+    # Calculate value at lock-in period (partial growth)
+    lock_in_amount = investment_amount * pow(1 + annual_rate, lock_in_period)
+    
+    # Calculate total interest earned (which is always equal to principal in KVP)
+    total_interest = maturity_amount - investment_amount
+    lock_in_interest = lock_in_amount - investment_amount
+    
+    # Generate yearly breakdown - showing progression to doubling
+    yearly_data = []
+    for year in range(1, int(maturity_years) + 2):  # +2 to show final year
+        if year <= maturity_years:
+            # For KVP, calculate gradual progression towards doubling
+            if year >= maturity_years:
+                # At maturity, amount is exactly double
+                year_amount = investment_amount * 2
+            else:
+                # Progressive growth using compound interest during the period
+                year_amount = investment_amount * pow(1 + annual_rate, year)
+            
+            year_interest = year_amount - investment_amount
+            yearly_data.append({
+                'year': year,
+                'amount': round(year_amount, 2),
+                'interest_earned': round(year_interest, 2),
+                'interest_rate': interest_rate
+            })
+    
+    # Generate monthly breakdown for first 2 years to show progression
+    monthly_data = []
+    for year in range(1, min(3, int(maturity_years) + 1)):  # Show first 2 years monthly
+        for month in range(1, 13):
+            months_elapsed = (year - 1) * 12 + month
+            months_factor = months_elapsed / 12.0
+            month_amount = investment_amount * pow(1 + annual_rate, months_factor)
+            month_interest = month_amount - investment_amount
+            
+            monthly_data.append({
+                'year': year,
+                'month': ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
+                         'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'][month-1],
+                'amount': round(month_amount, 2),
+                'interest_earned': round(month_interest, 2)
+            })
+    
+    # Calculate maturity date (assuming investment starts today)
+    from datetime import datetime, timedelta
+    import calendar
+    
+    today = datetime.now()
+    # Calculate maturity date by adding years and days
+    years_to_add = int(maturity_years)
+    days_to_add = int((maturity_years - years_to_add) * 365.25)  # Account for leap years
+    
+    try:
+        maturity_date = today.replace(year=today.year + years_to_add)
+        maturity_date = maturity_date + timedelta(days=days_to_add)
+    except ValueError:
+        # Handle leap year edge case (Feb 29)
+        maturity_date = today.replace(year=today.year + years_to_add, month=2, day=28)
+        maturity_date = maturity_date + timedelta(days=days_to_add)
+    
+    # Calculate lock-in date
+    lock_in_years_to_add = int(lock_in_period)
+    lock_in_days_to_add = int((lock_in_period - lock_in_years_to_add) * 365.25)
+    
+    try:
+        lock_in_date = today.replace(year=today.year + lock_in_years_to_add)
+        lock_in_date = lock_in_date + timedelta(days=lock_in_days_to_add)
+    except ValueError:
+        # Handle leap year edge case (Feb 29)
+        lock_in_date = today.replace(year=today.year + lock_in_years_to_add, month=2, day=28)
+        lock_in_date = lock_in_date + timedelta(days=lock_in_days_to_add)
+    
+    # Format dates
+    maturity_date_formatted = maturity_date.strftime("%b %Y")
+    lock_in_date_formatted = lock_in_date.strftime("%b %Y")
+    
+    return {
+        'investment_amount': investment_amount,
+        'interest_rate': interest_rate,
+        'maturity_years': round(maturity_years, 1),
+        'lock_in_period': lock_in_period,
+        'maturity_amount': round(maturity_amount, 2),
+        'lock_in_amount': round(lock_in_amount, 2),
+        'total_interest': round(total_interest, 2),
+        'lock_in_interest': round(lock_in_interest, 2),
+        'doubling_period': round(doubling_period, 1),
+        'maturity_date': maturity_date_formatted,
+        'lock_in_date': lock_in_date_formatted,
+        'maturity_date_full': maturity_date.strftime("%d %B %Y"),
+        'yearly_data': yearly_data,
+        'monthly_data': monthly_data
+    }
+
+def calculate_kvp():
+    try:
+        data = request.get_json()
+        investment_amount = float(data.get('investment_amount', 50000))
+        interest_rate = float(data.get('interest_rate', 7.5))
+        maturity_years = data.get('maturity_years', None)
+        lock_in_period = float(data.get('lock_in_period', 2.5))
+        if maturity_years is not None:
+            maturity_years = float(maturity_years)
+        
+        # Validate inputs
+        if investment_amount < 1000:
+            return jsonify({'error': 'Minimum investment amount is ₹1,000'}), 400
+        if investment_amount > 100000000:
+            return jsonify({'error': 'Investment amount cannot exceed ₹10 Crores'}), 400
+        if interest_rate < 1.0 or interest_rate > 15.0:
+            return jsonify({'error': 'Interest rate must be between 1% and 15%'}), 400
+        if maturity_years is not None and (maturity_years < 1 or maturity_years > 50):
+            return jsonify({'error': 'Maturity period must be between 1 and 50 years'}), 400
+        if lock_in_period < 1 or lock_in_period > 10:
+            return jsonify({'error': 'Lock-in period must be between 1 and 10 years'}), 400
+        
+        # Calculate KVP returns
+        result = calculate_kvp_returns(investment_amount, interest_rate, maturity_years, lock_in_period)
+        
+        return jsonify(result)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+def national_savings_certificate_calculator():
+    return render_template('national_savings_certificate_calculator.html')
+
+def calculate_nsc_returns(investment_amount, interest_rate):
+    """
+    Calculate National Savings Certificate (NSC) returns
+    NSC Features:
+    - Government savings scheme with fixed interest rate
+    - Fixed tenure of 5 years (not flexible)
+    - Interest compounded annually but paid at maturity
+    - Tax benefits under Section 80C up to ₹1.5 lakh
+    - Minimum investment: ₹1,000 (can also be ₹100)
+    - No maximum investment limit
+    """
+    
+    # NSC has a fixed tenure of 5 years
+    tenure_years = 5
+    
+    # Handle zero investment case
+    if investment_amount == 0:
+        return {
+            'investment_amount': 0,
+            'interest_rate': interest_rate,
+            'tenure_years': tenure_years,
+            'maturity_amount': 0,
+            'total_interest': 0,
+            'tax_benefit': 0,
+            'yearly_data': [],
+            'monthly_data': []
+        }
+    
+    # Convert interest rate to decimal
+    annual_rate = interest_rate / 100
+    
+    # Calculate maturity amount using compound interest formula
+    maturity_amount = investment_amount * pow(1 + annual_rate, tenure_years)
+    
+    # Calculate total interest earned
+    total_interest = maturity_amount - investment_amount
+    
+    # Calculate tax benefit (80C allows deduction up to ₹1.5 lakh)
+    max_80c_limit = 150000
+    tax_benefit_amount = min(investment_amount, max_80c_limit)
+    
+    # Generate yearly breakdown for all 5 years
+    yearly_data = []
+    cumulative_amount = investment_amount
+    for year in range(1, tenure_years + 1):
+        # Calculate amount at end of this year
+        year_end_amount = investment_amount * pow(1 + annual_rate, year)
+        year_interest = year_end_amount - cumulative_amount
+        cumulative_interest = year_end_amount - investment_amount
+        
+        yearly_data.append({
+            'year': year,
+            'opening_balance': round(cumulative_amount, 2),
+            'interest_earned': round(year_interest, 2),
+            'closing_balance': round(year_end_amount, 2),
+            'cumulative_interest': round(cumulative_interest, 2)
+        })
+        cumulative_amount = year_end_amount
+    
+    # Generate monthly breakdown for first 2 years to show progression
+    monthly_data = []
+    for year in range(1, min(3, tenure_years + 1)):  # Show first 2 years monthly
+        for month in range(1, 13):
+            months_elapsed = (year - 1) * 12 + month
+            months_factor = months_elapsed / 12.0
+            month_amount = investment_amount * pow(1 + annual_rate, months_factor)
+            month_interest = month_amount - investment_amount
+            
+            monthly_data.append({
+                'year': year,
+                'month': ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
+                         'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'][month-1],
+                'amount': round(month_amount, 2),
+                'interest_earned': round(month_interest, 2)
+            })
+    
+    # Calculate maturity date (assuming investment starts today)
+    from datetime import datetime, timedelta
+    import calendar
+    
+    today = datetime.now()
+    try:
+        maturity_date = today.replace(year=today.year + tenure_years)
+    except ValueError:
+        # Handle leap year edge case (Feb 29)
+        maturity_date = today.replace(year=today.year + tenure_years, month=2, day=28)
+    
+    # Format dates
+    maturity_date_formatted = maturity_date.strftime("%b %Y")
+    
+    return {
+        'investment_amount': investment_amount,
+        'interest_rate': interest_rate,
+        'tenure_years': tenure_years,
+        'maturity_amount': round(maturity_amount, 2),
+        'total_interest': round(total_interest, 2),
+        'tax_benefit': round(tax_benefit_amount, 2),
+        'maturity_date': maturity_date_formatted,
+        'maturity_date_full': maturity_date.strftime("%d %B %Y"),
+        'yearly_data': yearly_data,
+        'monthly_data': monthly_data
+    }
+
+def calculate_nsc():
+    try:
+        data = request.get_json()
+        investment_amount = float(data.get('investment_amount', 50000))
+        interest_rate = float(data.get('interest_rate', 6.8))
+        # tenure_years is not needed as NSC has fixed 5-year tenure
+        
+        # Validate inputs
+        if investment_amount < 100:
+            return jsonify({'error': 'Minimum investment amount is ₹100'}), 400
+        if investment_amount > 100000000:
+            return jsonify({'error': 'Investment amount cannot exceed ₹10 Crores'}), 400
+        if interest_rate < 1.0 or interest_rate > 15.0:
+            return jsonify({'error': 'Interest rate must be between 1% and 15%'}), 400
+        
+        # Calculate NSC returns (fixed 5-year tenure)
+        result = calculate_nsc_returns(investment_amount, interest_rate)
+        
+        return jsonify(result)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+def pradhan_mantri_shram_yogi_maandhan_calculator():
+    return render_template('pradhan_mantri_shram_yogi_maandhan_calculator.html')
+
+def pradhan_mantri_vaya_vandana_yojana_calculator():
+    return render_template('pradhan_mantri_vaya_vandana_yojana_calculator.html')
+
+def calculate_pmsym_returns(joining_age, pension_amount, interest_rate):
+    """
+    Calculate PMSYM (Pradhan Mantri Shram Yogi Maandhan) returns
+    PMSYM Features:
+    - Age at joining: 18-40 years
+    - Monthly contribution: ₹55 to ₹110 based on age (calculated automatically)
+    - Government contribution: 50% of subscriber's contribution
+    - Pension amount: ₹3000 per month after 60 years (fixed)
+    - Interest rate: 8% per annum (fixed)
+    """
+    
+    # Validate age range
+    if joining_age < 18 or joining_age > 40:
+        return {
+            'error': 'Joining age must be between 18 and 40 years'
+        }
+    
+    # Fixed PMSYM parameters
+    pension_amount = 3000  # Fixed pension amount
+    interest_rate = 8.0    # Fixed interest rate
+    
+    # Calculate years of contribution
+    years_of_contribution = int(60 - joining_age)
+    
+    # PMSYM contribution structure based on age
+    if joining_age <= 29:
+        monthly_contribution = 55
+    elif joining_age <= 30:
+        monthly_contribution = 60
+    elif joining_age <= 31:
+        monthly_contribution = 65
+    elif joining_age <= 32:
+        monthly_contribution = 70
+    elif joining_age <= 33:
+        monthly_contribution = 75
+    elif joining_age <= 34:
+        monthly_contribution = 80
+    elif joining_age <= 35:
+        monthly_contribution = 85
+    elif joining_age <= 36:
+        monthly_contribution = 90
+    elif joining_age <= 37:
+        monthly_contribution = 95
+    elif joining_age <= 38:
+        monthly_contribution = 100
+    elif joining_age <= 39:
+        monthly_contribution = 105
+    else:
+        monthly_contribution = 110
+    
+    # Government contribution is 50% of subscriber contribution
+    government_contribution = monthly_contribution * 0.5
+    
+    # Calculate total contributions
+    total_subscriber_contribution = monthly_contribution * 12 * years_of_contribution
+    total_government_contribution = government_contribution * 12 * years_of_contribution
+    total_contribution = total_subscriber_contribution + total_government_contribution
+    
+    # Generate yearly breakdown
+    yearly_breakdown = []
+    current_corpus = 0
+    annual_rate = interest_rate / 100
+    monthly_rate = annual_rate / 12
+    
+    for year in range(1, years_of_contribution + 1):
+        # Calculate monthly progression for this year
+        for month in range(12):
+            monthly_total = monthly_contribution + government_contribution
+            current_corpus += monthly_total
+            current_corpus = current_corpus * (1 + monthly_rate)
+        
+        yearly_breakdown.append({
+            'year': year,
+            'age': joining_age + year,
+            'yearly_subscriber_contribution': monthly_contribution * 12,
+            'yearly_government_contribution': government_contribution * 12,
+            'total_yearly_contribution': (monthly_contribution + government_contribution) * 12,
+            'corpus_at_year_end': current_corpus,
+            'cumulative_subscriber_contribution': monthly_contribution * 12 * year,
+            'cumulative_government_contribution': government_contribution * 12 * year
+        })
+    
+    return {
+        'joining_age': joining_age,
+        'monthly_contribution': monthly_contribution,
+        'government_contribution': government_contribution,
+        'pension_amount': pension_amount,
+        'interest_rate': interest_rate,
+        'years_of_contribution': years_of_contribution,
+        'total_subscriber_contribution': round(total_subscriber_contribution, 2),
+        'total_government_contribution': round(total_government_contribution, 2),
+        'total_contribution': round(total_contribution, 2),
+        'corpus_at_60': round(current_corpus, 2),
+        'yearly_breakdown': yearly_breakdown
+    }
+
+def calculate_pmsym():
+    try:
+        data = request.get_json()
+        joining_age = int(float(data.get('joining_age', 25)))
+        pension_amount = 3000  # Fixed pension amount
+        interest_rate = 8.0    # Fixed interest rate
+        
+        # Calculate PMSYM returns
+        result = calculate_pmsym_returns(joining_age, pension_amount, interest_rate)
+        
+        if 'error' in result:
+            return jsonify(result)
+        
+        return jsonify(result)
+        
+    except Exception as e:
+        return jsonify({'error': f'Calculation error: {str(e)}'})
+
+def sovereign_gold_bonds_calculator():
+    return render_template('sovereign_gold_bonds_calculator.html')
+
+def calculate_sgb():
+    try:
+        data = request.get_json()
+        
+        # Input parameters
+        investment_quantity = float(data.get('investment_quantity', 1))  # in grams
+        issue_price_per_gram = float(data.get('issue_price_per_gram', 6000))  # in ₹
+        expected_gold_price_maturity = float(data.get('expected_gold_price_maturity', 7500))  # in ₹
+        interest_rate = float(data.get('interest_rate', 2.5))  # in %
+        tenure_years = int(data.get('tenure_years', 8))  # in years
+        
+        # Validate inputs
+        if investment_quantity <= 0:
+            return jsonify({'error': 'Investment quantity must be greater than 0'}), 400
+        if issue_price_per_gram <= 0:
+            return jsonify({'error': 'Issue price must be greater than 0'}), 400
+        if expected_gold_price_maturity <= 0:
+            return jsonify({'error': 'Expected gold price must be greater than 0'}), 400
+        if interest_rate < 0:
+            return jsonify({'error': 'Interest rate cannot be negative'}), 400
+        if tenure_years <= 0:
+            return jsonify({'error': 'Tenure must be greater than 0'}), 400
+        
+        # Calculate SGB returns
+        result = calculate_sgb_returns(
+            investment_quantity,
+            issue_price_per_gram,
+            expected_gold_price_maturity,
+            interest_rate,
+            tenure_years
+        )
+        
+        return jsonify(result)
+        
+    except ValueError as e:
+        return jsonify({'error': f'Invalid input: {str(e)}'}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+def calculate_sgb_returns(investment_quantity, issue_price_per_gram, expected_gold_price_maturity, interest_rate, tenure_years):
+    """
+    Calculate Sovereign Gold Bonds (SGB) returns
+    Features:
+    - Calculate total investment amount
+    - Calculate interest earned over tenure
+    - Calculate capital gain based on gold price appreciation
+    - Calculate total return and annualized return
+    """
+    
+    # Calculate total investment
+    total_investment = investment_quantity * issue_price_per_gram
+    
+    # Calculate annual interest amount (interest is paid on issue price, not current market price)
+    annual_interest = total_investment * (interest_rate / 100)
+    total_interest_earned = annual_interest * tenure_years
+    
+    # Calculate maturity value (based on expected gold price)
+    maturity_value = investment_quantity * expected_gold_price_maturity
+    
+    # Calculate capital gain
+    capital_gain = maturity_value - total_investment
+    
+    # Calculate total return (maturity value + interest earned)
+    total_return = maturity_value + total_interest_earned
+    
+    # Calculate total gain (total return - investment)
+    total_gain = total_return - total_investment
+    
+    # Calculate annualized return
+    if total_investment > 0 and tenure_years > 0:
+        annualized_return = ((total_return / total_investment) ** (1 / tenure_years) - 1) * 100
+    else:
+        annualized_return = 0
+    
+    # Generate year-wise breakdown
+    year_wise_data = []
+    cumulative_interest = 0
+    
+    for year in range(1, tenure_years + 1):
+        cumulative_interest += annual_interest
+        
+        year_wise_data.append({
+            'year': year,
+            'annual_interest': annual_interest,
+            'cumulative_interest': cumulative_interest,
+            'investment_value': total_investment,  # SGB investment remains same
+            'estimated_gold_value': total_investment * (1 + ((expected_gold_price_maturity - issue_price_per_gram) / issue_price_per_gram) * (year / tenure_years)),
+            'total_value_with_interest': total_investment * (1 + ((expected_gold_price_maturity - issue_price_per_gram) / issue_price_per_gram) * (year / tenure_years)) + cumulative_interest
+        })
+    
+    return {
+        'investment_quantity': investment_quantity,
+        'issue_price_per_gram': issue_price_per_gram,
+        'expected_gold_price_maturity': expected_gold_price_maturity,
+        'interest_rate': interest_rate,
+        'tenure_years': tenure_years,
+        'total_investment': round(total_investment, 2),
+        'total_interest_earned': round(total_interest_earned, 2),
+        'maturity_value': round(maturity_value, 2),
+        'capital_gain': round(capital_gain, 2),
+        'total_return': round(total_return, 2),
+        'total_gain': round(total_gain, 2),
+        'annualized_return': round(annualized_return, 2),
+        'annual_interest': round(annual_interest, 2),
+        'year_wise_data': year_wise_data
+    }
+
+def post_office_rd_calculator():
+    return render_template('post_office_rd_calculator.html')
+
+def calculate_post_office_rd():
+    try:
+        data = request.get_json()
+        
+        monthly_amount = float(data.get('monthly_amount', 0))
+        tenure_years = int(data.get('tenure_years', 1))
+        interest_rate = float(data.get('interest_rate', 6.7))
+        
+        # Validation
+        if monthly_amount < 100:
+            return jsonify({'error': 'Monthly deposit amount must be at least ₹100'})
+        
+        if tenure_years < 1 or tenure_years > 30:
+            return jsonify({'error': 'Tenure must be between 1 and 30 years'})
+        
+        if interest_rate < 1.0 or interest_rate > 15.0:
+            return jsonify({'error': 'Interest rate must be between 1% and 15%'})
+        
+        # Post Office RD calculation using the formula:
+        # M = R × [(1 + i)^n − 1] / [1 − (1 + i)^(-1/3)]
+        # Where:
+        # R = Monthly deposit
+        # i = Interest rate per quarter = annual rate / 400
+        # n = total quarters = years × 4
+        
+        quarterly_rate = interest_rate / 400  # Interest rate per quarter
+        total_quarters = tenure_years * 4
+        total_months = tenure_years * 12
+        
+        if quarterly_rate == 0:
+            # If no interest
+            maturity_value = monthly_amount * total_months
+        else:
+            # Apply RD formula
+            numerator = ((1 + quarterly_rate) ** total_quarters) - 1
+            denominator = 1 - ((1 + quarterly_rate) ** (-1/3))
+            maturity_value = monthly_amount * (numerator / denominator)
+        
+        total_investment = monthly_amount * total_months
+        total_interest = maturity_value - total_investment
+        
+        # Calculate maturity date
+        from datetime import datetime, timedelta
+        today = datetime.now()
+        maturity_date = datetime(today.year + tenure_years, today.month, today.day)
+        
+        # Generate year-wise data
+        year_wise_data = []
+        cumulative_investment = 0
+        cumulative_value = 0
+        
+        for year in range(1, tenure_years + 1):
+            yearly_deposits = monthly_amount * 12
+            cumulative_investment += yearly_deposits
+            
+            # Calculate value at end of year using compound growth
+            quarters_completed = year * 4
+            
+            if quarterly_rate == 0:
+                year_end_value = cumulative_investment
+            else:
+                numerator_year = ((1 + quarterly_rate) ** quarters_completed) - 1
+                denominator_year = 1 - ((1 + quarterly_rate) ** (-1/3))
+                year_end_value = monthly_amount * (numerator_year / denominator_year)
+            
+            opening_balance = cumulative_value
+            year_interest = year_end_value - opening_balance - yearly_deposits
+            cumulative_value = year_end_value
+            
+            year_wise_data.append({
+                'year': year,
+                'quarterly_deposits': yearly_deposits / 4,
+                'opening_balance': round(opening_balance),
+                'interest_earned': round(max(0, year_interest)),
+                'closing_balance': round(year_end_value),
+                'total_invested': round(cumulative_investment)
+            })
+        
+        return jsonify({
+            'total_investment': round(total_investment),
+            'total_interest': round(total_interest),
+            'maturity_value': round(maturity_value),
+            'maturity_date': maturity_date.strftime('%b %Y'),
+            'monthly_amount': monthly_amount,
+            'tenure_years': tenure_years,
+            'interest_rate': interest_rate,
+            'year_wise_data': year_wise_data
+        })
+        
+    except Exception as e:
+        return jsonify({'error': f'Calculation error: {str(e)}'})
@@ -0,0 +1,3034 @@
+from flask import current_app, render_template, request, jsonify
+import math
+
+import numpy as np
+
+import amortization
+import loan_engine
+from loan_engine import calculate_emi, calculate_amortization_schedule
+import sensitivity
+import solver
+from apr import amortized_cash_flows, cash_flow_apr, loan_apr
+import streaming
+import export
+from calculators.common import calculate_flat_interest_emi
+
+def loan_product_result(product, data):
+    """
+    Calculate one of the EMI products configured in loan_engine.LOAN_PRODUCTS,
+    returning the response body and status code
+    """
+    config = loan_engine.LOAN_PRODUCTS[product]
+    try:
+        return loan_engine.calculate_loan_product(product, data), 200
+    
+    except Exception as e:
+        if 'log_label' in config:
+            print(f"Error in {config['log_label']} EMI calculation: {str(e)}")
+        if 'error_status' in config:
+            return {'error': str(e)}, config['error_status']
+        return {
+            'status': 'error',
+            'error': str(e)
+        }, 200
+
+def loan_product_response(product):
+    """
+    Thin route adapter for loan_product_result
+    """
+    body, status = loan_product_result(product, request.get_json(silent=True))
+    return jsonify(body), status
+
+def calculate_education_loan_emi_python(principal, annual_rate, tenure_months, repayment_option):
+    """
+    Calculate Education Loan EMI with accurate Python calculations for moratorium options
+    """
+    monthly_rate = annual_rate / (12 * 100)
+    study_period_months = 48  # 4 years standard study period
+    
+    if monthly_rate == 0:
+        emi = principal / tenure_months
+        total_interest = 0
+        total_payment = principal
+    else:
+        if repayment_option == 'complete_moratorium':
+            # Complete Moratorium: No payments during study period, interest capitalizes
+            if tenure_months <= study_period_months:
+                # If tenure is within study period, use standard EMI
+                emi = principal * monthly_rate * ((1 + monthly_rate) ** tenure_months) / (((1 + monthly_rate) ** tenure_months) - 1)
+                total_payment = emi * tenure_months
+                total_interest = total_payment - principal
+            else:
+                # Interest capitalizes during study period
+                capitalized_principal = principal * ((1 + monthly_rate) ** study_period_months)
+                repayment_months = tenure_months - study_period_months
+                
+                # EMI calculated on capitalized principal for remaining tenure
+                emi = capitalized_principal * monthly_rate * ((1 + monthly_rate) ** repayment_months) / (((1 + monthly_rate) ** repayment_months) - 1)
+                
+                # Total payment during repayment period only
+                total_payment = emi * repayment_months
+                total_interest = total_payment - principal
+                
+        elif repayment_option == 'principal_moratorium':
+            # Principal Moratorium: Only interest payments during study period
+            if tenure_months <= study_period_months:
+                # If tenure is within study period, only interest payments
+                emi = principal * monthly_rate
+                total_payment = emi * tenure_months
+                total_interest = total_payment
+            else:
+                # Interest-only payments during study period
+                interest_only_emi = principal * monthly_rate
+                interest_during_study = interest_only_emi * study_period_months
+                
+                # Principal + Interest EMI for remaining tenure
+                repayment_months = tenure_months - study_period_months
+                principal_emi = principal * monthly_rate * ((1 + monthly_rate) ** repayment_months) / (((1 + monthly_rate) ** repayment_months) - 1)
+                
+                # EMI shown is the principal repayment EMI (post-study period)
+                emi = principal_emi
+                
+                # Total interest = interest during study + interest during repayment
+                interest_during_repayment = (principal_emi * repayment_months) - principal
+                total_interest = interest_during_study + interest_during_repayment
+                total_payment = principal + total_interest
+                
+        else:  # full_emi
+            # Full EMI: Standard loan calculation from day 1
+            emi = principal * monthly_rate * ((1 + monthly_rate) ** tenure_months) / (((1 + monthly_rate) ** tenure_months) - 1)
+            total_payment = emi * tenure_months
+            total_interest = total_payment - principal
+    
+    return {
+        'emi': round(emi, 2),
+        'principal': principal,
+        'total_interest': round(total_interest, 2),
+        'total_payment': round(total_payment, 2),
+        'tenure_months': tenure_months,
+        'interest_rate': annual_rate,
+        'repayment_option': repayment_option
+    }
+
+def home_loan_calculator():
+    return render_template('home_loan_calculator.html')
+
+def home_loan_eligibility_calculator():
+    return render_template('home_loan_eligibility_calculator.html')
+
+def home_loan_affordability_calculator():
+    return render_template('home_loan_affordability_calculator.html')
+
+def home_loan_refinance_calculator():
+    return render_template('home_loan_refinance_calculator.html')
+
+def loan_amount_calculator():
+    return render_template('loan_amount_calculator.html')
+
+def loan_tenure_calculator():
+    return render_template('loan_tenure_calculator.html')
+
+def interest_rate_calculator():
+    return render_template('interest_rate_calculator.html')
+
+def car_loan_emi_calculator():
+    return render_template('car_loan_emi_calculator.html')
+
+def two_wheeler_loan_emi_calculator():
+    return render_template('two_wheeler_loan_emi_calculator.html')
+
+def personal_loan_emi_calculator():
+    return render_template('personal_loan_emi_calculator.html')
+
+def business_loan_emi_calculator():
+    return render_template('business_loan_emi_calculator.html')
+
+def education_loan_emi_calculator():
+    return render_template('education_loan_emi_calculator.html')
+
+def credit_card_emi_calculator():
+    return render_template('credit_card_emi_calculator.html')
+
+def mobile_phone_emi_calculator():
+    return render_template('mobile_phone_emi_calculator.html')
+
+def laptop_emi_calculator():
+    return render_template('laptop_emi_calculator.html')
+
+def land_loan_emi_calculator():
+    return render_template('land_loan_emi_calculator.html')
+
+def tractor_loan_emi_calculator():
+    return render_template('tractor_loan_emi_calculator.html')
+
+def commercial_property_emi_calculator():
+    return render_template('commercial_property_emi_calculator.html')
+
+def commercial_vehicle_emi_calculator():
+    return render_template('commercial_vehicle_emi_calculator.html')
+
+def daily_emi_calculator():
+    return render_template('daily_emi_calculator.html')
+
+def weekly_emi_calculator():
+    return render_template('weekly_emi_calculator.html')
+
+def monthly_emi_calculator():
+    return render_template('monthly_emi_calculator.html')
+
+def emi_calculator_with_part_payment():
+    return render_template('emi_calculator_with_part_payment.html')
+
+def flat_interest_rate_emi_calculator():
+    return render_template('flat_interest_rate_emi_calculator.html')
+
+def step_up_emi_calculator():
+    return render_template('step_up_emi_calculator.html')
+
+def bullet_emi_calculator():
+    return render_template('bullet_emi_calculator.html')
+
+def reverse_emi_calculator():
+    return render_template('reverse_emi_calculator.html')
+
+def no_cost_emi_calculator():
+    return render_template('no_cost_emi_calculator.html')
+
+def reducing_loan_emi_calculator():
+    return render_template('reducing_loan_emi_calculator.html')
+
+def reducing_balance_emi_calculator():
+    return render_template('reducing_balance_emi_calculator.html')
+
+def reducing_rate_emi_calculator():
+    return render_template('reducing_rate_emi_calculator.html')
+
+def emi_overdue_status_calculator():
+    return render_template('emi_overdue_status_calculator.html')
+
+def calculate_emi_overdue_status(principal, annual_rate, tenure_months, emi_amount, months_overdue, penalty_rate_per_month):
+    """
+    Calculate EMI overdue status including penalties and impact on loan
+    """
+    monthly_rate = annual_rate / (12 * 100)
+    penalty_monthly_rate = penalty_rate_per_month / 100
+    
+    # Calculate current outstanding principal
+    # This assumes some EMIs were paid before becoming overdue
+    payments_made = max(0, 12 - months_overdue)  # Assume 1 year loan started
+    outstanding_principal = principal
+    
+    # Calculate outstanding balance after payments made
+    for i in range(payments_made):
+        interest_payment = outstanding_principal * monthly_rate
+        principal_payment = emi_amount - interest_payment
+        outstanding_principal -= principal_payment
+    
+    # Calculate overdue amounts
+    overdue_emi_amount = emi_amount * months_overdue
+    overdue_interest = 0
+    
+    # Calculate compounding interest on overdue amount
+    temp_overdue = overdue_emi_amount
+    for month in range(months_overdue):
+        interest_on_overdue = temp_overdue * penalty_monthly_rate
+        overdue_interest += interest_on_overdue
+        temp_overdue += interest_on_overdue
+    
+    # Total amount to pay to become current
+    total_overdue_amount = overdue_emi_amount + overdue_interest
+    
+    # Calculate revised loan parameters after clearing overdue
+    revised_principal = outstanding_principal
+    revised_tenure_months = tenure_months - payments_made
+    
+    # Calculate new EMI if tenure remains same
+    if revised_tenure_months > 0 and monthly_rate > 0:
+        revised_emi = revised_principal * monthly_rate * ((1 + monthly_rate) ** revised_tenure_months) / (((1 + monthly_rate) ** revised_tenure_months) - 1)
+    else:
+        revised_emi = revised_principal / max(1, revised_tenure_months)
+    
+    # Calculate total interest on remaining loan
+    total_remaining_payment = revised_emi * revised_tenure_months
+    total_remaining_interest = total_remaining_payment - revised_principal
+    
+    # Calculate impact of overdue
+    original_total_payment = emi_amount * tenure_months
+    original_total_interest = original_total_payment - principal
+    
+    additional_cost = total_overdue_amount + total_remaining_interest - original_total_interest
+    
+    return {
+        'original_emi': round(emi_amount, 2),
+        'outstanding_principal': round(outstanding_principal, 2),
+        'overdue_emi_amount': round(overdue_emi_amount, 2),
+        'overdue_interest': round(overdue_interest, 2),
+        'total_overdue_amount': round(total_overdue_amount, 2),
+        'revised_emi': round(revised_emi, 2),
+        'revised_tenure_months': revised_tenure_months,
+        'additional_cost': round(additional_cost, 2),
+        'total_remaining_interest': round(total_remaining_interest, 2),
+        'penalty_rate_monthly': penalty_rate_per_month,
+        'months_overdue': months_overdue
+    }
+
+def calculate_emi_overdue_status_route():
+    try:
+        data = request.get_json()
+        
+        principal = float(data.get('principal', 1000000))
+        annual_rate = float(data.get('annualRate', 12.0))
+        tenure_months = int(data.get('tenureMonths', 180))
+        emi_amount = float(data.get('emiAmount', 12000))
+        months_overdue = int(data.get('monthsOverdue', 3))
+        penalty_rate = float(data.get('penaltyRate', 2.0))
+        
+        # Validate inputs
+        if principal <= 0 or annual_rate < 0 or tenure_months <= 0 or emi_amount <= 0 or months_overdue < 0:
+            return jsonify({'status': 'error', 'error': 'Invalid input values'})
+        
+        result = calculate_emi_overdue_status(principal, annual_rate, tenure_months, emi_amount, months_overdue, penalty_rate)
+        
+        return jsonify({
+            'status': 'success',
+            **result
+        })
+        
+    except Exception as e:
+        return jsonify({'status': 'error', 'error': str(e)})
+
+def calculate():
+    return loan_product_response('emi')
+
+def calculate_step_up_emi(principal, annual_rate, tenure_years, initial_emi, step_up_amount, step_up_frequency):
+    """
+    Calculate Step Up EMI and related financial metrics
+    """
+    # Input validation
+    if principal <= 0 or annual_rate < 0 or tenure_years <= 0:
+        raise ValueError("Principal, interest rate, and tenure must be positive values")
+    
+    tenure_months = int(tenure_years * 12)
+    monthly_rate = annual_rate / (12 * 100)
+    
+    # Calculate step-up interval in months
+    step_up_interval = 12 if step_up_frequency == 'yearly' else 6 if step_up_frequency == 'half_yearly' else 3
+    
+    # Simulation variables
+    remaining_balance = principal
+    total_interest = 0
+    total_payment = 0
+    current_emi = initial_emi
+    payment_schedule = []
+    
+    for month in range(1, tenure_months + 1):
+        # Calculate interest for current month
+        interest_payment = remaining_balance * monthly_rate
+        principal_payment = current_emi - interest_payment
+        
+        # Handle negative amortization (when EMI < Interest)
+        if principal_payment < 0:
+            # Unpaid interest gets added to principal balance
+            unpaid_interest = abs(principal_payment)
+            remaining_balance += unpaid_interest
+            principal_payment = 0
+            # Actual interest paid is only the EMI amount
+            actual_interest_paid = current_emi
+        else:
+            # Normal case: EMI covers interest and some principal
+            actual_interest_paid = interest_payment
+            remaining_balance = max(0, remaining_balance - principal_payment)
+        
+        total_interest += actual_interest_paid
+        total_payment += current_emi
+        
+        # Store payment details
+        payment_schedule.append({
+            'month': month,
+            'emi': round(current_emi, 2),
+            'principal': round(principal_payment, 2),
+            'interest': round(actual_interest_paid, 2),
+            'balance': round(remaining_balance, 2)
+        })
+        
+        # Step up EMI if it's time (add fixed amount)
+        if month % step_up_interval == 0 and month < tenure_months:
+            current_emi = current_emi + step_up_amount
+        
+        # Break if loan is fully paid
+        if remaining_balance <= 0:
+            break
+    
+    # Calculate average EMI
+    avg_emi = total_payment / len(payment_schedule) if payment_schedule else 0
+    
+    # Calculate total amount and savings compared to regular EMI
+    regular_emi = calculate_emi(principal, annual_rate, tenure_months)
+    regular_total = regular_emi * tenure_months
+    savings = regular_total - total_payment
+    
+    return {
+        'initial_emi': round(initial_emi, 2),
+        'final_emi': round(current_emi, 2),
+        'average_emi': round(avg_emi, 2),
+        'total_interest': round(total_interest, 2),
+        'total_amount': round(total_payment, 2),
+        'principal': principal,
+        'tenure_months': len(payment_schedule),
+        'actual_tenure_years': round(len(payment_schedule) / 12, 1),
+        'savings': round(savings, 2),
+        'regular_emi': round(regular_emi, 2),
+        'payment_schedule': payment_schedule
+    }
+
+def generate_step_up_emi_yearly_schedule(principal, annual_rate, tenure_years, initial_emi, step_up_amount, step_up_frequency, start_year=2025):
+    """
+    Generate yearly payment schedule for step-up EMI
+    """
+    step_up_data = calculate_step_up_emi(principal, annual_rate, tenure_years, initial_emi, step_up_amount, step_up_frequency)
+    payment_schedule = step_up_data['payment_schedule']
+    
+    yearly_schedule = []
+    current_year = start_year
+    month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
+                   'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+    
+    # Group payments by year
+    months_processed = 0
+    current_month_index = 0
+    
+    while months_processed < len(payment_schedule):
+        year_principal = 0
+        year_interest = 0
+        year_payments = 0
+        monthly_data = []
+        
+        # Process up to 12 months for this year
+        months_in_year = min(12, len(payment_schedule) - months_processed)
+        
+        for month_in_year in range(months_in_year):
+            payment = payment_schedule[months_processed + month_in_year]
+            year_principal += payment['principal']
+            year_interest += payment['interest']
+            year_payments += payment['emi']
+            
+            # Calculate loan paid percentage
+            loan_paid_percentage = ((principal - payment['balance']) / principal) * 100
+            
+            monthly_data.append({
+                'month': month_names[(current_month_index + month_in_year) % 12],
+                'principal': payment['principal'],
+                'interest': payment['interest'],
+                'total_payment': payment['emi'],
+                'balance': payment['balance'],
+                'loan_paid_percentage': round(loan_paid_percentage, 2)
+            })
+        
+        # Calculate year-end loan paid percentage
+        last_payment = payment_schedule[months_processed + months_in_year - 1]
+        loan_paid_percentage = ((principal - last_payment['balance']) / principal) * 100
+        
+        yearly_schedule.append({
+            'year': current_year,
+            'principal': round(year_principal, 2),
+            'interest': round(year_interest, 2),
+            'total_payment': round(year_payments, 2),
+            'balance': last_payment['balance'],
+            'loan_paid_percentage': round(loan_paid_percentage, 2),
+            'months_in_year': months_in_year,
+            'monthly_data': monthly_data
+        })
+        
+        months_processed += months_in_year
+        current_year += 1
+        current_month_index = (current_month_index + months_in_year) % 12
+    
+    return yearly_schedule
+
+def calculate_step_up_emi_route():
+    try:
+        data = request.get_json()
+        
+        loan_amount = float(data.get('loanAmount', 0))
+        interest_rate = float(data.get('interestRate', 0))
+        tenure_years = int(data.get('tenureYears', 0))
+        initial_emi = float(data.get('initialEmi', 0))
+        step_up_amount = float(data.get('stepUpAmount', 0))
+        step_up_frequency = data.get('stepUpFrequency', 'yearly')
+        
+        # Calculate step-up EMI
+        calculation = calculate_step_up_emi(loan_amount, interest_rate, tenure_years, initial_emi, step_up_amount, step_up_frequency)
+        
+        # Generate yearly schedule with monthly breakdown
+        yearly_schedule = generate_step_up_emi_yearly_schedule(
+            loan_amount, interest_rate, tenure_years, initial_emi, step_up_amount, step_up_frequency
+        )
+        
+        return jsonify({
+            'status': 'success',
+            'initialEmi': calculation['initial_emi'],
+            'finalEmi': calculation['final_emi'],
+            'averageEmi': calculation['average_emi'],
+            'totalInterest': calculation['total_interest'],
+            'totalAmount': calculation['total_amount'],
+            'actualTenureYears': calculation['actual_tenure_years'],
+            'savings': calculation['savings'],
+            'regularEmi': calculation['regular_emi'],
+            'loanAmount': loan_amount,
+            'yearlyBreakdown': yearly_schedule
+        })
+    
+    except Exception as e:
+        return jsonify({'status': 'error', 'error': str(e)}), 400
+
+def generate_flat_interest_amortization_schedule(principal, annual_rate, tenure_years):
+    """
+    Generate amortization schedule for flat interest rate EMI
+    """
+    calculation = calculate_flat_interest_emi(principal, annual_rate, tenure_years)
+    flat_emi = calculation['flatEmi']
+    total_payments = calculation['totalPayments']
+    
+    # Calculate interest per payment (constant for flat rate)
+    total_interest = principal * (annual_rate / 100) * tenure_years
+    interest_per_payment = total_interest / total_payments
+    
+    # Calculate principal per payment (constant for flat rate)
+    principal_per_payment = principal / total_payments
+    
+    schedule = []
+    remaining_balance = principal
+    
+    for payment_num in range(1, total_payments + 1):
+        # Monthly payment labels
+        period_label = f"Month {payment_num}"
+        
+        remaining_balance -= principal_per_payment
+        
+        schedule.append({
+            'period': period_label,
+            'emi': round(flat_emi, 2),
+            'principal': round(principal_per_payment, 2),
+            'interest': round(interest_per_payment, 2),
+            'balance': round(max(0, remaining_balance), 2)
+        })
+    
+    return schedule
+
+def generate_flat_interest_yearly_schedule(principal, annual_rate, tenure_years, start_year=2025):
+    """
+    Generate year-wise amortization schedule with monthly breakdown for flat interest rate EMI
+    """
+    calculation = calculate_flat_interest_emi(principal, annual_rate, tenure_years)
+    flat_emi = calculation['flatEmi']
+    
+    # Calculate interest per payment (constant for flat rate)
+    total_interest = principal * (annual_rate / 100) * tenure_years
+    interest_per_payment = total_interest / (tenure_years * 12)
+    
+    # Calculate principal per payment (constant for flat rate)
+    principal_per_payment = principal / (tenure_years * 12)
+    
+    yearly_schedule = []
+    remaining_balance = principal
+    total_principal_paid = 0
+    
+    month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
+                   'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+    
+    for year in range(tenure_years):
+        current_year = start_year + year
+        year_principal = 0
+        year_interest = 0
+        year_payments = 0
+        monthly_data = []
+        
+        # Calculate 12 months for each year
+        for month_idx in range(12):
+            month_name = month_names[month_idx]
+            
+            year_principal += principal_per_payment
+            year_interest += interest_per_payment
+            year_payments += flat_emi
+            
+            remaining_balance -= principal_per_payment
+            total_principal_paid += principal_per_payment
+            
+            # Calculate loan paid percentage for this month
+            loan_paid_percentage = ((principal - remaining_balance) / principal) * 100
+            
+            # Store monthly data
+            monthly_data.append({
+                'month': month_name,
+                'principal': round(principal_per_payment, 2),
+                'interest': round(interest_per_payment, 2),
+                'total_payment': round(flat_emi, 2),
+                'balance': round(max(0, remaining_balance), 2),
+                'loan_paid_percentage': round(loan_paid_percentage, 2)
+            })
+        
+        # Calculate loan paid percentage for the year
+        loan_paid_percentage = ((principal - remaining_balance) / principal) * 100
+        
+        yearly_schedule.append({
+            'year': current_year,
+            'principal': round(year_principal, 2),
+            'interest': round(year_interest, 2),
+            'total_payment': round(year_payments, 2),
+            'balance': round(max(0, remaining_balance), 2),
+            'loan_paid_percentage': round(loan_paid_percentage, 2),
+            'months_in_year': 12,
+            'monthly_data': monthly_data
+        })
+    
+    return yearly_schedule
+
+def calculate_flat_interest_rate_emi():
+    try:
+        data = request.get_json()
+        
+        loan_amount = float(data.get('loanAmount', 0))
+        interest_rate = float(data.get('interestRate', 0))
+        tenure_years = int(data.get('tenureYears', 0))
+        
+        # Calculate flat interest EMI
+        calculation = calculate_flat_interest_emi(loan_amount, interest_rate, tenure_years)
+        
+        # Generate amortization schedule
+        amortization_schedule = generate_flat_interest_amortization_schedule(
+            loan_amount, interest_rate, tenure_years
+        )
+        
+        # Generate yearly schedule with monthly breakdown
+        yearly_schedule = generate_flat_interest_yearly_schedule(
+            loan_amount, interest_rate, tenure_years
+        )
+        
+        return jsonify({
+            'status': 'success',
+            'flatEmi': calculation['flatEmi'],
+            'totalInterest': calculation['totalInterest'],
+            'totalAmount': calculation['totalAmount'],
+            'effectiveRate': calculation['effectiveRate'],
+            'loanAmount': loan_amount,
+            'amortizationSchedule': amortization_schedule,
+            'yearlyBreakdown': yearly_schedule
+        })
+    
+    except Exception as e:
+        return jsonify({'status': 'error', 'error': str(e)}), 400
+
+def calculate_reducing_loan_emi(principal, annual_rate, tenure_years):
+    """
+    Calculate reducing loan EMI using reducing balance method
+    """
+    tenure_months = tenure_years * 12
+    monthly_rate = annual_rate / (12 * 100)
+    
+    # Calculate EMI using reducing balance method
+    if monthly_rate > 0:
+        emi = principal * monthly_rate * ((1 + monthly_rate) ** tenure_months) / (((1 + monthly_rate) ** tenure_months) - 1)
+    else:
+        emi = principal / tenure_months
+    
+    # Calculate total amounts
+    total_interest = (emi * tenure_months) - principal
+    total_amount = principal + total_interest
+    
+    return {
+        'emi': round(emi, 2),
+        'totalInterest': round(total_interest, 2),
+        'totalAmount': round(total_amount, 2),
+        'principalAmount': principal
+    }
+
+def generate_reducing_loan_emi_schedule(principal, annual_rate, tenure_years, start_year=2025):
+    """
+    Generate year-wise payment schedule for reducing loan EMI
+    """
+    tenure_months = tenure_years * 12
+    monthly_rate = annual_rate / (12 * 100)
+    
+    # Calculate EMI
+    if monthly_rate > 0:
+        emi = principal * monthly_rate * ((1 + monthly_rate) ** tenure_months) / (((1 + monthly_rate) ** tenure_months) - 1)
+    else:
+        emi = principal / tenure_months
+    
+    schedule = []
+    remaining_balance = principal
+    
+    month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
+                   'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+    
+    for year in range(tenure_years):
+        current_year = start_year + year
+        year_principal = 0
+        year_interest = 0
+        year_payments = 0
+        monthly_data = []
+        
+        # Calculate 12 months for the year
+        for month_idx in range(12):
+            if remaining_balance <= 0:
+                break
+                
+            month_name = month_names[month_idx]
+            interest_payment = remaining_balance * monthly_rate
+            principal_payment = min(emi - interest_payment, remaining_balance)
+            
+            # Adjust EMI if it's the last payment
+            if remaining_balance < emi:
+                actual_emi = remaining_balance + interest_payment
+            else:
+                actual_emi = emi
+            
+            year_principal += principal_payment
+            year_interest += interest_payment
+            year_payments += actual_emi
+            
+            remaining_balance -= principal_payment
+            
+            # Calculate loan paid percentage for this month
+            loan_paid_percentage = ((principal - remaining_balance) / principal) * 100
+            
+            # Store monthly data
+            monthly_data.append({
+                'month': month_name,
+                'principal': round(principal_payment, 2),
+                'interest': round(interest_payment, 2),
+                'emi': round(actual_emi, 2),
+                'balance': round(max(0, remaining_balance), 2),
+                'loan_paid_percentage': round(loan_paid_percentage, 2)
+            })
+        
+        # Calculate loan paid percentage for the year
+        loan_paid_percentage = ((principal - remaining_balance) / principal) * 100
+        
+        schedule.append({
+            'year': current_year,
+            'principal': round(year_principal, 2),
+            'interest': round(year_interest, 2),
+            'total_payment': round(year_payments, 2),
+            'balance': round(max(0, remaining_balance), 2),
+            'loan_paid_percentage': round(loan_paid_percentage, 2),
+            'emi': round(emi, 2),
+            'months_in_year': len(monthly_data),
+            'monthly_data': monthly_data
+        })
+        
+        # Stop if loan is fully paid
+        if remaining_balance <= 0:
+            break
+    
+    return schedule
+
+def calculate_reducing_loan_emi_route():
+    try:
+        data = request.get_json()
+        
+        loan_amount = float(data.get('loanAmount', 0))
+        interest_rate = float(data.get('interestRate', 0))
+        tenure_years = int(data.get('tenureYears', 0))
+        
+        # Calculate reducing loan EMI
+        calculation = calculate_reducing_loan_emi(
+            loan_amount, interest_rate, tenure_years
+        )
+        
+        # Generate payment schedule
+        payment_schedule = generate_reducing_loan_emi_schedule(
+            loan_amount, interest_rate, tenure_years
+        )
+        
+        return jsonify({
+            'status': 'success',
+            'emi': calculation['emi'],
+            'totalInterest': calculation['totalInterest'],
+            'totalAmount': calculation['totalAmount'],
+            'principalAmount': calculation['principalAmount'],
+            'loanAmount': loan_amount,
+            'paymentSchedule': payment_schedule
+        })
+    
+    except Exception as e:
+        return jsonify({'status': 'error', 'error': str(e)}), 400
+
+def calculate_reducing_balance_emi(principal, annual_rate, tenure_years):
+    """
+    Calculate reducing balance EMI - standard EMI calculation where interest 
+    is charged on the outstanding (reducing) balance
+    """
+    tenure_months = tenure_years * 12
+    monthly_rate = annual_rate / (12 * 100)
+    
+    if monthly_rate == 0:
+        emi = principal / tenure_months
+        total_interest = 0
+        total_amount = principal
+    else:
+        # Standard EMI formula for reducing balance
+        emi = principal * monthly_rate * ((1 + monthly_rate) ** tenure_months) / (((1 + monthly_rate) ** tenure_months) - 1)
+        total_amount = emi * tenure_months
+        total_interest = total_amount - principal
+    
+    return {
+        'emi': round(emi, 2),
+        'principalAmount': principal,
+        'totalInterest': round(total_interest, 2),
+        'totalAmount': round(total_amount, 2),
+        'tenureMonths': tenure_months
+    }
+
+def generate_reducing_balance_emi_schedule(principal, annual_rate, tenure_years, start_year=2025):
+    """
+    Generate year-wise amortization schedule with monthly breakdown for reducing balance EMI
+    """
+    calculation = calculate_reducing_balance_emi(principal, annual_rate, tenure_years)
+    emi = calculation['emi']
+    tenure_months = calculation['tenureMonths']
+    monthly_rate = annual_rate / (12 * 100)
+    
+    yearly_schedule = []
+    remaining_balance = principal
+    current_year = start_year
+    month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
+                   'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+    
+    total_months_processed = 0
+    current_month = 0  # Start from January
+    
+    while total_months_processed < tenure_months:
+        year_principal = 0
+        year_interest = 0
+        year_payments = 0
+        monthly_data = []
+        opening_balance_year = remaining_balance
+        
+        # Calculate months for this year
+        months_remaining_in_year = 12 - current_month
+        months_to_process = min(months_remaining_in_year, tenure_months - total_months_processed)
+        
+        for month_idx in range(months_to_process):
+            if total_months_processed >= tenure_months:
+                break
+                
+            total_months_processed += 1
+            
+            # Calculate interest and principal for this month
+            interest_payment = remaining_balance * monthly_rate
+            principal_payment = emi - interest_payment
+            
+            # Ensure we don't pay more principal than remaining
+            if principal_payment > remaining_balance:
+                principal_payment = remaining_balance
+                interest_payment = emi - principal_payment
+            
+            year_principal += principal_payment
+            year_interest += interest_payment
+            year_payments += emi
+            
+            remaining_balance -= principal_payment
+            
+            # Get the correct month name
+            month_name = month_names[(current_month + month_idx) % 12]
+            
+            # Store monthly data
+            monthly_data.append({
+                'month': month_name,
+                'emi': round(emi, 2),
+                'principal': round(principal_payment, 2),
+                'interest': round(interest_payment, 2),
+                'balance': round(max(0, remaining_balance), 2),
+                'openingBalance': round(remaining_balance + principal_payment, 2)
+            })
+        
+        yearly_schedule.append({
+            'year': current_year,
+            'openingBalance': round(opening_balance_year, 2),
+            'emiPaid': round(year_payments, 2),
+            'principalPaid': round(year_principal, 2),
+            'interestPaid': round(year_interest, 2),
+            'closingBalance': round(max(0, remaining_balance), 2),
+            'months_in_year': months_to_process,
+            'monthly_data': monthly_data
+        })
+        
+        # Move to next year
+        current_year += 1
+        current_month = 0  # Start from January for subsequent years
+        
+        # Stop if loan is fully paid
+        if remaining_balance <= 0:
+            break
+    
+    return yearly_schedule
+
+def calculate_reducing_balance_emi_route():
+    try:
+        data = request.get_json()
+        
+        loan_amount = float(data.get('loanAmount', 0))
+        interest_rate = float(data.get('interestRate', 0))
+        tenure_years = int(data.get('tenureYears', 0))
+        
+        # Calculate reducing balance EMI
+        calculation = calculate_reducing_balance_emi(loan_amount, interest_rate, tenure_years)
+        
+        # Generate yearly schedule with monthly breakdown
+        yearly_schedule = generate_reducing_balance_emi_schedule(
+            loan_amount, interest_rate, tenure_years, 2025
+        )
+        
+        return jsonify({
+            'status': 'success',
+            'emi': calculation['emi'],
+            'principalAmount': calculation['principalAmount'],
+            'totalInterest': calculation['totalInterest'],
+            'totalAmount': calculation['totalAmount'],
+            'balanceSchedule': yearly_schedule
+        })
+    
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'error': str(e)
+        }), 400
+
+def calculate_reducing_rate_emi(principal, initial_rate, reduced_rate, transition_year, tenure_years):
+    """
+    Calculate reducing rate EMI - where interest rate reduces after a certain period
+    """
+    tenure_months = tenure_years * 12
+    transition_month = transition_year * 12
+    
+    # Phase 1: Initial rate period
+    initial_monthly_rate = initial_rate / (12 * 100)
+    
+    if initial_monthly_rate == 0:
+        phase1_emi = principal / tenure_months
+    else:
+        # Standard EMI formula for entire tenure at initial rate
+        phase1_emi = principal * initial_monthly_rate * ((1 + initial_monthly_rate) ** tenure_months) / (((1 + initial_monthly_rate) ** tenure_months) - 1)
+    
+    # Calculate remaining balance after transition period
+    remaining_principal = principal
+    total_interest_phase1 = 0
+    
+    for month in range(min(transition_month, tenure_months)):
+        interest_payment = remaining_principal * initial_monthly_rate
+        principal_payment = phase1_emi - interest_payment
+        remaining_principal -= principal_payment
+        total_interest_phase1 += interest_payment
+    
+    # Phase 2: Reduced rate period (if any months remaining)
+    phase2_emi = 0
+    total_interest_phase2 = 0
+    remaining_months = tenure_months - transition_month
+    
+    if remaining_months > 0 and remaining_principal > 0:
+        reduced_monthly_rate = reduced_rate / (12 * 100)
+        
+        if reduced_monthly_rate == 0:
+            phase2_emi = remaining_principal / remaining_months
+        else:
+            # EMI for remaining balance at reduced rate
+            phase2_emi = remaining_principal * reduced_monthly_rate * ((1 + reduced_monthly_rate) ** remaining_months) / (((1 + reduced_monthly_rate) ** remaining_months) - 1)
+        
+        # Calculate interest for phase 2
+        temp_balance = remaining_principal
+        for month in range(remaining_months):
+            interest_payment = temp_balance * reduced_monthly_rate
+            principal_payment = phase2_emi - interest_payment
+            temp_balance -= principal_payment
+            total_interest_phase2 += interest_payment
+    
+    total_interest = total_interest_phase1 + total_interest_phase2
+    total_amount = principal + total_interest
+    
+    # Calculate weighted average EMI
+    if transition_month >= tenure_months:
+        avg_emi = phase1_emi
+    else:
+        avg_emi = ((phase1_emi * transition_month) + (phase2_emi * remaining_months)) / tenure_months
+    
+    return {
+        'phase1Emi': round(phase1_emi, 2),
+        'phase2Emi': round(phase2_emi, 2),
+        'avgEmi': round(avg_emi, 2),
+        'principalAmount': principal,
+        'totalInterest': round(total_interest, 2),
+        'totalAmount': round(total_amount, 2),
+        'tenureMonths': tenure_months,
+        'transitionMonth': transition_month,
+        'remainingBalanceAtTransition': round(remaining_principal, 2),
+        'phase1Interest': round(total_interest_phase1, 2),
+        'phase2Interest': round(total_interest_phase2, 2)
+    }
+
+def generate_reducing_rate_emi_schedule(principal, initial_rate, reduced_rate, transition_year, tenure_years, start_year=2025):
+    """
+    Generate year-wise amortization schedule with monthly breakdown for reducing rate EMI
+    """
+    calculation = calculate_reducing_rate_emi(principal, initial_rate, reduced_rate, transition_year, tenure_years)
+    tenure_months = calculation['tenureMonths']
+    transition_month = calculation['transitionMonth']
+    
+    yearly_schedule = []
+    remaining_balance = principal
+    current_year = start_year
+    month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
+                   'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+    
+    total_months_processed = 0
+    current_month = 0  # Start from January
+    
+    while total_months_processed < tenure_months:
+        year_principal = 0
+        year_interest = 0
+        year_payments = 0
+        monthly_data = []
+        opening_balance_year = remaining_balance
+        
+        # Calculate months for this year
+        months_remaining_in_year = 12 - current_month
+        months_to_process = min(months_remaining_in_year, tenure_months - total_months_processed)
+        
+        for month_idx in range(months_to_process):
+            if total_months_processed >= tenure_months:
+                break
+                
+            total_months_processed += 1
+            
+            # Determine which phase we're in
+            if total_months_processed <= transition_month:
+                # Phase 1: Initial rate
+                monthly_rate = initial_rate / (12 * 100)
+                current_emi = calculation['phase1Emi']
+                rate_type = "Initial"
+            else:
+                # Phase 2: Reduced rate
+                monthly_rate = reduced_rate / (12 * 100)
+                current_emi = calculation['phase2Emi']
+                rate_type = "Reduced"
+            
+            # Calculate interest and principal for this month
+            interest_payment = remaining_balance * monthly_rate
+            principal_payment = current_emi - interest_payment
+            
+            # Ensure we don't pay more principal than remaining
+            if principal_payment > remaining_balance:
+                principal_payment = remaining_balance
+                interest_payment = current_emi - principal_payment
+            
+            year_principal += principal_payment
+            year_interest += interest_payment
+            year_payments += current_emi
+            
+            remaining_balance -= principal_payment
+            
+            # Get the correct month name
+            month_name = month_names[(current_month + month_idx) % 12]
+            
+            # Store monthly data
+            monthly_data.append({
+                'month': month_name,
+                'emi': round(current_emi, 2),
+                'principal': round(principal_payment, 2),
+                'interest': round(interest_payment, 2),
+                'balance': round(max(0, remaining_balance), 2),
+                'openingBalance': round(remaining_balance + principal_payment, 2),
+                'rateType': rate_type,
+                'currentRate': initial_rate if total_months_processed <= transition_month else reduced_rate
+            })
+        
+        yearly_schedule.append({
+            'year': current_year,
+            'openingBalance': round(opening_balance_year, 2),
+            'emiPaid': round(year_payments, 2),
+            'principalPaid': round(year_principal, 2),
+            'interestPaid': round(year_interest, 2),
+            'closingBalance': round(max(0, remaining_balance), 2),
+            'months_in_year': months_to_process,
+            'monthly_data': monthly_data
+        })
+        
+        # Move to next year
+        current_year += 1
+        current_month = 0  # Start from January for subsequent years
+        
+        # Stop if loan is fully paid
+        if remaining_balance <= 0:
+            break
+    
+    return yearly_schedule
+
+def calculate_reducing_rate_emi_route():
+    try:
+        data = request.get_json()
+        
+        loan_amount = float(data.get('loanAmount', 0))
+        initial_rate = float(data.get('initialRate', 0))
+        reduced_rate = float(data.get('reducedRate', 0))
+        transition_year = int(data.get('transitionYear', 0))
+        tenure_years = int(data.get('tenureYears', 0))
+        
+        # Calculate reducing rate EMI
+        calculation = calculate_reducing_rate_emi(loan_amount, initial_rate, reduced_rate, transition_year, tenure_years)
+        
+        # Generate yearly schedule with monthly breakdown
+        yearly_schedule = generate_reducing_rate_emi_schedule(
+            loan_amount, initial_rate, reduced_rate, transition_year, tenure_years, 2025
+        )
+        
+        return jsonify({
+            'status': 'success',
+            'phase1Emi': calculation['phase1Emi'],
+            'phase2Emi': calculation['phase2Emi'],
+            'avgEmi': calculation['avgEmi'],
+            'principalAmount': calculation['principalAmount'],
+            'totalInterest': calculation['totalInterest'],
+            'totalAmount': calculation['totalAmount'],
+            'remainingBalanceAtTransition': calculation['remainingBalanceAtTransition'],
+            'phase1Interest': calculation['phase1Interest'],
+            'phase2Interest': calculation['phase2Interest'],
+            'balanceSchedule': yearly_schedule
+        })
+    
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'error': str(e)
+        }), 400
+
+def calculate_no_cost_emi(mrp_price, tenure_months, regular_interest_rate):
+    """
+    Calculate No Cost EMI analysis - shows what inflated price would be needed for true "no cost" EMI
+    """
+    # Regular EMI calculation (compound interest)
+    monthly_rate = regular_interest_rate / (12 * 100)
+    if monthly_rate > 0:
+        regular_emi = (mrp_price * monthly_rate * ((1 + monthly_rate) ** tenure_months)) / (((1 + monthly_rate) ** tenure_months) - 1)
+    else:
+        regular_emi = mrp_price / tenure_months
+    
+    # No Cost EMI is same as Regular EMI (that's the "trick")
+    no_cost_emi = regular_emi
+    
+    # Calculate what the inflated price would need to be
+    inflated_price = no_cost_emi * tenure_months
+    
+    # Calculate totals
+    regular_total = regular_emi * tenure_months
+    no_cost_total = inflated_price
+    
+    # Hidden markup calculation
+    hidden_markup = inflated_price - mrp_price
+    
+    # Effective interest rate calculation
+    # This represents the hidden interest rate embedded in the price inflation
+    if hidden_markup > 0 and mrp_price > 0:
+        # Calculate the annualized rate of the hidden markup
+        years = tenure_months / 12
+        effective_rate = ((inflated_price / mrp_price) ** (1 / years) - 1) * 100
+    else:
+        effective_rate = 0
+    
+    # Since no-cost EMI and regular EMI have same monthly payment, they are equivalent
+    better_option = 'Both are equivalent'
+    savings = 0
+    
+    return {
+        'noCostEmi': round(no_cost_emi, 2),
+        'regularEmi': round(regular_emi, 2),
+        'hiddenCost': round(hidden_markup, 2),
+        'effectiveRate': round(effective_rate, 2),
+        'inflatedPrice': round(inflated_price, 2),
+        'betterOption': better_option,
+        'savings': round(savings, 2),
+        'mrpPrice': mrp_price,
+        'noCostPrice': round(inflated_price, 2),
+        'processingFee': 0,
+        'regularTotal': round(regular_total, 2),
+        'noCostTotal': round(no_cost_total, 2)
+    }
+
+def generate_no_cost_emi_payment_schedule(inflated_price, tenure_months):
+    """
+    Generate payment schedule for No Cost EMI
+    """
+    total_amount = inflated_price
+    emi_amount = total_amount / tenure_months
+    
+    schedule = []
+    outstanding_balance = total_amount
+    
+    for month in range(1, tenure_months + 1):
+        outstanding_balance -= emi_amount
+        
+        schedule.append({
+            'month': month,
+            'emiAmount': round(emi_amount, 2),
+            'outstandingBalance': round(max(0, outstanding_balance), 2),
+            'paymentStatus': 'Pending'
+        })
+    
+    return schedule
+
+def calculate_no_cost_emi_route():
+    try:
+        data = request.get_json()
+        
+        mrp_price = float(data.get('mrpPrice', 0))
+        tenure_months = int(data.get('tenureMonths', 0))
+        interest_rate = float(data.get('interestRate', 12.0))
+        
+        # Calculate no cost EMI
+        calculation = calculate_no_cost_emi(mrp_price, tenure_months, interest_rate)
+        
+        # Generate payment schedule
+        payment_schedule = generate_no_cost_emi_payment_schedule(calculation['inflatedPrice'], tenure_months)
+        
+        return jsonify({
+            'status': 'success',
+            'noCostEmi': calculation['noCostEmi'],
+            'regularEmi': calculation['regularEmi'],
+            'hiddenCost': calculation['hiddenCost'],
+            'effectiveRate': calculation['effectiveRate'],
+            'inflatedPrice': calculation['inflatedPrice'],
+            'betterOption': calculation['betterOption'],
+            'savings': calculation['savings'],
+            'mrpPrice': calculation['mrpPrice'],
+            'noCostPrice': calculation['noCostPrice'],
+            'processingFee': 0,
+            'regularTotal': calculation['regularTotal'],
+            'noCostTotal': calculation['noCostTotal'],
+            'paymentSchedule': payment_schedule
+        })
+    
+    except Exception as e:
+        return jsonify({'status': 'error', 'error': str(e)}), 400
+
+def calculate_bullet_emi(total_amount, down_payment, actual_loan_amount, annual_rate, tenure_years):
+    """
+    Calculate Bullet EMI - Interest-only payments with principal due at end
+    """
+    # Monthly interest rate
+    monthly_rate = annual_rate / (12 * 100)
+    total_months = tenure_years * 12
+    
+    # Monthly interest payment (only interest, no principal) - based on actual loan amount
+    monthly_interest = actual_loan_amount * monthly_rate
+    
+    # Monthly EMI (same as monthly interest in bullet EMI) - based on actual loan amount
+    monthly_emi = monthly_interest  # In bullet EMI, EMI = Interest payment only
+    
+    # Total interest over the tenure
+    total_interest = monthly_interest * total_months
+    
+    # Total amount payable (loan + interest, excluding down payment)
+    total_payable = actual_loan_amount + total_interest
+    
+    # Calculate what the regular EMI would be for the Total Amount Payable
+    if monthly_rate > 0:
+        regular_emi_for_total = (total_payable * monthly_rate * (1 + monthly_rate) ** total_months) / ((1 + monthly_rate) ** total_months - 1)
+    else:
+        regular_emi_for_total = total_payable / total_months if total_months > 0 else 0
+    
+    return {
+        'monthlyEmi': round(monthly_emi, 2),
+        'monthlyInterest': round(monthly_interest, 2),
+        'totalInterest': round(total_interest, 2),
+        'totalPayable': round(total_payable, 2),
+        'regularEmiForTotal': round(regular_emi_for_total, 2),
+        'actualLoanAmount': actual_loan_amount,
+        'downPayment': down_payment,
+        'totalAmount': total_amount,
+        'tenureYears': tenure_years
+    }
+
+def generate_bullet_emi_payment_schedule(actual_loan_amount, annual_rate, tenure_years, start_year=2025):
+    """
+    Generate year-wise payment schedule for bullet EMI
+    """
+    monthly_rate = annual_rate / (12 * 100)
+    monthly_interest = actual_loan_amount * monthly_rate
+    
+    payment_schedule = []
+    
+    for year in range(tenure_years):
+        current_year = start_year + year
+        
+        # For all years except the last, only interest payments
+        if year < tenure_years - 1:
+            interest_payment = monthly_interest * 12
+            principal_payment = 0
+            total_payment = interest_payment
+            outstanding_principal = actual_loan_amount
+            loan_paid_percentage = 0
+        else:
+            # Final year: interest payments + principal repayment
+            interest_payment = monthly_interest * 12
+            principal_payment = actual_loan_amount
+            total_payment = interest_payment + principal_payment
+            outstanding_principal = 0
+            loan_paid_percentage = 100
+        
+        payment_schedule.append({
+            'year': current_year,
+            'interestPayment': round(interest_payment, 2),
+            'principalPayment': round(principal_payment, 2),
+            'totalPayment': round(total_payment, 2),
+            'outstandingPrincipal': round(outstanding_principal, 2),
+            'loanPaidPercentage': round(loan_paid_percentage, 2)
+        })
+    
+    return payment_schedule
+
+def calculate_bullet_emi_route():
+    try:
+        data = request.get_json()
+        
+        total_amount = float(data.get('totalAmount', 0))
+        down_payment = float(data.get('downPayment', 0))
+        actual_loan_amount = float(data.get('actualLoanAmount', 0))
+        interest_rate = float(data.get('interestRate', 0))
+        tenure_years = int(data.get('tenureYears', 0))
+        
+        # Validate that actual loan amount is positive
+        if actual_loan_amount <= 0:
+            return jsonify({
+                'status': 'error', 
+                'error': 'Loan amount must be greater than zero. Please reduce down payment or increase total amount.'
+            }), 400
+        
+        # Calculate bullet EMI
+        calculation = calculate_bullet_emi(
+            total_amount, down_payment, actual_loan_amount, interest_rate, tenure_years
+        )
+        
+        # Generate payment schedule
+        payment_schedule = generate_bullet_emi_payment_schedule(
+            actual_loan_amount, interest_rate, tenure_years
+        )
+        
+        return jsonify({
+            'status': 'success',
+            'monthlyEmi': calculation['monthlyEmi'],
+            'monthlyInterest': calculation['monthlyInterest'],
+            'totalInterest': calculation['totalInterest'],
+            'totalPayable': calculation['totalPayable'],
+            'regularEmiForTotal': calculation['regularEmiForTotal'],
+            'actualLoanAmount': actual_loan_amount,
+            'downPayment': down_payment,
+            'totalAmount': total_amount,
+            'paymentSchedule': payment_schedule
+        })
+    
+    except Exception as e:
+        return jsonify({'status': 'error', 'error': str(e)}), 400
+
+def calculate_reverse_emi_loan_amount(target_emi, annual_rate, tenure_years):
+    """
+    Calculate maximum loan amount based on target EMI
+    """
+    tenure_months = tenure_years * 12
+    monthly_rate = annual_rate / (12 * 100)
+    
+    if monthly_rate == 0:
+        # If interest rate is 0, loan amount = EMI * tenure
+        loan_amount = target_emi * tenure_months
+    else:
+        # Using EMI formula: EMI = P * r * (1+r)^n / ((1+r)^n - 1)
+        # Solving for P: P = EMI * ((1+r)^n - 1) / (r * (1+r)^n)
+        power_term = (1 + monthly_rate) ** tenure_months
+        loan_amount = target_emi * (power_term - 1) / (monthly_rate * power_term)
+    
+    total_payment = target_emi * tenure_months
+    total_interest = total_payment - loan_amount
+    
+    return {
+        'loanAmount': round(loan_amount, 2),
+        'targetEmi': round(target_emi, 2),
+        'totalInterest': round(total_interest, 2),
+        'totalAmount': round(total_payment, 2),
+        'tenureMonths': tenure_months,
+        'interestRate': annual_rate
+    }
+
+def generate_reverse_emi_yearly_schedule(loan_amount, annual_rate, tenure_years, target_emi, start_year=2025):
+    """
+    Generate year-wise amortization schedule for reverse EMI calculation
+    """
+    monthly_rate = annual_rate / (12 * 100)
+    
+    yearly_schedule = []
+    remaining_principal = loan_amount
+    current_year = start_year
+    month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
+                   'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+    
+    total_months_processed = 0
+    current_month = 0  # Start from January
+    tenure_months = tenure_years * 12
+    
+    while total_months_processed < tenure_months:
+        year_principal = 0
+        year_interest = 0
+        year_payments = 0
+        monthly_data = []
+        
+        # Calculate months for this year
+        months_remaining_in_year = 12 - current_month
+        months_to_process = min(months_remaining_in_year, tenure_months - total_months_processed)
+        
+        for month_idx in range(months_to_process):
+            if total_months_processed >= tenure_months:
+                break
+                
+            total_months_processed += 1
+            
+            if monthly_rate == 0:
+                interest_payment = 0
+                principal_payment = target_emi
+            else:
+                interest_payment = remaining_principal * monthly_rate
+                principal_payment = target_emi - interest_payment
+            
+            year_principal += principal_payment
+            year_interest += interest_payment
+            year_payments += target_emi
+            
+            remaining_principal -= principal_payment
+            
+            # Calculate loan paid percentage for this month
+            loan_paid_percentage = ((loan_amount - remaining_principal) / loan_amount) * 100
+            
+            # Get the correct month name
+            month_name = month_names[(current_month + month_idx) % 12]
+            
+            # Store monthly data
+            monthly_data.append({
+                'month': month_name,
+                'principal': round(principal_payment, 2),
+                'interest': round(interest_payment, 2),
+                'total_payment': round(target_emi, 2),
+                'balance': round(max(0, remaining_principal), 2),
+                'loan_paid_percentage': round(loan_paid_percentage, 2)
+            })
+        
+        # Calculate loan paid percentage for the year
+        loan_paid_percentage = ((loan_amount - remaining_principal) / loan_amount) * 100
+        
+        yearly_schedule.append({
+            'year': current_year,
+            'principal': round(year_principal, 2),
+            'interest': round(year_interest, 2),
+            'total_payment': round(year_payments, 2),
+            'balance': round(max(0, remaining_principal), 2),
+            'loan_paid_percentage': round(loan_paid_percentage, 2),
+            'months_in_year': months_to_process,
+            'monthly_data': monthly_data
+        })
+        
+        # Move to next year
+        current_year += 1
+        current_month = 0  # Start from January for subsequent years
+        
+        # Stop if loan is fully paid
+        if remaining_principal <= 0:
+            break
+    
+    return yearly_schedule
+
+def calculate_reverse_emi():
+    try:
+        data = request.get_json()
+        
+        target_emi = float(data.get('targetEmi', 0))
+        interest_rate = float(data.get('interestRate', 0))
+        tenure_years = int(data.get('tenureYears', 0))
+        
+        # Calculate reverse EMI
+        calculation = calculate_reverse_emi_loan_amount(target_emi, interest_rate, tenure_years)
+        
+        # Generate yearly breakdown
+        yearly_breakdown = generate_reverse_emi_yearly_schedule(
+            calculation['loanAmount'], 
+            interest_rate, 
+            tenure_years, 
+            target_emi
+        )
+        
+        return jsonify({
+            'status': 'success',
+            'loanAmount': calculation['loanAmount'],
+            'targetEmi': calculation['targetEmi'],
+            'totalInterest': calculation['totalInterest'],
+            'totalAmount': calculation['totalAmount'],
+            'interestRate': interest_rate,
+            'tenureYears': tenure_years,
+            'yearlyBreakdown': yearly_breakdown
+        })
+    
+    except Exception as e:
+        return jsonify({'status': 'error', 'error': str(e)}), 400
+
+def calculate_home_loan():
+    try:
+        data = request.get_json()
+        
+        # Home loan details
+        home_value = float(data.get('homeValue', 0))
+        down_payment = float(data.get('downPayment', 0))
+        loan_insurance = float(data.get('loanInsurance', 0))
+        interest_rate = float(data.get('interestRate', 0))
+        tenure_years = int(data.get('tenureYears', 0))
+        tenure_months = int(data.get('tenureMonths', 0))
+        loan_fees = float(data.get('loanFees', 0))
+        
+        # Homeowner expenses
+        one_time_expenses = float(data.get('oneTimeExpenses', 0))
+        property_taxes_annual = float(data.get('propertyTaxes', 0))
+        home_insurance_annual = float(data.get('homeInsurance', 0))
+        maintenance_monthly = float(data.get('maintenance', 0))
+        
+        # Prepayments
+        monthly_prepayment = float(data.get('monthlyPrepayment', 0))
+        yearly_prepayment = float(data.get('yearlyPrepayment', 0))
+        
+        # Calculate loan amount
+        loan_amount = home_value + loan_insurance - down_payment
+        
+        # Calculate EMI
+        total_months = (tenure_years * 12) + tenure_months
+        monthly_rate = interest_rate / (12 * 100)
+        
+        if monthly_rate > 0 and total_months > 0:
+            emi = (loan_amount * monthly_rate * (1 + monthly_rate) ** total_months) / ((1 + monthly_rate) ** total_months - 1)
+        else:
+            emi = loan_amount / total_months if total_months > 0 else 0
+        
+        # Calculate monthly expenses
+        monthly_property_tax = property_taxes_annual / 12
+        monthly_home_insurance = home_insurance_annual / 12
+        total_monthly_payment = emi + monthly_property_tax + monthly_home_insurance + maintenance_monthly
+        
+        # Calculate totals
+        total_down_payment = down_payment + loan_fees + one_time_expenses
+        total_interest = (emi * total_months) - loan_amount
+        total_taxes_insurance = (property_taxes_annual + home_insurance_annual) * tenure_years + (maintenance_monthly * total_months)
+        grand_total = total_down_payment + loan_amount + total_interest + total_taxes_insurance
+        
+        # Generate payment schedule
+        payment_schedule = generate_home_loan_schedule(
+            loan_amount, monthly_rate, total_months, emi,
+            monthly_property_tax, monthly_home_insurance, maintenance_monthly
+        )
+        
+        return jsonify({
+            'emi': round(emi, 2),
+            'monthlyPropertyTax': round(monthly_property_tax, 2),
+            'monthlyHomeInsurance': round(monthly_home_insurance, 2),
+            'monthlyMaintenance': round(maintenance_monthly, 2),
+            'totalMonthlyPayment': round(total_monthly_payment, 2),
+            'totalDownPayment': round(total_down_payment, 2),
+            'totalPrincipal': round(loan_amount, 2),
+            'totalInterest': round(total_interest, 2),
+            'totalTaxesInsurance': round(total_taxes_insurance, 2),
+            'grandTotal': round(grand_total, 2),
+            'paymentSchedule': payment_schedule
+        })
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+def generate_home_loan_schedule(loan_amount, monthly_rate, total_months, emi, 
+                               monthly_property_tax, monthly_home_insurance, maintenance_monthly):
+    interest, principal_paid, balance = amortization.amortize(loan_amount, monthly_rate, total_months, emi, clamp=True)
+    
+    starts = amortization.year_starts(total_months)
+    ends = amortization.year_ends(starts, total_months)
+    yearly_taxes = (monthly_property_tax + monthly_home_insurance + maintenance_monthly) * 12
+    
+    yearly_principal = amortization.yearly_sums(principal_paid, starts)
+    yearly_interest = amortization.yearly_sums(interest, starts)
+    year_end_balance = balance[ends]
+    if loan_amount > 0:
+        loan_paid_percentage = amortization.paid_percentage(loan_amount, year_end_balance)
+    else:
+        # Down payment covers the home value: nothing is borrowed or repaid
+        loan_paid_percentage = np.zeros(len(ends))
+    
+    schedule = []
+    for year_idx, (principal_sum, interest_sum, remaining, paid) in enumerate(zip(
+        amortization.rounded(yearly_principal),
+        amortization.rounded(yearly_interest),
+        amortization.rounded(year_end_balance),
+        amortization.rounded(loan_paid_percentage, 1)
+    )):
+        schedule.append({
+            'year': 2025 + year_idx,  # Starting from 2025
+            'principal': principal_sum,
+            'interest': interest_sum,
+            'taxes': round(yearly_taxes, 2),
+            'totalPayment': round(float(yearly_principal[year_idx] + yearly_interest[year_idx]) + yearly_taxes, 2),
+            'balance': remaining,
+            'loanPaidPercentage': paid
+        })
+    
+    return schedule
+
+def calculate_home_loan_eligibility():
+    try:
+        data = request.get_json()
+        
+        gross_income = float(data.get('grossIncome', 0))
+        tenure = int(data.get('tenure', 0))
+        interest_rate = float(data.get('interestRate', 0))
+        other_emis = float(data.get('otherEmis', 0))
+        emi_scheme = data.get('emiScheme', 'arrears')
+        
+        # FOIR (Fixed Obligation to Income Ratio) - typically 40%
+        foir_limit = 0.40
+        
+        # Available income for EMI after existing EMIs
+        available_income = (gross_income * foir_limit) - other_emis
+        
+        if available_income <= 0:
+            return jsonify({
+                'maxLoanAmount': 0,
+                'monthlyEmi': 0,
+                'foirRatio': round((other_emis / gross_income) * 100, 2),
+                'availableIncome': 0,
+                'totalInterest': 0,
+                'totalAmount': 0,
+                'yearlySchedule': []
+            })
+        
+        # Calculate EMI parameters
+        monthly_rate = interest_rate / (12 * 100)
+        total_months = tenure * 12
+        
+        # Calculate maximum loan amount using reverse EMI formula
+        if monthly_rate > 0:
+            max_loan_amount = available_income * (((1 + monthly_rate) ** total_months) - 1) / (monthly_rate * ((1 + monthly_rate) ** total_months))
+            
+            # Adjust for EMI in advance
+            if emi_scheme == 'advance':
+                max_loan_amount = max_loan_amount * (1 + monthly_rate)
+        else:
+            max_loan_amount = available_income * total_months
+        
+        # Calculate totals
+        total_interest = (available_income * total_months) - max_loan_amount
+        total_amount = max_loan_amount + total_interest
+        foir_ratio = ((available_income + other_emis) / gross_income) * 100
+        
+        # Generate yearly schedule
+        yearly_schedule = calculate_eligibility_yearly_schedule(
+            max_loan_amount, monthly_rate, total_months, available_income, other_emis, gross_income
+        )
+        
+        return jsonify({
+            'maxLoanAmount': round(max_loan_amount, 2),
+            'monthlyEmi': round(available_income, 2),
+            'foirRatio': round(foir_ratio, 2),
+            'availableIncome': round(available_income, 2),
+            'totalInterest': round(total_interest, 2),
+            'totalAmount': round(total_amount, 2),
+            'yearlySchedule': yearly_schedule
+        })
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+def generate_affordability_schedule(loan_amount, monthly_rate, total_months, emi):
+    """
+    Generate yearly and monthly payment schedule for affordability calculator
+    """
+    current_year = 2025
+    
+    interest, principal_paid, balance = amortization.amortize(loan_amount, monthly_rate, total_months, emi, clamp=True)
+    paid_months = amortization.active_periods(balance)
+    loan_paid_percentage = amortization.paid_percentage(loan_amount, balance)
+    
+    starts = amortization.year_starts(total_months)
+    ends = amortization.year_ends(starts, total_months)
+    
+    month_principal = amortization.rounded(principal_paid)
+    month_interest = amortization.rounded(interest)
+    month_balance = amortization.rounded(balance)
+    month_paid = amortization.rounded(loan_paid_percentage)
+    year_principal = amortization.yearly_sums(principal_paid, starts)
+    year_interest = amortization.yearly_sums(interest, starts)
+    emi_rounded = round(emi, 2)
+    
+    schedule = []
+    for year_idx, (start, end) in enumerate(zip(starts.tolist(), ends.tolist())):
+        monthly_data = [{
+            'month': amortization.MONTH_NAMES[k - start],
+            'principal': month_principal[k],
+            'interest': month_interest[k],
+            'emi': emi_rounded,
+            'balance': month_balance[k],
+            'loan_paid_percentage': month_paid[k]
+        } for k in range(start, min(end + 1, paid_months))]
+        
+        schedule.append({
+            'year': current_year + year_idx,
+            'principal': round(float(year_principal[year_idx]), 2),
+            'interest': round(float(year_interest[year_idx]), 2),
+            'emi': emi_rounded,
+            'totalPayment': round(float(year_principal[year_idx] + year_interest[year_idx]), 2),
+            'balance': month_balance[end],
+            'loanPaidPercentage': round(float(loan_paid_percentage[end]), 1),
+            'monthlyData': monthly_data
+        })
+        
+        if balance[end] <= 0:
+            break
+    
+    return schedule
+
+def calculate_eligibility_yearly_schedule(loan_amount, monthly_rate, total_months, emi, other_emis, gross_income):
+    """
+    Calculate yearly schedule for loan eligibility
+    """
+    current_year = 2025
+    
+    interest, principal_paid, balance = amortization.amortize(loan_amount, monthly_rate, total_months, emi, clamp=True)
+    
+    starts = amortization.year_starts(total_months)
+    ends = amortization.year_ends(starts, total_months)
+    months_in_year = (ends - starts + 1).tolist()
+    
+    yearly_principal = amortization.yearly_sums(principal_paid, starts)
+    yearly_interest = amortization.yearly_sums(interest, starts)
+    total_emi_payments = yearly_principal + yearly_interest
+    
+    # Calculate annual payments and FOIR
+    annual_other_emis = other_emis * 12
+    total_annual_payment = total_emi_payments + annual_other_emis
+    annual_gross_income = gross_income * 12
+    foir_percentage = total_annual_payment * (100 / annual_gross_income)
+    
+    schedule = []
+    for year_idx, (start, end) in enumerate(zip(starts.tolist(), ends.tolist())):
+        # Years after the payoff month are not shown
+        if start > 0 and balance[start - 1] <= 0:
+            break
+        
+        schedule.append({
+            'year': current_year + year_idx,
+            'principal': round(float(yearly_principal[year_idx]), 2),
+            'interest': round(float(yearly_interest[year_idx]), 2),
+            'monthlyEmi': round(float(total_emi_payments[year_idx]) / months_in_year[year_idx], 2),
+            'otherEmis': round(annual_other_emis, 2),
+            'totalAnnualPayment': round(float(total_annual_payment[year_idx]), 2),
+            'balance': round(max(0, float(balance[end])), 2),
+            'foirPercentage': round(float(foir_percentage[year_idx]), 2)
+        })
+    
+    return schedule
+
+def calculate_affordability():
+    try:
+        data = request.get_json()
+        
+        gross_monthly_income = float(data.get('grossMonthlyIncome', 0))
+        other_monthly_emis = float(data.get('otherMonthlyEmis', 0))
+        desired_loan_tenure = int(data.get('desiredLoanTenure', 0))
+        rate_of_interest = float(data.get('rateOfInterest', 0))
+        my_funds = float(data.get('myFunds', 0))
+        
+        # FOIR (Fixed Obligation to Income Ratio) - typically 40%
+        foir_limit = 0.40
+        
+        # Available income for EMI after existing EMIs
+        available_income_for_emi = (gross_monthly_income * foir_limit) - other_monthly_emis
+        
+        if available_income_for_emi <= 0:
+            return jsonify({
+                'eligible_loan_amount': 0,
+                'monthly_emi': 0,
+                'property_cost_affordable': my_funds,
+                'remaining_balance_salary': gross_monthly_income - other_monthly_emis
+            })
+        
+        # Calculate loan parameters
+        monthly_rate = rate_of_interest / (12 * 100)
+        total_months = desired_loan_tenure * 12
+        
+        # Calculate maximum loan amount using reverse EMI formula
+        if monthly_rate > 0:
+            eligible_loan_amount = available_income_for_emi * (((1 + monthly_rate) ** total_months) - 1) / (monthly_rate * ((1 + monthly_rate) ** total_months))
+        else:
+            eligible_loan_amount = available_income_for_emi * total_months
+        
+        # Property cost you can afford = Loan amount + My funds
+        property_cost_affordable = eligible_loan_amount + my_funds
+        
+        # Remaining balance salary = Gross income - Other EMIs - Available EMI amount
+        remaining_balance_salary = gross_monthly_income - other_monthly_emis - available_income_for_emi
+        
+        # Calculate total interest
+        total_interest = (available_income_for_emi * total_months) - eligible_loan_amount
+        
+        # Generate payment schedule
+        payment_schedule = generate_affordability_schedule(
+            eligible_loan_amount, monthly_rate, total_months, available_income_for_emi
+        )
+        
+        return jsonify({
+            'eligible_loan_amount': round(eligible_loan_amount, 2),
+            'monthly_emi': round(available_income_for_emi, 2),
+            'property_cost_affordable': round(property_cost_affordable, 2),
+            'remaining_balance_salary': round(remaining_balance_salary, 2),
+            'total_interest': round(total_interest, 2),
+            'down_payment': round(my_funds, 2),
+            'payment_schedule': payment_schedule
+        })
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+def calculate_refinance():
+    try:
+        data = request.get_json()
+        
+        # Existing loan details (matching frontend field names)
+        existing_principal = float(data.get('existingPrincipal', 0))
+        existing_interest_rate = float(data.get('existingInterestRate', 0))
+        existing_tenure_years = int(data.get('existingTenureYears', 0))
+        
+        # New loan details
+        new_interest_rate = float(data.get('newInterestRate', 0))
+        new_tenure_years = int(data.get('newTenureYears', 0))
+        
+        # Processing fee
+        processing_fee_percent = float(data.get('processingFeePercent', 0.5))
+        processing_fee = (existing_principal * processing_fee_percent) / 100
+        
+        # Calculate existing loan details
+        existing_total_months = existing_tenure_years * 12
+        existing_monthly_rate = existing_interest_rate / (12 * 100)
+        
+        if existing_monthly_rate > 0:
+            existing_emi = (existing_principal * existing_monthly_rate * (1 + existing_monthly_rate) ** existing_total_months) / ((1 + existing_monthly_rate) ** existing_total_months - 1)
+        else:
+            existing_emi = existing_principal / existing_total_months if existing_total_months > 0 else 0
+        
+        existing_total_interest = (existing_emi * existing_total_months) - existing_principal
+        existing_total_payment = existing_principal + existing_total_interest
+        
+        # Calculate new loan details
+        new_total_months = new_tenure_years * 12
+        new_monthly_rate = new_interest_rate / (12 * 100)
+        
+        if new_monthly_rate > 0:
+            new_emi = (existing_principal * new_monthly_rate * (1 + new_monthly_rate) ** new_total_months) / ((1 + new_monthly_rate) ** new_total_months - 1)
+        else:
+            new_emi = existing_principal / new_total_months if new_total_months > 0 else 0
+        
+        new_total_interest = (new_emi * new_total_months) - existing_principal
+        new_total_payment = existing_principal + new_total_interest + processing_fee
+        
+        # Calculate savings
+        emi_savings = existing_emi - new_emi
+        interest_savings = existing_total_interest - new_total_interest
+        total_savings = existing_total_payment - new_total_payment
+        
+        # Calculate breakeven period (months to recover processing fee)
+        months_to_breakeven = 0
+        if emi_savings > 0:
+            months_to_breakeven = int(processing_fee / emi_savings) + 1
+        
+        # Generate payment schedules
+        existing_schedule = generate_refinance_schedule(existing_principal, existing_monthly_rate, existing_total_months, existing_emi)
+        new_schedule = generate_refinance_schedule(existing_principal, new_monthly_rate, new_total_months, new_emi)
+        
+        return jsonify({
+            'existingEmi': round(existing_emi, 2),
+            'existingTotalInterest': round(existing_total_interest, 2),
+            'existingTotalPayment': round(existing_total_payment, 2),
+            'newEmi': round(new_emi, 2),
+            'newTotalInterest': round(new_total_interest, 2),
+            'newTotalPayment': round(new_total_payment, 2),
+            'emiSavings': round(emi_savings, 2),
+            'interestSavings': round(interest_savings, 2),
+            'totalSavings': round(total_savings, 2),
+            'processingFee': round(processing_fee, 2),
+            'monthsToBreakeven': months_to_breakeven,
+            'existingSchedule': existing_schedule,
+            'newSchedule': new_schedule
+        })
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+def generate_refinance_schedule(principal, monthly_rate, total_months, emi):
+    """Generate yearly payment schedule for refinance calculator"""
+    interest, principal_paid, balance = amortization.amortize(principal, monthly_rate, total_months, emi, clamp=True)
+    
+    # Calculate number of years needed
+    starts = amortization.year_starts(total_months)
+    ends = amortization.year_ends(starts, total_months)
+    
+    yearly_principal = amortization.yearly_sums(principal_paid, starts)
+    yearly_interest = amortization.yearly_sums(interest, starts)
+    loan_paid_percentage = amortization.paid_percentage(principal, balance[ends])
+    
+    schedule = []
+    for year_idx, end in enumerate(ends.tolist()):
+        schedule.append({
+            'year': 2025 + year_idx,  # Starting from 2025
+            'principal': round(float(yearly_principal[year_idx]), 2),
+            'interest': round(float(yearly_interest[year_idx]), 2),
+            'totalPayment': round(float(yearly_principal[year_idx] + yearly_interest[year_idx]), 2),
+            'balance': round(max(0, float(balance[end])), 2),
+            'loanPaidPercentage': round(float(loan_paid_percentage[year_idx]), 1)
+        })
+        
+        if balance[end] <= 0:
+            break
+    
+    return schedule
+
+def generate_loan_amount_schedule(principal_amount, monthly_rate, total_months, emi, emi_in_advance=False):
+    """Generate yearly payment schedule with monthly breakdown for loan amount calculator"""
+    # For EMI in advance, first payment has no interest
+    if emi_in_advance:
+        interest, principal_paid, balance = amortization.amortize_advance(principal_amount, monthly_rate, total_months, emi, clamp=True)
+    else:
+        interest, principal_paid, balance = amortization.amortize(principal_amount, monthly_rate, total_months, emi, clamp=True)
+    paid_months = amortization.active_periods(balance)
+    loan_paid_percentage = amortization.paid_percentage(principal_amount, balance)
+    
+    # Calculate number of years needed
+    starts = amortization.year_starts(total_months)
+    ends = amortization.year_ends(starts, total_months)
+    
+    month_principal = amortization.rounded(principal_paid)
+    month_interest = amortization.rounded(interest)
+    month_total = amortization.rounded(principal_paid + interest)
+    month_balance = amortization.rounded(balance)
+    month_paid = amortization.rounded(loan_paid_percentage, 1)
+    yearly_principal = amortization.yearly_sums(principal_paid, starts)
+    yearly_interest = amortization.yearly_sums(interest, starts)
+    
+    schedule = []
+    for year_idx, (start, end) in enumerate(zip(starts.tolist(), ends.tolist())):
+        monthly_details = [{
+            'month': amortization.MONTH_NAMES[k - start],
+            'principal': month_principal[k],
+            'interest': month_interest[k],
+            'totalPayment': month_total[k],
+            'balance': month_balance[k],
+            'loanPaidPercentage': month_paid[k]
+        } for k in range(start, min(end + 1, paid_months))]
+        
+        schedule.append({
+            'year': 2025 + year_idx,  # Starting from 2025
+            'principal': round(float(yearly_principal[year_idx]), 2),
+            'interest': round(float(yearly_interest[year_idx]), 2),
+            'totalPayment': round(float(yearly_principal[year_idx] + yearly_interest[year_idx]), 2),
+            'balance': month_balance[end],
+            'loanPaidPercentage': month_paid[end],
+            'monthlyDetails': monthly_details
+        })
+    
+    return schedule
+
+def calculate_loan_amount():
+    try:
+        data = request.get_json()
+        
+        # Input values
+        emi = float(data.get('emi', 0))
+        interest_rate = float(data.get('interestRate', 0))
+        tenure_years = int(data.get('tenureYears', 0))
+        tenure_months = int(data.get('tenureMonths', 0))
+        fees_charges = float(data.get('feesCharges', 0))
+        emi_in_advance = data.get('emiScheme', 'arrears') == 'advance'
+        
+        # Calculate total tenure in months
+        total_months = (tenure_years * 12) + tenure_months
+        
+        if total_months <= 0:
+            return jsonify({'error': 'Invalid tenure'}), 400
+        
+        # Convert annual rate to monthly rate
+        monthly_rate = interest_rate / (12 * 100)
+        
+        # Calculate principal loan amount using reverse EMI formula
+        if monthly_rate > 0:
+            # For EMI in advance, adjust the EMI
+            adjusted_emi = emi
+            if emi_in_advance:
+                adjusted_emi = emi * (1 + monthly_rate)
+            
+            # Reverse EMI formula: P = EMI * [(1+r)^n - 1] / [r * (1+r)^n]
+            principal_amount = adjusted_emi * (((1 + monthly_rate) ** total_months) - 1) / (monthly_rate * ((1 + monthly_rate) ** total_months))
+        else:
+            # For zero interest rate
+            principal_amount = emi * total_months
+        
+        # Calculate APR (Annual Percentage Rate) from the IRR of the fee-adjusted cash flows
+        if principal_amount > 0 and fees_charges > 0 and principal_amount - fees_charges > 0:
+            apr = loan_apr(principal_amount, emi, total_months, fees_charges, emi_in_advance)
+        else:
+            # No fees, APR equals the interest rate
+            apr = interest_rate
+        
+        # Calculate total interest payable
+        total_payment = emi * total_months
+        total_interest = total_payment - principal_amount
+        
+        # Calculate total payment including fees
+        total_payment_with_fees = total_payment + fees_charges
+        
+        # Generate payment schedule
+        payment_schedule = generate_loan_amount_schedule(
+            principal_amount, monthly_rate, total_months, emi, emi_in_advance
+        )
+        
+        return jsonify({
+            'principalAmount': round(principal_amount, 2),
+            'loanApr': round(apr, 2) if apr is not None else None,
+            'totalInterest': round(total_interest, 2),
+            'totalPayment': round(total_payment_with_fees, 2),
+            'emi': round(emi, 2),
+            'feesCharges': round(fees_charges, 2),
+            'effectiveLoanAmount': round(principal_amount - fees_charges, 2),
+            'paymentSchedule': payment_schedule
+        })
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+def calculate_loan_tenure():
+    try:
+        data = request.get_json()
+        loan_amount = float(data.get('loanAmount', 0))
+        emi = float(data.get('emi', 0))
+        interest_rate = float(data.get('interestRate', 0))
+        fees_charges = float(data.get('feesCharges', 0))
+        emi_scheme = data.get('emiScheme', 'arrears')
+        
+        # Validate inputs
+        if loan_amount <= 0:
+            return jsonify({'error': 'Loan amount must be greater than 0'})
+        
+        if emi <= 0:
+            return jsonify({'error': 'EMI must be greater than 0'})
+        
+        if interest_rate < 0 or interest_rate > 50:
+            return jsonify({'error': 'Interest rate must be between 0% and 50%'})
+        
+        # Convert annual rate to monthly rate
+        monthly_rate = interest_rate / (12 * 100)
+        
+        # Check if EMI is sufficient to pay the interest
+        min_emi_required = loan_amount * monthly_rate
+        if emi <= min_emi_required:
+            return jsonify({
+                'error': f'EMI too low. Minimum EMI required: ₹{min_emi_required:,.2f} to cover monthly interest of ₹{min_emi_required:,.2f}'
+            })
+        
+        # Calculate tenure using logarithmic formula
+        if emi_scheme == 'advance':
+            # EMI in advance: Present value calculation
+            tenure_months = math.log((emi * (1 + monthly_rate)) / ((emi * (1 + monthly_rate)) - loan_amount * monthly_rate)) / math.log(1 + monthly_rate)
+        else:
+            # EMI in arrears: Standard calculation
+            tenure_months = math.log(emi / (emi - loan_amount * monthly_rate)) / math.log(1 + monthly_rate)
+        
+        # EMIs actually paid: the last one only clears the remaining balance
+        payments_needed = math.ceil(tenure_months - 1e-9)
+        tenure_months = round(tenure_months)
+        
+        # Validate tenure bounds
+        if tenure_months <= 0 or tenure_months > 360:
+            return jsonify({'error': 'Calculated tenure is invalid. Please adjust your EMI amount.'})
+        
+        # Calculate total payments and interest
+        total_emi_payments = emi * tenure_months
+        total_interest = max(0, total_emi_payments - loan_amount)  # Ensure non-negative
+        total_payment_with_fees = total_emi_payments + fees_charges
+        
+        # Calculate tenure in years and months
+        tenure_years = tenure_months // 12
+        tenure_remaining_months = tenure_months % 12
+        
+        # Calculate APR (Annual Percentage Rate) from the IRR of the fee-adjusted
+        # cash flows of the actual amortization, short final EMI included
+        if fees_charges > 0 and loan_amount - fees_charges > 0:
+            apr = cash_flow_apr(amortized_cash_flows(loan_amount, monthly_rate, emi, payments_needed,
+                                                     fees_charges, emi_scheme == 'advance'))
+        else:
+            apr = interest_rate
+        
+        # Generate payment schedule for chart and table
+        payment_schedule = generate_payment_schedule_tenure(loan_amount, emi, monthly_rate, tenure_months, fees_charges)
+        
+        return jsonify({
+            'tenureMonths': tenure_months,
+            'tenureYears': tenure_years,
+            'tenureRemainingMonths': tenure_remaining_months,
+            'loanApr': round(apr, 2) if apr is not None else None,
+            'totalInterest': round(total_interest),
+            'totalPayment': round(total_payment_with_fees),
+            'loanAmount': loan_amount,
+            'emi': emi,
+            'feesCharges': fees_charges,
+            'paymentSchedule': payment_schedule
+        })
+        
+    except Exception as e:
+        return jsonify({'error': str(e)})
+
+def generate_payment_schedule_tenure(loan_amount, emi, monthly_rate, tenure_months, fees_charges):
+    """Generate yearly payment schedule for loan tenure calculator"""
+    current_year = 2025  # Starting year
+    
+    interest, principal_paid, balance = amortization.amortize(loan_amount, monthly_rate, tenure_months, emi, clamp=True)
+    paid_months = amortization.active_periods(balance)
+    loan_paid_percentage = amortization.rounded(amortization.paid_percentage(loan_amount, balance))
+    
+    # Group payments by year; the last year might be partial
+    starts = amortization.year_starts(tenure_months)
+    ends = amortization.year_ends(starts, tenure_months)
+    
+    month_principal = amortization.rounded_int(principal_paid)
+    month_interest = amortization.rounded_int(interest)
+    month_balance = amortization.rounded_int(balance)
+    yearly_principal = amortization.yearly_sums(principal_paid, starts)
+    yearly_interest = amortization.yearly_sums(interest, starts)
+    emi_rounded = round(emi)
+    
+    schedule = []
+    for year_idx, (start, end) in enumerate(zip(starts.tolist(), ends.tolist())):
+        monthly_details = [{
+            'month': f"{amortization.MONTH_NAMES[k - start]} {current_year + year_idx}",
+            'principal': month_principal[k],
+            'interest': month_interest[k],
+            'totalPayment': emi_rounded,
+            'balance': month_balance[k],
+            'loanPaidPercentage': loan_paid_percentage[k]
+        } for k in range(start, min(end + 1, paid_months))]
+        
+        # Add year summary
+        schedule.append({
+            'year': current_year + year_idx,
+            'principal': round(float(yearly_principal[year_idx])),
+            'interest': round(float(yearly_interest[year_idx])),
+            'totalPayment': round(float(yearly_principal[year_idx] + yearly_interest[year_idx])),
+            'balance': month_balance[end],
+            'loanPaidPercentage': f"{loan_paid_percentage[end]:.2f}",
+            'monthlyDetails': monthly_details
+        })
+    
+    return schedule
+
+def calculate_interest_rate():
+    try:
+        data = request.get_json()
+        
+        loan_amount = float(data.get('loanAmount', 0))
+        emi = float(data.get('emi', 0))
+        tenure_years = int(data.get('tenureYears', 0))
+        tenure_months = int(data.get('tenureMonths', 0))
+        fees_charges = float(data.get('feesCharges', 0))
+        emi_scheme = data.get('emiScheme', 'arrears')
+        
+        total_months = (tenure_years * 12) + tenure_months
+        
+        if loan_amount <= 0 or emi <= 0 or total_months <= 0:
+            return jsonify({'error': 'Invalid input values'}), 400
+        
+        # Solve EMI(rate) = EMI for the monthly rate; an EMI outside the
+        # solver's range has no rate to report
+        solution = solver.solve_rate_for_payment(loan_amount, emi, total_months, emi_scheme == 'advance')
+        if not solution.converged:
+            if solution.root <= 0:
+                return jsonify({'error': 'EMI is too low to repay the loan over this tenure'}), 400
+            return jsonify({'error': f'EMI implies an interest rate above {solver.MAX_MONTHLY_RATE * 12 * 100:g}%'}), 400
+        found_rate = solution.root * 12 * 100
+        
+        # Calculate total payments and interest (matching emicalculator.net logic)
+        total_payment_without_fees = emi * total_months
+        
+        if emi_scheme == 'advance':
+            # For EMI in advance, calculate actual total interest from payment schedule
+            temp_schedule = generate_interest_rate_schedule(loan_amount, found_rate, total_months, emi, 0, True)
+            total_interest = sum(payment['interest'] for payment in temp_schedule)
+        else:
+            # For EMI in arrears, total interest is total payments minus principal
+            total_interest = total_payment_without_fees - loan_amount
+        
+        total_payment_with_fees = total_payment_without_fees + fees_charges
+        
+        # Calculate APR from the IRR of the fee-adjusted cash flows
+        if fees_charges > 0:
+            apr = loan_apr(loan_amount, emi, total_months, fees_charges, emi_scheme == 'advance')
+        else:
+            apr = found_rate
+        
+        # Generate payment schedule
+        payment_schedule = generate_interest_rate_schedule(loan_amount, found_rate, total_months, emi, fees_charges, emi_scheme == 'advance')
+        
+        return jsonify({
+            'interestRate': round(found_rate, 2),
+            'apr': round(apr, 2) if apr is not None else None,
+            'totalInterest': round(total_interest, 2),
+            'totalPayment': round(total_payment_with_fees, 2),
+            'loanAmount': round(loan_amount, 2),
+            'emi': round(emi, 2),
+            'feesCharges': round(fees_charges, 2),
+            'paymentSchedule': payment_schedule
+        })
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+def generate_interest_rate_schedule(loan_amount, annual_rate, total_months, emi, fees_charges, emi_advance=False):
+    """
+    Generate payment schedule for interest rate calculator
+    """
+    monthly_rate = annual_rate / (12 * 100)
+    
+    # Handle EMI in Advance: First EMI is all principal (no interest)
+    if emi_advance:
+        interest, principal_paid, balance = amortization.amortize_advance(loan_amount, monthly_rate, total_months, emi)
+    else:
+        interest, principal_paid, balance = amortization.amortize(loan_amount, monthly_rate, total_months, emi)
+    
+    loan_paid_percentage = amortization.paid_percentage(loan_amount, balance)
+    
+    emi_rounded = round(emi, 2)
+    schedule = [{
+        'month': month,
+        'emi': emi_rounded,
+        'principal': principal_payment,
+        'interest': interest_payment,
+        'balance': remaining,
+        'loan_paid_percentage': paid
+    } for month, principal_payment, interest_payment, remaining, paid in zip(
+        range(1, total_months + 1),
+        amortization.rounded(principal_paid),
+        amortization.rounded(interest),
+        amortization.rounded(np.maximum(balance, 0)),
+        amortization.rounded(loan_paid_percentage)
+    )]
+    
+    return schedule
+
+def stream_schedule(product):
+    """
+    Full per-period schedule of a loan product (daily, weekly, monthly,
+    quarterly, credit_card, ...) streamed as NDJSON or, with ?format=csv, CSV
+    """
+    output_format = request.args.get('format', 'ndjson')
+    if product not in loan_engine.LOAN_PRODUCTS:
+        return jsonify({'status': 'error', 'error': f'Unknown loan product {product}'}), 404
+    if output_format not in streaming.STREAM_FORMATS:
+        return jsonify({'status': 'error', 'error': f"format must be one of {', '.join(streaming.STREAM_FORMATS)}"}), 400
+    
+    try:
+        rows = loan_engine.schedule_rows(product, request.get_json(silent=True))
+    except Exception as e:
+        return jsonify({'status': 'error', 'error': str(e)}), 400
+    
+    return streaming.stream_rows(current_app, rows, output_format, f'{product}_schedule')
+
+def home_loan_monthly_rows(loan_amount, monthly_rate, total_months, emi, monthly_costs):
+    """
+    Month-by-month rows of the home loan schedule, labelled with the same
+    years as generate_home_loan_schedule and generated a block of months at
+    a time; the taxes column holds the monthly property tax, insurance and
+    maintenance
+    """
+    k = 0
+    for interest, principal_paid, balance in amortization.amortize_chunks(loan_amount, monthly_rate, total_months, emi, clamp=True):
+        if loan_amount > 0:
+            loan_paid_percentage = amortization.paid_percentage(loan_amount, balance)
+        else:
+            loan_paid_percentage = np.zeros(len(balance))
+        
+        for principal_payment, interest_payment, payment, remaining, paid in zip(
+            amortization.rounded(principal_paid),
+            amortization.rounded(interest),
+            amortization.rounded(principal_paid + interest + monthly_costs),
+            amortization.rounded(balance),
+            amortization.rounded(loan_paid_percentage, 1)
+        ):
+            yield {
+                'year': 2025 + k // 12,
+                'month': amortization.MONTH_NAMES[k % 12],
+                'principal': principal_payment,
+                'interest': interest_payment,
+                'taxes': round(monthly_costs, 2),
+                'totalPayment': payment,
+                'balance': remaining,
+                'loanPaidPercentage': paid
+            }
+            k += 1
+
+def home_loan_schedule_rows(data):
+    """
+    Monthly home loan schedule, with taxes, insurance and maintenance, for the
+    same payload as /calculate-home-loan
+    """
+    loan_amount = float(data.get('homeValue', 0)) + float(data.get('loanInsurance', 0)) - float(data.get('downPayment', 0))
+    interest_rate = float(data.get('interestRate', 0))
+    total_months = int(data.get('tenureYears', 0)) * 12 + int(data.get('tenureMonths', 0))
+    if total_months <= 0:
+        raise ValueError('Invalid tenure')
+    if total_months > loan_engine.MAX_TENURE_YEARS * 12:
+        raise ValueError(f'Tenure cannot exceed {loan_engine.MAX_TENURE_YEARS} years')
+    
+    emi = calculate_emi(loan_amount, interest_rate, total_months)
+    monthly_costs = (float(data.get('propertyTaxes', 0)) + float(data.get('homeInsurance', 0))) / 12 + float(data.get('maintenance', 0))
+    return home_loan_monthly_rows(loan_amount, interest_rate / (12 * 100), total_months, emi, monthly_costs)
+
+# Schedules exported by /export/<product> besides the LOAN_PRODUCTS ones
+EXPORT_SCHEDULES = {
+    'home_loan': home_loan_schedule_rows
+}
+
+def export_schedule(product):
+    """
+    Full schedule of a loan product as a CSV, XLSX or PDF download
+    (?format=), generated and streamed row by row on the server
+    """
+    output_format = request.args.get('format', 'csv')
+    if product not in loan_engine.LOAN_PRODUCTS and product not in EXPORT_SCHEDULES:
+        return jsonify({'status': 'error', 'error': f'Unknown loan product {product}'}), 404
+    if output_format not in export.EXPORT_FORMATS:
+        return jsonify({'status': 'error', 'error': f"format must be one of {', '.join(export.EXPORT_FORMATS)}"}), 400
+    
+    data = request.get_json(silent=True) or {}
+    if product in EXPORT_SCHEDULES:
+        rows = lambda: EXPORT_SCHEDULES[product](data)
+    else:
+        rows = lambda: loan_engine.schedule_rows(product, data)
+    
+    title = f"{product.replace('_', ' ').capitalize()} schedule"
+    try:
+        return export.export_response(current_app, f'{product}_schedule', output_format, data, rows, title)
+    except Exception as e:
+        return jsonify({'status': 'error', 'error': str(e)}), 400
+
+def calculate_emi_grid():
+    """
+    EMI across ranges of loan amount, rate and tenure for sensitivity heatmaps
+    """
+    try:
+        return jsonify(sensitivity.calculate_emi_grid(request.get_json()))
+    except Exception as e:
+        return jsonify({'status': 'error', 'error': str(e)}), 400
+
+def calculate_car_loan_emi():
+    return loan_product_response('car_loan')
+
+def calculate_two_wheeler_loan_emi():
+    return loan_product_response('two_wheeler_loan')
+
+def calculate_personal_loan_emi():
+    return loan_product_response('personal_loan')
+
+def calculate_business_loan_emi():
+    return loan_product_response('business_loan')
+
+def calculate_education_loan_emi():
+    try:
+        data = request.get_json()
+        
+        loan_required = float(data.get('loanRequired', 0))
+        interest_rate = float(data.get('interestRate', 0))
+        tenure_months = int(data.get('tenureMonths', 0))
+        repayment_option = data.get('repaymentOption', 'full_emi')
+        
+        if tenure_months <= 0:
+            return jsonify({
+                'status': 'error',
+                'error': 'Invalid tenure'
+            })
+        
+        # Use the accurate Python calculation function
+        result = calculate_education_loan_emi_python(loan_required, interest_rate, tenure_months, repayment_option)
+        
+        # Calculate percentages for pie chart
+        principal_percentage = (result['principal'] / result['total_payment']) * 100 if result['total_payment'] > 0 else 100
+        interest_percentage = (result['total_interest'] / result['total_payment']) * 100 if result['total_payment'] > 0 else 0
+        
+        return jsonify({
+            'emi': result['emi'],
+            'totalInterest': result['total_interest'],
+            'totalPayment': result['total_payment'],
+            'principalAmount': result['principal'],
+            'principalPercentage': round(principal_percentage, 1),
+            'interestPercentage': round(interest_percentage, 1)
+        })
+        
+    except Exception as e:
+        print(f"Error in education loan EMI calculation: {str(e)}")
+        return jsonify({
+            'status': 'error',
+            'error': str(e)
+        })
+
+def calculate_credit_card_emi():
+    return loan_product_response('credit_card')
+
+def calculate_mobile_phone_emi():
+    return loan_product_response('mobile_phone_loan')
+
+def calculate_laptop_emi():
+    return loan_product_response('laptop_loan')
+
+def calculate_land_loan_emi():
+    return loan_product_response('land_loan')
+
+def calculate_commercial_property_emi():
+    return loan_product_response('commercial_property_loan')
+
+def calculate_commercial_vehicle_emi():
+    return loan_product_response('commercial_vehicle_loan')
+
+def calculate_tractor_loan_emi():
+    return loan_product_response('tractor_loan')
+
+def calculate_daily_emi():
+    return loan_product_response('daily')
+
+def calculate_weekly_emi():
+    return loan_product_response('weekly')
+
+def calculate_monthly_emi():
+    return loan_product_response('monthly')
+
+def loan_against_property_emi_calculator():
+    return render_template('loan_against_property_emi_calculator.html')
+
+def calculate_loan_against_property_emi():
+    return loan_product_response('loan_against_property')
+
+def gold_loan_emi_calculator():
+    return render_template('gold_loan_emi_calculator.html')
+
+def quarterly_emi_calculator():
+    return render_template('quarterly_emi_calculator.html')
+
+def calculate_gold_loan_emi():
+    try:
+        data = request.json
+        if not data:
+            return jsonify({'error': 'No data provided'}), 400
+        
+        # Extract form data
+        tenure_months = int(data.get('tenure_months', 6))
+        annual_rate = float(data.get('annual_rate', 12))
+        num_ornaments = int(data.get('num_ornaments', 1))
+        
+        # Gold details
+        ornaments = data.get('ornaments', [])
+        
+        # Current gold rate per gram (approximate, can be made dynamic)
+        gold_rates = {
+            '24K': 6500,  # Per gram in INR
+            '23K': 6000,
+            '22K': 5800,
+            '21K': 5600,
+            '20K': 5400,
+            '18K': 4900,
+            '16K': 4300,
+            '14K': 3800
+        }
+        
+        total_gold_value = 0
+        ornament_details = []
+        
+        # Calculate total gold value
+        for ornament in ornaments:
+            carat = ornament.get('carat', '24K')
+            weight = float(ornament.get('weight', 0))
+            
+            rate_per_gram = gold_rates.get(carat, gold_rates['24K'])
+            ornament_value = weight * rate_per_gram
+            total_gold_value += ornament_value
+            
+            ornament_details.append({
+                'carat': carat,
+                'weight': weight,
+                'rate_per_gram': rate_per_gram,
+                'value': round(ornament_value, 2)
+            })
+        
+        # LTV (Loan to Value) ratio - typically 75-80% for gold loans
+        ltv_ratio = 0.75
+        eligible_loan_amount = total_gold_value * ltv_ratio
+        
+        # Calculate EMI
+        monthly_rate = annual_rate / (12 * 100)
+        
+        if monthly_rate == 0:
+            emi = eligible_loan_amount / tenure_months
+        else:
+            emi = eligible_loan_amount * monthly_rate * ((1 + monthly_rate) ** tenure_months) / (((1 + monthly_rate) ** tenure_months) - 1)
+        
+        total_payment = emi * tenure_months
+        total_interest = total_payment - eligible_loan_amount
+        
+        # Generate amortization schedule
+        schedule, _ = calculate_amortization_schedule(eligible_loan_amount, annual_rate, tenure_months)
+        
+        return jsonify({
+            'emi': round(emi, 2),
+            'eligible_loan_amount': round(eligible_loan_amount, 2),
+            'total_payment': round(total_payment, 2),
+            'total_interest': round(total_interest, 2),
+            'total_gold_value': round(total_gold_value, 2),
+            'ltv_ratio': ltv_ratio * 100,
+            'schedule': schedule,
+            'ornament_details': ornament_details,
+            'annual_rate': annual_rate,
+            'tenure_months': tenure_months
+        })
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+def calculate_quarterly_emi():
+    return loan_product_response('quarterly')
+
+def calculate_emi_with_part_payment():
+    try:
+        data = request.get_json()
+        
+        loan_amount = float(data.get('loanAmount', 0))
+        interest_rate = float(data.get('interestRate', 0))
+        tenure_years = int(data.get('tenureYears', 0))
+        part_payment_amount = float(data.get('partPaymentAmount', 0))
+        part_payment_month = int(data.get('partPaymentMonth', 0))
+        part_payment_option = data.get('partPaymentOption', 'reduceTenure')
+        
+        if loan_amount <= 0 or tenure_years <= 0 or interest_rate < 0:
+            return jsonify({
+                'status': 'error',
+                'error': 'Invalid input values'
+            })
+        
+        # Calculate EMI with part payment impact
+        results = calculate_emi_with_part_payment_returns(
+            loan_amount, interest_rate, tenure_years, 
+            part_payment_amount, part_payment_month, part_payment_option
+        )
+        
+        return jsonify({
+            'status': 'success',
+            'loanAmount': loan_amount,
+            'interestRate': interest_rate,
+            'tenureYears': tenure_years,
+            'partPaymentAmount': part_payment_amount,
+            'partPaymentMonth': part_payment_month,
+            'originalEmi': results['original_emi'],
+            'revisedEmi': results['revised_emi'],
+            'originalTotalInterest': results['original_total_interest'],
+            'revisedTotalInterest': results['revised_total_interest'],
+            'interestSavings': results['interest_savings'],
+            'originalTotalAmount': results['original_total_amount'],
+            'revisedTotalAmount': results['revised_total_amount'],
+            'totalSavings': results['total_savings'],
+            'originalTenure': results['original_tenure_months'],
+            'revisedTenure': results['revised_tenure_months'],
+            'tenureReduction': results['tenure_reduction'],
+            'current_principle_outstanding': results['current_principle_outstanding'],
+            'new_principle_outstanding': results['new_principle_outstanding'],
+            'part_payment_option': results['part_payment_option'],
+            'yearlyBreakdown': results['yearly_breakdown'],
+            'originalYearlyBreakdown': results['original_yearly_breakdown']
+        })
+    
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'error': str(e)
+        })
+
+def calculate_remaining_balance_after_months(principal, monthly_rate, emi, months):
+    """
+    Calculate remaining loan balance after a specific number of months
+    """
+    remaining_balance = principal
+    
+    for month in range(1, months + 1):
+        if remaining_balance <= 0:
+            break
+            
+        interest_payment = remaining_balance * monthly_rate
+        principal_payment = emi - interest_payment
+        
+        if principal_payment > remaining_balance:
+            principal_payment = remaining_balance
+            
+        remaining_balance -= principal_payment
+    
+    return max(0, remaining_balance)
+
+def calculate_remaining_balance_after_part_payment(principal, monthly_rate, emi, part_payment_amount, part_payment_month):
+    """
+    Calculate remaining loan balance after part payment is applied
+    """
+    remaining_balance = principal
+    
+    for month in range(1, part_payment_month + 1):
+        if remaining_balance <= 0:
+            break
+            
+        interest_payment = remaining_balance * monthly_rate
+        principal_payment = emi - interest_payment
+        
+        if principal_payment > remaining_balance:
+            principal_payment = remaining_balance
+            
+        remaining_balance -= principal_payment
+        
+        # Apply part payment if this is the specified month
+        if month == part_payment_month and part_payment_amount > 0:
+            actual_part_payment = min(part_payment_amount, remaining_balance)
+            remaining_balance -= actual_part_payment
+    
+    return max(0, remaining_balance)
+
+def calculate_emi_with_part_payment_returns(loan_amount, interest_rate, tenure_years, part_payment_amount, part_payment_month, part_payment_option='reduceTenure'):
+    """
+    Calculate EMI with part payment impact
+    """
+    original_tenure_months = tenure_years * 12
+    monthly_rate = interest_rate / (12 * 100)
+    
+    # Calculate original EMI
+    if monthly_rate > 0:
+        original_emi = loan_amount * monthly_rate * ((1 + monthly_rate) ** original_tenure_months) / (((1 + monthly_rate) ** original_tenure_months) - 1)
+    else:
+        original_emi = loan_amount / original_tenure_months
+    
+    # Calculate original totals
+    original_total_amount = original_emi * original_tenure_months
+    original_total_interest = original_total_amount - loan_amount
+    
+    # Calculate original yearly breakdown
+    original_yearly_breakdown = []
+    orig_remaining = loan_amount
+    for year in range(1, tenure_years + 1):
+        yearly_principal = 0
+        yearly_interest = 0
+        
+        for month in range(12):
+            if orig_remaining <= 0:
+                break
+            
+            interest_payment = orig_remaining * monthly_rate
+            principal_payment = original_emi - interest_payment
+            
+            if principal_payment > orig_remaining:
+                principal_payment = orig_remaining
+            
+            yearly_principal += principal_payment
+            yearly_interest += interest_payment
+            orig_remaining -= principal_payment
+        
+        original_yearly_breakdown.append({
+            'year': year,
+            'principal': round(yearly_principal, 2),
+            'interest': round(yearly_interest, 2),
+            'total_payment': round(yearly_principal + yearly_interest, 2),
+            'balance': round(max(0, orig_remaining), 2)
+        })
+    
+    if part_payment_option == 'reduceEmi':
+        # Calculate new EMI after part payment, keeping tenure same
+        revised_emi, revised_total_interest, yearly_breakdown = calculate_reduce_emi_scenario(
+            loan_amount, monthly_rate, original_tenure_months, original_emi, 
+            part_payment_amount, part_payment_month
+        )
+        revised_tenure_months = original_tenure_months
+        tenure_reduction = 0
+        revised_total_amount = (revised_emi * original_tenure_months) + part_payment_amount
+        
+    else:  # reduceTenure
+        # Keep EMI same, reduce tenure
+        revised_emi = original_emi
+        revised_total_interest, revised_tenure_months, yearly_breakdown = calculate_reduce_tenure_scenario(
+            loan_amount, monthly_rate, original_emi, 
+            part_payment_amount, part_payment_month
+        )
+        tenure_reduction = original_tenure_months - revised_tenure_months
+        revised_total_amount = revised_total_interest + loan_amount + part_payment_amount
+    
+    # Calculate loan amounts
+    # Current loan amount = remaining balance after specified months of EMI payments
+    current_loan_amount = calculate_remaining_balance_after_months(loan_amount, monthly_rate, original_emi, part_payment_month)
+    
+    # New loan amount = remaining balance after part payment is applied
+    new_loan_amount = calculate_remaining_balance_after_part_payment(
+        loan_amount, monthly_rate, original_emi, part_payment_amount, part_payment_month
+    )
+    
+    # Calculate savings
+    interest_savings = original_total_interest - revised_total_interest
+    total_savings = original_total_amount - revised_total_amount
+    
+    return {
+        'original_emi': round(original_emi, 2),
+        'revised_emi': round(revised_emi, 2),
+        'original_total_interest': round(original_total_interest, 2),
+        'revised_total_interest': round(revised_total_interest, 2),
+        'interest_savings': round(interest_savings, 2),
+        'original_total_amount': round(original_total_amount, 2),
+        'revised_total_amount': round(revised_total_amount, 2),
+        'total_savings': round(total_savings, 2),
+        'original_tenure_months': original_tenure_months,
+        'revised_tenure_months': revised_tenure_months,
+        'tenure_reduction': tenure_reduction,
+        'current_principle_outstanding': round(current_loan_amount, 2),
+        'new_principle_outstanding': round(new_loan_amount, 2),
+        'yearly_breakdown': yearly_breakdown,
+        'original_yearly_breakdown': original_yearly_breakdown,
+        'part_payment_option': part_payment_option
+    }
+
+def calculate_reduce_emi_scenario(loan_amount, monthly_rate, tenure_months, original_emi, part_payment_amount, part_payment_month):
+    """
+    Calculate scenario where EMI is reduced and tenure remains same
+    """
+    remaining_principal = loan_amount
+    total_interest = 0
+    current_emi = original_emi
+    yearly_breakdown = []
+    month = 1
+    
+    for year in range(1, int(tenure_months/12) + 2):
+        yearly_principal = 0
+        yearly_interest = 0
+        yearly_part_payment = 0
+        
+        for month_in_year in range(12):
+            if month > tenure_months or remaining_principal <= 0.01:
+                break
+            
+            # Apply part payment and recalculate EMI if this is the specified month
+            if month == part_payment_month and part_payment_amount > 0:
+                actual_part_payment = min(part_payment_amount, remaining_principal)
+                remaining_principal -= actual_part_payment
+                yearly_part_payment += actual_part_payment
+                
+                # Recalculate EMI for remaining tenure
+                remaining_months = tenure_months - month + 1
+                if remaining_months > 0 and monthly_rate > 0 and remaining_principal > 0:
+                    current_emi = remaining_principal * monthly_rate * ((1 + monthly_rate) ** remaining_months) / (((1 + monthly_rate) ** remaining_months) - 1)
+                elif remaining_months > 0 and remaining_principal > 0:
+                    current_emi = remaining_principal / remaining_months
+                else:
+                    current_emi = 0
+            
+            if remaining_principal <= 0.01:
+                break
+                
+            # Calculate interest and principal for current month
+            interest_payment = remaining_principal * monthly_rate
+            principal_payment = min(current_emi - interest_payment, remaining_principal)
+            
+            yearly_principal += principal_payment
+            yearly_interest += interest_payment
+            total_interest += interest_payment
+            remaining_principal -= principal_payment
+            
+            month += 1
+        
+        if yearly_principal > 0 or yearly_interest > 0 or yearly_part_payment > 0:
+            yearly_breakdown.append({
+                'year': year,
+                'principal': round(yearly_principal, 2),
+                'interest': round(yearly_interest, 2),
+                'part_payment': round(yearly_part_payment, 2),
+                'total_payment': round(yearly_principal + yearly_interest + yearly_part_payment, 2),
+                'balance': round(max(0, remaining_principal), 2)
+            })
+        
+        if month > tenure_months:
+            break
+    
+    return current_emi, total_interest, yearly_breakdown
+
+def calculate_reduce_tenure_scenario(loan_amount, monthly_rate, original_emi, part_payment_amount, part_payment_month):
+    """
+    Calculate scenario where tenure is reduced and EMI remains same
+    """
+    remaining_principal = loan_amount
+    total_interest = 0
+    yearly_breakdown = []
+    month = 1
+    
+    for year in range(1, 50):  # Max 50 years to handle edge cases
+        yearly_principal = 0
+        yearly_interest = 0
+        yearly_part_payment = 0
+        
+        for month_in_year in range(12):
+            if remaining_principal <= 0.01:  # Close to zero
+                break
+            
+            # Calculate interest and principal for current month
+            interest_payment = remaining_principal * monthly_rate
+            principal_payment = min(original_emi - interest_payment, remaining_principal)
+            
+            yearly_principal += principal_payment
+            yearly_interest += interest_payment
+            total_interest += interest_payment
+            remaining_principal -= principal_payment
+            
+            # Apply part payment if this is the specified month
+            if month == part_payment_month and part_payment_amount > 0:
+                actual_part_payment = min(part_payment_amount, remaining_principal)
+                remaining_principal -= actual_part_payment
+                yearly_part_payment += actual_part_payment
+            
+            month += 1
+            
+            if remaining_principal <= 0.01:
+                break
+        
+        yearly_breakdown.append({
+            'year': year,
+            'principal': round(yearly_principal, 2),
+            'interest': round(yearly_interest, 2),
+            'part_payment': round(yearly_part_payment, 2),
+            'total_payment': round(yearly_principal + yearly_interest + yearly_part_payment, 2),
+            'balance': round(max(0, remaining_principal), 2)
+        })
+        
+        if remaining_principal <= 0.01:
+            break
+    
+    return total_interest, month - 1, yearly_breakdown
+
+def calculate_outstanding_at_month(loan_amount, monthly_rate, emi, target_month):
+    """
+    Calculate the outstanding principal amount at a specific month
+    """
+    remaining_principal = loan_amount
+    
+    for month in range(1, target_month):
+        if remaining_principal <= 0:
+            break
+            
+        interest_payment = remaining_principal * monthly_rate
+        principal_payment = min(emi - interest_payment, remaining_principal)
+        remaining_principal -= principal_payment
+    
+    return max(0, remaining_principal)
+
+def floating_interest_rate_emi_calculator():
+    return render_template('floating_interest_rate_emi_calculator.html')
+
+def calculate_floating_interest_rate_emi(principal, initial_rate, revised_rate, transition_year, tenure_years):
+    """
+    Calculate Floating Interest Rate EMI with rate change during loan tenure
+    """
+    total_months = tenure_years * 12
+    transition_month = transition_year * 12
+    
+    # Calculate initial EMI based on initial interest rate for full tenure
+    initial_monthly_rate = initial_rate / (12 * 100)
+    if initial_monthly_rate == 0:
+        initial_emi = principal / total_months
+    else:
+        initial_emi = principal * initial_monthly_rate * ((1 + initial_monthly_rate) ** total_months) / (((1 + initial_monthly_rate) ** total_months) - 1)
+    
+    # Calculate outstanding balance at transition point
+    outstanding_at_transition = principal
+    total_interest_paid = 0
+    
+    # Calculate payments before rate change
+    for month in range(1, min(transition_month + 1, total_months + 1)):
+        interest_payment = outstanding_at_transition * initial_monthly_rate
+        principal_payment = initial_emi - interest_payment
+        outstanding_at_transition -= principal_payment
+        total_interest_paid += interest_payment
+        
+        if outstanding_at_transition <= 0:
+            break
+    
+    # If loan is not fully paid, calculate new EMI for remaining tenure
+    if outstanding_at_transition > 0 and transition_month < total_months:
+        remaining_months = total_months - transition_month
+        revised_monthly_rate = revised_rate / (12 * 100)
+        
+        if revised_monthly_rate == 0:
+            revised_emi = outstanding_at_transition / remaining_months
+        else:
+            revised_emi = outstanding_at_transition * revised_monthly_rate * ((1 + revised_monthly_rate) ** remaining_months) / (((1 + revised_monthly_rate) ** remaining_months) - 1)
+        
+        # Calculate remaining interest
+        remaining_interest = (revised_emi * remaining_months) - outstanding_at_transition
+        total_interest_paid += remaining_interest
+    else:
+        revised_emi = initial_emi
+    
+    total_amount = principal + total_interest_paid
+    
+    return {
+        'principal': principal,
+        'initial_rate': initial_rate,
+        'revised_rate': revised_rate,
+        'transition_year': transition_year,
+        'tenure_years': tenure_years,
+        'initial_emi': round(initial_emi, 2),
+        'revised_emi': round(revised_emi, 2),
+        'total_interest': round(total_interest_paid, 2),
+        'total_amount': round(total_amount, 2),
+        'outstanding_at_transition': round(max(0, outstanding_at_transition), 2)
+    }
+
+def generate_floating_interest_rate_emi_schedule(principal, initial_rate, revised_rate, transition_year, tenure_years, start_year=2025):
+    """
+    Generate yearly amortization schedule for floating interest rate EMI
+    """
+    total_months = tenure_years * 12
+    transition_month = transition_year * 12
+    
+    # Calculate initial EMI
+    initial_monthly_rate = initial_rate / (12 * 100)
+    if initial_monthly_rate == 0:
+        initial_emi = principal / total_months
+    else:
+        initial_emi = principal * initial_monthly_rate * ((1 + initial_monthly_rate) ** total_months) / (((1 + initial_monthly_rate) ** total_months) - 1)
+    
+    yearly_schedule = []
+    remaining_principal = principal
+    current_year = start_year
+    month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
+                   'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+    
+    total_months_processed = 0
+    current_month = 0
+    
+    while total_months_processed < total_months and remaining_principal > 0:
+        year_principal = 0
+        year_interest = 0
+        year_payments = 0
+        monthly_data = []
+        
+        # Calculate months for this year
+        months_to_process = min(12, total_months - total_months_processed)
+        
+        for month_idx in range(months_to_process):
+            if total_months_processed >= total_months or remaining_principal <= 0:
+                break
+                
+            total_months_processed += 1
+            
+            # Determine which rate to use
+            if total_months_processed <= transition_month:
+                current_rate = initial_monthly_rate
+                current_emi = initial_emi
+            else:
+                # Recalculate EMI for remaining tenure if this is the first month after transition
+                if total_months_processed == transition_month + 1:
+                    remaining_months = total_months - transition_month
+                    revised_monthly_rate = revised_rate / (12 * 100)
+                    
+                    if revised_monthly_rate == 0:
+                        revised_emi = remaining_principal / remaining_months
+                    else:
+                        revised_emi = remaining_principal * revised_monthly_rate * ((1 + revised_monthly_rate) ** remaining_months) / (((1 + revised_monthly_rate) ** remaining_months) - 1)
+                    
+                    current_emi = revised_emi
+                
+                current_rate = revised_rate / (12 * 100)
+            
+            interest_payment = remaining_principal * current_rate
+            principal_payment = min(current_emi - interest_payment, remaining_principal)
+            
+            year_principal += principal_payment
+            year_interest += interest_payment
+            year_payments += (principal_payment + interest_payment)
+            
+            remaining_principal -= principal_payment
+            
+            # Calculate loan paid percentage for this month
+            loan_paid_percentage = ((principal - remaining_principal) / principal) * 100
+            
+            # Get the correct month name
+            month_name = month_names[(current_month + month_idx) % 12]
+            
+            # Store monthly data
+            monthly_data.append({
+                'month': month_name,
+                'principal': round(principal_payment, 2),
+                'interest': round(interest_payment, 2),
+                'total_payment': round(principal_payment + interest_payment, 2),
+                'balance': round(max(0, remaining_principal), 2),
+                'loan_paid_percentage': round(loan_paid_percentage, 2),
+                'rate_used': round(current_rate * 12 * 100, 2)
+            })
+        
+        # Calculate loan paid percentage for the year
+        loan_paid_percentage = ((principal - remaining_principal) / principal) * 100
+        
+        yearly_schedule.append({
+            'year': current_year,
+            'principal': round(year_principal, 2),
+            'interest': round(year_interest, 2),
+            'total_payment': round(year_payments, 2),
+            'balance': round(max(0, remaining_principal), 2),
+            'loan_paid_percentage': round(loan_paid_percentage, 2),
+            'months_in_year': months_to_process,
+            'monthly_data': monthly_data
+        })
+        
+        # Move to next year
+        current_year += 1
+        current_month = 0
+        
+        # Stop if loan is fully paid
+        if remaining_principal <= 0.01:  # Small threshold for rounding errors
+            break
+    
+    return yearly_schedule
+
+def calculate_floating_interest_rate_emi_route():
+    try:
+        data = request.get_json()
+        principal = float(data.get('loanAmount', 1000000))
+        initial_rate = float(data.get('initialRate', 10.0))
+        revised_rate = float(data.get('revisedRate', 12.0))
+        transition_year = int(data.get('transitionYear', 3))
+        tenure_years = int(data.get('tenureYears', 15))
+        
+        # Validate inputs
+        if principal < 1000 or principal > 50000000:
+            return jsonify({'status': 'error', 'error': 'Loan amount must be between ₹1,000 and ₹5 Crores'}), 400
+        if initial_rate < 0.1 or initial_rate > 36:
+            return jsonify({'status': 'error', 'error': 'Initial interest rate must be between 0.1% and 36%'}), 400
+        if revised_rate < 0.1 or revised_rate > 36:
+            return jsonify({'status': 'error', 'error': 'Revised interest rate must be between 0.1% and 36%'}), 400
+        if transition_year < 1 or transition_year > tenure_years:
+            return jsonify({'status': 'error', 'error': 'Transition year must be between 1 and loan tenure'}), 400
+        if tenure_years < 1 or tenure_years > 30:
+            return jsonify({'status': 'error', 'error': 'Loan tenure must be between 1 and 30 years'}), 400
+        
+        # Calculate floating interest rate EMI
+        result = calculate_floating_interest_rate_emi(principal, initial_rate, revised_rate, transition_year, tenure_years)
+        
+        # Generate balance schedule
+        balance_schedule = generate_floating_interest_rate_emi_schedule(principal, initial_rate, revised_rate, transition_year, tenure_years)
+        
+        result['balanceSchedule'] = balance_schedule
+        
+        return jsonify({'status': 'success', **result})
+    except Exception as e:
+        return jsonify({'status': 'error', 'error': str(e)}), 400
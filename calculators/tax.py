@@ -0,0 +1,1088 @@
+from flask import render_template, request, jsonify
+
+def gratuity_calculator():
+    return render_template('gratuity_calculator.html')
+
+def calculate_gratuity_returns(last_salary, years_of_service, gratuity_type, custom_days):
+    """
+    Calculate gratuity amount based on Indian gratuity rules
+    """
+    # Calculate annual salary
+    annual_salary = last_salary * 12
+    
+    # Determine the number of days per year for calculation
+    if gratuity_type == 'act':
+        days_per_year = 15  # Under Payment of Gratuity Act
+        formula_used = '(Last Salary × Years of Service × 15) / 26'
+    elif gratuity_type == 'non-act':
+        days_per_year = 30  # Not covered under Act
+        formula_used = '(Last Salary × Years of Service × 30) / 26'
+    else:  # custom
+        days_per_year = custom_days
+        formula_used = f'(Last Salary × Years of Service × {custom_days}) / 26'
+    
+    # Calculate gratuity amount
+    # Formula: (Last Salary × Years of Service × Days per year) / 26
+    gratuity_amount = (last_salary * years_of_service * days_per_year) / 26
+    
+    # Apply maximum limit for Act coverage (Rs 20,00,000)
+    if gratuity_type == 'act' and gratuity_amount > 2000000:
+        gratuity_amount = 2000000
+    
+    return {
+        'gratuity_amount': round(gratuity_amount, 2),
+        'annual_salary': round(annual_salary, 2),
+        'formula_used': formula_used,
+        'days_per_year': days_per_year,
+        'years_of_service': years_of_service,
+        'last_salary': last_salary
+    }
+
+def calculate_gratuity():
+    try:
+        data = request.get_json()
+        
+        last_salary = float(data.get('last_salary', 0))
+        years_of_service = int(data.get('years_of_service', 0))
+        gratuity_type = data.get('gratuity_type', 'act')
+        custom_days = int(data.get('custom_days', 15))
+        
+        result = calculate_gratuity_returns(
+            last_salary, years_of_service, gratuity_type, custom_days
+        )
+        
+        return jsonify(result)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+def ltcg_calculator():
+    return render_template('ltcg_calculator.html')
+
+def income_tax_calculator_with_old_and_new_tax_regime():
+    return render_template('income_tax_calculator_with_old_and_new_tax_regime.html')
+
+def calculate_income_tax_old_new_regime(financial_year, age_group, income_details, deductions):
+    """
+    Calculate income tax for both old and new tax regimes
+    """
+    # Total income calculation
+    total_income = (
+        income_details.get('salary', 0) +
+        income_details.get('rental_income', 0) +
+        income_details.get('digital_asset_income', 0) +
+        income_details.get('other_income', 0) -
+        income_details.get('exempt_allowances', 0) -
+        income_details.get('self_occupied_property_loss', 0)
+    )
+    
+    # Interest on home loan for let-out property reduces rental income
+    rental_income_net = income_details.get('rental_income', 0) - income_details.get('interest_home_loan_letout', 0)
+    total_income = (
+        income_details.get('salary', 0) +
+        max(0, rental_income_net) +
+        income_details.get('digital_asset_income', 0) +
+        income_details.get('other_income', 0) -
+        income_details.get('exempt_allowances', 0) -
+        income_details.get('self_occupied_property_loss', 0)
+    )
+    
+    # OLD TAX REGIME CALCULATION
+    old_regime_tax = calculate_old_regime_tax(total_income, age_group, deductions, financial_year)
+    
+    # NEW TAX REGIME CALCULATION
+    new_regime_tax = calculate_new_regime_tax(total_income, age_group, financial_year)
+    
+    # Calculate savings/difference
+    savings_amount = old_regime_tax['total_tax'] - new_regime_tax['total_tax']
+    better_regime = 'New Regime' if savings_amount > 0 else 'Old Regime'
+    if abs(savings_amount) < 100:
+        better_regime = 'Both Similar'
+    
+    return {
+        'total_income': total_income,
+        'old_regime': old_regime_tax,
+        'new_regime': new_regime_tax,
+        'savings_amount': abs(savings_amount),
+        'better_regime': better_regime,
+        'financial_year': financial_year,
+        'age_group': age_group
+    }
+
+def calculate_old_regime_tax(total_income, age_group, deductions, financial_year):
+    """
+    Calculate tax under old regime with deductions
+    """
+    # Apply Section 80C, 80D, etc. deductions
+    section_80c = min(deductions.get('section_80c', 0), 150000)
+    section_80d = min(deductions.get('section_80d', 0), get_80d_limit(age_group))
+    section_80g = deductions.get('section_80g', 0)  # 100% deduction for donations
+    section_80tta = min(deductions.get('section_80tta', 0), 10000)
+    section_80ccd1 = min(deductions.get('section_80ccd1', 0), 50000)
+    section_80ccd2 = deductions.get('section_80ccd2', 0)  # No limit for employer NPS
+    section_80eea = min(deductions.get('section_80eea', 0), 150000)
+    other_deductions = deductions.get('other_deductions', 0)
+    
+    total_deductions = (section_80c + section_80d + section_80g + section_80tta + 
+                       section_80ccd1 + section_80ccd2 + section_80eea + other_deductions)
+    
+    # Taxable income after deductions
+    taxable_income = max(0, total_income - total_deductions)
+    
+    # Calculate tax based on slabs for old regime
+    income_tax = calculate_tax_slabs_old_regime(taxable_income, age_group, financial_year)
+    
+    # Add cess (4% on income tax)
+    cess = income_tax * 0.04
+    total_tax = income_tax + cess
+    
+    return {
+        'taxable_income': taxable_income,
+        'total_deductions': total_deductions,
+        'income_tax': income_tax,
+        'cess': cess,
+        'total_tax': total_tax,
+        'deduction_breakdown': {
+            'section_80c': section_80c,
+            'section_80d': section_80d,
+            'section_80g': section_80g,
+            'section_80tta': section_80tta,
+            'section_80ccd1': section_80ccd1,
+            'section_80ccd2': section_80ccd2,
+            'section_80eea': section_80eea,
+            'other_deductions': other_deductions
+        }
+    }
+
+def calculate_new_regime_tax(total_income, age_group, financial_year):
+    """
+    Calculate tax under new regime (no deductions but lower rates)
+    """
+    # Standard deduction of Rs. 50,000 for salaried individuals
+    standard_deduction = 50000
+    taxable_income = max(0, total_income - standard_deduction)
+    
+    # Calculate tax based on new regime slabs
+    income_tax = calculate_tax_slabs_new_regime(taxable_income, financial_year)
+    
+    # Add cess (4% on income tax)
+    cess = income_tax * 0.04
+    total_tax = income_tax + cess
+    
+    return {
+        'taxable_income': taxable_income,
+        'standard_deduction': standard_deduction,
+        'income_tax': income_tax,
+        'cess': cess,
+        'total_tax': total_tax
+    }
+
+def calculate_tax_slabs_old_regime(taxable_income, age_group, financial_year):
+    """
+    Calculate income tax based on old regime slabs
+    """
+    if financial_year in ['FY 2024-2025', 'FY 2025-2026']:
+        if age_group == '0-60':
+            # Below 60 years
+            if taxable_income <= 250000:
+                return 0
+            elif taxable_income <= 500000:
+                return (taxable_income - 250000) * 0.05
+            elif taxable_income <= 1000000:
+                return 12500 + (taxable_income - 500000) * 0.20
+            else:
+                return 112500 + (taxable_income - 1000000) * 0.30
+        elif age_group == '60-80':
+            # Senior citizen (60-80 years)
+            if taxable_income <= 300000:
+                return 0
+            elif taxable_income <= 500000:
+                return (taxable_income - 300000) * 0.05
+            elif taxable_income <= 1000000:
+                return 10000 + (taxable_income - 500000) * 0.20
+            else:
+                return 110000 + (taxable_income - 1000000) * 0.30
+        else:
+            # Super senior citizen (80+ years)
+            if taxable_income <= 500000:
+                return 0
+            elif taxable_income <= 1000000:
+                return (taxable_income - 500000) * 0.20
+            else:
+                return 100000 + (taxable_income - 1000000) * 0.30
+    
+    return 0
+
+def calculate_tax_slabs_new_regime(taxable_income, financial_year):
+    """
+    Calculate income tax based on new regime slabs
+    """
+    if financial_year in ['FY 2024-2025', 'FY 2025-2026']:
+        # New regime slabs (same for all age groups)
+        if taxable_income <= 300000:
+            return 0
+        elif taxable_income <= 600000:
+            return (taxable_income - 300000) * 0.05
+        elif taxable_income <= 900000:
+            return 15000 + (taxable_income - 600000) * 0.10
+        elif taxable_income <= 1200000:
+            return 45000 + (taxable_income - 900000) * 0.15
+        elif taxable_income <= 1500000:
+            return 90000 + (taxable_income - 1200000) * 0.20
+        else:
+            return 150000 + (taxable_income - 1500000) * 0.30
+    
+    return 0
+
+def get_80d_limit(age_group):
+    """
+    Get Section 80D deduction limit based on age group
+    """
+    if age_group == '80+':
+        return 50000  # For super senior citizens
+    elif age_group == '60-80':
+        return 50000  # For senior citizens
+    else:
+        return 25000  # For individuals below 60
+
+def calculate_income_tax_old_new_regime_api():
+    try:
+        data = request.get_json()
+        
+        # Extract basic details
+        financial_year = data.get('financial_year', 'FY 2024-2025')
+        age_group = data.get('age_group', '0-60')
+        
+        # Extract income details
+        income_details = {
+            'salary': float(data.get('salary', 0)),
+            'exempt_allowances': float(data.get('exempt_allowances', 0)),
+            'self_occupied_property_loss': float(data.get('self_occupied_property_loss', 0)),
+            'rental_income': float(data.get('rental_income', 0)),
+            'digital_asset_income': float(data.get('digital_asset_income', 0)),
+            'interest_home_loan_letout': float(data.get('interest_home_loan_letout', 0)),
+            'other_income': float(data.get('other_income', 0))
+        }
+        
+        # Extract deductions
+        deductions = {
+            'section_80c': float(data.get('section_80c', 0)),
+            'section_80d': float(data.get('section_80d', 0)),
+            'section_80g': float(data.get('section_80g', 0)),
+            'section_80tta': float(data.get('section_80tta', 0)),
+            'section_80ccd1': float(data.get('section_80ccd1', 0)),
+            'section_80ccd2': float(data.get('section_80ccd2', 0)),
+            'section_80eea': float(data.get('section_80eea', 0)),
+            'other_deductions': float(data.get('other_deductions', 0))
+        }
+        
+        # Calculate tax
+        result = calculate_income_tax_old_new_regime(financial_year, age_group, income_details, deductions)
+        
+        return jsonify({
+            'status': 'success',
+            **result
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'error': str(e)
+        }), 400
+
+def tds_calculator():
+    return render_template('tds_calculator.html')
+
+def calculate_tds_amount(payment_type, payment_amount, pan_available, category, regime_type='old'):
+    """
+    Calculate TDS amount based on payment type, PAN availability, category, and tax regime
+    
+    Args:
+        payment_type: Type of payment (e.g., '192A', '194A', etc.)
+        payment_amount: Amount of payment
+        pan_available: Whether PAN is available ('yes' or 'no')
+        category: 'individual' or 'other'
+        regime_type: Tax regime type ('old' or 'new')
+    
+    Returns:
+        dict: TDS calculation result
+    """
+    try:
+        # Validate inputs
+        if payment_amount <= 0:
+            raise ValueError("Payment amount must be greater than 0")
+        
+        # TDS rates based on section, PAN availability, and tax regime
+        old_regime_tds_rates = {
+            '192A': {  # Payment of accumulated balance due to an employee
+                'pan_available': 10.0,
+                'pan_not_available': 20.0,
+                'threshold': 30000
+            },
+            '194A': {  # Interest other than securities
+                'pan_available': 10.0,
+                'pan_not_available': 20.0,
+                'threshold': 40000 if category == 'individual' else 40000
+            },
+            '194H': {  # Commission or brokerage
+                'pan_available': 5.0,
+                'pan_not_available': 20.0,
+                'threshold': 15000
+            },
+            '194I': {  # Rent (plant/machinery/building)
+                'pan_available': 10.0,
+                'pan_not_available': 20.0,
+                'threshold': 240000
+            },
+            '194J': {  # Fees for professional/technical services
+                'pan_available': 10.0,
+                'pan_not_available': 20.0,
+                'threshold': 30000
+            },
+            '194C': {  # Payment to contractors
+                'pan_available': 1.0,
+                'pan_not_available': 20.0,
+                'threshold': 30000
+            },
+            '194D': {  # Insurance commission
+                'pan_available': 5.0,
+                'pan_not_available': 20.0,
+                'threshold': 15000
+            },
+            '194G': {  # Commission on sale of lottery tickets
+                'pan_available': 5.0,
+                'pan_not_available': 20.0,
+                'threshold': 15000
+            },
+            '194K': {  # Payment in respect of units
+                'pan_available': 10.0,
+                'pan_not_available': 20.0,
+                'threshold': 25000
+            },
+            '194LA': {  # Payment of compensation for compulsory acquisition
+                'pan_available': 10.0,
+                'pan_not_available': 20.0,
+                'threshold': 250000
+            },
+            '194M': {  # Payment of certain sums by e-commerce operator
+                'pan_available': 0.1,
+                'pan_not_available': 5.0,
+                'threshold': 500000
+            },
+            '194N': {  # Payment in respect of cash withdrawal
+                'pan_available': 2.0,
+                'pan_not_available': 2.0,
+                'threshold': 1000000
+            },
+            '194O': {  # Payment by e-commerce operator to e-commerce participant
+                'pan_available': 1.0,
+                'pan_not_available': 5.0,
+                'threshold': 500000
+            }
+        }
+
+        # New regime TDS rates (some sections may have different rates/thresholds)
+        new_regime_tds_rates = {
+            '192A': {  # Payment of accumulated balance due to an employee
+                'pan_available': 10.0,
+                'pan_not_available': 20.0,
+                'threshold': 30000
+            },
+            '194A': {  # Interest other than securities - progressive slab rates in new regime
+                'pan_available': 'slab',  # Use slab structure
+                'pan_not_available': 20.0,
+                'threshold': 50000 if category == 'individual' else 50000,
+                'slabs': {
+                    'pan_available': [
+                        {'min': 0, 'max': 50000, 'rate': 0.0},
+                        {'min': 50001, 'max': 500000, 'rate': 10.0},
+                        {'min': 500001, 'max': float('inf'), 'rate': 15.0}
+                    ],
+                    'pan_not_available': [
+                        {'min': 0, 'max': 50000, 'rate': 0.0},
+                        {'min': 50001, 'max': float('inf'), 'rate': 20.0}
+                    ]
+                }
+            },
+            '194H': {  # Commission or brokerage
+                'pan_available': 5.0,
+                'pan_not_available': 20.0,
+                'threshold': 15000
+            },
+            '194I': {  # Rent (plant/machinery/building)
+                'pan_available': 10.0,
+                'pan_not_available': 20.0,
+                'threshold': 240000
+            },
+            '194J': {  # Fees for professional/technical services
+                'pan_available': 10.0,
+                'pan_not_available': 20.0,
+                'threshold': 30000
+            },
+            '194C': {  # Payment to contractors
+                'pan_available': 1.0,
+                'pan_not_available': 20.0,
+                'threshold': 30000
+            },
+            '194D': {  # Insurance commission
+                'pan_available': 5.0,
+                'pan_not_available': 20.0,
+                'threshold': 15000
+            },
+            '194G': {  # Commission on sale of lottery tickets
+                'pan_available': 5.0,
+                'pan_not_available': 20.0,
+                'threshold': 15000
+            },
+            '194K': {  # Payment in respect of units
+                'pan_available': 10.0,
+                'pan_not_available': 20.0,
+                'threshold': 25000
+            },
+            '194LA': {  # Payment of compensation for compulsory acquisition
+                'pan_available': 10.0,
+                'pan_not_available': 20.0,
+                'threshold': 250000
+            },
+            '194M': {  # Payment of certain sums by e-commerce operator
+                'pan_available': 0.1,
+                'pan_not_available': 5.0,
+                'threshold': 500000
+            },
+            '194N': {  # Payment in respect of cash withdrawal
+                'pan_available': 2.0,
+                'pan_not_available': 2.0,
+                'threshold': 1000000
+            },
+            '194O': {  # Payment by e-commerce operator to e-commerce participant
+                'pan_available': 1.0,
+                'pan_not_available': 5.0,
+                'threshold': 500000
+            }
+        }
+
+        # Choose the appropriate rates based on regime type
+        tds_rates = new_regime_tds_rates if regime_type == 'new' else old_regime_tds_rates
+        
+        # Get TDS rate configuration
+        if payment_type not in tds_rates:
+            raise ValueError(f"Invalid payment type: {payment_type}")
+        
+        rate_config = tds_rates[payment_type]
+        threshold = rate_config['threshold']
+        
+        # Determine applicable rate and calculate TDS
+        pan_key = 'pan_available' if pan_available.lower() == 'yes' else 'pan_not_available'
+        
+        # Check if this section uses slab structure
+        if 'slabs' in rate_config and rate_config[pan_key] == 'slab':
+            # Slab-based calculation
+            slabs = rate_config['slabs'][pan_key]
+            tds_amount = 0
+            applicable_rate = 0
+            threshold_message = ""
+            
+            if payment_amount < threshold:
+                tds_amount = 0
+                applicable_rate = 0
+                threshold_message = f"No TDS required as payment amount (₹{payment_amount:,.2f}) is below threshold (₹{threshold:,.2f})"
+            else:
+                # Calculate TDS using slab structure
+                for slab in slabs:
+                    if payment_amount >= slab['min'] and payment_amount <= slab['max']:
+                        applicable_rate = slab['rate']
+                        tds_amount = (payment_amount * applicable_rate) / 100
+                        
+                        if applicable_rate == 0:
+                            threshold_message = f"No TDS required as payment amount (₹{payment_amount:,.2f}) is below threshold (₹{threshold:,.2f})"
+                        else:
+                            # Determine which slab this falls into for messaging
+                            if applicable_rate == 15.0:
+                                threshold_message = f"TDS at {applicable_rate}% as payment amount (₹{payment_amount:,.2f}) exceeds ₹5,00,000 slab (New Regime)"
+                            else:
+                                threshold_message = f"TDS at {applicable_rate}% as payment amount (₹{payment_amount:,.2f}) exceeds threshold (₹{threshold:,.2f})"
+                        break
+        else:
+            # Traditional flat rate calculation
+            if pan_available.lower() == 'yes':
+                applicable_rate = rate_config['pan_available']
+            else:
+                applicable_rate = rate_config['pan_not_available']
+            
+            # Check if payment exceeds threshold
+            if payment_amount < threshold:
+                tds_amount = 0
+                applicable_rate = 0
+                threshold_message = f"No TDS required as payment amount (₹{payment_amount:,.2f}) is below threshold (₹{threshold:,.2f})"
+            else:
+                tds_amount = (payment_amount * applicable_rate) / 100
+                threshold_message = f"TDS applicable as payment amount (₹{payment_amount:,.2f}) exceeds threshold (₹{threshold:,.2f})"
+        
+        # Calculate net amount after TDS
+        net_amount = payment_amount - tds_amount
+        
+        return {
+            'payment_amount': payment_amount,
+            'tds_amount': round(tds_amount, 2),
+            'net_amount': round(net_amount, 2),
+            'applicable_rate': applicable_rate,
+            'threshold': threshold,
+            'threshold_message': threshold_message,
+            'payment_type': payment_type,
+            'pan_available': pan_available,
+            'category': category,
+            'regime_type': regime_type,
+            'tds_percentage': applicable_rate
+        }
+        
+    except Exception as e:
+        raise Exception(f"Error calculating TDS: {str(e)}")
+
+def calculate_tds_route():
+    try:
+        data = request.get_json()
+        
+        payment_type = data.get('payment_type', '194A')
+        payment_amount = float(data.get('payment_amount', 0))
+        pan_available = data.get('pan_available', 'yes')
+        category = data.get('category', 'individual')
+        regime_type = data.get('regime_type', 'old')
+        
+        # Calculate TDS
+        result = calculate_tds_amount(payment_type, payment_amount, pan_available, category, regime_type)
+        
+        return jsonify({
+            'status': 'success',
+            **result
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'error': str(e)
+        }), 400
+
+def hra_calculator():
+    return render_template('hra_calculator.html')
+
+def calculate_hra_exemption(basic_salary_annual, da_received_annual, hra_received_annual, rent_paid_annual, city_type):
+    """
+    Calculate HRA exemption based on Income Tax rules (Annual basis as per ClearTax)
+    
+    HRA exemption is the minimum of:
+    1. Actual HRA received
+    2. 50% of basic salary (Metro) or 40% (Non-Metro)  
+    3. Rent paid - 10% of total salary (Basic + DA)
+    
+    Returns:
+    - HRA exempt amount
+    - Taxable HRA amount
+    """
+    try:
+        # Validate inputs
+        if basic_salary_annual <= 0:
+            raise ValueError("Basic salary must be greater than 0")
+        if da_received_annual < 0:
+            raise ValueError("Dearness Allowance cannot be negative")
+        if hra_received_annual < 0:
+            raise ValueError("HRA received cannot be negative")
+        if rent_paid_annual < 0:
+            raise ValueError("Rent paid cannot be negative")
+        if city_type not in ['metro', 'non-metro']:
+            raise ValueError("City type must be 'metro' or 'non-metro'")
+        
+        # Calculate total salary (Basic + DA) as per ClearTax calculation
+        total_salary_annual = basic_salary_annual + da_received_annual
+        
+        # Calculate the three components for HRA exemption
+        # 1. Actual HRA received
+        actual_hra = hra_received_annual
+        
+        # 2. Percentage of basic salary based on city type (Note: Only basic salary, not total)
+        if city_type == 'metro':
+            salary_percentage = basic_salary_annual * 0.50  # 50% for metro cities
+        else:
+            salary_percentage = basic_salary_annual * 0.40  # 40% for non-metro cities
+        
+        # 3. Rent paid minus 10% of total salary (Basic + DA)
+        ten_percent_total_salary = total_salary_annual * 0.10
+        rent_minus_ten_percent = max(0, rent_paid_annual - ten_percent_total_salary)
+        
+        # HRA exemption is minimum of the three
+        hra_exempt = min(actual_hra, salary_percentage, rent_minus_ten_percent)
+        
+        # Taxable HRA is HRA received minus exempt amount
+        taxable_hra = max(0, hra_received_annual - hra_exempt)
+        
+        return {
+            'basic_salary_annual': basic_salary_annual,
+            'da_received_annual': da_received_annual,
+            'total_salary_annual': total_salary_annual,
+            'hra_received_annual': hra_received_annual,
+            'rent_paid_annual': rent_paid_annual,
+            'city_type': city_type,
+            'actual_hra': round(actual_hra, 2),
+            'salary_percentage': round(salary_percentage, 2),
+            'rent_minus_ten_percent': round(rent_minus_ten_percent, 2),
+            'hra_exempt': round(hra_exempt, 2),
+            'taxable_hra': round(taxable_hra, 2),
+            'ten_percent_total_salary': round(ten_percent_total_salary, 2)
+        }
+        
+    except Exception as e:
+        raise Exception(f"Error calculating HRA exemption: {str(e)}")
+
+def calculate_hra_route():
+    try:
+        data = request.get_json()
+        
+        basic_salary_annual = float(data.get('basic_salary_annual', 0))
+        da_received_annual = float(data.get('da_received_annual', 0))
+        hra_received_annual = float(data.get('hra_received_annual', 0))
+        rent_paid_annual = float(data.get('rent_paid_annual', 0))
+        city_type = data.get('city_type', 'metro').lower()
+        
+        # Calculate HRA exemption
+        result = calculate_hra_exemption(basic_salary_annual, da_received_annual, hra_received_annual, rent_paid_annual, city_type)
+        
+        return jsonify({
+            'status': 'success',
+            **result
+        })
+        
+    except Exception as e:
+        return jsonify({'status': 'error', 'error': str(e)}), 400
+
+def ctc_calculator():
+    return render_template('ctc_calculator.html')
+
+def calculate_ctc_route():
+    try:
+        data = request.get_json()
+        
+        annual_ctc = float(data.get('annual_ctc', 0))
+        basic_salary_percent = float(data.get('basic_salary_percent', 40))
+        hra_percent = float(data.get('hra_percent', 40))
+        special_allowance = float(data.get('special_allowance', 0))
+        bonus_amount = float(data.get('bonus_amount', 0))
+        employer_pf_percent = float(data.get('employer_pf_percent', 12))
+        employee_pf_percent = float(data.get('employee_pf_percent', 12))
+        gratuity_percent = float(data.get('gratuity_percent', 4.81))
+        professional_tax = float(data.get('professional_tax', 2400))
+        
+        # Tax regime and deductions
+        tax_regime = data.get('tax_regime', 'new')
+        metro_city = data.get('metro_city', True)
+        monthly_rent = float(data.get('monthly_rent', 0))
+        section_80c = float(data.get('section_80c', 0))
+        section_80ccd1b = float(data.get('section_80ccd1b', 0))
+        section_80d = float(data.get('section_80d', 0))
+        senior_citizens = data.get('senior_citizens', False)
+        include_parents = data.get('include_parents', False)
+        section_80tta = float(data.get('section_80tta', 0))
+        home_loan_interest = float(data.get('home_loan_interest', 0))
+        property_rented_out = data.get('property_rented_out', False)
+        epf_applicable = data.get('epf_applicable', True)
+        professional_tax_applicable = data.get('professional_tax_applicable', True)
+        
+        # Calculate CTC breakdown
+        result = calculate_ctc_breakdown(annual_ctc, basic_salary_percent, hra_percent, 
+                                       special_allowance, bonus_amount, employer_pf_percent, 
+                                       employee_pf_percent, gratuity_percent, professional_tax,
+                                       tax_regime, metro_city, monthly_rent, section_80c,
+                                       section_80ccd1b, section_80d, senior_citizens, include_parents,
+                                       section_80tta, home_loan_interest, property_rented_out,
+                                       epf_applicable, professional_tax_applicable)
+        
+        return jsonify({
+            'status': 'success',
+            **result
+        })
+        
+    except Exception as e:
+        return jsonify({'status': 'error', 'error': str(e)}), 400
+
+def calculate_ctc_breakdown(annual_ctc, basic_salary_percent, hra_percent, special_allowance, 
+                          bonus_amount, employer_pf_percent, employee_pf_percent, 
+                          gratuity_percent, professional_tax, tax_regime='new', metro_city=True,
+                          monthly_rent=0, section_80c=0, section_80ccd1b=0, section_80d=0,
+                          senior_citizens=False, include_parents=False, section_80tta=0,
+                          home_loan_interest=0, property_rented_out=False, epf_applicable=True,
+                          professional_tax_applicable=True):
+    """
+    Calculate detailed CTC breakdown and take-home salary with tax regime support
+    """
+    
+    # Calculate basic salary
+    basic_salary_annual = (annual_ctc * basic_salary_percent) / 100
+    basic_salary_monthly = basic_salary_annual / 12
+    
+    # Calculate HRA
+    hra_annual = (basic_salary_annual * hra_percent) / 100
+    hra_monthly = hra_annual / 12
+    
+    # Calculate employer contributions
+    employer_pf_annual = (basic_salary_annual * employer_pf_percent) / 100
+    employer_pf_monthly = employer_pf_annual / 12
+    
+    gratuity_annual = (basic_salary_annual * gratuity_percent) / 100
+    gratuity_monthly = gratuity_annual / 12
+    
+    # Calculate gross salary (CTC - employer contributions)
+    gross_salary_annual = annual_ctc - employer_pf_annual - gratuity_annual
+    gross_salary_monthly = gross_salary_annual / 12
+    
+    # Calculate employee deductions
+    employee_pf_annual = (basic_salary_annual * employee_pf_percent) / 100
+    employee_pf_monthly = employee_pf_annual / 12
+    
+    professional_tax_monthly = professional_tax / 12 if professional_tax_applicable else 0
+    
+    # Calculate HRA exemption for old regime
+    hra_exemption = 0
+    if tax_regime == 'old' and monthly_rent > 0:
+        # HRA exemption calculation
+        annual_rent = monthly_rent * 12
+        hra_percent_limit = 0.5 if metro_city else 0.4
+        hra_limit_basic = basic_salary_annual * hra_percent_limit
+        rent_minus_10_percent_basic = annual_rent - (basic_salary_annual * 0.1)
+        
+        hra_exemption = min(hra_annual, hra_limit_basic, max(0, rent_minus_10_percent_basic))
+    
+    # Calculate income tax based on regime
+    if tax_regime == 'old':
+        # Old tax regime with deductions
+        total_deductions = 0
+        
+        # Standard deduction
+        standard_deduction = min(50000, gross_salary_annual)
+        total_deductions += standard_deduction
+        
+        # EPF deduction
+        if epf_applicable:
+            total_deductions += employee_pf_annual
+        
+        # HRA exemption
+        total_deductions += hra_exemption
+        
+        # Section 80C (max 150000)
+        total_deductions += min(section_80c, 150000)
+        
+        # Section 80CCD(1B) - NPS (max 50000)
+        total_deductions += min(section_80ccd1b, 50000)
+        
+        # Section 80D - Health Insurance
+        health_insurance_limit = 25000
+        if senior_citizens:
+            health_insurance_limit = 50000
+        if include_parents:
+            health_insurance_limit += 25000 if not senior_citizens else 50000
+        total_deductions += min(section_80d, health_insurance_limit)
+        
+        # Section 80TTA - Savings Interest (max 10000)
+        total_deductions += min(section_80tta, 10000)
+        
+        # Home loan interest deduction
+        home_loan_limit = 200000 if not property_rented_out else 300000
+        total_deductions += min(home_loan_interest, home_loan_limit)
+        
+        taxable_income = max(0, gross_salary_annual - total_deductions)
+        
+        # Old regime tax slabs
+        income_tax_annual = 0
+        if taxable_income > 250000:
+            if taxable_income <= 500000:
+                income_tax_annual = (taxable_income - 250000) * 0.05
+            elif taxable_income <= 1000000:
+                income_tax_annual = 250000 * 0.05 + (taxable_income - 500000) * 0.20
+            else:
+                income_tax_annual = 250000 * 0.05 + 500000 * 0.20 + (taxable_income - 1000000) * 0.30
+    else:
+        # New tax regime (no deductions except standard deduction and EPF)
+        total_deductions = 0
+        
+        # Standard deduction
+        standard_deduction = min(50000, gross_salary_annual)
+        total_deductions += standard_deduction
+        
+        # EPF deduction (always allowed)
+        if epf_applicable:
+            total_deductions += employee_pf_annual
+        
+        taxable_income = max(0, gross_salary_annual - total_deductions)
+        
+        # New regime tax slabs (2024-25)
+        income_tax_annual = 0
+        if taxable_income > 300000:
+            if taxable_income <= 600000:
+                income_tax_annual = (taxable_income - 300000) * 0.05
+            elif taxable_income <= 900000:
+                income_tax_annual = 300000 * 0.05 + (taxable_income - 600000) * 0.10
+            elif taxable_income <= 1200000:
+                income_tax_annual = 300000 * 0.05 + 300000 * 0.10 + (taxable_income - 900000) * 0.15
+            elif taxable_income <= 1500000:
+                income_tax_annual = 300000 * 0.05 + 300000 * 0.10 + 300000 * 0.15 + (taxable_income - 1200000) * 0.20
+            else:
+                income_tax_annual = 300000 * 0.05 + 300000 * 0.10 + 300000 * 0.15 + 300000 * 0.20 + (taxable_income - 1500000) * 0.30
+    
+    income_tax_monthly = income_tax_annual / 12
+    
+    # Calculate take-home salary
+    total_deductions_monthly = employee_pf_monthly + professional_tax_monthly + income_tax_monthly
+    total_deductions_annual = total_deductions_monthly * 12
+    
+    takehome_monthly = gross_salary_monthly - total_deductions_monthly
+    takehome_annual = takehome_monthly * 12
+    
+    takehome_percentage = (takehome_annual / annual_ctc) * 100
+    
+    total_contributions_monthly = employer_pf_monthly + gratuity_monthly
+    total_contributions_annual = total_contributions_monthly * 12
+    
+    bonus_monthly = bonus_amount / 12
+    special_allowance_monthly = special_allowance / 12
+    
+    return {
+        'annual_ctc': round(annual_ctc, 2),
+        'monthly_gross': round(gross_salary_monthly, 2),
+        'monthly_takehome': round(takehome_monthly, 2),
+        'takehome_percentage': round(takehome_percentage, 2),
+        'basic_salary_monthly': round(basic_salary_monthly, 2),
+        'hra_monthly': round(hra_monthly, 2),
+        'special_allowance_monthly': round(special_allowance_monthly, 2),
+        'bonus_monthly': round(bonus_monthly, 2),
+        'gross_salary_monthly': round(gross_salary_monthly, 2),
+        'employee_pf_monthly': round(employee_pf_monthly, 2),
+        'professional_tax_monthly': round(professional_tax_monthly, 2),
+        'income_tax_monthly': round(income_tax_monthly, 2),
+        'total_deductions_monthly': round(total_deductions_monthly, 2),
+        'employer_pf_monthly': round(employer_pf_monthly, 2),
+        'gratuity_monthly': round(gratuity_monthly, 2),
+        'total_contributions_monthly': round(total_contributions_monthly, 2),
+        'takehome_annual': round(takehome_annual, 2),
+        'total_deductions_annual': round(total_deductions_annual, 2),
+        'total_contributions_annual': round(total_contributions_annual, 2),
+        'basic_salary_annual': round(basic_salary_annual, 2),
+        'hra_annual': round(hra_annual, 2),
+        'employee_pf_annual': round(employee_pf_annual, 2),
+        'employer_pf_annual': round(employer_pf_annual, 2),
+        'gratuity_annual': round(gratuity_annual, 2),
+        'income_tax_annual': round(income_tax_annual, 2),
+        'tax_regime': tax_regime,
+        'hra_exemption': round(hra_exemption, 2),
+        'taxable_income': round(taxable_income, 2)
+    }
+
+def gst_calculator():
+    return render_template('gst_calculator.html')
+
+def reverse_gst_calculator():
+    return render_template('reverse_gst_calculator.html')
+
+def calculate_gst_amounts(amount, gst_rate, calculation_type):
+    """
+    Calculate GST amounts based on amount, rate and calculation type
+    """
+    try:
+        # Validate inputs
+        if amount < 0:
+            raise ValueError("Amount cannot be negative")
+        
+        if gst_rate < 0 or gst_rate > 100:
+            raise ValueError("GST rate must be between 0 and 100")
+        
+        if calculation_type not in ['add', 'remove']:
+            raise ValueError("Calculation type must be 'add' or 'remove'")
+        
+        # Calculate based on type
+        if calculation_type == 'add':
+            # Add GST: amount is exclusive of GST
+            base_amount = amount
+            gst_amount = amount * (gst_rate / 100)
+            total_amount = amount + gst_amount
+        else:
+            # Remove GST: amount is inclusive of GST
+            total_amount = amount
+            gst_amount = amount * (gst_rate / (100 + gst_rate))
+            base_amount = amount - gst_amount
+        
+        return {
+            'original_amount': round(amount, 2),
+            'base_amount': round(base_amount, 2),
+            'gst_amount': round(gst_amount, 2),
+            'total_amount': round(total_amount, 2),
+            'gst_rate': gst_rate,
+            'calculation_type': calculation_type,
+            'gst_percentage_of_total': round((gst_amount / total_amount) * 100, 2) if total_amount > 0 else 0,
+            'effective_rate': round((gst_amount / base_amount) * 100, 2) if base_amount > 0 else 0
+        }
+        
+    except Exception as e:
+        raise ValueError(f"GST calculation error: {str(e)}")
+
+def calculate_gst():
+    try:
+        data = request.get_json()
+        
+        # Extract parameters
+        amount = float(data.get('amount', 0))
+        gst_rate = float(data.get('gst_rate', 0))
+        calculation_type = data.get('calculation_type', 'add')
+        
+        # Validate amount limit
+        if amount > 10000000:  # 1 crore limit
+            return jsonify({'error': 'Amount cannot exceed ₹1,00,00,000'})
+        
+        # Calculate GST
+        result = calculate_gst_amounts(amount, gst_rate, calculation_type)
+        
+        # Add additional information
+        result['calculation_summary'] = generate_gst_summary(result)
+        result['breakdown_steps'] = generate_gst_breakdown_steps(result)
+        
+        return jsonify(result)
+        
+    except ValueError as e:
+        return jsonify({'error': str(e)})
+    except Exception as e:
+        return jsonify({'error': f'Calculation failed: {str(e)}'})
+
+def calculate_reverse_gst():
+    try:
+        data = request.get_json()
+        
+        # Extract parameters
+        inclusive_amount = float(data.get('inclusive_amount', 0))
+        gst_rate = float(data.get('gst_rate', 0))
+        transaction_type = data.get('transaction_type', 'intra-state')
+        
+        # Validate inputs
+        if inclusive_amount <= 0:
+            return jsonify({'error': 'Amount must be greater than 0'})
+        
+        if inclusive_amount > 20000000:  # 2 crore limit
+            return jsonify({'error': 'Amount cannot exceed ₹2,00,00,000'})
+        
+        if gst_rate < 0 or gst_rate > 100:
+            return jsonify({'error': 'GST rate must be between 0 and 100'})
+        
+        if transaction_type not in ['intra-state', 'inter-state']:
+            return jsonify({'error': 'Transaction type must be intra-state or inter-state'})
+        
+        # Calculate reverse GST
+        result = calculate_reverse_gst_amounts(inclusive_amount, gst_rate, transaction_type)
+        
+        # Add additional information
+        result['calculation_summary'] = generate_reverse_gst_summary(result)
+        
+        return jsonify(result)
+        
+    except ValueError as e:
+        return jsonify({'error': str(e)})
+    except Exception as e:
+        return jsonify({'error': f'Calculation failed: {str(e)}'})
+
+def calculate_reverse_gst_amounts(inclusive_amount, gst_rate, transaction_type):
+    """
+    Calculate reverse GST amounts from inclusive amount
+    """
+    try:
+        # Calculate base price and GST amount
+        base_price = inclusive_amount / (1 + (gst_rate / 100))
+        gst_amount = inclusive_amount - base_price
+        
+        # Initialize tax components
+        cgst = 0
+        sgst = 0
+        igst = 0
+        
+        if transaction_type == 'intra-state':
+            # For intra-state: CGST + SGST = GST Amount
+            cgst = gst_amount / 2
+            sgst = gst_amount / 2
+        else:
+            # For inter-state: IGST = GST Amount
+            igst = gst_amount
+        
+        return {
+            'inclusive_amount': round(inclusive_amount, 2),
+            'base_price': round(base_price, 2),
+            'gst_amount': round(gst_amount, 2),
+            'gst_rate': gst_rate,
+            'transaction_type': transaction_type,
+            'cgst': round(cgst, 2),
+            'sgst': round(sgst, 2),
+            'igst': round(igst, 2),
+            'gst_percentage_of_total': round((gst_amount / inclusive_amount) * 100, 2) if inclusive_amount > 0 else 0,
+            'effective_rate': round((gst_amount / base_price) * 100, 2) if base_price > 0 else 0
+        }
+        
+    except Exception as e:
+        raise ValueError(f"Reverse GST calculation error: {str(e)}")
+
+def generate_reverse_gst_summary(result):
+    """Generate a text summary of the reverse GST calculation"""
+    summary = f"₹{result['inclusive_amount']:,.2f} includes ₹{result['gst_amount']:,.2f} in GST at {result['gst_rate']}%.\n"
+    summary += f"• Base Price: ₹{result['base_price']:,.2f}\n"
+    summary += f"• GST Amount: ₹{result['gst_amount']:,.2f}\n"
+    
+    if result['transaction_type'] == 'intra-state':
+        summary += f"• CGST ({result['gst_rate']/2}%): ₹{result['cgst']:,.2f}\n"
+        summary += f"• SGST ({result['gst_rate']/2}%): ₹{result['sgst']:,.2f}"
+    else:
+        summary += f"• IGST ({result['gst_rate']}%): ₹{result['igst']:,.2f}"
+    
+    return summary
+
+def generate_gst_summary(result):
+    """Generate a text summary of the GST calculation"""
+    type_text = "Add GST (Exclusive)" if result['calculation_type'] == 'add' else "Remove GST (Inclusive)"
+    
+    summary = f"For an amount of ₹{result['original_amount']:,.2f} with {result['gst_rate']}% GST ({type_text}):\n"
+    summary += f"• Base Amount: ₹{result['base_amount']:,.2f}\n"
+    summary += f"• GST Amount: ₹{result['gst_amount']:,.2f}\n"
+    summary += f"• Total Amount: ₹{result['total_amount']:,.2f}"
+    
+    return summary
+
+def generate_gst_breakdown_steps(result):
+    """Generate step-by-step calculation breakdown"""
+    steps = []
+    
+    if result['calculation_type'] == 'add':
+        steps.append(f"Step 1: Base Amount = ₹{result['original_amount']:,.2f} (given)")
+        steps.append(f"Step 2: GST Amount = Base Amount × (GST Rate / 100)")
+        steps.append(f"Step 2: GST Amount = ₹{result['base_amount']:,.2f} × ({result['gst_rate']} / 100)")
+        steps.append(f"Step 2: GST Amount = ₹{result['gst_amount']:,.2f}")
+        steps.append(f"Step 3: Total Amount = Base Amount + GST Amount")
+        steps.append(f"Step 3: Total Amount = ₹{result['base_amount']:,.2f} + ₹{result['gst_amount']:,.2f}")
+        steps.append(f"Step 3: Total Amount = ₹{result['total_amount']:,.2f}")
+    else:
+        steps.append(f"Step 1: Total Amount = ₹{result['original_amount']:,.2f} (given)")
+        steps.append(f"Step 2: GST Amount = Total Amount × (GST Rate / (100 + GST Rate))")
+        steps.append(f"Step 2: GST Amount = ₹{result['total_amount']:,.2f} × ({result['gst_rate']} / (100 + {result['gst_rate']}))")
+        steps.append(f"Step 2: GST Amount = ₹{result['gst_amount']:,.2f}")
+        steps.append(f"Step 3: Base Amount = Total Amount - GST Amount")
+        steps.append(f"Step 3: Base Amount = ₹{result['total_amount']:,.2f} - ₹{result['gst_amount']:,.2f}")
+        steps.append(f"Step 3: Base Amount = ₹{result['base_amount']:,.2f}")
+    
+    return steps
+
+def capital_gains_calculator_with_and_without_tax_slabs():
+    """
+    Capital Gains Calculator (With & Without Tax Slabs)
+    
+    Calculates capital gains tax for various asset types including:
+    - Equity shares and mutual funds
+    - Debt mutual funds
+    - Property
+    - Gold and unlisted shares
+    - Crypto (VDA)
+    
+    Features:
+    - STCG/LTCG classification based on holding period
+    - Indexation benefits where applicable
+    - Tax exemptions (Section 54/54F/54EC for property, LTCG exemptions for equity)
+    - Tax calculation with and without income tax slab impact
+    - Cess and surcharge calculations
+    """
+    return render_template('capital_gains_calculator_with_and_without_tax_slabs.html')
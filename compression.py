@@ -0,0 +1,111 @@
+import gzip
+import os
+
+from flask import request
+
+import page_cache
+import response_cache
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Disabled with COMPRESSION_ENABLED=0. Bodies smaller than COMPRESSION_MIN_BYTES
+# are sent as they are: they fit in a packet or two and compressing only adds latency.
+COMPRESSION_ENABLED = os.environ.get('COMPRESSION_ENABLED', '1') != '0'
+COMPRESSION_MIN_BYTES = int(os.environ.get('COMPRESSION_MIN_BYTES', 1024))
+
+# Levels tuned for per-request latency rather than ratio; build-time
+# pre-compression (prerender.py) uses the maximum levels instead
+COMPRESSION_GZIP_LEVEL = int(os.environ.get('COMPRESSION_GZIP_LEVEL', 5))
+COMPRESSION_BROTLI_QUALITY = int(os.environ.get('COMPRESSION_BROTLI_QUALITY', 4))
+
+# Compressed variants of responses that carry an ETag (cached calculation
+# results and pages), keyed by the ETag of the representation they produce
+COMPRESSION_CACHE_MAX_BYTES = int(os.environ.get('COMPRESSION_CACHE_MAX_BYTES', 16 * 1024 * 1024))
+
+COMPRESSIBLE_MIMETYPES = {
+    'application/json',
+    'application/x-ndjson',
+    'application/javascript',
+    'image/svg+xml',
+    'text/css',
+    'text/csv',
+    'text/html',
+    'text/javascript',
+    'text/plain'
+}
+
+ENCODINGS = ('br', 'gzip') if brotli is not None else ('gzip',)
+
+variants = response_cache.ResponseCache(COMPRESSION_CACHE_MAX_BYTES, ttl=0)
+
+def compress(body, encoding):
+    if encoding == 'br':
+        return brotli.compress(body, quality=COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=COMPRESSION_GZIP_LEVEL, mtime=0)
+
+def encoded_etag(etag, encoding):
+    """
+    ETag of an encoded representation, following the pages' '<etag>-<encoding>'
+    """
+    return f'{etag}-{encoding}'
+
+def compressible(response):
+    if response.status_code != 200 or response.is_streamed or response.direct_passthrough:
+        return False
+    if 'Content-Encoding' in response.headers or response.mimetype not in COMPRESSIBLE_MIMETYPES:
+        return False
+    return len(response.get_data()) >= COMPRESSION_MIN_BYTES
+
+def compressed_body(response, encoding, tag):
+    """
+    The response body in `encoding`, from the variant cache when the
+    response has an ETag
+    """
+    if tag is not None:
+        entry = variants.get(tag)
+        if entry is not None:
+            return entry['body']
+
+    data = compress(response.get_data(), encoding)
+    if tag is not None:
+        variants.set(tag, data, 200, response.mimetype)
+    return data
+
+def compress_response(response):
+    """
+    Negotiate brotli/gzip for a large text response, answering 304 when the
+    client already holds the encoded representation
+    """
+    if not compressible(response):
+        return response
+
+    response.vary.add('Accept-Encoding')
+    encoding = page_cache.preferred_encoding(ENCODINGS)
+    if encoding is None:
+        return response
+
+    etag, _ = response.get_etag()
+    tag = encoded_etag(etag, encoding) if etag else None
+    if tag is not None and tag in request.if_none_match:
+        response.status_code = 304
+        response.set_data(b'')
+    else:
+        response.set_data(compressed_body(response, encoding, tag))
+        response.headers['Content-Encoding'] = encoding
+    if tag is not None:
+        response.set_etag(tag)
+    return response
+
+def init_app(app):
+    """
+    Content-negotiated compression of responses. Register it before the
+    caches: after_request hooks run in reverse order, so it then sees their
+    final identity bodies and ETags.
+    """
+    if not COMPRESSION_ENABLED:
+        return
+
+    app.after_request(compress_response)
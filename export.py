@@ -0,0 +1,250 @@
+import hashlib
+import json
+import os
+import re
+import zipfile
+from xml.sax.saxutils import escape
+
+import response_cache
+import streaming
+
+# Exports of the same scenario are served from memory unless EXPORT_CACHE_ENABLED=0.
+# Documents larger than EXPORT_CACHE_ENTRY_MAX_BYTES are streamed but not kept.
+EXPORT_CACHE_ENABLED = os.environ.get('EXPORT_CACHE_ENABLED', '1') != '0'
+EXPORT_CACHE_MAX_BYTES = int(os.environ.get('EXPORT_CACHE_MAX_BYTES', 32 * 1024 * 1024))
+EXPORT_CACHE_ENTRY_MAX_BYTES = int(os.environ.get('EXPORT_CACHE_ENTRY_MAX_BYTES', 4 * 1024 * 1024))
+EXPORT_CACHE_TTL = float(os.environ.get('EXPORT_CACHE_TTL', 3600))
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'pdf': 'application/pdf'
+}
+
+# A4 landscape in points, with the table set in 8pt Courier (4.8pt per character)
+# and columns at least PDF_COLUMN_WIDTH characters wide
+PDF_PAGE_WIDTH = 842
+PDF_PAGE_HEIGHT = 595
+PDF_MARGIN = 36
+PDF_FONT_SIZE = 8
+PDF_LEADING = 11
+PDF_COLUMN_WIDTH = 15
+PDF_ROWS_PER_PAGE = (PDF_PAGE_HEIGHT - 2 * PDF_MARGIN) // PDF_LEADING - 3
+
+cache = response_cache.ResponseCache(EXPORT_CACHE_MAX_BYTES, EXPORT_CACHE_TTL)
+
+def column_title(key):
+    """
+    loanPaidPercentage / total_payment -> Loan Paid Percentage / Total Payment
+    """
+    words = re.sub(r'([a-z])([A-Z])', r'\1 \2', key).replace('_', ' ').split()
+    return ' '.join(word[:1].upper() + word[1:] for word in words)
+
+def csv_chunks(rows, title):
+    for chunk in streaming.csv_chunks(rows):
+        yield chunk.encode('utf-8')
+
+class ChunkBuffer:
+    """
+    Write-only file object collecting what zipfile writes until it is drained
+    into the response
+    """
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self.chunks)
+        self.chunks.clear()
+        return data
+
+XLSX_PARTS = {
+    '[Content_Types].xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    ),
+    '_rels/.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    'xl/_rels/workbook.xml.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+        '</Relationships>'
+    ),
+    'xl/workbook.xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Schedule" sheetId="1" r:id="rId1"/></sheets>'
+        '</workbook>'
+    )
+}
+
+def xlsx_cell(value):
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return f'<c><v>{value}</v></c>'
+    return f'<c t="inlineStr"><is><t>{escape(str(value))}</t></is></c>'
+
+def xlsx_row(values):
+    return '<row>' + ''.join(xlsx_cell(value) for value in values) + '</row>'
+
+def xlsx_chunks(rows, title):
+    """
+    Single-sheet workbook written as a zip stream: the worksheet XML is
+    deflated a block of rows at a time and only the compressed bytes are
+    held between chunks
+    """
+    buffer = ChunkBuffer()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as workbook:
+        for name, content in XLSX_PARTS.items():
+            workbook.writestr(name, content)
+        yield buffer.drain()
+
+        with workbook.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as sheet:
+            sheet.write(b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                        b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>')
+            keys = None
+            for count, row in enumerate(rows, start=1):
+                if keys is None:
+                    keys = list(row)
+                    sheet.write(xlsx_row(column_title(key) for key in keys).encode('utf-8'))
+                sheet.write(xlsx_row(row.get(key, '') for key in keys).encode('utf-8'))
+                if count % streaming.ROWS_PER_CHUNK == 0:
+                    yield buffer.drain()
+            sheet.write(b'</sheetData></worksheet>')
+    yield buffer.drain()
+
+def pdf_text(value):
+    text = str(value).encode('latin-1', 'replace').decode('latin-1')
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+def pdf_line(values, widths):
+    return ''.join(str(value).rjust(width) for value, width in zip(values, widths))
+
+def pdf_chunks(rows, title):
+    """
+    Monospaced table in Courier, one page object written per
+    PDF_ROWS_PER_PAGE rows. Objects 1-3 (catalog, page tree, font) are
+    reserved; the page tree is written last, once every page is known, and
+    only the byte offsets of the objects are kept for the xref table.
+    """
+    offsets = {}
+    position = 0
+    page_ids = []
+    next_id = 4
+
+    def write_object(object_id, body):
+        nonlocal position
+        offsets[object_id] = position
+        data = f'{object_id} 0 obj\n'.encode('latin-1') + body + b'\nendobj\n'
+        position += len(data)
+        return data
+
+    def page(lines, number):
+        nonlocal next_id
+        content_id, page_id = next_id, next_id + 1
+        next_id += 2
+        top = PDF_PAGE_HEIGHT - PDF_MARGIN - PDF_FONT_SIZE
+        text = [f'BT /F1 {PDF_FONT_SIZE} Tf {PDF_LEADING} TL {PDF_MARGIN} {top} Td',
+                f'({pdf_text(title)}  -  page {number}) Tj T* T*']
+        text.extend(f'({pdf_text(line)}) Tj T*' for line in lines)
+        text.append('ET')
+        stream = '\n'.join(text).encode('latin-1')
+        page_ids.append(page_id)
+        return (write_object(content_id, f'<< /Length {len(stream)} >>\nstream\n'.encode('latin-1') + stream + b'\nendstream')
+                + write_object(page_id, f'<< /Type /Page /Parent 2 0 R /Contents {content_id} 0 R >>'.encode('latin-1')))
+
+    header = b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n'
+    position = len(header)
+    yield (header
+           + write_object(1, b'<< /Type /Catalog /Pages 2 0 R >>')
+           + write_object(3, b'<< /Type /Font /Subtype /Type1 /BaseFont /Courier /Encoding /WinAnsiEncoding >>'))
+
+    heading = None
+    lines = []
+    for row in rows:
+        if heading is None:
+            keys = list(row)
+            titles = [column_title(key) for key in keys]
+            widths = [max(PDF_COLUMN_WIDTH, len(title) + 2) for title in titles]
+            heading = pdf_line(titles, widths)
+        lines.append(pdf_line((row.get(key, '') for key in keys), widths))
+        if len(lines) == PDF_ROWS_PER_PAGE:
+            yield page([heading] + lines, len(page_ids) + 1)
+            lines = []
+    if lines or not page_ids:
+        yield page(([heading] if heading else []) + lines, len(page_ids) + 1)
+
+    kids = ' '.join(f'{page_id} 0 R' for page_id in page_ids)
+    page_tree = write_object(2, (f'<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} '
+                                 f'/MediaBox [0 0 {PDF_PAGE_WIDTH} {PDF_PAGE_HEIGHT}] '
+                                 f'/Resources << /Font << /F1 3 0 R >> >> >>').encode('latin-1'))
+    xref = [f'xref\n0 {next_id}\n', '0000000000 65535 f \n']
+    xref.extend(f'{offsets[object_id]:010d} 00000 n \n' for object_id in range(1, next_id))
+    xref.append(f'trailer\n<< /Size {next_id} /Root 1 0 R >>\nstartxref\n{position}\n%%EOF\n')
+    yield page_tree + ''.join(xref).encode('latin-1')
+
+WRITERS = {
+    'csv': csv_chunks,
+    'xlsx': xlsx_chunks,
+    'pdf': pdf_chunks
+}
+
+def export_cache_key(name, output_format, data):
+    canonical = json.dumps(data, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(f'{name}\n{output_format}\n{canonical}'.encode('utf-8')).hexdigest()
+
+def cached_chunks(chunks, key, mimetype, headers):
+    """
+    Pass chunks through to the client, storing the finished document in the
+    export cache unless it outgrows EXPORT_CACHE_ENTRY_MAX_BYTES
+    """
+    kept = []
+    size = 0
+    for chunk in chunks:
+        if kept is not None:
+            size += len(chunk)
+            if size > EXPORT_CACHE_ENTRY_MAX_BYTES:
+                kept = None
+            else:
+                kept.append(chunk)
+        yield chunk
+    if kept is not None:
+        cache.set(key, b''.join(kept), 200, mimetype, headers)
+
+def export_response(app, name, output_format, data, rows, title):
+    """
+    Streamed CSV/XLSX/PDF download of a schedule, or the stored document when
+    the same scenario was exported before. `rows` is only called on a miss.
+    """
+    mimetype = EXPORT_FORMATS[output_format]
+    headers = {'Content-Disposition': f'attachment; filename={name}.{output_format}'}
+    key = export_cache_key(name, output_format, data) if EXPORT_CACHE_ENABLED else None
+
+    if key is not None:
+        entry = cache.get(key)
+        if entry is not None:
+            return response_cache.cached_response(app, entry)
+
+    chunks = WRITERS[output_format](rows(), title)
+    if key is not None:
+        chunks = cached_chunks(chunks, key, mimetype, headers)
+    response = app.response_class(chunks, mimetype=mimetype)
+    response.headers.extend(headers)
+    return response
@@ -0,0 +1,129 @@
+import os
+import sys
+import time
+
+from flask import has_request_context, request
+from flask.json.provider import DefaultJSONProvider
+
+import metrics
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# JSON_COMPACT=1 skips key sorting and indentation even in debug mode
+JSON_COMPACT = os.environ.get('JSON_COMPACT', '0') == '1'
+
+# NumPy arrays and scalars in a response are rounded to this many decimal
+# places by the encoder, in one vectorized pass per array
+JSON_FLOAT_DECIMALS = int(os.environ.get('JSON_FLOAT_DECIMALS', 2))
+
+# ?format=columnar sends the schedules and per-period breakdowns listed in
+# COLUMNAR_KEYS as one header of field names and a parallel array per field
+COLUMNAR_FORMAT = 'columnar'
+
+COLUMNAR_KEYS = frozenset({
+    'amortizationSchedule', 'balanceSchedule', 'comparisonSchedule', 'comparison_data', 'cumulative_flows',
+    'existingSchedule', 'growth_table', 'half_yearly_data', 'month_wise_data', 'monthlyBreakdown', 'monthlyData',
+    'monthlyDetails', 'monthly_breakdown', 'monthly_data', 'newSchedule', 'originalYearlyBreakdown',
+    'paymentSchedule', 'payment_schedule', 'quarterly_breakdown', 'schedule', 'year_wise_data', 'yearlyBreakdown',
+    'yearlyPaymentSchedule', 'yearlySchedule', 'yearly_breakdown', 'yearly_data', 'yearly_summary'
+})
+
+def to_columnar(value, key=None):
+    """
+    [{'year': 2025, 'balance': 10.0}, {'year': 2026, 'balance': 0.0}] ->
+    {'columns': ['year', 'balance'], 'values': [[2025, 2026], [10.0, 0.0]]}
+
+    Only lists under one of COLUMNAR_KEYS whose items are all dicts with the
+    same keys are converted; other lists (e.g. the /batch results) keep their
+    records, and schedules nested anywhere (e.g. monthly_data) are converted
+    in turn.
+    """
+    if isinstance(value, dict):
+        return {name: to_columnar(item, name) for name, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        if key in COLUMNAR_KEYS and value and all(isinstance(item, dict) for item in value):
+            keys = value[0].keys()
+            if all(item.keys() == keys for item in value):
+                columns = list(keys)
+                return {
+                    'columns': columns,
+                    'values': [to_columnar([item[column] for item in value], column) for column in columns]
+                }
+        return [to_columnar(item, key) for item in value]
+    return value
+
+def columnar_requested():
+    return has_request_context() and request.args.get('format') == COLUMNAR_FORMAT
+
+def quantize(o):
+    """
+    Encoder fallback for NumPy values, quantized to JSON_FLOAT_DECIMALS
+    """
+    # NumPy is only imported by the calculator modules; until then no value can be an array
+    np = sys.modules.get('numpy')
+    if np is None:
+        return DefaultJSONProvider.default(o)
+    if isinstance(o, np.ndarray):
+        if np.issubdtype(o.dtype, np.floating):
+            o = np.round(o, JSON_FLOAT_DECIMALS)
+        return o.tolist()
+    if isinstance(o, np.floating):
+        return round(float(o), JSON_FLOAT_DECIMALS)
+    if isinstance(o, (np.integer, np.bool_)):
+        return o.item()
+    return DefaultJSONProvider.default(o)
+
+class AppJSONProvider(DefaultJSONProvider):
+    """
+    Encodes with orjson when it is installed, quantizes NumPy values and
+    reshapes the body for ?format=columnar before it is encoded
+    """
+
+    default = staticmethod(quantize)
+    sort_keys = not JSON_COMPACT
+    compact = True if JSON_COMPACT else None
+
+    def indented(self):
+        return self.compact is False or (self.compact is None and self._app.debug)
+
+    def dumps(self, obj, **kwargs):
+        if orjson is None or kwargs:
+            kwargs.setdefault('default', self.default)
+            kwargs.setdefault('ensure_ascii', self.ensure_ascii)
+            kwargs.setdefault('sort_keys', self.sort_keys)
+            return super().dumps(obj, **kwargs)
+        return self.encode(obj, indent=False).decode('utf-8')
+
+    def encode(self, obj, indent):
+        """
+        UTF-8 encoded JSON; dates and dataclasses go through default() so
+        they encode the same as with the standard library
+        """
+        if orjson is None:
+            separators = None if indent else (',', ':')
+            return super().dumps(obj, default=self.default, ensure_ascii=self.ensure_ascii, sort_keys=self.sort_keys,
+                                 indent=2 if indent else None, separators=separators).encode('utf-8')
+
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def response(self, *args, **kwargs):
+        if args and kwargs:
+            raise TypeError('app.json.response() takes either args or kwargs, not both')
+        obj = args[0] if len(args) == 1 else list(args) if args else kwargs
+        started = time.perf_counter()
+        if columnar_requested():
+            obj = to_columnar(obj)
+        body = self.encode(obj, self.indented()) + b'\n'
+        metrics.observe_json(obj, time.perf_counter() - started)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+def init_app(app):
+    app.json = AppJSONProvider(app)
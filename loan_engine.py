@@ -0,0 +1,560 @@
+import os
+from datetime import datetime
+from itertools import islice
+
+import numpy as np
+
+import amortization
+from result_cache import memoize
+
+# Longest tenure accepted by the loan products, in years
+MAX_TENURE_YEARS = 100
+
+# Rows of a daily/weekly/monthly/quarterly schedule returned in a JSON
+# response; longer schedules are truncated and flagged, the full schedule
+# is available from /stream-schedule/<product>
+JSON_SCHEDULE_MAX_ROWS = int(os.environ.get('JSON_SCHEDULE_MAX_ROWS', 1200))
+
+def calculate_emi(principal, annual_rate, tenure_months, emi_advance=False):
+    """
+    Calculate EMI using the standard formula
+    EMI = P * r * (1+r)^n / ((1+r)^n - 1)
+    """
+    # Convert annual rate to monthly rate
+    monthly_rate = annual_rate / (12 * 100)
+    
+    return amortization.level_payment(principal, monthly_rate, tenure_months, emi_advance)
+
+@memoize()
+def calculate_yearly_payment_schedule(principal, annual_rate, tenure_months, emi_advance=False, start_year=2025, start_month=1):
+    """
+    Calculate yearly amortization schedule with detailed payment breakdown and monthly data
+    """
+    emi = calculate_emi(principal, annual_rate, tenure_months, emi_advance)
+    monthly_rate = annual_rate / (12 * 100)
+    
+    # Every month's split in one pass; dicts are only built for the response
+    interest, principal_paid, balance = amortization.amortize(principal, monthly_rate, tenure_months, emi)
+    loan_paid_percentage = amortization.paid_percentage(principal, balance)
+    
+    # The first year only covers the months from start_month onwards
+    starts = amortization.year_starts(tenure_months, 12 - (start_month - 1))
+    ends = amortization.year_ends(starts, tenure_months)
+    months_in_year = (ends - starts + 1).tolist()
+    
+    month_names = [amortization.MONTH_NAMES[(start_month - 1 + k) % 12] for k in range(tenure_months)]
+    month_principal = amortization.rounded(principal_paid)
+    month_interest = amortization.rounded(interest)
+    month_balance = amortization.rounded(np.maximum(balance, 0))
+    month_paid = amortization.rounded(loan_paid_percentage)
+    emi_rounded = round(emi, 2)
+    
+    year_principal = amortization.rounded(amortization.yearly_sums(principal_paid, starts))
+    year_interest = amortization.rounded(amortization.yearly_sums(interest, starts))
+    
+    yearly_schedule = []
+    for year_idx, (start, end) in enumerate(zip(starts.tolist(), ends.tolist())):
+        monthly_data = [{
+            'month': month_names[k],
+            'principal': month_principal[k],
+            'interest': month_interest[k],
+            'total_payment': emi_rounded,
+            'balance': month_balance[k],
+            'loan_paid_percentage': month_paid[k]
+        } for k in range(start, end + 1)]
+        
+        yearly_schedule.append({
+            'year': start_year + year_idx,
+            'principal': year_principal[year_idx],
+            'interest': year_interest[year_idx],
+            'total_payment': round(emi * months_in_year[year_idx], 2),
+            'balance': month_balance[end],
+            'loan_paid_percentage': month_paid[end],
+            'months_in_year': months_in_year[year_idx],
+            'monthly_data': monthly_data
+        })
+        
+        # Stop if loan is fully paid
+        if balance[end] <= 0:
+            break
+    
+    return yearly_schedule
+
+@memoize()
+def calculate_amortization_schedule(principal, annual_rate, tenure_months, emi_advance=False):
+    """
+    Calculate detailed amortization schedule
+    """
+    emi = calculate_emi(principal, annual_rate, tenure_months, emi_advance)
+    monthly_rate = annual_rate / (12 * 100)
+    
+    interest, principal_paid, balance = amortization.amortize(principal, monthly_rate, tenure_months, emi)
+    
+    emi_rounded = round(emi, 2)
+    schedule = [{
+        'month': month,
+        'emi': emi_rounded,
+        'principal': principal_payment,
+        'interest': interest_payment,
+        'balance': remaining
+    } for month, principal_payment, interest_payment, remaining in zip(
+        range(1, tenure_months + 1),
+        amortization.rounded(principal_paid),
+        amortization.rounded(interest),
+        amortization.rounded(np.maximum(balance, 0))
+    )]
+    
+    return schedule, float(interest.sum())
+
+# Declarative configuration for the EMI products served by calculate_loan_product.
+# 'amount' is the request field holding the price or loan amount, 'tenure' maps
+# tenure fields to the number of periods they represent and 'layout' picks the
+# response shape the product's page expects.
+LOAN_PRODUCTS = {
+    'emi': {
+        'amount': 'loanAmount',
+        'tenure': {'tenureYears': 12, 'tenureMonths': 1},
+        'schedule': 'yearly',
+        'start_year_default': 2024,
+        'layout': 'emi',
+        'error_status': 400
+    },
+    'car_loan': {
+        'amount': 'carLoanAmount',
+        'tenure': {'tenureYears': 12, 'tenureMonths': 1},
+        'emi_scheme': 'emiScheme',
+        'layout': 'summary',
+        'tenure_error': 'Invalid tenure',
+        'log_label': 'car loan'
+    },
+    'two_wheeler_loan': {
+        'amount': 'carLoanAmount',
+        'tenure': {'tenureYears': 12, 'tenureMonths': 1},
+        'emi_scheme': 'emiScheme',
+        'layout': 'summary',
+        'tenure_error': 'Invalid tenure',
+        'log_label': 'two wheeler loan'
+    },
+    'personal_loan': {
+        'amount': 'carLoanAmount',
+        'tenure': {'tenureYears': 12, 'tenureMonths': 1},
+        'emi_scheme': 'emiScheme',
+        'layout': 'summary',
+        'tenure_error': 'Invalid tenure',
+        'log_label': 'personal loan'
+    },
+    'business_loan': {
+        'amount': 'carLoanAmount',
+        'tenure': {'tenureYears': 12, 'tenureMonths': 1},
+        'emi_scheme': 'emiScheme',
+        'layout': 'summary',
+        'tenure_error': 'Invalid tenure',
+        'log_label': 'business loan'
+    },
+    'land_loan': {
+        'amount': 'landPrice',
+        'rate_default': 10.5,
+        'tenure': {'tenureMonths': 1},
+        'schedule': 'yearly',
+        'layout': 'financed_asset',
+        'amount_error': 'Invalid land price',
+        'tenure_error': 'Invalid tenure'
+    },
+    'commercial_property_loan': {
+        'amount': 'propertyPrice',
+        'rate_default': 11.5,
+        'tenure': {'tenureMonths': 1},
+        'schedule': 'yearly',
+        'layout': 'financed_asset',
+        'amount_error': 'Invalid property price',
+        'tenure_error': 'Invalid tenure'
+    },
+    'commercial_vehicle_loan': {
+        'amount': 'vehiclePrice',
+        'rate_default': 8.5,
+        'tenure': {'tenureMonths': 1},
+        'schedule': 'yearly',
+        'layout': 'financed_asset',
+        'amount_error': 'Invalid vehicle price',
+        'tenure_error': 'Invalid tenure'
+    },
+    'tractor_loan': {
+        'amount': 'tractorPrice',
+        'rate_default': 6.5,
+        'tenure': {'tenureMonths': 1},
+        'schedule': 'yearly',
+        'layout': 'financed_asset',
+        'amount_error': 'Invalid tractor price',
+        'tenure_error': 'Invalid tenure'
+    },
+    'loan_against_property': {
+        'amount': 'propertyValue',
+        'rate_default': 10.5,
+        'tenure': {'tenureMonths': 1},
+        'schedule': 'yearly',
+        'layout': 'financed_asset',
+        'amount_error': 'Invalid property value',
+        'tenure_error': 'Invalid tenure'
+    },
+    'mobile_phone_loan': {
+        'amount': 'phonePrice',
+        'down_payment': 'downPayment',
+        'rate_default': 18,
+        'tenure': {'tenureMonths': 1},
+        'schedule': 'dated',
+        'layout': 'down_payment',
+        'amount_error': 'Down payment cannot be equal to or greater than phone price',
+        'tenure_error': 'Invalid tenure'
+    },
+    'laptop_loan': {
+        'amount': 'laptopPrice',
+        'down_payment': 'downPayment',
+        'rate_default': 18,
+        'tenure': {'tenureMonths': 1},
+        'schedule': 'dated',
+        'layout': 'down_payment',
+        'amount_error': 'Down payment cannot be equal to or greater than laptop price',
+        'tenure_error': 'Invalid tenure'
+    },
+    'credit_card': {
+        'amount': 'transactionAmount',
+        'tenure': {'tenureMonths': 1},
+        'fees': 'processingFees',
+        'gst_rate': 0.18,
+        'schedule': 'dated',
+        'layout': 'credit_card'
+    },
+    'daily': {
+        'amount': 'principal',
+        'tenure': {'tenureDays': 1},
+        'periods_per_year': 365,
+        'period': ('day', 'Day', 'daily'),
+        'schedule': 'periodic',
+        'layout': 'periodic',
+        'tenure_error': 'Invalid tenure'
+    },
+    'weekly': {
+        'amount': 'principal',
+        'tenure': {'tenureWeeks': 1},
+        'periods_per_year': 52,
+        'period': ('week', 'Week', 'weekly'),
+        'schedule': 'periodic',
+        'layout': 'periodic',
+        'tenure_error': 'Invalid tenure'
+    },
+    'monthly': {
+        'amount': 'principal',
+        'tenure': {'tenureMonths': 1},
+        'period': ('month', 'Month', 'monthly'),
+        'schedule': 'periodic',
+        'layout': 'periodic',
+        'tenure_error': 'Invalid tenure'
+    },
+    'quarterly': {
+        'amount': 'principal',
+        'tenure': {'tenureQuarters': 1},
+        'periods_per_year': 4,
+        'period': ('quarter', None, 'quarterly'),
+        'schedule': 'periodic',
+        'layout': 'periodic',
+        'amount_error': 'Invalid input values',
+        'tenure_error': 'Invalid input values'
+    }
+}
+
+def parse_loan_inputs(config, data):
+    """
+    Read a product's request fields into the common loan parameters
+    """
+    price = float(data.get(config['amount'], 0))
+    down_payment = float(data.get(config['down_payment'], 0)) if 'down_payment' in config else 0
+    periods = sum(int(data.get(field, 0)) * multiplier for field, multiplier in config['tenure'].items())
+    emi_scheme_field = config.get('emi_scheme')
+
+    return {
+        'price': price,
+        'down_payment': down_payment,
+        'principal': price - down_payment,
+        'annual_rate': float(data.get('interestRate', config.get('rate_default', 0))),
+        'periods': periods,
+        'advance': bool(emi_scheme_field) and data.get(emi_scheme_field, 'arrears') == 'advance',
+        'fees': float(data.get(config['fees'], 0)) if 'fees' in config else 0,
+        'start_year': int(data.get('startYear', config.get('start_year_default', 2025))),
+        'start_month': int(data.get('startMonth', 1))
+    }
+
+def dated_rows(principal, periodic_rate, periods, emi, gst_rate=None):
+    """
+    Monthly rows labelled with calendar months from today, stopping once the
+    balance is cleared, generated a block of periods at a time
+    """
+    first_month = datetime.now().month - 1
+    emi_rounded = round(emi, 2)
+
+    k = 0
+    for interest, principal_paid, balance in amortization.amortize_chunks(principal, periodic_rate, periods, emi, clamp=True):
+        paid_periods = amortization.active_periods(balance)
+        columns = [
+            amortization.rounded(principal_paid[:paid_periods]),
+            amortization.rounded(interest[:paid_periods]),
+            amortization.rounded(balance[:paid_periods]),
+            amortization.rounded(amortization.paid_percentage(principal, balance[:paid_periods])),
+            interest[:paid_periods].tolist()
+        ]
+
+        for principal_payment, interest_payment, remaining, paid, exact_interest in zip(*columns):
+            row = {
+                'month': amortization.MONTH_NAMES[(first_month + k) % 12],
+                'principal': principal_payment,
+                'interest': interest_payment
+            }
+            if gst_rate is None:
+                row['totalPayment'] = emi_rounded
+            else:
+                # GST is charged on the interest component of each EMI
+                gst_on_interest = exact_interest * gst_rate
+                row['gstOnInterest'] = round(gst_on_interest, 2)
+                row['totalPayment'] = round(emi + gst_on_interest, 2)
+            row['balance'] = remaining
+            row['loanPaidPercentage'] = paid
+            k += 1
+            yield row
+
+        # Cleared within this block
+        if balance[paid_periods - 1] <= 0:
+            return
+
+def dated_schedule(principal, periodic_rate, periods, emi, gst_rate=None):
+    """
+    Monthly rows labelled with calendar months from today, stopping once the
+    balance is cleared
+    """
+    return list(dated_rows(principal, periodic_rate, periods, emi, gst_rate))
+
+def periodic_rows(principal, periodic_rate, periods, emi, period):
+    """
+    Numbered rows (Day 1, Week 2, ...) for the daily, weekly, monthly and
+    quarterly EMI calculators, generated a block of periods at a time
+    """
+    key, label, adjective = period
+    payment_key = f'{adjective}Payment'
+    emi_rounded = round(emi, 2)
+
+    number = 0
+    for interest, principal_paid, balance in amortization.amortize_chunks(principal, periodic_rate, periods, emi):
+        columns = [
+            amortization.rounded(principal_paid),
+            amortization.rounded(interest),
+            amortization.rounded(np.maximum(balance, 0))
+        ]
+        if label:
+            columns.append(amortization.rounded(amortization.paid_percentage(principal, balance)))
+
+        for row_values in zip(*columns):
+            number += 1
+            row = {
+                key: f'{label} {number}' if label else number,
+                'principal': row_values[0],
+                'interest': row_values[1],
+                payment_key: emi_rounded,
+                'balance': row_values[2]
+            }
+            if label:
+                row['loanPaidPercentage'] = row_values[3]
+            yield row
+
+def yearly_monthly_rows(principal, annual_rate, tenure_months, emi_advance=False, start_year=2025, start_month=1):
+    """
+    The monthly rows of calculate_yearly_payment_schedule, each labelled with
+    its year, generated a block of months at a time instead of building and
+    caching the whole schedule
+    """
+    emi = calculate_emi(principal, annual_rate, tenure_months, emi_advance)
+    monthly_rate = annual_rate / (12 * 100)
+    emi_rounded = round(emi, 2)
+
+    # The first year only covers the months from start_month onwards
+    first_year_months = 12 - (start_month - 1)
+
+    k = 0
+    for interest, principal_paid, balance in amortization.amortize_chunks(principal, monthly_rate, tenure_months, emi):
+        columns = [
+            amortization.rounded(principal_paid),
+            amortization.rounded(interest),
+            amortization.rounded(np.maximum(balance, 0)),
+            amortization.rounded(amortization.paid_percentage(principal, balance)),
+            balance.tolist()
+        ]
+        for principal_payment, interest_payment, remaining, paid, exact_balance in zip(*columns):
+            year_idx = 0 if k < first_year_months else 1 + (k - first_year_months) // 12
+            yield {
+                'year': start_year + year_idx,
+                'month': amortization.MONTH_NAMES[(start_month - 1 + k) % 12],
+                'principal': principal_payment,
+                'interest': interest_payment,
+                'total_payment': emi_rounded,
+                'balance': remaining,
+                'loan_paid_percentage': paid
+            }
+            k += 1
+
+            # Stop after the year in which the loan is fully paid
+            year_end = k == first_year_months or (k > first_year_months and (k - first_year_months) % 12 == 0)
+            if year_end and exact_balance <= 0:
+                return
+
+def schedule_rows(product, data):
+    """
+    Iterator over the full per-period schedule of a product, for streaming;
+    yearly schedules are flattened into their monthly rows. Every schedule
+    is generated a block of periods at a time, so its rows are never all in
+    memory. Inputs are validated before the iterator is returned, so errors
+    surface before any row is sent.
+    """
+    config = LOAN_PRODUCTS[product]
+    schedule = config.get('schedule')
+    if schedule not in ('periodic', 'dated', 'yearly'):
+        raise ValueError(f'{product} has no per-period schedule to stream')
+
+    loan = loan_terms(config, data)
+    if schedule == 'yearly':
+        return yearly_monthly_rows(
+            loan['principal'], loan['annual_rate'], loan['periods'], loan['advance'], loan['start_year'], loan['start_month']
+        )
+    if schedule == 'dated':
+        return dated_rows(loan['principal'], loan['periodic_rate'], loan['periods'], loan['emi'], config.get('gst_rate'))
+    return periodic_rows(loan['principal'], loan['periodic_rate'], loan['periods'], loan['emi'], config['period'])
+
+def loan_terms(config, data):
+    """
+    Validated loan parameters for a product's request payload, with the
+    periodic rate and EMI. Invalid inputs raise ValueError with the message
+    shown to the user.
+    """
+    loan = parse_loan_inputs(config, data)
+
+    if 'amount_error' in config and loan['principal'] <= 0:
+        raise ValueError(config['amount_error'])
+    if 'tenure_error' in config and loan['periods'] <= 0:
+        raise ValueError(config['tenure_error'])
+
+    periods_per_year = config.get('periods_per_year', 12)
+    if loan['periods'] > MAX_TENURE_YEARS * periods_per_year:
+        raise ValueError(f'Tenure cannot exceed {MAX_TENURE_YEARS} years')
+    loan['periodic_rate'] = loan['annual_rate'] / (periods_per_year * 100)
+    loan['emi'] = amortization.level_payment(loan['principal'], loan['periodic_rate'], loan['periods'], loan['advance'])
+    return loan
+
+def calculate_loan_product(product, data):
+    """
+    Calculate EMI, totals and schedule for one of LOAN_PRODUCTS from its request
+    payload. Invalid inputs raise ValueError with the message shown to the user.
+    """
+    config = LOAN_PRODUCTS[product]
+    loan = loan_terms(config, data)
+
+    principal = loan['principal']
+    periods = loan['periods']
+    annual_rate = loan['annual_rate']
+    periodic_rate = loan['periodic_rate']
+    emi = loan['emi']
+
+    total_emi_payments = emi * periods
+    total_interest = 0 if periodic_rate == 0 else total_emi_payments - principal
+
+    schedule = None
+    if config.get('schedule') == 'yearly':
+        schedule = calculate_yearly_payment_schedule(
+            principal, annual_rate, periods, loan['advance'], loan['start_year'], loan['start_month']
+        )
+    elif config.get('schedule') == 'dated':
+        schedule = dated_schedule(principal, periodic_rate, periods, emi, config.get('gst_rate'))
+    elif config.get('schedule') == 'periodic':
+        # Only the rows returned are generated
+        schedule = list(islice(periodic_rows(principal, periodic_rate, periods, emi, config['period']), JSON_SCHEDULE_MAX_ROWS))
+
+    layout = config['layout']
+    if layout == 'emi':
+        return {
+            'emi': round(emi, 2),
+            'totalInterest': round(total_interest, 2),
+            'totalAmount': round(principal + total_interest, 2),
+            'loanAmount': round(principal, 2),
+            'yearlyPaymentSchedule': schedule
+        }
+
+    if layout == 'summary':
+        total_payment = principal + total_interest
+        return {
+            'emi': round(emi, 2),
+            'totalInterest': round(total_interest, 2),
+            'totalPayment': round(total_payment, 2),
+            'principalAmount': round(principal, 2),
+            'principalPercentage': round((principal / total_payment) * 100, 1),
+            'interestPercentage': round((total_interest / total_payment) * 100, 1)
+        }
+
+    if layout == 'financed_asset':
+        total_payment = total_emi_payments
+        return {
+            'status': 'success',
+            'monthlyEmi': round(emi, 2),
+            config['amount']: loan['price'],
+            'loanAmount': principal,
+            'totalInterest': round(total_interest, 2),
+            'totalPayment': round(total_payment, 2),
+            'loanAmountPercentage': round((principal / total_payment) * 100 if total_payment > 0 else 0, 1),
+            'interestPercentage': round((total_interest / total_payment) * 100 if total_payment > 0 else 0, 1),
+            'amortizationSchedule': schedule
+        }
+
+    if layout == 'down_payment':
+        # Down payment is paid upfront on top of the EMI payments
+        total_payment = loan['down_payment'] + total_emi_payments
+        return {
+            'status': 'success',
+            'monthlyEmi': round(emi, 2),
+            config['amount']: loan['price'],
+            'downPayment': loan['down_payment'],
+            'loanAmount': principal,
+            'totalInterest': round(total_interest, 2),
+            'totalPayment': round(total_payment, 2),
+            'downPaymentPercentage': round((loan['down_payment'] / total_payment) * 100 if total_payment > 0 else 0, 1),
+            'loanAmountPercentage': round((principal / total_payment) * 100 if total_payment > 0 else 0, 1),
+            'amortizationSchedule': schedule
+        }
+
+    if layout == 'credit_card':
+        # GST applies to the interest and to the processing fees
+        gst_rate = config['gst_rate']
+        gst_on_interest = total_interest * gst_rate
+        processing_fees_with_gst = loan['fees'] * (1 + gst_rate)
+        return {
+            'status': 'success',
+            'monthlyEmi': round(emi, 2),
+            config['amount']: loan['price'],
+            'totalInterest': round(total_interest, 2),
+            'gstOnInterest': round(gst_on_interest, 2),
+            'processingFeesWithGst': round(processing_fees_with_gst, 2),
+            'totalPayment': round(total_emi_payments + processing_fees_with_gst + gst_on_interest, 2),
+            'amortizationSchedule': schedule
+        }
+
+    # Periodic layouts echo the tenure and name the EMI after the period
+    key, label, adjective = config['period']
+    result = {
+        'status': 'success',
+        'principal': principal
+    }
+    if label:
+        tenure_field = next(iter(config['tenure']))
+        result['interestRate'] = annual_rate
+        result[tenure_field] = periods
+    result[f'{adjective}Emi'] = round(emi, 2)
+    result['totalInterest'] = round(total_interest, 2)
+    result['totalPayment'] = round(total_emi_payments, 2)
+    result['amortizationSchedule'] = schedule
+    if periods > len(schedule):
+        result['scheduleTruncated'] = True
+        result['fullScheduleUrl'] = f'/stream-schedule/{product}'
+    return result
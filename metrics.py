@@ -0,0 +1,282 @@
+import os
+import sys
+import threading
+import time
+
+from flask import g, has_request_context, request
+
+import compression
+import page_cache
+import response_cache
+import result_cache
+
+# Request instrumentation, on unless METRICS_ENABLED=0. The report is served
+# in Prometheus text format at GET /metrics to requests with the admin token.
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', '1') != '0'
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Request environ key marking a 200 response whose body reports an error
+ERROR_BODY_KEY = 'metrics.error_body'
+
+def label_value(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+def format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{label_value(value)}"' for name, value in labels) + '}'
+
+def format_number(value):
+    if isinstance(value, float):
+        return repr(round(value, 9))
+    return str(value)
+
+class Histogram:
+    """
+    Cumulative bucket counts, sum and count per label set
+    """
+
+    def __init__(self, name, help_text, label_names, buckets):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = buckets
+        self.series = {}
+
+    def observe(self, labels, value):
+        series = self.series.get(labels)
+        if series is None:
+            series = self.series[labels] = [0] * len(self.buckets) + [0.0, 0]
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                series[index] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def lines(self):
+        yield f'# HELP {self.name} {self.help_text}'
+        yield f'# TYPE {self.name} histogram'
+        for labels, series in sorted(self.series.items()):
+            pairs = list(zip(self.label_names, labels))
+            for bound, count in zip(self.buckets, series):
+                yield f'{self.name}_bucket{format_labels(pairs + [("le", format_number(float(bound)))])} {count}'
+            yield f'{self.name}_bucket{format_labels(pairs + [("le", "+Inf")])} {series[-1]}'
+            yield f'{self.name}_sum{format_labels(pairs)} {format_number(series[-2])}'
+            yield f'{self.name}_count{format_labels(pairs)} {series[-1]}'
+
+class Counter:
+    """
+    Monotonic value per label set; also used for summed seconds
+    """
+
+    def __init__(self, name, help_text, label_names):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.series = {}
+
+    def inc(self, labels, amount=1):
+        self.series[labels] = self.series.get(labels, 0) + amount
+
+    def lines(self):
+        yield f'# HELP {self.name} {self.help_text}'
+        yield f'# TYPE {self.name} counter'
+        for labels, value in sorted(self.series.items()):
+            yield f'{self.name}{format_labels(list(zip(self.label_names, labels)))} {format_number(value)}'
+
+class RequestMetrics:
+    """
+    Per-route latency, payload sizes, calculation/serialization time and
+    error counts
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = Counter('calculator_requests_total', 'Requests by route, method and status code.',
+                                ('endpoint', 'method', 'status'))
+        self.errors = Counter('calculator_errors_total', 'Failed requests by route; kind is "status" for 4xx/5xx '
+                              'responses and "body" for 200 responses carrying an error.', ('endpoint', 'kind'))
+        self.latency = Histogram('calculator_request_duration_seconds', 'Time from the first before_request hook '
+                                 'to the last after_request hook.', ('endpoint',), LATENCY_BUCKETS)
+        self.request_bytes = Histogram('calculator_request_size_bytes', 'Request body size.', ('endpoint',), SIZE_BUCKETS)
+        self.response_bytes = Histogram('calculator_response_size_bytes', 'Response body size as sent, after '
+                                        'compression; streamed responses are not counted.', ('endpoint',), SIZE_BUCKETS)
+        self.calculation = Counter('calculator_calculation_seconds_total', 'Time spent in the view itself, '
+                                   'excluding JSON encoding.', ('endpoint',))
+        self.serialization = Counter('calculator_serialization_seconds_total', 'Time spent encoding JSON responses.',
+                                     ('endpoint',))
+        self.families = (self.requests, self.errors, self.latency, self.request_bytes, self.response_bytes,
+                         self.calculation, self.serialization)
+
+    def observe(self, endpoint, method, status, seconds, request_size, response_size, view_seconds,
+                json_seconds, error_body):
+        labels = (endpoint,)
+        with self.lock:
+            self.requests.inc((endpoint, method, str(status)))
+            if status >= 400:
+                self.errors.inc((endpoint, 'status'))
+            elif error_body:
+                self.errors.inc((endpoint, 'body'))
+            self.latency.observe(labels, seconds)
+            self.request_bytes.observe(labels, request_size)
+            if response_size is not None:
+                self.response_bytes.observe(labels, response_size)
+            if view_seconds is not None:
+                self.calculation.inc(labels, max(view_seconds, 0.0))
+            if json_seconds:
+                self.serialization.inc(labels, json_seconds)
+
+    def lines(self):
+        with self.lock:
+            for family in self.families:
+                yield from family.lines()
+
+registry = RequestMetrics()
+
+# Cache counters exported as calculator_cache_<field>{cache="..."}
+CACHE_FIELDS = {
+    'entries': ('gauge', 'Entries held.'),
+    'bytes': ('gauge', 'Bytes held.'),
+    'hits': ('counter', 'Lookups answered from the cache.'),
+    'misses': ('counter', 'Lookups not answered from the cache.'),
+    'evictions': ('counter', 'Entries evicted to stay within the bound.')
+}
+
+def cache_stats():
+    """
+    Stats of every in-process cache. The export cache is only reported once
+    an export has loaded its module.
+    """
+    caches = {
+        'response': response_cache.cache.stats(),
+        'page': page_cache.cache.stats(),
+        'compressed_variants': compression.variants.stats()
+    }
+    export = sys.modules.get('export')
+    if export is not None:
+        caches['export'] = export.cache.stats()
+    for name, stats in result_cache.cache_stats().items():
+        caches[f'result:{name}'] = stats
+    return caches
+
+def cache_lines(caches):
+    by_field = {}
+    for cache, stats in sorted(caches.items()):
+        for field, value in stats.items():
+            field = 'entries' if field == 'size' else field
+            if field in CACHE_FIELDS:
+                by_field.setdefault(field, []).append((cache, value))
+
+    for field, series in by_field.items():
+        kind, help_text = CACHE_FIELDS[field]
+        name = f'calculator_cache_{field}' + ('_total' if kind == 'counter' else '')
+        yield f'# HELP {name} {help_text}'
+        yield f'# TYPE {name} {kind}'
+        for cache, value in series:
+            yield f'{name}{format_labels([("cache", cache)])} {format_number(value)}'
+
+# Request class admission under the ASGI entry point, exported as
+# calculator_concurrency_<field>{class="heavy|light"}
+CONCURRENCY_FIELDS = {
+    'limit': ('gauge', 'Requests of the class allowed to run at once.'),
+    'active': ('gauge', 'Requests of the class running.'),
+    'queued': ('gauge', 'Requests of the class waiting for a slot.'),
+    'rejected': ('counter', 'Requests of the class turned away with a 503 after waiting too long.')
+}
+
+def concurrency_lines(classes):
+    for field, (kind, help_text) in CONCURRENCY_FIELDS.items():
+        name = f'calculator_concurrency_{field}' + ('_total' if kind == 'counter' else '')
+        yield f'# HELP {name} {help_text}'
+        yield f'# TYPE {name} {kind}'
+        for request_class, stats in sorted(classes.items()):
+            yield f'{name}{format_labels([("class", request_class)])} {format_number(stats[field])}'
+
+def render():
+    """
+    Prometheus text exposition of the request metrics and cache counters,
+    plus the request class limits when served through asgi.py
+    """
+    lines = list(registry.lines())
+    lines.extend(cache_lines(cache_stats()))
+    asgi = sys.modules.get('asgi')
+    if asgi is not None:
+        lines.extend(concurrency_lines(asgi.class_stats()))
+    return '\n'.join(lines) + '\n'
+
+def observe_json(obj, seconds):
+    """
+    Called by the JSON provider for every encoded response body
+    """
+    if not METRICS_ENABLED or not has_request_context():
+        return
+    g.metrics_json_seconds = g.get('metrics_json_seconds', 0.0) + seconds
+    if isinstance(obj, dict) and 'error' in obj and obj.get('status') != 'success':
+        flag_error_body()
+
+def flag_error_body():
+    """
+    Count the current request as a 200 response carrying an error, e.g.
+    when a cached error body is replayed without being encoded again. The
+    flag lives in the request's environ rather than on g, which the
+    scenarios of a /batch request share with it.
+    """
+    if METRICS_ENABLED and has_request_context():
+        request.environ[ERROR_BODY_KEY] = True
+
+def error_body_flagged():
+    return METRICS_ENABLED and has_request_context() and request.environ.get(ERROR_BODY_KEY, False)
+
+def init_app(app):
+    """
+    Instrument every request and serve GET /metrics. Register it first, so
+    its after_request hook runs last and times the other hooks too.
+    """
+    if not METRICS_ENABLED:
+        return
+
+    from admin import admin_only
+
+    dispatch_request = app.dispatch_request
+
+    def timed_dispatch_request(*args, **kwargs):
+        json_before = g.get('metrics_json_seconds', 0.0)
+        started = time.perf_counter()
+        try:
+            return dispatch_request(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            g.metrics_view_seconds = elapsed - (g.get('metrics_json_seconds', 0.0) - json_before)
+
+    app.dispatch_request = timed_dispatch_request
+
+    @app.before_request
+    def start_timer():
+        g.metrics_started = time.perf_counter()
+
+    @app.after_request
+    def record_request(response):
+        started = g.get('metrics_started')
+        if started is None:
+            return response
+        registry.observe(
+            request.endpoint or 'unmatched',
+            request.method,
+            response.status_code,
+            time.perf_counter() - started,
+            request.content_length or 0,
+            None if response.is_streamed else response.calculate_content_length(),
+            g.get('metrics_view_seconds'),
+            g.get('metrics_json_seconds', 0.0),
+            error_body_flagged()
+        )
+        return response
+
+    @app.route('/metrics')
+    @admin_only
+    def metrics_report():
+        return app.response_class(render(), content_type=PROMETHEUS_CONTENT_TYPE)
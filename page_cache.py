@@ -0,0 +1,226 @@
+import hashlib
+import os
+import threading
+from datetime import datetime, timezone
+
+from flask import g, request, template_rendered
+from jinja2 import FileSystemBytecodeCache
+
+# Rendered calculator pages are kept in memory unless PAGE_CACHE_ENABLED=0
+PAGE_CACHE_ENABLED = os.environ.get('PAGE_CACHE_ENABLED', '1') != '0'
+
+# Directory of compiled template bytecode, filled at build time by
+# `flask --app index compile-templates`; unset keeps Jinja's in-memory cache only
+JINJA_BYTECODE_CACHE_DIR = os.environ.get('JINJA_BYTECODE_CACHE_DIR', '')
+
+# TEMPLATE_WARM=1 compiles every template and renders every page at boot,
+# trading a slower boot (all calculator modules are imported) for warm first hits
+TEMPLATE_WARM = os.environ.get('TEMPLATE_WARM', '0') == '1'
+
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """
+    Bytecode cache keyed by template name only, so bytecode compiled at build
+    time is found when the app is deployed under another path. Jinja checks
+    the source checksum on load, so a changed template is still recompiled.
+    """
+
+    def get_cache_key(self, name, filename=None):
+        return hashlib.sha1(name.encode('utf-8')).hexdigest()
+
+    def dump_bytecode(self, bucket):
+        # A read-only deployment keeps serving from the build-time bytecode
+        try:
+            super().dump_bytecode(bucket)
+        except OSError:
+            pass
+
+class PageCache:
+    """
+    Rendered HTML of the calculator pages, keyed by endpoint
+    """
+
+    def __init__(self):
+        self.entries = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, endpoint):
+        with self.lock:
+            entry = self.entries.get(endpoint)
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return entry
+
+    def set(self, endpoint, body, mimetype, last_modified=None, encoded=None):
+        """
+        Store a page; `encoded` maps a content coding to a precompressed body
+        """
+        entry = {
+            'body': body,
+            'mimetype': mimetype,
+            'etag': hashlib.sha1(body).hexdigest(),
+            'last_modified': last_modified or datetime.now(timezone.utc),
+            'encoded': encoded or {}
+        }
+        with self.lock:
+            self.entries[endpoint] = entry
+        return entry
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self):
+        with self.lock:
+            return {
+                'entries': len(self.entries),
+                'bytes': sum(len(entry['body']) for entry in self.entries.values()),
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+cache = PageCache()
+
+def page(view):
+    """
+    Mark a view as a static page: it takes no request context, so its
+    rendered HTML can be served to everyone
+    """
+    view.cached_page = True
+    return view
+
+def is_cached_page(app):
+    if request.method not in ('GET', 'HEAD') or request.view_args:
+        return False
+    view = app.view_functions.get(request.endpoint)
+    return getattr(view, 'cached_page', False)
+
+def record_template(sender, template, context, **extra):
+    """
+    Remember the rendered template's file for the page's Last-Modified
+    """
+    g.page_template_filename = template.filename
+
+def template_last_modified(filename):
+    if filename:
+        try:
+            return datetime.fromtimestamp(int(os.path.getmtime(filename)), timezone.utc)
+        except OSError:
+            pass
+    return None
+
+def preferred_encoding(encoded):
+    """
+    Best precompressed variant the client accepts, or None for the identity body
+    """
+    for encoding in ('br', 'gzip'):
+        if encoding in encoded and request.accept_encodings[encoding]:
+            return encoding
+    return None
+
+def page_response(app, entry):
+    """
+    Response for a cached page, answering 304 to a matching If-None-Match or
+    If-Modified-Since
+    """
+    encoding = preferred_encoding(entry['encoded'])
+    if encoding is None:
+        response = app.response_class(entry['body'], mimetype=entry['mimetype'])
+        response.set_etag(entry['etag'])
+    else:
+        response = app.response_class(entry['encoded'][encoding], mimetype=entry['mimetype'])
+        response.headers['Content-Encoding'] = encoding
+        response.set_etag(f"{entry['etag']}-{encoding}")
+    if entry['encoded']:
+        response.vary.add('Accept-Encoding')
+    response.last_modified = entry['last_modified']
+    response.headers['X-Page-Cache'] = 'hit'
+    return response.make_conditional(request)
+
+def compile_templates(app):
+    """
+    Compile every template, storing its bytecode in the bytecode cache when
+    one is configured. Returns the number of templates compiled.
+    """
+    env = app.jinja_env
+    names = [name for name in env.list_templates() if name.endswith('.html')]
+    for name in names:
+        env.get_template(name)
+    return len(names)
+
+def warm(app):
+    """
+    Compile every template and render every cached page into the page cache.
+    Returns the pages that failed to render.
+    """
+    compile_templates(app)
+    if not PAGE_CACHE_ENABLED:
+        return []
+
+    failed = []
+    for rule in app.url_map.iter_rules():
+        view = app.view_functions.get(rule.endpoint)
+        if not getattr(view, 'cached_page', False) or rule.arguments:
+            continue
+        with app.test_request_context(rule.rule):
+            try:
+                app.full_dispatch_request()
+            except Exception:
+                failed.append(rule.rule)
+
+    if failed:
+        print(f"Could not warm {len(failed)} pages, e.g. {failed[0]}")
+    return failed
+
+def init_app(app):
+    """
+    Bytecode cache for templates, the compile-templates command and in-memory
+    caching of rendered calculator pages
+    """
+    if JINJA_BYTECODE_CACHE_DIR:
+        try:
+            os.makedirs(JINJA_BYTECODE_CACHE_DIR, exist_ok=True)
+        except OSError as e:
+            print(f"Could not create template bytecode cache {JINJA_BYTECODE_CACHE_DIR}: {str(e)}")
+        app.jinja_env.bytecode_cache = TemplateBytecodeCache(JINJA_BYTECODE_CACHE_DIR)
+
+    @app.cli.command('compile-templates')
+    def compile_templates_command():
+        """Compile all templates into JINJA_BYTECODE_CACHE_DIR."""
+        if not JINJA_BYTECODE_CACHE_DIR:
+            raise SystemExit('Set JINJA_BYTECODE_CACHE_DIR to the bytecode cache directory')
+        count = compile_templates(app)
+        print(f'Compiled {count} templates into {JINJA_BYTECODE_CACHE_DIR}')
+
+    if not PAGE_CACHE_ENABLED:
+        return
+
+    template_rendered.connect(record_template, app)
+
+    @app.before_request
+    def serve_cached_page():
+        if not is_cached_page(app):
+            return None
+
+        entry = cache.get(request.endpoint)
+        if entry is None:
+            g.page_cache_miss = True
+            return None
+        return page_response(app, entry)
+
+    @app.after_request
+    def store_page(response):
+        if not g.pop('page_cache_miss', False):
+            return response
+        if response.status_code != 200 or response.mimetype != 'text/html' or response.is_streamed:
+            return response
+
+        last_modified = template_last_modified(g.get('page_template_filename'))
+        entry = cache.set(request.endpoint, response.get_data(), response.mimetype, last_modified)
+        response.set_etag(entry['etag'])
+        response.last_modified = entry['last_modified']
+        response.headers['X-Page-Cache'] = 'miss'
+        return response
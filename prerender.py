@@ -0,0 +1,156 @@
+import gzip
+import hashlib
+import json
+import os
+import shutil
+from datetime import datetime, timezone
+
+from werkzeug.http import parse_date
+
+import page_cache
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Bundle written by `flask --app index prerender` and, when set, loaded into
+# the page cache at boot so pages are served without running their views
+PRERENDERED_DIR = os.environ.get('PRERENDERED_DIR', '')
+DEFAULT_OUTPUT_DIR = 'prerendered'
+MANIFEST_NAME = 'manifest.json'
+
+# Precompressed variants, written next to each file as <name>.gz and <name>.br
+ENCODING_SUFFIXES = {'gzip': '.gz', 'br': '.br'}
+
+def compressed_variants(body):
+    """
+    gzip (and brotli, when the brotli package is installed) encodings of a
+    body at maximum compression, done once at build time
+    """
+    variants = {'gzip': gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants['br'] = brotli.compress(body, quality=11)
+    return variants
+
+def page_file(rule):
+    """
+    Bundle path of a page route: /sip-calculator/ -> sip-calculator/index.html
+    """
+    path = rule.strip('/')
+    return f'{path}/index.html' if path else 'index.html'
+
+def write_variants(output_dir, name, body):
+    """
+    Write a file and its precompressed variants, returning its manifest entry
+    """
+    path = os.path.join(output_dir, name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as handle:
+        handle.write(body)
+
+    encodings = {}
+    for encoding, encoded in compressed_variants(body).items():
+        with open(path + ENCODING_SUFFIXES[encoding], 'wb') as handle:
+            handle.write(encoded)
+        encodings[encoding] = {'file': name + ENCODING_SUFFIXES[encoding], 'bytes': len(encoded)}
+
+    return {
+        'file': name,
+        'bytes': len(body),
+        'etag': hashlib.sha1(body).hexdigest(),
+        'encodings': encodings
+    }
+
+def page_rules(app):
+    """
+    Rules of the cached GET pages, which take no arguments
+    """
+    for rule in app.url_map.iter_rules():
+        view = app.view_functions.get(rule.endpoint)
+        if getattr(view, 'cached_page', False) and not rule.arguments:
+            yield rule
+
+def build_bundle(app, output_dir=DEFAULT_OUTPUT_DIR):
+    """
+    Render every page route and copy the static assets into output_dir, with
+    gzip/brotli variants of each and a manifest. Returns the manifest.
+    """
+    if os.path.isdir(output_dir):
+        shutil.rmtree(output_dir)
+    os.makedirs(output_dir)
+
+    manifest = {
+        'generatedAt': datetime.now(timezone.utc).isoformat(),
+        'encodings': sorted(compressed_variants(b'')),
+        'pages': {},
+        'assets': {},
+        'failed': []
+    }
+
+    # Render every page afresh rather than from an already loaded bundle
+    page_cache.cache.clear()
+    client = app.test_client()
+    for rule in page_rules(app):
+        response = client.get(rule.rule)
+        if response.status_code != 200:
+            manifest['failed'].append({'route': rule.rule, 'statusCode': response.status_code})
+            continue
+
+        entry = write_variants(output_dir, page_file(rule.rule), response.get_data())
+        entry['endpoint'] = rule.endpoint
+        entry['contentType'] = response.content_type
+        entry['lastModified'] = response.headers.get('Last-Modified')
+        manifest['pages'][rule.rule] = entry
+
+    static_folder = app.static_folder
+    for root, _, files in os.walk(static_folder):
+        for filename in sorted(files):
+            source = os.path.join(root, filename)
+            name = os.path.relpath(source, os.path.dirname(static_folder)).replace(os.sep, '/')
+            with open(source, 'rb') as handle:
+                manifest['assets'][name] = write_variants(output_dir, name, handle.read())
+
+    with open(os.path.join(output_dir, MANIFEST_NAME), 'w', encoding='utf-8') as handle:
+        json.dump(manifest, handle, indent=2, sort_keys=True)
+    return manifest
+
+def load_bundle(bundle_dir):
+    """
+    Fill the page cache from a pre-rendered bundle, so a cold worker serves
+    pages without importing their calculator modules. Returns the number of
+    pages loaded.
+    """
+    with open(os.path.join(bundle_dir, MANIFEST_NAME), encoding='utf-8') as handle:
+        manifest = json.load(handle)
+
+    def read(name):
+        with open(os.path.join(bundle_dir, name), 'rb') as handle:
+            return handle.read()
+
+    for entry in manifest['pages'].values():
+        encoded = {encoding: read(variant['file']) for encoding, variant in entry['encodings'].items()}
+        last_modified = parse_date(entry['lastModified']) if entry.get('lastModified') else None
+        page_cache.cache.set(entry['endpoint'], read(entry['file']), 'text/html', last_modified, encoded)
+    return len(manifest['pages'])
+
+def init_app(app):
+    """
+    The prerender build command, and serving a bundle given by PRERENDERED_DIR
+    """
+
+    @app.cli.command('prerender')
+    def prerender_command():
+        """Render all calculator pages and static assets into a deployable bundle."""
+        output_dir = PRERENDERED_DIR or DEFAULT_OUTPUT_DIR
+        manifest = build_bundle(app, output_dir)
+        print(f"Pre-rendered {len(manifest['pages'])} pages and {len(manifest['assets'])} assets "
+              f"into {output_dir} ({', '.join(manifest['encodings'])})")
+        for failure in manifest['failed']:
+            print(f"Skipped {failure['route']}: status {failure['statusCode']}")
+
+    if PRERENDERED_DIR and page_cache.PAGE_CACHE_ENABLED:
+        try:
+            load_bundle(PRERENDERED_DIR)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Could not load pre-rendered pages from {PRERENDERED_DIR}: {str(e)}")
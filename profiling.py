@@ -0,0 +1,222 @@
+import cProfile
+import io
+import os
+import pstats
+import random
+import threading
+from collections import defaultdict
+from html import escape
+
+# Profile PROFILE_SAMPLE_RATE of requests (0.01 = 1%) with cProfile, optionally
+# only for the comma-separated endpoints in PROFILE_ENDPOINTS. Off by default,
+# in which case no hook is installed at all.
+PROFILE_SAMPLE_RATE = float(os.environ.get('PROFILE_SAMPLE_RATE', 0))
+PROFILE_ENDPOINTS = {name.strip() for name in os.environ.get('PROFILE_ENDPOINTS', '').split(',') if name.strip()}
+
+# Stacks attributed less than this many microseconds are left out of the
+# collapsed output, which keeps recursive call graphs bounded
+PROFILE_MIN_STACK_US = int(os.environ.get('PROFILE_MIN_STACK_US', 10))
+PROFILE_MAX_DEPTH = 64
+
+PROFILE_FORMATS = ('collapsed', 'svg', 'text')
+
+class RouteProfiles:
+    """
+    cProfile statistics of the sampled requests, aggregated per endpoint
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stats = {}
+        self.samples = defaultdict(int)
+
+    def add(self, endpoint, profiler):
+        with self.lock:
+            if endpoint in self.stats:
+                self.stats[endpoint].add(profiler)
+            else:
+                self.stats[endpoint] = pstats.Stats(profiler)
+            self.samples[endpoint] += 1
+
+    def get(self, endpoint):
+        """
+        Copy of an endpoint's statistics, safe to sort and walk while
+        requests keep adding to the original
+        """
+        with self.lock:
+            if endpoint not in self.stats:
+                return None
+            stats = pstats.Stats()
+            stats.add(self.stats[endpoint])
+            return stats
+
+    def clear(self):
+        with self.lock:
+            self.stats.clear()
+            self.samples.clear()
+
+    def summary(self):
+        with self.lock:
+            return [{
+                'endpoint': endpoint,
+                'samples': self.samples[endpoint],
+                'totalSeconds': round(stats.total_tt, 6)
+            } for endpoint, stats in sorted(self.stats.items(), key=lambda item: item[1].total_tt, reverse=True)]
+
+profiles = RouteProfiles()
+
+def frame_label(func):
+    filename, line, name = func
+    if filename == '~':
+        label = name
+    else:
+        label = f'{os.path.splitext(os.path.basename(filename))[0]}:{name}:{line}'
+    return label.replace(';', ',').replace(' ', '_')
+
+def collapsed_stacks(stats):
+    """
+    Reconstruct 'root;caller;callee microseconds' stacks from the caller
+    graph cProfile records. A function's time is split between its callers
+    in proportion to the time each call edge accounts for, so stacks through
+    functions reached from several places are estimates.
+    """
+    children = defaultdict(list)
+    roots = []
+    for func, (_, _, _, _, callers) in stats.stats.items():
+        if not callers:
+            roots.append(func)
+        for caller, edge in callers.items():
+            children[caller].append((func, edge[3]))
+
+    stacks = defaultdict(float)
+
+    def walk(func, path, labels, scale):
+        _, _, self_time, cumulative, _ = stats.stats[func]
+        labels = labels + [frame_label(func)]
+        stacks[';'.join(labels)] += self_time * scale * 1e6
+        if len(labels) >= PROFILE_MAX_DEPTH:
+            return
+        for child, edge_time in children.get(func, ()):
+            child_cumulative = stats.stats[child][3]
+            attributed = edge_time * scale
+            if child in path or not child_cumulative or attributed * 1e6 < PROFILE_MIN_STACK_US:
+                continue
+            walk(child, path | {child}, labels, attributed / child_cumulative)
+
+    for root in roots:
+        walk(root, {root}, [], 1.0)
+
+    return {stack: int(round(us)) for stack, us in stacks.items() if us >= PROFILE_MIN_STACK_US}
+
+def collapsed_text(stacks):
+    return ''.join(f'{stack} {value}\n' for stack, value in sorted(stacks.items()))
+
+def flame_graph_svg(stacks, title, width=1200, row_height=16):
+    """
+    Minimal flame graph: one rectangle per frame, widths proportional to
+    time, hover for the frame and its share
+    """
+    tree = {'children': {}, 'value': 0}
+    for stack, value in stacks.items():
+        node = tree
+        node['value'] += value
+        for label in stack.split(';'):
+            node = node['children'].setdefault(label, {'children': {}, 'value': 0})
+            node['value'] += value
+
+    total = tree['value'] or 1
+    rects = []
+    depth_reached = [0]
+
+    def draw(node, x, depth):
+        depth_reached[0] = max(depth_reached[0], depth)
+        for label, child in sorted(node['children'].items()):
+            child_width = child['value'] / total * width
+            if child_width >= 0.5:
+                hue = 20 + (sum(map(ord, label)) % 40)
+                share = child['value'] / total * 100
+                rects.append((x, depth, child_width, label, share, hue))
+                draw(child, x, depth + 1)
+            x += child_width
+
+    draw(tree, 0.0, 0)
+    height = (depth_reached[0] + 2) * row_height + 24
+
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" font-family="monospace" font-size="11">',
+             f'<text x="4" y="16">{escape(title)} ({total / 1e6:.3f}s profiled)</text>']
+    for x, depth, rect_width, label, share, hue in rects:
+        y = height - (depth + 1) * row_height
+        text = escape(label[:int(rect_width / 7)]) if rect_width > 21 else ''
+        parts.append(f'<g><title>{escape(label)} ({share:.2f}%)</title>'
+                     f'<rect x="{x:.1f}" y="{y}" width="{rect_width:.1f}" height="{row_height - 1}" fill="hsl({hue},90%,60%)"/>'
+                     f'<text x="{x + 3:.1f}" y="{y + row_height - 4}">{text}</text></g>')
+    parts.append('</svg>')
+    return '\n'.join(parts) + '\n'
+
+def stats_text(stats, limit=60):
+    buffer = io.StringIO()
+    stats.stream = buffer
+    stats.sort_stats('cumulative').print_stats(limit)
+    return buffer.getvalue()
+
+def sampled(endpoint):
+    if PROFILE_ENDPOINTS and endpoint not in PROFILE_ENDPOINTS:
+        return False
+    return random.random() < PROFILE_SAMPLE_RATE
+
+def init_app(app):
+    """
+    Profile a sample of requests and serve the aggregated profiles from
+    GET /admin/profiles and GET /admin/profiles/<endpoint>?format=
+    """
+    if PROFILE_SAMPLE_RATE <= 0:
+        return
+
+    from flask import g, jsonify, request
+    from admin import admin_only
+
+    @app.before_request
+    def start_profile():
+        if request.endpoint is None or request.endpoint.startswith('admin_profile') or not sampled(request.endpoint):
+            return
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another request is being profiled; cProfile allows one at a time
+            return
+        g.profiler = profiler
+
+    @app.teardown_request
+    def finish_profile(exc):
+        profiler = g.pop('profiler', None)
+        if profiler is not None:
+            profiler.disable()
+            profiles.add(request.endpoint, profiler)
+
+    @app.route('/admin/profiles', methods=['GET', 'DELETE'])
+    @admin_only
+    def admin_profiles():
+        if request.method == 'DELETE':
+            profiles.clear()
+        return jsonify({'sampleRate': PROFILE_SAMPLE_RATE, 'routes': profiles.summary()})
+
+    @app.route('/admin/profiles/<endpoint>')
+    @admin_only
+    def admin_profile(endpoint):
+        output_format = request.args.get('format', 'collapsed')
+        if output_format not in PROFILE_FORMATS:
+            return jsonify({'status': 'error', 'error': f"format must be one of {', '.join(PROFILE_FORMATS)}"}), 400
+        stats = profiles.get(endpoint)
+        if stats is None:
+            return jsonify({'status': 'error', 'error': f'No profile for {endpoint}'}), 404
+
+        if output_format == 'text':
+            return app.response_class(stats_text(stats), mimetype='text/plain')
+        stacks = collapsed_stacks(stats)
+        if output_format == 'svg':
+            response = app.response_class(flame_graph_svg(stacks, endpoint), mimetype='image/svg+xml')
+        else:
+            response = app.response_class(collapsed_text(stacks), mimetype='text/plain')
+        response.headers['Content-Disposition'] = f'attachment; filename={endpoint}.{"svg" if output_format == "svg" else "folded"}'
+        return response
@@ -0,0 +1,173 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from flask import g, request
+
+# Disabled with RESPONSE_CACHE_ENABLED=0; the memory cap covers the encoded bodies
+RESPONSE_CACHE_ENABLED = os.environ.get('RESPONSE_CACHE_ENABLED', '1') != '0'
+RESPONSE_CACHE_MAX_BYTES = int(os.environ.get('RESPONSE_CACHE_MAX_BYTES', 32 * 1024 * 1024))
+RESPONSE_CACHE_TTL = float(os.environ.get('RESPONSE_CACHE_TTL', 3600))
+
+# Only the calculation endpoints are cached
+CACHED_PATH_PREFIX = '/calculate'
+
+class ResponseCache:
+    """
+    LRU cache of encoded response bodies bounded by their total size in bytes
+    """
+
+    def __init__(self, max_bytes=RESPONSE_CACHE_MAX_BYTES, ttl=RESPONSE_CACHE_TTL):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                if not self.ttl or time.monotonic() - entry['stored_at'] < self.ttl:
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return entry
+                self.remove(key)
+            self.misses += 1
+            return None
+
+    def set(self, key, body, status, mimetype, headers=None, error_body=False):
+        # Bodies larger than the whole budget are never stored
+        if len(body) > self.max_bytes:
+            return None
+
+        entry = {
+            'body': body,
+            'status': status,
+            'mimetype': mimetype,
+            'headers': dict(headers or {}),
+            'etag': hashlib.sha1(body).hexdigest(),
+            'error_body': error_body,
+            'stored_at': time.monotonic()
+        }
+        with self.lock:
+            if key in self.entries:
+                self.remove(key)
+            self.entries[key] = entry
+            self.size += len(body)
+            while self.size > self.max_bytes:
+                oldest = next(iter(self.entries))
+                self.remove(oldest)
+                self.evictions += 1
+        return entry
+
+    def remove(self, key):
+        entry = self.entries.pop(key)
+        self.size -= len(entry['body'])
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+    def stats(self):
+        with self.lock:
+            return {
+                'entries': len(self.entries),
+                'bytes': self.size,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+cache = ResponseCache()
+
+def exempt(view):
+    """
+    Opt a route out of response caching, e.g. when its result depends on the
+    current date
+    """
+    view.response_cache_exempt = True
+    return view
+
+def request_cache_key(app):
+    """
+    Canonical hash of the endpoint, query arguments and JSON body, or None when the request is
+    not cacheable
+    """
+    if request.method != 'POST' or not request.path.startswith(CACHED_PATH_PREFIX):
+        return None
+
+    view = app.view_functions.get(request.endpoint)
+    if view is None or getattr(view, 'response_cache_exempt', False):
+        return None
+
+    data = request.get_json(silent=True)
+    if data is None:
+        return None
+
+    # Query arguments such as ?format=columnar change the encoded body
+    arguments = sorted(request.args.items(multi=True))
+    canonical = json.dumps([data, arguments], sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(f'{request.endpoint}\n{canonical}'.encode('utf-8')).hexdigest()
+
+def cached_response(app, entry):
+    """
+    Rebuild a response from a cache entry, answering 304 when the client
+    already holds the same ETag. A cached error body is reported to the
+    metrics like the response it replays.
+    """
+    if entry['error_body']:
+        # metrics imports this module through compression
+        import metrics
+        metrics.flag_error_body()
+    if entry['etag'] in request.if_none_match:
+        response = app.response_class(status=304)
+    else:
+        response = app.response_class(entry['body'], status=entry['status'], mimetype=entry['mimetype'])
+        response.headers.extend(entry['headers'])
+    response.set_etag(entry['etag'])
+    response.headers['X-Response-Cache'] = 'hit'
+    return response
+
+def init_app(app):
+    """
+    Serve repeated POST /calculate-* requests from pre-encoded response bytes
+    """
+    if not RESPONSE_CACHE_ENABLED:
+        return
+
+    @app.before_request
+    def serve_cached_response():
+        key = request_cache_key(app)
+        g.response_cache_key = key
+        if key is None:
+            return None
+
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        return cached_response(app, entry)
+
+    @app.after_request
+    def store_response(response):
+        key = g.pop('response_cache_key', None)
+        if key is None or 'X-Response-Cache' in response.headers:
+            return response
+        if response.status_code != 200 or response.mimetype != 'application/json' or response.direct_passthrough or response.is_streamed:
+            return response
+
+        import metrics
+        entry = cache.set(key, response.get_data(), response.status_code, response.mimetype,
+                          error_body=metrics.error_body_flagged())
+        if entry is not None:
+            response.set_etag(entry['etag'])
+            response.headers['X-Response-Cache'] = 'miss'
+        return response
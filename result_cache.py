@@ -0,0 +1,130 @@
+import inspect
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+# Defaults for every memoized calculator, overridable per deployment
+DEFAULT_MAXSIZE = int(os.environ.get('RESULT_CACHE_SIZE', 512))
+DEFAULT_TTL = float(os.environ.get('RESULT_CACHE_TTL', 3600))
+
+# Every cache created by memoize, keyed by the wrapped function's name
+CACHES = {}
+
+class ResultCache:
+    """
+    Bounded LRU cache with optional expiry and hit/miss counters
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, ttl=DEFAULT_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """
+        Return (True, value) for a live entry, otherwise (False, None)
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                stored_at, value = entry
+                if not self.ttl or time.monotonic() - stored_at < self.ttl:
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self.entries[key]
+            self.misses += 1
+            return False, None
+
+    def set(self, key, value):
+        if self.maxsize <= 0:
+            return
+
+        with self.lock:
+            self.entries[key] = (time.monotonic(), value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self.entries),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0
+            }
+
+def cache_key(arguments):
+    """
+    Key of a call's bound arguments. Values are tagged with their type, so
+    8.5 and 8.50000001, 1 and 1.0 or 'Monthly' and 'monthly' never share an
+    entry: a cached result is exactly what the call would have returned.
+    """
+    return tuple((name, type(value), value) for name, value in arguments.items())
+
+def memoize(maxsize=None, ttl=None):
+    """
+    Cache a pure calculator's results keyed on its exact arguments.
+
+    The calculator is called with the arguments as given. Cached results
+    are shared between requests and must be treated as read-only.
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+        cache = ResultCache(
+            DEFAULT_MAXSIZE if maxsize is None else maxsize,
+            DEFAULT_TTL if ttl is None else ttl
+        )
+        CACHES[func.__name__] = cache
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = cache_key(bound.arguments)
+
+            # Unhashable inputs (lists of purchases, cash flows) bypass the cache
+            try:
+                hash(key)
+            except TypeError:
+                return func(*args, **kwargs)
+
+            hit, result = cache.get(key)
+            if hit:
+                return result
+
+            result = func(*args, **kwargs)
+            cache.set(key, result)
+            return result
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+def cache_stats():
+    """
+    Hit/miss counters for every memoized calculator
+    """
+    return {name: cache.stats() for name, cache in CACHES.items()}
+
+def clear_caches():
+    for cache in CACHES.values():
+        cache.clear()
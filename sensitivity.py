@@ -0,0 +1,228 @@
+import os
+
+import numpy as np
+
+# Upper bound on the number of cells one grid request may compute
+GRID_MAX_CELLS = int(os.environ.get('GRID_MAX_CELLS', 250000))
+
+SIP_INVESTMENTS_PER_YEAR = {
+    'daily': 365,
+    'monthly': 12,
+    'quarterly': 4,
+    'yearly': 1,
+    'one-time': 1
+}
+
+def parameter_values(name, spec):
+    """
+    Read a grid parameter as (values, is_range). A number is held fixed, while
+    a list of values, {"start", "stop", "step"} (stop inclusive) or
+    {"start", "stop", "count"} becomes an axis of the grid.
+    """
+    if isinstance(spec, dict):
+        try:
+            start = float(spec['start'])
+            stop = float(spec['stop'])
+        except KeyError:
+            raise ValueError(f'{name} range needs start and stop')
+
+        if 'count' in spec:
+            count = int(spec['count'])
+            if count < 1:
+                raise ValueError(f'{name} count must be positive')
+            if count > GRID_MAX_CELLS:
+                raise ValueError(f'{name} range has too many points')
+            values = np.linspace(start, stop, count)
+        else:
+            step = float(spec.get('step', 1))
+            if step <= 0 or stop < start:
+                raise ValueError(f'{name} range must have start <= stop and a positive step')
+            if (stop - start) / step >= GRID_MAX_CELLS:
+                raise ValueError(f'{name} range has too many points')
+            # Half a step of slack keeps the stop value despite float error
+            values = np.arange(start, stop + step / 2, step)
+        return values, True
+
+    if isinstance(spec, list):
+        if not spec:
+            raise ValueError(f'{name} list is empty')
+        if len(spec) > GRID_MAX_CELLS:
+            raise ValueError(f'{name} list has too many values')
+        values = np.asarray(spec, dtype=float)
+        if values.ndim != 1:
+            raise ValueError(f'{name} list must be flat')
+        return values, True
+
+    return np.asarray(float(spec)), False
+
+def grid_axes(parameters):
+    """
+    Broadcast the parameters against each other. Every range gets its own
+    axis, in the order given, and fixed values broadcast as scalars.
+
+    Returns (arrays, dims, axes) where arrays maps each parameter to its
+    broadcastable array, dims names the grid axes and axes holds their values.
+    """
+    dims = [name for name, (_, is_range) in parameters.items() if is_range]
+    if not dims:
+        raise ValueError('At least one parameter must be a range')
+
+    shape = [len(parameters[name][0]) for name in dims]
+    if int(np.prod(shape)) > GRID_MAX_CELLS:
+        raise ValueError(f'Grid is limited to {GRID_MAX_CELLS} cells')
+
+    arrays = {}
+    for name, (values, is_range) in parameters.items():
+        if is_range:
+            position = [1] * len(dims)
+            position[dims.index(name)] = len(values)
+            values = values.reshape(position)
+        arrays[name] = values
+
+    axes = {name: parameters[name][0] for name in dims}
+    return arrays, dims, axes
+
+def emi_grid(principal, annual_rate, tenure_months, emi_advance=False):
+    """
+    EMI for every combination of broadcastable principal, annual rate (%) and
+    tenure (months) arrays in one pass, using the same closed form as
+    amortization.level_payment
+    """
+    principal, rate, tenure_months = np.broadcast_arrays(
+        np.asarray(principal, dtype=float),
+        np.asarray(annual_rate, dtype=float) / 1200,
+        np.asarray(tenure_months, dtype=float)
+    )
+
+    growth = (1 + rate) ** tenure_months
+    # Zero-rate cells fall back to principal / n; silence the 0/0 computed there
+    with np.errstate(divide='ignore', invalid='ignore'):
+        emi = np.where(rate == 0, principal / tenure_months, principal * rate * growth / (growth - 1))
+
+    # EMI in advance is discounted by one period
+    if emi_advance:
+        emi = emi / (1 + rate)
+
+    return emi
+
+def sip_future_value_grid(sip_amount, annual_return_rate, tenure_years, frequency='monthly'):
+    """
+    SIP maturity value for every combination of broadcastable amount, annual
+    return (%) and tenure (years) arrays, matching calculate_sip_returns
+    """
+    sip_amount, annual_return_rate, tenure_years = np.broadcast_arrays(
+        np.asarray(sip_amount, dtype=float),
+        np.asarray(annual_return_rate, dtype=float),
+        np.asarray(tenure_years, dtype=float)
+    )
+
+    if frequency == 'one-time':
+        return sip_amount * (1 + annual_return_rate / 100) ** tenure_years
+
+    investments_per_year = SIP_INVESTMENTS_PER_YEAR.get(frequency, 12)
+    rate = annual_return_rate / (100 * investments_per_year)
+    periods = tenure_years * investments_per_year
+
+    # Annuity due: FV = PMT * [((1 + r)^n - 1) / r] * (1 + r)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        future_value = np.where(
+            rate == 0,
+            sip_amount * periods,
+            sip_amount * (((1 + rate) ** periods - 1) / rate) * (1 + rate)
+        )
+    return future_value
+
+def sip_invested_grid(sip_amount, annual_return_rate, tenure_years, frequency='monthly'):
+    """
+    Total amount invested for the same grid as sip_future_value_grid
+    """
+    sip_amount, _, tenure_years = np.broadcast_arrays(
+        np.asarray(sip_amount, dtype=float),
+        np.asarray(annual_return_rate, dtype=float),
+        np.asarray(tenure_years, dtype=float)
+    )
+
+    if frequency == 'one-time':
+        return sip_amount
+    return sip_amount * tenure_years * SIP_INVESTMENTS_PER_YEAR.get(frequency, 12)
+
+def grid_response(metric, dims, axes, values):
+    """
+    Compact response: axis values once, then one N-d array of cells, which
+    the JSON encoder rounds to 2 dp
+    """
+    return {
+        'status': 'success',
+        'metric': metric,
+        'dims': dims,
+        'axes': {name: np.round(axis, 4).tolist() for name, axis in axes.items()},
+        'shape': list(values.shape),
+        'values': values
+    }
+
+def calculate_emi_grid(data):
+    """
+    EMI sensitivity grid from a request payload. loanAmount, interestRate and
+    tenureMonths (or tenureYears) may each be a number or a range; metric picks
+    emi, totalInterest or totalPayment.
+    """
+    tenure_field = 'tenureYears' if 'tenureYears' in data and 'tenureMonths' not in data else 'tenureMonths'
+    parameters = {
+        'loanAmount': parameter_values('loanAmount', data.get('loanAmount', 0)),
+        'interestRate': parameter_values('interestRate', data.get('interestRate', 0)),
+        tenure_field: parameter_values(tenure_field, data.get(tenure_field, 0))
+    }
+    arrays, dims, axes = grid_axes(parameters)
+
+    principal = arrays['loanAmount']
+    annual_rate = arrays['interestRate']
+    tenure_months = arrays[tenure_field] * (12 if tenure_field == 'tenureYears' else 1)
+
+    if np.any(principal <= 0) or np.any(annual_rate < 0) or np.any(tenure_months <= 0):
+        raise ValueError('Invalid input values')
+
+    emi = emi_grid(principal, annual_rate, tenure_months, data.get('emiScheme') == 'advance')
+
+    metric = data.get('metric', 'emi')
+    if metric == 'emi':
+        values = emi
+    elif metric == 'totalPayment':
+        values = emi * tenure_months
+    elif metric == 'totalInterest':
+        values = np.where(annual_rate == 0, 0, emi * tenure_months - principal)
+    else:
+        raise ValueError(f'Unknown metric {metric!r}')
+
+    return grid_response(metric, dims, axes, values)
+
+def calculate_sip_grid(data):
+    """
+    SIP maturity sensitivity grid from a request payload. sipAmount, returnRate
+    and tenureYears may each be a number or a range; metric picks futureValue,
+    totalReturns or totalInvested.
+    """
+    parameters = {
+        'sipAmount': parameter_values('sipAmount', data.get('sipAmount', 0)),
+        'returnRate': parameter_values('returnRate', data.get('returnRate', 12)),
+        'tenureYears': parameter_values('tenureYears', data.get('tenureYears', 10))
+    }
+    arrays, dims, axes = grid_axes(parameters)
+    frequency = data.get('frequency', 'monthly')
+
+    sip_amount = arrays['sipAmount']
+    tenure_years = arrays['tenureYears']
+    if np.any(sip_amount <= 0) or np.any(tenure_years <= 0):
+        raise ValueError('Invalid input values')
+
+    metric = data.get('metric', 'futureValue')
+    if metric == 'futureValue':
+        values = sip_future_value_grid(sip_amount, arrays['returnRate'], tenure_years, frequency)
+    elif metric == 'totalReturns':
+        values = (sip_future_value_grid(sip_amount, arrays['returnRate'], tenure_years, frequency)
+                  - sip_invested_grid(sip_amount, arrays['returnRate'], tenure_years, frequency))
+    elif metric == 'totalInvested':
+        values = sip_invested_grid(sip_amount, arrays['returnRate'], tenure_years, frequency)
+    else:
+        raise ValueError(f'Unknown metric {metric!r}')
+
+    return grid_response(metric, dims, axes, values)
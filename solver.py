@@ -0,0 +1,157 @@
+from collections import namedtuple
+
+# Default tolerances on the root: converged once a step is below
+# XTOL + RTOL * |root|
+DEFAULT_XTOL = 1e-12
+DEFAULT_RTOL = 1e-10
+DEFAULT_MAX_ITERATIONS = 100
+
+# Monthly rate bounds for loan solves, 0% to 50% a year
+MAX_MONTHLY_RATE = 50 / (12 * 100)
+
+Root = namedtuple('Root', ['root', 'iterations', 'converged', 'method'])
+
+def brent(f, lo, hi, xtol=DEFAULT_XTOL, rtol=DEFAULT_RTOL, max_iterations=DEFAULT_MAX_ITERATIONS, f_lo=None, f_hi=None):
+    """
+    Brent's method on a bracket [lo, hi] where f changes sign: inverse
+    quadratic or secant steps, falling back to bisection whenever they would
+    not shrink the bracket fast enough
+    """
+    x_pre, x_cur = lo, hi
+    f_pre = f(lo) if f_lo is None else f_lo
+    f_cur = f(hi) if f_hi is None else f_hi
+
+    if f_pre == 0:
+        return Root(x_pre, 0, True, 'brent')
+    if f_cur == 0:
+        return Root(x_cur, 0, True, 'brent')
+    if f_pre * f_cur > 0:
+        raise ValueError('Root is not bracketed')
+
+    x_blk = f_blk = 0.0
+    s_pre = s_cur = 0.0
+    for iteration in range(1, max_iterations + 1):
+        if f_pre * f_cur < 0:
+            x_blk, f_blk = x_pre, f_pre
+            s_pre = s_cur = x_cur - x_pre
+        if abs(f_blk) < abs(f_cur):
+            x_pre, x_cur, x_blk = x_cur, x_blk, x_cur
+            f_pre, f_cur, f_blk = f_cur, f_blk, f_cur
+
+        delta = (xtol + rtol * abs(x_cur)) / 2
+        s_bis = (x_blk - x_cur) / 2
+        if f_cur == 0 or abs(s_bis) < delta:
+            return Root(x_cur, iteration, True, 'brent')
+
+        if abs(s_pre) > delta and abs(f_cur) < abs(f_pre):
+            if x_pre == x_blk:
+                # Secant step
+                s_try = -f_cur * (x_cur - x_pre) / (f_cur - f_pre)
+            else:
+                # Inverse quadratic interpolation
+                d_pre = (f_pre - f_cur) / (x_pre - x_cur)
+                d_blk = (f_blk - f_cur) / (x_blk - x_cur)
+                s_try = -f_cur * (f_blk * d_blk - f_pre * d_pre) / (d_blk * d_pre * (f_blk - f_pre))
+
+            if 2 * abs(s_try) < min(abs(s_pre), 3 * abs(s_bis) - delta):
+                s_pre, s_cur = s_cur, s_try
+            else:
+                s_pre = s_cur = s_bis
+        else:
+            s_pre = s_cur = s_bis
+
+        x_pre, f_pre = x_cur, f_cur
+        if abs(s_cur) > delta:
+            x_cur += s_cur
+        else:
+            x_cur += delta if s_bis > 0 else -delta
+        f_cur = f(x_cur)
+
+    return Root(x_cur, max_iterations, False, 'brent')
+
+def find_root(f_and_slope, lo, hi, x0=None, xtol=DEFAULT_XTOL, rtol=DEFAULT_RTOL, max_iterations=DEFAULT_MAX_ITERATIONS):
+    """
+    Safeguarded Newton's method on a bracket [lo, hi] where f changes sign.
+
+    f_and_slope(x) returns (f(x), f'(x)) so both can share intermediate
+    powers. Every evaluation narrows the bracket; a Newton step that leaves
+    it, or a missing slope, hands the narrowed bracket to Brent's method with
+    the remaining iteration budget.
+    """
+    f_lo = f_and_slope(lo)[0]
+    f_hi = f_and_slope(hi)[0]
+    if f_lo == 0:
+        return Root(lo, 0, True, 'newton')
+    if f_hi == 0:
+        return Root(hi, 0, True, 'newton')
+    if f_lo * f_hi > 0:
+        raise ValueError('Root is not bracketed')
+
+    x = x0 if x0 is not None and lo < x0 < hi else (lo + hi) / 2
+    for iteration in range(1, max_iterations + 1):
+        fx, slope = f_and_slope(x)
+        if fx == 0:
+            return Root(x, iteration, True, 'newton')
+
+        if (fx < 0) == (f_lo < 0):
+            lo, f_lo = x, fx
+        else:
+            hi, f_hi = x, fx
+
+        step = fx / slope if slope else None
+        if step is None or step != step or not lo <= x - step <= hi:
+            fallback = brent(lambda r: f_and_slope(r)[0], lo, hi, xtol, rtol,
+                             max_iterations - iteration, f_lo, f_hi)
+            return fallback._replace(iterations=iteration + fallback.iterations)
+
+        x -= step
+        if abs(step) <= xtol + rtol * abs(x):
+            return Root(x, iteration, True, 'newton')
+
+    return Root(x, max_iterations, False, 'newton')
+
+def payment_and_slope(principal, periodic_rate, periods, advance=False):
+    """
+    Level instalment EMI(r) = P r g / (g - 1) with g = (1+r)^n, and its
+    derivative P [g(g - 1) - r n g / (1+r)] / (g - 1)^2
+    """
+    if periodic_rate == 0:
+        return principal / periods, None
+
+    growth = (1 + periodic_rate) ** periods
+    payment = principal * periodic_rate * growth / (growth - 1)
+    slope = principal * (growth * (growth - 1) - periodic_rate * periods * growth / (1 + periodic_rate)) / (growth - 1) ** 2
+
+    # EMI in advance is discounted by one period
+    if advance:
+        slope = slope / (1 + periodic_rate) - payment / (1 + periodic_rate) ** 2
+        payment = payment / (1 + periodic_rate)
+
+    return payment, slope
+
+def bounded_root(f_and_slope, lo, hi, x0, increasing, **tolerances):
+    """
+    Root of a monotonic function on [lo, hi], clamped to the nearer bound
+    when the target lies outside the range
+    """
+    sign = 1 if increasing else -1
+    f_lo = f_and_slope(lo)[0]
+    f_hi = f_and_slope(hi)[0]
+    if sign * f_lo > 0:
+        return Root(lo, 0, False, 'bound')
+    if sign * f_hi < 0:
+        return Root(hi, 0, False, 'bound')
+    return find_root(f_and_slope, lo, hi, x0, **tolerances)
+
+def solve_rate_for_payment(principal, payment, periods, advance=False, max_rate=MAX_MONTHLY_RATE, **tolerances):
+    """
+    Periodic interest rate at which a loan of `principal` over `periods` has
+    the given level payment
+    """
+    def f_and_slope(rate):
+        value, slope = payment_and_slope(principal, rate, periods, advance)
+        return value - payment, slope
+
+    # Flat-rate approximation as a starting point
+    guess = payment / principal - 1 / periods
+    return bounded_root(f_and_slope, 0.0, max_rate, guess, increasing=True, **tolerances)
@@ -0,0 +1,210 @@
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+
+# Enabled with STARTUP_PROFILE=1; the report is written to STARTUP_PROFILE_PATH on boot
+STARTUP_PROFILE_ENABLED = os.environ.get('STARTUP_PROFILE', '0') == '1'
+STARTUP_PROFILE_PATH = os.environ.get('STARTUP_PROFILE_PATH', os.path.join(tempfile.gettempdir(), 'startup_profile.json'))
+
+# Slowest imports and route registrations kept in the report
+STARTUP_PROFILE_TOP = int(os.environ.get('STARTUP_PROFILE_TOP', 25))
+
+class TimedLoader:
+    """
+    Loader wrapper timing exec_module, i.e. the execution of the module body
+    including the imports it triggers
+    """
+
+    def __init__(self, profile, loader):
+        self._profile = profile
+        self._loader = loader
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._profile.import_started()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profile.import_finished(module.__name__)
+
+class ImportTimer:
+    """
+    Meta path finder that wraps the loader of every module imported while it
+    is installed. Times are cumulative and self, as python -X importtime.
+    """
+
+    def __init__(self, profile):
+        self.profile = profile
+
+    def find_spec(self, name, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                spec.loader = TimedLoader(self.profile, spec.loader)
+            return spec
+        return None
+
+class StartupProfile:
+    """
+    Phase, import and route registration timings from the first import of
+    this module to the first response
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.last_mark = self.started
+        self.booted = None
+        self.phases = []
+        self.imports = []
+        self.routes = []
+        self.first_request = None
+        self.first_request_started = None
+        self.import_stack = []
+        self.lock = threading.Lock()
+        self.timer = ImportTimer(self)
+
+    def elapsed_ms(self, since):
+        return (time.perf_counter() - since) * 1000
+
+    def install(self):
+        sys.meta_path.insert(0, self.timer)
+
+    def uninstall(self):
+        if self.timer in sys.meta_path:
+            sys.meta_path.remove(self.timer)
+
+    def import_started(self):
+        with self.lock:
+            self.import_stack.append([time.perf_counter(), 0.0])
+
+    def import_finished(self, name):
+        with self.lock:
+            started, children = self.import_stack.pop()
+            total = time.perf_counter() - started
+            if self.import_stack:
+                self.import_stack[-1][1] += total
+            self.imports.append({'module': name, 'cumulativeMs': total * 1000, 'selfMs': (total - children) * 1000})
+
+    def mark(self, phase):
+        """
+        Close a boot phase that started at the previous mark
+        """
+        now = time.perf_counter()
+        self.phases.append({'phase': phase, 'ms': (now - self.last_mark) * 1000})
+        self.last_mark = now
+
+    def record_route(self, rule, endpoint, ms):
+        self.routes.append({'rule': rule, 'endpoint': endpoint, 'ms': ms})
+
+    def report(self):
+        def slowest(rows, key):
+            return [{name: round(value, 3) if isinstance(value, float) else value for name, value in row.items()}
+                    for row in sorted(rows, key=lambda row: row[key], reverse=True)[:STARTUP_PROFILE_TOP]]
+
+        return {
+            'generatedAt': datetime.now(timezone.utc).isoformat(),
+            'pid': os.getpid(),
+            'python': sys.version.split()[0],
+            'bootMs': round((self.booted - self.started) * 1000, 3) if self.booted else None,
+            'firstRequest': self.first_request,
+            'phases': [{'phase': row['phase'], 'ms': round(row['ms'], 3)} for row in self.phases],
+            'imports': {
+                'count': len(self.imports),
+                'totalSelfMs': round(sum(row['selfMs'] for row in self.imports), 3),
+                'slowest': slowest(self.imports, 'selfMs')
+            },
+            'routes': {
+                'count': len(self.routes),
+                'totalMs': round(sum(row['ms'] for row in self.routes), 3),
+                'slowest': slowest(self.routes, 'ms')
+            }
+        }
+
+    def write(self, path=STARTUP_PROFILE_PATH):
+        try:
+            with open(path, 'w', encoding='utf-8') as handle:
+                json.dump(self.report(), handle, indent=2)
+        except OSError as e:
+            print(f"Could not write startup profile to {path}: {str(e)}")
+
+profile = StartupProfile()
+
+# Installed on import, so importing this module first times every later import.
+# Flask is only imported inside init_app for the same reason.
+if STARTUP_PROFILE_ENABLED:
+    profile.install()
+
+def mark(phase):
+    if STARTUP_PROFILE_ENABLED:
+        profile.mark(phase)
+
+def init_app(app):
+    """
+    Time route registrations and the first response, and expose the report
+    at GET /admin/startup-profile
+    """
+    if not STARTUP_PROFILE_ENABLED:
+        return
+
+    from flask import jsonify, request
+    from admin import admin_only
+
+    add_url_rule = app.add_url_rule
+
+    def timed_add_url_rule(rule, endpoint=None, view_func=None, **options):
+        started = time.perf_counter()
+        try:
+            return add_url_rule(rule, endpoint, view_func, **options)
+        finally:
+            profile.record_route(rule, endpoint or getattr(view_func, '__name__', None), profile.elapsed_ms(started))
+
+    app.add_url_rule = timed_add_url_rule
+
+    @app.before_request
+    def start_first_request():
+        if profile.first_request_started is None and profile.booted is not None:
+            profile.first_request_started = time.perf_counter()
+
+    @app.after_request
+    def finish_first_request(response):
+        if profile.first_request is None and profile.first_request_started is not None:
+            profile.first_request = {
+                'path': request.path,
+                'startedAfterBootMs': round((profile.first_request_started - profile.booted) * 1000, 3),
+                'ms': round(profile.elapsed_ms(profile.first_request_started), 3)
+            }
+            # Imports triggered by the first request count towards the cold start
+            profile.uninstall()
+            profile.write()
+        return response
+
+    @app.route('/admin/startup-profile')
+    @admin_only
+    def startup_profile_report():
+        return jsonify(profile.report())
+
+def finish(app):
+    """
+    End of boot: build the Jinja environment as its own phase and write the
+    report
+    """
+    if not STARTUP_PROFILE_ENABLED:
+        return
+
+    app.jinja_env
+    mark('jinja_environment')
+    profile.booted = time.perf_counter()
+    profile.write()
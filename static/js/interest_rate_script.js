@@ -354,7 +354,8 @@ function calculateAndUpdate() {
 function updateResults(data) {
     // Update results
     document.getElementById('interestRateResult').textContent = `${data.interestRate.toFixed(2)} %`;
-    document.getElementById('loanApr').textContent = `${data.apr.toFixed(2)} %`;
+    // The server sends no APR when fees push it above 1000% a year
+    document.getElementById('loanApr').textContent = data.apr === null ? 'Above 1000 %' : `${data.apr.toFixed(2)} %`;
     document.getElementById('totalInterest').textContent = `₹ ${formatIndianCurrency(data.totalInterest)}`;
     document.getElementById('totalPayment').textContent = `₹ ${formatIndianCurrency(data.totalPayment)}`;
     
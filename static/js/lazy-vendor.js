@@ -0,0 +1,62 @@
+// Loads the export libraries (jsPDF, SheetJS) the first time an export
+// control is used instead of on every page view. The library URLs are
+// given as data attributes on this script's tag.
+(function () {
+    const script = document.currentScript;
+    const libraries = Object.values(script.dataset);
+    const exportControl = /pdf|excel|xlsx|csv|download|export|print|report/i;
+    let loading = null;
+    let ready = libraries.length === 0;
+
+    function loadScript(url) {
+        return new Promise((resolve, reject) => {
+            const tag = document.createElement('script');
+            tag.src = url;
+            tag.onload = resolve;
+            tag.onerror = () => reject(new Error('Could not load ' + url));
+            document.head.appendChild(tag);
+        });
+    }
+
+    function loadLibraries() {
+        if (!loading) {
+            // Libraries load in order, as their script tags used to
+            loading = libraries.reduce((chain, url) => chain.then(() => loadScript(url)), Promise.resolve())
+                .catch(error => console.error(error))
+                .then(() => { ready = true; });
+        }
+        return loading;
+    }
+
+    function exportControlOf(target) {
+        const control = target.closest ? target.closest('button, a, input[type="button"], [onclick], [role="button"]') : null;
+        if (!control) {
+            return null;
+        }
+        const description = [control.id, control.getAttribute('class'), control.getAttribute('onclick'), control.textContent, control.value].join(' ');
+        return exportControl.test(description) ? control : null;
+    }
+
+    // Start downloading as soon as the pointer or focus reaches an export control
+    ['pointerover', 'focusin', 'touchstart'].forEach(type => {
+        window.addEventListener(type, event => {
+            if (!ready && exportControlOf(event.target)) {
+                loadLibraries();
+            }
+        }, { capture: true, passive: true });
+    });
+
+    // Hold a click on an export control until the libraries are there, then replay it
+    window.addEventListener('click', event => {
+        if (ready) {
+            return;
+        }
+        const control = exportControlOf(event.target);
+        if (!control) {
+            return;
+        }
+        event.preventDefault();
+        event.stopImmediatePropagation();
+        loadLibraries().then(() => control.click());
+    }, true);
+})();
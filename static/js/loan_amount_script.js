@@ -311,7 +311,8 @@ function calculateAndUpdate() {
 function updateResults(data) {
     // Update result values
     document.getElementById('principalAmount').textContent = formatCurrency(data.principalAmount);
-    document.getElementById('loanApr').textContent = data.loanApr.toFixed(2) + ' %';
+    // The server sends no APR when fees push it above 1000% a year
+    document.getElementById('loanApr').textContent = data.loanApr === null ? 'Above 1000 %' : data.loanApr.toFixed(2) + ' %';
     document.getElementById('totalInterest').textContent = formatCurrency(data.totalInterest);
     document.getElementById('totalPayment').textContent = formatCurrency(data.totalPayment);
     
@@ -195,7 +195,8 @@ function updateResults(data) {
     document.getElementById('tenureResult').textContent = tenureText;
     
     // Update results
-    document.getElementById('loanApr').textContent = `${data.loanApr.toFixed(2)} %`;
+    // The server sends no APR when fees push it above 1000% a year
+    document.getElementById('loanApr').textContent = data.loanApr === null ? 'Above 1000 %' : `${data.loanApr.toFixed(2)} %`;
     document.getElementById('totalInterest').textContent = `₹ ${formatIndianCurrency(data.totalInterest)}`;
     document.getElementById('totalPayment').textContent = `₹ ${formatIndianCurrency(data.totalPayment)}`;
     
@@ -619,7 +620,7 @@ function downloadPDF() {
                 <div class="summary-section">
                     <h3>Payment Summary</h3>
                     <p><strong>Loan Tenure:</strong> ${calculationData.tenureMonths} months</p>
-                    <p><strong>Loan APR:</strong> ${calculationData.loanApr}%</p>
+                    <p><strong>Loan APR:</strong> ${calculationData.loanApr === null ? 'Above 1000' : calculationData.loanApr}%</p>
                     <p><strong>Total Interest:</strong> ₹${formatIndianCurrency(calculationData.totalInterest)}</p>
                     <p><strong>Total Payment:</strong> ₹${formatIndianCurrency(calculationData.totalPayment)}</p>
                 </div>
@@ -679,7 +680,7 @@ function downloadExcel() {
             [''],
             ['Results'],
             ['Loan Tenure', `${calculationData.tenureMonths} months`],
-            ['Loan APR', `${calculationData.loanApr}%`],
+            ['Loan APR', `${calculationData.loanApr === null ? 'Above 1000' : calculationData.loanApr}%`],
             ['Total Interest', `₹${formatIndianCurrency(calculationData.totalInterest)}`],
             ['Total Payment', `₹${formatIndianCurrency(calculationData.totalPayment)}`]
         ];
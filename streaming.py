@@ -0,0 +1,53 @@
+import csv
+import io
+import json
+
+STREAM_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv'
+}
+
+# Rows encoded into each chunk written to the client
+ROWS_PER_CHUNK = 256
+
+def ndjson_chunks(rows):
+    """
+    One compact JSON document per line
+    """
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(row, separators=(',', ':'), ensure_ascii=False))
+        if len(lines) >= ROWS_PER_CHUNK:
+            yield '\n'.join(lines) + '\n'
+            lines.clear()
+    if lines:
+        yield '\n'.join(lines) + '\n'
+
+def csv_chunks(rows):
+    """
+    CSV with a header taken from the first row's keys
+    """
+    buffer = io.StringIO()
+    writer = None
+    for count, row in enumerate(rows, start=1):
+        if writer is None:
+            writer = csv.DictWriter(buffer, fieldnames=list(row))
+            writer.writeheader()
+        writer.writerow(row)
+        if count % ROWS_PER_CHUNK == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+def stream_rows(app, rows, output_format, filename):
+    """
+    Streamed response encoding rows as they are generated, so the server
+    never holds the whole schedule
+    """
+    chunks = csv_chunks(rows) if output_format == 'csv' else ndjson_chunks(rows)
+    response = app.response_class(chunks, mimetype=STREAM_FORMATS[output_format])
+    if output_format == 'csv':
+        response.headers['Content-Disposition'] = f'attachment; filename={filename}.csv'
+    return response
@@ -0,0 +1,86 @@
+import os
+
+import pytest
+
+import apr
+
+def reference_apr(principal, annual_rate, emi, fees, advance):
+    """
+    Month-by-month amortization and a bisection on the lender's IRR
+    """
+    rate = annual_rate / 1200
+    balance = principal - emi if advance else principal
+    payments = []
+    while balance > 1e-9:
+        interest = balance * rate
+        payment = min(emi, balance + interest)
+        payments.append(payment)
+        balance += interest - payment
+    disbursed = principal - fees - (emi if advance else 0)
+
+    lo, hi = 0.0, 1.0
+    for _ in range(200):
+        mid = (lo + hi) / 2
+        npv = -disbursed + sum(payment / (1 + mid) ** (k + 1) for k, payment in enumerate(payments))
+        lo, hi = (mid, hi) if npv > 0 else (lo, mid)
+    return mid * 1200
+
+@pytest.mark.parametrize('scheme', ['arrears', 'advance'])
+@pytest.mark.parametrize('fees', [0.01, 1000, 25000])
+def test_loan_tenure_apr_prices_the_short_final_emi(client, scheme, fees):
+    # 971,415 at 7.25% with an 80,000 EMI clears in 12.6 months
+    data = client.post('/calculate-loan-tenure', json={
+        'loanAmount': 971415, 'emi': 80000, 'interestRate': 7.25, 'feesCharges': fees, 'emiScheme': scheme
+    }).get_json()
+
+    expected = reference_apr(971415, 7.25, 80000, fees, scheme == 'advance')
+    assert data['loanApr'] == pytest.approx(expected, abs=0.01)
+
+def test_negligible_fees_leave_the_apr_at_the_interest_rate(client):
+    data = client.post('/calculate-loan-tenure', json={
+        'loanAmount': 971415, 'emi': 80000, 'interestRate': 7.25, 'feesCharges': 0.01
+    }).get_json()
+    assert data['loanApr'] == pytest.approx(7.25, abs=0.01)
+
+def test_apr_above_fifty_percent_is_not_clamped():
+    # 25,000 of fees on a 50,000 two-year loan
+    value = apr.loan_apr(50000, 2500, 24, 25000)
+    assert value > 100
+    flows = apr.loan_cash_flows(50000, 2500, 24, 25000)
+    assert sum(flow / (1 + value / 1200) ** k for k, flow in enumerate(flows)) == pytest.approx(0, abs=1e-6)
+
+def test_apr_above_the_solver_range_is_none():
+    assert apr.loan_apr(50000, 2500, 24, 49990) is None
+
+def test_negative_apr_is_reported():
+    # 240 EMIs of 5,000 return less than the 1,695,000 paid out
+    value = apr.loan_apr(1700000, 5000, 240, 5000)
+    assert value < 0
+    flows = apr.loan_cash_flows(1700000, 5000, 240, 5000)
+    assert sum(flow / (1 + value / 1200) ** k for k, flow in enumerate(flows)) == pytest.approx(0, abs=1e-4)
+
+def test_routes_send_null_apr_above_the_solver_range(client):
+    # 99,000 of fees on a 100,000 loan: the borrower receives 1,000
+    data = client.post('/calculate-interest-rate', json={
+        'loanAmount': 100000, 'emi': 3000, 'tenureYears': 5, 'feesCharges': 99000
+    }).get_json()
+    assert data['apr'] is None
+    assert data['interestRate'] == pytest.approx(26.1, abs=0.01)
+
+    data = client.post('/calculate-loan-tenure', json={
+        'loanAmount': 100000, 'emi': 3000, 'interestRate': 10, 'feesCharges': 99000
+    }).get_json()
+    assert data['loanApr'] is None
+    assert data['tenureMonths'] > 0
+
+@pytest.mark.parametrize('script, field', [
+    ('interest_rate_script.js', 'data.apr'),
+    ('loan_tenure_script.js', 'data.loanApr'),
+    ('loan_amount_script.js', 'data.loanApr')
+])
+def test_pages_render_a_null_apr(script, field):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with open(os.path.join(root, 'static', 'js', script), encoding='utf-8') as f:
+        source = f.read()
+    # Every formatted APR is guarded against null
+    assert source.count(f'{field}.toFixed(') == source.count(f'{field} === null ?')
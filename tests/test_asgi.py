@@ -0,0 +1,84 @@
+import asyncio
+import json
+
+import pytest
+
+import asgi
+from blueprints.loans import LOAN_PRODUCT_ENDPOINTS
+
+def http_scope(path, method='POST'):
+    return {
+        'type': 'http', 'method': method, 'path': path, 'query_string': b'', 'http_version': '1.1',
+        'headers': [(b'content-type', b'application/json')]
+    }
+
+def receiver(payload):
+    async def receive():
+        return {'type': 'http.request', 'body': json.dumps(payload).encode('utf-8'), 'more_body': False}
+    return receive
+
+@pytest.fixture(autouse=True)
+def request_classes(monkeypatch):
+    # Semaphores belong to the event loop of each test's asyncio.run()
+    classes = {name: asgi.RequestClass(name, limit) for name, limit in (('heavy', 2), ('light', 2))}
+    monkeypatch.setattr(asgi, 'classes', classes)
+    yield classes
+    for request_class in classes.values():
+        request_class.shutdown()
+
+# A 100-year daily schedule: tens of thousands of streamed chunks
+LONG_STREAM = ('/stream-schedule/daily', {'principal': 1000000, 'interestRate': 10, 'tenureDays': 36500})
+
+@pytest.mark.parametrize('endpoint', sorted(LOAN_PRODUCT_ENDPOINTS))
+def test_every_emi_product_is_heavy(endpoint):
+    assert f'loans.{endpoint}' in asgi.HEAVY_ENDPOINTS
+
+def test_closed_form_calculators_are_light():
+    assert asgi.classify('POST', '/calculate-weekly-emi') == 'heavy'
+    assert asgi.classify('POST', '/calculate-gst') == 'light'
+
+def test_light_requests_run_on_a_pool():
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    async def main():
+        await asgi.app(http_scope('/calculate-gst'), receiver({'amount': 1000, 'gstRate': 18}), send)
+        return asgi.classes['light'].executor
+
+    assert asyncio.run(main()) is not None
+    assert messages[0]['status'] == 200
+
+def test_disconnected_client_stops_the_app_thread():
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+        if len(sent) == 3:
+            raise OSError('client went away')
+
+    path, payload = LONG_STREAM
+    asyncio.run(asyncio.wait_for(asgi.app(http_scope(path), receiver(payload), send), 10))
+    assert len(sent) == 3
+    assert asgi.classes['heavy'].active == 0
+
+def test_cancelled_request_does_not_leave_the_app_thread_blocked():
+    async def main():
+        started = asyncio.Event()
+
+        async def send(message):
+            started.set()
+            # A client that never reads: the relay queue fills up behind this
+            await asyncio.Event().wait()
+
+        path, payload = LONG_STREAM
+        task = asyncio.create_task(asgi.app(http_scope(path), receiver(payload), send))
+        await started.wait()
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(task, 10)
+        return asgi.classes['heavy'].active
+
+    assert asyncio.run(main()) == 0
@@ -0,0 +1,29 @@
+from json_provider import to_columnar
+
+def test_schedules_become_columns_including_nested_ones():
+    body = {'yearlyPaymentSchedule': [
+        {'year': 2025, 'monthly_data': [{'month': 'Jan', 'balance': 2.0}, {'month': 'Feb', 'balance': 1.0}]},
+        {'year': 2026, 'monthly_data': [{'month': 'Jan', 'balance': 0.5}]}
+    ]}
+
+    schedule = to_columnar(body)['yearlyPaymentSchedule']
+    assert schedule['columns'] == ['year', 'monthly_data']
+    assert schedule['values'][0] == [2025, 2026]
+    assert schedule['values'][1][0] == {'columns': ['month', 'balance'], 'values': [['Jan', 'Feb'], [2.0, 1.0]]}
+
+def test_other_lists_of_records_are_left_alone():
+    results = [{'status': 200, 'body': {'amortizationSchedule': [{'month': 1}, {'month': 2}]}},
+               {'status': 200, 'body': {'amortizationSchedule': [{'month': 1}]}}]
+
+    converted = to_columnar({'results': results})['results']
+    assert [item['status'] for item in converted] == [200, 200]
+    assert converted[0]['body']['amortizationSchedule'] == {'columns': ['month'], 'values': [[1, 2]]}
+
+def test_batch_results_stay_records(client):
+    response = client.post('/batch?format=columnar', json={
+        'route': '/calculate', 'payloads': [{'loanAmount': 100000, 'interestRate': 8, 'tenureYears': 1}] * 2
+    })
+    results = response.get_json()['results']
+
+    assert isinstance(results, list) and len(results) == 2
+    assert results[0]['result']['yearlyPaymentSchedule']['columns'][0] == 'year'
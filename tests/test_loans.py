@@ -0,0 +1,93 @@
+import pytest
+
+import loan_engine
+
+
+def test_home_loan_down_payment_above_home_value_gives_zero_rows(client):
+    data = client.post('/calculate-home-loan', json={
+        'homeValue': 1000000, 'downPayment': 1400000, 'interestRate': 8, 'tenureYears': 2, 'tenureMonths': 0
+    }).get_json()
+
+    assert len(data['paymentSchedule']) == 2
+    for row in data['paymentSchedule']:
+        assert row['principal'] == 0
+        assert row['interest'] == 0
+        assert row['balance'] == 0
+        assert row['loanPaidPercentage'] == 0
+
+def test_long_daily_schedule_is_truncated_and_points_at_the_stream(client, monkeypatch):
+    monkeypatch.setattr(loan_engine, 'JSON_SCHEDULE_MAX_ROWS', 50)
+    data = client.post('/calculate-daily-emi', json={'principal': 100000, 'interestRate': 12, 'tenureDays': 365}).get_json()
+
+    assert len(data['amortizationSchedule']) == 50
+    assert data['scheduleTruncated'] is True
+    assert data['fullScheduleUrl'] == '/stream-schedule/daily'
+    assert data['amortizationSchedule'][-1]['day'] == 'Day 50'
+    assert data['tenureDays'] == 365
+
+def test_short_schedule_is_returned_in_full(client):
+    data = client.post('/calculate-weekly-emi', json={'principal': 100000, 'interestRate': 12, 'tenureWeeks': 52}).get_json()
+
+    assert len(data['amortizationSchedule']) == 52
+    assert 'scheduleTruncated' not in data
+
+def test_tenure_above_the_maximum_is_rejected(client):
+    data = client.post('/calculate-daily-emi', json={'principal': 100000, 'interestRate': 12, 'tenureDays': 1000000}).get_json()
+    assert data['status'] == 'error'
+    assert 'cannot exceed' in data['error']
+
+    response = client.post('/stream-schedule/weekly', json={'principal': 100000, 'interestRate': 12, 'tenureWeeks': 300000})
+    assert response.status_code == 400
+
+def test_home_loan_export_has_a_row_per_month(client):
+    response = client.post('/export/home_loan?format=csv', json={
+        'homeValue': 1000000, 'downPayment': 200000, 'interestRate': 8, 'tenureYears': 2, 'tenureMonths': 0,
+        'propertyTaxes': 1200, 'homeInsurance': 600, 'maintenance': 100
+    })
+    lines = response.get_data(as_text=True).strip().splitlines()
+
+    assert response.status_code == 200
+    assert len(lines) == 1 + 24
+    assert lines[1].split(',')[:2] == ['2025', 'Jan']
+    assert lines[-1].split(',')[:2] == ['2026', 'Dec']
+
+def test_interest_rate_rejects_an_emi_above_the_rate_range(client):
+    response = client.post('/calculate-interest-rate', json={'loanAmount': 100000, 'emi': 90000, 'tenureYears': 5})
+    assert response.status_code == 400
+    assert response.get_json()['error'] == 'EMI implies an interest rate above 50%'
+
+def test_interest_rate_rejects_an_emi_that_cannot_repay_the_loan(client):
+    response = client.post('/calculate-interest-rate', json={'loanAmount': 1700000, 'emi': 5000, 'tenureMonths': 240})
+    assert response.status_code == 400
+    assert 'too low' in response.get_json()['error']
+
+def test_interest_rate_at_zero_percent_is_solved(client):
+    data = client.post('/calculate-interest-rate', json={'loanAmount': 120000, 'emi': 10000, 'tenureYears': 1}).get_json()
+    assert data['interestRate'] == 0
+
+@pytest.mark.parametrize('product, payload', [
+    ('emi', {'loanAmount': 2500000, 'interestRate': 8.5, 'tenureYears': 30, 'startMonth': 4}),
+    ('land_loan', {'landPrice': 800000, 'interestRate': 9, 'tenureMonths': 84}),
+    ('credit_card', {'transactionAmount': 60000, 'interestRate': 16, 'tenureMonths': 18, 'processingFees': 500})
+])
+def test_streamed_schedules_match_the_json_ones_without_building_them(monkeypatch, product, payload):
+    config = loan_engine.LOAN_PRODUCTS[product]
+    loan = loan_engine.loan_terms(config, payload)
+    if config['schedule'] == 'yearly':
+        expected = [{'year': year['year'], **month} for year in loan_engine.calculate_yearly_payment_schedule(
+            loan['principal'], loan['annual_rate'], loan['periods'], loan['advance'], loan['start_year'], loan['start_month']
+        ) for month in year['monthly_data']]
+    else:
+        expected = loan_engine.dated_schedule(loan['principal'], loan['periodic_rate'], loan['periods'], loan['emi'],
+                                              config.get('gst_rate'))
+
+    def whole_schedule(*args, **kwargs):
+        raise AssertionError('the streamed schedule was built in full')
+    monkeypatch.setattr(loan_engine, 'calculate_yearly_payment_schedule', whole_schedule)
+    monkeypatch.setattr(loan_engine, 'dated_schedule', whole_schedule)
+    # Small blocks, so every schedule spans several of them
+    amortize_chunks = loan_engine.amortization.amortize_chunks
+    monkeypatch.setattr(loan_engine.amortization, 'amortize_chunks',
+                        lambda *args, **kwargs: amortize_chunks(*args, **dict(kwargs, chunk_size=5)))
+
+    assert list(loan_engine.schedule_rows(product, payload)) == expected
@@ -0,0 +1,49 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import metrics
+
+def counter_value(name, labels):
+    for line in metrics.render().splitlines():
+        if line.startswith(f'{name}{{{labels}}} '):
+            return float(line.rsplit(' ', 1)[1])
+    return 0.0
+
+def test_cached_error_bodies_and_304s_are_counted(client):
+    # An over-long tenure is reported as a 200 response with an error body
+    body = {'principal': 123456, 'interestRate': 12, 'tenureDays': 1000000}
+    endpoint = 'endpoint="loans.calculate_daily_emi"'
+    requests_before = counter_value('calculator_requests_total', f'{endpoint},method="POST",status="200"')
+    not_modified_before = counter_value('calculator_requests_total', f'{endpoint},method="POST",status="304"')
+    errors_before = counter_value('calculator_errors_total', f'{endpoint},kind="body"')
+
+    responses = [client.post('/calculate-daily-emi', json=body) for _ in range(3)]
+    assert [response.headers['X-Response-Cache'] for response in responses] == ['miss', 'hit', 'hit']
+    not_modified = client.post('/calculate-daily-emi', json=body, headers={'If-None-Match': responses[0].headers['ETag']})
+    assert not_modified.status_code == 304
+
+    assert counter_value('calculator_requests_total', f'{endpoint},method="POST",status="200"') == requests_before + 3
+    assert counter_value('calculator_requests_total', f'{endpoint},method="POST",status="304"') == not_modified_before + 1
+    assert counter_value('calculator_errors_total', f'{endpoint},kind="body"') == errors_before + 4
+
+@pytest.mark.parametrize('module', ['response_cache', 'metrics', 'compression'])
+def test_instrumented_modules_import_on_their_own(module):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run([sys.executable, '-c', f'import {module}'], cwd=root, check=True)
+
+def test_a_failing_batch_scenario_does_not_mark_the_batch_as_an_error(client):
+    # The second scenario reports its error in its own result
+    payload = {'route': '/calculate-interest-rate', 'payloads': [
+        {'loanAmount': 100000, 'emi': 3000, 'tenureYears': 5},
+        {'loanAmount': 0, 'emi': 3000, 'tenureYears': 5}
+    ]}
+    endpoint = 'endpoint="calculate_batch"'
+    errors_before = counter_value('calculator_errors_total', f'{endpoint},kind="body"')
+
+    results = client.post('/batch', json=payload).get_json()['results']
+    assert [result['statusCode'] for result in results] == [200, 400]
+
+    assert counter_value('calculator_errors_total', f'{endpoint},kind="body"') == errors_before
@@ -0,0 +1,21 @@
+import inspect
+
+from calculators.common import calculate_fd_returns
+from loan_engine import calculate_yearly_payment_schedule
+
+def test_memoized_results_match_the_undecorated_calculator():
+    uncached = inspect.unwrap(calculate_fd_returns)
+    for frequency in ('monthly', 'Monthly', 'quarterly'):
+        for rate in (8.555, 8.56):
+            assert calculate_fd_returns(5000, 10, rate, frequency) == uncached(5000, 10, rate, frequency)
+
+def test_cache_keeps_original_arguments():
+    result = calculate_fd_returns(5000, 10, 8.555, 'Monthly')
+    assert result['interest_rate'] == 8.555
+    assert result['compounding_frequency'] == 'Monthly'
+
+def test_near_identical_rates_do_not_share_an_entry():
+    first = calculate_yearly_payment_schedule(1000000, 8.555, 240)
+    second = calculate_yearly_payment_schedule(1000000, 8.56, 240)
+    assert first != second
+    assert first == inspect.unwrap(calculate_yearly_payment_schedule)(1000000, 8.555, 240)
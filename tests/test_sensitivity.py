@@ -0,0 +1,24 @@
+import pytest
+
+import sensitivity
+
+def test_count_above_the_grid_limit_is_rejected_before_allocating(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError('linspace called for an oversized range')
+
+    monkeypatch.setattr(sensitivity.np, 'linspace', fail)
+    with pytest.raises(ValueError, match='too many points'):
+        sensitivity.parameter_values('loanAmount', {'start': 1, 'stop': 2, 'count': 300000000})
+
+def test_oversized_count_gets_a_400(client):
+    response = client.post('/calculate-emi-grid', json={
+        'loanAmount': {'start': 100000, 'stop': 200000, 'count': 300000000},
+        'interestRate': 8.5,
+        'tenureMonths': 240
+    })
+    assert response.status_code == 400
+
+def test_count_within_the_limit_builds_the_axis():
+    values, is_range = sensitivity.parameter_values('interestRate', {'start': 6, 'stop': 9, 'count': 4})
+    assert is_range
+    assert list(values) == [6, 7, 8, 9]
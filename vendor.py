@@ -0,0 +1,86 @@
+import base64
+import hashlib
+import json
+import os
+import urllib.request
+
+from flask import current_app, url_for
+from markupsafe import Markup, escape
+
+from assets import asset_url
+
+# Third-party browser libraries, pinned to one version each. Files fetched with
+# `flask --app index fetch-vendor` are served from static/vendor/<name>/<version>/;
+# until then pages fall back to the same version on its CDN.
+VENDOR_LIBRARIES = {
+    'chart.js': ('4.4.1', 'https://cdn.jsdelivr.net/npm/chart.js@4.4.1/dist/chart.umd.js'),
+    'jspdf': ('2.5.1', 'https://cdnjs.cloudflare.com/ajax/libs/jspdf/2.5.1/jspdf.umd.min.js'),
+    'xlsx': ('0.18.5', 'https://cdnjs.cloudflare.com/ajax/libs/xlsx/0.18.5/xlsx.full.min.js')
+}
+
+VENDOR_DIR = 'vendor'
+VENDOR_LOCK_NAME = 'vendor.lock.json'
+
+def vendor_file(name):
+    """
+    Path of a library under static/, e.g. vendor/jspdf/2.5.1/jspdf.umd.min.js
+    """
+    version, url = VENDOR_LIBRARIES[name]
+    return f'{VENDOR_DIR}/{name}/{version}/{url.rsplit("/", 1)[-1]}'
+
+def fetch_vendor(app):
+    """
+    Download every pinned library into static/vendor and record its size and
+    SHA-384 (as a subresource integrity value) in vendor.lock.json
+    """
+    lock = {}
+    for name, (version, url) in VENDOR_LIBRARIES.items():
+        with urllib.request.urlopen(url, timeout=60) as response:
+            body = response.read()
+
+        path = os.path.join(app.static_folder, vendor_file(name))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as handle:
+            handle.write(body)
+
+        digest = hashlib.sha384(body).digest()
+        lock[name] = {
+            'version': version,
+            'source': url,
+            'file': vendor_file(name),
+            'bytes': len(body),
+            'integrity': 'sha384-' + base64.b64encode(digest).decode('ascii')
+        }
+
+    with open(os.path.join(app.static_folder, VENDOR_DIR, VENDOR_LOCK_NAME), 'w', encoding='utf-8') as handle:
+        json.dump(lock, handle, indent=2, sort_keys=True)
+    return lock
+
+def vendor_url(name):
+    """
+    Self-hosted URL of a pinned library, or its CDN URL when not fetched
+    """
+    if os.path.isfile(os.path.join(current_app.static_folder, vendor_file(name))):
+        return url_for('static', filename=vendor_file(name))
+    return VENDOR_LIBRARIES[name][1]
+
+def lazy_vendor_tags(*names):
+    """
+    Loader script that fetches the given libraries the first time an export
+    control is used, instead of on every page view
+    """
+    attributes = ''.join(f' data-{name}="{escape(vendor_url(name))}"' for name in names)
+    return Markup(f'<script src="{escape(asset_url("js/lazy-vendor.js"))}"{attributes}></script>')
+
+def init_app(app):
+    """
+    vendor_url()/lazy_vendor_tags() template helpers and the fetch-vendor
+    command
+    """
+    app.jinja_env.globals.update(vendor_url=vendor_url, lazy_vendor_tags=lazy_vendor_tags)
+
+    @app.cli.command('fetch-vendor')
+    def fetch_vendor_command():
+        """Download the pinned browser libraries into static/vendor."""
+        for name, entry in sorted(fetch_vendor(app).items()):
+            print(f"{name} {entry['version']}: {entry['file']} ({entry['bytes']} bytes)")
@@ -0,0 +1,93 @@
+from datetime import date
+
+import numpy as np
+
+import solver
+
+DAY_COUNTS = ('actual/365', 'actual/actual')
+
+# Candidate rates scanned for a sign change when bracketing the root
+BRACKET_RATES = np.array([-0.999, -0.99, -0.9, -0.75, -0.5, -0.25, 0.0, 0.1, 0.25, 0.5,
+                          1.0, 2.5, 5.0, 10.0, 100.0, 1000.0])
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+def day_numbers(dates):
+    """
+    Dates as a datetime64[D] array; converting date objects through their
+    ordinals is much faster than letting NumPy parse each one
+    """
+    if isinstance(dates, np.ndarray):
+        return dates.astype('datetime64[D]')
+
+    ordinals = np.fromiter((day.toordinal() for day in dates), dtype=np.int64, count=len(dates))
+    return (ordinals - EPOCH_ORDINAL).astype('datetime64[D]')
+
+def year_fractions(dates, day_count='actual/365'):
+    """
+    Time of each date in years from the earliest one.
+
+    Actual/365 divides the day difference by 365. Actual/Actual (ISDA) counts
+    the days falling in each calendar year against that year's length.
+    """
+    days = day_numbers(dates)
+    if day_count == 'actual/365':
+        return (days - days.min()).astype(float) / 365.0
+    if day_count != 'actual/actual':
+        raise ValueError(f'Unknown day count {day_count!r}, expected one of {", ".join(DAY_COUNTS)}')
+
+    # Position of each date as year + fraction of that year elapsed
+    years = days.astype('datetime64[Y]')
+    year_start = years.astype('datetime64[D]')
+    year_length = ((years + 1).astype('datetime64[D]') - year_start).astype(float)
+    position = years.astype(float) + (days - year_start).astype(float) / year_length
+    return position - position.min()
+
+def xnpv_and_slope(rate, amounts, times):
+    """
+    NPV of dated flows, sum c_i (1+r)^-t_i, and its derivative in r
+    """
+    discount = (1 + rate) ** -times
+    npv = amounts @ discount
+    slope = -(amounts * times) @ discount / (1 + rate)
+    return npv, slope
+
+def bracket_root(amounts, times, guess):
+    """
+    Pair of adjacent candidate rates around a sign change of the NPV,
+    preferring the one closest to the guess. Returns None when the NPV keeps
+    one sign over the whole range.
+    """
+    rates = np.sort(np.append(BRACKET_RATES, guess))
+    with np.errstate(over='ignore', invalid='ignore'):
+        npvs = (1 + rates[:, None]) ** -times[None, :] @ amounts
+
+    finite = np.isfinite(npvs)
+    rates, npvs = rates[finite], npvs[finite]
+    changes = np.flatnonzero(np.sign(npvs[:-1]) * np.sign(npvs[1:]) <= 0)
+    if not changes.size:
+        return None
+
+    nearest = changes[np.argmin(np.abs(rates[changes] - guess))]
+    return rates[nearest], rates[nearest + 1]
+
+def xirr(dates, amounts, day_count='actual/365', guess=0.1, **tolerances):
+    """
+    Annualized internal rate of return of irregularly dated cash flows, as
+    Excel's XIRR. Year fractions are computed once and every NPV evaluation
+    is a single vectorized pass, so long histories (daily SIPs) stay fast.
+
+    Returns a solver.Root for the annual rate, or None when the flows do not
+    change sign or have no root in the bracketing range.
+    """
+    amounts = np.asarray(amounts, dtype=float)
+    if len(amounts) < 2 or not (amounts > 0).any() or not (amounts < 0).any():
+        return None
+
+    times = year_fractions(dates, day_count)
+    bracket = bracket_root(amounts, times, guess)
+    if bracket is None:
+        return None
+
+    lo, hi = bracket
+    return solver.find_root(lambda rate: xnpv_and_slope(rate, amounts, times), lo, hi, guess, **tolerances)